@@ -1,7 +1,6 @@
 import os
 import sys
 import yaml
-import wx
 
 from logbook import CRITICAL, DEBUG, ERROR, FingersCrossedHandler, INFO, Logger, NestedSetup, NullHandler, \
     StreamHandler, TimedRotatingFileHandler, WARNING
@@ -12,6 +11,12 @@ from cryptography.fernet import Fernet
 
 pyfalog = Logger(__name__)
 
+# GUI toolkit is not needed by headless tools, like fit evaluation server
+try:
+    import wx
+except ImportError:
+    wx = None
+
 # Load variable overrides specific to distribution type
 try:
     import configforced
@@ -24,6 +29,8 @@ except ImportError:
 debug = False
 # Defines if our saveddata will be in pyfa root or not
 saveInRoot = False
+# Defines if saveddata validation is postponed until main window is shown
+deferStartupTasks = False
 
 evemonMinVersion = "4081"
 
@@ -55,7 +62,7 @@ slotColourMap = {
     FittingSlot.HIGH: wx.Colour(235, 204, 209),  # red    = high slots
     FittingSlot.RIG: '',
     FittingSlot.SUBSYSTEM: ''
-}
+} if wx is not None else {}
 
 def getClientSecret():
     return clientHash
@@ -170,6 +177,9 @@ def defPaths(customSavePath=None):
     # saveddata db location modifier, shouldn't ever need to touch this
     eos.config.saveddata_connectionstring = "sqlite:///" + saveDB + "?check_same_thread=False"
     eos.config.gamedata_connectionstring = "sqlite:///" + gameDB + "?check_same_thread=False"
+    # compiled effect registry location
+    eos.config.effectCachePath = os.path.join(savePath, "cache")
+    eos.config.priceStorePath = os.path.join(savePath, "prices.db")
 
     # initialize the settings
     from service.settings import EOSSettings
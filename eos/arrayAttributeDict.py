@@ -0,0 +1,407 @@
+# ===============================================================================
+# Copyright (C) 2010 Diego Duclos
+#
+# This file is part of eos.
+#
+# eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with eos.  If not, see <http://www.gnu.org/licenses/>.
+# ===============================================================================
+
+from array import array
+
+from logbook import Logger
+
+from eos.calcHooks import registerHooks
+from eos.calcJournal import journaledRead
+from eos.const import Operator
+from eos.modifiedAttributeDict import (
+    ModifiedAttributeDict, addExtraMultipliers, applyStackingPenalties, getAttrDefault, getCappingKey,
+    getPenaltyFactor)
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+pyfalog = Logger(__name__)
+
+
+# Attribute names and penalty groups are interned into small integers, shared by all maps
+attrIDs = {}
+attrNames = []
+penaltyGroupIDs = {}
+penaltyGroupNames = []
+NOT_PENALIZED = -1
+
+# {capping attribute name: set of names of attributes it caps}
+cappedAttrs = {}
+
+# Stacking penalty factors by position in chain
+penaltyFactors = []
+
+
+def internAttr(name):
+    try:
+        return attrIDs[name]
+    except KeyError:
+        attrID = attrIDs[name] = len(attrNames)
+        attrNames.append(name)
+        return attrID
+
+
+def internPenaltyGroup(name):
+    try:
+        return penaltyGroupIDs[name]
+    except KeyError:
+        groupID = penaltyGroupIDs[name] = len(penaltyGroupNames)
+        penaltyGroupNames.append(name)
+        return groupID
+
+
+def getPenaltyFactors(amount):
+    """Get array of stacking penalty factors for chain positions up to amount"""
+    while len(penaltyFactors) < amount:
+        penaltyFactors.append(getPenaltyFactor(len(penaltyFactors)))
+    return numpy.array(penaltyFactors[:amount], dtype=numpy.float64)
+
+
+class ArrayModifiedAttributeDict(ModifiedAttributeDict):
+    """
+    Modified attribute map which keeps modifications in flat typed arrays.
+
+    Every modification takes one row across attribute ID, operator, value and
+    penalty group arrays. Values are calculated on access, in bulk for all
+    attributes modified since previous access; with NumPy available and enough
+    rows, aggregation and stacking penalties are vectorized.
+    """
+
+    # 'Affected By' data is used only for display, and can be skipped to save memory
+    trackAfflictions = True
+    # Minimum amount of modifications to do bulk calculation with NumPy
+    vectorizeThreshold = 64
+
+    def initStorage(self):
+        self.__attrIDs = array('H')
+        self.__operators = array('b')
+        self.__values = array('d')
+        self.__penaltyGroups = array('h')
+        # (modifying fit, affliction data) per row
+        self.__afflictions = []
+        # {attribute ID: indices of its rows}
+        self.__rows = {}
+        self.__intermediary = {}
+        # Calculated values, attributes with pending modifications have placeholder instead
+        self.__modified = {}
+        self.__pending = set()
+        # Values calculated in bulk ahead of being requested
+        self.__eager = set()
+
+    def clear(self):
+        del self.__attrIDs[:]
+        del self.__operators[:]
+        del self.__values[:]
+        del self.__penaltyGroups[:]
+        del self.__afflictions[:]
+        self.__rows.clear()
+        self.__intermediary.clear()
+        self.__modified.clear()
+        self.__pending.clear()
+        self.__eager.clear()
+
+    def _getStorage(self):
+        return (
+            self.__attrIDs, self.__operators, self.__values, self.__penaltyGroups, self.__afflictions, self.__rows,
+            self.__intermediary, self.__modified, self.__pending, self.__eager)
+
+    def resetValues(self):
+        self.__modified.clear()
+        self.__pending.clear()
+        self.__eager.clear()
+
+    def __getitem__(self, key):
+        # Check if we have final calculated value
+        val = self.__modified.get(key)
+        if val is self.CalculationPlaceholder:
+            val = self.__calculatePending(key)
+        elif self.__eager:
+            self.__eager.discard(key)
+        if val is not None:
+            return val
+
+        # Then in values which are not yet calculated
+        if self.__intermediary:
+            val = self.__intermediary.get(key)
+            if val is not None:
+                return val
+
+        # Original value is the least priority
+        return self.getOriginal(key)
+
+    def _getIntermediary(self, key):
+        if self.__intermediary:
+            return self.__intermediary.get(key)
+        return None
+
+    def __delitem__(self, key):
+        self.__pending.discard(key)
+        self.__eager.discard(key)
+        if key in self.__modified:
+            del self.__modified[key]
+        if key in self.__intermediary:
+            del self.__intermediary[key]
+
+    def __iter__(self):
+        all_dict = dict(self.original, **self.__modified)
+        return (key for key in all_dict)
+
+    def __contains__(self, key):
+        return (self.original is not None and key in self.original) or \
+            key in self.__modified or key in self.__intermediary
+
+    def __len__(self):
+        keys = set()
+        keys.update(iter(self.original.keys()))
+        keys.update(iter(self.__modified.keys()))
+        keys.update(iter(self.__intermediary.keys()))
+        return len(keys)
+
+    def getAfflictions(self, key):
+        afflictions = {}
+        attrID = attrIDs.get(key)
+        if attrID is None:
+            return afflictions
+        for row in self.__rows.get(attrID, ()):
+            affliction = self.__afflictions[row]
+            if affliction is not None:
+                fit, affData = affliction
+                afflictions.setdefault(fit, []).append(affData)
+        return afflictions
+
+    def iterAfflictions(self):
+        seen = set()
+        for rowAttrID, affliction in zip(self.__attrIDs, self.__afflictions):
+            if affliction is not None and rowAttrID not in seen:
+                seen.add(rowAttrID)
+                yield attrNames[rowAttrID]
+
+    def applyOperation(self, operation):
+        operator, attributeName, value, stackingPenalties, penaltyGroup, affliction = operation
+        if operator is None:
+            self.__intermediary[attributeName] = value
+            if attributeName in self.__eager:
+                self.__repend(attributeName)
+        else:
+            attrID = internAttr(attributeName)
+            self.__rows.setdefault(attrID, []).append(len(self.__attrIDs))
+            self.__attrIDs.append(attrID)
+            self.__operators.append(operator)
+            self.__values.append(value)
+            if operator == Operator.MULTIPLY and stackingPenalties:
+                self.__penaltyGroups.append(internPenaltyGroup(penaltyGroup))
+            else:
+                self.__penaltyGroups.append(NOT_PENALIZED)
+            self.__afflictions.append(affliction if self.trackAfflictions else None)
+            self.__repend(attributeName)
+        # Values calculated ahead of time could use capping value which is now changing
+        if self.__eager:
+            for cappedKey in cappedAttrs.get(attributeName, ()):
+                if cappedKey in self.__eager:
+                    self.__repend(cappedKey)
+
+    def __repend(self, key):
+        """Mark value as pending calculation"""
+        self.__modified[key] = self.CalculationPlaceholder
+        self.__pending.add(key)
+        self.__eager.discard(key)
+
+    def __collect(self, key):
+        """Gather modifications of single attribute, in the same shape regular map keeps them"""
+        force = None
+        preAssign = None
+        preIncrease = 0
+        multiplier = 1
+        penalizedMultiplierGroups = {}
+        postIncrease = 0
+        attrID = attrIDs.get(key)
+        if attrID is not None:
+            operators = self.__operators
+            values = self.__values
+            penaltyGroups = self.__penaltyGroups
+            for row in self.__rows.get(attrID, ()):
+                operator = operators[row]
+                value = values[row]
+                groupID = penaltyGroups[row]
+                if operator == Operator.PREINCREASE:
+                    preIncrease += value
+                elif operator == Operator.MULTIPLY:
+                    if groupID == NOT_PENALIZED:
+                        multiplier *= value
+                    else:
+                        penalizedMultiplierGroups.setdefault(penaltyGroupNames[groupID], []).append(value)
+                elif operator == Operator.POSTINCREASE:
+                    postIncrease += value
+                elif operator == Operator.PREASSIGN:
+                    preAssign = value
+                elif operator == Operator.FORCE:
+                    force = value
+        return force, preAssign, preIncrease, multiplier, penalizedMultiplierGroups, postIncrease
+
+    def __getCappingValue(self, key):
+        cappingKey = getCappingKey(key)
+        if not cappingKey:
+            return None
+        cappedAttrs.setdefault(cappingKey, set()).add(key)
+        cappingValue = self.original.get(cappingKey, self._calculateValue(cappingKey))
+        return cappingValue.value if hasattr(cappingValue, "value") else cappingValue
+
+    @staticmethod
+    def __finishValue(key, val, cappingValue):
+        # Cap value if we have cap defined
+        if cappingValue is not None:
+            val = min(val, cappingValue)
+        if key in ("cpu", "power", "cpuOutput", "powerOutput"):
+            val = round(val, 2)
+        return val
+
+    def _calculateValue(self, key, extraMultipliers=None, preIncAdj=None, multAdj=None, postIncAdj=None, ignorePenMult=None):
+        cappingValue = self.__getCappingValue(key)
+        force, preAssign, preIncrease, multiplier, penalizedMultiplierGroups, postIncrease = self.__collect(key)
+        # If value is forced, we don't have to calculate anything,
+        # just return forced value instead
+        if force is not None:
+            return self.__finishValue(key, force, cappingValue)
+        # Add extra multipliers to the group, not modifying initial data source
+        if extraMultipliers is not None:
+            penalizedMultiplierGroups = addExtraMultipliers(self.fit, penalizedMultiplierGroups, extraMultipliers)
+
+        # Grab initial value, priorities are:
+        # Results of ongoing calculation > preAssign > original > 0
+        val = self.__getBaseValue(key, preAssign)
+
+        # We'll do stuff in the following order:
+        # preIncrease > multiplier > stacking penalized multipliers > postIncrease
+        val += preIncrease
+        if preIncAdj is not None:
+            val += preIncAdj
+        val *= multiplier
+        if multAdj is not None:
+            val *= multAdj
+        val = applyStackingPenalties(val, penalizedMultiplierGroups, ignorePenMult)
+        val += postIncrease
+        if postIncAdj is not None:
+            val += postIncAdj
+        return self.__finishValue(key, val, cappingValue)
+
+    def __getBaseValue(self, key, preAssign):
+        if preAssign is None:
+            preAssign = self.getOriginal(key, getAttrDefault(key, fallback=0.0))
+        return self.__intermediary.get(key, preAssign)
+
+    def __calculatePending(self, key):
+        """Calculate requested value, along with all other pending values when it's worth it"""
+        pending = self.__pending
+        if numpy is not None and len(pending) > 1 and len(self.__attrIDs) >= self.vectorizeThreshold:
+            values = self.__calculateVectorized(pending)
+            self.__modified.update(values)
+            pending.clear()
+            self.__eager.update(values)
+            self.__eager.discard(key)
+            return values[key]
+        val = self.__modified[key] = self._calculateValue(key)
+        pending.discard(key)
+        return val
+
+    def __calculateVectorized(self, keys):
+        """Calculate values of multiple attributes at once"""
+        keys = sorted(keys, key=lambda k: attrIDs.get(k, -1))
+        keyIDs = numpy.array([attrIDs.get(k, -1) for k in keys], dtype=numpy.int64)
+        attrs = numpy.array(self.__attrIDs, dtype=numpy.int64)
+        rows = numpy.flatnonzero(numpy.isin(attrs, keyIDs))
+        slots = numpy.searchsorted(keyIDs, attrs[rows])
+        operators = numpy.array(self.__operators, dtype=numpy.int8)[rows]
+        values = numpy.array(self.__values, dtype=numpy.float64)[rows]
+        groups = numpy.array(self.__penaltyGroups, dtype=numpy.int64)[rows]
+        amount = len(keys)
+
+        def aggregate(mask, initial, ufunc):
+            # Rows are processed in the order they were added, like sequential
+            # in-place updates of regular map
+            result = numpy.full(amount, initial, dtype=numpy.float64)
+            ufunc.at(result, slots[mask], values[mask])
+            return result.tolist()
+
+        def lastRows(mask):
+            result = numpy.full(amount, -1, dtype=numpy.int64)
+            numpy.maximum.at(result, slots[mask], numpy.flatnonzero(mask))
+            return result.tolist()
+
+        isMultiply = operators == Operator.MULTIPLY
+        preIncreases = aggregate(operators == Operator.PREINCREASE, 0, numpy.add)
+        postIncreases = aggregate(operators == Operator.POSTINCREASE, 0, numpy.add)
+        multipliers = aggregate(isMultiply & (groups == NOT_PENALIZED), 1, numpy.multiply)
+        forceRows = lastRows(operators == Operator.FORCE)
+        preAssignRows = lastRows(operators == Operator.PREASSIGN)
+
+        # Stacking penalized multipliers: groups are applied in order they were first seen,
+        # bonuses before penalties, and the most significant ones first within each of those
+        # (multipliers equal to 1 do not change anything, but still define order of groups)
+        penalized = numpy.flatnonzero(isMultiply & (groups != NOT_PENALIZED))
+        pairs = slots[penalized] * (len(penaltyGroupNames) + 1) + groups[penalized]
+        if len(penalized):
+            _, firstSeen, pairIndex = numpy.unique(pairs, return_index=True, return_inverse=True)
+            groupOrder = penalized[firstSeen][pairIndex.reshape(-1)]
+        else:
+            groupOrder = penalized
+        significant = values[penalized] != 1
+        penalized = penalized[significant]
+        groupOrder = groupOrder[significant]
+        penSlots = slots[penalized]
+        penValues = values[penalized]
+        isPenalty = penValues < 1
+        order = numpy.lexsort((penalized, -numpy.abs(penValues - 1), isPenalty, groupOrder, penSlots))
+        penSlots = penSlots[order]
+        penValues = penValues[order]
+        chains = numpy.stack((penSlots, groupOrder[order], isPenalty[order])) if len(order) else None
+        positions = numpy.arange(len(order))
+        if len(order):
+            chainStart = numpy.ones(len(order), dtype=bool)
+            chainStart[1:] = numpy.any(chains[:, 1:] != chains[:, :-1], axis=0)
+            ranks = positions - numpy.maximum.accumulate(numpy.where(chainStart, positions, 0))
+            factors = (1 + (penValues - 1) * getPenaltyFactors(int(ranks.max()) + 1)[ranks]).tolist()
+        else:
+            factors = []
+        bounds = numpy.searchsorted(penSlots, numpy.arange(amount + 1)).tolist()
+        rowValues = values.tolist()
+
+        results = {}
+        for slot, key in enumerate(keys):
+            cappingValue = self.__getCappingValue(key)
+            if forceRows[slot] >= 0:
+                results[key] = self.__finishValue(key, rowValues[forceRows[slot]], cappingValue)
+                continue
+            preAssign = rowValues[preAssignRows[slot]] if preAssignRows[slot] >= 0 else None
+            val = self.__getBaseValue(key, preAssign)
+            val += preIncreases[slot]
+            val *= multipliers[slot]
+            for factor in factors[bounds[slot]:bounds[slot + 1]]:
+                val *= factor
+            val += postIncreases[slot]
+            results[key] = self.__finishValue(key, val, cappingValue)
+        return results
+
+
+# Calculation journal hooks, used only while journal is active
+registerHooks(ArrayModifiedAttributeDict, {
+    "__getitem__": journaledRead(ArrayModifiedAttributeDict.__getitem__, getCappingKey),
+    "__contains__": journaledRead(ArrayModifiedAttributeDict.__contains__)})
@@ -0,0 +1,69 @@
+# ===============================================================================
+# Copyright (C) 2010 Diego Duclos
+#
+# This file is part of eos.
+#
+# eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with eos.  If not, see <http://www.gnu.org/licenses/>.
+# ===============================================================================
+
+"""
+Switch for calculation hooks.
+
+Calculation journal and profiler hook into the hottest paths of calculation:
+attribute reads, attribute operations and effect handler lookups. Hooked
+versions of those methods are swapped in only while a journal or profiler is
+active on some thread, so that calculation does not pay for the hooks when
+neither is used. Hooked versions still check what is active on the current
+thread.
+"""
+
+import threading
+
+
+_lock = threading.Lock()
+# Number of journals and profilers which are currently active
+_users = 0
+# List of (class, attribute name, plain version, hooked version) tuples
+_hooks = []
+
+
+def registerHooks(cls, hooks):
+    """Register hooked versions of class attributes, passed as {attribute name: hooked version}"""
+    with _lock:
+        for name, hooked in hooks.items():
+            _hooks.append((cls, name, cls.__dict__[name], hooked))
+            if _users:
+                setattr(cls, name, hooked)
+
+
+def enableHooks():
+    global _users
+    with _lock:
+        _users += 1
+        if _users == 1:
+            for cls, name, plain, hooked in _hooks:
+                setattr(cls, name, hooked)
+
+
+def disableHooks():
+    global _users
+    with _lock:
+        _users -= 1
+        if _users == 0:
+            for cls, name, plain, hooked in _hooks:
+                setattr(cls, name, plain)
+
+
+def hooksEnabled():
+    return _users > 0
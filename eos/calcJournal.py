@@ -0,0 +1,464 @@
+# ===============================================================================
+# Copyright (C) 2010 Diego Duclos
+#
+# This file is part of eos.
+#
+# eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with eos.  If not, see <http://www.gnu.org/licenses/>.
+# ===============================================================================
+
+"""
+Calculation journal, used to recalculate fits incrementally.
+
+While a fit is calculated with a journal active, every effect handler call is
+recorded as an invocation, together with the attribute operations it applied,
+the modified attributes it read and the item lists it filtered. When the fit
+changes afterwards, the journal finds out which fit items changed and rebuilds
+modified attributes in the original order: operations of unaffected
+invocations are replayed from the journal, handlers whose inputs may have
+changed are run again, and handlers which filtered a list that gained items
+are run against the new items only. Whenever the journal cannot vouch for the
+result, it refuses to update and the fit has to be calculated from scratch.
+"""
+
+import threading
+from functools import wraps
+
+from logbook import Logger
+
+import eos.config
+from eos.calcHooks import disableHooks, enableHooks
+
+
+pyfalog = Logger(__name__)
+
+
+RUN_TIMES = ("early", "normal", "late")
+
+
+class _JournalState(threading.local):
+    # Journal which is recording on the current thread, if any
+    journal = None
+
+
+journalState = _JournalState()
+
+
+class JournalConflict(Exception):
+    """Raised when incremental update cannot reproduce results of full calculation"""
+    pass
+
+
+def getActiveJournal():
+    return journalState.journal
+
+
+def iterCalcList(handledList, elements=None):
+    """
+    Iterate over items of the list which is filtered by an effect. When an
+    invocation is re-run only against new items of the list, other items
+    are skipped here. Elements can be passed when the list was already
+    narrowed down via its index.
+    """
+    journal = journalState.journal
+    if journal is None:
+        return handledList if elements is None else elements
+    return journal.iterList(handledList, elements)
+
+
+def journaledRead(method, getCappingKey=None):
+    """
+    Wrap read method of modified attribute map, so that recording journal knows
+    about the read. When getCappingKey is passed, reads of the attribute which
+    caps the read one are recorded as well.
+    """
+    @wraps(method)
+    def hooked(self, key, *args, **kwargs):
+        journal = journalState.journal
+        if journal is not None:
+            journal.recordRead(self, key)
+            if getCappingKey is not None:
+                cappingKey = getCappingKey(key)
+                if cappingKey:
+                    journal.recordRead(self, cappingKey)
+        return method(self, key, *args, **kwargs)
+    return hooked
+
+
+def sourceMads(source):
+    """Get modified attribute maps which belong to the calculation source"""
+    mads = []
+    for attrName in ("itemModifiedAttributes", "chargeModifiedAttributes"):
+        mad = getattr(source, attrName, None)
+        if mad is not None:
+            mads.append(mad)
+    return mads
+
+
+class Invocation:
+    """Single call of an effect handler, and everything it did to the fit"""
+
+    __slots__ = (
+        "runTime", "handler", "entity", "context", "args", "kwargs", "modifier", "origin",
+        "operations", "reads", "lists", "raised", "volatile", "restrict", "restrictMads")
+
+    def __init__(self, runTime, handler, entity, context, args, kwargs, modifier, origin):
+        self.runTime = runTime
+        self.handler = handler
+        self.entity = entity
+        self.context = context
+        self.args = args
+        self.kwargs = kwargs
+        # Modifier registered with the fit when handler was called
+        self.modifier = modifier
+        self.origin = origin
+        # List of (modified attribute map, operation) tuples
+        self.operations = []
+        # Set of (id of modified attribute map, attribute name) tuples
+        self.reads = set()
+        # Lists filtered by the handler, {id(list): list}
+        self.lists = {}
+        self.raised = False
+        # Set when handler does something besides modifying attributes,
+        # which means it cannot be replayed
+        self.volatile = False
+        # When set, handler is run against these items only
+        self.restrict = None
+        self.restrictMads = None
+
+    def copy(self):
+        return Invocation(
+            self.runTime, self.handler, self.entity, self.context, self.args,
+            self.kwargs, self.modifier, self.origin)
+
+
+class CalcJournal:
+
+    def __init__(self, fit):
+        self.fit = fit
+        self.valid = True
+        self.current = None
+        self.source = None
+        self.runTime = None
+        self.__previous = None
+        # {id(source): {runTime: [invocations]}}
+        self.__invocations = {}
+        self.__sources = []
+        self.__signatures = {}
+        self.__fitSignature = None
+
+    @staticmethod
+    def canRecord(fit):
+        """Check if fit is calculated in a way which journal can reproduce"""
+        from eos.modifiedAttributeDict import ModifiedAttributeDict
+        if fit.ship is None or ModifiedAttributeDict.overrides_enabled:
+            return False
+        if fit.projectedFits or fit.commandFits:
+            return False
+        if fit.projectedModules or fit.projectedDrones or fit.projectedFighters:
+            return False
+        return True
+
+    @staticmethod
+    def fitSignature(fit):
+        """Collect fit-wide data which effect handlers rely on, besides fit items"""
+        character = fit.character
+        damagePattern = fit.damagePattern
+        if damagePattern is not None:
+            patternSignature = (
+                damagePattern.emAmount, damagePattern.thermalAmount,
+                damagePattern.kineticAmount, damagePattern.explosiveAmount)
+        else:
+            patternSignature = None
+        return (
+            id(fit.ship), fit.isStructure, fit.implantLocation, fit.getSystemSecurity(),
+            id(character), tuple(skill.level for skill in character.skills),
+            patternSignature, eos.config.settings["useStaticAdaptiveArmorHardener"])
+
+    @staticmethod
+    def sourceSignature(source):
+        """Collect state of calculation source which determines which effects it runs and how"""
+        item = getattr(source, "item", None)
+        charge = getattr(source, "charge", None)
+        mutators = getattr(source, "mutators", None) or {}
+        return (
+            getattr(item, "ID", None), getattr(charge, "ID", None),
+            getattr(source, "state", None), getattr(source, "active", None),
+            getattr(source, "amount", None), getattr(source, "amountActive", None),
+            getattr(source, "projected", None),
+            tuple(ability.active for ability in getattr(source, "abilities", ())),
+            tuple(sideEffect.active for sideEffect in getattr(source, "sideEffects", ())),
+            tuple((mutatorID, mutator.value) for mutatorID, mutator in mutators.items()))
+
+    def __enter__(self):
+        enableHooks()
+        self.__previous = journalState.journal
+        journalState.journal = self
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        journalState.journal = self.__previous
+        disableHooks()
+        self.__previous = None
+        self.current = None
+        self.source = None
+        self.runTime = None
+
+    def enterSource(self, source, runTime):
+        """Called by fit before calculation source applies its effects"""
+        self.source = source
+        self.runTime = runTime
+
+    def finish(self):
+        """Store state of the fit the recorded calculation was done against"""
+        fit = self.fit
+        if fit.commandBonuses:
+            self.valid = False
+        if not self.valid:
+            return False
+        self.__sources = list(fit.iterCalcSources())
+        self.__signatures = {id(s): self.sourceSignature(s) for s in self.__sources}
+        self.__fitSignature = self.fitSignature(fit)
+        return True
+
+    def getState(self):
+        """Get recorded calculation, which can be brought back via setState() after journal is updated"""
+        invocations = {
+            sID: {runTime: [(invocation, invocation.operations, invocation.raised) for invocation in runTimeInvocations]
+                  for runTime, runTimeInvocations in sourceInvocations.items()}
+            for sID, sourceInvocations in self.__invocations.items()}
+        return self.valid, invocations, self.__sources, self.__signatures, self.__fitSignature
+
+    def setState(self, state):
+        self.valid, invocations, self.__sources, self.__signatures, self.__fitSignature = state
+        self.__invocations = {}
+        for sID, sourceInvocations in invocations.items():
+            for runTime, runTimeInvocations in sourceInvocations.items():
+                restored = self.__invocations.setdefault(sID, {}).setdefault(runTime, [])
+                for invocation, operations, raised in runTimeInvocations:
+                    invocation.operations = operations
+                    invocation.raised = raised
+                    restored.append(invocation)
+
+    # Hooks used by effect handlers and modified attribute maps
+
+    def trackHandler(self, handler):
+        """Wrap effect handler so that its calls are recorded as invocations"""
+        def trackedHandler(fit, entity, context, *args, **kwargs):
+            if fit is not self.fit or self.source is None or self.current is not None:
+                if fit is not self.fit:
+                    self.valid = False
+                return handler(fit, entity, context, *args, **kwargs)
+            invocation = Invocation(
+                self.runTime, handler, entity, context, args, kwargs, fit.getModifier(), fit.getOrigin())
+            self.__invocations.setdefault(id(self.source), {}).setdefault(self.runTime, []).append(invocation)
+            self.__execute(invocation)
+        return trackedHandler
+
+    def recordOperation(self, mad, operation):
+        """Record operation; returns False if the operation should not be applied"""
+        invocation = self.current
+        if invocation is None:
+            # Something modified attributes outside of effect handlers, we cannot replay it
+            self.valid = False
+            return True
+        if invocation.restrictMads is not None and id(mad) not in invocation.restrictMads:
+            return False
+        invocation.operations.append((mad, operation))
+        return True
+
+    def recordRead(self, mad, key):
+        invocation = self.current
+        if invocation is not None:
+            invocation.reads.add((id(mad), key))
+
+    def recordSideEffect(self):
+        invocation = self.current
+        if invocation is None:
+            self.valid = False
+        else:
+            invocation.volatile = True
+
+    def iterList(self, handledList, elements=None):
+        if elements is None:
+            elements = handledList
+        invocation = self.current
+        if invocation is None:
+            return elements
+        invocation.lists[id(handledList)] = handledList
+        if invocation.restrict is None:
+            return elements
+        return [element for element in elements if id(element) in invocation.restrict]
+
+    def __execute(self, invocation):
+        previous = self.current
+        self.current = invocation
+        try:
+            invocation.handler(self.fit, invocation.entity, invocation.context, *invocation.args, **invocation.kwargs)
+        except Exception:
+            invocation.raised = True
+            raise
+        finally:
+            self.current = previous
+
+    # Incremental update
+
+    def update(self):
+        """
+        Rebuild modified attributes of the fit after local changes. Returns
+        False if fit has to be calculated from scratch instead.
+        """
+        fit = self.fit
+        if not self.valid or not self.canRecord(fit) or self.fitSignature(fit) != self.__fitSignature:
+            return False
+        sources = list(fit.iterCalcSources())
+        signatures = {id(s): self.sourceSignature(s) for s in sources}
+        changed = {sID for sID, sig in signatures.items() if self.__signatures.get(sID) != sig}
+        removed = [s for s in self.__sources if id(s) not in signatures]
+        # Items which were not touched have to be run in the same order as before,
+        # otherwise values they read during calculation might differ
+        kept = set(signatures).difference(changed)
+        if [id(s) for s in self.__sources if id(s) in kept] != [id(s) for s in sources if id(s) in kept]:
+            return False
+
+        # Maps of changed and removed items are rebuilt from scratch
+        staleMads = set()
+        changedMadOwners = {}
+        madsByOwner = {}
+        for source in sources:
+            if id(source) in changed:
+                mads = sourceMads(source)
+                madsByOwner[id(source)] = mads
+                for mad in mads:
+                    changedMadOwners[id(mad)] = id(source)
+        staleMads.update(changedMadOwners)
+        for source in removed:
+            staleMads.update(id(mad) for mad in sourceMads(source))
+
+        # Attributes which might end up with values different from previous calculation
+        changedKeys = set()
+        oldInvocations = self.__invocations
+        for sID in changed.union(id(s) for s in removed):
+            for invocations in oldInvocations.get(sID, {}).values():
+                for invocation in invocations:
+                    changedKeys.update((id(mad), op[1]) for mad, op in invocation.operations)
+
+        pyfalog.debug("Updating fit {0}: {1} changed, {2} removed items", repr(fit), len(changed), len(removed))
+        fit.clear()
+        self.__invocations = {}
+        enableHooks()
+        self.__previous = journalState.journal
+        journalState.journal = self
+        try:
+            for runTime in RUN_TIMES:
+                self.runTime = runTime
+                for source in sources:
+                    sID = id(source)
+                    self.source = source
+                    if sID in changed:
+                        fit.register(source)
+                        source.calculateModifiedAttributes(fit, runTime, False)
+                        for invocation in self.__invocations.get(sID, {}).get(runTime, ()):
+                            changedKeys.update((id(mad), op[1]) for mad, op in invocation.operations)
+                        continue
+                    invocations = oldInvocations.get(sID, {}).get(runTime)
+                    if not invocations:
+                        continue
+                    refreshed = self.__invocations.setdefault(sID, {}).setdefault(runTime, [])
+                    for invocation in invocations:
+                        refreshed.append(self.__refresh(
+                            invocation, changed, staleMads, changedMadOwners, madsByOwner, changedKeys))
+        except JournalConflict as e:
+            pyfalog.debug("Incremental update of fit {0} is not possible: {1}", repr(fit), e)
+            self.valid = False
+        except Exception:
+            pyfalog.exception("Incremental update of fit {0} failed", repr(fit))
+            self.valid = False
+        finally:
+            journalState.journal = self.__previous
+            disableHooks()
+            self.__previous = None
+            self.current = None
+            self.source = None
+            self.runTime = None
+        return self.finish()
+
+    def __refresh(self, invocation, changed, staleMads, changedMadOwners, madsByOwner, changedKeys):
+        """Bring single invocation of unchanged item up to date, returning invocation to keep"""
+        if invocation.volatile or not changedKeys.isdisjoint(invocation.reads):
+            return self.__rerun(invocation, staleMads, changedKeys)
+        for madID, key in invocation.reads:
+            if madID in staleMads:
+                return self.__rerun(invocation, staleMads, changedKeys)
+        # Changed items which handler will have to be applied to
+        restrict = set()
+        for handledList in invocation.lists.values():
+            for element in handledList:
+                if id(element) in changed:
+                    restrict.add(id(element))
+        operations = []
+        for mad, operation in invocation.operations:
+            madID = id(mad)
+            if madID not in staleMads:
+                operations.append((mad, operation))
+                continue
+            owner = changedMadOwners.get(madID)
+            # Handler modified changed item it didn't get from a list, no
+            # way to tell what it's going to do now
+            if owner is not None and owner not in restrict:
+                return self.__rerun(invocation, staleMads, changedKeys)
+        if restrict and invocation.raised:
+            return self.__rerun(invocation, staleMads, changedKeys)
+        for mad, operation in operations:
+            mad.applyOperation(operation)
+        invocation.operations = operations
+        if restrict:
+            invocation.restrict = restrict
+            invocation.restrictMads = {id(mad) for owner in restrict for mad in madsByOwner[owner]}
+            self.fit.register(invocation.modifier, invocation.origin)
+            try:
+                self.__execute(invocation)
+            except Exception as e:
+                raise JournalConflict("handler failed when applied to new items: {}".format(e))
+            finally:
+                invocation.restrict = None
+                invocation.restrictMads = None
+        return invocation
+
+    def __rerun(self, invocation, staleMads, changedKeys):
+        rerun = invocation.copy()
+        self.fit.register(rerun.modifier, rerun.origin)
+        try:
+            self.__execute(rerun)
+        except Exception:
+            pass
+        if rerun.raised != invocation.raised:
+            raise JournalConflict("handler outcome changed")
+        # Only attributes which received different operations can affect other handlers
+        oldOperations = self.__groupOperations(invocation, staleMads)
+        newOperations = self.__groupOperations(rerun, staleMads)
+        for key in set(oldOperations).union(newOperations):
+            if oldOperations.get(key) != newOperations.get(key):
+                changedKeys.add(key)
+        return rerun
+
+    @staticmethod
+    def __groupOperations(invocation, staleMads):
+        grouped = {}
+        for mad, operation in invocation.operations:
+            madID = id(mad)
+            if madID in staleMads:
+                continue
+            # Affliction data is left out, it doesn't influence values
+            grouped.setdefault((madID, operation[1]), []).append(operation[:5])
+        return grouped
@@ -0,0 +1,209 @@
+# ===============================================================================
+# Copyright (C) 2010 Diego Duclos
+#
+# This file is part of eos.
+#
+# eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with eos.  If not, see <http://www.gnu.org/licenses/>.
+# ===============================================================================
+
+"""
+Calculation-only fits.
+
+Saved data classes are mapped to database tables, so every write to their
+mapped attributes goes through ORM instrumentation, and through listeners
+eos.events attaches to update modification time of the fit. Fits which are
+only calculated need none of that. Calculation-only classes run the same code
+as saved data classes, thus effect handlers work with them the same way, but
+they are not mapped, and keep their attributes in slots. Calculation-only
+fits are copies of saved data fits; they cannot be saved, and projected and
+command fits are not copied along with them.
+"""
+
+import dis
+
+from sqlalchemy.orm import class_mapper
+
+# {saved data class: calculation-only class}
+calcClasses = {}
+
+
+def getStoredAttrs(cls):
+    """Get names of all attributes which code of the class and of its bases assigns"""
+    names = set()
+
+    def collect(code):
+        for instruction in dis.get_instructions(code):
+            if instruction.opname == "STORE_ATTR":
+                names.add(instruction.argval)
+        for const in code.co_consts:
+            if hasattr(const, "co_code"):
+                collect(const)
+
+    for klass in cls.__mro__[:-1]:
+        for value in vars(klass).values():
+            if isinstance(value, property):
+                funcs = (value.fget, value.fset, value.fdel)
+            elif isinstance(value, (staticmethod, classmethod)):
+                funcs = (value.__func__,)
+            else:
+                funcs = (value,)
+            for func in funcs:
+                code = getattr(func, "__code__", None)
+                if code is not None:
+                    collect(code)
+    return names
+
+
+def buildCalcClass(cls):
+    """
+    Build calculation-only counterpart of saved data class. It shares methods and
+    properties with the saved data class, while mapped attributes and attributes
+    assigned by its code become slots.
+    """
+    stored = getStoredAttrs(cls) | set(class_mapper(cls).attrs.keys())
+    namespace = {"__module__": __name__, "__doc__": cls.__doc__}
+    # Class attributes which instances override, they are assigned on creation
+    defaults = {}
+    for name, value in vars(cls).items():
+        if name in ("__dict__", "__weakref__", "__module__", "__qualname__", "__doc__", "__init__") or name.startswith("_sa_"):
+            continue
+        # Instrumented attributes and association proxies
+        if type(value).__module__.startswith("sqlalchemy"):
+            stored.add(name)
+            continue
+        if name in stored and not hasattr(value, "__set__"):
+            defaults[name] = value
+            continue
+        namespace[name] = value
+    inherited = {name for klass in cls.__mro__[1:] for name, value in vars(klass).items() if hasattr(value, "__set__")}
+    namespace["__slots__"] = tuple(sorted(stored - set(namespace) - inherited))
+    namespace["calcDefaults"] = defaults
+    return type("Calc{}".format(cls.__name__), cls.__bases__, namespace)
+
+
+def getCalcClass(cls):
+    calcClass = calcClasses.get(cls)
+    if calcClass is None:
+        calcClass = calcClasses[cls] = buildCalcClass(cls)
+    return calcClass
+
+
+def isCalcOnly(obj):
+    return type(obj) in calcClasses.values()
+
+
+def createCopy(source):
+    """Create calculation-only object with values of mapped columns of the source, without initializing it"""
+    sourceClass = type(source)
+    calcClass = getCalcClass(sourceClass)
+    obj = calcClass.__new__(calcClass)
+    for name, value in calcClass.calcDefaults.items():
+        setattr(obj, name, value)
+    for prop in class_mapper(sourceClass).column_attrs:
+        setattr(obj, prop.key, getattr(source, prop.key))
+    return obj
+
+
+def copyChild(source, parentKey, parent):
+    """
+    Copy object which belongs to another one, like fighter ability. Initializing them needs
+    their parent to be initialized first, so they are copied with all their attributes instead.
+    """
+    obj = createCopy(source)
+    mapped = class_mapper(type(source)).attrs.keys()
+    for name, value in vars(source).items():
+        if name not in mapped and not name.startswith("_sa_"):
+            setattr(obj, name, value)
+    setattr(obj, parentKey, parent)
+    return obj
+
+
+def copyModule(source, fit):
+    mod = createCopy(source)
+    mod.owner = fit
+    mod.mutators = {attrID: copyChild(mutator, "module", mod) for attrID, mutator in source.mutators.items()}
+    mod.init()
+    return mod
+
+
+def copyDrone(source, fit):
+    drone = createCopy(source)
+    drone.owner = fit
+    drone.init()
+    return drone
+
+
+def copyFighter(source, fit):
+    fighter = createCopy(source)
+    fighter.owner = fit
+    fighter._Fighter__abilities = [copyChild(ability, "fighter", fighter) for ability in source.abilities]
+    fighter.init()
+    return fighter
+
+
+def copyCargo(source, fit):
+    cargo = createCopy(source)
+    cargo.owner = fit
+    cargo.init()
+    return cargo
+
+
+def copyImplant(source, fit):
+    implant = createCopy(source)
+    implant.owner = [fit]
+    implant.init()
+    return implant
+
+
+def copyBooster(source, fit):
+    booster = createCopy(source)
+    booster.owner = fit
+    booster._Booster__sideEffects = [copyChild(sideEffect, "booster", booster) for sideEffect in source.sideEffects]
+    booster.init()
+    return booster
+
+
+# (attribute with the container, function which copies items in it)
+FIT_CONTAINERS = (
+    ("_Fit__modules", copyModule),
+    ("_Fit__projectedModules", copyModule),
+    ("_Fit__drones", copyDrone),
+    ("_Fit__projectedDrones", copyDrone),
+    ("_Fit__fighters", copyFighter),
+    ("_Fit__projectedFighters", copyFighter),
+    ("_Fit__cargo", copyCargo),
+    ("_Fit__implants", copyImplant),
+    ("_Fit__boosters", copyBooster))
+
+
+def toCalcOnly(source):
+    """Build calculation-only copy of saved data fit"""
+    if isCalcOnly(source):
+        return source
+    fit = createCopy(source)
+    fit.owner = None
+    fit._Fit__character = source._Fit__character
+    fit._Fit__damagePattern = source.damagePattern
+    fit._Fit__targetProfile = source.targetProfile
+    for name in ("projectedOnto", "victimOf", "boostedOnto", "boostedOf", "projectedFitDict", "commandFitDict"):
+        setattr(fit, name, {})
+    for name, copyItem in FIT_CONTAINERS:
+        sourceItems = getattr(source, name)
+        items = type(sourceItems)()
+        # Items were validated when they were added to the source fit, no need
+        # to go through checks of the container again
+        list.extend(items, (copyItem(item, fit) for item in sourceItems))
+        setattr(fit, name, items)
+    fit.init()
+    return fit
@@ -0,0 +1,187 @@
+# ===============================================================================
+# Copyright (C) 2010 Diego Duclos
+#
+# This file is part of eos.
+#
+# eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with eos.  If not, see <http://www.gnu.org/licenses/>.
+# ===============================================================================
+
+"""
+Calculation profiler.
+
+While a profiler is active on the current thread, every effect handler call,
+every filtered pass over a handled list and every operation applied to a
+modified attribute map is timed and counted. Stats are accumulated over all
+calculations done while profiler was active, and can be exported as JSON.
+
+Handler times include time of list passes and attribute operations done by
+the handler. When a fit is updated incrementally, handlers whose results are
+replayed from calculation journal are not called, and thus not profiled.
+"""
+
+import json
+import threading
+from time import perf_counter
+
+from logbook import Logger
+
+from eos.calcHooks import disableHooks, enableHooks
+from eos.const import Operator
+
+
+pyfalog = Logger(__name__)
+
+
+class _ProfilerState(threading.local):
+    # Profiler which is active on the current thread, if any
+    profiler = None
+
+
+profilerState = _ProfilerState()
+
+
+class CalcStats:
+    """Call count and total time of one profiled thing"""
+
+    __slots__ = ("calls", "time")
+
+    def __init__(self):
+        self.calls = 0
+        self.time = 0
+
+    def add(self, elapsed):
+        self.calls += 1
+        self.time += elapsed
+
+    def export(self):
+        return {"calls": self.calls, "time": self.time, "average": self.time / self.calls if self.calls else 0}
+
+
+class CalcProfiler:
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        # Profilers which were active when this one was entered
+        self.__previous = []
+        self.reset()
+
+    def reset(self):
+        # {effect ID: [effect name, run time, CalcStats]}
+        self.effects = {}
+        # {run time: CalcStats}
+        self.runTimes = {}
+        # {(source type, source name): CalcStats}
+        self.sources = {}
+        # {(effect ID, list method name): [CalcStats, scanned list elements]}
+        self.listPasses = {}
+        # {operation name: CalcStats}
+        self.operations = {}
+        # List of (fit name, calculation type, time) tuples
+        self.recalcs = []
+        self.__effectID = None
+
+    def __enter__(self):
+        enableHooks()
+        self.__previous.append(profilerState.profiler)
+        profilerState.profiler = self
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        profilerState.profiler = self.__previous.pop()
+        disableHooks()
+
+    # Hooks used by effects, handled lists and modified attribute maps
+
+    def trackHandler(self, effect, handler):
+        """Wrap effect handler so that its calls are timed"""
+        def profiledHandler(fit, entity, context, *args, **kwargs):
+            previousEffectID = self.__effectID
+            self.__effectID = effect.ID
+            start = perf_counter()
+            try:
+                return handler(fit, entity, context, *args, **kwargs)
+            finally:
+                elapsed = perf_counter() - start
+                self.__effectID = previousEffectID
+                self.__addEffect(effect, entity, elapsed)
+        return profiledHandler
+
+    def __addEffect(self, effect, entity, elapsed):
+        runTime = effect.runTime
+        item = getattr(entity, "item", None)
+        sourceKey = (type(entity).__name__, getattr(item, "name", None))
+        with self.lock:
+            if effect.ID not in self.effects:
+                self.effects[effect.ID] = [effect.name, runTime, CalcStats()]
+            self.effects[effect.ID][2].add(elapsed)
+            self.runTimes.setdefault(runTime, CalcStats()).add(elapsed)
+            self.sources.setdefault(sourceKey, CalcStats()).add(elapsed)
+
+    def trackListPass(self, methodName, method, handledList, args, kwargs):
+        """Run filtered pass over handled list, timing it"""
+        start = perf_counter()
+        try:
+            return method(handledList, *args, **kwargs)
+        finally:
+            elapsed = perf_counter() - start
+            with self.lock:
+                key = (self.__effectID, methodName)
+                if key not in self.listPasses:
+                    self.listPasses[key] = [CalcStats(), 0]
+                passStats = self.listPasses[key]
+                passStats[0].add(elapsed)
+                passStats[1] += len(handledList)
+
+    def addOperation(self, operator, elapsed):
+        name = Operator(operator).name.lower() if operator is not None else "intermediary"
+        with self.lock:
+            self.operations.setdefault(name, CalcStats()).add(elapsed)
+
+    def addRecalc(self, fitName, calcType, elapsed):
+        with self.lock:
+            self.recalcs.append((fitName, calcType, elapsed))
+
+    # Results
+
+    def getEffectStats(self):
+        """Get list of (effect ID, effect name, run time, CalcStats), most time consuming first"""
+        with self.lock:
+            rows = [(effectID, name, runTime, stats) for effectID, (name, runTime, stats) in self.effects.items()]
+        rows.sort(key=lambda row: row[3].time, reverse=True)
+        return rows
+
+    def export(self):
+        """Compose JSON-serializable dictionary with all collected stats"""
+        def sortedStats(items):
+            return sorted(items, key=lambda row: row["time"], reverse=True)
+
+        with self.lock:
+            return {
+                "recalcs": [{"fit": fitName, "type": calcType, "time": elapsed} for fitName, calcType, elapsed in self.recalcs],
+                "effects": sortedStats(
+                    dict(stats.export(), effectID=effectID, name=name, runTime=runTime)
+                    for effectID, (name, runTime, stats) in self.effects.items()),
+                "runTimes": sortedStats(dict(stats.export(), runTime=runTime) for runTime, stats in self.runTimes.items()),
+                "sources": sortedStats(
+                    dict(stats.export(), type=sourceType, name=sourceName)
+                    for (sourceType, sourceName), stats in self.sources.items()),
+                "listPasses": sortedStats(
+                    dict(stats.export(), effectID=effectID, method=methodName, elements=elements)
+                    for (effectID, methodName), (stats, elements) in self.listPasses.items()),
+                "operations": sortedStats(dict(stats.export(), operation=name) for name, stats in self.operations.items())}
+
+    def exportJson(self, path):
+        with open(path, "w") as f:
+            json.dump(self.export(), f, indent=2)
+        pyfalog.info("Calculation profile exported to {0}", path)
@@ -0,0 +1,117 @@
+# ===============================================================================
+# Copyright (C) 2010 Diego Duclos
+#
+# This file is part of eos.
+#
+# eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with eos.  If not, see <http://www.gnu.org/licenses/>.
+# ===============================================================================
+
+"""
+Snapshots of calculated fit state.
+
+Besides modified attribute maps, calculation leaves results in plain instance
+attributes of the fit and its items: drains and command bonuses collected by
+effects, reload times, stats cached on first access. Snapshot keeps all
+attributes which are not mapped to database columns, together with contents
+of attribute maps, so that restoring it brings fit back to the state it was
+calculated to without calculating it again. Values of mapped attributes are
+not part of the snapshot, whoever changes them is responsible for changing
+them back.
+"""
+
+from sqlalchemy.orm.attributes import manager_of_class
+
+from eos.calcJournal import sourceMads
+from eos.modifiedAttributeDict import copyContainer
+
+
+class SlotVars:
+    """Dictionary-like view of attributes of calculation-only object, which keeps them in slots"""
+
+    def __init__(self, entity):
+        self.entity = entity
+        self.slots = [name for klass in type(entity).__mro__ for name in vars(klass).get("__slots__", ())]
+
+    def __iter__(self):
+        return (name for name in self.slots if hasattr(self.entity, name))
+
+    def __contains__(self, name):
+        return name in self.slots and hasattr(self.entity, name)
+
+    def __getitem__(self, name):
+        return getattr(self.entity, name)
+
+    def __setitem__(self, name, value):
+        setattr(self.entity, name, value)
+
+    def __delitem__(self, name):
+        delattr(self.entity, name)
+
+
+def getVars(entity):
+    try:
+        return vars(entity)
+    except TypeError:
+        return SlotVars(entity)
+
+
+class CalcSnapshot:
+
+    def __init__(self, fit):
+        self.fit = fit
+        # List of (entity, {attribute name: value})
+        self.entities = []
+        # List of (modified attribute map, its state)
+        self.mads = []
+        for entity in self.iterEntities(fit):
+            self.entities.append((entity, self.__saveVars(entity)))
+            for mad in sourceMads(entity):
+                self.mads.append((mad, mad.getState()))
+
+    @staticmethod
+    def iterEntities(fit):
+        yield fit
+        for source in fit.iterCalcSources():
+            yield source
+            if source is fit.character:
+                yield from source.skills
+            for ability in getattr(source, "abilities", ()):
+                yield ability
+
+    @staticmethod
+    def __getUnmappedKeys(entity):
+        manager = manager_of_class(type(entity))
+        return [k for k in getVars(entity) if k != "_sa_instance_state" and (manager is None or k not in manager)]
+
+    def __saveVars(self, entity):
+        entityVars = getVars(entity)
+        return {k: (entityVars[k], copyContainer(entityVars[k])) for k in self.__getUnmappedKeys(entity)}
+
+    def restore(self):
+        for entity, saved in self.entities:
+            entityVars = getVars(entity)
+            for key in self.__getUnmappedKeys(entity):
+                if key not in saved:
+                    del entityVars[key]
+            for key, (value, contents) in saved.items():
+                # Containers are restored in place, as others might keep references to them
+                if contents is not value:
+                    if isinstance(value, (dict, set)):
+                        value.clear()
+                        value.update(contents)
+                    else:
+                        value[:] = contents
+                entityVars[key] = value
+        for mad, state in self.mads:
+            mad.setState(state)
@@ -3,6 +3,11 @@ import time
 from math import sqrt, exp
 from collections import Counter
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 DAY = 24 * 60 * 60 * 1000
 
 
@@ -306,3 +311,325 @@ class CapSimulator:
         self.saved_changes_internal = None
 
         self.runtime = time.time() - start
+
+
+class VectorCapSimulator(CapSimulator):
+    """
+    Capacitor simulator which builds timeline of module activations with NumPy
+    instead of running them through a heap, and recharges capacitor between
+    activations with precalculated decay factors. Activation times do not
+    depend on capacitor state unless cap injectors are used, so for setups with
+    injectors regular simulation is run instead.
+    """
+
+    # Length of timeline chunk generated at once, when it is not periodic
+    window = 5 * 60 * 1000
+
+    def run(self):
+        """Run the simulation"""
+        if numpy is None or any(activation[6] for activation in self.prepare()):
+            CapSimulator.run(self)
+            return
+
+        start = time.time()
+        streams = self.streams
+        capCapacity = self.capacitorCapacity
+        tau = self.capacitorRecharge / 5.0
+        t_max = self.t_max
+        period = self.period
+        stability_precision = self.stability_precision
+        optimize = self.optimize_repeats
+        changes = {}
+
+        cap = self.startingCapacity
+        cap_wrap = cap
+        cap_lowest = cap
+        cap_lowest_pre = cap
+        t_last = 0
+        t_wrap = period
+        iterations = 0
+        stop = False
+
+        for times, needs, decays in (self.__iterWindows() if streams else ()):
+            times = times.tolist()
+            needs = needs.tolist()
+            decays = decays.tolist()
+            for i in range(len(times)):
+                t_now = times[i]
+                if t_now >= t_max:
+                    stop = True
+                    break
+                if t_now > t_last:
+                    decay = decays[i] if i else exp((t_last - t_now) / tau)
+                    cap = ((1.0 + (sqrt(cap / capCapacity) - 1.0) * decay) ** 2) * capCapacity
+                    if cap < cap_lowest_pre:
+                        cap_lowest_pre = cap
+                    if t_now == t_wrap:
+                        # History is repeating itself, so if we have more cap now than last
+                        # time this happened, it is a stable setup
+                        if optimize and cap >= cap_wrap:
+                            self.result_optimized_repeats = True
+                            stop = True
+                            break
+                        cap_wrap = round(cap, stability_precision)
+                        t_wrap += period
+                t_last = t_now
+                iterations += 1
+                cap -= needs[i]
+                if cap > capCapacity:
+                    cap = capCapacity
+                changes[t_now] = cap
+                if cap < cap_lowest:
+                    # Negative cap - we're unstable, simulation is over
+                    if cap < 0.0:
+                        stop = True
+                        break
+                    cap_lowest = cap
+            if stop:
+                break
+
+        self.t = t_last
+        self.iterations = iterations
+        self.cap_stable_eve = self.getEveStability(streams, capCapacity, tau)
+        if cap > 0.0:
+            self.cap_stable_low = cap_lowest
+            self.cap_stable_high = cap_lowest_pre
+        else:
+            self.cap_stable_low = self.cap_stable_high = 0.0
+        self.saved_changes = tuple((k / 1000, max(0, changes[k])) for k in sorted(changes))
+        self.runtime = time.time() - start
+
+    def prepare(self):
+        """Prepare simulator and return activation streams, in format used by regular simulation"""
+        self.reset()
+        self.result_optimized_repeats = False
+        self.saved_changes_internal = None
+        self.streams = list(self.state)
+        return self.streams
+
+    @property
+    def isPeriodic(self):
+        """Check if prepared activation timeline repeats itself every period"""
+        return self.period < self.t_max and all(not activation[4] for activation in self.streams)
+
+    @staticmethod
+    def getEveStability(streams, capCapacity, tau):
+        try:
+            avgDrain = sum(x[2] / x[1] for x in streams)
+            return 0.25 * (1.0 + sqrt(-(2.0 * avgDrain * tau - capCapacity) / capCapacity)) ** 2
+        except ValueError:
+            return 0.0
+
+    def getTimeline(self, tStart, tEnd):
+        """
+        Return times and capacitor needs of all activations within [tStart, tEnd),
+        in the order regular simulation would process them.
+        """
+        times = []
+        keys = []
+        for t0, duration, capNeed, shot, clipSize, reloadTime, isInjector in self.streams:
+            if clipSize:
+                # Activation number n happens after n cycles and n // clipSize reloads
+                cycle = duration * clipSize + reloadTime
+                first = max(0, int((tStart - t0) // cycle) * clipSize)
+                last = int((tEnd - t0) // cycle + 1) * clipSize
+                n = numpy.arange(first, last, dtype=numpy.float64)
+                streamTimes = t0 + n * duration + numpy.floor(n / clipSize) * reloadTime
+                shots = n % clipSize
+            else:
+                first = max(0, int(numpy.ceil((tStart - t0) / duration)))
+                last = int(numpy.ceil((tEnd - t0) / duration))
+                streamTimes = t0 + numpy.arange(first, last, dtype=numpy.float64) * duration
+                shots = numpy.zeros(len(streamTimes))
+            mask = (streamTimes >= tStart) & (streamTimes < tEnd)
+            streamTimes = streamTimes[mask]
+            times.append(streamTimes)
+            keys.append(numpy.column_stack((
+                numpy.full(len(streamTimes), duration, dtype=numpy.float64),
+                numpy.full(len(streamTimes), capNeed, dtype=numpy.float64),
+                shots[mask],
+                numpy.full(len(streamTimes), clipSize, dtype=numpy.float64),
+                numpy.full(len(streamTimes), reloadTime, dtype=numpy.float64))))
+        times = numpy.concatenate(times) if times else numpy.zeros(0)
+        keys = numpy.concatenate(keys) if keys else numpy.zeros((0, 5))
+        # Heap pops activations ordered by time, then by the rest of activation data
+        order = numpy.lexsort((keys[:, 4], keys[:, 3], keys[:, 2], keys[:, 1], keys[:, 0], times))
+        return times[order], keys[order, 1]
+
+    def __iterWindows(self):
+        """Yield chunks of activation timeline with recharge decay factors between activations"""
+        tau = self.capacitorRecharge / 5.0
+        if self.isPeriodic:
+            # Same activations are repeated every period, just shift them
+            times, needs = self.getTimeline(0, self.period)
+            decays = self.__getDecays(times, tau)
+            offset = 0
+            while offset < self.t_max:
+                yield times + offset, needs, decays
+                offset += self.period
+        else:
+            tStart = 0
+            while tStart < self.t_max:
+                tEnd = min(tStart + self.window, self.t_max)
+                times, needs = self.getTimeline(tStart, tEnd)
+                yield times, needs, self.__getDecays(times, tau)
+                tStart = tEnd
+
+    @staticmethod
+    def __getDecays(times, tau):
+        """Recharge decay factor for time passed since previous activation, first one has to be calculated separately"""
+        decays = numpy.ones(len(times))
+        if len(times) > 1:
+            decays[1:] = numpy.exp(-numpy.diff(times) / tau)
+        return decays
+
+
+def runBatch(simulators, minBatch=64):
+    """
+    Run many simulations at once. Simulations with periodic activation timelines are
+    stepped together, activation by activation, with capacitor state of all of them
+    stored in arrays; those do not keep changes in capacitor level over time. Other
+    simulations are run one by one. Once fewer than minBatch simulations are still
+    running, they are finished in a plain loop.
+    """
+    batch = []
+    for sim in simulators:
+        if numpy is not None and isinstance(sim, VectorCapSimulator):
+            streams = sim.prepare()
+            if streams and not any(activation[6] for activation in streams) and sim.isPeriodic:
+                batch.append(sim)
+                continue
+        sim.run()
+    if batch:
+        _runPeriodicBatch(batch, minBatch)
+
+
+def _runPeriodicBatch(sims, minBatch=64):
+    start = time.time()
+    amount = len(sims)
+    # Activations of single period of all simulations, one after another
+    timelines = [sim.getTimeline(0, sim.period) for sim in sims]
+    lengths = numpy.array([len(times) for times, needs in timelines], dtype=numpy.int64)
+    starts = numpy.concatenate(([0], numpy.cumsum(lengths)[:-1]))
+    times = numpy.concatenate([times for times, needs in timelines])
+    needs = numpy.concatenate([needs for times, needs in timelines])
+    capacity = numpy.array([sim.capacitorCapacity for sim in sims], dtype=numpy.float64)
+    tau = numpy.array([sim.capacitorRecharge / 5.0 for sim in sims], dtype=numpy.float64)
+    period = numpy.array([sim.period for sim in sims], dtype=numpy.float64)
+    tMax = numpy.array([sim.t_max for sim in sims], dtype=numpy.float64)
+    optimize = numpy.array([sim.optimize_repeats for sim in sims], dtype=bool)
+    precision = numpy.array([10.0 ** sim.stability_precision for sim in sims])
+    # Recharge decay factor before every activation; first activation of period
+    # gets decay for time since last activation of previous period
+    owner = numpy.repeat(numpy.arange(amount), lengths)
+    steps = numpy.empty(len(times))
+    steps[1:] = numpy.diff(times)
+    steps[starts] = period - times[starts + lengths - 1] + times[starts]
+    decays = numpy.exp(-steps / tau[owner])
+    recharges = steps > 0
+
+    # State of simulations which are still running
+    index = numpy.arange(amount)
+    cap = numpy.array([sim.startingCapacity for sim in sims], dtype=numpy.float64)
+    capWrap = cap.copy()
+    capLowest = cap.copy()
+    capLowestPre = cap.copy()
+    tLast = numpy.zeros(amount)
+    iterations = numpy.zeros(amount, dtype=numpy.int64)
+    position = numpy.zeros(amount, dtype=numpy.int64)
+    offset = numpy.zeros(amount)
+    wrapped = numpy.zeros(amount, dtype=bool)
+    # Results, filled in as simulations finish
+    results = numpy.zeros((5, amount))
+    optimized = numpy.zeros(amount, dtype=bool)
+
+    while len(index) >= minBatch:
+        event = starts[index] + position
+        tNow = offset + times[event]
+        # Max time reached - we're stable
+        finished = tNow >= tMax[index]
+        # Regenerate cap from last time point
+        recharge = ~finished & recharges[event] & ((position > 0) | wrapped)
+        rechargedCap = ((1.0 + (numpy.sqrt(cap / capacity[index]) - 1.0) * decays[event]) ** 2) * capacity[index]
+        cap = numpy.where(recharge, rechargedCap, cap)
+        capLowestPre = numpy.where(recharge, numpy.minimum(capLowestPre, cap), capLowestPre)
+        # History is repeating itself, so if we have more cap now than last
+        # time this happened, it is a stable setup
+        wrap = ~finished & wrapped & (position == 0)
+        stable = wrap & optimize[index] & (cap >= capWrap)
+        optimized[index[stable]] = True
+        finished |= stable
+        capWrap = numpy.where(wrap, numpy.round(cap * precision[index]) / precision[index], capWrap)
+        # Apply cap modification
+        current = ~finished
+        tLast = numpy.where(current, tNow, tLast)
+        iterations += current
+        cap = numpy.where(current, numpy.minimum(cap - needs[event], capacity[index]), cap)
+        # Negative cap - we're unstable, simulation is over
+        failed = current & (cap < 0.0)
+        finished |= failed
+        capLowest = numpy.where(current & ~failed, numpy.minimum(capLowest, cap), capLowest)
+        # Queue next activation
+        position += 1
+        nextPeriod = position == lengths[index]
+        position[nextPeriod] = 0
+        offset = offset + numpy.where(nextPeriod, period[index], 0.0)
+        wrapped |= nextPeriod
+        if finished.any():
+            done = index[finished]
+            results[:, done] = (cap[finished], capLowest[finished], capLowestPre[finished], tLast[finished],
+                                iterations[finished])
+            keep = ~finished
+            index = index[keep]
+            cap, capWrap, capLowest, capLowestPre = cap[keep], capWrap[keep], capLowest[keep], capLowestPre[keep]
+            tLast, iterations, position, offset, wrapped = tLast[keep], iterations[keep], position[keep], offset[keep], wrapped[keep]
+
+    # Stepping few simulations with arrays is slower than plain loop
+    timesList, needsList, decaysList, rechargesList = times.tolist(), needs.tolist(), decays.tolist(), recharges.tolist()
+    for n, i in enumerate(index.tolist()):
+        simCap, simCapWrap, simLowest, simLowestPre = float(cap[n]), float(capWrap[n]), float(capLowest[n]), float(capLowestPre[n])
+        simT, simIterations, simPosition, simOffset, simWrapped = float(tLast[n]), int(iterations[n]), int(position[n]), float(offset[n]), bool(wrapped[n])
+        simStart, simLength, simCapacity, simPeriod, simTMax = int(starts[i]), int(lengths[i]), float(capacity[i]), float(period[i]), float(tMax[i])
+        simOptimize, simPrecision = bool(optimize[i]), sims[i].stability_precision
+        while True:
+            event = simStart + simPosition
+            tNow = simOffset + timesList[event]
+            if tNow >= simTMax:
+                break
+            if rechargesList[event] and (simPosition or simWrapped):
+                simCap = ((1.0 + (sqrt(simCap / simCapacity) - 1.0) * decaysList[event]) ** 2) * simCapacity
+                if simCap < simLowestPre:
+                    simLowestPre = simCap
+            if simWrapped and not simPosition:
+                if simOptimize and simCap >= simCapWrap:
+                    optimized[i] = True
+                    break
+                simCapWrap = round(simCap, simPrecision)
+            simT = tNow
+            simIterations += 1
+            simCap = min(simCap - needsList[event], simCapacity)
+            if simCap < simLowest:
+                if simCap < 0.0:
+                    break
+                simLowest = simCap
+            simPosition += 1
+            if simPosition == simLength:
+                simPosition = 0
+                simOffset += simPeriod
+                simWrapped = True
+        results[:, i] = (simCap, simLowest, simLowestPre, simT, simIterations)
+
+    runtime = (time.time() - start) / amount
+    for i, sim in enumerate(sims):
+        simCap, simLowest, simLowestPre, simT, simIterations = results[:, i]
+        sim.t = float(simT)
+        sim.iterations = int(simIterations)
+        sim.result_optimized_repeats = bool(optimized[i])
+        sim.cap_stable_eve = sim.getEveStability(sim.streams, sim.capacitorCapacity, sim.capacitorRecharge / 5.0)
+        if simCap > 0.0:
+            sim.cap_stable_low = float(simLowest)
+            sim.cap_stable_high = float(simLowestPre)
+        else:
+            sim.cap_stable_low = sim.cap_stable_high = 0.0
+        sim.saved_changes = None
+        sim.runtime = runtime
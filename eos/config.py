@@ -10,6 +10,26 @@ pyfalog = Logger(__name__)
 debug = False
 gamedataCache = True
 saveddataCache = True
+# Limits of every cached gamedata query: maximum amount of cached results and
+# their approximate total size in bytes, least recently used results are dropped
+gamedataCacheEntries = 2000
+gamedataCacheBytes = 16 * 1024 * 1024
+# Limits of queries which take arbitrary arguments, as {function name: (entries, bytes)}
+gamedataCacheLimits = {
+    "searchItems": (100, 4 * 1024 * 1024),
+    "searchSkills": (100, 1024 * 1024),
+    "getVariations": (200, 4 * 1024 * 1024),
+    "getItemsByCategory": (100, 4 * 1024 * 1024),
+    "directAttributeRequest": (200, 1024 * 1024)
+}
+# Storage used for modified attributes of fit items: "dict" keeps separate dictionaries per
+# modification type, "array" keeps modifications in compact typed arrays, which takes less
+# memory when many fits are loaded at once
+attributeBackend = "dict"
+# Folder for compiled effect registry, None keeps it in __pycache__ next to eos/effects.py
+effectCachePath = None
+# Database file with price history, None keeps prices in memory only
+priceStorePath = None
 gamedata_version = ""
 gamedata_date = ""
 gamedata_connectionstring = 'sqlite:///' + realpath(join(dirname(abspath(__file__)), "..", "eve.db"))
@@ -26,7 +46,8 @@ pyfalog.debug("Saveddata connection string: {0}", saveddata_connectionstring)
 settings = {
     "useStaticAdaptiveArmorHardener": False,
     "strictSkillLevels": True,
-    "globalDefaultSpoolupPercentage": 1.0
+    "globalDefaultSpoolupPercentage": 1.0,
+    "vectorizedCapSim": False
 }
 
 # Autodetect path, only change if the autodetection bugs out.
@@ -0,0 +1,131 @@
+# ===============================================================================
+# Copyright (C) 2010 Diego Duclos
+#
+# This file is part of eos.
+#
+# eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with eos.  If not, see <http://www.gnu.org/licenses/>.
+# ===============================================================================
+
+import json
+import sys
+import threading
+from collections import OrderedDict
+
+from logbook import Logger
+
+
+pyfalog = Logger(__name__)
+
+# All created caches, {name: QueryCache}
+caches = OrderedDict()
+
+
+def getSize(obj):
+    """
+    Approximate size of query result in bytes. Containers are measured one level
+    deep, objects together with their attribute dictionary.
+    """
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(sys.getsizeof(key) + sys.getsizeof(value) for key, value in obj.items())
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        size += sum(sys.getsizeof(value) for value in obj)
+    elif hasattr(obj, "__dict__"):
+        size += sys.getsizeof(obj.__dict__)
+    return size
+
+
+class QueryCache:
+    """
+    LRU cache of results of a single query function, limited by amount of
+    results and by their approximate size.
+    """
+
+    def __init__(self, name, maxEntries, maxBytes):
+        self.name = name
+        self.maxEntries = maxEntries
+        self.maxBytes = maxBytes
+        self.lock = threading.Lock()
+        # Format: {key: (result, size)}, least recently used first
+        self.entries = OrderedDict()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        caches[name] = self
+
+    def get(self, key):
+        """Get (True, result) if key is cached, (False, None) otherwise"""
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return False, None
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return True, entry[0]
+
+    def store(self, key, result):
+        size = getSize(key) + getSize(result)
+        with self.lock:
+            old = self.entries.pop(key, None)
+            if old is not None:
+                self.bytes -= old[1]
+            self.entries[key] = (result, size)
+            self.bytes += size
+            # Always keep the latest result, even if it's larger than the limit alone
+            while len(self.entries) > 1 and (len(self.entries) > self.maxEntries or self.bytes > self.maxBytes):
+                _, (_, evictedSize) = self.entries.popitem(last=False)
+                self.bytes -= evictedSize
+                self.evictions += 1
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.bytes = 0
+
+    def getStats(self):
+        with self.lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self.entries),
+                "maxEntries": self.maxEntries,
+                "bytes": self.bytes,
+                "maxBytes": self.maxBytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hitRate": self.hits / lookups if lookups else None}
+
+
+def getCacheStats():
+    """Get stats of all query caches, {name: stats}"""
+    return OrderedDict((name, cache.getStats()) for name, cache in caches.items())
+
+
+def dumpCacheStats(path=None):
+    """Write stats of all query caches as JSON into file, or into log if no path is passed"""
+    stats = getCacheStats()
+    if path is None:
+        for name, cacheStats in stats.items():
+            pyfalog.info("Query cache {0}: {1}", name, cacheStats)
+    else:
+        with open(path, "w") as statsFile:
+            json.dump(stats, statsFile, indent=2)
+    return stats
+
+
+def clearCaches():
+    for cache in caches.values():
+        cache.clear()
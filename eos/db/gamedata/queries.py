@@ -25,14 +25,20 @@ import eos.config
 from eos.db import gamedata_session
 from eos.db.gamedata.group import groups_table
 from eos.db.gamedata.metaGroup import items_table, metatypes_table
+from eos.db.gamedata.searchIndex import ItemSearchIndex
+from eos.db.boundedCache import QueryCache
 from eos.db.util import processEager, processWhere
 from eos.gamedata import AlphaClone, Attribute, AttributeInfo, Category, DynamicItem, Group, Item, MarketGroup, MetaData, MetaGroup
 
-cache = {}
 configVal = getattr(eos.config, "gamedataCache", None)
 if configVal is True:
     def cachedQuery(amount, *keywords):
         def deco(function):
+            name = function.__name__
+            maxEntries, maxBytes = eos.config.gamedataCacheLimits.get(
+                name, (eos.config.gamedataCacheEntries, eos.config.gamedataCacheBytes))
+            cache = QueryCache(name, maxEntries, maxBytes)
+
             def checkAndReturn(*args, **kwargs):
                 useCache = kwargs.pop("useCache", True)
                 cacheKey = []
@@ -41,12 +47,16 @@ if configVal is True:
                     cacheKey.append(kwargs.get(keyword))
 
                 cacheKey = tuple(cacheKey)
-                handler = cache.get(cacheKey)
-                if handler is None or not useCache:
-                    handler = cache[cacheKey] = function(*args, **kwargs)
+                if useCache:
+                    found, handler = cache.get(cacheKey)
+                    if found:
+                        return handler
+                handler = function(*args, **kwargs)
+                cache.store(cacheKey, handler)
 
                 return handler
 
+            checkAndReturn.cache = cache
             return checkAndReturn
 
         return deco
@@ -138,18 +148,22 @@ def getItems(lookfor, eager=None):
 
     toGet = []
     results = []
+    # Cache of getItem, when caching is enabled
+    itemCache = getattr(getItem, "cache", None)
 
     for id in lookfor:
-        if (id, None) in cache:
-            results.append(cache.get((id, None)))
+        found, item = itemCache.get((id, None)) if itemCache is not None else (False, None)
+        if found:
+            results.append(item)
         else:
             toGet.append(id)
 
     if len(toGet) > 0:
         # Get items that aren't currently cached, and store them in the cache
         items = gamedata_session.query(Item).filter(Item.ID.in_(toGet)).all()
-        for item in items:
-            cache[(item.ID, None)] = item
+        if itemCache is not None:
+            for item in items:
+                itemCache.store((item.ID, None), item)
         results += items
 
     # sort the results based on the original indexing
@@ -306,15 +320,26 @@ def searchItems(nameLike, where=None, join=None, eager=None):
     if not hasattr(join, "__iter__"):
         join = (join,)
 
-    items = gamedata_session.query(Item).options(*processEager(eager)).join(*join)
-    for token in nameLike.split(' '):
-        token_safe = "%{0}%".format(sqlizeString(token))
+    itemIDs = ItemSearchIndex.getInstance().search(nameLike)
+    if itemIDs is None:
+        items = gamedata_session.query(Item).options(*processEager(eager)).join(*join)
         if where is not None:
-            items = items.filter(and_(Item.name.like(token_safe, escape="\\"), where))
-        else:
-            items = items.filter(Item.name.like(token_safe, escape="\\"))
-    items = items.limit(100).all()
-    return items
+            items = items.filter(where)
+        return items.limit(100).all()
+
+    # Index gives all matching items, best first; load them in chunks until
+    # we have enough of those which satisfy passed conditions
+    ranks = {itemID: rank for rank, itemID in enumerate(itemIDs)}
+    items = []
+    for i in range(0, len(itemIDs), 500):
+        chunk = gamedata_session.query(Item).options(*processEager(eager)).join(*join).filter(Item.ID.in_(itemIDs[i:i + 500]))
+        if where is not None:
+            chunk = chunk.filter(where)
+        items.extend(chunk.all())
+        if len(items) >= 100:
+            break
+    items.sort(key=lambda item: ranks[item.ID])
+    return items[:100]
 
 
 @cachedQuery(3, "where", "nameLike", "join")
@@ -0,0 +1,182 @@
+# ===============================================================================
+# Copyright (C) 2010 Diego Duclos
+#
+# This file is part of eos.
+#
+# eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with eos.  If not, see <http://www.gnu.org/licenses/>.
+# ===============================================================================
+
+import re
+import threading
+import time
+
+from logbook import Logger
+from sqlalchemy.sql import select
+
+import eos.config
+from eos.db import gamedata_session
+from eos.db.gamedata.group import groups_table
+from eos.db.gamedata.item import items_table
+
+
+pyfalog = Logger(__name__)
+
+
+def getTrigrams(text):
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+class TrigramIndex:
+    """Maps trigrams of lowercase names to positions of names which contain them"""
+
+    def __init__(self, names):
+        self.names = names
+        self.postings = {}
+        for position, name in enumerate(names):
+            for trigram in getTrigrams(name):
+                self.postings.setdefault(trigram, []).append(position)
+
+    def find(self, token):
+        """
+        Get positions of names which contain token. Asterisk in token matches
+        any amount of any symbols, like in regular searches.
+        """
+        parts = [part for part in token.split("*") if part]
+        if not parts:
+            return set(range(len(self.names)))
+        trigrams = set()
+        for part in parts:
+            trigrams.update(getTrigrams(part))
+        if trigrams:
+            postings = sorted((self.postings.get(trigram, ()) for trigram in trigrams), key=len)
+            candidates = set(postings[0])
+            for posting in postings[1:]:
+                if not candidates:
+                    break
+                candidates.intersection_update(posting)
+        else:
+            # Too short to use trigrams, check all names
+            candidates = range(len(self.names))
+        names = self.names
+        if len(parts) == 1:
+            part = parts[0]
+            return {position for position in candidates if part in names[position]}
+        pattern = re.compile(".*".join(re.escape(part) for part in parts))
+        return {position for position in candidates if pattern.search(names[position])}
+
+
+class ItemSearchIndex:
+    """
+    In-memory trigram index over item and group names, which is used to search
+    items by parts of their names. It's built on first search, and rebuilt if
+    gamedata version changes.
+    """
+    instance = None
+
+    @classmethod
+    def getInstance(cls):
+        if cls.instance is None:
+            cls.instance = ItemSearchIndex()
+
+        return cls.instance
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.version = None
+        self.built = False
+        self.itemIDs = ()
+        self.itemNames = ()
+        # Position of group of every item in group index
+        self.itemGroups = ()
+        self.itemIndex = None
+        self.groupIndex = None
+        # Positions of items in every group
+        self.groupItems = ()
+
+    def __build(self):
+        start = time.time()
+        query = select([items_table.c.typeID, items_table.c.typeName, groups_table.c.groupID, groups_table.c.groupName]).select_from(
+            items_table.outerjoin(groups_table, items_table.c.groupID == groups_table.c.groupID))
+        groupPositions = {}
+        groupNames = []
+        groupItems = []
+        itemIDs = []
+        itemNames = []
+        itemGroups = []
+        for typeID, typeName, groupID, groupName in gamedata_session.execute(query):
+            if groupID not in groupPositions:
+                groupPositions[groupID] = len(groupNames)
+                groupNames.append((groupName or "").lower())
+                groupItems.append([])
+            groupPosition = groupPositions[groupID]
+            groupItems[groupPosition].append(len(itemIDs))
+            itemIDs.append(typeID)
+            itemNames.append((typeName or "").lower())
+            itemGroups.append(groupPosition)
+        self.itemIDs = itemIDs
+        self.itemNames = itemNames
+        self.itemGroups = itemGroups
+        self.groupItems = groupItems
+        self.itemIndex = TrigramIndex(itemNames)
+        self.groupIndex = TrigramIndex(groupNames)
+        self.version = eos.config.gamedata_version
+        self.built = True
+        pyfalog.debug("Built item search index for {} items in {:.3f}s", len(itemIDs), time.time() - start)
+
+    def search(self, text):
+        """
+        Get IDs of items which contain all space-separated tokens of the text in
+        their name or name of their group, best matches first. Items which match
+        all tokens by name go before items which match some tokens by group only.
+        """
+        tokens = [token for token in text.lower().split(" ") if token]
+        if not tokens:
+            return None
+        with self.lock:
+            if not self.built or self.version != eos.config.gamedata_version:
+                self.__build()
+        itemIndex = self.itemIndex
+        # {item position: amount of tokens matched only by group name}
+        matches = None
+        for token in tokens:
+            byName = itemIndex.find(token)
+            byGroup = set()
+            for groupPosition in self.groupIndex.find(token):
+                byGroup.update(self.groupItems[groupPosition])
+            byGroup.difference_update(byName)
+            if matches is None:
+                matches = dict.fromkeys(byName, 0)
+                matches.update(dict.fromkeys(byGroup, 1))
+            else:
+                matches = {
+                    position: misses + (1 if position in byGroup else 0)
+                    for position, misses in matches.items()
+                    if position in byName or position in byGroup}
+            if not matches:
+                return []
+        names = self.itemNames
+        firstToken = tokens[0].split("*")[0]
+
+        def getRank(position):
+            name = names[position]
+            if name.startswith(firstToken):
+                prefixRank = 0
+            elif " {}".format(firstToken) in name:
+                prefixRank = 1
+            else:
+                prefixRank = 2
+            return matches[position], prefixRank, len(name), name
+
+        itemIDs = self.itemIDs
+        return [itemIDs[position] for position in sorted(matches, key=getRank)]
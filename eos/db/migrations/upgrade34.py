@@ -0,0 +1,13 @@
+"""
+Migration 34
+
+- Fills fit summaries table, which is used to list fits without loading them
+"""
+
+
+def upgrade(saveddata_engine):
+    # Table itself is created by sqlalchemy before migrations are run
+    saveddata_engine.execute(
+        "INSERT OR REPLACE INTO fitSummaries (fitID, shipID, name, booster, modified, notes) "
+        "SELECT ID, shipID, name, booster, COALESCE(modified, created, DATETIME(timestamp, 'unixepoch', 'localtime')), notes "
+        "FROM fits")
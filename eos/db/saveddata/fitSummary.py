@@ -0,0 +1,68 @@
+# ===============================================================================
+# Copyright (C) 2010 Diego Duclos
+#
+# This file is part of eos.
+#
+# eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with eos.  If not, see <http://www.gnu.org/licenses/>.
+# ===============================================================================
+
+from logbook import Logger
+from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Integer, String, Table, event
+from sqlalchemy.sql import text
+
+from eos.db import saveddata_meta
+from eos.saveddata.fit import Fit
+
+
+pyfalog = Logger(__name__)
+
+# Denormalized copy of fit rows, which is all the fit browser needs. It is kept
+# in sync on every fit save, and allows to list fits without loading them.
+fitSummaries_table = Table("fitSummaries", saveddata_meta,
+                           Column("fitID", ForeignKey("fits.ID", ondelete="CASCADE"), primary_key=True),
+                           Column("shipID", Integer, nullable=False, index=True),
+                           Column("name", String, nullable=False),
+                           Column("booster", Boolean, nullable=False, default=0),
+                           # Latest of modified / created / timestamp of the fit
+                           Column("modified", DateTime, nullable=True, index=True),
+                           Column("notes", String, nullable=True))
+
+COPY_FITS = """
+INSERT OR REPLACE INTO fitSummaries (fitID, shipID, name, booster, modified, notes)
+SELECT ID, shipID, name, booster, COALESCE(modified, created, DATETIME(timestamp, 'unixepoch', 'localtime')), notes
+FROM fits WHERE {where}
+"""
+
+
+def saveSummary(mapper, connection, fit):
+    connection.execute(text(COPY_FITS.format(where="ID = :fitID")), fitID=fit.ID)
+
+
+def removeSummary(mapper, connection, fit):
+    connection.execute(fitSummaries_table.delete().where(fitSummaries_table.c.fitID == fit.ID))
+
+
+event.listen(Fit, "after_insert", saveSummary)
+event.listen(Fit, "after_update", saveSummary)
+event.listen(Fit, "after_delete", removeSummary)
+
+
+def syncFitSummaries(saveddata_engine):
+    """Add summaries of fits which have none, and remove summaries of removed fits"""
+    added = saveddata_engine.execute(
+        COPY_FITS.format(where="ID NOT IN (SELECT fitID FROM fitSummaries)")).rowcount
+    removed = saveddata_engine.execute(
+        "DELETE FROM fitSummaries WHERE fitID NOT IN (SELECT ID FROM fits)").rowcount
+    if added or removed:
+        pyfalog.info("Fit summaries synced: {0} added, {1} removed", added, removed)
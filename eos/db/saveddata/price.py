@@ -19,17 +19,13 @@
 
 
 from sqlalchemy import Table, Column, Float, Integer
-from sqlalchemy.orm import mapper
 
 from eos.db import saveddata_meta
-from eos.saveddata.price import Price
 
 
+# Prices are kept by price store now, table is left only to import prices saved in it before
 prices_table = Table("prices", saveddata_meta,
                      Column("typeID", Integer, primary_key=True),
                      Column("price", Float, default=0.0),
                      Column("time", Integer, nullable=False),
                      Column("status", Integer, nullable=False))
-
-
-mapper(Price, prices_table)
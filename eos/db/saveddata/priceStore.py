@@ -0,0 +1,129 @@
+# ===============================================================================
+# Copyright (C) 2010 Diego Duclos
+#
+# This file is part of eos.
+#
+# eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with eos.  If not, see <http://www.gnu.org/licenses/>.
+# ===============================================================================
+
+import sqlite3
+import threading
+from time import time
+
+from logbook import Logger
+
+import eos.config
+from eos.saveddata.price import Price, PriceStatus
+
+
+pyfalog = Logger(__name__)
+
+# How long price history is kept, latest price of every item is kept regardless
+HISTORY_KEEP = 30 * 24 * 60 * 60
+
+
+class PriceStore:
+    """
+    Keeps prices of all items in memory, and history of their changes on disk.
+    History is kept in its own database file as plain (typeID, time, price,
+    status) rows, latest row of an item being its current price.
+    """
+    instance = None
+
+    @classmethod
+    def getInstance(cls):
+        if cls.instance is None:
+            cls.instance = PriceStore(eos.config.priceStorePath)
+
+        return cls.instance
+
+    def __init__(self, path=None):
+        self.path = path
+        self.lock = threading.RLock()
+        # Format: {typeID: Price}
+        self.prices = {}
+        self.connection = sqlite3.connect(path or ":memory:", check_same_thread=False)
+        with self.connection:
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS priceHistory (typeID INTEGER NOT NULL, time INTEGER NOT NULL, "
+                "price REAL NOT NULL, status INTEGER NOT NULL, PRIMARY KEY (typeID, time)) WITHOUT ROWID")
+        self.__load()
+
+    def __load(self):
+        rows = self.connection.execute(
+            "SELECT typeID, MAX(time), price, status FROM priceHistory GROUP BY typeID").fetchall()
+        if not rows and self.path is not None:
+            rows = self.__importLegacyPrices()
+        for typeID, priceTime, value, status in rows:
+            price = Price(typeID)
+            price.time = priceTime
+            price.price = value
+            price.status = PriceStatus(status)
+            self.prices[typeID] = price
+        # Drop old history, keeping latest row of every item
+        with self.connection:
+            self.connection.execute(
+                "DELETE FROM priceHistory WHERE time < ? AND time < (SELECT MAX(h.time) FROM priceHistory h "
+                "WHERE h.typeID = priceHistory.typeID)", (int(time()) - HISTORY_KEEP,))
+        pyfalog.debug("Loaded {} prices from price store", len(self.prices))
+
+    def __importLegacyPrices(self):
+        """Move prices which were kept in saveddata database before"""
+        from eos.db import saveddata_engine
+        try:
+            rows = [tuple(row) for row in saveddata_engine.execute("SELECT typeID, time, price, status FROM prices")]
+        except Exception as e:
+            pyfalog.debug("No legacy prices to import: {}", e)
+            return []
+        rows = [(typeID, int(priceTime or 0), value or 0.0, status) for typeID, priceTime, value, status in rows]
+        with self.connection:
+            self.connection.executemany("INSERT OR REPLACE INTO priceHistory VALUES (?, ?, ?, ?)", rows)
+        saveddata_engine.execute("DELETE FROM prices")
+        pyfalog.info("Imported {} prices from saveddata", len(rows))
+        return rows
+
+    def get(self, typeID):
+        """Get price of item, creating new one if item has no price yet"""
+        with self.lock:
+            price = self.prices.get(typeID)
+            if price is None:
+                price = self.prices[typeID] = Price(typeID)
+        return price
+
+    def save(self, prices):
+        """Write current state of passed prices to history"""
+        rows = [(price.typeID, int(price.time), price.price or 0.0, int(price.status)) for price in prices]
+        if not rows:
+            return
+        with self.lock, self.connection:
+            self.connection.executemany("INSERT OR REPLACE INTO priceHistory VALUES (?, ?, ?, ?)", rows)
+
+    def getHistory(self, typeID):
+        """Get list of (time, price) of successful fetches of item price, oldest first"""
+        with self.lock:
+            return self.connection.execute(
+                "SELECT time, price FROM priceHistory WHERE typeID = ? AND status = ? ORDER BY time",
+                (typeID, int(PriceStatus.fetchSuccess))).fetchall()
+
+    def clear(self):
+        with self.lock, self.connection:
+            self.connection.execute("DELETE FROM priceHistory")
+            deleted = len(self.prices)
+            # Objects handed out before are reset too, so that nobody uses old prices
+            for price in self.prices.values():
+                price.time = 0
+                price.price = 0
+                price.status = PriceStatus.initialized
+            self.prices.clear()
+        return deleted
@@ -24,9 +24,10 @@ from sqlalchemy import desc, select
 from sqlalchemy import func
 
 from eos.db import saveddata_session, sd_lock
-from eos.db.saveddata.fit import fits_table, projectedFits_table
+from eos.db.saveddata.fit import projectedFits_table
+from eos.db.saveddata.fitSummary import fitSummaries_table
+from eos.db.saveddata.priceStore import PriceStore
 from eos.db.util import processEager, processWhere
-from eos.saveddata.price import Price
 from eos.saveddata.user import User
 from eos.saveddata.ssocharacter import SsoCharacter
 from eos.saveddata.damagePattern import DamagePattern
@@ -246,19 +247,29 @@ def getFitsWithShip(shipID, ownerID=None, where=None, eager=None):
     return fits
 
 
-def getRecentFits(ownerID=None, where=None, eager=None):
-    eager = processEager(eager)
+def getFitSummariesWithShip(shipID):
+    """
+    Get (ID, name, booster, modified, notes) rows of all the fits using a
+    certain ship, without loading the fits.
+    """
+    if not isinstance(shipID, int):
+        raise TypeError("ShipID must be integer")
+    summaries = fitSummaries_table.c
+    with sd_lock:
+        stmt = select((summaries.fitID, summaries.name, summaries.booster, summaries.modified, summaries.notes)).where(
+            summaries.shipID == shipID)
+        fits = saveddata_session.execute(stmt).fetchall()
+
+    return fits
+
+
+def getRecentFits(limit=50):
+    """Get (ID, shipID, name, modified, notes) rows of recently modified fits"""
+    summaries = fitSummaries_table.c
     with sd_lock:
-        q = select((
-            Fit.ID,
-            Fit.shipID,
-            Fit.name,
-            Fit.modified,
-            Fit.created,
-            Fit.timestamp,
-            Fit.notes
-        )).order_by(desc(Fit.modified), desc(Fit.timestamp)).limit(50)
-        fits = eos.db.saveddata_session.execute(q).fetchall()
+        stmt = select((summaries.fitID, summaries.shipID, summaries.name, summaries.modified, summaries.notes)).order_by(
+            desc(summaries.modified)).limit(limit)
+        fits = saveddata_session.execute(stmt).fetchall()
 
     return fits
 
@@ -285,35 +296,29 @@ def countAllFits():
 
 
 def countFitGroupedByShip():
+    summaries = fitSummaries_table.c
     with sd_lock:
-        count = eos.db.saveddata_session.query(Fit.shipID, func.count(Fit.shipID)).group_by(Fit.shipID).all()
+        stmt = select((summaries.shipID, func.count(summaries.fitID))).group_by(summaries.shipID)
+        count = saveddata_session.execute(stmt).fetchall()
     return count
 
 
-def countFitsWithShip(lookfor, ownerID=None, where=None, eager=None):
+def countFitsWithShip(lookfor):
     """
-    Get all the fits using a certain ship.
-    If no user is passed, do this for all users.
+    Count all the fits using a certain ship, or any ship of passed list.
     """
-    if ownerID is not None and not isinstance(ownerID, int):
-        raise TypeError("OwnerID must be integer")
-
+    summaries = fitSummaries_table.c
     if isinstance(lookfor, int):
-        filter = Fit.shipID == lookfor
+        filter = summaries.shipID == lookfor
     elif isinstance(lookfor, list):
         if len(lookfor) == 0:
             return 0
-        filter = Fit.shipID.in_(lookfor)
+        filter = summaries.shipID.in_(lookfor)
     else:
         raise TypeError("You must supply either an integer or ShipID must be integer")
 
-    if ownerID is not None:
-        filter = and_(filter, Fit.ownerID == ownerID)
-
-    filter = processWhere(filter, where)
-    eager = processEager(eager)
     with sd_lock:
-        count = saveddata_session.query(Fit).options(*eager).filter(filter).count()
+        count = saveddata_session.execute(select((func.count(summaries.fitID),)).where(filter)).scalar()
 
     return count
 
@@ -327,9 +332,10 @@ def getFitList(eager=None):
 
 
 def getFitListLite():
+    summaries = fitSummaries_table.c
     with sd_lock:
-        stmt = select([fits_table.c.ID, fits_table.c.name, fits_table.c.shipID])
-        data = eos.db.saveddata_session.execute(stmt).fetchall()
+        stmt = select([summaries.fitID, summaries.name, summaries.shipID])
+        data = saveddata_session.execute(stmt).fetchall()
     fits = []
     for fitID, fitName, shipID in data:
         fit = FitLite(id=fitID, name=fitName, shipID=shipID)
@@ -337,21 +343,20 @@ def getFitListLite():
     return fits
 
 
-@cachedQuery(Price, 1, "typeID")
 def getPrice(typeID):
     if isinstance(typeID, int):
-        with sd_lock:
-            price = saveddata_session.query(Price).get(typeID)
+        price = PriceStore.getInstance().get(typeID)
     else:
         raise TypeError("Need integer as argument")
     return price
 
 
+def savePrices(prices):
+    PriceStore.getInstance().save(prices)
+
+
 def clearPrices():
-    with sd_lock:
-        deleted_rows = saveddata_session.query(Price).delete()
-    commit()
-    return deleted_rows
+    return PriceStore.getInstance().clear()
 
 
 def getMiscData(field):
@@ -475,6 +480,23 @@ def searchFits(nameLike, where=None, eager=None):
     return fits
 
 
+def searchFitSummaries(nameLike):
+    """
+    Get (ID, name, shipID, booster, modified, notes) rows of fits which contain
+    passed string in their name, without loading the fits.
+    """
+    if not isinstance(nameLike, str):
+        raise TypeError("Need string as argument")
+    nameLike = "%{0}%".format(sqlizeString(nameLike))
+    summaries = fitSummaries_table.c
+    with sd_lock:
+        stmt = select((summaries.fitID, summaries.name, summaries.shipID, summaries.booster, summaries.modified, summaries.notes)).where(
+            summaries.name.like(nameLike, escape="\\"))
+        fits = saveddata_session.execute(stmt).fetchall()
+
+    return fits
+
+
 def getProjectedFits(fitID):
     if isinstance(fitID, int):
         with sd_lock:
@@ -556,6 +578,16 @@ def remove(stuff):
     commit()
 
 
+def removeAll(stuffs):
+    """Remove several objects, committing once"""
+    for stuff in stuffs:
+        removeCachedEntry(type(stuff), stuff.ID)
+    with sd_lock:
+        for stuff in stuffs:
+            saveddata_session.delete(stuff)
+    commit()
+
+
 def commit():
     with sd_lock:
         try:
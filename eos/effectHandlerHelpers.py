@@ -18,99 +18,285 @@
 # ===============================================================================
 
 
+from functools import wraps
+
 from logbook import Logger
 
+from eos.calcHooks import registerHooks
+from eos.calcJournal import iterCalcList
+from eos.calcProfiler import profilerState
+
 
 pyfalog = Logger(__name__)
 
 
+def profiledPass(method):
+    """Let calculation profiler time filtered passes over the list, if it's active"""
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        profiler = profilerState.profiler
+        if profiler is None:
+            return method(self, *args, **kwargs)
+        return profiler.trackListPass(method.__name__, method, self, args, kwargs)
+    return wrapper
+
+
+class _IndexState:
+    # Bumped when something which indexes rely on changes outside of the
+    # lists themselves, e.g. a charge is loaded into a module
+    generation = 0
+
+
+indexState = _IndexState()
+
+
+def dropAllIndexes():
+    """Make indexes of all handled lists stale"""
+    indexState.generation += 1
+
+
+def _indexValue(value):
+    # Skills and items can be passed instead of names or IDs
+    if hasattr(value, "item"):
+        return value.item.ID
+    if hasattr(value, "ID"):
+        return value.ID
+    return value
+
+
+class IndexedFilter:
+    """
+    Filter which handled lists can resolve via their indexes, instead of
+    checking every element. Matches elements indexed under any of passed
+    values; values are names or IDs. Calling filter checks single element.
+    """
+
+    __slots__ = ("values",)
+
+    def __init__(self, *values):
+        self.values = tuple(_indexValue(value) for value in values)
+
+    @staticmethod
+    def getKeys(element):
+        """Get all values the element is indexed under"""
+        raise NotImplementedError
+
+    def __call__(self, element):
+        keys = self.getKeys(element)
+        return any(value in keys for value in self.values)
+
+    def __repr__(self):
+        return "{}{!r}".format(type(self).__name__, self.values)
+
+
+def _skillKeys(item):
+    keys = set()
+    for skill in item.requiredSkills:
+        keys.add(skill.name)
+        keys.add(skill.ID)
+    return keys
+
+
+class ItemSkillFilter(IndexedFilter):
+    """Same as lambda mod: mod.item.requiresSkill(skill)"""
+
+    __slots__ = ()
+
+    @staticmethod
+    def getKeys(element):
+        return _skillKeys(element.item)
+
+
+class ChargeSkillFilter(IndexedFilter):
+    """Same as lambda mod: mod.charge.requiresSkill(skill)"""
+
+    __slots__ = ()
+
+    @staticmethod
+    def getKeys(element):
+        return _skillKeys(element.charge)
+
+
+class ItemGroupFilter(IndexedFilter):
+    """Same as lambda mod: mod.item.group.name == groupName"""
+
+    __slots__ = ()
+
+    @staticmethod
+    def getKeys(element):
+        group = element.item.group
+        return group.name, group.ID
+
+
+class ChargeGroupFilter(IndexedFilter):
+    """Same as lambda mod: mod.charge.group.name == groupName"""
+
+    __slots__ = ()
+
+    @staticmethod
+    def getKeys(element):
+        group = element.charge.group
+        return group.name, group.ID
+
+
 class HandledList(list):
-    def filteredItemPreAssign(self, filter, *args, **kwargs):
-        for element in self:
+    """
+    List of fit items which effects modify via filtered passes. Filters which
+    are instances of IndexedFilter are resolved via index of the list, which
+    is built on first use and dropped whenever the list changes.
+    """
+
+    def getIndexed(self, filter):
+        """Get elements matching indexed filter, in list order"""
+        indexes = getattr(self, "_indexes", None)
+        if indexes is None or self._indexGeneration != indexState.generation:
+            indexes = self._indexes = {}
+            self._indexGeneration = indexState.generation
+        indexType = type(filter)
+        index = indexes.get(indexType)
+        if index is None:
+            index = indexes[indexType] = {}
+            for position, element in enumerate(self):
+                try:
+                    keys = filter.getKeys(element)
+                except AttributeError:
+                    continue
+                for key in keys:
+                    index.setdefault(key, []).append(position)
+        values = filter.values
+        if len(values) == 1:
+            positions = index.get(values[0], ())
+        else:
+            positions = sorted(set(position for value in values for position in index.get(value, ())))
+        return [self[position] for position in positions]
+
+    def dropIndexes(self):
+        self._indexes = None
+
+    def iterFiltered(self, filter):
+        """Iterate over elements of the list which match the filter"""
+        if isinstance(filter, IndexedFilter):
+            for element in iterCalcList(self, self.getIndexed(filter)):
+                yield element
+            return
+        for element in iterCalcList(self):
             try:
                 if filter(element):
-                    element.preAssignItemAttr(*args, **kwargs)
+                    yield element
+            except AttributeError:
+                pass
+
+    def filteredItemPreAssign(self, filter, *args, **kwargs):
+        for element in self.iterFiltered(filter):
+            try:
+                element.preAssignItemAttr(*args, **kwargs)
             except AttributeError:
                 pass
 
     def filteredItemIncrease(self, filter, *args, **kwargs):
-        for element in self:
+        for element in self.iterFiltered(filter):
             try:
-                if filter(element):
-                    element.increaseItemAttr(*args, **kwargs)
+                element.increaseItemAttr(*args, **kwargs)
             except AttributeError:
                 pass
 
     def filteredItemMultiply(self, filter, *args, **kwargs):
-        for element in self:
+        for element in self.iterFiltered(filter):
             try:
-                if filter(element):
-                    element.multiplyItemAttr(*args, **kwargs)
+                element.multiplyItemAttr(*args, **kwargs)
             except AttributeError:
                 pass
 
     def filteredItemBoost(self, filter, *args, **kwargs):
-        for element in self:
+        for element in self.iterFiltered(filter):
             try:
-                if filter(element):
-                    element.boostItemAttr(*args, **kwargs)
+                element.boostItemAttr(*args, **kwargs)
             except AttributeError:
                 pass
 
     def filteredItemForce(self, filter, *args, **kwargs):
-        for element in self:
+        for element in self.iterFiltered(filter):
             try:
-                if filter(element):
-                    element.forceItemAttr(*args, **kwargs)
+                element.forceItemAttr(*args, **kwargs)
             except AttributeError:
                 pass
 
     def filteredChargePreAssign(self, filter, *args, **kwargs):
-        for element in self:
+        for element in self.iterFiltered(filter):
             try:
-                if filter(element):
-                    element.preAssignChargeAttr(*args, **kwargs)
+                element.preAssignChargeAttr(*args, **kwargs)
             except AttributeError:
                 pass
 
     def filteredChargeIncrease(self, filter, *args, **kwargs):
-        for element in self:
+        for element in self.iterFiltered(filter):
             try:
-                if filter(element):
-                    element.increaseChargeAttr(*args, **kwargs)
+                element.increaseChargeAttr(*args, **kwargs)
             except AttributeError:
                 pass
 
     def filteredChargeMultiply(self, filter, *args, **kwargs):
-        for element in self:
+        for element in self.iterFiltered(filter):
             try:
-                if filter(element):
-                    element.multiplyChargeAttr(*args, **kwargs)
+                element.multiplyChargeAttr(*args, **kwargs)
             except AttributeError:
                 pass
 
     def filteredChargeBoost(self, filter, *args, **kwargs):
-        for element in self:
+        for element in self.iterFiltered(filter):
             try:
-                if filter(element):
-                    element.boostChargeAttr(*args, **kwargs)
+                element.boostChargeAttr(*args, **kwargs)
             except AttributeError:
                 pass
 
     def filteredChargeForce(self, filter, *args, **kwargs):
-        for element in self:
+        for element in self.iterFiltered(filter):
             try:
-                if filter(element):
-                    element.forceChargeAttr(*args, **kwargs)
+                element.forceChargeAttr(*args, **kwargs)
             except AttributeError:
                 pass
 
+    # Any change of the list makes its indexes stale
+
+    def append(self, thing):
+        self._indexes = None
+        list.append(self, thing)
+
+    def insert(self, idx, thing):
+        self._indexes = None
+        list.insert(self, idx, thing)
+
+    def extend(self, things):
+        self._indexes = None
+        list.extend(self, things)
+
+    def pop(self, *args):
+        self._indexes = None
+        return list.pop(self, *args)
+
+    def clear(self):
+        self._indexes = None
+        list.clear(self)
+
+    def __setitem__(self, key, value):
+        self._indexes = None
+        list.__setitem__(self, key, value)
+
+    def __delitem__(self, key):
+        self._indexes = None
+        list.__delitem__(self, key)
+
+    def __iadd__(self, things):
+        self._indexes = None
+        return list.__iadd__(self, things)
+
     def remove(self, thing):
         # We must flag it as modified, otherwise it not be removed from the database
         # @todo: flag_modified isn't in os x skel. need to rebuild to include
         # flag_modified(thing, "itemID")
         if thing.isInvalid:  # see GH issue #324
             thing.itemID = 0
+        self._indexes = None
         list.remove(self, thing)
 
     def sort(self, *args, **kwargs):
@@ -119,6 +305,15 @@ class HandledList(list):
         raise NotImplementedError
 
 
+# Calculation profiler hooks, used only while it is active
+registerHooks(HandledList, {
+    name: profiledPass(HandledList.__dict__[name])
+    for name in (
+        "filteredItemPreAssign", "filteredItemIncrease", "filteredItemMultiply", "filteredItemBoost",
+        "filteredItemForce", "filteredChargePreAssign", "filteredChargeIncrease", "filteredChargeMultiply",
+        "filteredChargeBoost", "filteredChargeForce")})
+
+
 class HandledModuleList(HandledList):
 
     def append(self, mod):
@@ -395,6 +590,10 @@ class HandledProjectedDroneList(HandledDroneCargoList):
 
 
 class HandledItem:
+    # Mixins don't keep any state, so that calculation-only classes built on
+    # top of them can keep all their attributes in slots
+    __slots__ = ()
+
     def preAssignItemAttr(self, *args, **kwargs):
         self.itemModifiedAttributes.preAssign(*args, **kwargs)
 
@@ -412,6 +611,8 @@ class HandledItem:
 
 
 class HandledCharge:
+    __slots__ = ()
+
     def preAssignChargeAttr(self, *args, **kwargs):
         self.chargeModifiedAttributes.preAssign(*args, **kwargs)
 
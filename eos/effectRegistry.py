@@ -0,0 +1,302 @@
+# ===============================================================================
+# Copyright (C) 2010 Diego Duclos
+#
+# This file is part of eos.
+#
+# eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with eos.  If not, see <http://www.gnu.org/licenses/>.
+# ===============================================================================
+
+"""
+Lazy registry of effect handlers.
+
+Effect definitions live in eos/effects.py, which is large and takes a while to
+import. The registry splits it into compiled code of every effect class and
+metadata about it (class attributes like runTime and type, and names of
+attributes handler reads and modifies), and keeps both in a cache file. Effect
+classes are then executed one by one, only when their handler is needed, and
+metadata is available without running any effect code.
+"""
+
+import ast
+import importlib.util
+import marshal
+import os
+import sys
+import threading
+
+from logbook import Logger
+
+import eos.config
+
+
+pyfalog = Logger(__name__)
+
+EFFECTS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "effects.py")
+# Bump when format of cached data changes
+CACHE_FORMAT = 1
+
+# Methods which receive attribute name, and position of the name in their arguments
+READ_METHODS = {
+    "getModifiedItemAttr": 0, "getModifiedChargeAttr": 0,
+    "getModifiedItemAttrExtended": 0, "getModifiedChargeAttrExtended": 0}
+WRITE_METHODS = {
+    "preAssign": 0, "increase": 0, "multiply": 0, "boost": 0, "force": 0,
+    "preAssignItemAttr": 0, "increaseItemAttr": 0, "multiplyItemAttr": 0, "boostItemAttr": 0, "forceItemAttr": 0,
+    "preAssignChargeAttr": 0, "increaseChargeAttr": 0, "multiplyChargeAttr": 0, "boostChargeAttr": 0,
+    "forceChargeAttr": 0,
+    "filteredItemPreAssign": 1, "filteredItemIncrease": 1, "filteredItemMultiply": 1, "filteredItemBoost": 1,
+    "filteredItemForce": 1,
+    "filteredChargePreAssign": 1, "filteredChargeIncrease": 1, "filteredChargeMultiply": 1,
+    "filteredChargeBoost": 1, "filteredChargeForce": 1}
+
+
+def getEffectID(className):
+    if not className.startswith("Effect"):
+        return None
+    try:
+        return int(className[6:])
+    except ValueError:
+        return None
+
+
+def collectAttributeNames(node):
+    """Find names of attributes which code reads and modifies, where they are passed as plain strings"""
+    reads = set()
+    writes = set()
+    for child in ast.walk(node):
+        if not isinstance(child, ast.Call) or not isinstance(child.func, ast.Attribute):
+            continue
+        method = child.func.attr
+        for methods, names in ((READ_METHODS, reads), (WRITE_METHODS, writes)):
+            position = methods.get(method)
+            if position is None or len(child.args) <= position:
+                continue
+            arg = child.args[position]
+            # Python 3.6 parses string literals as ast.Str, later versions as ast.Constant
+            value = getattr(arg, "s", None) if type(arg).__name__ == "Str" else getattr(arg, "value", None)
+            if isinstance(value, str):
+                names.add(value)
+    return tuple(sorted(reads)), tuple(sorted(writes))
+
+
+def collectClassAttributes(classNode):
+    """Get class-level values of effect definition, as long as they are literals"""
+    attrs = {}
+    for node in classNode.body:
+        if not isinstance(node, ast.Assign):
+            continue
+        try:
+            value = ast.literal_eval(node.value)
+        except ValueError:
+            continue
+        for target in node.targets:
+            if isinstance(target, ast.Name):
+                attrs[target.id] = value
+    return attrs
+
+
+class EffectRegistry:
+    """
+    Index of effect definitions. Metadata of an effect is dictionary of class
+    attributes of its definition, plus "name" (from docstring), "reads" and
+    "writes" (names of attributes the handler uses).
+    """
+    instance = None
+
+    @classmethod
+    def getInstance(cls):
+        if cls.instance is None:
+            cls.instance = EffectRegistry()
+
+        return cls.instance
+
+    def __init__(self, sourcePath=EFFECTS_PATH, cachePath=None):
+        self.sourcePath = sourcePath
+        if cachePath is None:
+            cacheDir = eos.config.effectCachePath or os.path.join(os.path.dirname(sourcePath), "__pycache__")
+            cachePath = os.path.join(cacheDir, "effects.{}.registry".format(sys.implementation.cache_tag))
+        self.cachePath = cachePath
+        self.lock = threading.RLock()
+        # {effectID: metadata}
+        self.__metadata = None
+        # {effectID: (offset, length)} of compiled effect classes in cache file,
+        # or {effectID: code} if registry couldn't be cached
+        self.__locations = None
+        self.__codes = None
+        self.__headerCode = None
+        self.__namespace = None
+        self.__definitions = {}
+
+    def __contains__(self, effectID):
+        return self.getMetadata(effectID) is not None
+
+    def getMetadata(self, effectID):
+        """Get metadata of effect, or None if effect is not implemented"""
+        if self.__metadata is None:
+            self.__load()
+        return self.__metadata.get(effectID)
+
+    def getDefinition(self, effectID):
+        """Get effect definition class, running its code if it wasn't run yet"""
+        definition = self.__definitions.get(effectID)
+        if definition is not None:
+            return definition
+        with self.lock:
+            if effectID in self.__definitions:
+                return self.__definitions[effectID]
+            if self.getMetadata(effectID) is None:
+                return None
+            namespace = self.__getNamespace()
+            className = "Effect{}".format(effectID)
+            if className not in namespace:
+                exec(self.__getCode(effectID), namespace)
+            definition = self.__definitions[effectID] = namespace[className]
+        return definition
+
+    @property
+    def baseEffect(self):
+        return self.__getNamespace()["BaseEffect"]
+
+    @property
+    def dummyEffect(self):
+        return self.__getNamespace()["DummyEffect"]
+
+    @property
+    def loadedCount(self):
+        return len(self.__definitions)
+
+    def __getNamespace(self):
+        if self.__namespace is None:
+            with self.lock:
+                if self.__namespace is None:
+                    if self.__metadata is None:
+                        self.__load()
+                    module = sys.modules.get("eos.effects")
+                    if module is not None or self.__headerCode is None:
+                        # Full module is imported already, or there's no source to
+                        # compile - take definitions from the module itself
+                        import eos.effects
+                        self.__namespace = vars(eos.effects)
+                    else:
+                        namespace = {"__name__": "eos.effects", "__file__": self.sourcePath, "__builtins__": __builtins__}
+                        exec(self.__headerCode, namespace)
+                        self.__namespace = namespace
+        return self.__namespace
+
+    def __getCode(self, effectID):
+        if self.__codes is not None:
+            return self.__codes[effectID]
+        offset, length = self.__locations[effectID]
+        with open(self.cachePath, "rb") as f:
+            f.seek(offset)
+            return marshal.loads(f.read(length))
+
+    def __getCacheKey(self):
+        stat = os.stat(self.sourcePath)
+        return CACHE_FORMAT, importlib.util.MAGIC_NUMBER, stat.st_size, stat.st_mtime_ns
+
+    def __load(self):
+        with self.lock:
+            if self.__metadata is not None:
+                return
+            if not os.path.isfile(self.sourcePath):
+                # Frozen builds ship compiled module only
+                self.__loadFromModule()
+                return
+            cacheKey = self.__getCacheKey()
+            try:
+                self.__loadFromCache(cacheKey)
+                return
+            except (OSError, EOFError, ValueError, TypeError, KeyError):
+                pass
+            self.__build(cacheKey)
+
+    def __loadFromCache(self, cacheKey):
+        with open(self.cachePath, "rb") as f:
+            # Cache file is marshaled header followed by marshaled code of effect classes
+            header = marshal.load(f)
+            if header["key"] != cacheKey:
+                raise ValueError("Effect registry cache is outdated")
+            dataOffset = f.tell()
+        self.__headerCode = header["header"]
+        self.__metadata = header["metadata"]
+        self.__locations = {effectID: (dataOffset + offset, length) for effectID, (offset, length) in header["locations"].items()}
+        pyfalog.debug("Loaded effect registry with {} effects from cache", len(self.__metadata))
+
+    def __build(self, cacheKey):
+        with open(self.sourcePath, "r", encoding="utf-8") as f:
+            tree = ast.parse(f.read(), self.sourcePath)
+        headerNodes = []
+        metadata = {}
+        codes = {}
+        for node in tree.body:
+            effectID = getEffectID(node.name) if isinstance(node, ast.ClassDef) else None
+            if effectID is None:
+                headerNodes.append(node)
+                continue
+            effectMetadata = collectClassAttributes(node)
+            docstring = ast.get_docstring(node)
+            effectMetadata["name"] = docstring.split("\n", 1)[0].strip() if docstring else None
+            effectMetadata["reads"], effectMetadata["writes"] = collectAttributeNames(node)
+            metadata[effectID] = effectMetadata
+            codes[effectID] = self.__compile([node])
+        self.__headerCode = self.__compile(headerNodes)
+        self.__metadata = metadata
+        self.__codes = codes
+        pyfalog.debug("Built effect registry with {} effects", len(metadata))
+        try:
+            self.__writeCache(cacheKey)
+        except OSError as e:
+            pyfalog.warning("Unable to write effect registry cache: {}", e)
+
+    def __compile(self, nodes):
+        module = ast.Module(body=nodes)
+        # Python 3.8+ requires list of type ignores
+        module.type_ignores = []
+        return compile(module, self.sourcePath, "exec")
+
+    def __writeCache(self, cacheKey):
+        blobs = []
+        locations = {}
+        offset = 0
+        for effectID, code in self.__codes.items():
+            blob = marshal.dumps(code)
+            locations[effectID] = (offset, len(blob))
+            blobs.append(blob)
+            offset += len(blob)
+        header = {"key": cacheKey, "header": self.__headerCode, "metadata": self.__metadata, "locations": locations}
+        os.makedirs(os.path.dirname(self.cachePath), exist_ok=True)
+        # Write to temporary file first, so that other processes never see partial cache
+        tmpPath = "{}.{}.tmp".format(self.cachePath, os.getpid())
+        with open(tmpPath, "wb") as f:
+            marshal.dump(header, f)
+            for blob in blobs:
+                f.write(blob)
+        os.replace(tmpPath, self.cachePath)
+
+    def __loadFromModule(self):
+        import eos.effects
+        metadata = {}
+        for name, definition in vars(eos.effects).items():
+            effectID = getEffectID(name)
+            if effectID is None or not isinstance(definition, type):
+                continue
+            effectMetadata = {k: v for k, v in vars(definition).items() if not k.startswith("__") and k != "handler"}
+            effectMetadata["name"] = (definition.__doc__ or "").strip().split("\n", 1)[0].strip() or None
+            # Handler code is not available for analysis
+            effectMetadata["reads"] = effectMetadata["writes"] = None
+            metadata[effectID] = effectMetadata
+            self.__definitions[effectID] = definition
+        self.__metadata = metadata
+        self.__namespace = vars(eos.effects)
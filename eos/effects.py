@@ -20,6 +20,7 @@
 
 import eos.config
 from eos.const import FittingModuleState, FitSystemSecurity
+from eos.effectHandlerHelpers import ChargeGroupFilter, ChargeSkillFilter, ItemGroupFilter, ItemSkillFilter
 from eos.utils.spoolSupport import SpoolType, SpoolOptions, calculateSpoolup, resolveSpoolOptions
 
 
@@ -437,7 +438,7 @@ class Effect89(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, **kwargs):
-        fit.modules.filteredItemMultiply(lambda mod: mod.item.group.name == 'Projectile Weapon',
+        fit.modules.filteredItemMultiply(ItemGroupFilter('Projectile Weapon'),
                                          'speed', module.getModifiedItemAttr('speedMultiplier'),
                                          stackingPenalties=True, **kwargs)
 
@@ -454,7 +455,7 @@ class Effect91(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, **kwargs):
-        fit.modules.filteredItemMultiply(lambda mod: mod.item.group.name == 'Energy Weapon',
+        fit.modules.filteredItemMultiply(ItemGroupFilter('Energy Weapon'),
                                          'damageMultiplier', module.getModifiedItemAttr('damageMultiplier'),
                                          stackingPenalties=True, **kwargs)
 
@@ -471,7 +472,7 @@ class Effect92(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, **kwargs):
-        fit.modules.filteredItemMultiply(lambda mod: mod.item.group.name == 'Projectile Weapon',
+        fit.modules.filteredItemMultiply(ItemGroupFilter('Projectile Weapon'),
                                          'damageMultiplier', module.getModifiedItemAttr('damageMultiplier'),
                                          stackingPenalties=True, **kwargs)
 
@@ -488,7 +489,7 @@ class Effect93(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, **kwargs):
-        fit.modules.filteredItemMultiply(lambda mod: mod.item.group.name == 'Hybrid Weapon',
+        fit.modules.filteredItemMultiply(ItemGroupFilter('Hybrid Weapon'),
                                          'damageMultiplier', module.getModifiedItemAttr('damageMultiplier'),
                                          stackingPenalties=True, **kwargs)
 
@@ -505,7 +506,7 @@ class Effect95(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, **kwargs):
-        fit.modules.filteredItemMultiply(lambda mod: mod.item.group.name == 'Energy Weapon',
+        fit.modules.filteredItemMultiply(ItemGroupFilter('Energy Weapon'),
                                          'speed', module.getModifiedItemAttr('speedMultiplier'),
                                          stackingPenalties=True, **kwargs)
 
@@ -522,7 +523,7 @@ class Effect96(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, **kwargs):
-        fit.modules.filteredItemMultiply(lambda mod: mod.item.group.name == 'Hybrid Weapon',
+        fit.modules.filteredItemMultiply(ItemGroupFilter('Hybrid Weapon'),
                                          'speed', module.getModifiedItemAttr('speedMultiplier'),
                                          stackingPenalties=True, **kwargs)
 
@@ -594,7 +595,7 @@ class Effect157(BaseEffect):
     @staticmethod
     def handler(fit, container, context, **kwargs):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Hybrid Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Large Hybrid Turret'),
                                       'damageMultiplier', container.getModifiedItemAttr('damageMultiplierBonus') * level, **kwargs)
 
 
@@ -612,7 +613,7 @@ class Effect159(BaseEffect):
     @staticmethod
     def handler(fit, container, context, **kwargs):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Energy Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Medium Energy Turret'),
                                       'damageMultiplier', container.getModifiedItemAttr('damageMultiplierBonus') * level, **kwargs)
 
 
@@ -630,7 +631,7 @@ class Effect160(BaseEffect):
     @staticmethod
     def handler(fit, container, context, **kwargs):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Hybrid Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Medium Hybrid Turret'),
                                       'damageMultiplier', container.getModifiedItemAttr('damageMultiplierBonus') * level, **kwargs)
 
 
@@ -648,7 +649,7 @@ class Effect161(BaseEffect):
     @staticmethod
     def handler(fit, container, context, **kwargs):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Projectile Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Medium Projectile Turret'),
                                       'damageMultiplier', container.getModifiedItemAttr('damageMultiplierBonus') * level, **kwargs)
 
 
@@ -667,7 +668,7 @@ class Effect162(BaseEffect):
     @staticmethod
     def handler(fit, container, context, **kwargs):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Energy Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Large Energy Turret'),
                                       'damageMultiplier', container.getModifiedItemAttr('damageMultiplierBonus') * level, **kwargs)
 
 
@@ -685,7 +686,7 @@ class Effect172(BaseEffect):
     @staticmethod
     def handler(fit, container, context, **kwargs):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Energy Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Small Energy Turret'),
                                       'damageMultiplier', container.getModifiedItemAttr('damageMultiplierBonus') * level, **kwargs)
 
 
@@ -703,7 +704,7 @@ class Effect173(BaseEffect):
     @staticmethod
     def handler(fit, container, context, **kwargs):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Hybrid Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Small Hybrid Turret'),
                                       'damageMultiplier', container.getModifiedItemAttr('damageMultiplierBonus') * level, **kwargs)
 
 
@@ -721,7 +722,7 @@ class Effect174(BaseEffect):
     @staticmethod
     def handler(fit, container, context, **kwargs):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Projectile Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Small Projectile Turret'),
                                       'damageMultiplier', container.getModifiedItemAttr('damageMultiplierBonus') * level, **kwargs)
 
 
@@ -740,7 +741,7 @@ class Effect212(BaseEffect):
     @staticmethod
     def handler(fit, container, context, **kwargs):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Electronics Upgrades'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Electronics Upgrades'),
                                       'cpu', container.getModifiedItemAttr('cpuNeedBonus') * level, **kwargs)
 
 
@@ -788,7 +789,7 @@ class Effect227(BaseEffect):
 
     @staticmethod
     def handler(fit, container, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Propulsion Module',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Propulsion Module'),
                                       'capacitorNeed', container.getModifiedItemAttr('capNeedBonus'), **kwargs)
 
 
@@ -807,7 +808,7 @@ class Effect230(BaseEffect):
     @staticmethod
     def handler(fit, container, context, **kwargs):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Afterburner'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Afterburner'),
                                       'duration', container.getModifiedItemAttr('durationBonus') * level, **kwargs)
 
 
@@ -838,7 +839,7 @@ class Effect242(BaseEffect):
 
     @staticmethod
     def handler(fit, implant, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Propulsion Module',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Propulsion Module'),
                                       'speedFactor', implant.getModifiedItemAttr('speedFBonus'), **kwargs)
 
 
@@ -856,7 +857,7 @@ class Effect244(BaseEffect):
     @staticmethod
     def handler(fit, container, context, **kwargs):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('High Speed Maneuvering'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('High Speed Maneuvering'),
                                       'capacitorNeed', container.getModifiedItemAttr('capNeedBonus') * level, **kwargs)
 
 
@@ -896,7 +897,7 @@ class Effect272(BaseEffect):
     @staticmethod
     def handler(fit, container, context, **kwargs):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Repair Systems'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Repair Systems'),
                                       'duration', container.getModifiedItemAttr('durationSkillBonus') * level, **kwargs)
 
 
@@ -915,7 +916,7 @@ class Effect273(BaseEffect):
     @staticmethod
     def handler(fit, container, context, **kwargs):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Upgrades'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Shield Upgrades'),
                                       'power', container.getModifiedItemAttr('powerNeedBonus') * level, **kwargs)
 
 
@@ -948,7 +949,7 @@ class Effect279(BaseEffect):
     @staticmethod
     def handler(fit, container, context, **kwargs):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Emission Systems'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Shield Emission Systems'),
                                       'capacitorNeed', container.getModifiedItemAttr('capNeedBonus') * level, **kwargs)
 
 
@@ -966,7 +967,7 @@ class Effect287(BaseEffect):
     @staticmethod
     def handler(fit, container, context, **kwargs):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Gunnery'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Gunnery'),
                                       'capacitorNeed', container.getModifiedItemAttr('capNeedBonus') * level, **kwargs)
 
 
@@ -985,7 +986,7 @@ class Effect290(BaseEffect):
     @staticmethod
     def handler(fit, container, context, **kwargs):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Gunnery'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Gunnery'),
                                       'maxRange', container.getModifiedItemAttr('rangeSkillBonus') * level, **kwargs)
 
 
@@ -1004,7 +1005,7 @@ class Effect298(BaseEffect):
     @staticmethod
     def handler(fit, container, context, **kwargs):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Gunnery'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Gunnery'),
                                       'falloff', container.getModifiedItemAttr('falloffBonus') * level, **kwargs)
 
 
@@ -1040,7 +1041,7 @@ class Effect391(BaseEffect):
     @staticmethod
     def handler(fit, container, context, **kwargs):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Mining'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Mining'),
                                       'miningAmount', container.getModifiedItemAttr('miningAmountBonus') * level, **kwargs)
 
 
@@ -1125,7 +1126,7 @@ class Effect396(BaseEffect):
     @staticmethod
     def handler(fit, container, context, **kwargs):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Energy Grid Upgrades'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Energy Grid Upgrades'),
                                       'cpu', container.getModifiedItemAttr('cpuNeedBonus') * level, **kwargs)
 
 
@@ -1163,7 +1164,7 @@ class Effect408(BaseEffect):
     @staticmethod
     def handler(fit, container, context, **kwargs):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Projectile Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Large Projectile Turret'),
                                       'damageMultiplier', container.getModifiedItemAttr('damageMultiplierBonus') * level, **kwargs)
 
 
@@ -1182,7 +1183,7 @@ class Effect414(BaseEffect):
     @staticmethod
     def handler(fit, container, context, **kwargs):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Gunnery'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Gunnery'),
                                       'speed', container.getModifiedItemAttr('turretSpeeBonus') * level, **kwargs)
 
 
@@ -1313,7 +1314,7 @@ class Effect506(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Afterburner'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Afterburner'),
                                       'capacitorNeed', skill.getModifiedItemAttr('capNeedBonus') * skill.level, **kwargs)
 
 
@@ -1352,7 +1353,7 @@ class Effect508(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Projectile Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Small Projectile Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('shipBonusMF'), skill='Minmatar Frigate', **kwargs)
 
 
@@ -1374,7 +1375,7 @@ class Effect511(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Energy Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Small Energy Turret'),
                                       'capacitorNeed', ship.getModifiedItemAttr('shipBonus2AF'),
                                       skill='Amarr Frigate', **kwargs)
 
@@ -1396,7 +1397,7 @@ class Effect512(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Hybrid Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Small Hybrid Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('shipBonusGF'),
                                       skill='Gallente Frigate', **kwargs)
 
@@ -1416,7 +1417,7 @@ class Effect514(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Energy Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Small Energy Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('shipBonusAF'),
                                       skill='Amarr Frigate', **kwargs)
 
@@ -1435,7 +1436,7 @@ class Effect516(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Energy Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Medium Energy Turret'),
                                       'capacitorNeed', ship.getModifiedItemAttr('shipBonusAC'),
                                       skill='Amarr Cruiser', **kwargs)
 
@@ -1452,7 +1453,7 @@ class Effect521(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Hybrid Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Medium Hybrid Turret'),
                                       'maxRange', ship.getModifiedItemAttr('shipBonusCC'),
                                       skill='Caldari Cruiser', **kwargs)
 
@@ -1521,7 +1522,7 @@ class Effect542(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Energy Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Large Energy Turret'),
                                       'capacitorNeed', ship.getModifiedItemAttr('shipBonusAB'), skill='Amarr Battleship', **kwargs)
 
 
@@ -1539,7 +1540,7 @@ class Effect549(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Projectile Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Large Projectile Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('shipBonusMB'),
                                       skill='Minmatar Battleship', **kwargs)
 
@@ -1561,7 +1562,7 @@ class Effect550(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Hybrid Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Large Hybrid Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('shipBonusGB'),
                                       skill='Gallente Battleship', **kwargs)
 
@@ -1578,7 +1579,7 @@ class Effect553(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Hybrid Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Large Hybrid Turret'),
                                       'trackingSpeed', ship.getModifiedItemAttr('shipBonusGB'),
                                       skill='Gallente Battleship', **kwargs)
 
@@ -1601,7 +1602,7 @@ class Effect562(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Hybrid Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Medium Hybrid Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('shipBonusGC'),
                                       skill='Gallente Cruiser', **kwargs)
 
@@ -1620,7 +1621,7 @@ class Effect581(BaseEffect):
     @staticmethod
     def handler(fit, container, context, **kwargs):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Gunnery'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Gunnery'),
                                       'cpu', container.getModifiedItemAttr('cpuNeedBonus') * level, **kwargs)
 
 
@@ -1636,7 +1637,7 @@ class Effect582(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Gunnery'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Gunnery'),
                                       'speed', skill.getModifiedItemAttr('rofBonus') * skill.level, **kwargs)
 
 
@@ -1654,7 +1655,7 @@ class Effect584(BaseEffect):
 
     @staticmethod
     def handler(fit, implant, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Gunnery'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Gunnery'),
                                       'damageMultiplier', implant.getModifiedItemAttr('damageMultiplierBonus'), **kwargs)
 
 
@@ -1670,7 +1671,7 @@ class Effect587(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Weapon',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Energy Weapon'),
                                       'damageMultiplier', skill.getModifiedItemAttr('damageMultiplierBonus') * skill.level, **kwargs)
 
 
@@ -1686,7 +1687,7 @@ class Effect588(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Projectile Weapon',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Projectile Weapon'),
                                       'damageMultiplier', skill.getModifiedItemAttr('damageMultiplierBonus') * skill.level, **kwargs)
 
 
@@ -1702,7 +1703,7 @@ class Effect589(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Hybrid Weapon',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Hybrid Weapon'),
                                       'damageMultiplier', skill.getModifiedItemAttr('damageMultiplierBonus') * skill.level, **kwargs)
 
 
@@ -1720,7 +1721,7 @@ class Effect590(BaseEffect):
     @staticmethod
     def handler(fit, container, context, **kwargs):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Energy Pulse Weapons'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Energy Pulse Weapons'),
                                       'duration', container.getModifiedItemAttr('durationBonus') * level, **kwargs)
 
 
@@ -1808,7 +1809,7 @@ class Effect602(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Projectile Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Medium Projectile Turret'),
                                       'speed', ship.getModifiedItemAttr('shipBonusMC'), skill='Minmatar Cruiser', **kwargs)
 
 
@@ -1828,7 +1829,7 @@ class Effect604(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Projectile Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Large Projectile Turret'),
                                       'speed', ship.getModifiedItemAttr('shipBonusMB2'), skill='Minmatar Battleship', **kwargs)
 
 
@@ -1867,7 +1868,7 @@ class Effect623(BaseEffect):
     @staticmethod
     def handler(fit, container, context, **kwargs):
         level = container.level if 'skill' in context else 1
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Mining Drone Operation'),
+        fit.drones.filteredItemBoost(ItemSkillFilter('Mining Drone Operation'),
                                      'miningAmount',
                                      container.getModifiedItemAttr('miningAmountBonus') * level, **kwargs)
 
@@ -1920,7 +1921,7 @@ class Effect660(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill(skill),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter(skill),
                                         'emDamage', skill.getModifiedItemAttr('damageMultiplierBonus') * skill.level, **kwargs)
 
 
@@ -1938,7 +1939,7 @@ class Effect661(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill(skill),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter(skill),
                                         'explosiveDamage', skill.getModifiedItemAttr('damageMultiplierBonus') * skill.level, **kwargs)
 
 
@@ -1956,7 +1957,7 @@ class Effect662(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill(skill),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter(skill),
                                         'thermalDamage', skill.getModifiedItemAttr('damageMultiplierBonus') * skill.level, **kwargs)
 
 
@@ -1974,7 +1975,7 @@ class Effect668(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill(skill),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter(skill),
                                         'kineticDamage', skill.getModifiedItemAttr('damageMultiplierBonus') * skill.level, **kwargs)
 
 
@@ -2005,7 +2006,7 @@ class Effect675(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Energy Pulse Weapons'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Energy Pulse Weapons'),
                                       'cpu', skill.getModifiedItemAttr('cpuNeedBonus') * skill.level, **kwargs)
 
 
@@ -2023,7 +2024,7 @@ class Effect677(BaseEffect):
     @staticmethod
     def handler(fit, container, context, **kwargs):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Missile Launcher Operation'),
                                       'cpu', container.getModifiedItemAttr('cpuNeedBonus') * level, **kwargs)
 
 
@@ -2205,7 +2206,7 @@ class Effect744(BaseEffect):
     @staticmethod
     def handler(fit, container, context, **kwargs):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('CPU Management'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('CPU Management'),
                                       'duration', container.getModifiedItemAttr('scanspeedBonus') * level, **kwargs)
 
 
@@ -2221,7 +2222,7 @@ class Effect754(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Hybrid Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Small Hybrid Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('shipBonusCF'), skill='Caldari Frigate', **kwargs)
 
 
@@ -2240,7 +2241,7 @@ class Effect757(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Energy Turret'), 'damageMultiplier',
+        fit.modules.filteredItemBoost(ItemSkillFilter('Small Energy Turret'), 'damageMultiplier',
                                       src.getModifiedItemAttr('shipBonusAF'), skill='Amarr Frigate', **kwargs)
 
 
@@ -2258,7 +2259,7 @@ class Effect760(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Missile Launcher Operation'),
                                       'speed', ship.getModifiedItemAttr('shipBonusCF2'), skill='Caldari Frigate', **kwargs)
 
 
@@ -2275,7 +2276,7 @@ class Effect763(BaseEffect):
     @staticmethod
     def handler(fit, container, context, **kwargs):
         for dmgType in ('em', 'kinetic', 'explosive', 'thermal'):
-            fit.modules.filteredChargeMultiply(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+            fit.modules.filteredChargeMultiply(ChargeSkillFilter('Missile Launcher Operation'),
                                                '%sDamage' % dmgType,
                                                container.getModifiedItemAttr('missileDamageMultiplierBonus'),
                                                stackingPenalties=True, **kwargs)
@@ -2298,7 +2299,7 @@ class Effect784(BaseEffect):
     def handler(fit, container, context, **kwargs):
         level = container.level if 'skill' in context else 1
         penalized = False if 'skill' in context or 'implant' in context or 'booster' in context else True
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Missile Launcher Operation'),
                                         'explosionDelay', container.getModifiedItemAttr('maxFlightTimeBonus') * level,
                                         stackingPenalties=penalized, **kwargs)
 
@@ -2349,7 +2350,7 @@ class Effect848(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Cloaking'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Cloaking'),
                                       'cloakingTargetingDelay',
                                       skill.getModifiedItemAttr('cloakingTargetingDelayBonus') * skill.level, **kwargs)
 
@@ -2402,7 +2403,7 @@ class Effect874(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Projectile Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Small Projectile Turret'),
                                       'maxRange', ship.getModifiedItemAttr('shipBonusMF2'), skill='Minmatar Frigate', **kwargs)
 
 
@@ -2419,7 +2420,7 @@ class Effect882(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Hybrid Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Small Hybrid Turret'),
                                       'maxRange', ship.getModifiedItemAttr('shipBonusCF2'), skill='Caldari Frigate', **kwargs)
 
 
@@ -2435,7 +2436,7 @@ class Effect887(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Energy Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Large Energy Turret'),
                                       'speed', ship.getModifiedItemAttr('shipBonusAB2'), skill='Amarr Battleship', **kwargs)
 
 
@@ -2451,7 +2452,7 @@ class Effect889(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, **kwargs):
-        fit.modules.filteredItemMultiply(lambda mod: mod.item.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredItemMultiply(ItemSkillFilter('Missile Launcher Operation'),
                                          'speed', module.getModifiedItemAttr('speedMultiplier'),
                                          stackingPenalties=True, **kwargs)
 
@@ -2468,7 +2469,7 @@ class Effect891(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Cruise Missiles'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Cruise Missiles'),
                                         'maxVelocity', ship.getModifiedItemAttr('shipBonusCB3'),
                                         skill='Caldari Battleship', **kwargs)
 
@@ -2485,7 +2486,7 @@ class Effect892(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Torpedoes'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Torpedoes'),
                                         'maxVelocity', ship.getModifiedItemAttr('shipBonusCB3'),
                                         skill='Caldari Battleship', **kwargs)
 
@@ -2503,7 +2504,7 @@ class Effect896(BaseEffect):
 
     @staticmethod
     def handler(fit, container, context, **kwargs):
-        fit.modules.filteredItemMultiply(lambda mod: mod.item.group.name == 'Cloaking Device',
+        fit.modules.filteredItemMultiply(ItemGroupFilter('Cloaking Device'),
                                          'cpu', container.getModifiedItemAttr('cloakingCpuNeedBonus'), **kwargs)
 
 
@@ -2521,7 +2522,7 @@ class Effect898(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Missile Launcher Operation'),
                                         'kineticDamage', ship.getModifiedItemAttr('shipBonusCF'),
                                         skill='Caldari Frigate', **kwargs)
 
@@ -2540,7 +2541,7 @@ class Effect899(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Missile Launcher Operation'),
                                         'kineticDamage', ship.getModifiedItemAttr('shipBonusCC'),
                                         skill='Caldari Cruiser', **kwargs)
 
@@ -2557,7 +2558,7 @@ class Effect900(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Light Drone Operation'),
+        fit.drones.filteredItemBoost(ItemSkillFilter('Light Drone Operation'),
                                      'thermalDamage', ship.getModifiedItemAttr('shipBonusGF2'),
                                      skill='Gallente Frigate', **kwargs)
 
@@ -2575,7 +2576,7 @@ class Effect907(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Energy Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Medium Energy Turret'),
                                       'speed', ship.getModifiedItemAttr('shipBonusAC2'),
                                       skill='Amarr Cruiser', **kwargs)
 
@@ -2608,7 +2609,7 @@ class Effect912(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Missile Launcher Operation'),
                                       'speed', ship.getModifiedItemAttr('shipBonusCC2'),
                                       skill='Caldari Cruiser', **kwargs)
 
@@ -2642,7 +2643,7 @@ class Effect919(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Hybrid Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Medium Hybrid Turret'),
                                       'trackingSpeed', ship.getModifiedItemAttr('shipBonusGC2'),
                                       skill='Gallente Cruiser', **kwargs)
 
@@ -2725,7 +2726,7 @@ class Effect968(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Projectile Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Medium Projectile Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('shipBonusMC2'),
                                       skill='Minmatar Cruiser', **kwargs)
 
@@ -2760,7 +2761,7 @@ class Effect989(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Hybrid Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Small Hybrid Turret'),
                                       'maxRange', ship.getModifiedItemAttr('eliteBonusGunship1'),
                                       skill='Assault Frigates', **kwargs)
 
@@ -2777,7 +2778,7 @@ class Effect991(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Energy Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Small Energy Turret'),
                                       'maxRange', ship.getModifiedItemAttr('eliteBonusGunship1'),
                                       skill='Assault Frigates', **kwargs)
 
@@ -2794,7 +2795,7 @@ class Effect996(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Hybrid Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Small Hybrid Turret'),
                                       'trackingSpeed', ship.getModifiedItemAttr('eliteBonusGunship2'),
                                       skill='Assault Frigates', **kwargs)
 
@@ -2811,7 +2812,7 @@ class Effect998(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Projectile Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Small Projectile Turret'),
                                       'falloff', ship.getModifiedItemAttr('eliteBonusGunship2'),
                                       skill='Assault Frigates', **kwargs)
 
@@ -2828,7 +2829,7 @@ class Effect999(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Operation'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Shield Operation'),
                                       'shieldBonus', ship.getModifiedItemAttr('eliteBonusGunship2'),
                                       skill='Assault Frigates', **kwargs)
 
@@ -2861,7 +2862,7 @@ class Effect1003(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Pulse Laser Specialization'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Small Pulse Laser Specialization'),
                                       'damageMultiplier', skill.getModifiedItemAttr('damageMultiplierBonus') * skill.level, **kwargs)
 
 
@@ -2877,7 +2878,7 @@ class Effect1004(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Beam Laser Specialization'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Small Beam Laser Specialization'),
                                       'damageMultiplier', skill.getModifiedItemAttr('damageMultiplierBonus') * skill.level, **kwargs)
 
 
@@ -2893,7 +2894,7 @@ class Effect1005(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Blaster Specialization'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Small Blaster Specialization'),
                                       'damageMultiplier', skill.getModifiedItemAttr('damageMultiplierBonus') * skill.level, **kwargs)
 
 
@@ -2909,7 +2910,7 @@ class Effect1006(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Railgun Specialization'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Small Railgun Specialization'),
                                       'damageMultiplier', skill.getModifiedItemAttr('damageMultiplierBonus') * skill.level, **kwargs)
 
 
@@ -2925,7 +2926,7 @@ class Effect1007(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Autocannon Specialization'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Small Autocannon Specialization'),
                                       'damageMultiplier', skill.getModifiedItemAttr('damageMultiplierBonus') * skill.level, **kwargs)
 
 
@@ -2941,7 +2942,7 @@ class Effect1008(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Artillery Specialization'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Small Artillery Specialization'),
                                       'damageMultiplier', skill.getModifiedItemAttr('damageMultiplierBonus') * skill.level, **kwargs)
 
 
@@ -2957,7 +2958,7 @@ class Effect1009(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Pulse Laser Specialization'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Medium Pulse Laser Specialization'),
                                       'damageMultiplier', skill.getModifiedItemAttr('damageMultiplierBonus') * skill.level, **kwargs)
 
 
@@ -2973,7 +2974,7 @@ class Effect1010(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Beam Laser Specialization'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Medium Beam Laser Specialization'),
                                       'damageMultiplier', skill.getModifiedItemAttr('damageMultiplierBonus') * skill.level, **kwargs)
 
 
@@ -2989,7 +2990,7 @@ class Effect1011(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Blaster Specialization'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Medium Blaster Specialization'),
                                       'damageMultiplier', skill.getModifiedItemAttr('damageMultiplierBonus') * skill.level, **kwargs)
 
 
@@ -3005,7 +3006,7 @@ class Effect1012(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Railgun Specialization'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Medium Railgun Specialization'),
                                       'damageMultiplier', skill.getModifiedItemAttr('damageMultiplierBonus') * skill.level, **kwargs)
 
 
@@ -3021,7 +3022,7 @@ class Effect1013(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Autocannon Specialization'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Medium Autocannon Specialization'),
                                       'damageMultiplier', skill.getModifiedItemAttr('damageMultiplierBonus') * skill.level, **kwargs)
 
 
@@ -3037,7 +3038,7 @@ class Effect1014(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Artillery Specialization'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Medium Artillery Specialization'),
                                       'damageMultiplier', skill.getModifiedItemAttr('damageMultiplierBonus') * skill.level, **kwargs)
 
 
@@ -3053,7 +3054,7 @@ class Effect1015(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Pulse Laser Specialization'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Large Pulse Laser Specialization'),
                                       'damageMultiplier', skill.getModifiedItemAttr('damageMultiplierBonus') * skill.level, **kwargs)
 
 
@@ -3069,7 +3070,7 @@ class Effect1016(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Beam Laser Specialization'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Large Beam Laser Specialization'),
                                       'damageMultiplier', skill.getModifiedItemAttr('damageMultiplierBonus') * skill.level, **kwargs)
 
 
@@ -3085,7 +3086,7 @@ class Effect1017(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Blaster Specialization'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Large Blaster Specialization'),
                                       'damageMultiplier', skill.getModifiedItemAttr('damageMultiplierBonus') * skill.level, **kwargs)
 
 
@@ -3101,7 +3102,7 @@ class Effect1018(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Railgun Specialization'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Large Railgun Specialization'),
                                       'damageMultiplier', skill.getModifiedItemAttr('damageMultiplierBonus') * skill.level, **kwargs)
 
 
@@ -3117,7 +3118,7 @@ class Effect1019(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Autocannon Specialization'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Large Autocannon Specialization'),
                                       'damageMultiplier', skill.getModifiedItemAttr('damageMultiplierBonus') * skill.level, **kwargs)
 
 
@@ -3133,7 +3134,7 @@ class Effect1020(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Artillery Specialization'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Large Artillery Specialization'),
                                       'damageMultiplier', skill.getModifiedItemAttr('damageMultiplierBonus') * skill.level, **kwargs)
 
 
@@ -3149,7 +3150,7 @@ class Effect1021(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Hybrid Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Small Hybrid Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('eliteBonusGunship2'),
                                       skill='Assault Frigates', **kwargs)
 
@@ -3167,7 +3168,7 @@ class Effect1024(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Heavy Missiles'),
                                         'maxVelocity', ship.getModifiedItemAttr('shipBonusCC2'),
                                         skill='Caldari Cruiser', **kwargs)
 
@@ -3185,7 +3186,7 @@ class Effect1025(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Light Missiles'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Light Missiles'),
                                         'maxVelocity', ship.getModifiedItemAttr('shipBonusCC2'),
                                         skill='Caldari Cruiser', **kwargs)
 
@@ -3205,7 +3206,7 @@ class Effect1030(BaseEffect):
     @staticmethod
     def handler(fit, container, context, **kwargs):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Remote Armor Repair Systems'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Remote Armor Repair Systems'),
                                       'capacitorNeed', container.getModifiedItemAttr('capNeedBonus') * level, **kwargs)
 
 
@@ -3221,7 +3222,7 @@ class Effect1033(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Remote Armor Repair Systems'), 'capacitorNeed',
+        fit.modules.filteredItemBoost(ItemSkillFilter('Remote Armor Repair Systems'), 'capacitorNeed',
                                       src.getModifiedItemAttr('eliteBonusLogistics1'), skill='Logistics Cruisers', **kwargs)
 
 
@@ -3238,7 +3239,7 @@ class Effect1034(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Remote Armor Repair Systems'), 'capacitorNeed',
+        fit.modules.filteredItemBoost(ItemSkillFilter('Remote Armor Repair Systems'), 'capacitorNeed',
                                       src.getModifiedItemAttr('eliteBonusLogistics2'), skill='Logistics Cruisers', **kwargs)
 
 
@@ -3254,7 +3255,7 @@ class Effect1035(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Emission Systems'), 'capacitorNeed',
+        fit.modules.filteredItemBoost(ItemSkillFilter('Shield Emission Systems'), 'capacitorNeed',
                                       src.getModifiedItemAttr('eliteBonusLogistics2'), skill='Logistics Cruisers', **kwargs)
 
 
@@ -3271,7 +3272,7 @@ class Effect1036(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Emission Systems'), 'capacitorNeed',
+        fit.modules.filteredItemBoost(ItemSkillFilter('Shield Emission Systems'), 'capacitorNeed',
                                       src.getModifiedItemAttr('eliteBonusLogistics1'), skill='Logistics Cruisers', **kwargs)
 
 
@@ -3287,7 +3288,7 @@ class Effect1046(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Remote Armor Repair Systems'), 'maxRange',
+        fit.modules.filteredItemBoost(ItemSkillFilter('Remote Armor Repair Systems'), 'maxRange',
                                       src.getModifiedItemAttr('shipBonusGC'), skill='Gallente Cruiser', **kwargs)
 
 
@@ -3303,7 +3304,7 @@ class Effect1047(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Remote Armor Repair Systems'), 'maxRange',
+        fit.modules.filteredItemBoost(ItemSkillFilter('Remote Armor Repair Systems'), 'maxRange',
                                       src.getModifiedItemAttr('shipBonusAC2'), skill='Amarr Cruiser', **kwargs)
 
 
@@ -3320,7 +3321,7 @@ class Effect1048(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Emission Systems'), 'maxRange',
+        fit.modules.filteredItemBoost(ItemSkillFilter('Shield Emission Systems'), 'maxRange',
                                       src.getModifiedItemAttr('shipBonusCC'), skill='Caldari Cruiser', **kwargs)
 
 
@@ -3336,7 +3337,7 @@ class Effect1049(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Emission Systems'), 'maxRange',
+        fit.modules.filteredItemBoost(ItemSkillFilter('Shield Emission Systems'), 'maxRange',
                                       src.getModifiedItemAttr('shipBonusMC2'), skill='Minmatar Cruiser', **kwargs)
 
 
@@ -3352,7 +3353,7 @@ class Effect1056(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Hybrid Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Medium Hybrid Turret'),
                                       'maxRange', ship.getModifiedItemAttr('eliteBonusHeavyGunship1'),
                                       skill='Heavy Assault Cruisers', **kwargs)
 
@@ -3369,7 +3370,7 @@ class Effect1057(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Projectile Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Medium Projectile Turret'),
                                       'maxRange', ship.getModifiedItemAttr('eliteBonusHeavyGunship1'),
                                       skill='Heavy Assault Cruisers', **kwargs)
 
@@ -3386,7 +3387,7 @@ class Effect1058(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Energy Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Medium Energy Turret'),
                                       'maxRange', ship.getModifiedItemAttr('eliteBonusHeavyGunship1'),
                                       skill='Heavy Assault Cruisers', **kwargs)
 
@@ -3403,7 +3404,7 @@ class Effect1060(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Projectile Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Medium Projectile Turret'),
                                       'falloff', ship.getModifiedItemAttr('eliteBonusHeavyGunship1'),
                                       skill='Heavy Assault Cruisers', **kwargs)
 
@@ -3421,7 +3422,7 @@ class Effect1061(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Hybrid Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Medium Hybrid Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('eliteBonusHeavyGunship2'),
                                       skill='Heavy Assault Cruisers', **kwargs)
 
@@ -3438,7 +3439,7 @@ class Effect1062(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Energy Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Medium Energy Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('eliteBonusHeavyGunship2'),
                                       skill='Heavy Assault Cruisers', **kwargs)
 
@@ -3455,7 +3456,7 @@ class Effect1063(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Projectile Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Medium Projectile Turret'),
                                       'trackingSpeed', ship.getModifiedItemAttr('eliteBonusHeavyGunship2'),
                                       skill='Heavy Assault Cruisers', **kwargs)
 
@@ -3472,7 +3473,7 @@ class Effect1080(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Hybrid Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Medium Hybrid Turret'),
                                       'falloff', ship.getModifiedItemAttr('eliteBonusHeavyGunship1'),
                                       skill='Heavy Assault Cruisers', **kwargs)
 
@@ -3489,7 +3490,7 @@ class Effect1081(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Heavy Missiles'),
                                         'explosionDelay', ship.getModifiedItemAttr('eliteBonusHeavyGunship1'),
                                         skill='Heavy Assault Cruisers', **kwargs)
 
@@ -3506,7 +3507,7 @@ class Effect1082(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Light Missiles'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Light Missiles'),
                                         'explosionDelay', ship.getModifiedItemAttr('eliteBonusHeavyGunship1'),
                                         skill='Heavy Assault Cruisers', **kwargs)
 
@@ -3539,7 +3540,7 @@ class Effect1087(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Projectile Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Medium Projectile Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('eliteBonusHeavyGunship2'),
                                       skill='Heavy Assault Cruisers', **kwargs)
 
@@ -3558,7 +3559,7 @@ class Effect1099(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Projectile Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Small Projectile Turret'),
                                       'trackingSpeed', ship.getModifiedItemAttr('shipBonusMF2'),
                                       skill='Minmatar Frigate', **kwargs)
 
@@ -3577,7 +3578,7 @@ class Effect1176(BaseEffect):
     @staticmethod
     def handler(fit, container, context, **kwargs):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Propulsion Module',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Propulsion Module'),
                                       'speedFactor', container.getModifiedItemAttr('speedFBonus') * level, **kwargs)
 
 
@@ -3593,7 +3594,7 @@ class Effect1179(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Energy Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Small Energy Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('eliteBonusGunship2'),
                                       skill='Assault Frigates', **kwargs)
 
@@ -3610,7 +3611,7 @@ class Effect1181(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Remote Capacitor Transmitter',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Remote Capacitor Transmitter'),
                                       'capacitorNeed', ship.getModifiedItemAttr('eliteBonusLogistics1'),
                                       skill='Logistics Cruisers', **kwargs)
 
@@ -3627,7 +3628,7 @@ class Effect1182(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Remote Capacitor Transmitter',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Remote Capacitor Transmitter'),
                                       'maxRange', ship.getModifiedItemAttr('shipBonusAC'),
                                       skill='Amarr Cruiser', **kwargs)
 
@@ -3645,7 +3646,7 @@ class Effect1183(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Remote Capacitor Transmitter',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Remote Capacitor Transmitter'),
                                       'capacitorNeed', ship.getModifiedItemAttr('eliteBonusLogistics2'),
                                       skill='Logistics Cruisers', **kwargs)
 
@@ -3663,7 +3664,7 @@ class Effect1184(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Remote Capacitor Transmitter',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Remote Capacitor Transmitter'),
                                       'maxRange', ship.getModifiedItemAttr('shipBonusCC2'),
                                       skill='Caldari Cruiser', **kwargs)
 
@@ -3699,7 +3700,7 @@ class Effect1190(BaseEffect):
     @staticmethod
     def handler(fit, container, context, **kwargs):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Ice Harvesting'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Ice Harvesting'),
                                       'duration', container.getModifiedItemAttr('iceHarvestCycleBonus') * level, **kwargs)
 
 
@@ -3750,7 +3751,7 @@ class Effect1215(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Nosferatu',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Energy Nosferatu'),
                                       'powerTransferAmount', ship.getModifiedItemAttr('shipBonusAF'),
                                       skill='Amarr Frigate', **kwargs)
 
@@ -3769,7 +3770,7 @@ class Effect1218(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Hybrid Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Small Hybrid Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('shipBonusRole7'), **kwargs)
 
 
@@ -3785,7 +3786,7 @@ class Effect1219(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Nosferatu',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Energy Nosferatu'),
                                       'powerTransferAmount', ship.getModifiedItemAttr('shipBonusAB'),
                                       skill='Amarr Battleship', **kwargs)
 
@@ -3804,7 +3805,7 @@ class Effect1220(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Nosferatu',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Energy Nosferatu'),
                                       'powerTransferAmount', ship.getModifiedItemAttr('shipBonusAC'),
                                       skill='Amarr Cruiser', **kwargs)
 
@@ -3821,7 +3822,7 @@ class Effect1221(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Stasis Web',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Stasis Web'),
                                       'maxRange', ship.getModifiedItemAttr('shipBonusMB'),
                                       skill='Minmatar Battleship', **kwargs)
 
@@ -3838,7 +3839,7 @@ class Effect1222(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Stasis Web',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Stasis Web'),
                                       'maxRange', ship.getModifiedItemAttr('shipBonusMC2'),
                                       skill='Minmatar Cruiser', **kwargs)
 
@@ -3856,7 +3857,7 @@ class Effect1228(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Projectile Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Small Projectile Turret'),
                                       'trackingSpeed', ship.getModifiedItemAttr('shipBonusGF'), skill='Gallente Frigate', **kwargs)
 
 
@@ -3874,7 +3875,7 @@ class Effect1230(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Missile Launcher Operation'),
                                         'maxVelocity', ship.getModifiedItemAttr('shipBonusRole7'), **kwargs)
 
 
@@ -3891,7 +3892,7 @@ class Effect1232(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Projectile Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Medium Projectile Turret'),
                                       'speed', ship.getModifiedItemAttr('shipBonusRole7'), **kwargs)
 
 
@@ -3908,7 +3909,7 @@ class Effect1233(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Hybrid Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Medium Hybrid Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('shipBonusRole7'), **kwargs)
 
 
@@ -3925,7 +3926,7 @@ class Effect1234(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Light Missiles'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Light Missiles'),
                                         'maxVelocity', ship.getModifiedItemAttr('shipBonusRole7'), **kwargs)
 
 
@@ -3941,7 +3942,7 @@ class Effect1239(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Projectile Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Large Projectile Turret'),
                                       'speed', ship.getModifiedItemAttr('shipBonusRole7'), **kwargs)
 
 
@@ -3957,7 +3958,7 @@ class Effect1240(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Hybrid Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Large Hybrid Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('shipBonusRole7'), **kwargs)
 
 
@@ -3974,7 +3975,7 @@ class Effect1255(BaseEffect):
 
     @staticmethod
     def handler(fit, implant, context, **kwargs):
-        fit.appliedImplants.filteredItemMultiply(lambda mod: mod.item.group.name == 'Cyberimplant',
+        fit.appliedImplants.filteredItemMultiply(ItemGroupFilter('Cyberimplant'),
                                                  'durationBonus', implant.getModifiedItemAttr('implantSetBloodraider'), **kwargs)
 
 
@@ -3990,7 +3991,7 @@ class Effect1256(BaseEffect):
 
     @staticmethod
     def handler(fit, implant, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capacitor Emission Systems'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Capacitor Emission Systems'),
                                       'duration', implant.getModifiedItemAttr('durationBonus'), **kwargs)
 
 
@@ -4007,7 +4008,7 @@ class Effect1261(BaseEffect):
 
     @staticmethod
     def handler(fit, implant, context, **kwargs):
-        fit.appliedImplants.filteredItemMultiply(lambda mod: mod.item.group.name == 'Cyberimplant',
+        fit.appliedImplants.filteredItemMultiply(ItemGroupFilter('Cyberimplant'),
                                                  'velocityBonus', implant.getModifiedItemAttr('implantSetSerpentis'), **kwargs)
 
 
@@ -4023,7 +4024,7 @@ class Effect1264(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Hybrid Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Small Hybrid Turret'),
                                       'trackingSpeed', ship.getModifiedItemAttr('eliteBonusInterceptor2'),
                                       skill='Interceptors', **kwargs)
 
@@ -4040,7 +4041,7 @@ class Effect1268(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Energy Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Small Energy Turret'),
                                       'trackingSpeed', ship.getModifiedItemAttr('eliteBonusInterceptor2'),
                                       skill='Interceptors', **kwargs)
 
@@ -4060,7 +4061,7 @@ class Effect1281(BaseEffect):
     @staticmethod
     def handler(fit, container, context, **kwargs):
         penalized = 'implant' not in context
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Repair Systems'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Repair Systems'),
                                       'armorDamageAmount', container.getModifiedItemAttr('repairBonus'),
                                       stackingPenalties=penalized, **kwargs)
 
@@ -4081,7 +4082,7 @@ class Effect1318(BaseEffect):
         groups = ('ECM', 'Burst Jammer')
         level = container.level if 'skill' in context else 1
         for scanType in ('Gravimetric', 'Ladar', 'Magnetometric', 'Radar'):
-            fit.modules.filteredItemBoost(lambda mod: mod.item.group.name in groups,
+            fit.modules.filteredItemBoost(ItemGroupFilter(*groups),
                                           'scan{0}StrengthBonus'.format(scanType),
                                           container.getModifiedItemAttr('scanSkillEwStrengthBonus') * level,
                                           stackingPenalties=False if 'skill' in context else True, **kwargs)
@@ -4101,7 +4102,7 @@ class Effect1360(BaseEffect):
     @staticmethod
     def handler(fit, container, context, **kwargs):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Sensor Linking'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Sensor Linking'),
                                       'capacitorNeed', container.getModifiedItemAttr('capNeedBonus') * level, **kwargs)
 
 
@@ -4119,7 +4120,7 @@ class Effect1361(BaseEffect):
     @staticmethod
     def handler(fit, container, context, **kwargs):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Weapon Disruption'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Weapon Disruption'),
                                       'capacitorNeed', container.getModifiedItemAttr('capNeedBonus') * level, **kwargs)
 
 
@@ -4137,7 +4138,7 @@ class Effect1370(BaseEffect):
     @staticmethod
     def handler(fit, container, context, **kwargs):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Target Painting'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Target Painting'),
                                       'capacitorNeed', container.getModifiedItemAttr('capNeedBonus') * level, **kwargs)
 
 
@@ -4156,7 +4157,7 @@ class Effect1372(BaseEffect):
     @staticmethod
     def handler(fit, container, context, **kwargs):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'ECM',
+        fit.modules.filteredItemBoost(ItemGroupFilter('ECM'),
                                       'capacitorNeed', container.getModifiedItemAttr('capNeedBonus') * level, **kwargs)
 
 
@@ -4172,7 +4173,7 @@ class Effect1395(BaseEffect):
 
     @staticmethod
     def handler(fit, container, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Operation'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Shield Operation'),
                                       'shieldBonus', container.getModifiedItemAttr('shieldBoostMultiplier'), **kwargs)
 
 
@@ -4189,7 +4190,7 @@ class Effect1397(BaseEffect):
 
     @staticmethod
     def handler(fit, implant, context, **kwargs):
-        fit.appliedImplants.filteredItemMultiply(lambda mod: mod.item.group.name == 'Cyberimplant',
+        fit.appliedImplants.filteredItemMultiply(ItemGroupFilter('Cyberimplant'),
                                                  'shieldBoostMultiplier', implant.getModifiedItemAttr('implantSetGuristas'), **kwargs)
 
 
@@ -4208,7 +4209,7 @@ class Effect1409(BaseEffect):
     @staticmethod
     def handler(fit, container, context, **kwargs):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Astrometrics'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Astrometrics'),
                                       'duration', container.getModifiedItemAttr('durationBonus') * level, **kwargs)
 
 
@@ -4226,7 +4227,7 @@ class Effect1410(BaseEffect):
     @staticmethod
     def handler(fit, container, context, **kwargs):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Propulsion Jamming'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Propulsion Jamming'),
                                       'capacitorNeed', container.getModifiedItemAttr('capNeedBonus') * level, **kwargs)
 
 
@@ -4242,7 +4243,7 @@ class Effect1412(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Hybrid Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Large Hybrid Turret'),
                                       'maxRange', ship.getModifiedItemAttr('shipBonusCB'), skill='Caldari Battleship', **kwargs)
 
 
@@ -4259,7 +4260,7 @@ class Effect1434(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, **kwargs):
         for sensorType in ('Gravimetric', 'Ladar', 'Magnetometric', 'Radar'):
-            fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Electronic Warfare'),
+            fit.modules.filteredItemBoost(ItemSkillFilter('Electronic Warfare'),
                                           'scan{0}StrengthBonus'.format(sensorType),
                                           ship.getModifiedItemAttr('shipBonusCB'),
                                           skill='Caldari Battleship', **kwargs)
@@ -4277,7 +4278,7 @@ class Effect1441(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'ECM',
+        fit.modules.filteredItemBoost(ItemGroupFilter('ECM'),
                                       'maxRange', ship.getModifiedItemAttr('shipBonusCB3'),
                                       skill='Caldari Battleship', **kwargs)
 
@@ -4294,7 +4295,7 @@ class Effect1442(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'ECM',
+        fit.modules.filteredItemBoost(ItemGroupFilter('ECM'),
                                       'maxRange', ship.getModifiedItemAttr('shipBonusCC2'), skill='Caldari Cruiser', **kwargs)
 
 
@@ -4312,7 +4313,7 @@ class Effect1443(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'ECM',
+        fit.modules.filteredItemBoost(ItemGroupFilter('ECM'),
                                       'capacitorNeed', ship.getModifiedItemAttr('shipBonusCC'),
                                       skill='Caldari Cruiser', **kwargs)
 
@@ -4331,7 +4332,7 @@ class Effect1445(BaseEffect):
     @staticmethod
     def handler(fit, container, context, **kwargs):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Sensor Linking'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Sensor Linking'),
                                       'maxRange', container.getModifiedItemAttr('rangeSkillBonus') * level,
                                       stackingPenalties='skill' not in context, **kwargs)
 
@@ -4350,7 +4351,7 @@ class Effect1446(BaseEffect):
     @staticmethod
     def handler(fit, container, context, **kwargs):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Target Painter',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Target Painter'),
                                       'maxRange', container.getModifiedItemAttr('rangeSkillBonus') * level,
                                       stackingPenalties='skill' not in context, **kwargs)
 
@@ -4369,7 +4370,7 @@ class Effect1448(BaseEffect):
     @staticmethod
     def handler(fit, container, context, **kwargs):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Weapon Disruptor',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Weapon Disruptor'),
                                       'maxRange', container.getModifiedItemAttr('rangeSkillBonus') * level,
                                       stackingPenalties='skill' not in context, **kwargs)
 
@@ -4386,7 +4387,7 @@ class Effect1449(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Sensor Linking'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Sensor Linking'),
                                       'falloffEffectiveness', skill.getModifiedItemAttr('falloffBonus') * skill.level, **kwargs)
 
 
@@ -4402,7 +4403,7 @@ class Effect1450(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Target Painter',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Target Painter'),
                                       'falloffEffectiveness', skill.getModifiedItemAttr('falloffBonus') * skill.level, **kwargs)
 
 
@@ -4418,7 +4419,7 @@ class Effect1451(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Weapon Disruptor',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Weapon Disruptor'),
                                       'falloffEffectiveness', skill.getModifiedItemAttr('falloffBonus') * skill.level, **kwargs)
 
 
@@ -4437,7 +4438,7 @@ class Effect1452(BaseEffect):
     @staticmethod
     def handler(fit, container, context, **kwargs):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'ECM',
+        fit.modules.filteredItemBoost(ItemGroupFilter('ECM'),
                                       'maxRange', container.getModifiedItemAttr('rangeSkillBonus') * level,
                                       stackingPenalties='skill' not in context and 'implant' not in context, **kwargs)
 
@@ -4454,7 +4455,7 @@ class Effect1453(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'ECM',
+        fit.modules.filteredItemBoost(ItemGroupFilter('ECM'),
                                       'falloffEffectiveness', skill.getModifiedItemAttr('falloffBonus') * skill.level, **kwargs)
 
 
@@ -4474,7 +4475,7 @@ class Effect1472(BaseEffect):
     def handler(fit, container, context, **kwargs):
         level = container.level if 'skill' in context else 1
         penalize = False if 'skill' in context or 'implant' in context else True
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Missile Launcher Operation'),
                                         'aoeCloudSize', container.getModifiedItemAttr('aoeCloudSizeBonus') * level,
                                         stackingPenalties=penalize, **kwargs)
 
@@ -4493,7 +4494,7 @@ class Effect1500(BaseEffect):
     @staticmethod
     def handler(fit, container, context, **kwargs):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Operation'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Shield Operation'),
                                       'capacitorNeed', container.getModifiedItemAttr('shieldBoostCapacitorBonus') * level, **kwargs)
 
 
@@ -4509,7 +4510,7 @@ class Effect1550(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Target Painter',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Target Painter'),
                                       'signatureRadiusBonus',
                                       skill.getModifiedItemAttr('scanSkillTargetPaintStrengthBonus') * skill.level, **kwargs)
 
@@ -4527,7 +4528,7 @@ class Effect1551(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Target Painter',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Target Painter'),
                                       'signatureRadiusBonus', ship.getModifiedItemAttr('shipBonusMF2'),
                                       skill='Minmatar Frigate', **kwargs)
 
@@ -4566,7 +4567,7 @@ class Effect1579(BaseEffect):
 
     @staticmethod
     def handler(fit, implant, context, **kwargs):
-        fit.appliedImplants.filteredItemMultiply(lambda target: target.item.requiresSkill('Cybernetics'),
+        fit.appliedImplants.filteredItemMultiply(ItemSkillFilter('Cybernetics'),
                                                  'armorHpBonus', implant.getModifiedItemAttr('implantSetAmulet') or 1, **kwargs)
 
 
@@ -4597,7 +4598,7 @@ class Effect1585(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Energy Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Capital Energy Turret'),
                                       'damageMultiplier', skill.getModifiedItemAttr('damageMultiplierBonus') * skill.level, **kwargs)
 
 
@@ -4613,7 +4614,7 @@ class Effect1586(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Projectile Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Capital Projectile Turret'),
                                       'damageMultiplier', skill.getModifiedItemAttr('damageMultiplierBonus') * skill.level, **kwargs)
 
 
@@ -4629,7 +4630,7 @@ class Effect1587(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Hybrid Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Capital Hybrid Turret'),
                                       'damageMultiplier', skill.getModifiedItemAttr('damageMultiplierBonus') * skill.level, **kwargs)
 
 
@@ -4647,7 +4648,7 @@ class Effect1588(BaseEffect):
     @staticmethod
     def handler(fit, container, context, **kwargs):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('XL Torpedoes'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('XL Torpedoes'),
                                         'kineticDamage', container.getModifiedItemAttr('damageMultiplierBonus') * level, **kwargs)
 
 
@@ -4667,7 +4668,7 @@ class Effect1590(BaseEffect):
     def handler(fit, container, context, **kwargs):
         level = container.level if 'skill' in context else 1
         penalize = False if 'skill' in context or 'implant' in context else True
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Missile Launcher Operation'),
                                         'aoeVelocity', container.getModifiedItemAttr('aoeVelocityBonus') * level,
                                         stackingPenalties=penalize, **kwargs)
 
@@ -4686,7 +4687,7 @@ class Effect1592(BaseEffect):
     @staticmethod
     def handler(fit, container, context, **kwargs):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('XL Torpedoes'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('XL Torpedoes'),
                                         'emDamage', container.getModifiedItemAttr('damageMultiplierBonus') * level, **kwargs)
 
 
@@ -4704,7 +4705,7 @@ class Effect1593(BaseEffect):
     @staticmethod
     def handler(fit, container, context, **kwargs):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('XL Torpedoes'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('XL Torpedoes'),
                                         'explosiveDamage', container.getModifiedItemAttr('damageMultiplierBonus') * level, **kwargs)
 
 
@@ -4722,7 +4723,7 @@ class Effect1594(BaseEffect):
     @staticmethod
     def handler(fit, container, context, **kwargs):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('XL Torpedoes'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('XL Torpedoes'),
                                         'thermalDamage', container.getModifiedItemAttr('damageMultiplierBonus') * level, **kwargs)
 
 
@@ -4740,7 +4741,7 @@ class Effect1595(BaseEffect):
     @staticmethod
     def handler(fit, src, context, **kwargs):
         mod = src.level if 'skill' in context else 1
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Missile Launcher Operation'),
                                         'emDamage', src.getModifiedItemAttr('damageMultiplierBonus') * mod, **kwargs)
 
 
@@ -4758,7 +4759,7 @@ class Effect1596(BaseEffect):
     @staticmethod
     def handler(fit, src, context, **kwargs):
         mod = src.level if 'skill' in context else 1
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Missile Launcher Operation'),
                                         'explosiveDamage', src.getModifiedItemAttr('damageMultiplierBonus') * mod, **kwargs)
 
 
@@ -4776,7 +4777,7 @@ class Effect1597(BaseEffect):
     @staticmethod
     def handler(fit, src, context, **kwargs):
         mod = src.level if 'skill' in context else 1
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Missile Launcher Operation'),
                                         'kineticDamage', src.getModifiedItemAttr('damageMultiplierBonus') * mod, **kwargs)
 
 
@@ -4843,7 +4844,7 @@ class Effect1634(BaseEffect):
     @staticmethod
     def handler(fit, container, context, **kwargs):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Shield Operation'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Capital Shield Operation'),
                                       'capacitorNeed', container.getModifiedItemAttr('shieldBoostCapacitorBonus') * level, **kwargs)
 
 
@@ -4861,7 +4862,7 @@ class Effect1635(BaseEffect):
     @staticmethod
     def handler(fit, container, context, **kwargs):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Repair Systems'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Capital Repair Systems'),
                                       'duration', container.getModifiedItemAttr('durationSkillBonus') * level,
                                       stackingPenalties='skill' not in context, **kwargs)
 
@@ -4879,7 +4880,7 @@ class Effect1638(BaseEffect):
     @staticmethod
     def handler(fit, skill, context, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Gunnery') or mod.item.requiresSkill('Missile Launcher Operation'),
+            ItemSkillFilter('Gunnery', 'Missile Launcher Operation'),
             'power', skill.getModifiedItemAttr('powerNeedBonus') * skill.level, **kwargs)
 
 
@@ -4897,15 +4898,15 @@ class Effect1643(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Armored Command'), 'warfareBuff2Multiplier',
+        fit.modules.filteredChargeBoost(ItemSkillFilter('Armored Command'), 'warfareBuff2Multiplier',
                                         src.getModifiedItemAttr('mindlinkBonus'), **kwargs)
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Armored Command'), 'warfareBuff1Multiplier',
+        fit.modules.filteredChargeBoost(ItemSkillFilter('Armored Command'), 'warfareBuff1Multiplier',
                                         src.getModifiedItemAttr('mindlinkBonus'), **kwargs)
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Armored Command'), 'warfareBuff4Multiplier',
+        fit.modules.filteredChargeBoost(ItemSkillFilter('Armored Command'), 'warfareBuff4Multiplier',
                                         src.getModifiedItemAttr('mindlinkBonus'), **kwargs)
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Armored Command'), 'warfareBuff3Multiplier',
+        fit.modules.filteredChargeBoost(ItemSkillFilter('Armored Command'), 'warfareBuff3Multiplier',
                                         src.getModifiedItemAttr('mindlinkBonus'), **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Armored Command'), 'buffDuration',
+        fit.modules.filteredItemBoost(ItemSkillFilter('Armored Command'), 'buffDuration',
                                       src.getModifiedItemAttr('mindlinkBonus'), **kwargs)
 
 
@@ -4923,15 +4924,15 @@ class Effect1644(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Skirmish Command'), 'warfareBuff3Multiplier',
+        fit.modules.filteredChargeBoost(ItemSkillFilter('Skirmish Command'), 'warfareBuff3Multiplier',
                                         src.getModifiedItemAttr('mindlinkBonus'), **kwargs)
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Skirmish Command'), 'warfareBuff4Multiplier',
+        fit.modules.filteredChargeBoost(ItemSkillFilter('Skirmish Command'), 'warfareBuff4Multiplier',
                                         src.getModifiedItemAttr('mindlinkBonus'), **kwargs)
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Skirmish Command'), 'warfareBuff2Multiplier',
+        fit.modules.filteredChargeBoost(ItemSkillFilter('Skirmish Command'), 'warfareBuff2Multiplier',
                                         src.getModifiedItemAttr('mindlinkBonus'), **kwargs)
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Skirmish Command'), 'warfareBuff1Multiplier',
+        fit.modules.filteredChargeBoost(ItemSkillFilter('Skirmish Command'), 'warfareBuff1Multiplier',
                                         src.getModifiedItemAttr('mindlinkBonus'), **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Skirmish Command'), 'buffDuration',
+        fit.modules.filteredItemBoost(ItemSkillFilter('Skirmish Command'), 'buffDuration',
                                       src.getModifiedItemAttr('mindlinkBonus'), **kwargs)
 
 
@@ -4947,15 +4948,15 @@ class Effect1645(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Shield Command'), 'warfareBuff4Multiplier',
+        fit.modules.filteredChargeBoost(ItemSkillFilter('Shield Command'), 'warfareBuff4Multiplier',
                                         src.getModifiedItemAttr('mindlinkBonus'), **kwargs)
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Shield Command'), 'warfareBuff3Multiplier',
+        fit.modules.filteredChargeBoost(ItemSkillFilter('Shield Command'), 'warfareBuff3Multiplier',
                                         src.getModifiedItemAttr('mindlinkBonus'), **kwargs)
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Shield Command'), 'warfareBuff2Multiplier',
+        fit.modules.filteredChargeBoost(ItemSkillFilter('Shield Command'), 'warfareBuff2Multiplier',
                                         src.getModifiedItemAttr('mindlinkBonus'), **kwargs)
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Shield Command'), 'warfareBuff1Multiplier',
+        fit.modules.filteredChargeBoost(ItemSkillFilter('Shield Command'), 'warfareBuff1Multiplier',
                                         src.getModifiedItemAttr('mindlinkBonus'), **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Command'), 'buffDuration',
+        fit.modules.filteredItemBoost(ItemSkillFilter('Shield Command'), 'buffDuration',
                                       src.getModifiedItemAttr('mindlinkBonus'), **kwargs)
 
 
@@ -4973,15 +4974,15 @@ class Effect1646(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Information Command'), 'warfareBuff4Multiplier',
+        fit.modules.filteredChargeBoost(ItemSkillFilter('Information Command'), 'warfareBuff4Multiplier',
                                         src.getModifiedItemAttr('mindlinkBonus'), **kwargs)
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Information Command'), 'warfareBuff3Multiplier',
+        fit.modules.filteredChargeBoost(ItemSkillFilter('Information Command'), 'warfareBuff3Multiplier',
                                         src.getModifiedItemAttr('mindlinkBonus'), **kwargs)
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Information Command'), 'warfareBuff1Multiplier',
+        fit.modules.filteredChargeBoost(ItemSkillFilter('Information Command'), 'warfareBuff1Multiplier',
                                         src.getModifiedItemAttr('mindlinkBonus'), **kwargs)
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Information Command'), 'warfareBuff2Multiplier',
+        fit.modules.filteredChargeBoost(ItemSkillFilter('Information Command'), 'warfareBuff2Multiplier',
                                         src.getModifiedItemAttr('mindlinkBonus'), **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Information Command'), 'buffDuration',
+        fit.modules.filteredItemBoost(ItemSkillFilter('Information Command'), 'buffDuration',
                                       src.getModifiedItemAttr('mindlinkBonus'), **kwargs)
 
 
@@ -4998,7 +4999,7 @@ class Effect1650(BaseEffect):
     @staticmethod
     def handler(fit, skill, context, **kwargs):
         amount = -skill.getModifiedItemAttr('consumptionQuantityBonus')
-        fit.modules.filteredItemIncrease(lambda mod: mod.item.requiresSkill(skill),
+        fit.modules.filteredItemIncrease(ItemSkillFilter(skill),
                                          'consumptionQuantity', amount * skill.level, **kwargs)
 
 
@@ -5016,7 +5017,7 @@ class Effect1657(BaseEffect):
     @staticmethod
     def handler(fit, src, context, **kwargs):
         mod = src.level if 'skill' in context else 1
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Missile Launcher Operation'),
                                         'thermalDamage', src.getModifiedItemAttr('damageMultiplierBonus') * mod, **kwargs)
 
 
@@ -5154,7 +5155,7 @@ class Effect1720(BaseEffect):
     @staticmethod
     def handler(fit, module, context, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Shield Operation') or mod.item.requiresSkill('Capital Shield Operation'),
+            ItemSkillFilter('Shield Operation', 'Capital Shield Operation'),
             'shieldBonus', module.getModifiedItemAttr('shieldBoostMultiplier'),
             stackingPenalties=True, **kwargs)
 
@@ -5187,7 +5188,7 @@ class Effect1730(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context, **kwargs):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill(skill),
+        fit.drones.filteredItemBoost(ItemSkillFilter(skill),
                                      'damageMultiplier', skill.getModifiedItemAttr('damageMultiplierBonus') * skill.level, **kwargs)
 
 
@@ -5219,7 +5220,7 @@ class Effect1763(BaseEffect):
     @staticmethod
     def handler(fit, container, context, **kwargs):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Missile Launcher Operation'),
                                       'speed', container.getModifiedItemAttr('rofBonus') * level, **kwargs)
 
 
@@ -5239,7 +5240,7 @@ class Effect1764(BaseEffect):
     def handler(fit, container, context, **kwargs):
         level = container.level if 'skill' in context else 1
         penalized = False if 'skill' in context or 'implant' in context else True
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Missile Launcher Operation'),
                                         'maxVelocity', container.getModifiedItemAttr('speedFactor') * level,
                                         stackingPenalties=penalized, **kwargs)
 
@@ -5257,7 +5258,7 @@ class Effect1773(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Hybrid Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Small Hybrid Turret'),
                                       'falloff', ship.getModifiedItemAttr('shipBonusGF2'), skill='Gallente Frigate', **kwargs)
 
 
@@ -5481,15 +5482,15 @@ class Effect1848(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Mining Foreman'), 'warfareBuff4Multiplier',
+        fit.modules.filteredChargeBoost(ItemSkillFilter('Mining Foreman'), 'warfareBuff4Multiplier',
                                         src.getModifiedItemAttr('mindlinkBonus'), **kwargs)
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Mining Foreman'), 'warfareBuff2Multiplier',
+        fit.modules.filteredChargeBoost(ItemSkillFilter('Mining Foreman'), 'warfareBuff2Multiplier',
                                         src.getModifiedItemAttr('mindlinkBonus'), **kwargs)
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Mining Foreman'), 'warfareBuff1Multiplier',
+        fit.modules.filteredChargeBoost(ItemSkillFilter('Mining Foreman'), 'warfareBuff1Multiplier',
                                         src.getModifiedItemAttr('mindlinkBonus'), **kwargs)
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Mining Foreman'), 'warfareBuff3Multiplier',
+        fit.modules.filteredChargeBoost(ItemSkillFilter('Mining Foreman'), 'warfareBuff3Multiplier',
                                         src.getModifiedItemAttr('mindlinkBonus'), **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Mining Foreman'), 'buffDuration',
+        fit.modules.filteredItemBoost(ItemSkillFilter('Mining Foreman'), 'buffDuration',
                                       src.getModifiedItemAttr('mindlinkBonus'), **kwargs)
 
 
@@ -5507,7 +5508,7 @@ class Effect1851(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill(skill),
+        fit.modules.filteredItemBoost(ItemSkillFilter(skill),
                                       'speed', skill.getModifiedItemAttr('rofBonus') * skill.level, **kwargs)
 
 
@@ -5523,7 +5524,7 @@ class Effect1862(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Missile Launcher Operation'),
                                         'emDamage', ship.getModifiedItemAttr('shipBonusCF2'),
                                         skill='Caldari Frigate', **kwargs)
 
@@ -5540,7 +5541,7 @@ class Effect1863(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Missile Launcher Operation'),
                                         'thermalDamage', ship.getModifiedItemAttr('shipBonusCF2'),
                                         skill='Caldari Frigate', **kwargs)
 
@@ -5557,7 +5558,7 @@ class Effect1864(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Missile Launcher Operation'),
                                         'explosiveDamage', ship.getModifiedItemAttr('shipBonusCF2'),
                                         skill='Caldari Frigate', **kwargs)
 
@@ -5575,7 +5576,7 @@ class Effect1882(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Mining'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Mining'),
                                       'miningAmount', module.getModifiedItemAttr('miningAmountBonus'), **kwargs)
 
 
@@ -5592,7 +5593,7 @@ class Effect1885(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Missile Launcher Cruise',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Missile Launcher Cruise'),
                                       'speed', ship.getModifiedItemAttr('shipBonus2CB'),
                                       skill='Caldari Battleship', **kwargs)
 
@@ -5610,7 +5611,7 @@ class Effect1886(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Missile Launcher Torpedo',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Missile Launcher Torpedo'),
                                       'speed', ship.getModifiedItemAttr('shipBonus2CB'),
                                       skill='Caldari Battleship', **kwargs)
 
@@ -5627,7 +5628,7 @@ class Effect1896(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Ice Harvesting'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Ice Harvesting'),
                                       'duration', ship.getModifiedItemAttr('eliteBonusBarge2'),
                                       skill='Exhumers', **kwargs)
 
@@ -5645,7 +5646,7 @@ class Effect1910(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Nosferatu',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Energy Nosferatu'),
                                       'powerTransferAmount', ship.getModifiedItemAttr('eliteBonusReconShip2'),
                                       skill='Recon Ships', **kwargs)
 
@@ -5664,7 +5665,7 @@ class Effect1911(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'ECM',
+        fit.modules.filteredItemBoost(ItemGroupFilter('ECM'),
                                       'scanGravimetricStrengthBonus', ship.getModifiedItemAttr('eliteBonusReconShip2'),
                                       skill='Recon Ships', **kwargs)
 
@@ -5683,7 +5684,7 @@ class Effect1912(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'ECM',
+        fit.modules.filteredItemBoost(ItemGroupFilter('ECM'),
                                       'scanMagnetometricStrengthBonus', ship.getModifiedItemAttr('eliteBonusReconShip2'),
                                       skill='Recon Ships', **kwargs)
 
@@ -5702,7 +5703,7 @@ class Effect1913(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'ECM',
+        fit.modules.filteredItemBoost(ItemGroupFilter('ECM'),
                                       'scanRadarStrengthBonus', ship.getModifiedItemAttr('eliteBonusReconShip2'),
                                       skill='Recon Ships', **kwargs)
 
@@ -5721,7 +5722,7 @@ class Effect1914(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'ECM',
+        fit.modules.filteredItemBoost(ItemGroupFilter('ECM'),
                                       'scanLadarStrengthBonus', ship.getModifiedItemAttr('eliteBonusReconShip2'),
                                       skill='Recon Ships', **kwargs)
 
@@ -5741,7 +5742,7 @@ class Effect1921(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Stasis Web',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Stasis Web'),
                                       'maxRange', ship.getModifiedItemAttr('eliteBonusReconShip2'),
                                       skill='Recon Ships', **kwargs)
 
@@ -5760,7 +5761,7 @@ class Effect1922(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Warp Scrambler',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Warp Scrambler'),
                                       'maxRange', ship.getModifiedItemAttr('eliteBonusReconShip2'),
                                       skill='Recon Ships', **kwargs)
 
@@ -5792,7 +5793,7 @@ class Effect1964(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Emission Systems'), 'capacitorNeed',
+        fit.modules.filteredItemBoost(ItemSkillFilter('Shield Emission Systems'), 'capacitorNeed',
                                       src.getModifiedItemAttr('shipBonusCC'), skill='Caldari Cruiser', **kwargs)
 
 
@@ -5808,7 +5809,7 @@ class Effect1969(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Remote Armor Repair Systems'), 'capacitorNeed',
+        fit.modules.filteredItemBoost(ItemSkillFilter('Remote Armor Repair Systems'), 'capacitorNeed',
                                       src.getModifiedItemAttr('shipBonusGC'), skill='Gallente Cruiser', **kwargs)
 
 
@@ -5825,7 +5826,7 @@ class Effect1996(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'ECM',
+        fit.modules.filteredItemBoost(ItemGroupFilter('ECM'),
                                       'capacitorNeed', ship.getModifiedItemAttr('shipBonusCF2'),
                                       skill='Caldari Frigate', **kwargs)
 
@@ -5858,7 +5859,7 @@ class Effect2008(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Cynosural Field Generator',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Cynosural Field Generator'),
                                       'duration', ship.getModifiedItemAttr('durationBonus'), **kwargs)
 
 
@@ -5878,7 +5879,7 @@ class Effect2013(BaseEffect):
     def handler(fit, container, context, **kwargs):
         level = container.level if 'skill' in context else 1
         penalties = False if 'implant' in context else True
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+        fit.drones.filteredItemBoost(ItemSkillFilter('Drones'),
                                      'maxVelocity', container.getModifiedItemAttr('droneMaxVelocityBonus') * level,
                                      stackingPenalties=penalties, **kwargs)
 
@@ -5897,7 +5898,7 @@ class Effect2014(BaseEffect):
     def handler(fit, container, context, **kwargs):
         level = container.level if 'skill' in context else 1
         penalized = False if 'skill' in context else True
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+        fit.drones.filteredItemBoost(ItemSkillFilter('Drones'),
                                      'maxRange',
                                      container.getModifiedItemAttr('rangeSkillBonus') * level,
                                      stackingPenalties=penalized, **kwargs)
@@ -5915,7 +5916,7 @@ class Effect2015(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, **kwargs):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+        fit.drones.filteredItemBoost(ItemSkillFilter('Drones'),
                                      'shieldCapacity', module.getModifiedItemAttr('hullHpBonus'), **kwargs)
 
 
@@ -5931,7 +5932,7 @@ class Effect2016(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, **kwargs):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+        fit.drones.filteredItemBoost(ItemSkillFilter('Drones'),
                                      'armorHP', module.getModifiedItemAttr('hullHpBonus'), **kwargs)
 
 
@@ -5948,7 +5949,7 @@ class Effect2017(BaseEffect):
     @staticmethod
     def handler(fit, container, context, **kwargs):
         level = container.level if 'skill' in context else 1
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+        fit.drones.filteredItemBoost(ItemSkillFilter('Drones'),
                                      'hp', container.getModifiedItemAttr('hullHpBonus') * level, **kwargs)
 
 
@@ -5967,7 +5968,7 @@ class Effect2019(BaseEffect):
     def handler(fit, container, context, **kwargs):
         level = container.level if 'skill' in context else 1
         penalized = False if 'skill' in context else True
-        fit.drones.filteredItemBoost(lambda drone: drone.item.group.name == 'Logistic Drone',
+        fit.drones.filteredItemBoost(ItemGroupFilter('Logistic Drone'),
                                      'shieldBonus', container.getModifiedItemAttr('damageHP') * level,
                                      stackingPenalties=penalized, **kwargs)
 
@@ -5987,7 +5988,7 @@ class Effect2020(BaseEffect):
     def handler(fit, container, context, **kwargs):
         level = container.level if 'skill' in context else 1
         penalized = False if 'skill' in context else True
-        fit.drones.filteredItemBoost(lambda drone: drone.item.group.name == 'Logistic Drone',
+        fit.drones.filteredItemBoost(ItemGroupFilter('Logistic Drone'),
                                      'armorDamageAmount', container.getModifiedItemAttr('damageHP') * level,
                                      stackingPenalties=penalized, **kwargs)
 
@@ -6057,7 +6058,7 @@ class Effect2053(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Shield Resistance Amplifier',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Shield Resistance Amplifier'),
                                       'emDamageResistanceBonus', skill.getModifiedItemAttr('hardeningBonus') * skill.level, **kwargs)
 
 
@@ -6073,7 +6074,7 @@ class Effect2054(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Shield Resistance Amplifier',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Shield Resistance Amplifier'),
                                       'explosiveDamageResistanceBonus',
                                       skill.getModifiedItemAttr('hardeningBonus') * skill.level, **kwargs)
 
@@ -6090,7 +6091,7 @@ class Effect2055(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Shield Resistance Amplifier',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Shield Resistance Amplifier'),
                                       'kineticDamageResistanceBonus',
                                       skill.getModifiedItemAttr('hardeningBonus') * skill.level, **kwargs)
 
@@ -6107,7 +6108,7 @@ class Effect2056(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Shield Resistance Amplifier',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Shield Resistance Amplifier'),
                                       'thermalDamageResistanceBonus',
                                       skill.getModifiedItemAttr('hardeningBonus') * skill.level, **kwargs)
 
@@ -6124,7 +6125,7 @@ class Effect2105(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Armor Coating',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Armor Coating'),
                                       'emDamageResistanceBonus', skill.getModifiedItemAttr('hardeningBonus') * skill.level, **kwargs)
 
 
@@ -6140,7 +6141,7 @@ class Effect2106(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Armor Coating',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Armor Coating'),
                                       'explosiveDamageResistanceBonus',
                                       skill.getModifiedItemAttr('hardeningBonus') * skill.level, **kwargs)
 
@@ -6157,7 +6158,7 @@ class Effect2107(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Armor Coating',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Armor Coating'),
                                       'kineticDamageResistanceBonus',
                                       skill.getModifiedItemAttr('hardeningBonus') * skill.level, **kwargs)
 
@@ -6174,7 +6175,7 @@ class Effect2108(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Armor Coating',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Armor Coating'),
                                       'thermalDamageResistanceBonus',
                                       skill.getModifiedItemAttr('hardeningBonus') * skill.level, **kwargs)
 
@@ -6191,7 +6192,7 @@ class Effect2109(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Armor Plating Energized',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Armor Plating Energized'),
                                       'emDamageResistanceBonus', skill.getModifiedItemAttr('hardeningBonus') * skill.level, **kwargs)
 
 
@@ -6207,7 +6208,7 @@ class Effect2110(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Armor Plating Energized',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Armor Plating Energized'),
                                       'explosiveDamageResistanceBonus',
                                       skill.getModifiedItemAttr('hardeningBonus') * skill.level, **kwargs)
 
@@ -6224,7 +6225,7 @@ class Effect2111(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Armor Plating Energized',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Armor Plating Energized'),
                                       'kineticDamageResistanceBonus',
                                       skill.getModifiedItemAttr('hardeningBonus') * skill.level, **kwargs)
 
@@ -6241,7 +6242,7 @@ class Effect2112(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Armor Plating Energized',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Armor Plating Energized'),
                                       'thermalDamageResistanceBonus',
                                       skill.getModifiedItemAttr('hardeningBonus') * skill.level, **kwargs)
 
@@ -6259,7 +6260,7 @@ class Effect2130(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Hybrid Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Small Hybrid Turret'),
                                       'maxRange', ship.getModifiedItemAttr('maxRangeBonus'), **kwargs)
 
 
@@ -6277,7 +6278,7 @@ class Effect2131(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Energy Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Small Energy Turret'),
                                       'maxRange', ship.getModifiedItemAttr('maxRangeBonus'), **kwargs)
 
 
@@ -6293,7 +6294,7 @@ class Effect2132(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Projectile Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Small Projectile Turret'),
                                       'maxRange', ship.getModifiedItemAttr('maxRangeBonus'), **kwargs)
 
 
@@ -6310,7 +6311,7 @@ class Effect2133(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Remote Capacitor Transmitter',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Remote Capacitor Transmitter'),
                                       'maxRange', ship.getModifiedItemAttr('maxRangeBonus2'), **kwargs)
 
 
@@ -6329,9 +6330,9 @@ class Effect2134(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Remote Shield Booster', 'maxRange',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Remote Shield Booster'), 'maxRange',
                                       ship.getModifiedItemAttr('maxRangeBonus'), **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Ancillary Remote Shield Booster', 'maxRange',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Ancillary Remote Shield Booster'), 'maxRange',
                                       ship.getModifiedItemAttr('maxRangeBonus'), **kwargs)
 
 
@@ -6351,9 +6352,9 @@ class Effect2135(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Remote Armor Repairer', 'maxRange',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Remote Armor Repairer'), 'maxRange',
                                       src.getModifiedItemAttr('maxRangeBonus'), **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Ancillary Remote Armor Repairer', 'maxRange',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Ancillary Remote Armor Repairer'), 'maxRange',
                                       src.getModifiedItemAttr('maxRangeBonus'), **kwargs)
 
 
@@ -6369,7 +6370,7 @@ class Effect2143(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Target Painter',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Target Painter'),
                                       'signatureRadiusBonus', ship.getModifiedItemAttr('shipBonusMC2'),
                                       skill='Minmatar Cruiser', **kwargs)
 
@@ -6402,7 +6403,7 @@ class Effect2155(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Projectile Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Medium Projectile Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('eliteBonusCommandShips1'),
                                       skill='Command Ships', **kwargs)
 
@@ -6419,7 +6420,7 @@ class Effect2156(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Projectile Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Medium Projectile Turret'),
                                       'falloff', ship.getModifiedItemAttr('eliteBonusCommandShips2'),
                                       skill='Command Ships', **kwargs)
 
@@ -6436,7 +6437,7 @@ class Effect2157(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Energy Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Medium Energy Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('eliteBonusCommandShips1'),
                                       skill='Command Ships', **kwargs)
 
@@ -6453,7 +6454,7 @@ class Effect2158(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Energy Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Medium Energy Turret'),
                                       'speed', ship.getModifiedItemAttr('eliteBonusCommandShips2'),
                                       skill='Command Ships', **kwargs)
 
@@ -6470,7 +6471,7 @@ class Effect2160(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Hybrid Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Medium Hybrid Turret'),
                                       'falloff', ship.getModifiedItemAttr('eliteBonusCommandShips2'),
                                       skill='Command Ships', **kwargs)
 
@@ -6487,7 +6488,7 @@ class Effect2161(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Hybrid Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Medium Hybrid Turret'),
                                       'maxRange', ship.getModifiedItemAttr('eliteBonusCommandShips1'),
                                       skill='Command Ships', **kwargs)
 
@@ -6507,7 +6508,7 @@ class Effect2179(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, **kwargs):
         for type in ('shieldCapacity', 'armorHP', 'hp'):
-            fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+            fit.drones.filteredItemBoost(ItemSkillFilter('Drones'),
                                          type, ship.getModifiedItemAttr('shipBonusGC2'),
                                          skill='Gallente Cruiser', **kwargs)
 
@@ -6525,7 +6526,7 @@ class Effect2181(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, **kwargs):
         for type in ('shieldCapacity', 'armorHP', 'hp'):
-            fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+            fit.drones.filteredItemBoost(ItemSkillFilter('Drones'),
                                          type, ship.getModifiedItemAttr('shipBonusAC2'),
                                          skill='Amarr Cruiser', **kwargs)
 
@@ -6544,7 +6545,7 @@ class Effect2186(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, **kwargs):
         for type in ('shieldCapacity', 'armorHP', 'hp'):
-            fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+            fit.drones.filteredItemBoost(ItemSkillFilter('Drones'),
                                          type, ship.getModifiedItemAttr('shipBonusGB2'),
                                          skill='Gallente Battleship', **kwargs)
 
@@ -6562,7 +6563,7 @@ class Effect2187(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+        fit.drones.filteredItemBoost(ItemSkillFilter('Drones'),
                                      'damageMultiplier', ship.getModifiedItemAttr('shipBonusGB2'),
                                      skill='Gallente Battleship', **kwargs)
 
@@ -6581,7 +6582,7 @@ class Effect2188(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+        fit.drones.filteredItemBoost(ItemSkillFilter('Drones'),
                                      'damageMultiplier', ship.getModifiedItemAttr('shipBonusGC2'),
                                      skill='Gallente Cruiser', **kwargs)
 
@@ -6598,7 +6599,7 @@ class Effect2189(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+        fit.drones.filteredItemBoost(ItemSkillFilter('Drones'),
                                      'damageMultiplier', ship.getModifiedItemAttr('shipBonusAC2'),
                                      skill='Amarr Cruiser', **kwargs)
 
@@ -6616,7 +6617,7 @@ class Effect2200(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, **kwargs):
         fit.modules.filteredChargeBoost(
-            lambda mod: mod.charge.requiresSkill('Light Missiles') or mod.charge.requiresSkill('Rockets'),
+            ChargeSkillFilter('Light Missiles', 'Rockets'),
             'kineticDamage', ship.getModifiedItemAttr('eliteBonusInterdictors1'), skill='Interdictors', **kwargs)
 
 
@@ -6632,7 +6633,7 @@ class Effect2201(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Projectile Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Small Projectile Turret'),
                                       'falloff', ship.getModifiedItemAttr('eliteBonusInterdictors1'),
                                       skill='Interdictors', **kwargs)
 
@@ -6652,7 +6653,7 @@ class Effect2215(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Projectile Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Small Projectile Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('shipBonusRole7'), **kwargs)
 
 
@@ -6686,7 +6687,7 @@ class Effect2249(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+        fit.drones.filteredItemBoost(ItemSkillFilter('Drones'),
                                      'miningAmount', ship.getModifiedItemAttr('shipBonusAC2'),
                                      skill='Amarr Cruiser', **kwargs)
 
@@ -6703,7 +6704,7 @@ class Effect2250(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Mining Drone Operation'),
+        fit.drones.filteredItemBoost(ItemSkillFilter('Mining Drone Operation'),
                                      'miningAmount', ship.getModifiedItemAttr('shipBonusGC2'),
                                      skill='Gallente Cruiser', **kwargs)
 
@@ -6722,9 +6723,9 @@ class Effect2251(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemIncrease(lambda mod: mod.item.requiresSkill('Leadership'), 'maxGroupOnline',
+        fit.modules.filteredItemIncrease(ItemSkillFilter('Leadership'), 'maxGroupOnline',
                                          src.getModifiedItemAttr('maxGangModules'), **kwargs)
-        fit.modules.filteredItemIncrease(lambda mod: mod.item.requiresSkill('Leadership'), 'maxGroupActive',
+        fit.modules.filteredItemIncrease(ItemSkillFilter('Leadership'), 'maxGroupActive',
                                          src.getModifiedItemAttr('maxGangModules'), **kwargs)
 
 
@@ -6749,7 +6750,7 @@ class Effect2252(BaseEffect):
 
     @staticmethod
     def handler(fit, container, context, **kwargs):
-        fit.modules.filteredItemForce(lambda mod: mod.item.requiresSkill('Cloaking'),
+        fit.modules.filteredItemForce(ItemSkillFilter('Cloaking'),
                                       'moduleReactivationDelay',
                                       container.getModifiedItemAttr('covertOpsAndReconOpsCloakModuleDelay'), **kwargs)
 
@@ -6772,7 +6773,7 @@ class Effect2253(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemForce(lambda mod: mod.item.group.name == 'Cloaking Device',
+        fit.modules.filteredItemForce(ItemGroupFilter('Cloaking Device'),
                                       'cloakingTargetingDelay',
                                       ship.getModifiedItemAttr('covertOpsStealthBomberTargettingDelay'), **kwargs)
 
@@ -6842,7 +6843,7 @@ class Effect2305(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Neutralizer',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Energy Neutralizer'),
                                       'energyNeutralizerAmount', ship.getModifiedItemAttr('eliteBonusReconShip2'),
                                       skill='Recon Ships', **kwargs)
 
@@ -6861,7 +6862,7 @@ class Effect2354(BaseEffect):
     @staticmethod
     def handler(fit, container, context, **kwargs):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Remote Armor Repair Systems'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Capital Remote Armor Repair Systems'),
                                       'capacitorNeed', container.getModifiedItemAttr('capNeedBonus') * level, **kwargs)
 
 
@@ -6878,7 +6879,7 @@ class Effect2355(BaseEffect):
     @staticmethod
     def handler(fit, container, context, **kwargs):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Shield Emission Systems'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Capital Shield Emission Systems'),
                                       'capacitorNeed', container.getModifiedItemAttr('capNeedBonus') * level, **kwargs)
 
 
@@ -6894,7 +6895,7 @@ class Effect2356(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Capacitor Emission Systems'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Capital Capacitor Emission Systems'),
                                       'capacitorNeed', skill.getModifiedItemAttr('capNeedBonus') * skill.level, **kwargs)
 
 
@@ -6969,7 +6970,7 @@ class Effect2444(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Mining'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Mining'),
                                       'cpu', module.getModifiedItemAttr('cpuPenaltyPercent'), **kwargs)
 
 
@@ -6985,7 +6986,7 @@ class Effect2445(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Ice Harvesting'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Ice Harvesting'),
                                       'cpu', module.getModifiedItemAttr('cpuPenaltyPercent'), **kwargs)
 
 
@@ -7003,7 +7004,7 @@ class Effect2456(BaseEffect):
     @staticmethod
     def handler(fit, container, context, **kwargs):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Mining Upgrades'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Mining Upgrades'),
                                       'cpuPenaltyPercent',
                                       container.getModifiedItemAttr('miningUpgradeCPUReductionBonus') * level, **kwargs)
 
@@ -7039,7 +7040,7 @@ class Effect2479(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Ice Harvesting'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Ice Harvesting'),
                                       'duration', module.getModifiedItemAttr('iceHarvestCycleBonus'), **kwargs)
 
 
@@ -7088,7 +7089,7 @@ class Effect2489(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Remote Tracking Computer',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Remote Tracking Computer'),
                                       'falloffEffectiveness', ship.getModifiedItemAttr('shipBonusMC'),
                                       skill='Minmatar Cruiser', **kwargs)
 
@@ -7105,7 +7106,7 @@ class Effect2490(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Remote Tracking Computer',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Remote Tracking Computer'),
                                       'falloffEffectiveness', ship.getModifiedItemAttr('shipBonusGC2'),
                                       skill='Gallente Cruiser', **kwargs)
 
@@ -7124,7 +7125,7 @@ class Effect2491(BaseEffect):
     @staticmethod
     def handler(fit, container, context, **kwargs):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Burst Jammer',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Burst Jammer'),
                                       'ecmBurstRange', container.getModifiedItemAttr('rangeSkillBonus') * level,
                                       stackingPenalties=False if 'skill' in context else True, **kwargs)
 
@@ -7144,7 +7145,7 @@ class Effect2492(BaseEffect):
     @staticmethod
     def handler(fit, container, context, **kwargs):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Burst Jammer',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Burst Jammer'),
                                       'capacitorNeed', container.getModifiedItemAttr('capNeedBonus') * level, **kwargs)
 
 
@@ -7161,7 +7162,7 @@ class Effect2503(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Hybrid Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Large Hybrid Turret'),
                                       'trackingSpeed', ship.getModifiedItemAttr('shipBonusGB2'),
                                       skill='Gallente Battleship', **kwargs)
 
@@ -7181,7 +7182,7 @@ class Effect2504(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Hybrid Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Small Hybrid Turret'),
                                       'trackingSpeed', ship.getModifiedItemAttr('shipBonusGF2'),
                                       skill='Gallente Frigate', **kwargs)
 
@@ -7198,7 +7199,7 @@ class Effect2561(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Missile Launcher Operation'),
                                         'maxVelocity', ship.getModifiedItemAttr('eliteBonusGunship1'),
                                         skill='Assault Frigates', **kwargs)
 
@@ -7307,7 +7308,7 @@ class Effect2611(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Projectile Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Small Projectile Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('eliteBonusGunship1'),
                                       skill='Assault Frigates', **kwargs)
 
@@ -7373,7 +7374,7 @@ class Effect2647(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Missile Launcher Heavy',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Missile Launcher Heavy'),
                                       'speed', ship.getModifiedItemAttr('eliteBonusHeavyGunship2'),
                                       skill='Heavy Assault Cruisers', **kwargs)
 
@@ -7390,7 +7391,7 @@ class Effect2648(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Missile Launcher Heavy Assault',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Missile Launcher Heavy Assault'),
                                       'speed', ship.getModifiedItemAttr('eliteBonusHeavyGunship2'),
                                       skill='Heavy Assault Cruisers', **kwargs)
 
@@ -7407,7 +7408,7 @@ class Effect2649(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Missile Launcher Rapid Light',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Missile Launcher Rapid Light'),
                                       'speed', ship.getModifiedItemAttr('eliteBonusHeavyGunship2'),
                                       skill='Heavy Assault Cruisers', **kwargs)
 
@@ -7448,7 +7449,7 @@ class Effect2688(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Weapon',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Energy Weapon'),
                                       'capacitorNeed', module.getModifiedItemAttr('capNeedBonus'), **kwargs)
 
 
@@ -7464,7 +7465,7 @@ class Effect2689(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Hybrid Weapon',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Hybrid Weapon'),
                                       'capacitorNeed', module.getModifiedItemAttr('capNeedBonus'), **kwargs)
 
 
@@ -7480,7 +7481,7 @@ class Effect2690(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Weapon',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Energy Weapon'),
                                       'cpu', module.getModifiedItemAttr('cpuNeedBonus'), **kwargs)
 
 
@@ -7496,7 +7497,7 @@ class Effect2691(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Hybrid Weapon',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Hybrid Weapon'),
                                       'cpu', module.getModifiedItemAttr('cpuNeedBonus'), **kwargs)
 
 
@@ -7512,7 +7513,7 @@ class Effect2693(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Weapon',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Energy Weapon'),
                                       'falloff', module.getModifiedItemAttr('falloffBonus'),
                                       stackingPenalties=True, **kwargs)
 
@@ -7529,7 +7530,7 @@ class Effect2694(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Hybrid Weapon',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Hybrid Weapon'),
                                       'falloff', module.getModifiedItemAttr('falloffBonus'),
                                       stackingPenalties=True, **kwargs)
 
@@ -7546,7 +7547,7 @@ class Effect2695(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Projectile Weapon',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Projectile Weapon'),
                                       'falloff', module.getModifiedItemAttr('falloffBonus'),
                                       stackingPenalties=True, **kwargs)
 
@@ -7563,7 +7564,7 @@ class Effect2696(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Weapon',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Energy Weapon'),
                                       'maxRange', module.getModifiedItemAttr('maxRangeBonus'),
                                       stackingPenalties=True, **kwargs)
 
@@ -7580,7 +7581,7 @@ class Effect2697(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Hybrid Weapon',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Hybrid Weapon'),
                                       'maxRange', module.getModifiedItemAttr('maxRangeBonus'),
                                       stackingPenalties=True, **kwargs)
 
@@ -7597,7 +7598,7 @@ class Effect2698(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Projectile Weapon',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Projectile Weapon'),
                                       'maxRange', module.getModifiedItemAttr('maxRangeBonus'),
                                       stackingPenalties=True, **kwargs)
 
@@ -7614,7 +7615,7 @@ class Effect2706(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Weapon',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Energy Weapon'),
                                       'power', module.getModifiedItemAttr('drawback'), **kwargs)
 
 
@@ -7630,7 +7631,7 @@ class Effect2707(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Hybrid Weapon',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Hybrid Weapon'),
                                       'power', module.getModifiedItemAttr('drawback'), **kwargs)
 
 
@@ -7646,7 +7647,7 @@ class Effect2708(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Projectile Weapon',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Projectile Weapon'),
                                       'power', module.getModifiedItemAttr('drawback'), **kwargs)
 
 
@@ -7692,7 +7693,7 @@ class Effect2714(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Missile Launcher Operation'),
                                       'cpu', module.getModifiedItemAttr('drawback'), **kwargs)
 
 
@@ -7770,7 +7771,7 @@ class Effect2727(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context, **kwargs):
-        fit.modules.filteredItemIncrease(lambda mod: mod.item.group.name == 'Gas Cloud Harvester',
+        fit.modules.filteredItemIncrease(ItemGroupFilter('Gas Cloud Harvester'),
                                          'maxGroupActive', skill.level, **kwargs)
 
 
@@ -7787,7 +7788,7 @@ class Effect2734(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, **kwargs):
         for type in ('Gravimetric', 'Ladar', 'Radar', 'Magnetometric'):
-            fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'ECM',
+            fit.modules.filteredItemBoost(ItemGroupFilter('ECM'),
                                           'scan{0}StrengthBonus'.format(type),
                                           ship.getModifiedItemAttr('shipBonusCF'),
                                           skill='Caldari Frigate', **kwargs)
@@ -7826,7 +7827,7 @@ class Effect2736(BaseEffect):
 
     @classmethod
     def handler(cls, fit, booster, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name in ('Armor Repair Unit', 'Ancillary Armor Repairer'),
+        fit.modules.filteredItemBoost(ItemGroupFilter('Armor Repair Unit', 'Ancillary Armor Repairer'),
                                       'armorDamageAmount', booster.getModifiedItemAttr(cls.attr), **kwargs)
 
 
@@ -7863,7 +7864,7 @@ class Effect2739(BaseEffect):
 
     @classmethod
     def handler(cls, fit, booster, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Gunnery'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Gunnery'),
                                       'maxRange', booster.getModifiedItemAttr(cls.attr), **kwargs)
 
 
@@ -7882,7 +7883,7 @@ class Effect2741(BaseEffect):
 
     @classmethod
     def handler(cls, fit, booster, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Gunnery'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Gunnery'),
                                       'falloff', booster.getModifiedItemAttr(cls.attr), **kwargs)
 
 
@@ -7937,7 +7938,7 @@ class Effect2747(BaseEffect):
 
     @classmethod
     def handler(cls, fit, booster, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Gunnery'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Gunnery'),
                                       'trackingSpeed', booster.getModifiedItemAttr(cls.attr), **kwargs)
 
 
@@ -7956,7 +7957,7 @@ class Effect2748(BaseEffect):
 
     @classmethod
     def handler(cls, fit, booster, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Missile Launcher Operation'),
                                         'maxVelocity', booster.getModifiedItemAttr(cls.attr), **kwargs)
 
 
@@ -7974,7 +7975,7 @@ class Effect2749(BaseEffect):
 
     @classmethod
     def handler(cls, fit, booster, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Missile Launcher Operation'),
                                         'aoeVelocity', booster.getModifiedItemAttr(cls.attr), **kwargs)
 
 
@@ -7991,7 +7992,7 @@ class Effect2756(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, **kwargs):
         for type in ('Gravimetric', 'Magnetometric', 'Ladar', 'Radar'):
-            fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'ECM',
+            fit.modules.filteredItemBoost(ItemGroupFilter('ECM'),
                                           'scan{0}StrengthBonus'.format(type), ship.getModifiedItemAttr('shipBonusCC'),
                                           skill='Caldari Cruiser', **kwargs)
 
@@ -8130,7 +8131,7 @@ class Effect2791(BaseEffect):
 
     @classmethod
     def handler(cls, fit, booster, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Missile Launcher Operation'),
                                         'aoeCloudSize', booster.getModifiedItemAttr(cls.attr), **kwargs)
 
 
@@ -8165,7 +8166,7 @@ class Effect2794(BaseEffect):
 
     @staticmethod
     def handler(fit, container, context, **kwargs):
-        fit.modules.filteredItemIncrease(lambda mod: mod.item.requiresSkill('Salvaging'),
+        fit.modules.filteredItemIncrease(ItemSkillFilter('Salvaging'),
                                          'accessDifficultyBonus', container.getModifiedItemAttr('accessDifficultyBonus'),
                                          position='post', **kwargs)
 
@@ -8216,7 +8217,7 @@ class Effect2797(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, **kwargs):
-        fit.modules.filteredItemMultiply(lambda mod: mod.item.group.name == 'Projectile Weapon',
+        fit.modules.filteredItemMultiply(ItemGroupFilter('Projectile Weapon'),
                                          'speed', module.getModifiedItemAttr('speedMultiplier'),
                                          stackingPenalties=True, **kwargs)
 
@@ -8233,7 +8234,7 @@ class Effect2798(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, **kwargs):
-        fit.modules.filteredItemMultiply(lambda mod: mod.item.group.name == 'Projectile Weapon',
+        fit.modules.filteredItemMultiply(ItemGroupFilter('Projectile Weapon'),
                                          'damageMultiplier', module.getModifiedItemAttr('damageMultiplier'),
                                          stackingPenalties=True, **kwargs)
 
@@ -8250,7 +8251,7 @@ class Effect2799(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, **kwargs):
-        fit.modules.filteredItemMultiply(lambda mod: mod.item.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredItemMultiply(ItemSkillFilter('Missile Launcher Operation'),
                                          'speed', module.getModifiedItemAttr('speedMultiplier'),
                                          stackingPenalties=True, **kwargs)
 
@@ -8267,7 +8268,7 @@ class Effect2801(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, **kwargs):
-        fit.modules.filteredItemMultiply(lambda mod: mod.item.group.name == 'Energy Weapon',
+        fit.modules.filteredItemMultiply(ItemGroupFilter('Energy Weapon'),
                                          'speed', module.getModifiedItemAttr('speedMultiplier'),
                                          stackingPenalties=True, **kwargs)
 
@@ -8284,7 +8285,7 @@ class Effect2802(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, **kwargs):
-        fit.modules.filteredItemMultiply(lambda mod: mod.item.group.name == 'Hybrid Weapon',
+        fit.modules.filteredItemMultiply(ItemGroupFilter('Hybrid Weapon'),
                                          'damageMultiplier', module.getModifiedItemAttr('damageMultiplier'),
                                          stackingPenalties=True, **kwargs)
 
@@ -8301,7 +8302,7 @@ class Effect2803(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, **kwargs):
-        fit.modules.filteredItemMultiply(lambda mod: mod.item.group.name == 'Energy Weapon',
+        fit.modules.filteredItemMultiply(ItemGroupFilter('Energy Weapon'),
                                          'damageMultiplier', module.getModifiedItemAttr('damageMultiplier'),
                                          stackingPenalties=True, **kwargs)
 
@@ -8318,7 +8319,7 @@ class Effect2804(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, **kwargs):
-        fit.modules.filteredItemMultiply(lambda mod: mod.item.group.name == 'Hybrid Weapon',
+        fit.modules.filteredItemMultiply(ItemGroupFilter('Hybrid Weapon'),
                                          'speed', module.getModifiedItemAttr('speedMultiplier'),
                                          stackingPenalties=True, **kwargs)
 
@@ -8336,7 +8337,7 @@ class Effect2805(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Energy Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Large Energy Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('shipBonusAB2'),
                                       skill='Amarr Battleship', **kwargs)
 
@@ -8354,7 +8355,7 @@ class Effect2809(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Assault Missiles'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Heavy Assault Missiles'),
                                         'maxVelocity', ship.getModifiedItemAttr('shipBonusCC2'),
                                         skill='Caldari Cruiser', **kwargs)
 
@@ -8371,7 +8372,7 @@ class Effect2810(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Assault Missiles'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Heavy Assault Missiles'),
                                         'explosionDelay', ship.getModifiedItemAttr('eliteBonusHeavyGunship1'),
                                         skill='Heavy Assault Cruisers', **kwargs)
 
@@ -8388,7 +8389,7 @@ class Effect2812(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Burst Jammer',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Burst Jammer'),
                                       'ecmBurstRange', ship.getModifiedItemAttr('shipBonusCB3'),
                                       skill='Caldari Battleship', **kwargs)
 
@@ -8425,7 +8426,7 @@ class Effect2847(BaseEffect):
     @staticmethod
     def handler(fit, container, context, **kwargs):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Gunnery'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Gunnery'),
                                       'trackingSpeed', container.getModifiedItemAttr('trackingSpeedBonus') * level, **kwargs)
 
 
@@ -8443,7 +8444,7 @@ class Effect2848(BaseEffect):
 
     @staticmethod
     def handler(fit, container, context, **kwargs):
-        fit.modules.filteredItemIncrease(lambda module: module.item.requiresSkill('Archaeology'),
+        fit.modules.filteredItemIncrease(ItemSkillFilter('Archaeology'),
                                          'accessDifficultyBonus',
                                          container.getModifiedItemAttr('accessDifficultyBonusModifier'),
                                          position='post', **kwargs)
@@ -8464,7 +8465,7 @@ class Effect2849(BaseEffect):
 
     @staticmethod
     def handler(fit, container, context, **kwargs):
-        fit.modules.filteredItemIncrease(lambda c: c.item.requiresSkill('Hacking'),
+        fit.modules.filteredItemIncrease(ItemSkillFilter('Hacking'),
                                          'accessDifficultyBonus',
                                          container.getModifiedItemAttr('accessDifficultyBonusModifier'),
                                          position='post', **kwargs)
@@ -8482,7 +8483,7 @@ class Effect2850(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Propulsion Module',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Propulsion Module'),
                                       'duration', module.getModifiedItemAttr('durationBonus'), **kwargs)
 
 
@@ -8499,7 +8500,7 @@ class Effect2851(BaseEffect):
     @staticmethod
     def handler(fit, container, context, **kwargs):
         for dmgType in ('em', 'kinetic', 'explosive', 'thermal'):
-            fit.modules.filteredChargeMultiply(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+            fit.modules.filteredChargeMultiply(ChargeSkillFilter('Missile Launcher Operation'),
                                                '%sDamage' % dmgType,
                                                container.getModifiedItemAttr('missileDamageMultiplierBonus'),
                                                stackingPenalties=True, **kwargs)
@@ -8517,7 +8518,7 @@ class Effect2853(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda module: module.item.requiresSkill('Cloaking'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Cloaking'),
                                       'cloakingTargetingDelay', module.getModifiedItemAttr('cloakingTargetingDelayBonus'), **kwargs)
 
 
@@ -8601,7 +8602,7 @@ class Effect2867(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, **kwargs):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Sentry Drone Interfacing'),
+        fit.drones.filteredItemBoost(ItemSkillFilter('Sentry Drone Interfacing'),
                                      'damageMultiplier', module.getModifiedItemAttr('damageMultiplierBonus'),
                                      stackingPenalties=True, **kwargs)
 
@@ -8618,7 +8619,7 @@ class Effect2868(BaseEffect):
 
     @staticmethod
     def handler(fit, implant, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Repair Systems'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Capital Repair Systems'),
                                       'armorDamageAmount', implant.getModifiedItemAttr('repairBonus'),
                                       stackingPenalties=True, **kwargs)
 
@@ -8635,7 +8636,7 @@ class Effect2872(BaseEffect):
 
     @staticmethod
     def handler(fit, container, context, **kwargs):
-        fit.modules.filteredChargeMultiply(lambda mod: mod.charge.requiresSkill('Defender Missiles'),
+        fit.modules.filteredChargeMultiply(ChargeSkillFilter('Defender Missiles'),
                                            'maxVelocity', container.getModifiedItemAttr('missileVelocityBonus'), **kwargs)
 
 
@@ -8651,7 +8652,7 @@ class Effect2881(BaseEffect):
 
     @staticmethod
     def handler(fit, implant, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Cruise Missiles'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Cruise Missiles'),
                                         'emDamage', implant.getModifiedItemAttr('damageMultiplierBonus'), **kwargs)
 
 
@@ -8667,7 +8668,7 @@ class Effect2882(BaseEffect):
 
     @staticmethod
     def handler(fit, container, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Cruise Missiles'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Cruise Missiles'),
                                         'explosiveDamage', container.getModifiedItemAttr('damageMultiplierBonus'), **kwargs)
 
 
@@ -8683,7 +8684,7 @@ class Effect2883(BaseEffect):
 
     @staticmethod
     def handler(fit, container, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Cruise Missiles'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Cruise Missiles'),
                                         'kineticDamage', container.getModifiedItemAttr('damageMultiplierBonus'), **kwargs)
 
 
@@ -8699,7 +8700,7 @@ class Effect2884(BaseEffect):
 
     @staticmethod
     def handler(fit, container, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Cruise Missiles'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Cruise Missiles'),
                                         'thermalDamage', container.getModifiedItemAttr('damageMultiplierBonus'), **kwargs)
 
 
@@ -8715,7 +8716,7 @@ class Effect2885(BaseEffect):
 
     @staticmethod
     def handler(fit, implant, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Gas Cloud Harvesting'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Gas Cloud Harvesting'),
                                       'duration', implant.getModifiedItemAttr('durationBonus'), **kwargs)
 
 
@@ -8731,7 +8732,7 @@ class Effect2887(BaseEffect):
 
     @staticmethod
     def handler(fit, implant, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Rockets'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Rockets'),
                                         'emDamage', implant.getModifiedItemAttr('damageMultiplierBonus'), **kwargs)
 
 
@@ -8747,7 +8748,7 @@ class Effect2888(BaseEffect):
 
     @staticmethod
     def handler(fit, container, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Rockets'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Rockets'),
                                         'explosiveDamage', container.getModifiedItemAttr('damageMultiplierBonus'), **kwargs)
 
 
@@ -8763,7 +8764,7 @@ class Effect2889(BaseEffect):
 
     @staticmethod
     def handler(fit, container, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Rockets'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Rockets'),
                                         'kineticDamage', container.getModifiedItemAttr('damageMultiplierBonus'), **kwargs)
 
 
@@ -8779,7 +8780,7 @@ class Effect2890(BaseEffect):
 
     @staticmethod
     def handler(fit, container, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Rockets'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Rockets'),
                                         'thermalDamage', container.getModifiedItemAttr('damageMultiplierBonus'), **kwargs)
 
 
@@ -8795,7 +8796,7 @@ class Effect2891(BaseEffect):
 
     @staticmethod
     def handler(fit, implant, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Light Missiles'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Light Missiles'),
                                         'emDamage', implant.getModifiedItemAttr('damageMultiplierBonus'), **kwargs)
 
 
@@ -8811,7 +8812,7 @@ class Effect2892(BaseEffect):
 
     @staticmethod
     def handler(fit, container, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Light Missiles'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Light Missiles'),
                                         'explosiveDamage', container.getModifiedItemAttr('damageMultiplierBonus'), **kwargs)
 
 
@@ -8827,7 +8828,7 @@ class Effect2893(BaseEffect):
 
     @staticmethod
     def handler(fit, container, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Light Missiles'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Light Missiles'),
                                         'kineticDamage', container.getModifiedItemAttr('damageMultiplierBonus'), **kwargs)
 
 
@@ -8843,7 +8844,7 @@ class Effect2894(BaseEffect):
 
     @staticmethod
     def handler(fit, container, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Light Missiles'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Light Missiles'),
                                         'thermalDamage', container.getModifiedItemAttr('damageMultiplierBonus'), **kwargs)
 
 
@@ -8859,7 +8860,7 @@ class Effect2899(BaseEffect):
 
     @staticmethod
     def handler(fit, implant, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Heavy Missiles'),
                                         'emDamage', implant.getModifiedItemAttr('damageMultiplierBonus'), **kwargs)
 
 
@@ -8875,7 +8876,7 @@ class Effect2900(BaseEffect):
 
     @staticmethod
     def handler(fit, container, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Heavy Missiles'),
                                         'explosiveDamage', container.getModifiedItemAttr('damageMultiplierBonus'), **kwargs)
 
 
@@ -8891,7 +8892,7 @@ class Effect2901(BaseEffect):
 
     @staticmethod
     def handler(fit, container, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Heavy Missiles'),
                                         'kineticDamage', container.getModifiedItemAttr('damageMultiplierBonus'), **kwargs)
 
 
@@ -8907,7 +8908,7 @@ class Effect2902(BaseEffect):
 
     @staticmethod
     def handler(fit, container, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Heavy Missiles'),
                                         'thermalDamage', container.getModifiedItemAttr('damageMultiplierBonus'), **kwargs)
 
 
@@ -8923,7 +8924,7 @@ class Effect2903(BaseEffect):
 
     @staticmethod
     def handler(fit, implant, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Assault Missiles'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Heavy Assault Missiles'),
                                         'emDamage', implant.getModifiedItemAttr('damageMultiplierBonus'), **kwargs)
 
 
@@ -8939,7 +8940,7 @@ class Effect2904(BaseEffect):
 
     @staticmethod
     def handler(fit, container, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Assault Missiles'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Heavy Assault Missiles'),
                                         'explosiveDamage', container.getModifiedItemAttr('damageMultiplierBonus'), **kwargs)
 
 
@@ -8955,7 +8956,7 @@ class Effect2905(BaseEffect):
 
     @staticmethod
     def handler(fit, container, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Assault Missiles'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Heavy Assault Missiles'),
                                         'kineticDamage', container.getModifiedItemAttr('damageMultiplierBonus'), **kwargs)
 
 
@@ -8971,7 +8972,7 @@ class Effect2906(BaseEffect):
 
     @staticmethod
     def handler(fit, container, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Assault Missiles'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Heavy Assault Missiles'),
                                         'thermalDamage', container.getModifiedItemAttr('damageMultiplierBonus'), **kwargs)
 
 
@@ -8987,7 +8988,7 @@ class Effect2907(BaseEffect):
 
     @staticmethod
     def handler(fit, implant, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Torpedoes'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Torpedoes'),
                                         'emDamage', implant.getModifiedItemAttr('damageMultiplierBonus'), **kwargs)
 
 
@@ -9003,7 +9004,7 @@ class Effect2908(BaseEffect):
 
     @staticmethod
     def handler(fit, container, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Torpedoes'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Torpedoes'),
                                         'explosiveDamage', container.getModifiedItemAttr('damageMultiplierBonus'), **kwargs)
 
 
@@ -9019,7 +9020,7 @@ class Effect2909(BaseEffect):
 
     @staticmethod
     def handler(fit, container, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Torpedoes'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Torpedoes'),
                                         'kineticDamage', container.getModifiedItemAttr('damageMultiplierBonus'), **kwargs)
 
 
@@ -9035,7 +9036,7 @@ class Effect2910(BaseEffect):
 
     @staticmethod
     def handler(fit, container, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Torpedoes'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Torpedoes'),
                                         'thermalDamage', container.getModifiedItemAttr('damageMultiplierBonus'), **kwargs)
 
 
@@ -9051,7 +9052,7 @@ class Effect2911(BaseEffect):
 
     @staticmethod
     def handler(fit, implant, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Data Miners',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Data Miners'),
                                       'duration', implant.getModifiedItemAttr('durationBonus'), **kwargs)
 
 
@@ -9068,7 +9069,7 @@ class Effect2967(BaseEffect):
     @staticmethod
     def handler(fit, skill, context, **kwargs):
         amount = -skill.getModifiedItemAttr('consumptionQuantityBonus')
-        fit.modules.filteredItemIncrease(lambda mod: mod.item.requiresSkill(skill),
+        fit.modules.filteredItemIncrease(ItemSkillFilter(skill),
                                          'consumptionQuantity', amount * skill.level, **kwargs)
 
 
@@ -9084,7 +9085,7 @@ class Effect2979(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Remote Hull Repair Systems'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Remote Hull Repair Systems'),
                                       'capacitorNeed', skill.getModifiedItemAttr('capNeedBonus') * skill.level, **kwargs)
 
 
@@ -9100,7 +9101,7 @@ class Effect2980(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Remote Hull Repair Systems'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Capital Remote Hull Repair Systems'),
                                       'capacitorNeed', skill.getModifiedItemAttr('capNeedBonus') * skill.level, **kwargs)
 
 
@@ -9200,7 +9201,7 @@ class Effect3024(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Bomb Deployment'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Bomb Deployment'),
                                         'explosiveDamage', ship.getModifiedItemAttr('eliteBonusCovertOps1'),
                                         skill='Covert Ops', **kwargs)
 
@@ -9235,7 +9236,7 @@ class Effect3026(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Bomb Deployment'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Bomb Deployment'),
                                         'kineticDamage', ship.getModifiedItemAttr('eliteBonusCovertOps1'),
                                         skill='Covert Ops', **kwargs)
 
@@ -9253,7 +9254,7 @@ class Effect3027(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Bomb Deployment'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Bomb Deployment'),
                                         'thermalDamage', ship.getModifiedItemAttr('eliteBonusCovertOps1'),
                                         skill='Covert Ops', **kwargs)
 
@@ -9270,7 +9271,7 @@ class Effect3028(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Bomb Deployment'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Bomb Deployment'),
                                         'emDamage', ship.getModifiedItemAttr('eliteBonusCovertOps1'),
                                         skill='Covert Ops', **kwargs)
 
@@ -9373,7 +9374,7 @@ class Effect3036(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Missile Launcher Bomb',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Missile Launcher Bomb'),
                                       'moduleReactivationDelay', skill.getModifiedItemAttr('reactivationDelayBonus') * skill.level, **kwargs)
 
 
@@ -9419,7 +9420,7 @@ class Effect3061(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Operation'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Shield Operation'),
                                       'heatDamage', module.getModifiedItemAttr('heatDamageBonus'), **kwargs)
 
 
@@ -9435,7 +9436,7 @@ class Effect3169(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Emission Systems'), 'cpu',
+        fit.modules.filteredItemBoost(ItemSkillFilter('Shield Emission Systems'), 'cpu',
                                       src.getModifiedItemAttr('shieldTransportCpuNeedBonus'), **kwargs)
 
 
@@ -9455,7 +9456,7 @@ class Effect3172(BaseEffect):
     def handler(fit, ship, context, **kwargs):
         # This is actually level-less bonus, anyway you have to train cruisers 5
         # and will get 100% (20%/lvl as stated by description)
-        fit.drones.filteredItemBoost(lambda drone: drone.item.group.name == 'Logistic Drone',
+        fit.drones.filteredItemBoost(ItemGroupFilter('Logistic Drone'),
                                      'armorDamageAmount', ship.getModifiedItemAttr('droneArmorDamageAmountBonus'), **kwargs)
 
 
@@ -9475,7 +9476,7 @@ class Effect3173(BaseEffect):
     def handler(fit, ship, context, **kwargs):
         # This is actually level-less bonus, anyway you have to train cruisers 5
         # and will get 100% (20%/lvl as stated by description)
-        fit.drones.filteredItemBoost(lambda drone: drone.item.group.name == 'Logistic Drone',
+        fit.drones.filteredItemBoost(ItemGroupFilter('Logistic Drone'),
                                      'shieldBonus', ship.getModifiedItemAttr('droneShieldBonusBonus'), **kwargs)
 
 
@@ -9597,7 +9598,7 @@ class Effect3212(BaseEffect):
     @staticmethod
     def handler(fit, container, context, **kwargs):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('FoF Missiles'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('FoF Missiles'),
                                         'aoeCloudSize', container.getModifiedItemAttr('aoeCloudSizeBonus') * level, **kwargs)
 
 
@@ -9614,7 +9615,7 @@ class Effect3234(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Rockets'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Rockets'),
                                         'explosiveDamage', ship.getModifiedItemAttr('shipBonusAF'),
                                         skill='Amarr Frigate', **kwargs)
 
@@ -9632,7 +9633,7 @@ class Effect3235(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Rockets'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Rockets'),
                                         'kineticDamage', ship.getModifiedItemAttr('shipBonusAF'),
                                         skill='Amarr Frigate', **kwargs)
 
@@ -9650,7 +9651,7 @@ class Effect3236(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Rockets'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Rockets'),
                                         'thermalDamage', ship.getModifiedItemAttr('shipBonusAF'),
                                         skill='Amarr Frigate', **kwargs)
 
@@ -9668,7 +9669,7 @@ class Effect3237(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Rockets'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Rockets'),
                                         'emDamage', ship.getModifiedItemAttr('shipBonusAF'),
                                         skill='Amarr Frigate', **kwargs)
 
@@ -9766,7 +9767,7 @@ class Effect3264(BaseEffect):
     @staticmethod
     def handler(fit, skill, context, **kwargs):
         amount = -skill.getModifiedItemAttr('consumptionQuantityBonus')
-        fit.modules.filteredItemIncrease(lambda mod: mod.item.requiresSkill(skill),
+        fit.modules.filteredItemIncrease(ItemSkillFilter(skill),
                                          'consumptionQuantity', amount * skill.level, **kwargs)
 
 
@@ -9782,7 +9783,7 @@ class Effect3267(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Industrial Reconfiguration'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Industrial Reconfiguration'),
                                       'consumptionQuantity', ship.getModifiedItemAttr('shipBonusORECapital1'),
                                       skill='Capital Industrial Ships', **kwargs)
 
@@ -9799,7 +9800,7 @@ class Effect3297(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Neutralizer',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Energy Neutralizer'),
                                       'energyNeutralizerAmount', ship.getModifiedItemAttr('shipBonusAB'),
                                       skill='Amarr Battleship', **kwargs)
 
@@ -9817,7 +9818,7 @@ class Effect3298(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Neutralizer',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Energy Neutralizer'),
                                       'energyNeutralizerAmount', ship.getModifiedItemAttr('shipBonusAC'),
                                       skill='Amarr Cruiser', **kwargs)
 
@@ -9836,7 +9837,7 @@ class Effect3299(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Neutralizer',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Energy Neutralizer'),
                                       'energyNeutralizerAmount', ship.getModifiedItemAttr('shipBonusAF'),
                                       skill='Amarr Frigate', **kwargs)
 
@@ -9946,7 +9947,7 @@ class Effect3343(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Projectile Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Medium Projectile Turret'),
                                       'falloff', ship.getModifiedItemAttr('eliteBonusHeavyInterdictors1'),
                                       skill='Heavy Interdiction Cruisers', **kwargs)
 
@@ -9963,7 +9964,7 @@ class Effect3355(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Heavy Missiles'),
                                         'maxVelocity', ship.getModifiedItemAttr('eliteBonusHeavyInterdictors1'),
                                         skill='Heavy Interdiction Cruisers', **kwargs)
 
@@ -9980,7 +9981,7 @@ class Effect3356(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Assault Missiles'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Heavy Assault Missiles'),
                                         'maxVelocity', ship.getModifiedItemAttr('eliteBonusHeavyInterdictors1'),
                                         skill='Heavy Interdiction Cruisers', **kwargs)
 
@@ -9997,7 +9998,7 @@ class Effect3357(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Light Missiles'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Light Missiles'),
                                         'maxVelocity', ship.getModifiedItemAttr('eliteBonusHeavyInterdictors1'),
                                         skill='Heavy Interdiction Cruisers', **kwargs)
 
@@ -10015,7 +10016,7 @@ class Effect3366(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Sensor Dampener',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Sensor Dampener'),
                                       'capacitorNeed', ship.getModifiedItemAttr('shipBonusGF'), skill='Gallente Frigate', **kwargs)
 
 
@@ -10031,7 +10032,7 @@ class Effect3367(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Warp Scrambler',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Warp Scrambler'),
                                       'maxRange', ship.getModifiedItemAttr('eliteBonusElectronicAttackShip1'),
                                       skill='Electronic Attack Ships', **kwargs)
 
@@ -10048,7 +10049,7 @@ class Effect3369(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'ECM',
+        fit.modules.filteredItemBoost(ItemGroupFilter('ECM'),
                                       'maxRange', ship.getModifiedItemAttr('eliteBonusElectronicAttackShip1'),
                                       skill='Electronic Attack Ships', **kwargs)
 
@@ -10065,7 +10066,7 @@ class Effect3370(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Stasis Web',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Stasis Web'),
                                       'maxRange', ship.getModifiedItemAttr('eliteBonusElectronicAttackShip1'),
                                       skill='Electronic Attack Ships', **kwargs)
 
@@ -10082,7 +10083,7 @@ class Effect3371(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Warp Scrambler',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Warp Scrambler'),
                                       'capacitorNeed', ship.getModifiedItemAttr('eliteBonusElectronicAttackShip2'),
                                       skill='Electronic Attack Ships', **kwargs)
 
@@ -10115,7 +10116,7 @@ class Effect3379(BaseEffect):
 
     @staticmethod
     def handler(fit, implant, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Afterburner'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Afterburner'),
                                       'capacitorNeed', implant.getModifiedItemAttr('capNeedBonus'), **kwargs)
 
 
@@ -10138,16 +10139,16 @@ class Effect3380(BaseEffect):
                     fit.ship.increaseItemAttr('warpScrambleStatus', module.getModifiedItemAttr('warpScrambleStrength'), **kwargs)
                 if module.charge.ID == 45010:
                     fit.modules.filteredItemIncrease(
-                        lambda mod: mod.item.requiresSkill('High Speed Maneuvering') or mod.item.requiresSkill('Micro Jump Drive Operation'),
+                        ItemSkillFilter('High Speed Maneuvering', 'Micro Jump Drive Operation'),
                         'activationBlocked', 1, **kwargs)
         else:
             fit.ship.forceItemAttr('disallowAssistance', 1, **kwargs)
             if module.charge is None:
                 fit.ship.boostItemAttr('mass', module.getModifiedItemAttr('massBonusPercentage'), **kwargs)
                 fit.ship.boostItemAttr('signatureRadius', module.getModifiedItemAttr('signatureRadiusBonus'), **kwargs)
-                fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Propulsion Module',
+                fit.modules.filteredItemBoost(ItemGroupFilter('Propulsion Module'),
                                               'speedBoostFactor', module.getModifiedItemAttr('speedBoostFactorBonus'), **kwargs)
-                fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Propulsion Module',
+                fit.modules.filteredItemBoost(ItemGroupFilter('Propulsion Module'),
                                           'speedFactor', module.getModifiedItemAttr('speedFactorBonus'), **kwargs)
 
 
@@ -10163,7 +10164,7 @@ class Effect3392(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Energy Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Large Energy Turret'),
                                       'trackingSpeed', ship.getModifiedItemAttr('eliteBonusBlackOps1'), skill='Black Ops', **kwargs)
 
 
@@ -10210,7 +10211,7 @@ class Effect3415(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Energy Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Large Energy Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('eliteBonusViolatorsRole1'), **kwargs)
 
 
@@ -10226,7 +10227,7 @@ class Effect3416(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Hybrid Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Large Hybrid Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('eliteBonusViolatorsRole1'), **kwargs)
 
 
@@ -10242,7 +10243,7 @@ class Effect3417(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Projectile Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Large Projectile Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('eliteBonusViolatorsRole1'), **kwargs)
 
 
@@ -10258,7 +10259,7 @@ class Effect3424(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Hybrid Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Large Hybrid Turret'),
                                       'trackingSpeed', ship.getModifiedItemAttr('eliteBonusViolators1'), skill='Marauders', **kwargs)
 
 
@@ -10274,7 +10275,7 @@ class Effect3425(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Projectile Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Large Projectile Turret'),
                                       'trackingSpeed', ship.getModifiedItemAttr('eliteBonusViolators1'), skill='Marauders', **kwargs)
 
 
@@ -10290,7 +10291,7 @@ class Effect3427(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Tractor Beam',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Tractor Beam'),
                                       'maxRange', ship.getModifiedItemAttr('eliteBonusViolatorsRole2'), **kwargs)
 
 
@@ -10306,7 +10307,7 @@ class Effect3439(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Target Painter',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Target Painter'),
                                       'signatureRadiusBonus', ship.getModifiedItemAttr('eliteBonusViolators1'),
                                       skill='Marauders', **kwargs)
 
@@ -10324,7 +10325,7 @@ class Effect3447(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Projectile Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Large Projectile Turret'),
                                       'falloff', ship.getModifiedItemAttr('shipBonusMB'), skill='Minmatar Battleship', **kwargs)
 
 
@@ -10372,7 +10373,7 @@ class Effect3468(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Warp Disrupt Field Generator',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Warp Disrupt Field Generator'),
                                       'warpScrambleRange', ship.getModifiedItemAttr('eliteBonusHeavyInterdictors2'),
                                       skill='Heavy Interdiction Cruisers', **kwargs)
 
@@ -10389,7 +10390,7 @@ class Effect3473(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Tractor Beam',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Tractor Beam'),
                                       'maxTractorVelocity', ship.getModifiedItemAttr('eliteBonusViolatorsRole3'), **kwargs)
 
 
@@ -10406,7 +10407,7 @@ class Effect3478(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Energy Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Large Energy Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('shipBonusRole7'), **kwargs)
 
 
@@ -10422,7 +10423,7 @@ class Effect3480(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Energy Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Large Energy Turret'),
                                       'trackingSpeed', ship.getModifiedItemAttr('shipBonusAB2'), skill='Amarr Battleship', **kwargs)
 
 
@@ -10441,7 +10442,7 @@ class Effect3483(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Energy Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Medium Energy Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('shipBonusRole7'), **kwargs)
 
 
@@ -10458,7 +10459,7 @@ class Effect3484(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Energy Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Medium Energy Turret'),
                                       'trackingSpeed', ship.getModifiedItemAttr('shipBonusAC2'), skill='Amarr Cruiser', **kwargs)
 
 
@@ -10479,7 +10480,7 @@ class Effect3487(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Energy Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Small Energy Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('shipBonusRole7'), **kwargs)
 
 
@@ -10496,7 +10497,7 @@ class Effect3489(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Energy Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Small Energy Turret'),
                                       'trackingSpeed', ship.getModifiedItemAttr('shipBonus2AF'), skill='Amarr Frigate', **kwargs)
 
 
@@ -10512,7 +10513,7 @@ class Effect3493(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Cargo Scanner',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Cargo Scanner'),
                                       'cargoScanRange', ship.getModifiedItemAttr('cargoScannerRangeBonus'), **kwargs)
 
 
@@ -10528,7 +10529,7 @@ class Effect3494(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Survey Scanner',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Survey Scanner'),
                                       'surveyScanRange', ship.getModifiedItemAttr('surveyScannerRangeBonus'), **kwargs)
 
 
@@ -10549,7 +10550,7 @@ class Effect3495(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, **kwargs):
         groups = ('Stasis Web', 'Warp Scrambler')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name in groups,
+        fit.modules.filteredItemBoost(ItemGroupFilter(*groups),
                                       'capacitorNeed', ship.getModifiedItemAttr('eliteBonusInterceptorRole'), **kwargs)
 
 
@@ -10566,7 +10567,7 @@ class Effect3496(BaseEffect):
 
     @staticmethod
     def handler(fit, implant, context, **kwargs):
-        fit.appliedImplants.filteredItemMultiply(lambda mod: mod.item.group.name == 'Cyberimplant',
+        fit.appliedImplants.filteredItemMultiply(ItemGroupFilter('Cyberimplant'),
                                                  'agilityBonus', implant.getModifiedItemAttr('implantSetThukker'), **kwargs)
 
 
@@ -10583,7 +10584,7 @@ class Effect3498(BaseEffect):
 
     @staticmethod
     def handler(fit, implant, context, **kwargs):
-        fit.appliedImplants.filteredItemMultiply(lambda mod: mod.item.group.name == 'Cyberimplant',
+        fit.appliedImplants.filteredItemMultiply(ItemGroupFilter('Cyberimplant'),
                                                  'scanStrengthBonus', implant.getModifiedItemAttr('implantSetSisters'), **kwargs)
 
 
@@ -10600,7 +10601,7 @@ class Effect3499(BaseEffect):
 
     @staticmethod
     def handler(fit, implant, context, **kwargs):
-        fit.appliedImplants.filteredItemMultiply(lambda mod: mod.item.group.name == 'Cyberimplant',
+        fit.appliedImplants.filteredItemMultiply(ItemGroupFilter('Cyberimplant'),
                                                  'boosterAttributeModifier',
                                                  implant.getModifiedItemAttr('implantSetSyndicate'), **kwargs)
 
@@ -10618,7 +10619,7 @@ class Effect3513(BaseEffect):
 
     @staticmethod
     def handler(fit, implant, context, **kwargs):
-        fit.appliedImplants.filteredItemMultiply(lambda mod: mod.item.group.name == 'Cyberimplant',
+        fit.appliedImplants.filteredItemMultiply(ItemGroupFilter('Cyberimplant'),
                                                  'rangeSkillBonus', implant.getModifiedItemAttr('implantSetMordus'), **kwargs)
 
 
@@ -10634,7 +10635,7 @@ class Effect3514(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Warp Scrambler',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Warp Scrambler'),
                                       'maxRange', ship.getModifiedItemAttr('eliteBonusInterceptor2'), skill='Interceptors', **kwargs)
 
 
@@ -10650,7 +10651,7 @@ class Effect3519(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Bomb Deployment'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Bomb Deployment'),
                                       'cpu', skill.getModifiedItemAttr('cpuNeedBonus') * skill.level, **kwargs)
 
 
@@ -10666,7 +10667,7 @@ class Effect3520(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Bomb Deployment'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Bomb Deployment'),
                                       'power', skill.getModifiedItemAttr('powerNeedBonus') * skill.level, **kwargs)
 
 
@@ -10684,7 +10685,7 @@ class Effect3526(BaseEffect):
     @staticmethod
     def handler(fit, container, context, **kwargs):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Cynosural Field Generator',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Cynosural Field Generator'),
                                       'consumptionQuantity',
                                       container.getModifiedItemAttr('consumptionQuantityBonusPercentage') * level, **kwargs)
 
@@ -10734,7 +10735,7 @@ class Effect3561(BaseEffect):
     @staticmethod
     def handler(fit, container, context, **kwargs):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Weapon Disruptor',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Weapon Disruptor'),
                                       'trackingSpeedBonus',
                                       container.getModifiedItemAttr('scanSkillEwStrengthBonus') * level, **kwargs)
 
@@ -10751,7 +10752,7 @@ class Effect3568(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Remote Tracking Computer',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Remote Tracking Computer'),
                                       'maxRangeBonus', ship.getModifiedItemAttr('eliteBonusLogistics1'),
                                       skill='Logistics Cruisers', **kwargs)
 
@@ -10768,7 +10769,7 @@ class Effect3569(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Remote Tracking Computer',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Remote Tracking Computer'),
                                       'maxRangeBonus', ship.getModifiedItemAttr('eliteBonusLogistics2'),
                                       skill='Logistics Cruisers', **kwargs)
 
@@ -10785,7 +10786,7 @@ class Effect3570(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Remote Tracking Computer',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Remote Tracking Computer'),
                                       'trackingSpeedBonus', ship.getModifiedItemAttr('eliteBonusLogistics2'),
                                       skill='Logistics Cruisers', **kwargs)
 
@@ -10802,7 +10803,7 @@ class Effect3571(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Remote Tracking Computer',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Remote Tracking Computer'),
                                       'trackingSpeedBonus', ship.getModifiedItemAttr('eliteBonusLogistics1'),
                                       skill='Logistics Cruisers', **kwargs)
 
@@ -10822,7 +10823,7 @@ class Effect3586(BaseEffect):
     def handler(fit, container, context, **kwargs):
         level = container.level if 'skill' in context else 1
         penalized = False if 'skill' in context else True
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Sensor Dampener',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Sensor Dampener'),
                                       'scanResolutionBonus',
                                       container.getModifiedItemAttr('scanSkillEwStrengthBonus') * level,
                                       stackingPenalties=penalized, **kwargs)
@@ -10840,7 +10841,7 @@ class Effect3587(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Sensor Dampener',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Sensor Dampener'),
                                       'maxTargetRangeBonus', ship.getModifiedItemAttr('shipBonusGC2'),
                                       skill='Gallente Cruiser', **kwargs)
 
@@ -10858,7 +10859,7 @@ class Effect3588(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Sensor Dampener',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Sensor Dampener'),
                                       'maxTargetRangeBonus', ship.getModifiedItemAttr('shipBonusGF2'),
                                       skill='Gallente Frigate', **kwargs)
 
@@ -10876,7 +10877,7 @@ class Effect3589(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Sensor Dampener',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Sensor Dampener'),
                                       'scanResolutionBonus', ship.getModifiedItemAttr('shipBonusGF2'),
                                       skill='Gallente Frigate', **kwargs)
 
@@ -10893,7 +10894,7 @@ class Effect3590(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Sensor Dampener',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Sensor Dampener'),
                                       'scanResolutionBonus', ship.getModifiedItemAttr('shipBonusGC2'),
                                       skill='Gallente Cruiser', **kwargs)
 
@@ -10912,7 +10913,7 @@ class Effect3591(BaseEffect):
     @staticmethod
     def handler(fit, container, context, **kwargs):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Sensor Dampener',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Sensor Dampener'),
                                       'maxTargetRangeBonus',
                                       container.getModifiedItemAttr('scanSkillEwStrengthBonus') * level, **kwargs)
 
@@ -11133,7 +11134,7 @@ class Effect3649(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Energy Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Large Energy Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('eliteBonusViolators1'),
                                       skill='Marauders', **kwargs)
 
@@ -11150,7 +11151,7 @@ class Effect3650(BaseEffect):
 
     @staticmethod
     def handler(fit, implant, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Sensor Dampener',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Sensor Dampener'),
                                       'maxRange', implant.getModifiedItemAttr('rangeSkillBonus'), **kwargs)
 
 
@@ -11166,7 +11167,7 @@ class Effect3651(BaseEffect):
 
     @staticmethod
     def handler(fit, implant, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Target Painter',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Target Painter'),
                                       'maxRange', implant.getModifiedItemAttr('rangeSkillBonus'), **kwargs)
 
 
@@ -11182,7 +11183,7 @@ class Effect3652(BaseEffect):
 
     @staticmethod
     def handler(fit, implant, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Weapon Disruptor',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Weapon Disruptor'),
                                       'maxRange', implant.getModifiedItemAttr('rangeSkillBonus'), **kwargs)
 
 
@@ -11198,7 +11199,7 @@ class Effect3653(BaseEffect):
 
     @staticmethod
     def handler(fit, implant, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Burst Projectors',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Burst Projectors'),
                                       'maxRange', implant.getModifiedItemAttr('rangeSkillBonus'), **kwargs)
 
 
@@ -11214,7 +11215,7 @@ class Effect3655(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Gunnery'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Gunnery'),
                                       'maxRange', module.getModifiedItemAttr('maxRangeBonus'),
                                       stackingPenalties=True, **kwargs)
 
@@ -11231,7 +11232,7 @@ class Effect3656(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Gunnery'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Gunnery'),
                                       'trackingSpeed', module.getModifiedItemAttr('trackingSpeedBonus'),
                                       stackingPenalties=True, **kwargs)
 
@@ -11298,7 +11299,7 @@ class Effect3668(BaseEffect):
 
     @staticmethod
     def handler(fit, implant, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Mining Laser',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Mining Laser'),
                                       'maxRange', implant.getModifiedItemAttr('maxRangeBonus'), **kwargs)
 
 
@@ -11314,7 +11315,7 @@ class Effect3669(BaseEffect):
 
     @staticmethod
     def handler(fit, implant, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Frequency Mining Laser',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Frequency Mining Laser'),
                                       'maxRange', implant.getModifiedItemAttr('maxRangeBonus'), **kwargs)
 
 
@@ -11330,7 +11331,7 @@ class Effect3670(BaseEffect):
 
     @staticmethod
     def handler(fit, implant, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Strip Miner',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Strip Miner'),
                                       'maxRange', implant.getModifiedItemAttr('maxRangeBonus'), **kwargs)
 
 
@@ -11346,7 +11347,7 @@ class Effect3671(BaseEffect):
 
     @staticmethod
     def handler(fit, implant, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Gas Cloud Harvester',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Gas Cloud Harvester'),
                                       'maxRange', implant.getModifiedItemAttr('maxRangeBonus'), **kwargs)
 
 
@@ -11363,7 +11364,7 @@ class Effect3672(BaseEffect):
 
     @staticmethod
     def handler(fit, implant, context, **kwargs):
-        fit.appliedImplants.filteredItemMultiply(lambda mod: mod.item.group.name == 'Cyberimplant',
+        fit.appliedImplants.filteredItemMultiply(ItemGroupFilter('Cyberimplant'),
                                                  'maxRangeBonus', implant.getModifiedItemAttr('implantSetORE'), **kwargs)
 
 
@@ -11396,7 +11397,7 @@ class Effect3677(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Energy Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Large Energy Turret'),
                                       'maxRange', ship.getModifiedItemAttr('shipBonusAB2'), skill='Amarr Battleship', **kwargs)
 
 
@@ -11522,7 +11523,7 @@ class Effect3703(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, **kwargs):
         groups = ('Missile Launcher Rapid Light', 'Missile Launcher Heavy', 'Missile Launcher Heavy Assault')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name in groups,
+        fit.modules.filteredItemBoost(ItemGroupFilter(*groups),
                                       'speed', ship.getModifiedItemAttr('shipBonusMC2'), skill='Minmatar Cruiser', **kwargs)
 
 
@@ -11539,7 +11540,7 @@ class Effect3705(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Hybrid Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Medium Hybrid Turret'),
                                       'speed', ship.getModifiedItemAttr('shipBonusGC2'), skill='Gallente Cruiser', **kwargs)
 
 
@@ -11555,7 +11556,7 @@ class Effect3706(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Projectile Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Medium Projectile Turret'),
                                       'trackingSpeed', ship.getModifiedItemAttr('shipBonusMC2'), skill='Minmatar Cruiser', **kwargs)
 
 
@@ -11602,7 +11603,7 @@ class Effect3739(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Tractor Beam', 'maxRange',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Tractor Beam'), 'maxRange',
                                       src.getModifiedItemAttr('roleBonusTractorBeamRange'), **kwargs)
 
 
@@ -11618,7 +11619,7 @@ class Effect3740(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Tractor Beam', 'maxTractorVelocity',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Tractor Beam'), 'maxTractorVelocity',
                                       ship.getModifiedItemAttr('roleBonusTractorBeamVelocity'), **kwargs)
 
 
@@ -11655,15 +11656,15 @@ class Effect3744(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Mining Foreman'), 'warfareBuff4Value',
+        fit.modules.filteredItemBoost(ItemSkillFilter('Mining Foreman'), 'warfareBuff4Value',
                                       src.getModifiedItemAttr('shipBonusICS2'), skill='Industrial Command Ships', **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Mining Foreman'), 'warfareBuff1Value',
+        fit.modules.filteredItemBoost(ItemSkillFilter('Mining Foreman'), 'warfareBuff1Value',
                                       src.getModifiedItemAttr('shipBonusICS2'), skill='Industrial Command Ships', **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Mining Foreman'), 'buffDuration',
+        fit.modules.filteredItemBoost(ItemSkillFilter('Mining Foreman'), 'buffDuration',
                                       src.getModifiedItemAttr('shipBonusICS2'), skill='Industrial Command Ships', **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Mining Foreman'), 'warfareBuff3Value',
+        fit.modules.filteredItemBoost(ItemSkillFilter('Mining Foreman'), 'warfareBuff3Value',
                                       src.getModifiedItemAttr('shipBonusICS2'), skill='Industrial Command Ships', **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Mining Foreman'), 'warfareBuff2Value',
+        fit.modules.filteredItemBoost(ItemSkillFilter('Mining Foreman'), 'warfareBuff2Value',
                                       src.getModifiedItemAttr('shipBonusICS2'), skill='Industrial Command Ships', **kwargs)
 
 
@@ -11679,7 +11680,7 @@ class Effect3745(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Survey Scanner', 'surveyScanRange',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Survey Scanner'), 'surveyScanRange',
                                       src.getModifiedItemAttr('roleBonusSurveyScannerRange'), **kwargs)
 
 
@@ -11695,7 +11696,7 @@ class Effect3765(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemMultiply(lambda mod: mod.item.group.name == 'Missile Launcher Torpedo',
+        fit.modules.filteredItemMultiply(ItemGroupFilter('Missile Launcher Torpedo'),
                                          'power', ship.getModifiedItemAttr('stealthBomberLauncherPower'), **kwargs)
 
 
@@ -11711,7 +11712,7 @@ class Effect3766(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('High Speed Maneuvering'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('High Speed Maneuvering'),
                                       'signatureRadiusBonus', ship.getModifiedItemAttr('eliteBonusInterceptor'),
                                       skill='Interceptors', **kwargs)
 
@@ -11728,7 +11729,7 @@ class Effect3767(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Heavy Missiles'),
                                         'aoeVelocity', ship.getModifiedItemAttr('eliteBonusCommandShips2'),
                                         skill='Command Ships', **kwargs)
 
@@ -11978,7 +11979,7 @@ class Effect3861(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Afterburner'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Afterburner'),
                                       'speedFactor', module.getModifiedItemAttr('subsystemBonusMinmatarPropulsion'),
                                       skill='Minmatar Propulsion Systems', **kwargs)
 
@@ -11995,7 +11996,7 @@ class Effect3863(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Afterburner'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Afterburner'),
                                       'speedFactor', module.getModifiedItemAttr('subsystemBonusCaldariPropulsion'),
                                       skill='Caldari Propulsion Systems', **kwargs)
 
@@ -12012,7 +12013,7 @@ class Effect3864(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Afterburner'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Afterburner'),
                                       'speedFactor', module.getModifiedItemAttr('subsystemBonusAmarrPropulsion'),
                                       skill='Amarr Propulsion Systems', **kwargs)
 
@@ -12093,7 +12094,7 @@ class Effect3869(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('High Speed Maneuvering'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('High Speed Maneuvering'),
                                       'signatureRadiusBonus', src.getModifiedItemAttr('subsystemBonusMinmatarPropulsion2'),
                                       skill='Minmatar Propulsion Systems', **kwargs)
 
@@ -12110,7 +12111,7 @@ class Effect3872(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('High Speed Maneuvering'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('High Speed Maneuvering'),
                                       'signatureRadiusBonus', src.getModifiedItemAttr('subsystemBonusAmarrPropulsion2'),
                                       skill='Amarr Propulsion Systems', **kwargs)
 
@@ -12127,7 +12128,7 @@ class Effect3875(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Propulsion Module',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Propulsion Module'),
                                       'capacitorNeed', module.getModifiedItemAttr('subsystemBonusGallentePropulsion'),
                                       skill='Gallente Propulsion Systems', **kwargs)
 
@@ -12208,7 +12209,7 @@ class Effect3959(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Repair Systems'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Repair Systems'),
                                       'armorDamageAmount', module.getModifiedItemAttr('subsystemBonusAmarrDefensive'),
                                       skill='Amarr Defensive Systems', **kwargs)
 
@@ -12226,7 +12227,7 @@ class Effect3961(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Repair Systems'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Repair Systems'),
                                       'armorDamageAmount', module.getModifiedItemAttr('subsystemBonusGallenteDefensive'),
                                       skill='Gallente Defensive Systems', **kwargs)
 
@@ -12244,10 +12245,10 @@ class Effect3962(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Repair Systems'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Repair Systems'),
                                       'armorDamageAmount', src.getModifiedItemAttr('subsystemBonusMinmatarDefensive'),
                                       skill='Minmatar Defensive Systems', **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Operation'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Shield Operation'),
                                       'shieldBonus', src.getModifiedItemAttr('subsystemBonusMinmatarDefensive'),
                                       skill='Minmatar Defensive Systems', **kwargs)
 
@@ -12265,7 +12266,7 @@ class Effect3964(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Operation'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Shield Operation'),
                                       'shieldBonus', module.getModifiedItemAttr('subsystemBonusCaldariDefensive'),
                                       skill='Caldari Defensive Systems', **kwargs)
 
@@ -12476,7 +12477,7 @@ class Effect4002(BaseEffect):
 
     @staticmethod
     def handler(fit, beacon, context, **kwargs):
-        fit.modules.filteredChargeMultiply(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeMultiply(ChargeSkillFilter('Missile Launcher Operation'),
                                            'maxVelocity', beacon.getModifiedItemAttr('missileVelocityMultiplier'),
                                            stackingPenalties=True, penaltyGroup='postMul', **kwargs)
 
@@ -12511,7 +12512,7 @@ class Effect4016(BaseEffect):
 
     @staticmethod
     def handler(fit, beacon, context, **kwargs):
-        fit.modules.filteredItemMultiply(lambda mod: mod.item.requiresSkill('Gunnery'),
+        fit.modules.filteredItemMultiply(ItemSkillFilter('Gunnery'),
                                          'damageMultiplier', beacon.getModifiedItemAttr('damageMultiplierMultiplier'),
                                          stackingPenalties=True, **kwargs)
 
@@ -12529,7 +12530,7 @@ class Effect4017(BaseEffect):
 
     @staticmethod
     def handler(fit, beacon, context, **kwargs):
-        fit.modules.filteredChargeMultiply(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeMultiply(ChargeSkillFilter('Missile Launcher Operation'),
                                            'thermalDamage', beacon.getModifiedItemAttr('damageMultiplierMultiplier'),
                                            stackingPenalties=True, penaltyGroup='postMul', **kwargs)
 
@@ -12547,7 +12548,7 @@ class Effect4018(BaseEffect):
 
     @staticmethod
     def handler(fit, beacon, context, **kwargs):
-        fit.modules.filteredChargeMultiply(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeMultiply(ChargeSkillFilter('Missile Launcher Operation'),
                                            'emDamage', beacon.getModifiedItemAttr('damageMultiplierMultiplier'),
                                            stackingPenalties=True, penaltyGroup='postMul', **kwargs)
 
@@ -12565,7 +12566,7 @@ class Effect4019(BaseEffect):
 
     @staticmethod
     def handler(fit, beacon, context, **kwargs):
-        fit.modules.filteredChargeMultiply(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeMultiply(ChargeSkillFilter('Missile Launcher Operation'),
                                            'explosiveDamage', beacon.getModifiedItemAttr('damageMultiplierMultiplier'),
                                            stackingPenalties=True, penaltyGroup='postMul', **kwargs)
 
@@ -12583,7 +12584,7 @@ class Effect4020(BaseEffect):
 
     @staticmethod
     def handler(fit, beacon, context, **kwargs):
-        fit.modules.filteredChargeMultiply(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeMultiply(ChargeSkillFilter('Missile Launcher Operation'),
                                            'kineticDamage', beacon.getModifiedItemAttr('damageMultiplierMultiplier'),
                                            stackingPenalties=True, penaltyGroup='postMul', **kwargs)
 
@@ -12601,7 +12602,7 @@ class Effect4021(BaseEffect):
 
     @staticmethod
     def handler(fit, beacon, context, **kwargs):
-        fit.drones.filteredItemMultiply(lambda drone: drone.item.requiresSkill('Drones'),
+        fit.drones.filteredItemMultiply(ItemSkillFilter('Drones'),
                                         'damageMultiplier', beacon.getModifiedItemAttr('damageMultiplierMultiplier'),
                                         stackingPenalties=True, penaltyGroup='postMul', **kwargs)
 
@@ -12619,7 +12620,7 @@ class Effect4022(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, **kwargs):
-        fit.modules.filteredItemMultiply(lambda mod: mod.item.requiresSkill('Gunnery'),
+        fit.modules.filteredItemMultiply(ItemSkillFilter('Gunnery'),
                                          'trackingSpeed', module.getModifiedItemAttr('trackingSpeedMultiplier'),
                                          stackingPenalties=True, penaltyGroup='postMul', **kwargs)
 
@@ -12637,7 +12638,7 @@ class Effect4023(BaseEffect):
 
     @staticmethod
     def handler(fit, beacon, context, **kwargs):
-        fit.modules.filteredChargeMultiply(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeMultiply(ChargeSkillFilter('Missile Launcher Operation'),
                                            'aoeVelocity', beacon.getModifiedItemAttr('aoeVelocityMultiplier'), **kwargs)
 
 
@@ -12858,7 +12859,7 @@ class Effect4045(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, **kwargs):
-        fit.modules.filteredItemMultiply(lambda mod: mod.item.group.name == 'Smart Bomb',
+        fit.modules.filteredItemMultiply(ItemGroupFilter('Smart Bomb'),
                                          'empFieldRange', module.getModifiedItemAttr('empFieldRangeMultiplier'), **kwargs)
 
 
@@ -12875,7 +12876,7 @@ class Effect4046(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, **kwargs):
-        fit.modules.filteredItemMultiply(lambda mod: mod.item.group.name == 'Smart Bomb',
+        fit.modules.filteredItemMultiply(ItemGroupFilter('Smart Bomb'),
                                          'emDamage', module.getModifiedItemAttr('smartbombDamageMultiplier'), **kwargs)
 
 
@@ -12892,7 +12893,7 @@ class Effect4047(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, **kwargs):
-        fit.modules.filteredItemMultiply(lambda mod: mod.item.group.name == 'Smart Bomb',
+        fit.modules.filteredItemMultiply(ItemGroupFilter('Smart Bomb'),
                                          'thermalDamage', module.getModifiedItemAttr('smartbombDamageMultiplier'), **kwargs)
 
 
@@ -12909,7 +12910,7 @@ class Effect4048(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, **kwargs):
-        fit.modules.filteredItemMultiply(lambda mod: mod.item.group.name == 'Smart Bomb',
+        fit.modules.filteredItemMultiply(ItemGroupFilter('Smart Bomb'),
                                          'kineticDamage', module.getModifiedItemAttr('smartbombDamageMultiplier'), **kwargs)
 
 
@@ -12926,7 +12927,7 @@ class Effect4049(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, **kwargs):
-        fit.modules.filteredItemMultiply(lambda mod: mod.item.group.name == 'Smart Bomb',
+        fit.modules.filteredItemMultiply(ItemGroupFilter('Smart Bomb'),
                                          'explosiveDamage', module.getModifiedItemAttr('smartbombDamageMultiplier'), **kwargs)
 
 
@@ -12943,7 +12944,7 @@ class Effect4054(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, **kwargs):
-        fit.modules.filteredItemMultiply(lambda mod: mod.item.requiresSkill('Small Energy Turret'),
+        fit.modules.filteredItemMultiply(ItemSkillFilter('Small Energy Turret'),
                                          'damageMultiplier', module.getModifiedItemAttr('smallWeaponDamageMultiplier'),
                                          stackingPenalties=True, **kwargs)
 
@@ -12961,7 +12962,7 @@ class Effect4055(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, **kwargs):
-        fit.modules.filteredItemMultiply(lambda mod: mod.item.requiresSkill('Small Projectile Turret'),
+        fit.modules.filteredItemMultiply(ItemSkillFilter('Small Projectile Turret'),
                                          'damageMultiplier', module.getModifiedItemAttr('smallWeaponDamageMultiplier'),
                                          stackingPenalties=True, **kwargs)
 
@@ -12979,7 +12980,7 @@ class Effect4056(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, **kwargs):
-        fit.modules.filteredItemMultiply(lambda mod: mod.item.requiresSkill('Small Hybrid Turret'),
+        fit.modules.filteredItemMultiply(ItemSkillFilter('Small Hybrid Turret'),
                                          'damageMultiplier', module.getModifiedItemAttr('smallWeaponDamageMultiplier'),
                                          stackingPenalties=True, **kwargs)
 
@@ -12997,7 +12998,7 @@ class Effect4057(BaseEffect):
 
     @staticmethod
     def handler(fit, beacon, context, **kwargs):
-        fit.modules.filteredChargeMultiply(lambda mod: mod.charge.requiresSkill('Rockets'),
+        fit.modules.filteredChargeMultiply(ChargeSkillFilter('Rockets'),
                                            'emDamage', beacon.getModifiedItemAttr('smallWeaponDamageMultiplier'),
                                            stackingPenalties=True, penaltyGroup='postMul', **kwargs)
 
@@ -13015,7 +13016,7 @@ class Effect4058(BaseEffect):
 
     @staticmethod
     def handler(fit, beacon, context, **kwargs):
-        fit.modules.filteredChargeMultiply(lambda mod: mod.charge.requiresSkill('Rockets'),
+        fit.modules.filteredChargeMultiply(ChargeSkillFilter('Rockets'),
                                            'explosiveDamage', beacon.getModifiedItemAttr('smallWeaponDamageMultiplier'),
                                            stackingPenalties=True, penaltyGroup='postMul', **kwargs)
 
@@ -13033,7 +13034,7 @@ class Effect4059(BaseEffect):
 
     @staticmethod
     def handler(fit, beacon, context, **kwargs):
-        fit.modules.filteredChargeMultiply(lambda mod: mod.charge.requiresSkill('Rockets'),
+        fit.modules.filteredChargeMultiply(ChargeSkillFilter('Rockets'),
                                            'kineticDamage', beacon.getModifiedItemAttr('smallWeaponDamageMultiplier'),
                                            stackingPenalties=True, penaltyGroup='postMul', **kwargs)
 
@@ -13051,7 +13052,7 @@ class Effect4060(BaseEffect):
 
     @staticmethod
     def handler(fit, beacon, context, **kwargs):
-        fit.modules.filteredChargeMultiply(lambda mod: mod.charge.requiresSkill('Rockets'),
+        fit.modules.filteredChargeMultiply(ChargeSkillFilter('Rockets'),
                                            'thermalDamage', beacon.getModifiedItemAttr('smallWeaponDamageMultiplier'),
                                            stackingPenalties=True, penaltyGroup='postMul', **kwargs)
 
@@ -13069,7 +13070,7 @@ class Effect4061(BaseEffect):
 
     @staticmethod
     def handler(fit, beacon, context, **kwargs):
-        fit.modules.filteredChargeMultiply(lambda mod: mod.charge.requiresSkill('Light Missiles'),
+        fit.modules.filteredChargeMultiply(ChargeSkillFilter('Light Missiles'),
                                            'thermalDamage', beacon.getModifiedItemAttr('smallWeaponDamageMultiplier'),
                                            stackingPenalties=True, penaltyGroup='postMul', **kwargs)
 
@@ -13087,7 +13088,7 @@ class Effect4062(BaseEffect):
 
     @staticmethod
     def handler(fit, beacon, context, **kwargs):
-        fit.modules.filteredChargeMultiply(lambda mod: mod.charge.requiresSkill('Light Missiles'),
+        fit.modules.filteredChargeMultiply(ChargeSkillFilter('Light Missiles'),
                                            'emDamage', beacon.getModifiedItemAttr('smallWeaponDamageMultiplier'),
                                            stackingPenalties=True, penaltyGroup='postMul', **kwargs)
 
@@ -13105,7 +13106,7 @@ class Effect4063(BaseEffect):
 
     @staticmethod
     def handler(fit, beacon, context, **kwargs):
-        fit.modules.filteredChargeMultiply(lambda mod: mod.charge.requiresSkill('Light Missiles'),
+        fit.modules.filteredChargeMultiply(ChargeSkillFilter('Light Missiles'),
                                            'explosiveDamage', beacon.getModifiedItemAttr('smallWeaponDamageMultiplier'),
                                            stackingPenalties=True, penaltyGroup='postMul', **kwargs)
 
@@ -13123,8 +13124,7 @@ class Effect4086(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, **kwargs):
-        fit.modules.filteredItemMultiply(lambda mod: mod.item.requiresSkill('Repair Systems') or
-                                                     mod.item.requiresSkill('Capital Repair Systems'),
+        fit.modules.filteredItemMultiply(ItemSkillFilter('Repair Systems', 'Capital Repair Systems'),
                                          'armorDamageAmount', module.getModifiedItemAttr('armorDamageAmountMultiplier'),
                                          stackingPenalties=True, penaltyGroup='postMul', **kwargs)
 
@@ -13142,7 +13142,7 @@ class Effect4088(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, **kwargs):
-        fit.modules.filteredItemMultiply(lambda mod: mod.item.requiresSkill('Remote Armor Repair Systems'),
+        fit.modules.filteredItemMultiply(ItemSkillFilter('Remote Armor Repair Systems'),
                                          'armorDamageAmount',
                                          module.getModifiedItemAttr('armorDamageAmountMultiplierRemote'),
                                          stackingPenalties=True, **kwargs)
@@ -13161,7 +13161,7 @@ class Effect4089(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, **kwargs):
-        fit.modules.filteredItemMultiply(lambda mod: mod.item.requiresSkill('Shield Emission Systems'),
+        fit.modules.filteredItemMultiply(ItemSkillFilter('Shield Emission Systems'),
                                          'shieldBonus', module.getModifiedItemAttr('shieldBonusMultiplierRemote'),
                                          stackingPenalties=True, penaltyGroup='postMul', **kwargs)
 
@@ -13211,7 +13211,7 @@ class Effect4093(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Energy Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Medium Energy Turret'),
                                       'damageMultiplier', module.getModifiedItemAttr('subsystemBonusAmarrOffensive'),
                                       skill='Amarr Offensive Systems', **kwargs)
 
@@ -13228,7 +13228,7 @@ class Effect4104(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Hybrid Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Medium Hybrid Turret'),
                                       'maxRange', module.getModifiedItemAttr('subsystemBonusCaldariOffensive'),
                                       skill='Caldari Offensive Systems', **kwargs)
 
@@ -13245,7 +13245,7 @@ class Effect4106(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Hybrid Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Medium Hybrid Turret'),
                                       'falloff', module.getModifiedItemAttr('subsystemBonusGallenteOffensive'),
                                       skill='Gallente Offensive Systems', **kwargs)
 
@@ -13262,7 +13262,7 @@ class Effect4114(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Projectile Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Medium Projectile Turret'),
                                       'falloff', module.getModifiedItemAttr('subsystemBonusMinmatarOffensive'),
                                       skill='Minmatar Offensive Systems', **kwargs)
 
@@ -13279,7 +13279,7 @@ class Effect4115(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Projectile Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Medium Projectile Turret'),
                                       'maxRange', module.getModifiedItemAttr('subsystemBonusMinmatarOffensive'),
                                       skill='Minmatar Offensive Systems', **kwargs)
 
@@ -13297,7 +13297,7 @@ class Effect4122(BaseEffect):
     @staticmethod
     def handler(fit, src, context, **kwargs):
         groups = ('Missile Launcher Heavy', 'Missile Launcher Rapid Light', 'Missile Launcher Heavy Assault')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name in groups,
+        fit.modules.filteredItemBoost(ItemGroupFilter(*groups),
                                       'speed', src.getModifiedItemAttr('subsystemBonusCaldariOffensive'), skill='Caldari Offensive Systems', **kwargs)
 
 
@@ -13486,7 +13486,7 @@ class Effect4161(BaseEffect):
     @staticmethod
     def handler(fit, container, context, **kwargs):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Astrometrics'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Astrometrics'),
                                         'baseMaxScanDeviation',
                                         container.getModifiedItemAttr('maxScanDeviationModifier') * level, **kwargs)
 
@@ -13510,7 +13510,7 @@ class Effect4162(BaseEffect):
     def handler(fit, container, context, **kwargs):
         level = container.level if 'skill' in context else 1
         penalized = False if 'skill' in context or 'implant' in context else True
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Astrometrics'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Astrometrics'),
                                         'baseSensorStrength', container.getModifiedItemAttr('scanStrengthBonus') * level,
                                         stackingPenalties=penalized, **kwargs)
 
@@ -13527,7 +13527,7 @@ class Effect4165(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.group.name == 'Scanner Probe',
+        fit.modules.filteredChargeBoost(ChargeGroupFilter('Scanner Probe'),
                                         'baseSensorStrength', ship.getModifiedItemAttr('shipBonusCF2'),
                                         skill='Caldari Frigate', **kwargs)
 
@@ -13544,7 +13544,7 @@ class Effect4166(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.group.name == 'Scanner Probe',
+        fit.modules.filteredChargeBoost(ChargeGroupFilter('Scanner Probe'),
                                         'baseSensorStrength', ship.getModifiedItemAttr('shipBonusMF2'),
                                         skill='Minmatar Frigate', **kwargs)
 
@@ -13561,7 +13561,7 @@ class Effect4167(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.group.name == 'Scanner Probe',
+        fit.modules.filteredChargeBoost(ChargeGroupFilter('Scanner Probe'),
                                         'baseSensorStrength', ship.getModifiedItemAttr('shipBonusGF2'),
                                         skill='Gallente Frigate', **kwargs)
 
@@ -13578,7 +13578,7 @@ class Effect4168(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.group.name == 'Scanner Probe',
+        fit.modules.filteredChargeBoost(ChargeGroupFilter('Scanner Probe'),
                                         'baseSensorStrength', ship.getModifiedItemAttr('eliteBonusCovertOps2'),
                                         skill='Covert Ops', **kwargs)
 
@@ -13663,7 +13663,7 @@ class Effect4215(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Energy Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Medium Energy Turret'),
                                       'capacitorNeed', module.getModifiedItemAttr('subsystemBonusAmarrOffensive2'),
                                       skill='Amarr Offensive Systems', **kwargs)
 
@@ -13680,7 +13680,7 @@ class Effect4216(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Nosferatu', 'powerTransferAmount',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Energy Nosferatu'), 'powerTransferAmount',
                                       src.getModifiedItemAttr('subsystemBonusAmarrCore2'), skill='Amarr Core Systems', **kwargs)
 
 
@@ -13696,7 +13696,7 @@ class Effect4217(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Neutralizer', 'energyNeutralizerAmount',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Energy Neutralizer'), 'energyNeutralizerAmount',
                                       src.getModifiedItemAttr('subsystemBonusAmarrCore2'), skill='Amarr Core Systems', **kwargs)
 
 
@@ -13712,13 +13712,13 @@ class Effect4248(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Light Missiles'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Light Missiles'),
                                         'kineticDamage', src.getModifiedItemAttr('subsystemBonusCaldariOffensive2'),
                                         skill='Caldari Offensive Systems', **kwargs)
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Heavy Missiles'),
                                         'kineticDamage', src.getModifiedItemAttr('subsystemBonusCaldariOffensive2'),
                                         skill='Caldari Offensive Systems', **kwargs)
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Assault Missiles'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Heavy Assault Missiles'),
                                         'kineticDamage', src.getModifiedItemAttr('subsystemBonusCaldariOffensive2'),
                                         skill='Caldari Offensive Systems', **kwargs)
 
@@ -13735,16 +13735,16 @@ class Effect4250(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'),
+        fit.drones.filteredItemBoost(ItemSkillFilter('Drones'),
                                      'armorHP', src.getModifiedItemAttr('subsystemBonusGallenteOffensive'),
                                      skill='Gallente Offensive Systems', **kwargs)
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'),
+        fit.drones.filteredItemBoost(ItemSkillFilter('Drones'),
                                      'hp', src.getModifiedItemAttr('subsystemBonusGallenteOffensive'),
                                      skill='Gallente Offensive Systems', **kwargs)
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'),
+        fit.drones.filteredItemBoost(ItemSkillFilter('Drones'),
                                      'damageMultiplier', src.getModifiedItemAttr('subsystemBonusGallenteOffensive'),
                                      skill='Gallente Offensive Systems', **kwargs)
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'),
+        fit.drones.filteredItemBoost(ItemSkillFilter('Drones'),
                                      'shieldCapacity', src.getModifiedItemAttr('subsystemBonusGallenteOffensive'),
                                      skill='Gallente Offensive Systems', **kwargs)
 
@@ -13761,7 +13761,7 @@ class Effect4251(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Projectile Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Medium Projectile Turret'),
                                       'damageMultiplier', module.getModifiedItemAttr('subsystemBonusMinmatarOffensive2'),
                                       skill='Minmatar Offensive Systems', **kwargs)
 
@@ -13779,7 +13779,7 @@ class Effect4256(BaseEffect):
     @staticmethod
     def handler(fit, src, context, **kwargs):
         groups = ('Missile Launcher Heavy', 'Missile Launcher Rapid Light', 'Missile Launcher Heavy Assault')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name in groups,
+        fit.modules.filteredItemBoost(ItemGroupFilter(*groups),
                                       'speed', src.getModifiedItemAttr('subsystemBonusMinmatarOffensive2'),
                                       skill='Minmatar Offensive Systems', **kwargs)
 
@@ -13891,7 +13891,7 @@ class Effect4273(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Warp Scrambler', 'maxRange',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Warp Scrambler'), 'maxRange',
                                       src.getModifiedItemAttr('subsystemBonusGallenteCore2'), skill='Gallente Core Systems', **kwargs)
 
 
@@ -13907,7 +13907,7 @@ class Effect4274(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Stasis Web',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Stasis Web'),
                                       'maxRange', src.getModifiedItemAttr('subsystemBonusMinmatarCore2'), skill='Minmatar Core Systems', **kwargs)
 
 
@@ -13987,7 +13987,7 @@ class Effect4282(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Hybrid Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Medium Hybrid Turret'),
                                       'damageMultiplier', module.getModifiedItemAttr('subsystemBonusGallenteOffensive2'),
                                       skill='Gallente Offensive Systems', **kwargs)
 
@@ -14004,7 +14004,7 @@ class Effect4283(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Hybrid Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Medium Hybrid Turret'),
                                       'damageMultiplier', module.getModifiedItemAttr('subsystemBonusCaldariOffensive2'),
                                       skill='Caldari Offensive Systems', **kwargs)
 
@@ -14021,7 +14021,7 @@ class Effect4286(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Remote Armor Repair Systems'), 'capacitorNeed',
+        fit.modules.filteredItemBoost(ItemSkillFilter('Remote Armor Repair Systems'), 'capacitorNeed',
                                       src.getModifiedItemAttr('subsystemBonusAmarrOffensive2'), skill='Amarr Offensive Systems', **kwargs)
 
 
@@ -14037,7 +14037,7 @@ class Effect4288(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Remote Armor Repair Systems'), 'capacitorNeed',
+        fit.modules.filteredItemBoost(ItemSkillFilter('Remote Armor Repair Systems'), 'capacitorNeed',
                                       src.getModifiedItemAttr('subsystemBonusGallenteOffensive2'), skill='Gallente Offensive Systems', **kwargs)
 
 
@@ -14053,7 +14053,7 @@ class Effect4290(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Emission Systems') or mod.item.requiresSkill('Remote Armor Repair Systems'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Shield Emission Systems', 'Remote Armor Repair Systems'),
                                       'capacitorNeed', src.getModifiedItemAttr('subsystemBonusMinmatarOffensive2'),
                                       skill='Minmatar Offensive Systems', **kwargs)
 
@@ -14070,7 +14070,7 @@ class Effect4292(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Emission Systems'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Shield Emission Systems'),
                                       'capacitorNeed', src.getModifiedItemAttr('subsystemBonusCaldariOffensive2'),
                                       skill='Caldari Offensive Systems', **kwargs)
 
@@ -14087,15 +14087,15 @@ class Effect4321(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'ECM', 'scanLadarStrengthBonus',
+        fit.modules.filteredItemBoost(ItemGroupFilter('ECM'), 'scanLadarStrengthBonus',
                                       src.getModifiedItemAttr('subsystemBonusCaldariCore2'), skill='Caldari Core Systems', **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'ECM', 'scanRadarStrengthBonus',
+        fit.modules.filteredItemBoost(ItemGroupFilter('ECM'), 'scanRadarStrengthBonus',
                                       src.getModifiedItemAttr('subsystemBonusCaldariCore2'), skill='Caldari Core Systems', **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'ECM', 'maxRange',
+        fit.modules.filteredItemBoost(ItemGroupFilter('ECM'), 'maxRange',
                                       src.getModifiedItemAttr('subsystemBonusCaldariCore2'), skill='Caldari Core Systems', **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'ECM', 'scanGravimetricStrengthBonus',
+        fit.modules.filteredItemBoost(ItemGroupFilter('ECM'), 'scanGravimetricStrengthBonus',
                                       src.getModifiedItemAttr('subsystemBonusCaldariCore2'), skill='Caldari Core Systems', **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'ECM', 'scanMagnetometricStrengthBonus',
+        fit.modules.filteredItemBoost(ItemGroupFilter('ECM'), 'scanMagnetometricStrengthBonus',
                                       src.getModifiedItemAttr('subsystemBonusCaldariCore2'), skill='Caldari Core Systems', **kwargs)
 
 
@@ -14111,13 +14111,13 @@ class Effect4327(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'),
+        fit.drones.filteredItemBoost(ItemSkillFilter('Drones'),
                                      'hp', src.getModifiedItemAttr('subsystemBonusAmarrOffensive3'), skill='Amarr Offensive Systems', **kwargs)
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'),
+        fit.drones.filteredItemBoost(ItemSkillFilter('Drones'),
                                      'armorHP', src.getModifiedItemAttr('subsystemBonusAmarrOffensive3'), skill='Amarr Offensive Systems', **kwargs)
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'),
+        fit.drones.filteredItemBoost(ItemSkillFilter('Drones'),
                                      'shieldCapacity', src.getModifiedItemAttr('subsystemBonusAmarrOffensive3'), skill='Amarr Offensive Systems', **kwargs)
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'),
+        fit.drones.filteredItemBoost(ItemSkillFilter('Drones'),
                                      'damageMultiplier', src.getModifiedItemAttr('subsystemBonusAmarrOffensive3'), skill='Amarr Offensive Systems', **kwargs)
 
 
@@ -14133,7 +14133,7 @@ class Effect4330(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Energy Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Medium Energy Turret'),
                                       'maxRange', module.getModifiedItemAttr('subsystemBonusAmarrOffensive3'),
                                       skill='Amarr Offensive Systems', **kwargs)
 
@@ -14150,7 +14150,7 @@ class Effect4331(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles') or mod.charge.requiresSkill('Heavy Assault Missiles'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Heavy Missiles', 'Heavy Assault Missiles'),
                                         'maxVelocity', src.getModifiedItemAttr('subsystemBonusCaldariOffensive3'),
                                         skill='Caldari Offensive Systems', **kwargs)
 
@@ -14200,7 +14200,7 @@ class Effect4347(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Hybrid Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Medium Hybrid Turret'),
                                       'trackingSpeed', module.getModifiedItemAttr('subsystemBonusGallenteOffensive3'),
                                       skill='Gallente Offensive Systems', **kwargs)
 
@@ -14217,7 +14217,7 @@ class Effect4351(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Projectile Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Medium Projectile Turret'),
                                       'trackingSpeed', module.getModifiedItemAttr('subsystemBonusMinmatarOffensive3'),
                                       skill='Minmatar Offensive Systems', **kwargs)
 
@@ -14234,7 +14234,7 @@ class Effect4358(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'ECM',
+        fit.modules.filteredItemBoost(ItemGroupFilter('ECM'),
                                       'maxRange', module.getModifiedItemAttr('ecmRangeBonus'),
                                       stackingPenalties=True, **kwargs)
 
@@ -14252,7 +14252,7 @@ class Effect4360(BaseEffect):
     @staticmethod
     def handler(fit, src, context, **kwargs):
         groups = ('Missile Launcher Heavy', 'Missile Launcher Rapid Light', 'Missile Launcher Heavy Assault')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name in groups,
+        fit.modules.filteredItemBoost(ItemGroupFilter(*groups),
                                       'speed', src.getModifiedItemAttr('subsystemBonusAmarrOffensive'), skill='Amarr Offensive Systems', **kwargs)
 
 
@@ -14268,13 +14268,13 @@ class Effect4362(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeBoost(ItemSkillFilter('Missile Launcher Operation'),
                                         'explosiveDamage', src.getModifiedItemAttr('subsystemBonusAmarrOffensive2'), skill='Amarr Offensive Systems', **kwargs)
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeBoost(ItemSkillFilter('Missile Launcher Operation'),
                                         'kineticDamage', src.getModifiedItemAttr('subsystemBonusAmarrOffensive2'), skill='Amarr Offensive Systems', **kwargs)
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeBoost(ItemSkillFilter('Missile Launcher Operation'),
                                         'emDamage', src.getModifiedItemAttr('subsystemBonusAmarrOffensive2'), skill='Amarr Offensive Systems', **kwargs)
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeBoost(ItemSkillFilter('Missile Launcher Operation'),
                                         'thermalDamage', src.getModifiedItemAttr('subsystemBonusAmarrOffensive2'), skill='Amarr Offensive Systems', **kwargs)
 
 
@@ -14290,7 +14290,7 @@ class Effect4366(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Hybrid Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Medium Hybrid Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('shipBonusCC2'), skill='Caldari Cruiser', **kwargs)
 
 
@@ -14321,7 +14321,7 @@ class Effect4370(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'ECM',
+        fit.modules.filteredItemBoost(ItemGroupFilter('ECM'),
                                       'falloffEffectiveness', ship.getModifiedItemAttr('shipBonusCC2'),
                                       skill='Caldari Cruiser', **kwargs)
 
@@ -14338,7 +14338,7 @@ class Effect4372(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'ECM',
+        fit.modules.filteredItemBoost(ItemGroupFilter('ECM'),
                                       'falloffEffectiveness', ship.getModifiedItemAttr('shipBonusCB3'),
                                       skill='Caldari Battleship', **kwargs)
 
@@ -14356,9 +14356,7 @@ class Effect4373(BaseEffect):
     @staticmethod
     def handler(fit, src, context, **kwargs):
         for attrName in ('buffDuration', 'warfareBuff1Value', 'warfareBuff2Value', 'warfareBuff3Value', 'warfareBuff4Value'):
-            fit.modules.filteredItemBoost(lambda mod: (mod.item.requiresSkill('Skirmish Command') or
-                                                       mod.item.requiresSkill('Armored Command') or
-                                                       mod.item.requiresSkill('Information Command')),
+            fit.modules.filteredItemBoost(ItemSkillFilter('Skirmish Command', 'Armored Command', 'Information Command'),
                                           attrName, src.getModifiedItemAttr('subsystemBonusAmarrOffensive'),
                                           skill='Amarr Offensive Systems', **kwargs)
 
@@ -14376,7 +14374,7 @@ class Effect4377(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Torpedoes'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Torpedoes'),
                                         'maxVelocity', ship.getModifiedItemAttr('shipBonusGF2'), skill='Gallente Frigate', **kwargs)
 
 
@@ -14392,7 +14390,7 @@ class Effect4378(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Torpedoes'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Torpedoes'),
                                         'maxVelocity', ship.getModifiedItemAttr('shipBonusMF2'), skill='Minmatar Frigate', **kwargs)
 
 
@@ -14408,7 +14406,7 @@ class Effect4379(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Torpedoes'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Torpedoes'),
                                         'maxVelocity', ship.getModifiedItemAttr('shipBonus2AF'), skill='Amarr Frigate', **kwargs)
 
 
@@ -14424,7 +14422,7 @@ class Effect4380(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Torpedoes'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Torpedoes'),
                                         'maxVelocity', ship.getModifiedItemAttr('shipBonusCF2'), skill='Caldari Frigate', **kwargs)
 
 
@@ -14440,7 +14438,7 @@ class Effect4384(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Heavy Missiles'),
                                         'maxVelocity', ship.getModifiedItemAttr('eliteBonusReconShip1'),
                                         skill='Recon Ships', **kwargs)
 
@@ -14457,7 +14455,7 @@ class Effect4385(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Assault Missiles'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Heavy Assault Missiles'),
                                         'maxVelocity', ship.getModifiedItemAttr('eliteBonusReconShip1'),
                                         skill='Recon Ships', **kwargs)
 
@@ -14475,7 +14473,7 @@ class Effect4393(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Torpedoes'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Torpedoes'),
                                         'thermalDamage', ship.getModifiedItemAttr('eliteBonusCovertOps2'),
                                         skill='Covert Ops', **kwargs)
 
@@ -14492,7 +14490,7 @@ class Effect4394(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Torpedoes'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Torpedoes'),
                                         'emDamage', ship.getModifiedItemAttr('eliteBonusCovertOps2'), skill='Covert Ops', **kwargs)
 
 
@@ -14509,7 +14507,7 @@ class Effect4395(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Torpedoes'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Torpedoes'),
                                         'explosiveDamage', ship.getModifiedItemAttr('eliteBonusCovertOps2'),
                                         skill='Covert Ops', **kwargs)
 
@@ -14526,7 +14524,7 @@ class Effect4396(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Torpedoes'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Torpedoes'),
                                         'kineticDamage', ship.getModifiedItemAttr('eliteBonusCovertOps2'),
                                         skill='Covert Ops', **kwargs)
 
@@ -14543,7 +14541,7 @@ class Effect4397(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Torpedoes'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Torpedoes'),
                                         'aoeVelocity', ship.getModifiedItemAttr('shipBonusGF'), skill='Gallente Frigate', **kwargs)
 
 
@@ -14560,7 +14558,7 @@ class Effect4398(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Torpedoes'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Torpedoes'),
                                         'aoeVelocity', ship.getModifiedItemAttr('shipBonusMF'), skill='Minmatar Frigate', **kwargs)
 
 
@@ -14576,7 +14574,7 @@ class Effect4399(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Torpedoes'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Torpedoes'),
                                         'aoeVelocity', ship.getModifiedItemAttr('shipBonusCF'), skill='Caldari Frigate', **kwargs)
 
 
@@ -14592,7 +14590,7 @@ class Effect4400(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Torpedoes'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Torpedoes'),
                                         'aoeVelocity', ship.getModifiedItemAttr('shipBonusAF'), skill='Amarr Frigate', **kwargs)
 
 
@@ -14608,7 +14606,7 @@ class Effect4413(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Torpedoes'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Torpedoes'),
                                         'explosionDelay', ship.getModifiedItemAttr('shipBonusGF'), skill='Gallente Frigate', **kwargs)
 
 
@@ -14625,7 +14623,7 @@ class Effect4415(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Torpedoes'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Torpedoes'),
                                         'explosionDelay', ship.getModifiedItemAttr('shipBonusMF'), skill='Minmatar Frigate', **kwargs)
 
 
@@ -14641,7 +14639,7 @@ class Effect4416(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Torpedoes'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Torpedoes'),
                                         'explosionDelay', ship.getModifiedItemAttr('shipBonusCF'), skill='Caldari Frigate', **kwargs)
 
 
@@ -14657,7 +14655,7 @@ class Effect4417(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Torpedoes'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Torpedoes'),
                                         'explosionDelay', ship.getModifiedItemAttr('shipBonusAF'), skill='Amarr Frigate', **kwargs)
 
 
@@ -14735,7 +14733,7 @@ class Effect4456(BaseEffect):
 
     @staticmethod
     def handler(fit, implant, context, **kwargs):
-        fit.appliedImplants.filteredItemMultiply(lambda target: target.item.requiresSkill('Cybernetics'),
+        fit.appliedImplants.filteredItemMultiply(ItemSkillFilter('Cybernetics'),
                                                  'scanMagnetometricStrengthPercent',
                                                  implant.getModifiedItemAttr('implantSetFederationNavy'), **kwargs)
 
@@ -14753,7 +14751,7 @@ class Effect4457(BaseEffect):
 
     @staticmethod
     def handler(fit, implant, context, **kwargs):
-        fit.appliedImplants.filteredItemMultiply(lambda target: target.item.requiresSkill('Cybernetics'),
+        fit.appliedImplants.filteredItemMultiply(ItemSkillFilter('Cybernetics'),
                                                  'scanRadarStrengthPercent',
                                                  implant.getModifiedItemAttr('implantSetImperialNavy'), **kwargs)
 
@@ -14771,7 +14769,7 @@ class Effect4458(BaseEffect):
 
     @staticmethod
     def handler(fit, implant, context, **kwargs):
-        fit.appliedImplants.filteredItemMultiply(lambda target: target.item.requiresSkill('Cybernetics'),
+        fit.appliedImplants.filteredItemMultiply(ItemSkillFilter('Cybernetics'),
                                                  'scanLadarStrengthPercent',
                                                  implant.getModifiedItemAttr('implantSetRepublicFleet'), **kwargs)
 
@@ -14789,7 +14787,7 @@ class Effect4459(BaseEffect):
 
     @staticmethod
     def handler(fit, implant, context, **kwargs):
-        fit.appliedImplants.filteredItemMultiply(lambda target: target.item.requiresSkill('Cybernetics'),
+        fit.appliedImplants.filteredItemMultiply(ItemSkillFilter('Cybernetics'),
                                                  'scanGravimetricStrengthPercent',
                                                  implant.getModifiedItemAttr('implantSetCaldariNavy'), **kwargs)
 
@@ -14807,7 +14805,7 @@ class Effect4460(BaseEffect):
 
     @staticmethod
     def handler(fit, implant, context, **kwargs):
-        fit.appliedImplants.filteredItemMultiply(lambda target: target.item.requiresSkill('Cybernetics'),
+        fit.appliedImplants.filteredItemMultiply(ItemSkillFilter('Cybernetics'),
                                                  'scanRadarStrengthModifier',
                                                  implant.getModifiedItemAttr('implantSetLGImperialNavy'), **kwargs)
 
@@ -14825,7 +14823,7 @@ class Effect4461(BaseEffect):
 
     @staticmethod
     def handler(fit, implant, context, **kwargs):
-        fit.appliedImplants.filteredItemMultiply(lambda target: target.item.requiresSkill('Cybernetics'),
+        fit.appliedImplants.filteredItemMultiply(ItemSkillFilter('Cybernetics'),
                                                  'scanMagnetometricStrengthModifier',
                                                  implant.getModifiedItemAttr('implantSetLGFederationNavy'), **kwargs)
 
@@ -14843,7 +14841,7 @@ class Effect4462(BaseEffect):
 
     @staticmethod
     def handler(fit, implant, context, **kwargs):
-        fit.appliedImplants.filteredItemMultiply(lambda target: target.item.requiresSkill('Cybernetics'),
+        fit.appliedImplants.filteredItemMultiply(ItemSkillFilter('Cybernetics'),
                                                  'scanGravimetricStrengthModifier',
                                                  implant.getModifiedItemAttr('implantSetLGCaldariNavy'), **kwargs)
 
@@ -14861,7 +14859,7 @@ class Effect4463(BaseEffect):
 
     @staticmethod
     def handler(fit, implant, context, **kwargs):
-        fit.appliedImplants.filteredItemMultiply(lambda target: target.item.requiresSkill('Cybernetics'),
+        fit.appliedImplants.filteredItemMultiply(ItemSkillFilter('Cybernetics'),
                                                  'scanLadarStrengthModifier',
                                                  implant.getModifiedItemAttr('implantSetLGRepublicFleet'), **kwargs)
 
@@ -14878,7 +14876,7 @@ class Effect4464(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Projectile Turret'), 'speed',
+        fit.modules.filteredItemBoost(ItemSkillFilter('Small Projectile Turret'), 'speed',
                                       src.getModifiedItemAttr('shipBonusMF'), stackingPenalties=True, skill='Minmatar Frigate', **kwargs)
 
 
@@ -14896,7 +14894,7 @@ class Effect4471(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Stasis Web',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Stasis Web'),
                                       'maxRange', ship.getModifiedItemAttr('shipBonusMF2'), skill='Minmatar Frigate', **kwargs)
 
 
@@ -14912,7 +14910,7 @@ class Effect4472(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Projectile Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Medium Projectile Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('shipBonusMC'), skill='Minmatar Cruiser', **kwargs)
 
 
@@ -14944,7 +14942,7 @@ class Effect4474(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Projectile Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Medium Projectile Turret'),
                                       'maxRange', ship.getModifiedItemAttr('shipBonusATC2'), **kwargs)
 
 
@@ -14960,7 +14958,7 @@ class Effect4475(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Projectile Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Medium Projectile Turret'),
                                       'falloff', ship.getModifiedItemAttr('shipBonusATC2'), **kwargs)
 
 
@@ -14976,7 +14974,7 @@ class Effect4476(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Projectile Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Small Projectile Turret'),
                                       'falloff', ship.getModifiedItemAttr('shipBonusATF2'), **kwargs)
 
 
@@ -14992,7 +14990,7 @@ class Effect4477(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Projectile Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Small Projectile Turret'),
                                       'maxRange', ship.getModifiedItemAttr('shipBonusATF2'), **kwargs)
 
 
@@ -15008,7 +15006,7 @@ class Effect4478(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Propulsion Module',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Propulsion Module'),
                                       'capacitorNeed', ship.getModifiedItemAttr('shipBonusATF1'), **kwargs)
 
 
@@ -15024,7 +15022,7 @@ class Effect4479(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.group.name == 'Survey Probe',
+        fit.modules.filteredChargeBoost(ChargeGroupFilter('Survey Probe'),
                                         'explosionDelay', ship.getModifiedItemAttr('eliteBonusCovertOps3'),
                                         skill='Covert Ops', **kwargs)
 
@@ -15042,7 +15040,7 @@ class Effect4482(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Energy Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Small Energy Turret'),
                                       'maxRange', ship.getModifiedItemAttr('shipBonus2AF'), skill='Amarr Frigate', **kwargs)
 
 
@@ -15058,7 +15056,7 @@ class Effect4484(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Projectile Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Large Projectile Turret'),
                                       'falloff', ship.getModifiedItemAttr('shipBonusGB'), skill='Gallente Battleship', **kwargs)
 
 
@@ -15074,7 +15072,7 @@ class Effect4485(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Stasis Web',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Stasis Web'),
                                       'speedFactor', ship.getModifiedItemAttr('shipBonusMB'), skill='Minmatar Battleship', **kwargs)
 
 
@@ -15155,7 +15153,7 @@ class Effect4510(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Stasis Web',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Stasis Web'),
                                       'speedFactor', ship.getModifiedItemAttr('shipBonusMC2'), skill='Minmatar Cruiser', **kwargs)
 
 
@@ -15172,7 +15170,7 @@ class Effect4512(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Projectile Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Medium Projectile Turret'),
                                       'falloff', ship.getModifiedItemAttr('shipBonusGC'), skill='Gallente Cruiser', **kwargs)
 
 
@@ -15189,7 +15187,7 @@ class Effect4513(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Stasis Web',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Stasis Web'),
                                       'speedFactor', ship.getModifiedItemAttr('shipBonusMF2'), skill='Minmatar Frigate', **kwargs)
 
 
@@ -15206,7 +15204,7 @@ class Effect4515(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Projectile Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Small Projectile Turret'),
                                       'falloff', ship.getModifiedItemAttr('shipBonusMF'), skill='Minmatar Frigate', **kwargs)
 
 
@@ -15223,7 +15221,7 @@ class Effect4516(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Hybrid Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Medium Hybrid Turret'),
                                       'falloff', ship.getModifiedItemAttr('shipBonusGC'), skill='Gallente Cruiser', **kwargs)
 
 
@@ -15239,7 +15237,7 @@ class Effect4527(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Gunnery'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Gunnery'),
                                       'falloff', module.getModifiedItemAttr('falloffBonus'),
                                       stackingPenalties=True, **kwargs)
 
@@ -15256,7 +15254,7 @@ class Effect4555(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('XL Cruise Missiles'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('XL Cruise Missiles'),
                                         'emDamage', skill.getModifiedItemAttr('damageMultiplierBonus') * skill.level, **kwargs)
 
 
@@ -15272,7 +15270,7 @@ class Effect4556(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('XL Cruise Missiles'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('XL Cruise Missiles'),
                                         'explosiveDamage', skill.getModifiedItemAttr('damageMultiplierBonus') * skill.level, **kwargs)
 
 
@@ -15288,7 +15286,7 @@ class Effect4557(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('XL Cruise Missiles'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('XL Cruise Missiles'),
                                         'kineticDamage', skill.getModifiedItemAttr('damageMultiplierBonus') * skill.level, **kwargs)
 
 
@@ -15304,7 +15302,7 @@ class Effect4558(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('XL Cruise Missiles'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('XL Cruise Missiles'),
                                         'thermalDamage', skill.getModifiedItemAttr('damageMultiplierBonus') * skill.level, **kwargs)
 
 
@@ -15321,7 +15319,7 @@ class Effect4559(BaseEffect):
     @staticmethod
     def handler(fit, module, context, **kwargs):
         for attr in ('maxRange', 'falloff', 'trackingSpeed'):
-            fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Gunnery'),
+            fit.modules.filteredItemBoost(ItemSkillFilter('Gunnery'),
                                           attr, module.getModifiedItemAttr('%sBonus' % attr),
                                           stackingPenalties=True, **kwargs)
 
@@ -15346,55 +15344,55 @@ class Effect4575(BaseEffect):
                                   stackingPenalties=True, **kwargs)
 
         #  Remote Shield Repper Bonuses
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Shield Emission Systems'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Capital Shield Emission Systems'),
                                       'duration', src.getModifiedItemAttr('industrialCoreRemoteLogisticsDurationBonus'), **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Shield Emission Systems'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Capital Shield Emission Systems'),
                                       'maxRange', src.getModifiedItemAttr('industrialCoreRemoteLogisticsRangeBonus'),
                                       stackingPenalties=True, **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Shield Emission Systems'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Capital Shield Emission Systems'),
                                       'capacitorNeed', src.getModifiedItemAttr('industrialCoreRemoteLogisticsDurationBonus'), **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Shield Emission Systems'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Capital Shield Emission Systems'),
                                       'falloffEffectiveness', src.getModifiedItemAttr('industrialCoreRemoteLogisticsRangeBonus'),
                                       stackingPenalties=True, **kwargs)
 
         #  Local Shield Repper Bonuses
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Shield Operation'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Capital Shield Operation'),
                                       'duration', src.getModifiedItemAttr('industrialCoreLocalLogisticsDurationBonus'), **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Shield Operation'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Capital Shield Operation'),
                                       'shieldBonus', src.getModifiedItemAttr('industrialCoreLocalLogisticsAmountBonus'),
                                       stackingPenalties=True, **kwargs)
 
         # Mining Burst Bonuses
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Mining Foreman'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Mining Foreman'),
                                       'warfareBuff1Value', src.getModifiedItemAttr('industrialCoreBonusMiningBurstStrength'), **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Mining Foreman'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Mining Foreman'),
                                       'warfareBuff2Value', src.getModifiedItemAttr('industrialCoreBonusMiningBurstStrength'), **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Mining Foreman'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Mining Foreman'),
                                       'warfareBuff3Value', src.getModifiedItemAttr('industrialCoreBonusMiningBurstStrength'), **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Mining Foreman'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Mining Foreman'),
                                       'warfareBuff4Value', src.getModifiedItemAttr('industrialCoreBonusMiningBurstStrength'), **kwargs)
 
         #  Command Burst Range Bonus
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Leadership'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Leadership'),
                                       'maxRange', src.getModifiedItemAttr('industrialCoreBonusCommandBurstRange'),
                                       stackingPenalties=True, **kwargs)
 
         # Drone Bonuses
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Ice Harvesting Drone Operation'),
+        fit.drones.filteredItemBoost(ItemSkillFilter('Ice Harvesting Drone Operation'),
                                      'duration', src.getModifiedItemAttr('industrialCoreBonusDroneIceHarvesting'), **kwargs)
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Mining Drone Operation'),
+        fit.drones.filteredItemBoost(ItemSkillFilter('Mining Drone Operation'),
                                      'miningAmount', src.getModifiedItemAttr('industrialCoreBonusDroneMining'), **kwargs)
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+        fit.drones.filteredItemBoost(ItemSkillFilter('Drones'),
                                      'maxVelocity', src.getModifiedItemAttr('industrialCoreBonusDroneVelocity'),
                                      stackingPenalties=True, **kwargs)
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+        fit.drones.filteredItemBoost(ItemSkillFilter('Drones'),
                                      'damageMultiplier', src.getModifiedItemAttr('industrialCoreBonusDroneDamageHP'),
                                      stackingPenalties=True, **kwargs)
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+        fit.drones.filteredItemBoost(ItemSkillFilter('Drones'),
                                      'shieldCapacity', src.getModifiedItemAttr('industrialCoreBonusDroneDamageHP'), **kwargs)
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+        fit.drones.filteredItemBoost(ItemSkillFilter('Drones'),
                                      'armorHP', src.getModifiedItemAttr('industrialCoreBonusDroneDamageHP'), **kwargs)
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+        fit.drones.filteredItemBoost(ItemSkillFilter('Drones'),
                                      'hp', src.getModifiedItemAttr('industrialCoreBonusDroneDamageHP'), **kwargs)
 
         # Remote impedance (no reps, etc)
@@ -15418,7 +15416,7 @@ class Effect4576(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Remote Tracking Computer',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Remote Tracking Computer'),
                                       'falloffBonus', ship.getModifiedItemAttr('eliteBonusLogistics1'),
                                       skill='Logistics Cruisers', **kwargs)
 
@@ -15435,7 +15433,7 @@ class Effect4577(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Remote Tracking Computer',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Remote Tracking Computer'),
                                       'falloffBonus', ship.getModifiedItemAttr('eliteBonusLogistics2'),
                                       skill='Logistics Cruisers', **kwargs)
 
@@ -15452,7 +15450,7 @@ class Effect4579(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, **kwargs):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.group.name == 'Stasis Webifying Drone',
+        fit.drones.filteredItemBoost(ItemGroupFilter('Stasis Webifying Drone'),
                                      'speedFactor', module.getModifiedItemAttr('webSpeedFactorBonus'), **kwargs)
 
 
@@ -15468,7 +15466,7 @@ class Effect4619(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+        fit.drones.filteredItemBoost(ItemSkillFilter('Drones'),
                                      'damageMultiplier', ship.getModifiedItemAttr('shipBonusGF2'), skill='Gallente Frigate', **kwargs)
 
 
@@ -15485,7 +15483,7 @@ class Effect4620(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Warp Scrambler',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Warp Scrambler'),
                                       'maxRange', ship.getModifiedItemAttr('shipBonusGF2'), skill='Gallente Frigate', **kwargs)
 
 
@@ -15519,7 +15517,7 @@ class Effect4622(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Hybrid Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Small Hybrid Turret'),
                                       'maxRange', ship.getModifiedItemAttr('shipBonusATF2'), **kwargs)
 
 
@@ -15535,7 +15533,7 @@ class Effect4623(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Hybrid Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Small Hybrid Turret'),
                                       'trackingSpeed', ship.getModifiedItemAttr('shipBonusATF2'), **kwargs)
 
 
@@ -15551,7 +15549,7 @@ class Effect4624(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Hybrid Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Medium Hybrid Turret'),
                                       'trackingSpeed', ship.getModifiedItemAttr('shipBonusATC2'), **kwargs)
 
 
@@ -15567,7 +15565,7 @@ class Effect4625(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Hybrid Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Medium Hybrid Turret'),
                                       'falloff', ship.getModifiedItemAttr('shipBonusATC2'), **kwargs)
 
 
@@ -15584,7 +15582,7 @@ class Effect4626(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Warp Scrambler',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Warp Scrambler'),
                                       'maxRange', ship.getModifiedItemAttr('shipBonusGC2'), skill='Gallente Cruiser', **kwargs)
 
 
@@ -15603,7 +15601,7 @@ class Effect4635(BaseEffect):
         damageTypes = ('em', 'explosive', 'kinetic', 'thermal')
         for damageType in damageTypes:
             fit.modules.filteredChargeBoost(
-                lambda mod: mod.charge.requiresSkill('Cruise Missiles') or mod.charge.requiresSkill('Torpedoes'),
+                ChargeSkillFilter('Cruise Missiles', 'Torpedoes'),
                 '{0}Damage'.format(damageType), ship.getModifiedItemAttr('eliteBonusViolatorsRole1'), **kwargs)
 
 
@@ -15620,7 +15618,7 @@ class Effect4636(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, **kwargs):
         fit.modules.filteredChargeBoost(
-            lambda mod: mod.charge.requiresSkill('Cruise Missiles') or mod.charge.requiresSkill('Torpedoes'),
+            ChargeSkillFilter('Cruise Missiles', 'Torpedoes'),
             'aoeVelocity', ship.getModifiedItemAttr('shipBonus2CB'), skill='Caldari Battleship', **kwargs)
 
 
@@ -15638,7 +15636,7 @@ class Effect4637(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, **kwargs):
         fit.modules.filteredChargeBoost(
-            lambda mod: mod.charge.requiresSkill('Cruise Missiles') or mod.charge.requiresSkill('Torpedoes'),
+            ChargeSkillFilter('Cruise Missiles', 'Torpedoes'),
             'maxVelocity', ship.getModifiedItemAttr('shipBonusCB3'), skill='Caldari Battleship', **kwargs)
 
 
@@ -15676,7 +15674,7 @@ class Effect4643(BaseEffect):
     def handler(fit, ship, context, **kwargs):
         damageTypes = ('em', 'explosive', 'kinetic', 'thermal')
         for damageType in damageTypes:
-            fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Assault Missiles'),
+            fit.modules.filteredChargeBoost(ChargeSkillFilter('Heavy Assault Missiles'),
                                             '{0}Damage'.format(damageType), ship.getModifiedItemAttr('shipBonusAC'),
                                             skill='Amarr Cruiser', **kwargs)
 
@@ -15694,7 +15692,7 @@ class Effect4645(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, **kwargs):
         groups = ('Missile Launcher Rapid Light', 'Missile Launcher Heavy Assault', 'Missile Launcher Heavy')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name in groups,
+        fit.modules.filteredItemBoost(ItemGroupFilter(*groups),
                                       'speed', ship.getModifiedItemAttr('eliteBonusHeavyGunship2'),
                                       skill='Heavy Assault Cruisers', **kwargs)
 
@@ -15713,7 +15711,7 @@ class Effect4648(BaseEffect):
     def handler(fit, ship, context, **kwargs):
         sensorTypes = ('Gravimetric', 'Ladar', 'Magnetometric', 'Radar')
         for type in sensorTypes:
-            fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'ECM', 'scan{0}StrengthBonus'.format(type),
+            fit.modules.filteredItemBoost(ItemGroupFilter('ECM'), 'scan{0}StrengthBonus'.format(type),
                                           ship.getModifiedItemAttr('eliteBonusBlackOps1'), skill='Black Ops', **kwargs)
 
 
@@ -15730,7 +15728,7 @@ class Effect4649(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, **kwargs):
         affectedGroups = ('Missile Launcher Cruise', 'Missile Launcher Torpedo')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name in affectedGroups,
+        fit.modules.filteredItemBoost(ItemGroupFilter(*affectedGroups),
                                       'speed', ship.getModifiedItemAttr('shipBonus2CB'), skill='Caldari Battleship', **kwargs)
 
 
@@ -15746,7 +15744,7 @@ class Effect4667(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Salvaging'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Salvaging'),
                                       'duration', ship.getModifiedItemAttr('shipBonusOreIndustrial1'),
                                       skill='ORE Industrial', **kwargs)
 
@@ -15763,7 +15761,7 @@ class Effect4668(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Tractor Beam',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Tractor Beam'),
                                       'duration', ship.getModifiedItemAttr('shipBonusOreIndustrial1'),
                                       skill='ORE Industrial', **kwargs)
 
@@ -15780,7 +15778,7 @@ class Effect4669(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Tractor Beam',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Tractor Beam'),
                                       'maxTractorVelocity', ship.getModifiedItemAttr('shipBonusOreIndustrial2'),
                                       skill='ORE Industrial', **kwargs)
 
@@ -15797,7 +15795,7 @@ class Effect4670(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Tractor Beam',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Tractor Beam'),
                                       'maxRange', ship.getModifiedItemAttr('shipBonusOreIndustrial2'),
                                       skill='ORE Industrial', **kwargs)
 
@@ -15819,11 +15817,11 @@ class Effect4728(BaseEffect):
         damages = ('em', 'thermal', 'kinetic', 'explosive')
         for damage in damages:
             # Nerf missile damage
-            fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+            fit.modules.filteredChargeBoost(ChargeSkillFilter('Missile Launcher Operation'),
                                             '{0}Damage'.format(damage),
                                             beacon.getModifiedItemAttr('systemEffectDamageReduction'), **kwargs)
             # Nerf smartbomb damage
-            fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Smart Bomb',
+            fit.modules.filteredItemBoost(ItemGroupFilter('Smart Bomb'),
                                           '{0}Damage'.format(damage),
                                           beacon.getModifiedItemAttr('systemEffectDamageReduction'), **kwargs)
             # Nerf armor resistances
@@ -15836,7 +15834,7 @@ class Effect4728(BaseEffect):
         fit.drones.filteredItemBoost(lambda drone: True,
                                      'damageMultiplier', beacon.getModifiedItemAttr('systemEffectDamageReduction'), **kwargs)
         # Nerf turret damage output
-        fit.modules.filteredItemBoost(lambda module: module.item.requiresSkill('Gunnery'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Gunnery'),
                                       'damageMultiplier', beacon.getModifiedItemAttr('systemEffectDamageReduction'), **kwargs)
 
 
@@ -15868,7 +15866,7 @@ class Effect4775(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Neutralizer',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Energy Neutralizer'),
                                       'energyNeutralizerAmount', ship.getModifiedItemAttr('shipBonus2AF'),
                                       skill='Amarr Frigate', **kwargs)
 
@@ -15885,7 +15883,7 @@ class Effect4782(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Energy Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Small Energy Turret'),
                                       'maxRange', ship.getModifiedItemAttr('shipBonusATF2'), **kwargs)
 
 
@@ -15901,7 +15899,7 @@ class Effect4789(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Energy Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Small Energy Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('shipBonusATF1'), **kwargs)
 
 
@@ -15917,7 +15915,7 @@ class Effect4793(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Missile Launcher Heavy',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Missile Launcher Heavy'),
                                       'speed', ship.getModifiedItemAttr('shipBonusATC1'), **kwargs)
 
 
@@ -15933,7 +15931,7 @@ class Effect4794(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Missile Launcher Rapid Light',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Missile Launcher Rapid Light'),
                                       'speed', ship.getModifiedItemAttr('shipBonusATC1'), **kwargs)
 
 
@@ -15949,7 +15947,7 @@ class Effect4795(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Missile Launcher Heavy Assault',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Missile Launcher Heavy Assault'),
                                       'speed', ship.getModifiedItemAttr('shipBonusATC1'), **kwargs)
 
 
@@ -15967,7 +15965,7 @@ class Effect4799(BaseEffect):
     def handler(fit, ship, context, **kwargs):
         sensorTypes = ('Gravimetric', 'Ladar', 'Magnetometric', 'Radar')
         for type in sensorTypes:
-            fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Burst Jammer',
+            fit.modules.filteredItemBoost(ItemGroupFilter('Burst Jammer'),
                                           'scan{0}StrengthBonus'.format(type),
                                           ship.getModifiedItemAttr('eliteBonusBlackOps1'), skill='Black Ops', **kwargs)
 
@@ -15986,7 +15984,7 @@ class Effect4804(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context, **kwargs):
-        fit.modules.filteredItemMultiply(lambda mod: mod.item.requiresSkill(skill), 'accessDifficultyBonus',
+        fit.modules.filteredItemMultiply(ItemSkillFilter(skill), 'accessDifficultyBonus',
                                          skill.getModifiedItemAttr('accessDifficultyBonusAbsolutePercent') * skill.level, **kwargs)
 
 
@@ -16002,7 +16000,7 @@ class Effect4809(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'ECM',
+        fit.modules.filteredItemBoost(ItemGroupFilter('ECM'),
                                       'scanGravimetricStrengthBonus', module.getModifiedItemAttr('ecmStrengthBonusPercent'),
                                       stackingPenalties=True, **kwargs)
 
@@ -16019,7 +16017,7 @@ class Effect4810(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'ECM',
+        fit.modules.filteredItemBoost(ItemGroupFilter('ECM'),
                                       'scanLadarStrengthBonus', module.getModifiedItemAttr('ecmStrengthBonusPercent'),
                                       stackingPenalties=True, **kwargs)
 
@@ -16036,7 +16034,7 @@ class Effect4811(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'ECM',
+        fit.modules.filteredItemBoost(ItemGroupFilter('ECM'),
                                       'scanMagnetometricStrengthBonus',
                                       module.getModifiedItemAttr('ecmStrengthBonusPercent'),
                                       stackingPenalties=True, **kwargs)
@@ -16054,7 +16052,7 @@ class Effect4812(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'ECM',
+        fit.modules.filteredItemBoost(ItemGroupFilter('ECM'),
                                       'scanRadarStrengthBonus', module.getModifiedItemAttr('ecmStrengthBonusPercent'),
                                       stackingPenalties=True, **kwargs)
 
@@ -16071,7 +16069,7 @@ class Effect4814(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill(skill), 'consumptionQuantity',
+        fit.modules.filteredItemBoost(ItemSkillFilter(skill), 'consumptionQuantity',
                                       skill.getModifiedItemAttr('consumptionQuantityBonusPercent') * skill.level, **kwargs)
 
 
@@ -16087,7 +16085,7 @@ class Effect4817(BaseEffect):
 
     @staticmethod
     def handler(fit, implant, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Salvager',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Salvager'),
                                       'duration', implant.getModifiedItemAttr('durationBonus'), **kwargs)
 
 
@@ -16103,7 +16101,7 @@ class Effect4820(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemMultiply(lambda mod: mod.item.requiresSkill('Large Energy Turret'),
+        fit.modules.filteredItemMultiply(ItemSkillFilter('Large Energy Turret'),
                                          'power', ship.getModifiedItemAttr('bcLargeTurretPower'), **kwargs)
 
 
@@ -16120,7 +16118,7 @@ class Effect4821(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemMultiply(lambda mod: mod.item.requiresSkill('Large Hybrid Turret'),
+        fit.modules.filteredItemMultiply(ItemSkillFilter('Large Hybrid Turret'),
                                          'power', ship.getModifiedItemAttr('bcLargeTurretPower'), **kwargs)
 
 
@@ -16136,7 +16134,7 @@ class Effect4822(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemMultiply(lambda mod: mod.item.requiresSkill('Large Projectile Turret'),
+        fit.modules.filteredItemMultiply(ItemSkillFilter('Large Projectile Turret'),
                                          'power', ship.getModifiedItemAttr('bcLargeTurretPower'), **kwargs)
 
 
@@ -16152,7 +16150,7 @@ class Effect4823(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemMultiply(lambda mod: mod.item.requiresSkill('Large Energy Turret'),
+        fit.modules.filteredItemMultiply(ItemSkillFilter('Large Energy Turret'),
                                          'cpu', ship.getModifiedItemAttr('bcLargeTurretCPU'), **kwargs)
 
 
@@ -16169,7 +16167,7 @@ class Effect4824(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemMultiply(lambda mod: mod.item.requiresSkill('Large Hybrid Turret'),
+        fit.modules.filteredItemMultiply(ItemSkillFilter('Large Hybrid Turret'),
                                          'cpu', ship.getModifiedItemAttr('bcLargeTurretCPU'), **kwargs)
 
 
@@ -16185,7 +16183,7 @@ class Effect4825(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemMultiply(lambda mod: mod.item.requiresSkill('Large Projectile Turret'),
+        fit.modules.filteredItemMultiply(ItemSkillFilter('Large Projectile Turret'),
                                          'cpu', ship.getModifiedItemAttr('bcLargeTurretCPU'), **kwargs)
 
 
@@ -16201,7 +16199,7 @@ class Effect4826(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemMultiply(lambda mod: mod.item.requiresSkill('Large Energy Turret'),
+        fit.modules.filteredItemMultiply(ItemSkillFilter('Large Energy Turret'),
                                          'capacitorNeed', ship.getModifiedItemAttr('bcLargeTurretCap'), **kwargs)
 
 
@@ -16218,7 +16216,7 @@ class Effect4827(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemMultiply(lambda mod: mod.item.requiresSkill('Large Hybrid Turret'),
+        fit.modules.filteredItemMultiply(ItemSkillFilter('Large Hybrid Turret'),
                                          'capacitorNeed', ship.getModifiedItemAttr('bcLargeTurretCap'), **kwargs)
 
 
@@ -16235,7 +16233,7 @@ class Effect4867(BaseEffect):
 
     @staticmethod
     def handler(fit, implant, context, **kwargs):
-        fit.appliedImplants.filteredItemMultiply(lambda mod: mod.item.group.name == 'Special Edition Implant',
+        fit.appliedImplants.filteredItemMultiply(ItemGroupFilter('Special Edition Implant'),
                                                  'powerEngineeringOutputBonus',
                                                  implant.getModifiedItemAttr('implantSetChristmas'), **kwargs)
 
@@ -16253,7 +16251,7 @@ class Effect4868(BaseEffect):
 
     @staticmethod
     def handler(fit, implant, context, **kwargs):
-        fit.appliedImplants.filteredItemMultiply(lambda mod: mod.item.group.name == 'Special Edition Implant',
+        fit.appliedImplants.filteredItemMultiply(ItemGroupFilter('Special Edition Implant'),
                                                  'capacitorCapacityBonus',
                                                  implant.getModifiedItemAttr('implantSetChristmas'), **kwargs)
 
@@ -16271,7 +16269,7 @@ class Effect4869(BaseEffect):
 
     @staticmethod
     def handler(fit, implant, context, **kwargs):
-        fit.appliedImplants.filteredItemMultiply(lambda mod: mod.item.group.name == 'Special Edition Implant',
+        fit.appliedImplants.filteredItemMultiply(ItemGroupFilter('Special Edition Implant'),
                                                  'cpuOutputBonus2', implant.getModifiedItemAttr('implantSetChristmas'), **kwargs)
 
 
@@ -16288,7 +16286,7 @@ class Effect4871(BaseEffect):
 
     @staticmethod
     def handler(fit, implant, context, **kwargs):
-        fit.appliedImplants.filteredItemMultiply(lambda mod: mod.item.group.name == 'Special Edition Implant',
+        fit.appliedImplants.filteredItemMultiply(ItemGroupFilter('Special Edition Implant'),
                                                  'capRechargeBonus', implant.getModifiedItemAttr('implantSetChristmas'), **kwargs)
 
 
@@ -16304,7 +16302,7 @@ class Effect4896(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+        fit.drones.filteredItemBoost(ItemSkillFilter('Drones'),
                                      'hp', ship.getModifiedItemAttr('shipBonusGF2'), skill='Gallente Frigate', **kwargs)
 
 
@@ -16320,7 +16318,7 @@ class Effect4897(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+        fit.drones.filteredItemBoost(ItemSkillFilter('Drones'),
                                      'armorHP', ship.getModifiedItemAttr('shipBonusGF2'), skill='Gallente Frigate', **kwargs)
 
 
@@ -16336,7 +16334,7 @@ class Effect4898(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+        fit.drones.filteredItemBoost(ItemSkillFilter('Drones'),
                                      'shieldCapacity', ship.getModifiedItemAttr('shipBonusGF2'), skill='Gallente Frigate', **kwargs)
 
 
@@ -16352,7 +16350,7 @@ class Effect4901(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Missile Launcher Operation'),
                                       'speed', ship.getModifiedItemAttr('shipBonus2AF'), skill='Amarr Frigate', **kwargs)
 
 
@@ -16370,7 +16368,7 @@ class Effect4902(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('High Speed Maneuvering'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('High Speed Maneuvering'),
                                       'signatureRadiusBonus', ship.getModifiedItemAttr('MWDSignatureRadiusBonus'), **kwargs)
 
 
@@ -16387,7 +16385,7 @@ class Effect4906(BaseEffect):
 
     @staticmethod
     def handler(fit, beacon, context, **kwargs):
-        fit.drones.filteredItemMultiply(lambda drone: drone.item.requiresSkill('Fighters'),
+        fit.drones.filteredItemMultiply(ItemSkillFilter('Fighters'),
                                         'damageMultiplier', beacon.getModifiedItemAttr('damageMultiplierMultiplier'),
                                         stackingPenalties=True, penaltyGroup='postMul', **kwargs)
 
@@ -16434,7 +16432,7 @@ class Effect4923(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Micro Jump Drive Operation'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Micro Jump Drive Operation'),
                                       'duration', skill.getModifiedItemAttr('durationBonus') * skill.level, **kwargs)
 
 
@@ -16581,7 +16579,7 @@ class Effect4934(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Repair Systems'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Repair Systems'),
                                       'armorDamageAmount', ship.getModifiedItemAttr('shipBonusGF2'),
                                       skill='Gallente Frigate', **kwargs)
 
@@ -16617,7 +16615,7 @@ class Effect4941(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Hybrid Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Small Hybrid Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('shipBonusCF2'), skill='Caldari Frigate', **kwargs)
 
 
@@ -16644,7 +16642,7 @@ class Effect4945(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Target Breaker',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Target Breaker'),
                                       'duration', skill.getModifiedItemAttr('durationBonus') * skill.level, **kwargs)
 
 
@@ -16660,7 +16658,7 @@ class Effect4946(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Target Breaker',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Target Breaker'),
                                       'capacitorNeed', skill.getModifiedItemAttr('capNeedBonus') * skill.level, **kwargs)
 
 
@@ -16676,7 +16674,7 @@ class Effect4950(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Operation'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Shield Operation'),
                                       'shieldBonus', ship.getModifiedItemAttr('shipBonusMB'), skill='Minmatar Battleship', **kwargs)
 
 
@@ -16695,7 +16693,7 @@ class Effect4951(BaseEffect):
     @staticmethod
     def handler(fit, container, context, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Shield Operation') or mod.item.requiresSkill('Capital Shield Operation'),
+            ItemSkillFilter('Shield Operation', 'Capital Shield Operation'),
             'shieldBonus', container.getModifiedItemAttr('shieldBoostMultiplier'), **kwargs)
 
 
@@ -16712,8 +16710,7 @@ class Effect4961(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, **kwargs):
-        fit.modules.filteredItemMultiply(lambda mod: mod.item.requiresSkill('Shield Operation') or
-                                                     mod.item.requiresSkill('Capital Shield Operation'),
+        fit.modules.filteredItemMultiply(ItemSkillFilter('Shield Operation', 'Capital Shield Operation'),
                                          'shieldBonus', module.getModifiedItemAttr('shieldBonusMultiplier'),
                                          stackingPenalties=True, penaltyGroup='postMul', **kwargs)
 
@@ -16731,7 +16728,7 @@ class Effect4967(BaseEffect):
     @staticmethod
     def handler(fit, module, context, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Shield Operation') or mod.item.requiresSkill('Capital Shield Operation'),
+            ItemSkillFilter('Shield Operation', 'Capital Shield Operation'),
             'duration', module.getModifiedItemAttr('durationSkillBonus'), **kwargs)
 
 
@@ -16751,7 +16748,7 @@ class Effect4970(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Operation') or mod.item.requiresSkill('Capital Shield Operation'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Shield Operation', 'Capital Shield Operation'),
                                       'shieldBonus', src.getModifiedItemAttr('boosterShieldBoostAmountPenalty'), **kwargs)
 
 
@@ -16767,7 +16764,7 @@ class Effect4972(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Missile Launcher Light',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Missile Launcher Light'),
                                       'speed', ship.getModifiedItemAttr('eliteBonusGunship1'), skill='Assault Frigates', **kwargs)
 
 
@@ -16783,7 +16780,7 @@ class Effect4973(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Missile Launcher Rocket',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Missile Launcher Rocket'),
                                       'speed', ship.getModifiedItemAttr('eliteBonusGunship1'), skill='Assault Frigates', **kwargs)
 
 
@@ -16800,7 +16797,7 @@ class Effect4974(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Operation'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Shield Operation'),
                                       'shieldBonus', ship.getModifiedItemAttr('eliteBonusViolators2'), skill='Marauders', **kwargs)
 
 
@@ -16816,7 +16813,7 @@ class Effect4975(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Missile Launcher Operation'),
                                         'kineticDamage', ship.getModifiedItemAttr('shipBonusATF2'), **kwargs)
 
 
@@ -16833,9 +16830,9 @@ class Effect4976(BaseEffect):
     @staticmethod
     def handler(fit, src, context, **kwargs):
         lvl = src.level
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Armor Resistance Shift Hardener', 'duration',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Armor Resistance Shift Hardener'), 'duration',
                                       src.getModifiedItemAttr('durationBonus') * lvl, **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Resistance Phasing'), 'duration',
+        fit.modules.filteredItemBoost(ItemSkillFilter('Resistance Phasing'), 'duration',
                                       src.getModifiedItemAttr('durationBonus') * lvl, **kwargs)
 
 
@@ -16851,7 +16848,7 @@ class Effect4989(BaseEffect):
 
     @staticmethod
     def handler(fit, implant, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Missile Launcher Operation'),
                                         'aoeCloudSize', implant.getModifiedItemAttr('aoeCloudSizeBonus'), **kwargs)
 
 
@@ -16868,7 +16865,7 @@ class Effect4990(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Energy Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Small Energy Turret'),
                                       'capacitorNeed', ship.getModifiedItemAttr('rookieSETCapBonus'), **kwargs)
 
 
@@ -16886,7 +16883,7 @@ class Effect4991(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Energy Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Small Energy Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('rookieSETDamageBonus'), **kwargs)
 
 
@@ -16978,7 +16975,7 @@ class Effect4999(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Hybrid Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Small Hybrid Turret'),
                                       'maxRange', ship.getModifiedItemAttr('rookieSHTOptimalBonus'), **kwargs)
 
 
@@ -16994,7 +16991,7 @@ class Effect5000(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Missile Launcher Operation'),
                                         'kineticDamage', ship.getModifiedItemAttr('rookieMissileKinDamageBonus'), **kwargs)
 
 
@@ -17080,7 +17077,7 @@ class Effect5013(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Hybrid Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Small Hybrid Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('rookieSHTDamageBonus'), **kwargs)
 
 
@@ -17100,7 +17097,7 @@ class Effect5014(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+        fit.drones.filteredItemBoost(ItemSkillFilter('Drones'),
                                      'damageMultiplier', ship.getModifiedItemAttr('rookieDroneBonus'), **kwargs)
 
 
@@ -17116,7 +17113,7 @@ class Effect5015(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Sensor Dampener',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Sensor Dampener'),
                                       'maxTargetRangeBonus', ship.getModifiedItemAttr('rookieDampStrengthBonus'), **kwargs)
 
 
@@ -17132,7 +17129,7 @@ class Effect5016(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Sensor Dampener',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Sensor Dampener'),
                                       'scanResolutionBonus', ship.getModifiedItemAttr('rookieDampStrengthBonus'), **kwargs)
 
 
@@ -17148,7 +17145,7 @@ class Effect5017(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Repair Systems'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Repair Systems'),
                                       'armorDamageAmount', ship.getModifiedItemAttr('rookieArmorRepBonus'), **kwargs)
 
 
@@ -17179,7 +17176,7 @@ class Effect5019(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Target Painter',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Target Painter'),
                                       'signatureRadiusBonus', ship.getModifiedItemAttr('rookieTargetPainterStrengthBonus'), **kwargs)
 
 
@@ -17196,7 +17193,7 @@ class Effect5020(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Projectile Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Small Projectile Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('rookieSPTDamageBonus'), **kwargs)
 
 
@@ -17213,7 +17210,7 @@ class Effect5021(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Operation'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Shield Operation'),
                                       'shieldBonus', ship.getModifiedItemAttr('rookieShieldBoostBonus'), **kwargs)
 
 
@@ -17230,7 +17227,7 @@ class Effect5028(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, **kwargs):
         for type in ('Gravimetric', 'Ladar', 'Radar', 'Magnetometric'):
-            fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'ECM',
+            fit.modules.filteredItemBoost(ItemGroupFilter('ECM'),
                                           'scan{0}StrengthBonus'.format(type),
                                           ship.getModifiedItemAttr('rookieECMStrengthBonus'), **kwargs)
 
@@ -17247,7 +17244,7 @@ class Effect5029(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Mining Drone Operation'),
+        fit.drones.filteredItemBoost(ItemSkillFilter('Mining Drone Operation'),
                                      'miningAmount', src.getModifiedItemAttr('roleBonusDroneMiningYield'), **kwargs)
 
 
@@ -17266,7 +17263,7 @@ class Effect5030(BaseEffect):
 
     @staticmethod
     def handler(fit, container, context, **kwargs):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Mining Drone Operation'),
+        fit.drones.filteredItemBoost(ItemSkillFilter('Mining Drone Operation'),
                                      'miningAmount', container.getModifiedItemAttr('rookieDroneBonus'), **kwargs)
 
 
@@ -17288,7 +17285,7 @@ class Effect5035(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, **kwargs):
         for type in ('shieldCapacity', 'armorHP', 'hp'):
-            fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+            fit.drones.filteredItemBoost(ItemSkillFilter('Drones'),
                                          type, ship.getModifiedItemAttr('rookieDroneBonus'), **kwargs)
 
 
@@ -17304,7 +17301,7 @@ class Effect5036(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Salvaging'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Salvaging'),
                                       'duration', ship.getModifiedItemAttr('shipBonusAF'), skill='Amarr Frigate', **kwargs)
 
 
@@ -17320,7 +17317,7 @@ class Effect5045(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Salvaging'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Salvaging'),
                                       'duration', ship.getModifiedItemAttr('shipBonusCF'), skill='Caldari Frigate', **kwargs)
 
 
@@ -17336,7 +17333,7 @@ class Effect5048(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Salvaging'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Salvaging'),
                                       'duration', ship.getModifiedItemAttr('shipBonusGF'), skill='Amarr Frigate', **kwargs)
 
 
@@ -17352,7 +17349,7 @@ class Effect5051(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Salvaging'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Salvaging'),
                                       'duration', ship.getModifiedItemAttr('shipBonusMF'), skill='Minmatar Frigate', **kwargs)
 
 
@@ -17368,7 +17365,7 @@ class Effect5055(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemMultiply(lambda mod: mod.item.requiresSkill('Ice Harvesting'),
+        fit.modules.filteredItemMultiply(ItemSkillFilter('Ice Harvesting'),
                                          'duration', ship.getModifiedItemAttr('iceHarvestCycleBonus'), **kwargs)
 
 
@@ -17384,7 +17381,7 @@ class Effect5058(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, **kwargs):
-        fit.modules.filteredItemMultiply(lambda mod: mod.item.requiresSkill('Mining'),
+        fit.modules.filteredItemMultiply(ItemSkillFilter('Mining'),
                                          'miningAmount', module.getModifiedItemAttr('miningAmountMultiplier'), **kwargs)
 
 
@@ -17401,7 +17398,7 @@ class Effect5059(BaseEffect):
 
     @staticmethod
     def handler(fit, container, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Ice Harvesting'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Ice Harvesting'),
                                       'duration', container.getModifiedItemAttr('shipBonusORE3'), skill='Mining Barge', **kwargs)
 
 
@@ -17418,7 +17415,7 @@ class Effect5066(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Target Painting'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Target Painting'),
                                       'maxRange', ship.getModifiedItemAttr('shipBonusMF'), skill='Minmatar Frigate', **kwargs)
 
 
@@ -17465,7 +17462,7 @@ class Effect5069(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Mercoxit Processing'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Mercoxit Processing'),
                                         'specialisationAsteroidYieldMultiplier',
                                         module.getModifiedItemAttr('miningAmountBonus'), **kwargs)
 
@@ -17482,7 +17479,7 @@ class Effect5079(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Missile Launcher Operation'),
                                         'kineticDamage', ship.getModifiedItemAttr('shipBonusCF2'), skill='Caldari Frigate', **kwargs)
 
 
@@ -17500,7 +17497,7 @@ class Effect5080(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Missile Launcher Operation'),
                                         'maxVelocity', ship.getModifiedItemAttr('shipBonusCF'), skill='Caldari Frigate', **kwargs)
 
 
@@ -17535,7 +17532,7 @@ class Effect5087(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, **kwargs):
         for layer in ('shieldCapacity', 'armorHP', 'hp'):
-            fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+            fit.drones.filteredItemBoost(ItemSkillFilter('Drones'),
                                          layer, ship.getModifiedItemAttr('shipBonusGF'), skill='Gallente Frigate', **kwargs)
 
 
@@ -17552,7 +17549,7 @@ class Effect5090(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Operation'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Shield Operation'),
                                       'shieldBonus', ship.getModifiedItemAttr('shipBonusMF'), skill='Minmatar Frigate', **kwargs)
 
 
@@ -17568,7 +17565,7 @@ class Effect5103(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Emission Systems'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Shield Emission Systems'),
                                       'capacitorNeed', ship.getModifiedItemAttr('shipBonusCF'), skill='Caldari Frigate', **kwargs)
 
 
@@ -17584,7 +17581,7 @@ class Effect5104(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Emission Systems'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Shield Emission Systems'),
                                       'shieldBonus', ship.getModifiedItemAttr('shipBonusCF2'), skill='Caldari Frigate', **kwargs)
 
 
@@ -17600,7 +17597,7 @@ class Effect5105(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Emission Systems'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Shield Emission Systems'),
                                       'capacitorNeed', ship.getModifiedItemAttr('shipBonusMF'), skill='Minmatar Frigate', **kwargs)
 
 
@@ -17616,7 +17613,7 @@ class Effect5106(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Emission Systems'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Shield Emission Systems'),
                                       'shieldBonus', ship.getModifiedItemAttr('shipBonusMF2'), skill='Minmatar Frigate', **kwargs)
 
 
@@ -17632,7 +17629,7 @@ class Effect5107(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Remote Armor Repair Systems'), 'capacitorNeed',
+        fit.modules.filteredItemBoost(ItemSkillFilter('Remote Armor Repair Systems'), 'capacitorNeed',
                                       src.getModifiedItemAttr('shipBonusGF'), skill='Gallente Frigate', **kwargs)
 
 
@@ -17648,7 +17645,7 @@ class Effect5108(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Remote Armor Repair Systems'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Remote Armor Repair Systems'),
                                       'armorDamageAmount', src.getModifiedItemAttr('shipBonusGF2'),
                                       skill='Gallente Frigate', **kwargs)
 
@@ -17666,7 +17663,7 @@ class Effect5109(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Remote Armor Repair Systems'), 'capacitorNeed',
+        fit.modules.filteredItemBoost(ItemSkillFilter('Remote Armor Repair Systems'), 'capacitorNeed',
                                       src.getModifiedItemAttr('shipBonusAF'), skill='Amarr Frigate', **kwargs)
 
 
@@ -17683,7 +17680,7 @@ class Effect5110(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Remote Armor Repair Systems'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Remote Armor Repair Systems'),
                                       'armorDamageAmount', src.getModifiedItemAttr('shipBonus2AF'), skill='Amarr Frigate', **kwargs)
 
 
@@ -17700,7 +17697,7 @@ class Effect5111(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+        fit.drones.filteredItemBoost(ItemSkillFilter('Drones'),
                                      'trackingSpeed', ship.getModifiedItemAttr('shipBonusGF'), skill='Gallente Frigate', **kwargs)
 
 
@@ -17716,7 +17713,7 @@ class Effect5119(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.group.name == 'Scanner Probe',
+        fit.modules.filteredChargeBoost(ChargeGroupFilter('Scanner Probe'),
                                         'baseSensorStrength', ship.getModifiedItemAttr('shipBonus2AF'),
                                         skill='Amarr Frigate', **kwargs)
 
@@ -17734,7 +17731,7 @@ class Effect5121(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Remote Capacitor Transmitter',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Remote Capacitor Transmitter'),
                                       'powerTransferAmount', ship.getModifiedItemAttr('energyTransferAmountBonus'), **kwargs)
 
 
@@ -17750,7 +17747,7 @@ class Effect5122(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Emission Systems'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Shield Emission Systems'),
                                       'capacitorNeed', ship.getModifiedItemAttr('shipBonusMC'), skill='Minmatar Cruiser', **kwargs)
 
 
@@ -17766,7 +17763,7 @@ class Effect5123(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Remote Armor Repair Systems'), 'capacitorNeed',
+        fit.modules.filteredItemBoost(ItemSkillFilter('Remote Armor Repair Systems'), 'capacitorNeed',
                                       src.getModifiedItemAttr('shipBonusAC'), skill='Amarr Cruiser', **kwargs)
 
 
@@ -17782,7 +17779,7 @@ class Effect5124(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Remote Armor Repair Systems'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Remote Armor Repair Systems'),
                                       'armorDamageAmount', src.getModifiedItemAttr('shipBonusAC2'), skill='Amarr Cruiser', **kwargs)
 
 
@@ -17798,7 +17795,7 @@ class Effect5125(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Remote Armor Repair Systems'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Remote Armor Repair Systems'),
                                       'armorDamageAmount', src.getModifiedItemAttr('shipBonusGC2'),
                                       skill='Gallente Cruiser', **kwargs)
 
@@ -17815,7 +17812,7 @@ class Effect5126(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Emission Systems'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Shield Emission Systems'),
                                       'shieldBonus', ship.getModifiedItemAttr('shipBonusCC2'), skill='Caldari Cruiser', **kwargs)
 
 
@@ -17831,7 +17828,7 @@ class Effect5127(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Emission Systems'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Shield Emission Systems'),
                                       'shieldBonus', ship.getModifiedItemAttr('shipBonusMC2'), skill='Minmatar Cruiser', **kwargs)
 
 
@@ -17847,7 +17844,7 @@ class Effect5128(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Sensor Dampener',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Sensor Dampener'),
                                       'maxRange', ship.getModifiedItemAttr('shipBonusGC'), skill='Gallente Cruiser', **kwargs)
 
 
@@ -17864,7 +17861,7 @@ class Effect5129(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Target Painter',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Target Painter'),
                                       'signatureRadiusBonus', ship.getModifiedItemAttr('shipBonusMC'),
                                       skill='Minmatar Cruiser', **kwargs)
 
@@ -17883,7 +17880,7 @@ class Effect5131(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, **kwargs):
         groups = ('Missile Launcher Heavy', 'Missile Launcher Rapid Light', 'Missile Launcher Heavy Assault')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name in groups,
+        fit.modules.filteredItemBoost(ItemGroupFilter(*groups),
                                       'speed', ship.getModifiedItemAttr('shipBonusCC'), skill='Caldari Cruiser', **kwargs)
 
 
@@ -17900,7 +17897,7 @@ class Effect5132(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Projectile Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Medium Projectile Turret'),
                                       'falloff', ship.getModifiedItemAttr('shipBonusMC2'), skill='Minmatar Cruiser', **kwargs)
 
 
@@ -17916,7 +17913,7 @@ class Effect5133(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Hybrid Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Medium Hybrid Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('shipBonusCC'), skill='Caldari Cruiser', **kwargs)
 
 
@@ -17935,7 +17932,7 @@ class Effect5136(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Energy Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Medium Energy Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('shipBonusAC'), skill='Amarr Cruiser', **kwargs)
 
 
@@ -17951,7 +17948,7 @@ class Effect5139(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Mining'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Mining'),
                                       'miningAmount', module.getModifiedItemAttr('shipBonusOREfrig1'),
                                       skill='Mining Frigate', **kwargs)
 
@@ -17969,7 +17966,7 @@ class Effect5142(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, **kwargs):
-        fit.modules.filteredItemMultiply(lambda mod: mod.item.group.name == 'Gas Cloud Harvester',
+        fit.modules.filteredItemMultiply(ItemGroupFilter('Gas Cloud Harvester'),
                                          'miningAmount', module.getModifiedItemAttr('miningAmountMultiplier'), **kwargs)
 
 
@@ -17986,7 +17983,7 @@ class Effect5153(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Rockets'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Rockets'),
                                         'maxVelocity', ship.getModifiedItemAttr('shipBonusRole7'), **kwargs)
 
 
@@ -18003,7 +18000,7 @@ class Effect5156(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Gas Cloud Harvester',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Gas Cloud Harvester'),
                                       'duration', module.getModifiedItemAttr('shipBonusOREfrig2'), skill='Mining Frigate', **kwargs)
 
 
@@ -18020,9 +18017,9 @@ class Effect5162(BaseEffect):
     @staticmethod
     def handler(fit, src, context, **kwargs):
         lvl = src.level
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Armor Resistance Shift Hardener', 'capacitorNeed',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Armor Resistance Shift Hardener'), 'capacitorNeed',
                                       src.getModifiedItemAttr('capNeedBonus') * lvl, **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Resistance Phasing'), 'capacitorNeed',
+        fit.modules.filteredItemBoost(ItemSkillFilter('Resistance Phasing'), 'capacitorNeed',
                                       src.getModifiedItemAttr('capNeedBonus') * lvl, **kwargs)
 
 
@@ -18039,7 +18036,7 @@ class Effect5165(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+        fit.drones.filteredItemBoost(ItemSkillFilter('Drones'),
                                      'maxVelocity', ship.getModifiedItemAttr('shipBonusRole7'), **kwargs)
 
 
@@ -18055,7 +18052,7 @@ class Effect5168(BaseEffect):
 
     @staticmethod
     def handler(fit, container, context, **kwargs):
-        fit.drones.filteredItemIncrease(lambda drone: drone.item.requiresSkill('Salvage Drone Operation'),
+        fit.drones.filteredItemIncrease(ItemSkillFilter('Salvage Drone Operation'),
                                         'accessDifficultyBonus',
                                         container.getModifiedItemAttr('accessDifficultyBonus') * container.level, **kwargs)
 
@@ -18134,7 +18131,7 @@ class Effect5185(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Nosferatu',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Energy Nosferatu'),
                                       'powerTransferAmount', ship.getModifiedItemAttr('shipBonus2AF'),
                                       skill='Amarr Frigate', **kwargs)
 
@@ -18151,7 +18148,7 @@ class Effect5187(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Sensor Dampener',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Sensor Dampener'),
                                       'falloffEffectiveness', ship.getModifiedItemAttr('shipBonusGC'),
                                       skill='Gallente Cruiser', **kwargs)
 
@@ -18168,7 +18165,7 @@ class Effect5188(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Hybrid Weapon',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Hybrid Weapon'),
                                       'trackingSpeed', module.getModifiedItemAttr('trackingSpeedBonus'),
                                       stackingPenalties=True, **kwargs)
 
@@ -18185,7 +18182,7 @@ class Effect5189(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Weapon',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Energy Weapon'),
                                       'trackingSpeed', module.getModifiedItemAttr('trackingSpeedBonus'),
                                       stackingPenalties=True, **kwargs)
 
@@ -18202,7 +18199,7 @@ class Effect5190(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Projectile Weapon',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Projectile Weapon'),
                                       'trackingSpeed', module.getModifiedItemAttr('trackingSpeedBonus'),
                                       stackingPenalties=True, **kwargs)
 
@@ -18220,7 +18217,7 @@ class Effect5201(BaseEffect):
     @staticmethod
     def handler(fit, container, context, **kwargs):
         level = container.level
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Armor Reinforcer',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Armor Reinforcer'),
                                       'massAddition', container.getModifiedItemAttr('massPenaltyReduction') * level, **kwargs)
 
 
@@ -18236,7 +18233,7 @@ class Effect5205(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Energy Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Small Energy Turret'),
                                       'trackingSpeed', ship.getModifiedItemAttr('rookieSETTracking'), **kwargs)
 
 
@@ -18252,7 +18249,7 @@ class Effect5206(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Energy Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Small Energy Turret'),
                                       'maxRange', ship.getModifiedItemAttr('rookieSETOptimal'), **kwargs)
 
 
@@ -18268,7 +18265,7 @@ class Effect5207(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Nosferatu',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Energy Nosferatu'),
                                       'powerTransferAmount', ship.getModifiedItemAttr('rookieNosDrain'), **kwargs)
 
 
@@ -18284,7 +18281,7 @@ class Effect5208(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Neutralizer',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Energy Neutralizer'),
                                       'energyNeutralizerAmount', ship.getModifiedItemAttr('rookieNeutDrain'), **kwargs)
 
 
@@ -18301,7 +18298,7 @@ class Effect5209(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Stasis Web',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Stasis Web'),
                                       'speedFactor', ship.getModifiedItemAttr('rookieWebAmount'), **kwargs)
 
 
@@ -18333,7 +18330,7 @@ class Effect5213(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Rockets'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Rockets'),
                                         'maxVelocity', ship.getModifiedItemAttr('rookieRocketVelocity'), **kwargs)
 
 
@@ -18349,7 +18346,7 @@ class Effect5214(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Light Missiles'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Light Missiles'),
                                         'maxVelocity', ship.getModifiedItemAttr('rookieLightMissileVelocity'), **kwargs)
 
 
@@ -18365,7 +18362,7 @@ class Effect5215(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Hybrid Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Small Hybrid Turret'),
                                       'trackingSpeed', ship.getModifiedItemAttr('rookieSHTTracking'), **kwargs)
 
 
@@ -18381,7 +18378,7 @@ class Effect5216(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Hybrid Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Small Hybrid Turret'),
                                       'falloff', ship.getModifiedItemAttr('rookieSHTFalloff'), **kwargs)
 
 
@@ -18397,7 +18394,7 @@ class Effect5217(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Projectile Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Small Projectile Turret'),
                                       'trackingSpeed', ship.getModifiedItemAttr('rookieSPTTracking'), **kwargs)
 
 
@@ -18413,7 +18410,7 @@ class Effect5218(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Projectile Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Small Projectile Turret'),
                                       'falloff', ship.getModifiedItemAttr('rookieSPTFalloff'), **kwargs)
 
 
@@ -18429,7 +18426,7 @@ class Effect5219(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Projectile Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Small Projectile Turret'),
                                       'maxRange', ship.getModifiedItemAttr('rookieSPTOptimal'), **kwargs)
 
 
@@ -18445,7 +18442,7 @@ class Effect5220(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Projectile Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Medium Projectile Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('shipBonusRole7'), **kwargs)
 
 
@@ -18461,7 +18458,7 @@ class Effect5221(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Assault Missiles'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Heavy Assault Missiles'),
                                         'emDamage', ship.getModifiedItemAttr('shipBonusRole7'), **kwargs)
 
 
@@ -18477,7 +18474,7 @@ class Effect5222(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Assault Missiles'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Heavy Assault Missiles'),
                                         'kineticDamage', ship.getModifiedItemAttr('shipBonusRole7'), **kwargs)
 
 
@@ -18493,7 +18490,7 @@ class Effect5223(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Assault Missiles'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Heavy Assault Missiles'),
                                         'thermalDamage', ship.getModifiedItemAttr('shipBonusRole7'), **kwargs)
 
 
@@ -18509,7 +18506,7 @@ class Effect5224(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Assault Missiles'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Heavy Assault Missiles'),
                                         'explosiveDamage', ship.getModifiedItemAttr('shipBonusRole7'), **kwargs)
 
 
@@ -18525,7 +18522,7 @@ class Effect5225(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Heavy Missiles'),
                                         'emDamage', ship.getModifiedItemAttr('shipBonusRole7'), **kwargs)
 
 
@@ -18541,7 +18538,7 @@ class Effect5226(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Heavy Missiles'),
                                         'explosiveDamage', ship.getModifiedItemAttr('shipBonusRole7'), **kwargs)
 
 
@@ -18557,7 +18554,7 @@ class Effect5227(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Heavy Missiles'),
                                         'kineticDamage', ship.getModifiedItemAttr('shipBonusRole7'), **kwargs)
 
 
@@ -18573,7 +18570,7 @@ class Effect5228(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Heavy Missiles'),
                                         'thermalDamage', ship.getModifiedItemAttr('shipBonusRole7'), **kwargs)
 
 
@@ -18593,7 +18590,7 @@ class Effect5229(BaseEffect):
 
     @staticmethod
     def handler(fit, container, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Astrometrics'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Astrometrics'),
                                         'baseSensorStrength', container.getModifiedItemAttr('shipBonusRole8'), **kwargs)
 
 
@@ -18649,7 +18646,7 @@ class Effect5234(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, **kwargs):
         fit.modules.filteredChargeBoost(
-            lambda mod: mod.charge.requiresSkill('Rockets') or mod.charge.requiresSkill('Light Missiles'),
+            ChargeSkillFilter('Rockets', 'Light Missiles'),
             'explosiveDamage', ship.getModifiedItemAttr('shipBonusCF2'), skill='Caldari Frigate', **kwargs)
 
 
@@ -18666,7 +18663,7 @@ class Effect5237(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, **kwargs):
         fit.modules.filteredChargeBoost(
-            lambda mod: mod.charge.requiresSkill('Rockets') or mod.charge.requiresSkill('Light Missiles'),
+            ChargeSkillFilter('Rockets', 'Light Missiles'),
             'kineticDamage', ship.getModifiedItemAttr('shipBonusCF2'), skill='Caldari Frigate', **kwargs)
 
 
@@ -18684,7 +18681,7 @@ class Effect5240(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, **kwargs):
         fit.modules.filteredChargeBoost(
-            lambda mod: mod.charge.requiresSkill('Rockets') or mod.charge.requiresSkill('Light Missiles'),
+            ChargeSkillFilter('Rockets', 'Light Missiles'),
             'thermalDamage', ship.getModifiedItemAttr('shipBonusCF2'), skill='Caldari Frigate', **kwargs)
 
 
@@ -18702,7 +18699,7 @@ class Effect5243(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, **kwargs):
         fit.modules.filteredChargeBoost(
-            lambda mod: mod.charge.requiresSkill('Rockets') or mod.charge.requiresSkill('Light Missiles'),
+            ChargeSkillFilter('Rockets', 'Light Missiles'),
             'emDamage', ship.getModifiedItemAttr('shipBonusCF2'), skill='Caldari Frigate', **kwargs)
 
 
@@ -18719,7 +18716,7 @@ class Effect5259(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Cloaking Device',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Cloaking Device'),
                                       'cpu', ship.getModifiedItemAttr('eliteBonusReconShip1'), skill='Recon Ships', **kwargs)
 
 
@@ -18736,7 +18733,7 @@ class Effect5260(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Cloaking'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Cloaking'),
                                       'cpu', ship.getModifiedItemAttr('eliteBonusCovertOps1'), skill='Covert Ops', **kwargs)
 
 
@@ -18768,7 +18765,7 @@ class Effect5262(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, **kwargs):
-        fit.modules.filteredItemIncrease(lambda mod: mod.item.requiresSkill('Cloaking'),
+        fit.modules.filteredItemIncrease(ItemSkillFilter('Cloaking'),
                                          'covertCloakCPUAdd', module.getModifiedItemAttr('covertCloakCPUPenalty'), **kwargs)
 
 
@@ -18784,7 +18781,7 @@ class Effect5263(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, **kwargs):
-        fit.modules.filteredItemIncrease(lambda mod: mod.item.requiresSkill('Cynosural Field Theory'),
+        fit.modules.filteredItemIncrease(ItemSkillFilter('Cynosural Field Theory'),
                                          'covertCloakCPUAdd', module.getModifiedItemAttr('covertCloakCPUPenalty'), **kwargs)
 
 
@@ -18816,7 +18813,7 @@ class Effect5265(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, **kwargs):
-        fit.modules.filteredItemIncrease(lambda mod: mod.item.requiresSkill('Leadership'),
+        fit.modules.filteredItemIncrease(ItemSkillFilter('Leadership'),
                                          'warfareLinkCPUAdd', module.getModifiedItemAttr('warfareLinkCPUPenalty'), **kwargs)
 
 
@@ -18833,7 +18830,7 @@ class Effect5266(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Cloaking Device',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Cloaking Device'),
                                       'cpu', ship.getModifiedItemAttr('eliteIndustrialCovertCloakBonus'),
                                       skill='Transport Ships', **kwargs)
 
@@ -18851,7 +18848,7 @@ class Effect5267(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Repair Systems'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Repair Systems'),
                                       'power', module.getModifiedItemAttr('drawback'), **kwargs)
 
 
@@ -18868,7 +18865,7 @@ class Effect5268(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Repair Systems'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Capital Repair Systems'),
                                       'power', module.getModifiedItemAttr('drawback'), **kwargs)
 
 
@@ -18910,7 +18907,7 @@ class Effect5293(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Energy Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Small Energy Turret'),
                                       'capacitorNeed', ship.getModifiedItemAttr('shipBonusAD1'), skill='Amarr Destroyer', **kwargs)
 
 
@@ -18926,7 +18923,7 @@ class Effect5294(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Energy Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Small Energy Turret'),
                                       'trackingSpeed', ship.getModifiedItemAttr('shipBonusAD2'), skill='Amarr Destroyer', **kwargs)
 
 
@@ -18942,7 +18939,7 @@ class Effect5295(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'), 'damageMultiplier',
+        fit.drones.filteredItemBoost(ItemSkillFilter('Drones'), 'damageMultiplier',
                                      src.getModifiedItemAttr('shipBonusAD1'), skill='Amarr Destroyer', **kwargs)
 
 
@@ -18958,11 +18955,11 @@ class Effect5300(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'), 'shieldCapacity',
+        fit.drones.filteredItemBoost(ItemSkillFilter('Drones'), 'shieldCapacity',
                                      src.getModifiedItemAttr('shipBonusAD1'), skill='Amarr Destroyer', **kwargs)
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'), 'hp',
+        fit.drones.filteredItemBoost(ItemSkillFilter('Drones'), 'hp',
                                      src.getModifiedItemAttr('shipBonusAD1'), skill='Amarr Destroyer', **kwargs)
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'), 'armorHP',
+        fit.drones.filteredItemBoost(ItemSkillFilter('Drones'), 'armorHP',
                                      src.getModifiedItemAttr('shipBonusAD1'), skill='Amarr Destroyer', **kwargs)
 
 
@@ -18978,7 +18975,7 @@ class Effect5303(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Hybrid Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Small Hybrid Turret'),
                                       'maxRange', ship.getModifiedItemAttr('shipBonusCD1'), skill='Caldari Destroyer', **kwargs)
 
 
@@ -18994,7 +18991,7 @@ class Effect5304(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Hybrid Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Small Hybrid Turret'),
                                       'trackingSpeed', ship.getModifiedItemAttr('shipBonusCD2'), skill='Caldari Destroyer', **kwargs)
 
 
@@ -19010,7 +19007,7 @@ class Effect5305(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Light Missiles'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Light Missiles'),
                                         'kineticDamage', ship.getModifiedItemAttr('shipBonusCD1'),
                                         skill='Caldari Destroyer', **kwargs)
 
@@ -19027,7 +19024,7 @@ class Effect5306(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Rockets'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Rockets'),
                                         'kineticDamage', ship.getModifiedItemAttr('shipBonusCD1'),
                                         skill='Caldari Destroyer', **kwargs)
 
@@ -19044,7 +19041,7 @@ class Effect5307(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Rockets'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Rockets'),
                                         'aoeVelocity', ship.getModifiedItemAttr('shipBonusCD2'), skill='Caldari Destroyer', **kwargs)
 
 
@@ -19060,7 +19057,7 @@ class Effect5308(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Light Missiles'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Light Missiles'),
                                         'aoeVelocity', ship.getModifiedItemAttr('shipBonusCD2'), skill='Caldari Destroyer', **kwargs)
 
 
@@ -19076,7 +19073,7 @@ class Effect5309(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Hybrid Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Small Hybrid Turret'),
                                       'falloff', ship.getModifiedItemAttr('shipBonusGD1'), skill='Gallente Destroyer', **kwargs)
 
 
@@ -19093,7 +19090,7 @@ class Effect5310(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Hybrid Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Small Hybrid Turret'),
                                       'trackingSpeed', ship.getModifiedItemAttr('shipBonusGD2'), skill='Gallente Destroyer', **kwargs)
 
 
@@ -19109,7 +19106,7 @@ class Effect5311(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'), 'damageMultiplier',
+        fit.drones.filteredItemBoost(ItemSkillFilter('Drones'), 'damageMultiplier',
                                      src.getModifiedItemAttr('shipBonusGD1'), skill='Gallente Destroyer', **kwargs)
 
 
@@ -19125,11 +19122,11 @@ class Effect5316(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'), 'shieldCapacity',
+        fit.drones.filteredItemBoost(ItemSkillFilter('Drones'), 'shieldCapacity',
                                      src.getModifiedItemAttr('shipBonusGD1'), skill='Gallente Destroyer', **kwargs)
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'), 'armorHP',
+        fit.drones.filteredItemBoost(ItemSkillFilter('Drones'), 'armorHP',
                                      src.getModifiedItemAttr('shipBonusGD1'), skill='Gallente Destroyer', **kwargs)
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'), 'hp',
+        fit.drones.filteredItemBoost(ItemSkillFilter('Drones'), 'hp',
                                      src.getModifiedItemAttr('shipBonusGD1'), skill='Gallente Destroyer', **kwargs)
 
 
@@ -19145,7 +19142,7 @@ class Effect5317(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Projectile Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Small Projectile Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('shipBonusMD1'),
                                       skill='Minmatar Destroyer', **kwargs)
 
@@ -19162,7 +19159,7 @@ class Effect5318(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Projectile Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Small Projectile Turret'),
                                       'trackingSpeed', ship.getModifiedItemAttr('shipBonusMD2'), skill='Minmatar Destroyer', **kwargs)
 
 
@@ -19178,7 +19175,7 @@ class Effect5319(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Light Missiles'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Light Missiles'),
                                         'explosiveDamage', ship.getModifiedItemAttr('shipBonusMD1'),
                                         skill='Minmatar Destroyer', **kwargs)
 
@@ -19195,7 +19192,7 @@ class Effect5320(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Rockets'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Rockets'),
                                         'explosiveDamage', ship.getModifiedItemAttr('shipBonusMD1'),
                                         skill='Minmatar Destroyer', **kwargs)
 
@@ -19212,7 +19209,7 @@ class Effect5321(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('High Speed Maneuvering'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('High Speed Maneuvering'),
                                       'signatureRadiusBonus', ship.getModifiedItemAttr('shipBonusMD2'),
                                       skill='Minmatar Destroyer', **kwargs)
 
@@ -19297,7 +19294,7 @@ class Effect5326(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+        fit.drones.filteredItemBoost(ItemSkillFilter('Drones'),
                                      'damageMultiplier', ship.getModifiedItemAttr('shipBonusABC2'),
                                      skill='Amarr Battlecruiser', **kwargs)
 
@@ -19315,7 +19312,7 @@ class Effect5331(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, **kwargs):
         for layer in ('shieldCapacity', 'armorHP', 'hp'):
-            fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+            fit.drones.filteredItemBoost(ItemSkillFilter('Drones'),
                                          layer, ship.getModifiedItemAttr('shipBonusABC2'), skill='Amarr Battlecruiser', **kwargs)
 
 
@@ -19331,7 +19328,7 @@ class Effect5332(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Energy Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Medium Energy Turret'),
                                       'capacitorNeed', ship.getModifiedItemAttr('shipBonusABC1'),
                                       skill='Amarr Battlecruiser', **kwargs)
 
@@ -19348,7 +19345,7 @@ class Effect5333(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Energy Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Medium Energy Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('shipBonusABC2'),
                                       skill='Amarr Battlecruiser', **kwargs)
 
@@ -19365,7 +19362,7 @@ class Effect5334(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Hybrid Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Medium Hybrid Turret'),
                                       'maxRange', ship.getModifiedItemAttr('shipBonusCBC1'), skill='Caldari Battlecruiser', **kwargs)
 
 
@@ -19454,7 +19451,7 @@ class Effect5339(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Assault Missiles'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Heavy Assault Missiles'),
                                         'kineticDamage', ship.getModifiedItemAttr('shipBonusCBC1'),
                                         skill='Caldari Battlecruiser', **kwargs)
 
@@ -19472,7 +19469,7 @@ class Effect5340(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Heavy Missiles'),
                                         'kineticDamage', ship.getModifiedItemAttr('shipBonusCBC1'),
                                         skill='Caldari Battlecruiser', **kwargs)
 
@@ -19489,7 +19486,7 @@ class Effect5341(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Hybrid Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Medium Hybrid Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('shipBonusGBC1'),
                                       skill='Gallente Battlecruiser', **kwargs)
 
@@ -19508,7 +19505,7 @@ class Effect5342(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Repair Systems'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Repair Systems'),
                                       'armorDamageAmount', ship.getModifiedItemAttr('shipBonusGBC2'),
                                       skill='Gallente Battlecruiser', **kwargs)
 
@@ -19525,7 +19522,7 @@ class Effect5343(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+        fit.drones.filteredItemBoost(ItemSkillFilter('Drones'),
                                      'damageMultiplier', ship.getModifiedItemAttr('shipBonusGBC1'),
                                      skill='Gallente Battlecruiser', **kwargs)
 
@@ -19543,7 +19540,7 @@ class Effect5348(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, **kwargs):
         for layer in ('shieldCapacity', 'armorHP', 'hp'):
-            fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+            fit.drones.filteredItemBoost(ItemSkillFilter('Drones'),
                                          layer, ship.getModifiedItemAttr('shipBonusGBC1'), skill='Gallente Battlecruiser', **kwargs)
 
 
@@ -19559,7 +19556,7 @@ class Effect5349(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Missile Launcher Heavy',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Missile Launcher Heavy'),
                                       'speed', ship.getModifiedItemAttr('shipBonusMBC2'), skill='Minmatar Battlecruiser', **kwargs)
 
 
@@ -19575,7 +19572,7 @@ class Effect5350(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Missile Launcher Heavy Assault',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Missile Launcher Heavy Assault'),
                                       'speed', ship.getModifiedItemAttr('shipBonusMBC2'), skill='Minmatar Battlecruiser', **kwargs)
 
 
@@ -19592,7 +19589,7 @@ class Effect5351(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Operation'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Shield Operation'),
                                       'shieldBonus', ship.getModifiedItemAttr('shipBonusMBC1'),
                                       skill='Minmatar Battlecruiser', **kwargs)
 
@@ -19609,7 +19606,7 @@ class Effect5352(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Projectile Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Medium Projectile Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('shipBonusMBC1'),
                                       skill='Minmatar Battlecruiser', **kwargs)
 
@@ -19626,7 +19623,7 @@ class Effect5353(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Projectile Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Medium Projectile Turret'),
                                       'speed', ship.getModifiedItemAttr('shipBonusMBC2'), skill='Minmatar Battlecruiser', **kwargs)
 
 
@@ -19642,7 +19639,7 @@ class Effect5354(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Energy Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Large Energy Turret'),
                                       'capacitorNeed', ship.getModifiedItemAttr('shipBonusABC1'),
                                       skill='Amarr Battlecruiser', **kwargs)
 
@@ -19659,7 +19656,7 @@ class Effect5355(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Energy Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Large Energy Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('shipBonusABC2'),
                                       skill='Amarr Battlecruiser', **kwargs)
 
@@ -19676,7 +19673,7 @@ class Effect5356(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Hybrid Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Large Hybrid Turret'),
                                       'maxRange', ship.getModifiedItemAttr('shipBonusCBC1'), skill='Caldari Battlecruiser', **kwargs)
 
 
@@ -19692,7 +19689,7 @@ class Effect5357(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Hybrid Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Large Hybrid Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('shipBonusCBC2'),
                                       skill='Caldari Battlecruiser', **kwargs)
 
@@ -19709,7 +19706,7 @@ class Effect5358(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Hybrid Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Large Hybrid Turret'),
                                       'trackingSpeed', ship.getModifiedItemAttr('shipBonusGBC1'),
                                       skill='Gallente Battlecruiser', **kwargs)
 
@@ -19726,7 +19723,7 @@ class Effect5359(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Hybrid Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Large Hybrid Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('shipBonusGBC2'),
                                       skill='Gallente Battlecruiser', **kwargs)
 
@@ -19743,7 +19740,7 @@ class Effect5360(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Projectile Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Large Projectile Turret'),
                                       'speed', ship.getModifiedItemAttr('shipBonusMBC1'), skill='Minmatar Battlecruiser', **kwargs)
 
 
@@ -19759,7 +19756,7 @@ class Effect5361(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Projectile Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Large Projectile Turret'),
                                       'falloff', ship.getModifiedItemAttr('shipBonusMBC2'), skill='Minmatar Battlecruiser', **kwargs)
 
 
@@ -19778,7 +19775,7 @@ class Effect5364(BaseEffect):
     @staticmethod
     def handler(fit, booster, context, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Repair Systems') or mod.item.requiresSkill('Capital Repair Systems'),
+            ItemSkillFilter('Repair Systems', 'Capital Repair Systems'),
             'armorDamageAmount', booster.getModifiedItemAttr('armorDamageAmountBonus') or 0, **kwargs)
 
 
@@ -19795,7 +19792,7 @@ class Effect5365(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Repair Systems'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Repair Systems'),
                                       'armorDamageAmount', ship.getModifiedItemAttr('eliteBonusViolators2'),
                                       skill='Marauders', **kwargs)
 
@@ -19812,7 +19809,7 @@ class Effect5366(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Repair Systems'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Repair Systems'),
                                       'armorDamageAmount', ship.getModifiedItemAttr('shipBonusATC2'), **kwargs)
 
 
@@ -19828,7 +19825,7 @@ class Effect5367(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Repair Systems'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Repair Systems'),
                                       'armorDamageAmount', ship.getModifiedItemAttr('shipBonusGB2'),
                                       skill='Gallente Battleship', **kwargs)
 
@@ -19845,7 +19842,7 @@ class Effect5378(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Heavy Missiles'),
                                         'aoeCloudSize', ship.getModifiedItemAttr('shipBonusCBC1'),
                                         skill='Caldari Battlecruiser', **kwargs)
 
@@ -19862,7 +19859,7 @@ class Effect5379(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Assault Missiles'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Heavy Assault Missiles'),
                                         'aoeCloudSize', ship.getModifiedItemAttr('shipBonusCBC1'),
                                         skill='Caldari Battlecruiser', **kwargs)
 
@@ -19879,7 +19876,7 @@ class Effect5380(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Hybrid Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Medium Hybrid Turret'),
                                       'trackingSpeed', ship.getModifiedItemAttr('shipBonusGBC2'),
                                       skill='Gallente Battlecruiser', **kwargs)
 
@@ -19896,7 +19893,7 @@ class Effect5381(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Energy Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Medium Energy Turret'),
                                       'trackingSpeed', ship.getModifiedItemAttr('shipBonusABC1'),
                                       skill='Amarr Battlecruiser', **kwargs)
 
@@ -19914,7 +19911,7 @@ class Effect5382(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Energy Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Medium Energy Turret'),
                                       'maxRange', ship.getModifiedItemAttr('shipBonusAC2'), skill='Amarr Cruiser', **kwargs)
 
 
@@ -19931,7 +19928,7 @@ class Effect5383(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Missile Launcher Operation'),
                                         'emDamage', ship.getModifiedItemAttr('shipBonusCC'), skill='Caldari Cruiser', **kwargs)
 
 
@@ -19948,7 +19945,7 @@ class Effect5384(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Missile Launcher Operation'),
                                         'thermalDamage', ship.getModifiedItemAttr('shipBonusCC'), skill='Caldari Cruiser', **kwargs)
 
 
@@ -19965,7 +19962,7 @@ class Effect5385(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Missile Launcher Operation'),
                                         'explosiveDamage', ship.getModifiedItemAttr('shipBonusCC'), skill='Caldari Cruiser', **kwargs)
 
 
@@ -19981,7 +19978,7 @@ class Effect5386(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Missile Launcher Operation'),
                                         'kineticDamage', ship.getModifiedItemAttr('shipBonusCC2'), skill='Caldari Cruiser', **kwargs)
 
 
@@ -19997,7 +19994,7 @@ class Effect5387(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Assault Missiles'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Heavy Assault Missiles'),
                                         'aoeCloudSize', ship.getModifiedItemAttr('shipBonusCC2'), skill='Caldari Cruiser', **kwargs)
 
 
@@ -20013,7 +20010,7 @@ class Effect5388(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Heavy Missiles'),
                                         'aoeCloudSize', ship.getModifiedItemAttr('shipBonusCC2'), skill='Caldari Cruiser', **kwargs)
 
 
@@ -20029,7 +20026,7 @@ class Effect5397(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Astrometrics'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Astrometrics'),
                                         'baseMaxScanDeviation',
                                         module.getModifiedItemAttr('maxScanDeviationModifierModule'),
                                         stackingPenalties=True, **kwargs)
@@ -20047,7 +20044,7 @@ class Effect5398(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Astrometrics'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Astrometrics'),
                                       'duration', module.getModifiedItemAttr('scanDurationBonus'), **kwargs)
 
 
@@ -20063,7 +20060,7 @@ class Effect5399(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Astrometrics'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Astrometrics'),
                                         'baseSensorStrength', module.getModifiedItemAttr('scanStrengthBonusModule'),
                                         stackingPenalties=True, **kwargs)
 
@@ -20080,7 +20077,7 @@ class Effect5402(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Assault Missiles'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Heavy Assault Missiles'),
                                         'maxVelocity', ship.getModifiedItemAttr('shipBonusABC2'),
                                         skill='Amarr Battlecruiser', **kwargs)
 
@@ -20097,7 +20094,7 @@ class Effect5403(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Heavy Missiles'),
                                         'maxVelocity', ship.getModifiedItemAttr('shipBonusABC2'),
                                         skill='Amarr Battlecruiser', **kwargs)
 
@@ -20114,7 +20111,7 @@ class Effect5410(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Energy Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Medium Energy Turret'),
                                       'capacitorNeed', ship.getModifiedItemAttr('shipBonusABC2'),
                                       skill='Amarr Battlecruiser', **kwargs)
 
@@ -20131,7 +20128,7 @@ class Effect5411(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Missile Launcher Operation'),
                                         'maxVelocity', ship.getModifiedItemAttr('shipBonusCD1'), skill='Caldari Destroyer', **kwargs)
 
 
@@ -20147,7 +20144,7 @@ class Effect5417(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+        fit.drones.filteredItemBoost(ItemSkillFilter('Drones'),
                                      'damageMultiplier', ship.getModifiedItemAttr('shipBonusAB'), skill='Amarr Battleship', **kwargs)
 
 
@@ -20163,7 +20160,7 @@ class Effect5418(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+        fit.drones.filteredItemBoost(ItemSkillFilter('Drones'),
                                      'armorHP', ship.getModifiedItemAttr('shipBonusAB'), skill='Amarr Battleship', **kwargs)
 
 
@@ -20179,7 +20176,7 @@ class Effect5419(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+        fit.drones.filteredItemBoost(ItemSkillFilter('Drones'),
                                      'shieldCapacity', ship.getModifiedItemAttr('shipBonusAB'), skill='Amarr Battleship', **kwargs)
 
 
@@ -20195,7 +20192,7 @@ class Effect5420(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+        fit.drones.filteredItemBoost(ItemSkillFilter('Drones'),
                                      'hp', ship.getModifiedItemAttr('shipBonusAB'), skill='Amarr Battleship', **kwargs)
 
 
@@ -20212,7 +20209,7 @@ class Effect5424(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Hybrid Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Large Hybrid Turret'),
                                       'speed', ship.getModifiedItemAttr('shipBonusGB'), skill='Gallente Battleship', **kwargs)
 
 
@@ -20228,7 +20225,7 @@ class Effect5427(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+        fit.drones.filteredItemBoost(ItemSkillFilter('Drones'),
                                      'trackingSpeed', ship.getModifiedItemAttr('shipBonusGB'), skill='Gallente Battleship', **kwargs)
 
 
@@ -20244,7 +20241,7 @@ class Effect5428(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+        fit.drones.filteredItemBoost(ItemSkillFilter('Drones'),
                                      'maxRange', ship.getModifiedItemAttr('shipBonusGB'), skill='Gallente Battleship', **kwargs)
 
 
@@ -20260,7 +20257,7 @@ class Effect5429(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Torpedoes'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Torpedoes'),
                                         'aoeVelocity', ship.getModifiedItemAttr('shipBonusMB2'),
                                         skill='Minmatar Battleship', **kwargs)
 
@@ -20277,7 +20274,7 @@ class Effect5430(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Cruise Missiles'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Cruise Missiles'),
                                         'aoeVelocity', ship.getModifiedItemAttr('shipBonusMB2'),
                                         skill='Minmatar Battleship', **kwargs)
 
@@ -20295,7 +20292,7 @@ class Effect5431(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Energy Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Large Energy Turret'),
                                       'trackingSpeed', ship.getModifiedItemAttr('shipBonusAB'), skill='Amarr Battleship', **kwargs)
 
 
@@ -20316,7 +20313,7 @@ class Effect5433(BaseEffect):
     @staticmethod
     def handler(fit, container, context, **kwargs):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemIncrease(lambda mod: mod.item.requiresSkill('Hacking'),
+        fit.modules.filteredItemIncrease(ItemSkillFilter('Hacking'),
                                          'virusCoherence', container.getModifiedItemAttr('virusCoherenceBonus') * level, **kwargs)
 
 
@@ -20336,7 +20333,7 @@ class Effect5437(BaseEffect):
     @staticmethod
     def handler(fit, container, context, **kwargs):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemIncrease(lambda mod: mod.item.requiresSkill('Archaeology'),
+        fit.modules.filteredItemIncrease(ItemSkillFilter('Archaeology'),
                                          'virusCoherence', container.getModifiedItemAttr('virusCoherenceBonus') * level, **kwargs)
 
 
@@ -20353,7 +20350,7 @@ class Effect5440(BaseEffect):
 
     @staticmethod
     def handler(fit, beacon, context, **kwargs):
-        fit.modules.filteredChargeMultiply(lambda mod: mod.charge.requiresSkill('Light Missiles'),
+        fit.modules.filteredChargeMultiply(ChargeSkillFilter('Light Missiles'),
                                            'kineticDamage', beacon.getModifiedItemAttr('smallWeaponDamageMultiplier'),
                                            stackingPenalties=True, penaltyGroup='postMul', **kwargs)
 
@@ -20370,7 +20367,7 @@ class Effect5444(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Torpedoes'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Torpedoes'),
                                         'aoeCloudSize', ship.getModifiedItemAttr('shipBonusCB'), skill='Caldari Battleship', **kwargs)
 
 
@@ -20386,7 +20383,7 @@ class Effect5445(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Cruise Missiles'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Cruise Missiles'),
                                         'aoeCloudSize', ship.getModifiedItemAttr('shipBonusCB'), skill='Caldari Battleship', **kwargs)
 
 
@@ -20402,7 +20399,7 @@ class Effect5456(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Missile Launcher Cruise',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Missile Launcher Cruise'),
                                       'speed', ship.getModifiedItemAttr('shipBonusCB'), skill='Caldari Battleship', **kwargs)
 
 
@@ -20418,7 +20415,7 @@ class Effect5457(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Missile Launcher Torpedo',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Missile Launcher Torpedo'),
                                       'speed', ship.getModifiedItemAttr('shipBonusCB'), skill='Caldari Battleship', **kwargs)
 
 
@@ -20434,7 +20431,7 @@ class Effect5459(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemIncrease(lambda mod: mod.item.requiresSkill('Hacking'), 'virusStrength', src.getModifiedItemAttr('virusStrengthBonus'), **kwargs)
+        fit.modules.filteredItemIncrease(ItemSkillFilter('Hacking'), 'virusStrength', src.getModifiedItemAttr('virusStrengthBonus'), **kwargs)
 
 
 class Effect5460(BaseEffect):
@@ -20459,7 +20456,7 @@ class Effect5460(BaseEffect):
     def handler(fit, container, context, **kwargs):
         level = container.level if 'skill' in context else 1
         fit.modules.filteredItemIncrease(
-            lambda mod: (mod.item.requiresSkill('Hacking') or mod.item.requiresSkill('Archaeology')),
+            ItemSkillFilter('Hacking', 'Archaeology'),
             'virusStrength', container.getModifiedItemAttr('virusStrengthBonus') * level, **kwargs)
 
 
@@ -20615,7 +20612,7 @@ class Effect5480(BaseEffect):
 
     @staticmethod
     def handler(fit, implant, context, **kwargs):
-        fit.appliedImplants.filteredItemMultiply(lambda mod: mod.item.group.name == 'Special Edition Implant',
+        fit.appliedImplants.filteredItemMultiply(ItemGroupFilter('Special Edition Implant'),
                                                  'implantBonusVelocity', implant.getModifiedItemAttr('implantSetChristmas'), **kwargs)
 
 
@@ -20632,7 +20629,7 @@ class Effect5482(BaseEffect):
 
     @staticmethod
     def handler(fit, implant, context, **kwargs):
-        fit.appliedImplants.filteredItemMultiply(lambda mod: mod.item.group.name == 'Special Edition Implant',
+        fit.appliedImplants.filteredItemMultiply(ItemGroupFilter('Special Edition Implant'),
                                                  'agilityBonus', implant.getModifiedItemAttr('implantSetChristmas'), **kwargs)
 
 
@@ -20649,7 +20646,7 @@ class Effect5483(BaseEffect):
 
     @staticmethod
     def handler(fit, implant, context, **kwargs):
-        fit.appliedImplants.filteredItemMultiply(lambda mod: mod.item.group.name == 'Special Edition Implant',
+        fit.appliedImplants.filteredItemMultiply(ItemGroupFilter('Special Edition Implant'),
                                                  'shieldCapacityBonus', implant.getModifiedItemAttr('implantSetChristmas'), **kwargs)
 
 
@@ -20666,7 +20663,7 @@ class Effect5484(BaseEffect):
 
     @staticmethod
     def handler(fit, implant, context, **kwargs):
-        fit.appliedImplants.filteredItemMultiply(lambda mod: mod.item.group.name == 'Special Edition Implant',
+        fit.appliedImplants.filteredItemMultiply(ItemGroupFilter('Special Edition Implant'),
                                                  'armorHpBonus2', implant.getModifiedItemAttr('implantSetChristmas'), **kwargs)
 
 
@@ -20682,7 +20679,7 @@ class Effect5485(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Projectile Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Small Projectile Turret'),
                                       'maxRange', ship.getModifiedItemAttr('shipBonusMF'), skill='Minmatar Frigate', **kwargs)
 
 
@@ -20698,7 +20695,7 @@ class Effect5486(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Projectile Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Medium Projectile Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('shipBonusMBC2'),
                                       skill='Minmatar Battlecruiser', **kwargs)
 
@@ -20716,7 +20713,7 @@ class Effect5496(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Missile Launcher Heavy Assault',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Missile Launcher Heavy Assault'),
                                       'speed', ship.getModifiedItemAttr('eliteBonusCommandShips1'), skill='Command Ships', **kwargs)
 
 
@@ -20733,7 +20730,7 @@ class Effect5497(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Missile Launcher Heavy',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Missile Launcher Heavy'),
                                       'speed', ship.getModifiedItemAttr('eliteBonusCommandShips1'), skill='Command Ships', **kwargs)
 
 
@@ -20749,7 +20746,7 @@ class Effect5498(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Assault Missiles'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Heavy Assault Missiles'),
                                         'aoeVelocity', ship.getModifiedItemAttr('eliteBonusCommandShips2'),
                                         skill='Command Ships', **kwargs)
 
@@ -20766,7 +20763,7 @@ class Effect5499(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Assault Missiles'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Heavy Assault Missiles'),
                                         'aoeCloudSize', ship.getModifiedItemAttr('eliteBonusCommandShips2'),
                                         skill='Command Ships', **kwargs)
 
@@ -20783,7 +20780,7 @@ class Effect5500(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Heavy Missiles'),
                                         'aoeCloudSize', ship.getModifiedItemAttr('eliteBonusCommandShips2'),
                                         skill='Command Ships', **kwargs)
 
@@ -20800,7 +20797,7 @@ class Effect5501(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Hybrid Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Medium Hybrid Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('eliteBonusCommandShips2'),
                                       skill='Command Ships', **kwargs)
 
@@ -20817,7 +20814,7 @@ class Effect5502(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Hybrid Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Medium Hybrid Turret'),
                                       'trackingSpeed', ship.getModifiedItemAttr('eliteBonusCommandShips1'),
                                       skill='Command Ships', **kwargs)
 
@@ -20834,7 +20831,7 @@ class Effect5503(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Heavy Drone Operation'),
+        fit.drones.filteredItemBoost(ItemSkillFilter('Heavy Drone Operation'),
                                      'trackingSpeed', ship.getModifiedItemAttr('eliteBonusCommandShips2'),
                                      skill='Command Ships', **kwargs)
 
@@ -20851,7 +20848,7 @@ class Effect5504(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Heavy Drone Operation'),
+        fit.drones.filteredItemBoost(ItemSkillFilter('Heavy Drone Operation'),
                                      'maxVelocity', ship.getModifiedItemAttr('eliteBonusCommandShips2'),
                                      skill='Command Ships', **kwargs)
 
@@ -20868,7 +20865,7 @@ class Effect5505(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Hybrid Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Medium Hybrid Turret'),
                                       'speed', ship.getModifiedItemAttr('eliteBonusCommandShips1'), skill='Command Ships', **kwargs)
 
 
@@ -20886,7 +20883,7 @@ class Effect5514(BaseEffect):
     def handler(fit, ship, context, **kwargs):
         damageTypes = ('em', 'explosive', 'kinetic', 'thermal')
         for damageType in damageTypes:
-            fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Assault Missiles'),
+            fit.modules.filteredChargeBoost(ChargeSkillFilter('Heavy Assault Missiles'),
                                             '{0}Damage'.format(damageType),
                                             ship.getModifiedItemAttr('eliteBonusCommandShips2'), skill='Command Ships', **kwargs)
 
@@ -20905,7 +20902,7 @@ class Effect5521(BaseEffect):
     def handler(fit, ship, context, **kwargs):
         damageTypes = ('em', 'explosive', 'kinetic', 'thermal')
         for damageType in damageTypes:
-            fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'),
+            fit.modules.filteredChargeBoost(ChargeSkillFilter('Heavy Missiles'),
                                             '{0}Damage'.format(damageType),
                                             ship.getModifiedItemAttr('eliteBonusCommandShips2'), skill='Command Ships', **kwargs)
 
@@ -20922,7 +20919,7 @@ class Effect5539(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Heavy Missiles'),
                                         'kineticDamage', ship.getModifiedItemAttr('shipBonusAC'), skill='Amarr Cruiser', **kwargs)
 
 
@@ -20938,7 +20935,7 @@ class Effect5540(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Heavy Missiles'),
                                         'emDamage', ship.getModifiedItemAttr('shipBonusAC'), skill='Amarr Cruiser', **kwargs)
 
 
@@ -20954,7 +20951,7 @@ class Effect5541(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Heavy Missiles'),
                                         'thermalDamage', ship.getModifiedItemAttr('shipBonusAC'), skill='Amarr Cruiser', **kwargs)
 
 
@@ -20970,7 +20967,7 @@ class Effect5542(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Heavy Missiles'),
                                         'explosiveDamage', ship.getModifiedItemAttr('shipBonusAC'), skill='Amarr Cruiser', **kwargs)
 
 
@@ -20986,7 +20983,7 @@ class Effect5552(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Heavy Missiles'),
                                         'maxVelocity', ship.getModifiedItemAttr('eliteBonusHeavyGunship1'),
                                         skill='Heavy Assault Cruisers', **kwargs)
 
@@ -21003,7 +21000,7 @@ class Effect5553(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Assault Missiles'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Heavy Assault Missiles'),
                                         'maxVelocity', ship.getModifiedItemAttr('eliteBonusHeavyGunship1'),
                                         skill='Heavy Assault Cruisers', **kwargs)
 
@@ -21020,7 +21017,7 @@ class Effect5554(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Repair Systems'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Repair Systems'),
                                       'armorDamageAmount', ship.getModifiedItemAttr('shipBonusGC2'),
                                       skill='Gallente Cruiser', **kwargs)
 
@@ -21037,7 +21034,7 @@ class Effect5555(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Heavy Drone Operation'),
+        fit.drones.filteredItemBoost(ItemSkillFilter('Heavy Drone Operation'),
                                      'maxVelocity', ship.getModifiedItemAttr('shipBonusGC'), skill='Gallente Cruiser', **kwargs)
 
 
@@ -21053,7 +21050,7 @@ class Effect5556(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Heavy Drone Operation'),
+        fit.drones.filteredItemBoost(ItemSkillFilter('Heavy Drone Operation'),
                                      'trackingSpeed', ship.getModifiedItemAttr('shipBonusGC'), skill='Gallente Cruiser', **kwargs)
 
 
@@ -21069,7 +21066,7 @@ class Effect5557(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Sentry Drone Interfacing'),
+        fit.drones.filteredItemBoost(ItemSkillFilter('Sentry Drone Interfacing'),
                                      'maxRange', ship.getModifiedItemAttr('eliteBonusHeavyGunship2'),
                                      skill='Heavy Assault Cruisers', **kwargs)
 
@@ -21086,7 +21083,7 @@ class Effect5558(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Sentry Drone Interfacing'),
+        fit.drones.filteredItemBoost(ItemSkillFilter('Sentry Drone Interfacing'),
                                      'trackingSpeed', ship.getModifiedItemAttr('eliteBonusHeavyGunship2'),
                                      skill='Heavy Assault Cruisers', **kwargs)
 
@@ -21103,7 +21100,7 @@ class Effect5559(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Operation'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Shield Operation'),
                                       'shieldBonus', ship.getModifiedItemAttr('shipBonusMC2'), skill='Minmatar Cruiser', **kwargs)
 
 
@@ -21119,7 +21116,7 @@ class Effect5560(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Micro Jump Drive',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Micro Jump Drive'),
                                       'moduleReactivationDelay', ship.getModifiedItemAttr('roleBonusMarauder'), **kwargs)
 
 
@@ -21136,9 +21133,7 @@ class Effect5564(BaseEffect):
     @staticmethod
     def handler(fit, src, context, **kwargs):
         for attrName in ('buffDuration', 'warfareBuff1Value', 'warfareBuff2Value', 'warfareBuff3Value', 'warfareBuff4Value'):
-            fit.modules.filteredItemBoost(lambda mod: (mod.item.requiresSkill('Skirmish Command') or
-                                                       mod.item.requiresSkill('Shield Command') or
-                                                       mod.item.requiresSkill('Information Command')),
+            fit.modules.filteredItemBoost(ItemSkillFilter('Skirmish Command', 'Shield Command', 'Information Command'),
                                           attrName, src.getModifiedItemAttr('subsystemBonusCaldariOffensive'),
                                           skill='Caldari Offensive Systems', **kwargs)
 
@@ -21156,9 +21151,7 @@ class Effect5568(BaseEffect):
     @staticmethod
     def handler(fit, src, context, **kwargs):
         for attrName in ('buffDuration', 'warfareBuff1Value', 'warfareBuff2Value', 'warfareBuff3Value', 'warfareBuff4Value'):
-            fit.modules.filteredItemBoost(lambda mod: (mod.item.requiresSkill('Skirmish Command') or
-                                                       mod.item.requiresSkill('Armored Command') or
-                                                       mod.item.requiresSkill('Information Command')),
+            fit.modules.filteredItemBoost(ItemSkillFilter('Skirmish Command', 'Armored Command', 'Information Command'),
                                           attrName, src.getModifiedItemAttr('subsystemBonusGallenteOffensive'),
                                           skill='Gallente Offensive Systems', **kwargs)
 
@@ -21176,9 +21169,7 @@ class Effect5570(BaseEffect):
     @staticmethod
     def handler(fit, src, context, **kwargs):
         for attrName in ('buffDuration', 'warfareBuff1Value', 'warfareBuff2Value', 'warfareBuff3Value', 'warfareBuff4Value'):
-            fit.modules.filteredItemBoost(lambda mod: (mod.item.requiresSkill('Skirmish Command') or
-                                                       mod.item.requiresSkill('Shield Command') or
-                                                       mod.item.requiresSkill('Armored Command')),
+            fit.modules.filteredItemBoost(ItemSkillFilter('Skirmish Command', 'Shield Command', 'Armored Command'),
                                           attrName, src.getModifiedItemAttr('subsystemBonusMinmatarOffensive'),
                                           skill='Minmatar Offensive Systems', **kwargs)
 
@@ -21196,7 +21187,7 @@ class Effect5572(BaseEffect):
     @staticmethod
     def handler(fit, src, context, **kwargs):
         for attrName in ('buffDuration', 'warfareBuff1Value', 'warfareBuff2Value', 'warfareBuff3Value', 'warfareBuff4Value'):
-            fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Armored Command'),
+            fit.modules.filteredItemBoost(ItemSkillFilter('Armored Command'),
                                           attrName, src.getModifiedItemAttr('eliteBonusCommandShips3'),
                                           skill='Command Ships', **kwargs)
 
@@ -21214,7 +21205,7 @@ class Effect5573(BaseEffect):
     @staticmethod
     def handler(fit, src, context, **kwargs):
         for attrName in ('buffDuration', 'warfareBuff1Value', 'warfareBuff2Value', 'warfareBuff3Value', 'warfareBuff4Value'):
-            fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Command'),
+            fit.modules.filteredItemBoost(ItemSkillFilter('Shield Command'),
                                           attrName, src.getModifiedItemAttr('eliteBonusCommandShips3'),
                                           skill='Command Ships', **kwargs)
 
@@ -21232,7 +21223,7 @@ class Effect5574(BaseEffect):
     @staticmethod
     def handler(fit, src, context, **kwargs):
         for attrName in ('buffDuration', 'warfareBuff1Value', 'warfareBuff2Value', 'warfareBuff3Value', 'warfareBuff4Value'):
-            fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Skirmish Command'),
+            fit.modules.filteredItemBoost(ItemSkillFilter('Skirmish Command'),
                                           attrName, src.getModifiedItemAttr('eliteBonusCommandShips3'),
                                           skill='Command Ships', **kwargs)
 
@@ -21250,7 +21241,7 @@ class Effect5575(BaseEffect):
     @staticmethod
     def handler(fit, src, context, **kwargs):
         for attrName in ('buffDuration', 'warfareBuff1Value', 'warfareBuff2Value', 'warfareBuff3Value', 'warfareBuff4Value'):
-            fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Information Command'),
+            fit.modules.filteredItemBoost(ItemSkillFilter('Information Command'),
                                           attrName, src.getModifiedItemAttr('eliteBonusCommandShips3'),
                                           skill='Command Ships', **kwargs)
 
@@ -21270,7 +21261,7 @@ class Effect5607(BaseEffect):
     @staticmethod
     def handler(fit, container, context, **kwargs):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capacitor Emission Systems'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Capacitor Emission Systems'),
                                       'capacitorNeed', container.getModifiedItemAttr('capNeedBonus') * level, **kwargs)
 
 
@@ -21287,7 +21278,7 @@ class Effect5610(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Energy Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Large Energy Turret'),
                                       'maxRange', ship.getModifiedItemAttr('shipBonusAB'), skill='Amarr Battleship', **kwargs)
 
 
@@ -21303,7 +21294,7 @@ class Effect5611(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Hybrid Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Large Hybrid Turret'),
                                       'falloff', ship.getModifiedItemAttr('shipBonusGB2'), skill='Gallente Battleship', **kwargs)
 
 
@@ -21320,7 +21311,7 @@ class Effect5618(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Missile Launcher Rapid Heavy',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Missile Launcher Rapid Heavy'),
                                       'speed', ship.getModifiedItemAttr('shipBonus2CB'), skill='Caldari Battleship', **kwargs)
 
 
@@ -21336,7 +21327,7 @@ class Effect5619(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Missile Launcher Rapid Heavy',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Missile Launcher Rapid Heavy'),
                                       'speed', ship.getModifiedItemAttr('shipBonusCB'), skill='Caldari Battleship', **kwargs)
 
 
@@ -21352,7 +21343,7 @@ class Effect5620(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Missile Launcher Rapid Heavy',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Missile Launcher Rapid Heavy'),
                                       'speed', ship.getModifiedItemAttr('shipBonusMB'), skill='Minmatar Battleship', **kwargs)
 
 
@@ -21368,7 +21359,7 @@ class Effect5621(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Missile Launcher Cruise',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Missile Launcher Cruise'),
                                       'speed', ship.getModifiedItemAttr('shipBonusMB'), skill='Minmatar Battleship', **kwargs)
 
 
@@ -21384,7 +21375,7 @@ class Effect5622(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Missile Launcher Torpedo',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Missile Launcher Torpedo'),
                                       'speed', ship.getModifiedItemAttr('shipBonusMB'), skill='Minmatar Battleship', **kwargs)
 
 
@@ -21400,7 +21391,7 @@ class Effect5628(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Cruise Missiles'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Cruise Missiles'),
                                         'emDamage', ship.getModifiedItemAttr('shipBonusMB'), skill='Minmatar Battleship', **kwargs)
 
 
@@ -21416,7 +21407,7 @@ class Effect5629(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Cruise Missiles'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Cruise Missiles'),
                                         'thermalDamage', ship.getModifiedItemAttr('shipBonusMB'),
                                         skill='Minmatar Battleship', **kwargs)
 
@@ -21433,7 +21424,7 @@ class Effect5630(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Cruise Missiles'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Cruise Missiles'),
                                         'kineticDamage', ship.getModifiedItemAttr('shipBonusMB'),
                                         skill='Minmatar Battleship', **kwargs)
 
@@ -21450,7 +21441,7 @@ class Effect5631(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Cruise Missiles'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Cruise Missiles'),
                                         'explosiveDamage', ship.getModifiedItemAttr('shipBonusMB'),
                                         skill='Minmatar Battleship', **kwargs)
 
@@ -21467,7 +21458,7 @@ class Effect5632(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Torpedoes'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Torpedoes'),
                                         'explosiveDamage', ship.getModifiedItemAttr('shipBonusMB'),
                                         skill='Minmatar Battleship', **kwargs)
 
@@ -21484,7 +21475,7 @@ class Effect5633(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Torpedoes'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Torpedoes'),
                                         'emDamage', ship.getModifiedItemAttr('shipBonusMB'), skill='Minmatar Battleship', **kwargs)
 
 
@@ -21500,7 +21491,7 @@ class Effect5634(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Torpedoes'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Torpedoes'),
                                         'thermalDamage', ship.getModifiedItemAttr('shipBonusMB'),
                                         skill='Minmatar Battleship', **kwargs)
 
@@ -21517,7 +21508,7 @@ class Effect5635(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Torpedoes'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Torpedoes'),
                                         'kineticDamage', ship.getModifiedItemAttr('shipBonusMB'),
                                         skill='Minmatar Battleship', **kwargs)
 
@@ -21534,7 +21525,7 @@ class Effect5636(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Heavy Missiles'),
                                         'emDamage', ship.getModifiedItemAttr('shipBonusMB'), skill='Minmatar Battleship', **kwargs)
 
 
@@ -21550,7 +21541,7 @@ class Effect5637(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Heavy Missiles'),
                                         'thermalDamage', ship.getModifiedItemAttr('shipBonusMB'),
                                         skill='Minmatar Battleship', **kwargs)
 
@@ -21567,7 +21558,7 @@ class Effect5638(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Heavy Missiles'),
                                         'kineticDamage', ship.getModifiedItemAttr('shipBonusMB'),
                                         skill='Minmatar Battleship', **kwargs)
 
@@ -21584,7 +21575,7 @@ class Effect5639(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Heavy Missiles'),
                                         'explosiveDamage', ship.getModifiedItemAttr('shipBonusMB'),
                                         skill='Minmatar Battleship', **kwargs)
 
@@ -21601,7 +21592,7 @@ class Effect5644(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Missile Launcher Operation'),
                                         'maxVelocity', ship.getModifiedItemAttr('shipBonusCC2'), skill='Caldari Cruiser', **kwargs)
 
 
@@ -21624,7 +21615,7 @@ class Effect5647(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Cloaking'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Cloaking'),
                                       'cpu', ship.getModifiedItemAttr('shipBonusRole7'), **kwargs)
 
 
@@ -21676,7 +21667,7 @@ class Effect5673(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Projectile Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Small Projectile Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('eliteBonusInterceptor2'),
                                       skill='Interceptors', **kwargs)
 
@@ -21694,7 +21685,7 @@ class Effect5676(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, **kwargs):
         fit.modules.filteredChargeBoost(
-            lambda mod: mod.charge.requiresSkill('Rockets') or mod.charge.requiresSkill('Light Missiles'),
+            ChargeSkillFilter('Rockets', 'Light Missiles'),
             'aoeCloudSize', ship.getModifiedItemAttr('shipBonusCD2'), skill='Caldari Destroyer', **kwargs)
 
 
@@ -21710,7 +21701,7 @@ class Effect5688(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Missile Launcher Operation'),
                                         'maxVelocity', ship.getModifiedItemAttr('shipBonusAD2'), skill='Amarr Destroyer', **kwargs)
 
 
@@ -21744,7 +21735,7 @@ class Effect5717(BaseEffect):
 
     @staticmethod
     def handler(fit, implant, context, **kwargs):
-        fit.appliedImplants.filteredItemMultiply(lambda mod: mod.item.group.name == 'Cyberimplant',
+        fit.appliedImplants.filteredItemMultiply(ItemGroupFilter('Cyberimplant'),
                                                  'WarpSBonus', implant.getModifiedItemAttr('implantSetWarpSpeed'), **kwargs)
 
 
@@ -21760,7 +21751,7 @@ class Effect5721(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Energy Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Medium Energy Turret'),
                                       'maxRange', ship.getModifiedItemAttr('shipBonusRole7'), **kwargs)
 
 
@@ -21776,7 +21767,7 @@ class Effect5722(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Hybrid Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Small Hybrid Turret'),
                                       'maxRange', ship.getModifiedItemAttr('shipBonusGD1'), skill='Gallente Destroyer', **kwargs)
 
 
@@ -21792,7 +21783,7 @@ class Effect5723(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('High Speed Maneuvering'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('High Speed Maneuvering'),
                                       'signatureRadiusBonus', ship.getModifiedItemAttr('eliteBonusInterdictors2'),
                                       skill='Interdictors', **kwargs)
 
@@ -21809,7 +21800,7 @@ class Effect5724(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Hybrid Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Small Hybrid Turret'),
                                       'maxRange', ship.getModifiedItemAttr('shipBonusGF'), skill='Gallente Frigate', **kwargs)
 
 
@@ -21825,7 +21816,7 @@ class Effect5725(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Remote Armor Repair Systems'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Remote Armor Repair Systems'),
                                       'armorDamageAmount', ship.getModifiedItemAttr('shipBonusRole7'), **kwargs)
 
 
@@ -21841,7 +21832,7 @@ class Effect5726(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Energy Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Large Energy Turret'),
                                       'maxRange', ship.getModifiedItemAttr('shipBonusRole7'), **kwargs)
 
 
@@ -21857,7 +21848,7 @@ class Effect5733(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Heavy Missiles'),
                                         'explosiveDamage', ship.getModifiedItemAttr('eliteBonusViolatorsRole1'), **kwargs)
 
 
@@ -21873,7 +21864,7 @@ class Effect5734(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Heavy Missiles'),
                                         'kineticDamage', ship.getModifiedItemAttr('eliteBonusViolatorsRole1'), **kwargs)
 
 
@@ -21889,7 +21880,7 @@ class Effect5735(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Heavy Missiles'),
                                         'emDamage', ship.getModifiedItemAttr('eliteBonusViolatorsRole1'), **kwargs)
 
 
@@ -21905,7 +21896,7 @@ class Effect5736(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Heavy Missiles'),
                                         'thermalDamage', ship.getModifiedItemAttr('eliteBonusViolatorsRole1'), **kwargs)
 
 
@@ -21921,7 +21912,7 @@ class Effect5737(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Astrometrics'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Astrometrics'),
                                         'baseSensorStrength', ship.getModifiedItemAttr('shipBonusRole7'), **kwargs)
 
 
@@ -21937,9 +21928,9 @@ class Effect5738(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Remote Armor Repair Systems'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Remote Armor Repair Systems'),
                                       'maxRange', ship.getModifiedItemAttr('shipBonusRole8'), **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Remote Armor Repair Systems'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Remote Armor Repair Systems'),
                                       'falloffEffectiveness', ship.getModifiedItemAttr('shipBonusRole8'), **kwargs)
 
 
@@ -22016,7 +22007,7 @@ class Effect5769(BaseEffect):
     @staticmethod
     def handler(fit, container, context, **kwargs):
         level = container.level if 'skill' in context else 1
-        fit.drones.filteredItemBoost(lambda drone: drone.item.group.name == 'Logistic Drone',
+        fit.drones.filteredItemBoost(ItemGroupFilter('Logistic Drone'),
                                      'structureDamageAmount', container.getModifiedItemAttr('damageHP') * level, **kwargs)
 
 
@@ -22033,7 +22024,7 @@ class Effect5778(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Missile Launcher Operation'),
                                       'speed', ship.getModifiedItemAttr('shipBonusMF2'), skill='Minmatar Frigate', **kwargs)
 
 
@@ -22050,7 +22041,7 @@ class Effect5779(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Projectile Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Small Projectile Turret'),
                                       'falloff', ship.getModifiedItemAttr('shipBonusMF2'), skill='Minmatar Frigate', **kwargs)
 
 
@@ -22069,7 +22060,7 @@ class Effect5793(BaseEffect):
     def handler(fit, container, context, **kwargs):
         level = container.level if 'skill' in context else 1
         for attr in ('maxRangeBonus', 'falloffBonus'):
-            fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Weapon Disruption'),
+            fit.modules.filteredItemBoost(ItemSkillFilter('Weapon Disruption'),
                                           attr, container.getModifiedItemAttr('scanSkillEwStrengthBonus') * level, **kwargs)
 
 
@@ -22085,7 +22076,7 @@ class Effect5802(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Afterburner'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Afterburner'),
                                       'speedFactor', module.getModifiedItemAttr('shipBonus2CB'), skill='Caldari Battleship', **kwargs)
 
 
@@ -22101,7 +22092,7 @@ class Effect5803(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Sentry Drone Interfacing'),
+        fit.drones.filteredItemBoost(ItemSkillFilter('Sentry Drone Interfacing'),
                                      'damageMultiplier', ship.getModifiedItemAttr('shipBonusRole7'), **kwargs)
 
 
@@ -22117,7 +22108,7 @@ class Effect5804(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Heavy Drone Operation'),
+        fit.drones.filteredItemBoost(ItemSkillFilter('Heavy Drone Operation'),
                                      'damageMultiplier', ship.getModifiedItemAttr('shipBonusRole7'), **kwargs)
 
 
@@ -22133,7 +22124,7 @@ class Effect5805(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Sentry Drone Interfacing'),
+        fit.drones.filteredItemBoost(ItemSkillFilter('Sentry Drone Interfacing'),
                                      'hp', ship.getModifiedItemAttr('shipBonusRole7'), **kwargs)
 
 
@@ -22149,7 +22140,7 @@ class Effect5806(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Sentry Drone Interfacing'),
+        fit.drones.filteredItemBoost(ItemSkillFilter('Sentry Drone Interfacing'),
                                      'armorHP', ship.getModifiedItemAttr('shipBonusRole7'), **kwargs)
 
 
@@ -22165,7 +22156,7 @@ class Effect5807(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Sentry Drone Interfacing'),
+        fit.drones.filteredItemBoost(ItemSkillFilter('Sentry Drone Interfacing'),
                                      'shieldCapacity', ship.getModifiedItemAttr('shipBonusRole7'), **kwargs)
 
 
@@ -22181,7 +22172,7 @@ class Effect5808(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Heavy Drone Operation'),
+        fit.drones.filteredItemBoost(ItemSkillFilter('Heavy Drone Operation'),
                                      'shieldCapacity', ship.getModifiedItemAttr('shipBonusRole7'), **kwargs)
 
 
@@ -22197,7 +22188,7 @@ class Effect5809(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Heavy Drone Operation'),
+        fit.drones.filteredItemBoost(ItemSkillFilter('Heavy Drone Operation'),
                                      'armorHP', ship.getModifiedItemAttr('shipBonusRole7'), **kwargs)
 
 
@@ -22213,7 +22204,7 @@ class Effect5810(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Heavy Drone Operation'),
+        fit.drones.filteredItemBoost(ItemSkillFilter('Heavy Drone Operation'),
                                      'hp', ship.getModifiedItemAttr('shipBonusRole7'), **kwargs)
 
 
@@ -22229,7 +22220,7 @@ class Effect5811(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Missile Launcher Operation'),
                                         'kineticDamage', ship.getModifiedItemAttr('shipBonusGB2'),
                                         skill='Gallente Battleship', **kwargs)
 
@@ -22246,7 +22237,7 @@ class Effect5812(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Missile Launcher Operation'),
                                         'thermalDamage', ship.getModifiedItemAttr('shipBonusGB2'),
                                         skill='Gallente Battleship', **kwargs)
 
@@ -22264,7 +22255,7 @@ class Effect5813(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Afterburner'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Afterburner'),
                                       'speedFactor', module.getModifiedItemAttr('shipBonusCF2'), skill='Caldari Frigate', **kwargs)
 
 
@@ -22281,7 +22272,7 @@ class Effect5814(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Missile Launcher Operation'),
                                         'kineticDamage', ship.getModifiedItemAttr('shipBonusGF'), skill='Gallente Frigate', **kwargs)
 
 
@@ -22298,7 +22289,7 @@ class Effect5815(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Missile Launcher Operation'),
                                         'thermalDamage', ship.getModifiedItemAttr('shipBonusGF'), skill='Gallente Frigate', **kwargs)
 
 
@@ -22315,7 +22306,7 @@ class Effect5816(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Light Drone Operation'),
+        fit.drones.filteredItemBoost(ItemSkillFilter('Light Drone Operation'),
                                      'damageMultiplier', ship.getModifiedItemAttr('shipBonusRole7'), **kwargs)
 
 
@@ -22332,7 +22323,7 @@ class Effect5817(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Light Drone Operation'),
+        fit.drones.filteredItemBoost(ItemSkillFilter('Light Drone Operation'),
                                      'hp', ship.getModifiedItemAttr('shipBonusRole7'), **kwargs)
 
 
@@ -22349,7 +22340,7 @@ class Effect5818(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Light Drone Operation'),
+        fit.drones.filteredItemBoost(ItemSkillFilter('Light Drone Operation'),
                                      'armorHP', ship.getModifiedItemAttr('shipBonusRole7'), **kwargs)
 
 
@@ -22366,7 +22357,7 @@ class Effect5819(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Light Drone Operation'),
+        fit.drones.filteredItemBoost(ItemSkillFilter('Light Drone Operation'),
                                      'shieldCapacity', ship.getModifiedItemAttr('shipBonusRole7'), **kwargs)
 
 
@@ -22383,7 +22374,7 @@ class Effect5820(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Afterburner'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Afterburner'),
                                       'speedFactor', module.getModifiedItemAttr('shipBonusCC2'), skill='Caldari Cruiser', **kwargs)
 
 
@@ -22400,7 +22391,7 @@ class Effect5821(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Medium Drone Operation'),
+        fit.drones.filteredItemBoost(ItemSkillFilter('Medium Drone Operation'),
                                      'damageMultiplier', ship.getModifiedItemAttr('shipBonusRole7'), **kwargs)
 
 
@@ -22416,7 +22407,7 @@ class Effect5822(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Medium Drone Operation'),
+        fit.drones.filteredItemBoost(ItemSkillFilter('Medium Drone Operation'),
                                      'hp', ship.getModifiedItemAttr('shipBonusRole7'), **kwargs)
 
 
@@ -22432,7 +22423,7 @@ class Effect5823(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Medium Drone Operation'),
+        fit.drones.filteredItemBoost(ItemSkillFilter('Medium Drone Operation'),
                                      'armorHP', ship.getModifiedItemAttr('shipBonusRole7'), **kwargs)
 
 
@@ -22448,7 +22439,7 @@ class Effect5824(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Medium Drone Operation'),
+        fit.drones.filteredItemBoost(ItemSkillFilter('Medium Drone Operation'),
                                      'shieldCapacity', ship.getModifiedItemAttr('shipBonusRole7'), **kwargs)
 
 
@@ -22465,7 +22456,7 @@ class Effect5825(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Missile Launcher Operation'),
                                         'kineticDamage', ship.getModifiedItemAttr('shipBonusGC2'), skill='Gallente Cruiser', **kwargs)
 
 
@@ -22482,7 +22473,7 @@ class Effect5826(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Missile Launcher Operation'),
                                         'thermalDamage', ship.getModifiedItemAttr('shipBonusGC2'), skill='Gallente Cruiser', **kwargs)
 
 
@@ -22498,7 +22489,7 @@ class Effect5827(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Weapon Disruption'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Weapon Disruption'),
                                       'maxRange', ship.getModifiedItemAttr('shipBonusAF'), skill='Amarr Frigate', **kwargs)
 
 
@@ -22515,7 +22506,7 @@ class Effect5829(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Mining'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Mining'),
                                       'duration', ship.getModifiedItemAttr('shipBonusORE3'), skill='Mining Barge', **kwargs)
 
 
@@ -22532,7 +22523,7 @@ class Effect5832(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Mining') or mod.item.requiresSkill('Ice Harvesting'),
+            ItemSkillFilter('Mining', 'Ice Harvesting'),
             'maxRange', ship.getModifiedItemAttr('shipBonusORE2'), skill='Mining Barge', **kwargs)
 
 
@@ -22565,7 +22556,7 @@ class Effect5840(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Mining'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Mining'),
                                       'duration', ship.getModifiedItemAttr('eliteBonusBarge2'), skill='Exhumers', **kwargs)
 
 
@@ -22581,7 +22572,7 @@ class Effect5852(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Mining'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Mining'),
                                       'miningAmount', module.getModifiedItemAttr('eliteBonusExpedition1'),
                                       skill='Expedition Frigates', **kwargs)
 
@@ -22621,7 +22612,7 @@ class Effect5854(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemForce(lambda mod: mod.item.group.name == 'Energy Nosferatu',
+        fit.modules.filteredItemForce(ItemGroupFilter('Energy Nosferatu'),
                                       'nosOverride', ship.getModifiedItemAttr('nosOverride'), **kwargs)
 
 
@@ -22637,7 +22628,7 @@ class Effect5862(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Missile Launcher Operation'),
                                         'emDamage', ship.getModifiedItemAttr('shipBonusCB'), skill='Caldari Battleship', **kwargs)
 
 
@@ -22653,7 +22644,7 @@ class Effect5863(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Missile Launcher Operation'),
                                         'kineticDamage', ship.getModifiedItemAttr('shipBonusCB'),
                                         skill='Caldari Battleship', **kwargs)
 
@@ -22670,7 +22661,7 @@ class Effect5864(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Missile Launcher Operation'),
                                         'thermalDamage', ship.getModifiedItemAttr('shipBonusCB'),
                                         skill='Caldari Battleship', **kwargs)
 
@@ -22687,7 +22678,7 @@ class Effect5865(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Missile Launcher Operation'),
                                         'explosiveDamage', ship.getModifiedItemAttr('shipBonusCB'),
                                         skill='Caldari Battleship', **kwargs)
 
@@ -22704,7 +22695,7 @@ class Effect5866(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Warp Scrambler',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Warp Scrambler'),
                                       'maxRange', ship.getModifiedItemAttr('shipBonusGB'), skill='Gallente Battleship', **kwargs)
 
 
@@ -22722,7 +22713,7 @@ class Effect5867(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Missile Launcher Operation'),
                                         'explosionDelay', ship.getModifiedItemAttr('shipBonusRole8'), **kwargs)
 
 
@@ -22769,7 +22760,7 @@ class Effect5870(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Operation'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Shield Operation'),
                                       'shieldBonus', ship.getModifiedItemAttr('shipBonusCI2'), skill='Caldari Industrial', **kwargs)
 
 
@@ -22785,7 +22776,7 @@ class Effect5871(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Operation'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Shield Operation'),
                                       'shieldBonus', ship.getModifiedItemAttr('shipBonusMI2'), skill='Minmatar Industrial', **kwargs)
 
 
@@ -22801,7 +22792,7 @@ class Effect5872(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Repair Systems'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Repair Systems'),
                                       'armorDamageAmount', ship.getModifiedItemAttr('shipBonusAI2'),
                                       skill='Amarr Industrial', **kwargs)
 
@@ -22818,7 +22809,7 @@ class Effect5873(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Repair Systems'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Repair Systems'),
                                       'armorDamageAmount', ship.getModifiedItemAttr('shipBonusGI2'),
                                       skill='Gallente Industrial', **kwargs)
 
@@ -22887,7 +22878,7 @@ class Effect5889(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Afterburner'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Afterburner'),
                                       'overloadSpeedFactorBonus', ship.getModifiedItemAttr('roleBonusOverheatDST'), **kwargs)
 
 
@@ -22903,7 +22894,7 @@ class Effect5890(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('High Speed Maneuvering'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('High Speed Maneuvering'),
                                       'overloadSpeedFactorBonus', ship.getModifiedItemAttr('roleBonusOverheatDST'), **kwargs)
 
 
@@ -22919,7 +22910,7 @@ class Effect5891(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Hull Upgrades'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Hull Upgrades'),
                                       'overloadHardeningBonus', ship.getModifiedItemAttr('roleBonusOverheatDST'), **kwargs)
 
 
@@ -22935,7 +22926,7 @@ class Effect5892(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Hull Upgrades'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Hull Upgrades'),
                                       'overloadSelfDurationBonus', ship.getModifiedItemAttr('roleBonusOverheatDST'), **kwargs)
 
 
@@ -22951,7 +22942,7 @@ class Effect5893(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Tactical Shield Manipulation'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Tactical Shield Manipulation'),
                                       'overloadHardeningBonus', ship.getModifiedItemAttr('roleBonusOverheatDST'), **kwargs)
 
 
@@ -22967,9 +22958,9 @@ class Effect5896(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Operation'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Shield Operation'),
                                       'overloadShieldBonus', ship.getModifiedItemAttr('roleBonusOverheatDST'), **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Operation'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Shield Operation'),
                                       'overloadSelfDurationBonus', ship.getModifiedItemAttr('roleBonusOverheatDST'), **kwargs)
 
 
@@ -22985,9 +22976,9 @@ class Effect5899(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Repair Systems'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Repair Systems'),
                                       'overloadArmorDamageAmount', ship.getModifiedItemAttr('roleBonusOverheatDST'), **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Repair Systems'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Repair Systems'),
                                       'overloadSelfDurationBonus', ship.getModifiedItemAttr('roleBonusOverheatDST'), **kwargs)
 
 
@@ -23019,7 +23010,7 @@ class Effect5901(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Reinforced Bulkhead',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Reinforced Bulkhead'),
                                       'cpu', ship.getModifiedItemAttr('cpuNeedBonus'), **kwargs)
 
 
@@ -23053,7 +23044,7 @@ class Effect5912(BaseEffect):
 
     @staticmethod
     def handler(fit, beacon, context, **kwargs):
-        fit.modules.filteredItemMultiply(lambda mod: mod.item.group.name == 'Remote Capacitor Transmitter',
+        fit.modules.filteredItemMultiply(ItemGroupFilter('Remote Capacitor Transmitter'),
                                          'powerTransferAmount', beacon.getModifiedItemAttr('energyTransferAmountBonus'),
                                          stackingPenalties=True, penaltyGroup='postMul', **kwargs)
 
@@ -23087,7 +23078,7 @@ class Effect5914(BaseEffect):
 
     @staticmethod
     def handler(fit, beacon, context, **kwargs):
-        fit.modules.filteredItemMultiply(lambda mod: mod.item.group.name == 'Energy Neutralizer',
+        fit.modules.filteredItemMultiply(ItemGroupFilter('Energy Neutralizer'),
                                          'energyNeutralizerAmount',
                                          beacon.getModifiedItemAttr('energyWarfareStrengthMultiplier'),
                                          stackingPenalties=True, penaltyGroup='postMul', **kwargs)
@@ -23106,7 +23097,7 @@ class Effect5915(BaseEffect):
 
     @staticmethod
     def handler(fit, beacon, context, **kwargs):
-        fit.modules.filteredItemMultiply(lambda mod: mod.item.group.name == 'Energy Nosferatu',
+        fit.modules.filteredItemMultiply(ItemGroupFilter('Energy Nosferatu'),
                                          'powerTransferAmount',
                                          beacon.getModifiedItemAttr('energyWarfareStrengthMultiplier'),
                                          stackingPenalties=True, penaltyGroup='postMul', **kwargs)
@@ -23125,7 +23116,7 @@ class Effect5916(BaseEffect):
 
     @staticmethod
     def handler(fit, beacon, context, **kwargs):
-        fit.modules.filteredChargeMultiply(lambda mod: mod.charge.requiresSkill('Bomb Deployment'),
+        fit.modules.filteredChargeMultiply(ChargeSkillFilter('Bomb Deployment'),
                                            'explosiveDamage', beacon.getModifiedItemAttr('smartbombDamageMultiplier'),
                                            stackingPenalties=True, penaltyGroup='postMul', **kwargs)
 
@@ -23143,7 +23134,7 @@ class Effect5917(BaseEffect):
 
     @staticmethod
     def handler(fit, beacon, context, **kwargs):
-        fit.modules.filteredChargeMultiply(lambda mod: mod.charge.requiresSkill('Bomb Deployment'),
+        fit.modules.filteredChargeMultiply(ChargeSkillFilter('Bomb Deployment'),
                                            'kineticDamage', beacon.getModifiedItemAttr('smartbombDamageMultiplier'),
                                            stackingPenalties=True, penaltyGroup='postMul', **kwargs)
 
@@ -23161,7 +23152,7 @@ class Effect5918(BaseEffect):
 
     @staticmethod
     def handler(fit, beacon, context, **kwargs):
-        fit.modules.filteredChargeMultiply(lambda mod: mod.charge.requiresSkill('Bomb Deployment'),
+        fit.modules.filteredChargeMultiply(ChargeSkillFilter('Bomb Deployment'),
                                            'thermalDamage', beacon.getModifiedItemAttr('smartbombDamageMultiplier'),
                                            stackingPenalties=True, penaltyGroup='postMul', **kwargs)
 
@@ -23179,7 +23170,7 @@ class Effect5919(BaseEffect):
 
     @staticmethod
     def handler(fit, beacon, context, **kwargs):
-        fit.modules.filteredChargeMultiply(lambda mod: mod.charge.requiresSkill('Bomb Deployment'),
+        fit.modules.filteredChargeMultiply(ChargeSkillFilter('Bomb Deployment'),
                                            'emDamage', beacon.getModifiedItemAttr('smartbombDamageMultiplier'),
                                            stackingPenalties=True, penaltyGroup='postMul', **kwargs)
 
@@ -23197,7 +23188,7 @@ class Effect5920(BaseEffect):
 
     @staticmethod
     def handler(fit, beacon, context, **kwargs):
-        fit.modules.filteredChargeMultiply(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeMultiply(ChargeSkillFilter('Missile Launcher Operation'),
                                            'aoeCloudSize', beacon.getModifiedItemAttr('aoeCloudSizeMultiplier'), **kwargs)
 
 
@@ -23214,7 +23205,7 @@ class Effect5921(BaseEffect):
 
     @staticmethod
     def handler(fit, beacon, context, **kwargs):
-        fit.modules.filteredItemMultiply(lambda mod: mod.item.requiresSkill('Target Painting'),
+        fit.modules.filteredItemMultiply(ItemSkillFilter('Target Painting'),
                                          'signatureRadiusBonus',
                                          beacon.getModifiedItemAttr('targetPainterStrengthMultiplier'),
                                          stackingPenalties=True, penaltyGroup='postMul', **kwargs)
@@ -23233,7 +23224,7 @@ class Effect5922(BaseEffect):
 
     @staticmethod
     def handler(fit, beacon, context, **kwargs):
-        fit.modules.filteredItemMultiply(lambda mod: mod.item.group.name == 'Stasis Web',
+        fit.modules.filteredItemMultiply(ItemGroupFilter('Stasis Web'),
                                          'speedFactor', beacon.getModifiedItemAttr('stasisWebStrengthMultiplier'),
                                          stackingPenalties=True, penaltyGroup='postMul', **kwargs)
 
@@ -23251,7 +23242,7 @@ class Effect5923(BaseEffect):
 
     @staticmethod
     def handler(fit, beacon, context, **kwargs):
-        fit.modules.filteredChargeMultiply(lambda mod: mod.charge.requiresSkill('Bomb Deployment'),
+        fit.modules.filteredChargeMultiply(ChargeSkillFilter('Bomb Deployment'),
                                            'energyNeutralizerAmount',
                                            beacon.getModifiedItemAttr('smartbombDamageMultiplier'),
                                            stackingPenalties=True, penaltyGroup='postMul', **kwargs)
@@ -23270,7 +23261,7 @@ class Effect5924(BaseEffect):
 
     @staticmethod
     def handler(fit, beacon, context, **kwargs):
-        fit.modules.filteredChargeMultiply(lambda mod: mod.charge.requiresSkill('Bomb Deployment'),
+        fit.modules.filteredChargeMultiply(ChargeSkillFilter('Bomb Deployment'),
                                            'scanGravimetricStrengthBonus',
                                            beacon.getModifiedItemAttr('smartbombDamageMultiplier'),
                                            stackingPenalties=True, penaltyGroup='postMul', **kwargs)
@@ -23289,7 +23280,7 @@ class Effect5925(BaseEffect):
 
     @staticmethod
     def handler(fit, beacon, context, **kwargs):
-        fit.modules.filteredChargeMultiply(lambda mod: mod.charge.requiresSkill('Bomb Deployment'),
+        fit.modules.filteredChargeMultiply(ChargeSkillFilter('Bomb Deployment'),
                                            'scanLadarStrengthBonus',
                                            beacon.getModifiedItemAttr('smartbombDamageMultiplier'),
                                            stackingPenalties=True, penaltyGroup='postMul', **kwargs)
@@ -23308,7 +23299,7 @@ class Effect5926(BaseEffect):
 
     @staticmethod
     def handler(fit, beacon, context, **kwargs):
-        fit.modules.filteredChargeMultiply(lambda mod: mod.charge.requiresSkill('Bomb Deployment'),
+        fit.modules.filteredChargeMultiply(ChargeSkillFilter('Bomb Deployment'),
                                            'scanMagnetometricStrengthBonus',
                                            beacon.getModifiedItemAttr('smartbombDamageMultiplier'),
                                            stackingPenalties=True, penaltyGroup='postMul', **kwargs)
@@ -23327,7 +23318,7 @@ class Effect5927(BaseEffect):
 
     @staticmethod
     def handler(fit, beacon, context, **kwargs):
-        fit.modules.filteredChargeMultiply(lambda mod: mod.charge.requiresSkill('Bomb Deployment'),
+        fit.modules.filteredChargeMultiply(ChargeSkillFilter('Bomb Deployment'),
                                            'scanRadarStrengthBonus',
                                            beacon.getModifiedItemAttr('smartbombDamageMultiplier'),
                                            stackingPenalties=True, penaltyGroup='postMul', **kwargs)
@@ -23369,7 +23360,7 @@ class Effect5934(BaseEffect):
 
         fit.ship.increaseItemAttr('warpScrambleStatus', module.getModifiedItemAttr('warpScrambleStrength'))
         fit.modules.filteredItemIncrease(
-            lambda mod: mod.item.requiresSkill('High Speed Maneuvering') or mod.item.requiresSkill('Micro Jump Drive Operation'),
+            ItemSkillFilter('High Speed Maneuvering', 'Micro Jump Drive Operation'),
             'activationBlocked', module.getModifiedItemAttr('activationBlockedStrenght'), **kwargs)
 
 
@@ -23386,7 +23377,7 @@ class Effect5938(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, **kwargs):
         fit.modules.filteredChargeBoost(
-            lambda mod: mod.charge.requiresSkill('Rockets') or mod.charge.requiresSkill('Light Missiles'),
+            ChargeSkillFilter('Rockets', 'Light Missiles'),
             'aoeCloudSize', ship.getModifiedItemAttr('shipBonusCF2'), skill='Caldari Frigate', **kwargs)
 
 
@@ -23402,7 +23393,7 @@ class Effect5939(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Missile Launcher Rocket',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Missile Launcher Rocket'),
                                       'speed', ship.getModifiedItemAttr('shipBonus2AF'), skill='Amarr Frigate', **kwargs)
 
 
@@ -23418,7 +23409,7 @@ class Effect5940(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Hybrid Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Small Hybrid Turret'),
                                       'speed', ship.getModifiedItemAttr('eliteBonusInterdictors1'), skill='Interdictors', **kwargs)
 
 
@@ -23434,7 +23425,7 @@ class Effect5944(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Missile Launcher Operation'),
                                       'speed', ship.getModifiedItemAttr('shipBonusAD1'), skill='Amarr Destroyer', **kwargs)
 
 
@@ -23486,7 +23477,7 @@ class Effect5956(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Energy Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Medium Energy Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('shipBonusAC2'), skill='Amarr Cruiser', **kwargs)
 
 
@@ -23502,7 +23493,7 @@ class Effect5957(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Energy Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Medium Energy Turret'),
                                       'maxRange', ship.getModifiedItemAttr('eliteBonusHeavyInterdictors1'),
                                       skill='Heavy Interdiction Cruisers', **kwargs)
 
@@ -23521,7 +23512,7 @@ class Effect5958(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Hybrid Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Medium Hybrid Turret'),
                                       'trackingSpeed', ship.getModifiedItemAttr('shipBonusGC'), skill='Gallente Cruiser', **kwargs)
 
 
@@ -23537,7 +23528,7 @@ class Effect5959(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Hybrid Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Medium Hybrid Turret'),
                                       'maxRange', ship.getModifiedItemAttr('eliteBonusHeavyInterdictors1'),
                                       skill='Heavy Interdiction Cruisers', **kwargs)
 
@@ -23622,7 +23613,7 @@ class Effect6006(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Energy Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Small Energy Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('shipBonusTacticalDestroyerAmarr1'),
                                       skill='Amarr Tactical Destroyer', **kwargs)
 
@@ -23639,7 +23630,7 @@ class Effect6007(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Energy Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Small Energy Turret'),
                                       'capacitorNeed', ship.getModifiedItemAttr('shipBonusTacticalDestroyerAmarr2'),
                                       skill='Amarr Tactical Destroyer', **kwargs)
 
@@ -23674,7 +23665,7 @@ class Effect6009(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Astrometrics'), 'cpu', src.getModifiedItemAttr('roleBonusT3ProbeCPU'), **kwargs)
+        fit.modules.filteredItemBoost(ItemSkillFilter('Astrometrics'), 'cpu', src.getModifiedItemAttr('roleBonusT3ProbeCPU'), **kwargs)
 
 
 class Effect6010(BaseEffect):
@@ -23710,7 +23701,7 @@ class Effect6011(BaseEffect):
     @staticmethod
     def handler(fit, module, context, **kwargs):
         fit.modules.filteredItemMultiply(
-            lambda mod: mod.item.requiresSkill('Small Energy Turret'),
+            ItemSkillFilter('Small Energy Turret'),
             'maxRange',
             1 / module.getModifiedItemAttr('modeMaxRangePostDiv'),
             stackingPenalties=True,
@@ -23834,7 +23825,7 @@ class Effect6020(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Neutralizer', 'maxRange',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Energy Neutralizer'), 'maxRange',
                                       src.getModifiedItemAttr('eliteBonusReconShip3'), skill='Recon Ships', **kwargs)
 
 
@@ -23850,7 +23841,7 @@ class Effect6021(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Nosferatu', 'maxRange',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Energy Nosferatu'), 'maxRange',
                                       src.getModifiedItemAttr('eliteBonusReconShip3'), skill='Recon Ships', **kwargs)
 
 
@@ -23866,7 +23857,7 @@ class Effect6025(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Hybrid Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Medium Hybrid Turret'),
                                       'maxRange', ship.getModifiedItemAttr('eliteBonusReconShip1'), skill='Recon Ships', **kwargs)
 
 
@@ -23882,7 +23873,7 @@ class Effect6027(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Projectile Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Medium Projectile Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('eliteBonusReconShip1'),
                                       skill='Recon Ships', **kwargs)
 
@@ -23899,7 +23890,7 @@ class Effect6032(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Remote Capacitor Transmitter',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Remote Capacitor Transmitter'),
                                       'power', ship.getModifiedItemAttr('powerTransferPowerNeedBonus'), **kwargs)
 
 
@@ -23932,7 +23923,7 @@ class Effect6037(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Projectile Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Small Projectile Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('shipBonusTacticalDestroyerMinmatar1'),
                                       skill='Minmatar Tactical Destroyer', **kwargs)
 
@@ -23949,7 +23940,7 @@ class Effect6038(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Projectile Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Small Projectile Turret'),
                                       'maxRange', ship.getModifiedItemAttr('shipBonusTacticalDestroyerMinmatar2'),
                                       skill='Minmatar Tactical Destroyer', **kwargs)
 
@@ -23967,7 +23958,7 @@ class Effect6039(BaseEffect):
     @staticmethod
     def handler(fit, module, context, **kwargs):
         fit.modules.filteredItemMultiply(
-            lambda mod: mod.item.requiresSkill('Small Projectile Turret'),
+            ItemSkillFilter('Small Projectile Turret'),
             'trackingSpeed',
             1 / module.getModifiedItemAttr('modeTrackingPostDiv'),
             stackingPenalties=True,
@@ -23988,7 +23979,7 @@ class Effect6040(BaseEffect):
     @staticmethod
     def handler(fit, module, context, **kwargs):
         fit.modules.filteredItemMultiply(
-            lambda mod: mod.item.requiresSkill('High Speed Maneuvering'),
+            ItemSkillFilter('High Speed Maneuvering'),
             'signatureRadiusBonus',
             1 / module.getModifiedItemAttr('modeMWDSigPenaltyPostDiv'),
             stackingPenalties=True,
@@ -24035,7 +24026,7 @@ class Effect6045(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Sentry Drone Interfacing'),
+        fit.drones.filteredItemBoost(ItemSkillFilter('Sentry Drone Interfacing'),
                                      'damageMultiplier', ship.getModifiedItemAttr('shipBonusGC3'), skill='Gallente Cruiser', **kwargs)
 
 
@@ -24051,7 +24042,7 @@ class Effect6046(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Sentry Drone Interfacing'),
+        fit.drones.filteredItemBoost(ItemSkillFilter('Sentry Drone Interfacing'),
                                      'hp', ship.getModifiedItemAttr('shipBonusGC3'), skill='Gallente Cruiser', **kwargs)
 
 
@@ -24067,7 +24058,7 @@ class Effect6047(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Sentry Drone Interfacing'),
+        fit.drones.filteredItemBoost(ItemSkillFilter('Sentry Drone Interfacing'),
                                      'armorHP', ship.getModifiedItemAttr('shipBonusGC3'), skill='Gallente Cruiser', **kwargs)
 
 
@@ -24083,7 +24074,7 @@ class Effect6048(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Sentry Drone Interfacing'),
+        fit.drones.filteredItemBoost(ItemSkillFilter('Sentry Drone Interfacing'),
                                      'shieldCapacity', ship.getModifiedItemAttr('shipBonusGC3'), skill='Gallente Cruiser', **kwargs)
 
 
@@ -24099,7 +24090,7 @@ class Effect6051(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Light Drone Operation'),
+        fit.drones.filteredItemBoost(ItemSkillFilter('Light Drone Operation'),
                                      'damageMultiplier', ship.getModifiedItemAttr('shipBonusGC2'), skill='Gallente Cruiser', **kwargs)
 
 
@@ -24115,7 +24106,7 @@ class Effect6052(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Medium Drone Operation'),
+        fit.drones.filteredItemBoost(ItemSkillFilter('Medium Drone Operation'),
                                      'damageMultiplier', ship.getModifiedItemAttr('shipBonusGC2'), skill='Gallente Cruiser', **kwargs)
 
 
@@ -24131,7 +24122,7 @@ class Effect6053(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Heavy Drone Operation'),
+        fit.drones.filteredItemBoost(ItemSkillFilter('Heavy Drone Operation'),
                                      'damageMultiplier', ship.getModifiedItemAttr('shipBonusGC2'), skill='Gallente Cruiser', **kwargs)
 
 
@@ -24147,7 +24138,7 @@ class Effect6054(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Heavy Drone Operation'),
+        fit.drones.filteredItemBoost(ItemSkillFilter('Heavy Drone Operation'),
                                      'hp', ship.getModifiedItemAttr('shipBonusGC2'), skill='Gallente Cruiser', **kwargs)
 
 
@@ -24163,7 +24154,7 @@ class Effect6055(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Heavy Drone Operation'),
+        fit.drones.filteredItemBoost(ItemSkillFilter('Heavy Drone Operation'),
                                      'armorHP', ship.getModifiedItemAttr('shipBonusGC2'), skill='Gallente Cruiser', **kwargs)
 
 
@@ -24179,7 +24170,7 @@ class Effect6056(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Heavy Drone Operation'),
+        fit.drones.filteredItemBoost(ItemSkillFilter('Heavy Drone Operation'),
                                      'shieldCapacity', ship.getModifiedItemAttr('shipBonusGC2'), skill='Gallente Cruiser', **kwargs)
 
 
@@ -24195,7 +24186,7 @@ class Effect6057(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Medium Drone Operation'),
+        fit.drones.filteredItemBoost(ItemSkillFilter('Medium Drone Operation'),
                                      'shieldCapacity', ship.getModifiedItemAttr('shipBonusGC2'), skill='Gallente Cruiser', **kwargs)
 
 
@@ -24211,7 +24202,7 @@ class Effect6058(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Medium Drone Operation'),
+        fit.drones.filteredItemBoost(ItemSkillFilter('Medium Drone Operation'),
                                      'armorHP', ship.getModifiedItemAttr('shipBonusGC2'), skill='Gallente Cruiser', **kwargs)
 
 
@@ -24227,7 +24218,7 @@ class Effect6059(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Medium Drone Operation'),
+        fit.drones.filteredItemBoost(ItemSkillFilter('Medium Drone Operation'),
                                      'hp', ship.getModifiedItemAttr('shipBonusGC2'), skill='Gallente Cruiser', **kwargs)
 
 
@@ -24243,7 +24234,7 @@ class Effect6060(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Light Drone Operation'),
+        fit.drones.filteredItemBoost(ItemSkillFilter('Light Drone Operation'),
                                      'hp', ship.getModifiedItemAttr('shipBonusGC2'), skill='Gallente Cruiser', **kwargs)
 
 
@@ -24259,7 +24250,7 @@ class Effect6061(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Light Drone Operation'),
+        fit.drones.filteredItemBoost(ItemSkillFilter('Light Drone Operation'),
                                      'armorHP', ship.getModifiedItemAttr('shipBonusGC2'), skill='Gallente Cruiser', **kwargs)
 
 
@@ -24275,7 +24266,7 @@ class Effect6062(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Light Drone Operation'),
+        fit.drones.filteredItemBoost(ItemSkillFilter('Light Drone Operation'),
                                      'shieldCapacity', ship.getModifiedItemAttr('shipBonusGC2'), skill='Gallente Cruiser', **kwargs)
 
 
@@ -24312,7 +24303,7 @@ class Effect6076(BaseEffect):
     @staticmethod
     def handler(fit, module, context, **kwargs):
         fit.modules.filteredChargeMultiply(
-            lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+            ChargeSkillFilter('Missile Launcher Operation'),
             'maxVelocity',
             1 / module.getModifiedItemAttr('modeMaxRangePostDiv'),
             stackingPenalties=True,
@@ -24352,7 +24343,7 @@ class Effect6083(BaseEffect):
     def handler(fit, ship, context, **kwargs):
         for damageType in ('em', 'explosive', 'kinetic', 'thermal'):
             fit.modules.filteredChargeBoost(
-                lambda mod: mod.charge.requiresSkill('Rockets') or mod.charge.requiresSkill('Light Missiles'),
+                ChargeSkillFilter('Rockets', 'Light Missiles'),
                 '{0}Damage'.format(damageType), ship.getModifiedItemAttr('shipBonusRole7'), **kwargs)
 
 
@@ -24368,7 +24359,7 @@ class Effect6085(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Missile Launcher Operation'),
                                       'speed', ship.getModifiedItemAttr('shipBonusTacticalDestroyerCaldari1'),
                                       skill='Caldari Tactical Destroyer', **kwargs)
 
@@ -24387,7 +24378,7 @@ class Effect6088(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, **kwargs):
         for damageType in ('em', 'explosive', 'kinetic', 'thermal'):
-            fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Assault Missiles'),
+            fit.modules.filteredChargeBoost(ChargeSkillFilter('Heavy Assault Missiles'),
                                             '{0}Damage'.format(damageType), ship.getModifiedItemAttr('shipBonusMC2'),
                                             skill='Minmatar Cruiser', **kwargs)
 
@@ -24406,7 +24397,7 @@ class Effect6093(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, **kwargs):
         for damageType in ('em', 'explosive', 'kinetic', 'thermal'):
-            fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'),
+            fit.modules.filteredChargeBoost(ChargeSkillFilter('Heavy Missiles'),
                                             '{0}Damage'.format(damageType), ship.getModifiedItemAttr('shipBonusMC2'),
                                             skill='Minmatar Cruiser', **kwargs)
 
@@ -24425,7 +24416,7 @@ class Effect6096(BaseEffect):
     @staticmethod
     def handler(fit, ship, context, **kwargs):
         for damageType in ('em', 'explosive', 'kinetic', 'thermal'):
-            fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Light Missiles'),
+            fit.modules.filteredChargeBoost(ChargeSkillFilter('Light Missiles'),
                                             '{0}Damage'.format(damageType), ship.getModifiedItemAttr('shipBonusMC2'),
                                             skill='Minmatar Cruiser', **kwargs)
 
@@ -24442,7 +24433,7 @@ class Effect6098(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Missile Launcher Operation'),
                                       'reloadTime', ship.getModifiedItemAttr('shipBonusTacticalDestroyerCaldari2'),
                                       skill='Caldari Tactical Destroyer', **kwargs)
 
@@ -24459,7 +24450,7 @@ class Effect6104(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemMultiply(lambda mod: mod.item.requiresSkill('Infomorph Psychology'),
+        fit.modules.filteredItemMultiply(ItemSkillFilter('Infomorph Psychology'),
                                          'duration', ship.getModifiedItemAttr('entosisDurationMultiplier') or 1, **kwargs)
 
 
@@ -24475,7 +24466,7 @@ class Effect6110(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Missile Launcher Operation'),
                                         'maxVelocity', module.getModifiedItemAttr('missileVelocityBonus'),
                                         stackingPenalties=True, **kwargs)
 
@@ -24492,7 +24483,7 @@ class Effect6111(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Missile Launcher Operation'),
                                         'explosionDelay', module.getModifiedItemAttr('explosionDelayBonus'),
                                         stackingPenalties=True, **kwargs)
 
@@ -24509,7 +24500,7 @@ class Effect6112(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Missile Launcher Operation'),
                                         'aoeCloudSize', module.getModifiedItemAttr('aoeCloudSizeBonus'),
                                         stackingPenalties=True, **kwargs)
 
@@ -24527,7 +24518,7 @@ class Effect6113(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Missile Launcher Operation'),
                                         'aoeVelocity', module.getModifiedItemAttr('aoeVelocityBonus'),
                                         stackingPenalties=True, **kwargs)
 
@@ -24612,7 +24603,7 @@ class Effect6135(BaseEffect):
                 ('missileVelocityBonus', 'maxVelocity'),
                 ('explosionDelayBonus', 'explosionDelay'),
         ):
-            fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+            fit.modules.filteredChargeBoost(ChargeSkillFilter('Missile Launcher Operation'),
                                             tgtAttr, container.getModifiedItemAttr(srcAttr),
                                             stackingPenalties=True, **kwargs)
 
@@ -24668,7 +24659,7 @@ class Effect6149(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Hybrid Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Small Hybrid Turret'),
                                       'speed', ship.getModifiedItemAttr('shipBonusTacticalDestroyerGallente1'),
                                       skill='Gallente Tactical Destroyer', **kwargs)
 
@@ -24685,7 +24676,7 @@ class Effect6150(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Hybrid Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Small Hybrid Turret'),
                                       'trackingSpeed', ship.getModifiedItemAttr('shipBonusTacticalDestroyerGallente2'),
                                       skill='Gallente Tactical Destroyer', **kwargs)
 
@@ -24726,7 +24717,7 @@ class Effect6152(BaseEffect):
     @staticmethod
     def handler(fit, module, context, **kwargs):
         fit.modules.filteredItemMultiply(
-            lambda mod: mod.item.requiresSkill('Small Hybrid Turret'),
+            ItemSkillFilter('Small Hybrid Turret'),
             'maxRange',
             1 / module.getModifiedItemAttr('modeMaxRangePostDiv'),
             stackingPenalties=True,
@@ -24747,7 +24738,7 @@ class Effect6153(BaseEffect):
     @staticmethod
     def handler(fit, module, context, **kwargs):
         fit.modules.filteredItemMultiply(
-            lambda mod: mod.item.requiresSkill('High Speed Maneuvering'),
+            ItemSkillFilter('High Speed Maneuvering'),
             'capacitorNeed',
             1 / module.getModifiedItemAttr('modeMWDCapPostDiv'),
             **kwargs)
@@ -24766,7 +24757,7 @@ class Effect6154(BaseEffect):
     @staticmethod
     def handler(fit, module, context, **kwargs):
         fit.modules.filteredItemMultiply(
-            lambda mod: mod.item.requiresSkill('High Speed Maneuvering'),
+            ItemSkillFilter('High Speed Maneuvering'),
             'speedFactor',
             1 / module.getModifiedItemAttr('modeMWDVelocityPostDiv'),
             stackingPenalties=True,
@@ -24787,7 +24778,7 @@ class Effect6155(BaseEffect):
     @staticmethod
     def handler(fit, module, context, **kwargs):
         fit.modules.filteredItemMultiply(
-            lambda mod: mod.item.requiresSkill('Repair Systems'),
+            ItemSkillFilter('Repair Systems'),
             'duration',
             1 / module.getModifiedItemAttr('modeArmorRepDurationPostDiv'),
             **kwargs)
@@ -24838,11 +24829,11 @@ class Effect6166(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Propulsion Jamming'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Propulsion Jamming'),
                                       'speedFactorBonus', ship.getModifiedItemAttr('shipBonusAT'), **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Propulsion Jamming'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Propulsion Jamming'),
                                       'speedBoostFactorBonus', ship.getModifiedItemAttr('shipBonusAT'), **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Propulsion Jamming'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Propulsion Jamming'),
                                       'massBonusPercentage', ship.getModifiedItemAttr('shipBonusAT'), **kwargs)
 
 
@@ -24858,7 +24849,7 @@ class Effect6170(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemIncrease(lambda mod: mod.item.requiresSkill('Infomorph Psychology'),
+        fit.modules.filteredItemIncrease(ItemSkillFilter('Infomorph Psychology'),
                                          'entosisCPUAdd', ship.getModifiedItemAttr('entosisCPUPenalty'), **kwargs)
 
 
@@ -24889,9 +24880,9 @@ class Effect6172(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Energy Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Medium Energy Turret'),
                                       'maxRange', ship.getModifiedItemAttr('roleBonusCBC'), **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Energy Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Medium Energy Turret'),
                                       'falloff', ship.getModifiedItemAttr('roleBonusCBC'), **kwargs)
 
 
@@ -24908,9 +24899,9 @@ class Effect6173(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Hybrid Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Medium Hybrid Turret'),
                                       'maxRange', ship.getModifiedItemAttr('roleBonusCBC'), **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Hybrid Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Medium Hybrid Turret'),
                                       'falloff', ship.getModifiedItemAttr('roleBonusCBC'), **kwargs)
 
 
@@ -24926,9 +24917,9 @@ class Effect6174(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Projectile Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Medium Projectile Turret'),
                                       'maxRange', ship.getModifiedItemAttr('roleBonusCBC'), **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Projectile Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Medium Projectile Turret'),
                                       'falloff', ship.getModifiedItemAttr('roleBonusCBC'), **kwargs)
 
 
@@ -24945,7 +24936,7 @@ class Effect6175(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Missile Launcher Operation'),
                                         'maxVelocity', skill.getModifiedItemAttr('roleBonusCBC'), **kwargs)
 
 
@@ -24962,7 +24953,7 @@ class Effect6176(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+        fit.drones.filteredItemBoost(ItemSkillFilter('Drones'),
                                      'maxVelocity', ship.getModifiedItemAttr('roleBonusCBC'), **kwargs)
 
 
@@ -24978,7 +24969,7 @@ class Effect6177(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Hybrid Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Medium Hybrid Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('shipBonusCBC2'),
                                       skill='Caldari Battlecruiser', **kwargs)
 
@@ -24995,7 +24986,7 @@ class Effect6178(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Projectile Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Medium Projectile Turret'),
                                       'trackingSpeed', ship.getModifiedItemAttr('shipBonusMBC2'),
                                       skill='Minmatar Battlecruiser', **kwargs)
 
@@ -25139,7 +25130,7 @@ class Effect6196(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Ice Harvesting'), 'duration',
+        fit.modules.filteredItemBoost(ItemSkillFilter('Ice Harvesting'), 'duration',
                                       src.getModifiedItemAttr('eliteBonusExpedition2'), skill='Expedition Frigates', **kwargs)
 
 
@@ -25214,7 +25205,7 @@ class Effect6214(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Leadership'), 'power',
+        fit.modules.filteredItemBoost(ItemSkillFilter('Leadership'), 'power',
                                       src.getModifiedItemAttr('roleBonusCD'), **kwargs)
 
 
@@ -25260,7 +25251,7 @@ class Effect6222(BaseEffect):
         if 'projected' in context:
             fit.ship.increaseItemAttr('warpScrambleStatus', module.getModifiedItemAttr('warpScrambleStrength'), **kwargs)
             fit.modules.filteredItemIncrease(
-                lambda mod: mod.item.requiresSkill('High Speed Maneuvering') or mod.item.requiresSkill('Micro Jump Drive Operation'),
+                ItemSkillFilter('High Speed Maneuvering', 'Micro Jump Drive Operation'),
                 'activationBlocked', module.getModifiedItemAttr('activationBlockedStrenght'), **kwargs)
 
 
@@ -25276,7 +25267,7 @@ class Effect6230(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Neutralizer', 'maxRange',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Energy Neutralizer'), 'maxRange',
                                       src.getModifiedItemAttr('eliteBonusReconShip1'), skill='Recon Ships', **kwargs)
 
 
@@ -25292,7 +25283,7 @@ class Effect6232(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Neutralizer', 'falloffEffectiveness',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Energy Neutralizer'), 'falloffEffectiveness',
                                       src.getModifiedItemAttr('eliteBonusReconShip2'), skill='Recon Ships', **kwargs)
 
 
@@ -25308,7 +25299,7 @@ class Effect6233(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Neutralizer', 'falloffEffectiveness',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Energy Neutralizer'), 'falloffEffectiveness',
                                       src.getModifiedItemAttr('eliteBonusReconShip3'), skill='Recon Ships', **kwargs)
 
 
@@ -25324,7 +25315,7 @@ class Effect6234(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Nosferatu', 'maxRange',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Energy Nosferatu'), 'maxRange',
                                       src.getModifiedItemAttr('eliteBonusReconShip1'), skill='Recon Ships', **kwargs)
 
 
@@ -25340,7 +25331,7 @@ class Effect6237(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Nosferatu', 'falloffEffectiveness',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Energy Nosferatu'), 'falloffEffectiveness',
                                       src.getModifiedItemAttr('eliteBonusReconShip2'), skill='Recon Ships', **kwargs)
 
 
@@ -25356,7 +25347,7 @@ class Effect6238(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Nosferatu', 'falloffEffectiveness',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Energy Nosferatu'), 'falloffEffectiveness',
                                       src.getModifiedItemAttr('eliteBonusReconShip3'), skill='Recon Ships', **kwargs)
 
 
@@ -25372,7 +25363,7 @@ class Effect6239(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Ice Harvesting'), 'duration',
+        fit.modules.filteredItemBoost(ItemSkillFilter('Ice Harvesting'), 'duration',
                                       src.getModifiedItemAttr('shipBonusOREfrig2'), skill='Mining Frigate', **kwargs)
 
 
@@ -25388,7 +25379,7 @@ class Effect6241(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Neutralizer', 'falloffEffectiveness',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Energy Neutralizer'), 'falloffEffectiveness',
                                       src.getModifiedItemAttr('shipBonusAD1'), skill='Amarr Destroyer', **kwargs)
 
 
@@ -25404,7 +25395,7 @@ class Effect6242(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Neutralizer', 'maxRange',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Energy Neutralizer'), 'maxRange',
                                       src.getModifiedItemAttr('shipBonusAD2'), skill='Amarr Destroyer', **kwargs)
 
 
@@ -25420,7 +25411,7 @@ class Effect6245(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Nosferatu', 'maxRange',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Energy Nosferatu'), 'maxRange',
                                       src.getModifiedItemAttr('shipBonusAD2'), skill='Amarr Destroyer', **kwargs)
 
 
@@ -25436,7 +25427,7 @@ class Effect6246(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Nosferatu', 'falloffEffectiveness',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Energy Nosferatu'), 'falloffEffectiveness',
                                       src.getModifiedItemAttr('shipBonusAD1'), skill='Amarr Destroyer', **kwargs)
 
 
@@ -25452,7 +25443,7 @@ class Effect6253(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Neutralizer', 'maxRange',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Energy Neutralizer'), 'maxRange',
                                       src.getModifiedItemAttr('shipBonusAB'), skill='Amarr Battleship', **kwargs)
 
 
@@ -25468,7 +25459,7 @@ class Effect6256(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Neutralizer', 'falloffEffectiveness',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Energy Neutralizer'), 'falloffEffectiveness',
                                       src.getModifiedItemAttr('shipBonusAB2'), skill='Amarr Battleship', **kwargs)
 
 
@@ -25484,7 +25475,7 @@ class Effect6257(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Nosferatu', 'maxRange',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Energy Nosferatu'), 'maxRange',
                                       src.getModifiedItemAttr('shipBonusAB'), skill='Amarr Battleship', **kwargs)
 
 
@@ -25500,7 +25491,7 @@ class Effect6260(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Nosferatu', 'falloffEffectiveness',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Energy Nosferatu'), 'falloffEffectiveness',
                                       src.getModifiedItemAttr('shipBonusAB2'), skill='Amarr Battleship', **kwargs)
 
 
@@ -25516,7 +25507,7 @@ class Effect6267(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Neutralizer', 'maxRange',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Energy Neutralizer'), 'maxRange',
                                       src.getModifiedItemAttr('eliteBonusElectronicAttackShip1'),
                                       skill='Electronic Attack Ships', **kwargs)
 
@@ -25533,7 +25524,7 @@ class Effect6272(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Neutralizer', 'falloffEffectiveness',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Energy Neutralizer'), 'falloffEffectiveness',
                                       src.getModifiedItemAttr('eliteBonusElectronicAttackShip3'),
                                       skill='Electronic Attack Ships', **kwargs)
 
@@ -25550,7 +25541,7 @@ class Effect6273(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Nosferatu', 'maxRange',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Energy Nosferatu'), 'maxRange',
                                       src.getModifiedItemAttr('eliteBonusElectronicAttackShip1'),
                                       skill='Electronic Attack Ships', **kwargs)
 
@@ -25567,7 +25558,7 @@ class Effect6278(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Nosferatu', 'falloffEffectiveness',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Energy Nosferatu'), 'falloffEffectiveness',
                                       src.getModifiedItemAttr('eliteBonusElectronicAttackShip3'),
                                       skill='Electronic Attack Ships', **kwargs)
 
@@ -25584,7 +25575,7 @@ class Effect6281(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Neutralizer', 'maxRange',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Energy Neutralizer'), 'maxRange',
                                       src.getModifiedItemAttr('shipBonus2AF'), skill='Amarr Frigate', **kwargs)
 
 
@@ -25600,7 +25591,7 @@ class Effect6285(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Neutralizer', 'falloffEffectiveness',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Energy Neutralizer'), 'falloffEffectiveness',
                                       src.getModifiedItemAttr('shipBonus3AF'), skill='Amarr Frigate', **kwargs)
 
 
@@ -25616,7 +25607,7 @@ class Effect6287(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Nosferatu', 'maxRange',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Energy Nosferatu'), 'maxRange',
                                       src.getModifiedItemAttr('shipBonus2AF'), skill='Amarr Frigate', **kwargs)
 
 
@@ -25632,7 +25623,7 @@ class Effect6291(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Nosferatu', 'falloffEffectiveness',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Energy Nosferatu'), 'falloffEffectiveness',
                                       src.getModifiedItemAttr('shipBonus3AF'), skill='Amarr Frigate', **kwargs)
 
 
@@ -25648,7 +25639,7 @@ class Effect6294(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Neutralizer', 'maxRange',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Energy Neutralizer'), 'maxRange',
                                       src.getModifiedItemAttr('shipBonusAC'), skill='Amarr Cruiser', **kwargs)
 
 
@@ -25664,7 +25655,7 @@ class Effect6299(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Neutralizer', 'falloffEffectiveness',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Energy Neutralizer'), 'falloffEffectiveness',
                                       src.getModifiedItemAttr('shipBonusAC3'), skill='Amarr Cruiser', **kwargs)
 
 
@@ -25680,7 +25671,7 @@ class Effect6300(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Nosferatu', 'maxRange',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Energy Nosferatu'), 'maxRange',
                                       src.getModifiedItemAttr('shipBonusAC'), skill='Amarr Cruiser', **kwargs)
 
 
@@ -25696,9 +25687,9 @@ class Effect6301(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Nosferatu', 'falloffEffectiveness',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Energy Nosferatu'), 'falloffEffectiveness',
                                       src.getModifiedItemAttr('shipBonusAC2'), skill='Amarr Cruiser', **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Nosferatu', 'maxRange',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Energy Nosferatu'), 'maxRange',
                                       src.getModifiedItemAttr('shipBonusAC2'), skill='Amarr Cruiser', **kwargs)
 
 
@@ -25714,7 +25705,7 @@ class Effect6305(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Nosferatu', 'falloffEffectiveness',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Energy Nosferatu'), 'falloffEffectiveness',
                                       src.getModifiedItemAttr('shipBonusAC3'), skill='Amarr Cruiser', **kwargs)
 
 
@@ -25730,7 +25721,7 @@ class Effect6307(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'), 'thermalDamage',
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Missile Launcher Operation'), 'thermalDamage',
                                         src.getModifiedItemAttr('shipBonusMD1'), skill='Minmatar Destroyer', **kwargs)
 
 
@@ -25746,7 +25737,7 @@ class Effect6308(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'), 'emDamage',
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Missile Launcher Operation'), 'emDamage',
                                         src.getModifiedItemAttr('shipBonusMD1'), skill='Minmatar Destroyer', **kwargs)
 
 
@@ -25762,7 +25753,7 @@ class Effect6309(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'), 'kineticDamage',
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Missile Launcher Operation'), 'kineticDamage',
                                         src.getModifiedItemAttr('shipBonusMD1'), skill='Minmatar Destroyer', **kwargs)
 
 
@@ -25778,7 +25769,7 @@ class Effect6310(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Missile Launcher Operation'),
                                         'explosiveDamage', src.getModifiedItemAttr('shipBonusMD1'),
                                         skill='Minmatar Destroyer', **kwargs)
 
@@ -25796,7 +25787,7 @@ class Effect6315(BaseEffect):
     @staticmethod
     def handler(fit, src, context, **kwargs):
         for attrName in ('buffDuration', 'warfareBuff1Value', 'warfareBuff2Value', 'warfareBuff3Value', 'warfareBuff4Value'):
-            fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Skirmish Command'),
+            fit.modules.filteredItemBoost(ItemSkillFilter('Skirmish Command'),
                                           attrName, src.getModifiedItemAttr('eliteBonusCommandDestroyer1'),
                                           skill='Command Destroyers', **kwargs)
 
@@ -25815,7 +25806,7 @@ class Effect6316(BaseEffect):
     @staticmethod
     def handler(fit, src, context, **kwargs):
         for attrName in ('buffDuration', 'warfareBuff1Value', 'warfareBuff2Value', 'warfareBuff3Value', 'warfareBuff4Value'):
-            fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Command'),
+            fit.modules.filteredItemBoost(ItemSkillFilter('Shield Command'),
                                           attrName, src.getModifiedItemAttr('eliteBonusCommandDestroyer1'),
                                           skill='Command Destroyers', **kwargs)
 
@@ -25832,7 +25823,7 @@ class Effect6317(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Micro Jump Drive Operation'), 'duration',
+        fit.modules.filteredItemBoost(ItemSkillFilter('Micro Jump Drive Operation'), 'duration',
                                       src.getModifiedItemAttr('eliteBonusCommandDestroyer2'), skill='Command Destroyers', **kwargs)
 
 
@@ -25976,7 +25967,7 @@ class Effect6326(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'), 'thermalDamage',
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Missile Launcher Operation'), 'thermalDamage',
                                         src.getModifiedItemAttr('shipBonusCD1'), skill='Caldari Destroyer', **kwargs)
 
 
@@ -25992,7 +25983,7 @@ class Effect6327(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'), 'emDamage',
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Missile Launcher Operation'), 'emDamage',
                                         src.getModifiedItemAttr('shipBonusCD1'), skill='Caldari Destroyer', **kwargs)
 
 
@@ -26008,7 +25999,7 @@ class Effect6328(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'), 'kineticDamage',
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Missile Launcher Operation'), 'kineticDamage',
                                         src.getModifiedItemAttr('shipBonusCD1'), skill='Caldari Destroyer', **kwargs)
 
 
@@ -26024,7 +26015,7 @@ class Effect6329(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Missile Launcher Operation'),
                                         'explosiveDamage', src.getModifiedItemAttr('shipBonusCD1'),
                                         skill='Caldari Destroyer', **kwargs)
 
@@ -26106,7 +26097,7 @@ class Effect6334(BaseEffect):
     @staticmethod
     def handler(fit, src, context, **kwargs):
         for attrName in ('buffDuration', 'warfareBuff1Value', 'warfareBuff2Value', 'warfareBuff3Value', 'warfareBuff4Value'):
-            fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Information Command'),
+            fit.modules.filteredItemBoost(ItemSkillFilter('Information Command'),
                                           attrName, src.getModifiedItemAttr('eliteBonusCommandDestroyer1'),
                                           skill='Command Destroyers', **kwargs)
 
@@ -26188,7 +26179,7 @@ class Effect6339(BaseEffect):
     @staticmethod
     def handler(fit, src, context, **kwargs):
         for attrName in ('buffDuration', 'warfareBuff1Value', 'warfareBuff2Value', 'warfareBuff3Value', 'warfareBuff4Value'):
-            fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Armored Command'),
+            fit.modules.filteredItemBoost(ItemSkillFilter('Armored Command'),
                                           attrName, src.getModifiedItemAttr('eliteBonusCommandDestroyer1'),
                                           skill='Command Destroyers', **kwargs)
 
@@ -26270,7 +26261,7 @@ class Effect6350(BaseEffect):
     @staticmethod
     def handler(fit, src, context, **kwargs):
         fit.modules.filteredChargeBoost(
-            lambda mod: mod.charge.requiresSkill('Light Missiles') or mod.charge.requiresSkill('Rockets'), 'kineticDamage',
+            ChargeSkillFilter('Light Missiles', 'Rockets'), 'kineticDamage',
             src.getModifiedItemAttr('shipBonus3CF'), skill='Caldari Frigate', **kwargs)
 
 
@@ -26286,7 +26277,7 @@ class Effect6351(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'), 'kineticDamage',
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Missile Launcher Operation'), 'kineticDamage',
                                         src.getModifiedItemAttr('shipBonusCC3'), skill='Caldari Cruiser', **kwargs)
 
 
@@ -26302,9 +26293,9 @@ class Effect6352(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Weapon Disruption'), 'falloffEffectiveness',
+        fit.modules.filteredItemBoost(ItemSkillFilter('Weapon Disruption'), 'falloffEffectiveness',
                                       src.getModifiedItemAttr('roleBonus'), **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Weapon Disruption'), 'maxRange',
+        fit.modules.filteredItemBoost(ItemSkillFilter('Weapon Disruption'), 'maxRange',
                                       src.getModifiedItemAttr('roleBonus'), **kwargs)
 
 
@@ -26320,9 +26311,9 @@ class Effect6353(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Weapon Disruption'), 'cpu',
+        fit.modules.filteredItemBoost(ItemSkillFilter('Weapon Disruption'), 'cpu',
                                       src.getModifiedItemAttr('roleBonus'), **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Weapon Disruption'), 'capacitorNeed',
+        fit.modules.filteredItemBoost(ItemSkillFilter('Weapon Disruption'), 'capacitorNeed',
                                       src.getModifiedItemAttr('roleBonus'), **kwargs)
 
 
@@ -26342,7 +26333,7 @@ class Effect6354(BaseEffect):
             'trackingSpeedBonus', 'explosionDelayBonus', 'maxRangeBonus', 'falloffBonus',
             'missileVelocityBonus', 'aoeVelocityBonus', 'aoeCloudSizeBonus'
         ):
-            fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Weapon Disruption'), attrName,
+            fit.modules.filteredItemBoost(ItemSkillFilter('Weapon Disruption'), attrName,
                                           src.getModifiedItemAttr('shipBonus2AF'), skill='Amarr Frigate', **kwargs)
 
 
@@ -26358,9 +26349,9 @@ class Effect6355(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'ECM', 'capacitorNeed',
+        fit.modules.filteredItemBoost(ItemGroupFilter('ECM'), 'capacitorNeed',
                                       src.getModifiedItemAttr('roleBonus'), **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'ECM', 'cpu', src.getModifiedItemAttr('roleBonus'), **kwargs)
+        fit.modules.filteredItemBoost(ItemGroupFilter('ECM'), 'cpu', src.getModifiedItemAttr('roleBonus'), **kwargs)
 
 
 class Effect6356(BaseEffect):
@@ -26375,9 +26366,9 @@ class Effect6356(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'ECM', 'falloffEffectiveness',
+        fit.modules.filteredItemBoost(ItemGroupFilter('ECM'), 'falloffEffectiveness',
                                       src.getModifiedItemAttr('roleBonus'), **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'ECM', 'maxRange',
+        fit.modules.filteredItemBoost(ItemGroupFilter('ECM'), 'maxRange',
                                       src.getModifiedItemAttr('roleBonus'), **kwargs)
 
 
@@ -26393,7 +26384,7 @@ class Effect6357(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Navigation'), 'maxRange',
+        fit.modules.filteredItemBoost(ItemSkillFilter('Navigation'), 'maxRange',
                                       src.getModifiedItemAttr('shipBonusGF2'), skill='Gallente Frigate', **kwargs)
 
 
@@ -26409,7 +26400,7 @@ class Effect6358(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemIncrease(lambda mod: mod.item.requiresSkill('Navigation'),
+        fit.modules.filteredItemIncrease(ItemSkillFilter('Navigation'),
                                          'warpScrambleStrength', ship.getModifiedItemAttr('roleBonus'), **kwargs)
 
 
@@ -26425,7 +26416,7 @@ class Effect6359(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Rockets'), 'aoeVelocity',
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Rockets'), 'aoeVelocity',
                                         src.getModifiedItemAttr('shipBonusMF'), skill='Minmatar Frigate', **kwargs)
 
 
@@ -26441,11 +26432,11 @@ class Effect6360(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Rockets'), 'emDamage',
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Rockets'), 'emDamage',
                                         src.getModifiedItemAttr('shipBonusMF2'), skill='Minmatar Frigate', **kwargs)
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Rockets'), 'thermalDamage',
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Rockets'), 'thermalDamage',
                                         src.getModifiedItemAttr('shipBonusMF2'), skill='Minmatar Frigate', **kwargs)
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Rockets'), 'kineticDamage',
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Rockets'), 'kineticDamage',
                                         src.getModifiedItemAttr('shipBonusMF2'), skill='Minmatar Frigate', **kwargs)
 
 
@@ -26461,7 +26452,7 @@ class Effect6361(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Rockets'), 'explosiveDamage',
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Rockets'), 'explosiveDamage',
                                         src.getModifiedItemAttr('shipBonus3MF'), skill='Minmatar Frigate', **kwargs)
 
 
@@ -26477,7 +26468,7 @@ class Effect6362(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Stasis Web', 'maxRange',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Stasis Web'), 'maxRange',
                                       src.getModifiedItemAttr('roleBonus'), **kwargs)
 
 
@@ -26496,9 +26487,9 @@ class Effect6368(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Remote Shield Booster', 'falloffEffectiveness',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Remote Shield Booster'), 'falloffEffectiveness',
                                       src.getModifiedItemAttr('falloffBonus'), **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Ancillary Remote Shield Booster',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Ancillary Remote Shield Booster'),
                                       'falloffEffectiveness', src.getModifiedItemAttr('falloffBonus'), **kwargs)
 
 
@@ -26514,7 +26505,7 @@ class Effect6369(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Emission Systems'), 'falloffEffectiveness',
+        fit.modules.filteredItemBoost(ItemSkillFilter('Shield Emission Systems'), 'falloffEffectiveness',
                                       src.getModifiedItemAttr('shipBonusMC2'), skill='Minmatar Cruiser', **kwargs)
 
 
@@ -26531,7 +26522,7 @@ class Effect6370(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Emission Systems'), 'falloffEffectiveness',
+        fit.modules.filteredItemBoost(ItemSkillFilter('Shield Emission Systems'), 'falloffEffectiveness',
                                       src.getModifiedItemAttr('shipBonusCC'), skill='Caldari Cruiser', **kwargs)
 
 
@@ -26547,7 +26538,7 @@ class Effect6371(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Remote Armor Repair Systems'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Remote Armor Repair Systems'),
                                       'falloffEffectiveness', src.getModifiedItemAttr('shipBonusGC'),
                                       skill='Gallente Cruiser', **kwargs)
 
@@ -26564,7 +26555,7 @@ class Effect6372(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Remote Armor Repair Systems'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Remote Armor Repair Systems'),
                                       'falloffEffectiveness', src.getModifiedItemAttr('shipBonusAC2'),
                                       skill='Amarr Cruiser', **kwargs)
 
@@ -26585,9 +26576,9 @@ class Effect6373(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Remote Armor Repairer', 'falloffEffectiveness',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Remote Armor Repairer'), 'falloffEffectiveness',
                                       src.getModifiedItemAttr('falloffBonus'), **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Ancillary Remote Armor Repairer',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Ancillary Remote Armor Repairer'),
                                       'falloffEffectiveness', src.getModifiedItemAttr('falloffBonus'), **kwargs)
 
 
@@ -26605,7 +26596,7 @@ class Effect6374(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.group.name == 'Logistic Drone', 'structureDamageAmount',
+        fit.drones.filteredItemBoost(ItemGroupFilter('Logistic Drone'), 'structureDamageAmount',
                                      src.getModifiedItemAttr('droneArmorDamageAmountBonus'), **kwargs)
 
 
@@ -26622,9 +26613,9 @@ class Effect6377(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Remote Armor Repair Systems'), 'capacitorNeed',
+        fit.modules.filteredItemBoost(ItemSkillFilter('Remote Armor Repair Systems'), 'capacitorNeed',
                                       src.getModifiedItemAttr('eliteBonusLogiFrig1'), skill='Logistics Frigates', **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Remote Armor Repair Systems'), 'duration',
+        fit.modules.filteredItemBoost(ItemSkillFilter('Remote Armor Repair Systems'), 'duration',
                                       src.getModifiedItemAttr('eliteBonusLogiFrig1'), skill='Logistics Frigates', **kwargs)
 
 
@@ -26641,9 +26632,9 @@ class Effect6378(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Emission Systems'), 'duration',
+        fit.modules.filteredItemBoost(ItemSkillFilter('Shield Emission Systems'), 'duration',
                                       src.getModifiedItemAttr('eliteBonusLogiFrig1'), skill='Logistics Frigates', **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Emission Systems'), 'capacitorNeed',
+        fit.modules.filteredItemBoost(ItemSkillFilter('Shield Emission Systems'), 'capacitorNeed',
                                       src.getModifiedItemAttr('eliteBonusLogiFrig1'), skill='Logistics Frigates', **kwargs)
 
 
@@ -26728,7 +26719,7 @@ class Effect6385(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemForce(lambda mod: mod.item.group.name == 'Cloaking Device',
+        fit.modules.filteredItemForce(ItemGroupFilter('Cloaking Device'),
                                       'maxVelocityModifier', src.getModifiedItemAttr('velocityPenaltyReduction'), **kwargs)
 
 
@@ -26752,7 +26743,7 @@ class Effect6386(BaseEffect):
                 'aoeCloudSizeBonus',
                 'missileVelocityBonus'
         ):
-            fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Weapon Disruption'),
+            fit.modules.filteredItemBoost(ItemSkillFilter('Weapon Disruption'),
                                           attr, src.getModifiedItemAttr('scanSkillEwStrengthBonus') * level, **kwargs)
 
 
@@ -26772,7 +26763,7 @@ class Effect6395(BaseEffect):
             'missileVelocityBonus', 'aoeVelocityBonus', 'maxRangeBonus', 'explosionDelayBonus',
             'aoeCloudSizeBonus', 'trackingSpeedBonus', 'falloffBonus'
         ):
-            fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Weapon Disruption'), attrName,
+            fit.modules.filteredItemBoost(ItemSkillFilter('Weapon Disruption'), attrName,
                                           src.getModifiedItemAttr('shipBonusAC'), skill='Amarr Cruiser', **kwargs)
 
 
@@ -26790,7 +26781,7 @@ class Effect6396(BaseEffect):
     def handler(fit, src, context, **kwargs):
         groups = ('Structure Anti-Capital Missile', 'Structure Anti-Subcapital Missile', 'Structure Guided Bomb')
         for damageType in ('em', 'thermal', 'explosive', 'kinetic'):
-            fit.modules.filteredChargeBoost(lambda mod: mod.charge.group.name in groups,
+            fit.modules.filteredChargeBoost(ChargeGroupFilter(*groups),
                                             '%sDamage' % damageType, src.getModifiedItemAttr('damageMultiplierBonus'),
                                             skill='Structure Missile Systems', **kwargs)
 
@@ -26808,7 +26799,7 @@ class Effect6400(BaseEffect):
     @staticmethod
     def handler(fit, src, context, **kwargs):
         groups = ('Structure Warp Scrambler', 'Structure Disruption Battery', 'Structure Stasis Webifier')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name in groups,
+        fit.modules.filteredItemBoost(ItemGroupFilter(*groups),
                                       'capacitorNeed', src.getModifiedItemAttr('capNeedBonus'),
                                       skill='Structure Electronic Systems', **kwargs)
 
@@ -26826,7 +26817,7 @@ class Effect6401(BaseEffect):
     @staticmethod
     def handler(fit, src, context, **kwargs):
         groups = ('Structure Energy Neutralizer', 'Structure Area Denial Module')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name in groups,
+        fit.modules.filteredItemBoost(ItemGroupFilter(*groups),
                                       'capacitorNeed', src.getModifiedItemAttr('capNeedBonus'),
                                       skill='Structure Engineering Systems', **kwargs)
 
@@ -26845,7 +26836,7 @@ class Effect6402(BaseEffect):
     def handler(fit, src, context, **kwargs):
         groups = ('Structure Anti-Subcapital Missile', 'Structure Anti-Capital Missile')
 
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.group.name in groups,
+        fit.modules.filteredChargeBoost(ChargeGroupFilter(*groups),
                                       'aoeVelocity', src.getModifiedItemAttr('structureRigMissileExploVeloBonus'),
                                       stackingPenalties=True, **kwargs)
 
@@ -26863,7 +26854,7 @@ class Effect6403(BaseEffect):
     @staticmethod
     def handler(fit, src, context, **kwargs):
         groups = ('Structure Anti-Subcapital Missile', 'Structure Anti-Capital Missile')
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.group.name in groups,
+        fit.modules.filteredChargeBoost(ChargeGroupFilter(*groups),
                                       'maxVelocity', src.getModifiedItemAttr('structureRigMissileVelocityBonus'),
                                       stackingPenalties=True, **kwargs)
 
@@ -26881,11 +26872,11 @@ class Effect6404(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Structure Energy Neutralizer',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Structure Energy Neutralizer'),
                                       'maxRange', src.getModifiedItemAttr('structureRigEwarOptimalBonus'),
                                       stackingPenalties=True, **kwargs)
 
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Structure Energy Neutralizer',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Structure Energy Neutralizer'),
                                       'falloffEffectiveness', src.getModifiedItemAttr('structureRigEwarFalloffBonus'),
                                       stackingPenalties=True, **kwargs)
 
@@ -26903,7 +26894,7 @@ class Effect6405(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Structure Energy Neutralizer',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Structure Energy Neutralizer'),
                                       'capacitorNeed', src.getModifiedItemAttr('structureRigEwarCapUseBonus'),
                                       stackingPenalties=True, **kwargs)
 
@@ -26923,15 +26914,15 @@ class Effect6406(BaseEffect):
     def handler(fit, src, context, **kwargs):
         groups = ('Structure ECM Battery', 'Structure Disruption Battery')
 
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name in groups,
+        fit.modules.filteredItemBoost(ItemGroupFilter(*groups),
                                       'falloff', src.getModifiedItemAttr('structureRigEwarFalloffBonus'),
                                       stackingPenalties=True, **kwargs)
 
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name in groups,
+        fit.modules.filteredItemBoost(ItemGroupFilter(*groups),
                                       'maxRange', src.getModifiedItemAttr('structureRigEwarOptimalBonus'),
                                       stackingPenalties=True, **kwargs)
 
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name in groups,
+        fit.modules.filteredItemBoost(ItemGroupFilter(*groups),
                                       'falloffEffectiveness', src.getModifiedItemAttr('structureRigEwarFalloffBonus'),
                                       stackingPenalties=True, **kwargs)
 
@@ -26950,7 +26941,7 @@ class Effect6407(BaseEffect):
     @staticmethod
     def handler(fit, src, context, **kwargs):
         groups = ('Structure ECM Battery', 'Structure Disruption Battery')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name in groups,
+        fit.modules.filteredItemBoost(ItemGroupFilter(*groups),
                                       'capacitorNeed', src.getModifiedItemAttr('structureRigEwarCapUseBonus'),
                                       stackingPenalties=True, **kwargs)
 
@@ -27002,7 +26993,7 @@ class Effect6410(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.group.name == 'Structure Guided Bomb',
+        fit.modules.filteredChargeBoost(ChargeGroupFilter('Structure Guided Bomb'),
                                         'aoeCloudSize', src.getModifiedItemAttr('structureRigMissileExplosionRadiusBonus'),
                                         stackingPenalties=True, **kwargs)
 
@@ -27020,7 +27011,7 @@ class Effect6411(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.group.name == 'Structure Guided Bomb',
+        fit.modules.filteredChargeBoost(ChargeGroupFilter('Structure Guided Bomb'),
                                         'maxVelocity', src.getModifiedItemAttr('structureRigMissileVelocityBonus'),
                                         stackingPenalties=True, **kwargs)
 
@@ -27038,7 +27029,7 @@ class Effect6412(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Structure Area Denial Module',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Structure Area Denial Module'),
                                       'empFieldRange', src.getModifiedItemAttr('structureRigPDRangeBonus'),
                                       stackingPenalties=True, **kwargs)
 
@@ -27056,7 +27047,7 @@ class Effect6413(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Structure Area Denial Module',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Structure Area Denial Module'),
                                       'capacitorNeed', src.getModifiedItemAttr('structureRigPDCapUseBonus'),
                                       stackingPenalties=True, **kwargs)
 
@@ -27073,7 +27064,7 @@ class Effect6417(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemIncrease(lambda mod: mod.item.group.name == 'Structure Doomsday Weapon',
+        fit.modules.filteredItemIncrease(ItemGroupFilter('Structure Doomsday Weapon'),
                                          'lightningWeaponDamageLossTarget',
                                          src.getModifiedItemAttr('structureRigDoomsdayDamageLossTargetBonus'), **kwargs)
 
@@ -27120,7 +27111,7 @@ class Effect6423(BaseEffect):
                     ('missileVelocityBonus', 'maxVelocity'),
                     ('explosionDelayBonus', 'explosionDelay'),
             ):
-                fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+                fit.modules.filteredChargeBoost(ChargeSkillFilter('Missile Launcher Operation'),
                                                 tgtAttr, module.getModifiedItemAttr(srcAttr),
                                                 stackingPenalties=True, **kwargs)
 
@@ -27139,13 +27130,13 @@ class Effect6424(BaseEffect):
     @staticmethod
     def handler(fit, module, context, **kwargs):
         if 'projected' in context:
-            fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Gunnery'),
+            fit.modules.filteredItemBoost(ItemSkillFilter('Gunnery'),
                                           'trackingSpeed', module.getModifiedItemAttr('trackingSpeedBonus'),
                                           stackingPenalties=True, **kwargs)
-            fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Gunnery'),
+            fit.modules.filteredItemBoost(ItemSkillFilter('Gunnery'),
                                           'maxRange', module.getModifiedItemAttr('maxRangeBonus'),
                                           stackingPenalties=True, **kwargs)
-            fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Gunnery'),
+            fit.modules.filteredItemBoost(ItemSkillFilter('Gunnery'),
                                           'falloff', module.getModifiedItemAttr('falloffBonus'),
                                           stackingPenalties=True, **kwargs)
 
@@ -27228,13 +27219,13 @@ class Effect6428(BaseEffect):
     @staticmethod
     def handler(fit, module, context, **kwargs):
         if 'projected' in context:
-            fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Gunnery'),
+            fit.modules.filteredItemBoost(ItemSkillFilter('Gunnery'),
                                           'trackingSpeed', module.getModifiedItemAttr('trackingSpeedBonus'),
                                           stackingPenalties=True, **kwargs)
-            fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Gunnery'),
+            fit.modules.filteredItemBoost(ItemSkillFilter('Gunnery'),
                                           'maxRange', module.getModifiedItemAttr('maxRangeBonus'),
                                           stackingPenalties=True, **kwargs)
-            fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Gunnery'),
+            fit.modules.filteredItemBoost(ItemSkillFilter('Gunnery'),
                                           'falloff', module.getModifiedItemAttr('falloffBonus'),
                                           stackingPenalties=True, **kwargs)
 
@@ -27448,7 +27439,7 @@ class Effect6448(BaseEffect):
                 ('missileVelocityBonus', 'maxVelocity'),
                 ('explosionDelayBonus', 'explosionDelay'),
         ):
-            fit.modules.filteredChargeBoost(lambda mod: mod.charge.group.name in missileGroups,
+            fit.modules.filteredChargeBoost(ChargeGroupFilter(*missileGroups),
                                             tgtAttr, container.getModifiedItemAttr(srcAttr),
                                             stackingPenalties=True, **kwargs)
 
@@ -27468,13 +27459,13 @@ class Effect6449(BaseEffect):
         missileGroups = ('Structure Anti-Capital Missile', 'Structure Anti-Subcapital Missile')
 
         for dmgType in ('em', 'kinetic', 'explosive', 'thermal'):
-            fit.modules.filteredChargeMultiply(lambda mod: mod.charge.group.name in missileGroups,
+            fit.modules.filteredChargeMultiply(ChargeGroupFilter(*missileGroups),
                                                '%sDamage' % dmgType,
                                                module.getModifiedItemAttr('missileDamageMultiplierBonus'),
                                                stackingPenalties=True, **kwargs)
 
         launcherGroups = ('Structure XL Missile Launcher', 'Structure Multirole Missile Launcher')
-        fit.modules.filteredItemMultiply(lambda mod: mod.item.group.name in launcherGroups,
+        fit.modules.filteredItemMultiply(ItemGroupFilter(*launcherGroups),
                                          'speed', module.getModifiedItemAttr('speedMultiplier'),
                                          stackingPenalties=True, **kwargs)
 
@@ -27577,7 +27568,7 @@ class Effect6475(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemIncrease(lambda mod: mod.item.group.name == 'Structure Doomsday Weapon',
+        fit.modules.filteredItemIncrease(ItemGroupFilter('Structure Doomsday Weapon'),
                                          'lightningWeaponTargetAmount',
                                          src.getModifiedItemAttr('structureRigDoomsdayTargetAmountBonus'), **kwargs)
 
@@ -27665,17 +27656,17 @@ class Effect6479(BaseEffect):
                     ('missileVelocityBonus', 'maxVelocity'),
                     ('explosionDelayBonus', 'explosionDelay'),
             ):
-                fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+                fit.modules.filteredChargeBoost(ChargeSkillFilter('Missile Launcher Operation'),
                                                 tgtAttr, module.getModifiedItemAttr(srcAttr),
                                                 stackingPenalties=True, **kwargs)
 
-            fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Gunnery'),
+            fit.modules.filteredItemBoost(ItemSkillFilter('Gunnery'),
                                           'trackingSpeed', module.getModifiedItemAttr('trackingSpeedBonus'),
                                           stackingPenalties=True, **kwargs)
-            fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Gunnery'),
+            fit.modules.filteredItemBoost(ItemSkillFilter('Gunnery'),
                                           'maxRange', module.getModifiedItemAttr('maxRangeBonus'),
                                           stackingPenalties=True, **kwargs)
-            fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Gunnery'),
+            fit.modules.filteredItemBoost(ItemSkillFilter('Gunnery'),
                                           'falloff', module.getModifiedItemAttr('falloffBonus'),
                                           stackingPenalties=True, **kwargs)
 
@@ -27798,7 +27789,7 @@ class Effect6501(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Energy Turret'), 'damageMultiplier',
+        fit.modules.filteredItemBoost(ItemSkillFilter('Capital Energy Turret'), 'damageMultiplier',
                                       src.getModifiedItemAttr('shipBonusDreadnoughtA1'), skill='Amarr Dreadnought', **kwargs)
 
 
@@ -27836,7 +27827,7 @@ class Effect6503(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Energy Turret'), 'capacitorNeed',
+        fit.modules.filteredItemBoost(ItemSkillFilter('Capital Energy Turret'), 'capacitorNeed',
                                       src.getModifiedItemAttr('shipBonusDreadnoughtA3'), skill='Amarr Dreadnought', **kwargs)
 
 
@@ -27853,9 +27844,7 @@ class Effect6504(BaseEffect):
     @staticmethod
     def handler(fit, src, context, **kwargs):
         for attrName in ('emDamage', 'thermalDamage', 'kineticDamage', 'explosiveDamage'):
-            fit.modules.filteredChargeBoost(lambda mod: (mod.charge.requiresSkill('XL Torpedoes') or
-                                                         mod.charge.requiresSkill('XL Cruise Missiles') or
-                                                         mod.charge.requiresSkill('Torpedoes')), attrName,
+            fit.modules.filteredChargeBoost(ChargeSkillFilter('XL Torpedoes', 'XL Cruise Missiles', 'Torpedoes'), attrName,
                                             src.getModifiedItemAttr('shipBonusDreadnoughtC1'),
                                             skill='Caldari Dreadnought', **kwargs)
 
@@ -27894,7 +27883,7 @@ class Effect6506(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Hybrid Turret'), 'damageMultiplier',
+        fit.modules.filteredItemBoost(ItemSkillFilter('Capital Hybrid Turret'), 'damageMultiplier',
                                       src.getModifiedItemAttr('shipBonusDreadnoughtG1'), skill='Gallente Dreadnought', **kwargs)
 
 
@@ -27910,7 +27899,7 @@ class Effect6507(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Hybrid Turret'), 'speed',
+        fit.modules.filteredItemBoost(ItemSkillFilter('Capital Hybrid Turret'), 'speed',
                                       src.getModifiedItemAttr('shipBonusDreadnoughtG2'), skill='Gallente Dreadnought', **kwargs)
 
 
@@ -27926,7 +27915,7 @@ class Effect6508(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Repair Systems'), 'duration',
+        fit.modules.filteredItemBoost(ItemSkillFilter('Capital Repair Systems'), 'duration',
                                       src.getModifiedItemAttr('shipBonusDreadnoughtG3'), skill='Gallente Dreadnought', **kwargs)
 
 
@@ -27942,7 +27931,7 @@ class Effect6509(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Projectile Turret'), 'damageMultiplier',
+        fit.modules.filteredItemBoost(ItemSkillFilter('Capital Projectile Turret'), 'damageMultiplier',
                                       src.getModifiedItemAttr('shipBonusDreadnoughtM1'), skill='Minmatar Dreadnought', **kwargs)
 
 
@@ -27958,7 +27947,7 @@ class Effect6510(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Projectile Turret'), 'speed',
+        fit.modules.filteredItemBoost(ItemSkillFilter('Capital Projectile Turret'), 'speed',
                                       src.getModifiedItemAttr('shipBonusDreadnoughtM2'), skill='Minmatar Dreadnought', **kwargs)
 
 
@@ -27974,7 +27963,7 @@ class Effect6511(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Shield Operation'), 'duration',
+        fit.modules.filteredItemBoost(ItemSkillFilter('Capital Shield Operation'), 'duration',
                                       src.getModifiedItemAttr('shipBonusDreadnoughtM2'), skill='Minmatar Dreadnought', **kwargs)
 
 
@@ -28014,12 +28003,10 @@ class Effect6526(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capacitor Emission Systems') or
-                                                  mod.item.requiresSkill('Capital Capacitor Emission Systems'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Capacitor Emission Systems', 'Capital Capacitor Emission Systems'),
                                       'powerTransferAmount', src.getModifiedItemAttr('shipBonusForceAuxiliaryA1'),
                                       skill='Amarr Carrier', **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Remote Armor Repair Systems') or
-                                                  mod.item.requiresSkill('Capital Remote Armor Repair Systems'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Remote Armor Repair Systems', 'Capital Remote Armor Repair Systems'),
                                       'armorDamageAmount', src.getModifiedItemAttr('shipBonusForceAuxiliaryA1'),
                                       skill='Amarr Carrier', **kwargs)
 
@@ -28058,24 +28045,19 @@ class Effect6533(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Armored Command') or
-                                                  mod.item.requiresSkill('Information Command'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Armored Command', 'Information Command'),
                                       'warfareBuff4Value', src.getModifiedItemAttr('shipBonusForceAuxiliaryA4'),
                                       skill='Amarr Carrier', **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Armored Command') or
-                                                  mod.item.requiresSkill('Information Command'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Armored Command', 'Information Command'),
                                       'warfareBuff3Value', src.getModifiedItemAttr('shipBonusForceAuxiliaryA4'),
                                       skill='Amarr Carrier', **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Armored Command') or
-                                                  mod.item.requiresSkill('Information Command'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Armored Command', 'Information Command'),
                                       'warfareBuff1Value', src.getModifiedItemAttr('shipBonusForceAuxiliaryA4'),
                                       skill='Amarr Carrier', **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Armored Command') or
-                                                  mod.item.requiresSkill('Information Command'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Armored Command', 'Information Command'),
                                       'buffDuration', src.getModifiedItemAttr('shipBonusForceAuxiliaryA4'),
                                       skill='Amarr Carrier', **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Armored Command') or
-                                                  mod.item.requiresSkill('Information Command'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Armored Command', 'Information Command'),
                                       'warfareBuff2Value', src.getModifiedItemAttr('shipBonusForceAuxiliaryA4'),
                                       skill='Amarr Carrier', **kwargs)
 
@@ -28093,19 +28075,19 @@ class Effect6534(BaseEffect):
     @staticmethod
     def handler(fit, src, context, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Skirmish Command') or mod.item.requiresSkill('Shield Command'),
+            ItemSkillFilter('Skirmish Command', 'Shield Command'),
             'warfareBuff3Value', src.getModifiedItemAttr('shipBonusForceAuxiliaryM4'), skill='Minmatar Carrier', **kwargs)
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Skirmish Command') or mod.item.requiresSkill('Shield Command'),
+            ItemSkillFilter('Skirmish Command', 'Shield Command'),
             'warfareBuff2Value', src.getModifiedItemAttr('shipBonusForceAuxiliaryM4'), skill='Minmatar Carrier', **kwargs)
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Skirmish Command') or mod.item.requiresSkill('Shield Command'),
+            ItemSkillFilter('Skirmish Command', 'Shield Command'),
             'warfareBuff1Value', src.getModifiedItemAttr('shipBonusForceAuxiliaryM4'), skill='Minmatar Carrier', **kwargs)
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Skirmish Command') or mod.item.requiresSkill('Shield Command'),
+            ItemSkillFilter('Skirmish Command', 'Shield Command'),
             'buffDuration', src.getModifiedItemAttr('shipBonusForceAuxiliaryM4'), skill='Minmatar Carrier', **kwargs)
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Skirmish Command') or mod.item.requiresSkill('Shield Command'),
+            ItemSkillFilter('Skirmish Command', 'Shield Command'),
             'warfareBuff4Value', src.getModifiedItemAttr('shipBonusForceAuxiliaryM4'), skill='Minmatar Carrier', **kwargs)
 
 
@@ -28122,19 +28104,19 @@ class Effect6535(BaseEffect):
     @staticmethod
     def handler(fit, src, context, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Skirmish Command') or mod.item.requiresSkill('Armored Command'),
+            ItemSkillFilter('Skirmish Command', 'Armored Command'),
             'warfareBuff3Value', src.getModifiedItemAttr('shipBonusForceAuxiliaryG4'), skill='Gallente Carrier', **kwargs)
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Skirmish Command') or mod.item.requiresSkill('Armored Command'),
+            ItemSkillFilter('Skirmish Command', 'Armored Command'),
             'warfareBuff4Value', src.getModifiedItemAttr('shipBonusForceAuxiliaryG4'), skill='Gallente Carrier', **kwargs)
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Skirmish Command') or mod.item.requiresSkill('Armored Command'),
+            ItemSkillFilter('Skirmish Command', 'Armored Command'),
             'buffDuration', src.getModifiedItemAttr('shipBonusForceAuxiliaryG4'), skill='Gallente Carrier', **kwargs)
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Skirmish Command') or mod.item.requiresSkill('Armored Command'),
+            ItemSkillFilter('Skirmish Command', 'Armored Command'),
             'warfareBuff2Value', src.getModifiedItemAttr('shipBonusForceAuxiliaryG4'), skill='Gallente Carrier', **kwargs)
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Skirmish Command') or mod.item.requiresSkill('Armored Command'),
+            ItemSkillFilter('Skirmish Command', 'Armored Command'),
             'warfareBuff1Value', src.getModifiedItemAttr('shipBonusForceAuxiliaryG4'), skill='Gallente Carrier', **kwargs)
 
 
@@ -28151,19 +28133,19 @@ class Effect6536(BaseEffect):
     @staticmethod
     def handler(fit, src, context, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Shield Command') or mod.item.requiresSkill('Information Command'),
+            ItemSkillFilter('Shield Command', 'Information Command'),
             'warfareBuff3Value', src.getModifiedItemAttr('shipBonusForceAuxiliaryC4'), skill='Caldari Carrier', **kwargs)
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Shield Command') or mod.item.requiresSkill('Information Command'),
+            ItemSkillFilter('Shield Command', 'Information Command'),
             'warfareBuff4Value', src.getModifiedItemAttr('shipBonusForceAuxiliaryC4'), skill='Caldari Carrier', **kwargs)
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Shield Command') or mod.item.requiresSkill('Information Command'),
+            ItemSkillFilter('Shield Command', 'Information Command'),
             'warfareBuff2Value', src.getModifiedItemAttr('shipBonusForceAuxiliaryC4'), skill='Caldari Carrier', **kwargs)
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Shield Command') or mod.item.requiresSkill('Information Command'),
+            ItemSkillFilter('Shield Command', 'Information Command'),
             'buffDuration', src.getModifiedItemAttr('shipBonusForceAuxiliaryC4'), skill='Caldari Carrier', **kwargs)
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Shield Command') or mod.item.requiresSkill('Information Command'),
+            ItemSkillFilter('Shield Command', 'Information Command'),
             'warfareBuff1Value', src.getModifiedItemAttr('shipBonusForceAuxiliaryC4'), skill='Caldari Carrier', **kwargs)
 
 
@@ -28179,7 +28161,7 @@ class Effect6537(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Leadership'), 'cpu',
+        fit.modules.filteredItemBoost(ItemSkillFilter('Leadership'), 'cpu',
                                       src.getModifiedItemAttr('shipBonusRole1'), **kwargs)
 
 
@@ -28198,12 +28180,10 @@ class Effect6545(BaseEffect):
         if src.getModifiedItemAttr('shipBonusForceAuxiliaryC1') is None:
             return  # See GH Issue 1321
 
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capacitor Emission Systems') or
-                                                  mod.item.requiresSkill('Capital Capacitor Emission Systems'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Capacitor Emission Systems', 'Capital Capacitor Emission Systems'),
                                       'powerTransferAmount', src.getModifiedItemAttr('shipBonusForceAuxiliaryC1'),
                                       skill='Caldari Carrier', **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Emission Systems') or
-                                                  mod.item.requiresSkill('Capital Shield Emission Systems'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Shield Emission Systems', 'Capital Shield Emission Systems'),
                                       'shieldBonus', src.getModifiedItemAttr('shipBonusForceAuxiliaryC1'),
                                       skill='Caldari Carrier', **kwargs)
 
@@ -28242,12 +28222,10 @@ class Effect6548(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Emission Systems') or
-                                                  mod.item.requiresSkill('Capital Shield Emission Systems'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Shield Emission Systems', 'Capital Shield Emission Systems'),
                                       'duration', src.getModifiedItemAttr('shipBonusForceAuxiliaryG1'),
                                       skill='Gallente Carrier', **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Remote Armor Repair Systems') or
-                                                  mod.item.requiresSkill('Capital Remote Armor Repair Systems'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Remote Armor Repair Systems', 'Capital Remote Armor Repair Systems'),
                                       'duration', src.getModifiedItemAttr('shipBonusForceAuxiliaryG1'),
                                       skill='Gallente Carrier', **kwargs)
 
@@ -28264,9 +28242,9 @@ class Effect6549(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Repair Systems'), 'armorDamageAmount',
+        fit.modules.filteredItemBoost(ItemSkillFilter('Repair Systems'), 'armorDamageAmount',
                                       src.getModifiedItemAttr('shipBonusForceAuxiliaryG2'), skill='Gallente Carrier', **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Repair Systems'), 'armorDamageAmount',
+        fit.modules.filteredItemBoost(ItemSkillFilter('Capital Repair Systems'), 'armorDamageAmount',
                                       src.getModifiedItemAttr('shipBonusForceAuxiliaryG2'), skill='Gallente Carrier', **kwargs)
 
 
@@ -28282,13 +28260,11 @@ class Effect6551(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Emission Systems') or
-                                                  mod.item.requiresSkill('Capital Shield Emission Systems'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Shield Emission Systems', 'Capital Shield Emission Systems'),
                                       'duration', src.getModifiedItemAttr('shipBonusForceAuxiliaryM1'),
                                       skill='Minmatar Carrier', **kwargs)
 
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Remote Armor Repair Systems') or
-                                                  mod.item.requiresSkill('Capital Remote Armor Repair Systems'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Remote Armor Repair Systems', 'Capital Remote Armor Repair Systems'),
                                       'duration', src.getModifiedItemAttr('shipBonusForceAuxiliaryM1'),
                                       skill='Minmatar Carrier', **kwargs)
 
@@ -28305,9 +28281,9 @@ class Effect6552(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Shield Operation'), 'shieldBonus',
+        fit.modules.filteredItemBoost(ItemSkillFilter('Capital Shield Operation'), 'shieldBonus',
                                       src.getModifiedItemAttr('shipBonusForceAuxiliaryM2'), skill='Minmatar Carrier', **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Operation'), 'shieldBonus',
+        fit.modules.filteredItemBoost(ItemSkillFilter('Shield Operation'), 'shieldBonus',
                                       src.getModifiedItemAttr('shipBonusForceAuxiliaryM2'), skill='Minmatar Carrier', **kwargs)
 
 
@@ -28323,9 +28299,9 @@ class Effect6555(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'), 'maxVelocity',
+        fit.fighters.filteredItemBoost(ItemSkillFilter('Fighters'), 'maxVelocity',
                                        src.getModifiedItemAttr('speedFactor'), stackingPenalties=True, **kwargs)
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'), 'maxVelocity',
+        fit.drones.filteredItemBoost(ItemSkillFilter('Drones'), 'maxVelocity',
                                      src.getModifiedItemAttr('speedFactor'), stackingPenalties=True, **kwargs)
 
 
@@ -28343,16 +28319,16 @@ class Effect6556(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemBoost(ItemSkillFilter('Fighters'),
                                        'fighterAbilityMissilesDamageMultiplier',
                                        src.getModifiedItemAttr('droneDamageBonus'), stackingPenalties=True, **kwargs)
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemBoost(ItemSkillFilter('Fighters'),
                                        'fighterAbilityAttackTurretDamageMultiplier',
                                        src.getModifiedItemAttr('droneDamageBonus'), stackingPenalties=True, **kwargs)
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemBoost(ItemSkillFilter('Fighters'),
                                        'fighterAbilityAttackMissileDamageMultiplier',
                                        src.getModifiedItemAttr('droneDamageBonus'), stackingPenalties=True, **kwargs)
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'), 'damageMultiplier',
+        fit.drones.filteredItemBoost(ItemSkillFilter('Drones'), 'damageMultiplier',
                                      src.getModifiedItemAttr('droneDamageBonus'), stackingPenalties=True, **kwargs)
 
 
@@ -28368,39 +28344,39 @@ class Effect6557(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemBoost(ItemSkillFilter('Fighters'),
                                        'fighterAbilityAttackTurretRangeFalloff', src.getModifiedItemAttr('falloffBonus'),
                                        stackingPenalties=True, **kwargs)
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemBoost(ItemSkillFilter('Fighters'),
                                        'fighterAbilityMissilesExplosionVelocity',
                                        src.getModifiedItemAttr('aoeVelocityBonus'), stackingPenalties=True, **kwargs)
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'), 'trackingSpeed',
+        fit.drones.filteredItemBoost(ItemSkillFilter('Drones'), 'trackingSpeed',
                                      src.getModifiedItemAttr('trackingSpeedBonus'), stackingPenalties=True, **kwargs)
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemBoost(ItemSkillFilter('Fighters'),
                                        'fighterAbilityAttackMissileExplosionRadius',
                                        src.getModifiedItemAttr('aoeCloudSizeBonus'), stackingPenalties=True, **kwargs)
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemBoost(ItemSkillFilter('Fighters'),
                                        'fighterAbilityAttackTurretTrackingSpeed',
                                        src.getModifiedItemAttr('trackingSpeedBonus'), stackingPenalties=True, **kwargs)
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemBoost(ItemSkillFilter('Fighters'),
                                        'fighterAbilityMissilesExplosionRadius',
                                        src.getModifiedItemAttr('aoeCloudSizeBonus'), stackingPenalties=True, **kwargs)
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'), 'fighterAbilityMissilesRange',
+        fit.fighters.filteredItemBoost(ItemSkillFilter('Fighters'), 'fighterAbilityMissilesRange',
                                        src.getModifiedItemAttr('maxRangeBonus'), stackingPenalties=True, **kwargs)
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemBoost(ItemSkillFilter('Fighters'),
                                        'fighterAbilityAttackMissileRangeOptimal', src.getModifiedItemAttr('maxRangeBonus'),
                                        stackingPenalties=True, **kwargs)
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'), 'falloff',
+        fit.drones.filteredItemBoost(ItemSkillFilter('Drones'), 'falloff',
                                      src.getModifiedItemAttr('falloffBonus'), stackingPenalties=True, **kwargs)
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemBoost(ItemSkillFilter('Fighters'),
                                        'fighterAbilityAttackMissileExplosionVelocity',
                                        src.getModifiedItemAttr('aoeVelocityBonus'), stackingPenalties=True, **kwargs)
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemBoost(ItemSkillFilter('Fighters'),
                                        'fighterAbilityAttackMissileRangeFalloff', src.getModifiedItemAttr('falloffBonus'),
                                        stackingPenalties=True, **kwargs)
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'), 'maxRange',
+        fit.drones.filteredItemBoost(ItemSkillFilter('Drones'), 'maxRange',
                                      src.getModifiedItemAttr('maxRangeBonus'), stackingPenalties=True, **kwargs)
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemBoost(ItemSkillFilter('Fighters'),
                                        'fighterAbilityAttackTurretRangeOptimal', src.getModifiedItemAttr('maxRangeBonus'),
                                        stackingPenalties=True, **kwargs)
 
@@ -28437,40 +28413,40 @@ class Effect6559(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemBoost(ItemSkillFilter('Fighters'),
                                        'fighterAbilityAttackMissileExplosionRadius',
                                        src.getModifiedItemAttr('aoeCloudSizeBonus'), stackingPenalties=True, **kwargs)
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemBoost(ItemSkillFilter('Fighters'),
                                        'fighterAbilityAttackMissileRangeOptimal', src.getModifiedItemAttr('maxRangeBonus'),
                                        stackingPenalties=True, **kwargs)
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemBoost(ItemSkillFilter('Fighters'),
                                        'fighterAbilityAttackTurretRangeFalloff', src.getModifiedItemAttr('falloffBonus'),
                                        stackingPenalties=True, **kwargs)
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemBoost(ItemSkillFilter('Fighters'),
                                        'fighterAbilityMissilesExplosionRadius',
                                        src.getModifiedItemAttr('aoeCloudSizeBonus'), stackingPenalties=True, **kwargs)
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'), 'falloff',
+        fit.drones.filteredItemBoost(ItemSkillFilter('Drones'), 'falloff',
                                      src.getModifiedItemAttr('falloffBonus'), stackingPenalties=True, **kwargs)
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemBoost(ItemSkillFilter('Fighters'),
                                        'fighterAbilityAttackMissileRangeFalloff', src.getModifiedItemAttr('falloffBonus'),
                                        stackingPenalties=True, **kwargs)
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemBoost(ItemSkillFilter('Fighters'),
                                        'fighterAbilityAttackTurretTrackingSpeed',
                                        src.getModifiedItemAttr('trackingSpeedBonus'), stackingPenalties=True, **kwargs)
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'), 'maxRange',
+        fit.drones.filteredItemBoost(ItemSkillFilter('Drones'), 'maxRange',
                                      src.getModifiedItemAttr('maxRangeBonus'), stackingPenalties=True, **kwargs)
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'), 'trackingSpeed',
+        fit.drones.filteredItemBoost(ItemSkillFilter('Drones'), 'trackingSpeed',
                                      src.getModifiedItemAttr('trackingSpeedBonus'), stackingPenalties=True, **kwargs)
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemBoost(ItemSkillFilter('Fighters'),
                                        'fighterAbilityAttackTurretRangeOptimal', src.getModifiedItemAttr('maxRangeBonus'),
                                        stackingPenalties=True, **kwargs)
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemBoost(ItemSkillFilter('Fighters'),
                                        'fighterAbilityMissilesExplosionVelocity',
                                        src.getModifiedItemAttr('aoeVelocityBonus'), stackingPenalties=True, **kwargs)
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemBoost(ItemSkillFilter('Fighters'),
                                        'fighterAbilityAttackMissileExplosionVelocity',
                                        src.getModifiedItemAttr('aoeVelocityBonus'), stackingPenalties=True, **kwargs)
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'), 'fighterAbilityMissilesRange',
+        fit.fighters.filteredItemBoost(ItemSkillFilter('Fighters'), 'fighterAbilityMissilesRange',
                                        src.getModifiedItemAttr('maxRangeBonus'), stackingPenalties=True, **kwargs)
 
 
@@ -28487,13 +28463,13 @@ class Effect6560(BaseEffect):
     @staticmethod
     def handler(fit, src, context, **kwargs):
         lvl = src.level
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemBoost(ItemSkillFilter('Fighters'),
                                        'fighterAbilityAttackMissileDamageMultiplier',
                                        src.getModifiedItemAttr('damageMultiplierBonus') * lvl, **kwargs)
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemBoost(ItemSkillFilter('Fighters'),
                                        'fighterAbilityAttackTurretDamageMultiplier',
                                        src.getModifiedItemAttr('damageMultiplierBonus') * lvl, **kwargs)
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemBoost(ItemSkillFilter('Fighters'),
                                        'fighterAbilityMissilesDamageMultiplier',
                                        src.getModifiedItemAttr('damageMultiplierBonus') * lvl, **kwargs)
 
@@ -28511,7 +28487,7 @@ class Effect6561(BaseEffect):
     @staticmethod
     def handler(fit, src, context, **kwargs):
         lvl = src.level
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Light Fighters'), 'maxVelocity',
+        fit.fighters.filteredItemBoost(ItemSkillFilter('Light Fighters'), 'maxVelocity',
                                        src.getModifiedItemAttr('maxVelocityBonus') * lvl, **kwargs)
 
 
@@ -28528,7 +28504,7 @@ class Effect6562(BaseEffect):
     @staticmethod
     def handler(fit, src, context, **kwargs):
         lvl = src.level
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Support Fighters'), 'shieldCapacity',
+        fit.fighters.filteredItemBoost(ItemSkillFilter('Support Fighters'), 'shieldCapacity',
                                        src.getModifiedItemAttr('shieldBonus') * lvl, **kwargs)
 
 
@@ -28545,13 +28521,13 @@ class Effect6563(BaseEffect):
     @staticmethod
     def handler(fit, src, context, **kwargs):
         lvl = src.level
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Heavy Fighters'),
+        fit.fighters.filteredItemBoost(ItemSkillFilter('Heavy Fighters'),
                                        'fighterAbilityMissilesDamageMultiplier',
                                        src.getModifiedItemAttr('damageMultiplierBonus') * lvl, **kwargs)
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Heavy Fighters'),
+        fit.fighters.filteredItemBoost(ItemSkillFilter('Heavy Fighters'),
                                        'fighterAbilityAttackMissileDamageMultiplier',
                                        src.getModifiedItemAttr('damageMultiplierBonus') * lvl, **kwargs)
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Heavy Fighters'),
+        fit.fighters.filteredItemBoost(ItemSkillFilter('Heavy Fighters'),
                                        'fighterAbilityAttackTurretDamageMultiplier',
                                        src.getModifiedItemAttr('damageMultiplierBonus') * lvl, **kwargs)
 
@@ -28582,7 +28558,7 @@ class Effect6565(BaseEffect):
             'structureRigEwarCapUseBonus',
             'structureRigMissileExplosionRadiusBonus'
         ]:
-            fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Jury Rigging'),
+            fit.modules.filteredItemBoost(ItemSkillFilter('Jury Rigging'),
                                       attr, src.getModifiedItemAttr('structureRoleBonus'), **kwargs)
 
 
@@ -28598,18 +28574,18 @@ class Effect6566(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.fighters.filteredItemMultiply(lambda mod: mod.item.requiresSkill('Fighters'), 'shieldCapacity',
+        fit.fighters.filteredItemMultiply(ItemSkillFilter('Fighters'), 'shieldCapacity',
                                        src.getModifiedItemAttr('fighterBonusShieldCapacityPercent'), **kwargs)
-        fit.fighters.filteredItemMultiply(lambda mod: mod.item.requiresSkill('Fighters'), 'maxVelocity',
+        fit.fighters.filteredItemMultiply(ItemSkillFilter('Fighters'), 'maxVelocity',
                                        src.getModifiedItemAttr('fighterBonusVelocityPercent'), stackingPenalties=True, penaltyGroup='postMul', **kwargs)
-        fit.fighters.filteredItemMultiply(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemMultiply(ItemSkillFilter('Fighters'),
                                        'fighterAbilityAttackMissileDuration',
                                        src.getModifiedItemAttr('fighterBonusROFPercent'), stackingPenalties=True, penaltyGroup='postMul', **kwargs)
-        fit.fighters.filteredItemMultiply(lambda mod: mod.item.requiresSkill('Fighters'), 'fighterAbilityAttackTurretDuration',
+        fit.fighters.filteredItemMultiply(ItemSkillFilter('Fighters'), 'fighterAbilityAttackTurretDuration',
                                        src.getModifiedItemAttr('fighterBonusROFPercent'), stackingPenalties=True, penaltyGroup='postMul', **kwargs)
-        fit.fighters.filteredItemMultiply(lambda mod: mod.item.requiresSkill('Fighters'), 'fighterAbilityMissilesDuration',
+        fit.fighters.filteredItemMultiply(ItemSkillFilter('Fighters'), 'fighterAbilityMissilesDuration',
                                        src.getModifiedItemAttr('fighterBonusROFPercent'), stackingPenalties=True, penaltyGroup='postMul', **kwargs)
-        fit.fighters.filteredItemMultiply(lambda mod: mod.item.requiresSkill('Fighters'), 'shieldRechargeRate',
+        fit.fighters.filteredItemMultiply(ItemSkillFilter('Fighters'), 'shieldRechargeRate',
                                        src.getModifiedItemAttr('fighterBonusShieldRechargePercent'), **kwargs)
 
 
@@ -28631,7 +28607,7 @@ class Effect6567(BaseEffect):
             attr = 'scan{}Strength'.format(scanType)
             bonus = src.getModifiedItemAttr('scan{}StrengthPercent'.format(scanType))
             fit.ship.boostItemAttr(attr, bonus, stackingPenalties=True, **kwargs)
-            fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'), attr, bonus,
+            fit.fighters.filteredItemBoost(ItemSkillFilter('Fighters'), attr, bonus,
                                            stackingPenalties=True, **kwargs)
 
         # EW cap need increase
@@ -28677,7 +28653,7 @@ class Effect6571(BaseEffect):
     @staticmethod
     def handler(fit, src, context, **kwargs):
         lvl = src.level
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Autocannon Specialization'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Capital Autocannon Specialization'),
                                       'damageMultiplier', src.getModifiedItemAttr('damageMultiplierBonus') * lvl, **kwargs)
 
 
@@ -28694,7 +28670,7 @@ class Effect6572(BaseEffect):
     @staticmethod
     def handler(fit, src, context, **kwargs):
         lvl = src.level
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Artillery Specialization'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Capital Artillery Specialization'),
                                       'damageMultiplier', src.getModifiedItemAttr('damageMultiplierBonus') * lvl, **kwargs)
 
 
@@ -28711,7 +28687,7 @@ class Effect6573(BaseEffect):
     @staticmethod
     def handler(fit, src, context, **kwargs):
         lvl = src.level
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Blaster Specialization'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Capital Blaster Specialization'),
                                       'damageMultiplier', src.getModifiedItemAttr('damageMultiplierBonus') * lvl, **kwargs)
 
 
@@ -28728,7 +28704,7 @@ class Effect6574(BaseEffect):
     @staticmethod
     def handler(fit, src, context, **kwargs):
         lvl = src.level
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Railgun Specialization'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Capital Railgun Specialization'),
                                       'damageMultiplier', src.getModifiedItemAttr('damageMultiplierBonus') * lvl, **kwargs)
 
 
@@ -28745,7 +28721,7 @@ class Effect6575(BaseEffect):
     @staticmethod
     def handler(fit, src, context, **kwargs):
         lvl = src.level
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Pulse Laser Specialization'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Capital Pulse Laser Specialization'),
                                       'damageMultiplier', src.getModifiedItemAttr('damageMultiplierBonus') * lvl, **kwargs)
 
 
@@ -28762,7 +28738,7 @@ class Effect6576(BaseEffect):
     @staticmethod
     def handler(fit, src, context, **kwargs):
         lvl = src.level
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Beam Laser Specialization'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Capital Beam Laser Specialization'),
                                       'damageMultiplier', src.getModifiedItemAttr('damageMultiplierBonus') * lvl, **kwargs)
 
 
@@ -28779,7 +28755,7 @@ class Effect6577(BaseEffect):
     @staticmethod
     def handler(fit, src, context, **kwargs):
         lvl = src.level
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('XL Cruise Missile Specialization'), 'speed',
+        fit.modules.filteredItemBoost(ItemSkillFilter('XL Cruise Missile Specialization'), 'speed',
                                       src.getModifiedItemAttr('rofBonus') * lvl, **kwargs)
 
 
@@ -28796,7 +28772,7 @@ class Effect6578(BaseEffect):
     @staticmethod
     def handler(fit, src, context, **kwargs):
         lvl = src.level
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('XL Torpedo Specialization'), 'speed',
+        fit.modules.filteredItemBoost(ItemSkillFilter('XL Torpedo Specialization'), 'speed',
                                       src.getModifiedItemAttr('rofBonus') * lvl, **kwargs)
 
 
@@ -28812,11 +28788,11 @@ class Effect6580(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Repair Drone Operation'), 'structureDamageAmount',
+        fit.drones.filteredItemBoost(ItemSkillFilter('Repair Drone Operation'), 'structureDamageAmount',
                                      src.getModifiedItemAttr('shipBonusRole2'), **kwargs)
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Repair Drone Operation'), 'armorDamageAmount',
+        fit.drones.filteredItemBoost(ItemSkillFilter('Repair Drone Operation'), 'armorDamageAmount',
                                      src.getModifiedItemAttr('shipBonusRole2'), **kwargs)
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Repair Drone Operation'), 'shieldBonus',
+        fit.drones.filteredItemBoost(ItemSkillFilter('Repair Drone Operation'), 'shieldBonus',
                                      src.getModifiedItemAttr('shipBonusRole2'), **kwargs)
 
 
@@ -28839,23 +28815,23 @@ class Effect6581(BaseEffect):
                 ('Capital Shield Emission Systems', 'shieldBonus', True),
                 ('Capital Capacitor Emission Systems', 'powerTransferAmount', False),
                 ('Capital Remote Hull Repair Systems', 'structureDamageAmount', False)):
-            fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill(skill), 'duration',
+            fit.modules.filteredItemBoost(ItemSkillFilter(skill), 'duration',
                                           src.getModifiedItemAttr('siegeRemoteLogisticsDurationBonus'), **kwargs)
-            fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill(skill), amtAttr,
+            fit.modules.filteredItemBoost(ItemSkillFilter(skill), amtAttr,
                                           src.getModifiedItemAttr('siegeRemoteLogisticsAmountBonus'),
                                           stackingPenalties=stack, **kwargs)
-            fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill(skill), 'maxRange',
+            fit.modules.filteredItemBoost(ItemSkillFilter(skill), 'maxRange',
                                           src.getModifiedItemAttr('siegeRemoteLogisticsRangeBonus'), stackingPenalties=True, **kwargs)
-            fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill(skill), 'falloffEffectiveness',
+            fit.modules.filteredItemBoost(ItemSkillFilter(skill), 'falloffEffectiveness',
                                           src.getModifiedItemAttr('siegeRemoteLogisticsRangeBonus'), stackingPenalties=True, **kwargs)
 
         # Local armor/shield rep effects (duration / amount)
         for skill, amtAttr in (
                 ('Capital Shield Operation', 'shieldBonus'),
                 ('Capital Repair Systems', 'armorDamageAmount')):
-            fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill(skill), 'duration',
+            fit.modules.filteredItemBoost(ItemSkillFilter(skill), 'duration',
                                           src.getModifiedItemAttr('siegeLocalLogisticsDurationBonus'), **kwargs)
-            fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill(skill), amtAttr,
+            fit.modules.filteredItemBoost(ItemSkillFilter(skill), amtAttr,
                                           src.getModifiedItemAttr('siegeLocalLogisticsAmountBonus'),
                                           stackingPenalties=True, **kwargs)
 
@@ -28891,7 +28867,7 @@ class Effect6581(BaseEffect):
         fit.ship.forceItemAttr('disallowAssistance', src.getModifiedItemAttr('disallowAssistance'), **kwargs)
 
         # new in April 2016 release
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'), 'damageMultiplier',
+        fit.drones.filteredItemBoost(ItemSkillFilter('Drones'), 'damageMultiplier',
                                      src.getModifiedItemAttr('droneDamageBonus'), stackingPenalties=True, **kwargs)
 
         fit.ship.increaseItemAttr('warpScrambleStatus', src.getModifiedItemAttr('siegeModeWarpStatus'), **kwargs)
@@ -28917,44 +28893,38 @@ class Effect6582(BaseEffect):
     @staticmethod
     def handler(fit, src, context, **kwargs):
         # Turrets
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Energy Turret') or
-                                                  mod.item.requiresSkill('Capital Hybrid Turret') or
-                                                  mod.item.requiresSkill('Capital Projectile Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Capital Energy Turret', 'Capital Hybrid Turret', 'Capital Projectile Turret'),
                                       'damageMultiplier', src.getModifiedItemAttr('siegeTurretDamageBonus'), **kwargs)
 
-        fit.modules.filteredItemMultiply(lambda mod: mod.item.requiresSkill('Motion Prediction'),
+        fit.modules.filteredItemMultiply(ItemSkillFilter('Motion Prediction'),
                                          'damageMultiplier', src.getModifiedItemAttr('siegeHAWTurretDamageBonus'),
                                          stackingPenalties=True, **kwargs)
 
         # Missiles
         for type in ('kinetic', 'thermal', 'explosive', 'em'):
-            fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('XL Torpedoes') or
-                                                        mod.charge.requiresSkill('XL Cruise Missiles') or
-                                                        mod.charge.requiresSkill('Torpedoes'),
+            fit.modules.filteredChargeBoost(ChargeSkillFilter('XL Torpedoes', 'XL Cruise Missiles', 'Torpedoes'),
                                             '%sDamage' % type, src.getModifiedItemAttr('siegeMissileDamageBonus'), **kwargs)
 
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('XL Torpedoes') or
-                                                  mod.item.requiresSkill('XL Cruise Missiles'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('XL Torpedoes', 'XL Cruise Missiles'),
                                       'speed', src.getModifiedItemAttr('siegeLauncherROFBonus'), **kwargs)
 
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Target Navigation Prediction'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Target Navigation Prediction'),
                                       'speed', src.getModifiedItemAttr('siegeHAWMissileROFBonus'),
                                       stackingPenalties=True, penaltyGroup='postPercent', **kwargs)
 
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Torpedoes'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Torpedoes'),
                                         'maxVelocity', src.getModifiedItemAttr('siegeTorpedoVelocityBonus'),
                                         stackingPenalties=True, **kwargs)
 
         # Tank
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Shield Operation') or
-                                                  mod.item.requiresSkill('Capital Repair Systems'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Capital Shield Operation', 'Capital Repair Systems'),
                                       'duration', src.getModifiedItemAttr('siegeLocalLogisticsDurationBonus'), **kwargs)
 
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Shield Operation'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Capital Shield Operation'),
                                       'shieldBonus', src.getModifiedItemAttr('siegeLocalLogisticsAmountBonus'),
                                       stackingPenalties=True, **kwargs)
 
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Repair Systems'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Capital Repair Systems'),
                                       'armorDamageAmount', src.getModifiedItemAttr('siegeLocalLogisticsAmountBonus'),
                                       stackingPenalties=True, **kwargs)
 
@@ -29053,19 +29023,19 @@ class Effect6595(BaseEffect):
     @staticmethod
     def handler(fit, src, context, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Armored Command') or mod.item.requiresSkill('Information Command'),
+            ItemSkillFilter('Armored Command', 'Information Command'),
             'buffDuration', src.getModifiedItemAttr('shipBonusCarrierA4'), skill='Amarr Carrier', **kwargs)
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Armored Command') or mod.item.requiresSkill('Information Command'),
+            ItemSkillFilter('Armored Command', 'Information Command'),
             'warfareBuff3Value', src.getModifiedItemAttr('shipBonusCarrierA4'), skill='Amarr Carrier', **kwargs)
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Armored Command') or mod.item.requiresSkill('Information Command'),
+            ItemSkillFilter('Armored Command', 'Information Command'),
             'warfareBuff1Value', src.getModifiedItemAttr('shipBonusCarrierA4'), skill='Amarr Carrier', **kwargs)
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Armored Command') or mod.item.requiresSkill('Information Command'),
+            ItemSkillFilter('Armored Command', 'Information Command'),
             'warfareBuff4Value', src.getModifiedItemAttr('shipBonusCarrierA4'), skill='Amarr Carrier', **kwargs)
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Armored Command') or mod.item.requiresSkill('Information Command'),
+            ItemSkillFilter('Armored Command', 'Information Command'),
             'warfareBuff2Value', src.getModifiedItemAttr('shipBonusCarrierA4'), skill='Amarr Carrier', **kwargs)
 
 
@@ -29082,19 +29052,19 @@ class Effect6596(BaseEffect):
     @staticmethod
     def handler(fit, src, context, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Shield Command') or mod.item.requiresSkill('Information Command'),
+            ItemSkillFilter('Shield Command', 'Information Command'),
             'warfareBuff2Value', src.getModifiedItemAttr('shipBonusCarrierC4'), skill='Caldari Carrier', **kwargs)
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Shield Command') or mod.item.requiresSkill('Information Command'),
+            ItemSkillFilter('Shield Command', 'Information Command'),
             'buffDuration', src.getModifiedItemAttr('shipBonusCarrierC4'), skill='Caldari Carrier', **kwargs)
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Shield Command') or mod.item.requiresSkill('Information Command'),
+            ItemSkillFilter('Shield Command', 'Information Command'),
             'warfareBuff3Value', src.getModifiedItemAttr('shipBonusCarrierC4'), skill='Caldari Carrier', **kwargs)
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Shield Command') or mod.item.requiresSkill('Information Command'),
+            ItemSkillFilter('Shield Command', 'Information Command'),
             'warfareBuff4Value', src.getModifiedItemAttr('shipBonusCarrierC4'), skill='Caldari Carrier', **kwargs)
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Shield Command') or mod.item.requiresSkill('Information Command'),
+            ItemSkillFilter('Shield Command', 'Information Command'),
             'warfareBuff1Value', src.getModifiedItemAttr('shipBonusCarrierC4'), skill='Caldari Carrier', **kwargs)
 
 
@@ -29111,19 +29081,19 @@ class Effect6597(BaseEffect):
     @staticmethod
     def handler(fit, src, context, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Skirmish Command') or mod.item.requiresSkill('Armored Command'),
+            ItemSkillFilter('Skirmish Command', 'Armored Command'),
             'warfareBuff2Value', src.getModifiedItemAttr('shipBonusCarrierG4'), skill='Gallente Carrier', **kwargs)
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Skirmish Command') or mod.item.requiresSkill('Armored Command'),
+            ItemSkillFilter('Skirmish Command', 'Armored Command'),
             'warfareBuff3Value', src.getModifiedItemAttr('shipBonusCarrierG4'), skill='Gallente Carrier', **kwargs)
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Skirmish Command') or mod.item.requiresSkill('Armored Command'),
+            ItemSkillFilter('Skirmish Command', 'Armored Command'),
             'warfareBuff4Value', src.getModifiedItemAttr('shipBonusCarrierG4'), skill='Gallente Carrier', **kwargs)
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Skirmish Command') or mod.item.requiresSkill('Armored Command'),
+            ItemSkillFilter('Skirmish Command', 'Armored Command'),
             'buffDuration', src.getModifiedItemAttr('shipBonusCarrierG4'), skill='Gallente Carrier', **kwargs)
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Skirmish Command') or mod.item.requiresSkill('Armored Command'),
+            ItemSkillFilter('Skirmish Command', 'Armored Command'),
             'warfareBuff1Value', src.getModifiedItemAttr('shipBonusCarrierG4'), skill='Gallente Carrier', **kwargs)
 
 
@@ -29140,19 +29110,19 @@ class Effect6598(BaseEffect):
     @staticmethod
     def handler(fit, src, context, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Skirmish Command') or mod.item.requiresSkill('Shield Command'),
+            ItemSkillFilter('Skirmish Command', 'Shield Command'),
             'warfareBuff4Value', src.getModifiedItemAttr('shipBonusCarrierM4'), skill='Minmatar Carrier', **kwargs)
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Skirmish Command') or mod.item.requiresSkill('Shield Command'),
+            ItemSkillFilter('Skirmish Command', 'Shield Command'),
             'warfareBuff2Value', src.getModifiedItemAttr('shipBonusCarrierM4'), skill='Minmatar Carrier', **kwargs)
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Skirmish Command') or mod.item.requiresSkill('Shield Command'),
+            ItemSkillFilter('Skirmish Command', 'Shield Command'),
             'warfareBuff3Value', src.getModifiedItemAttr('shipBonusCarrierM4'), skill='Minmatar Carrier', **kwargs)
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Skirmish Command') or mod.item.requiresSkill('Shield Command'),
+            ItemSkillFilter('Skirmish Command', 'Shield Command'),
             'warfareBuff1Value', src.getModifiedItemAttr('shipBonusCarrierM4'), skill='Minmatar Carrier', **kwargs)
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Skirmish Command') or mod.item.requiresSkill('Shield Command'),
+            ItemSkillFilter('Skirmish Command', 'Shield Command'),
             'buffDuration', src.getModifiedItemAttr('shipBonusCarrierM4'), skill='Minmatar Carrier', **kwargs)
 
 
@@ -29212,13 +29182,13 @@ class Effect6601(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemBoost(ItemSkillFilter('Fighters'),
                                        'fighterAbilityMissilesDamageMultiplier',
                                        src.getModifiedItemAttr('shipBonusCarrierG1'), skill='Gallente Carrier', **kwargs)
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemBoost(ItemSkillFilter('Fighters'),
                                        'fighterAbilityAttackTurretDamageMultiplier',
                                        src.getModifiedItemAttr('shipBonusCarrierG1'), skill='Gallente Carrier', **kwargs)
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemBoost(ItemSkillFilter('Fighters'),
                                        'fighterAbilityAttackMissileDamageMultiplier',
                                        src.getModifiedItemAttr('shipBonusCarrierG1'), skill='Gallente Carrier', **kwargs)
 
@@ -29235,13 +29205,13 @@ class Effect6602(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemBoost(ItemSkillFilter('Fighters'),
                                        'fighterAbilityAttackMissileDamageMultiplier',
                                        src.getModifiedItemAttr('shipBonusCarrierM1'), skill='Minmatar Carrier', **kwargs)
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemBoost(ItemSkillFilter('Fighters'),
                                        'fighterAbilityMissilesDamageMultiplier',
                                        src.getModifiedItemAttr('shipBonusCarrierM1'), skill='Minmatar Carrier', **kwargs)
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemBoost(ItemSkillFilter('Fighters'),
                                        'fighterAbilityAttackTurretDamageMultiplier',
                                        src.getModifiedItemAttr('shipBonusCarrierM1'), skill='Minmatar Carrier', **kwargs)
 
@@ -29259,13 +29229,13 @@ class Effect6603(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemBoost(ItemSkillFilter('Fighters'),
                                        'fighterAbilityMissilesDamageMultiplier',
                                        src.getModifiedItemAttr('shipBonusSupercarrierA1'), skill='Amarr Carrier', **kwargs)
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemBoost(ItemSkillFilter('Fighters'),
                                        'fighterAbilityAttackMissileDamageMultiplier',
                                        src.getModifiedItemAttr('shipBonusSupercarrierA1'), skill='Amarr Carrier', **kwargs)
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemBoost(ItemSkillFilter('Fighters'),
                                        'fighterAbilityAttackTurretDamageMultiplier',
                                        src.getModifiedItemAttr('shipBonusSupercarrierA1'), skill='Amarr Carrier', **kwargs)
 
@@ -29283,13 +29253,13 @@ class Effect6604(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemBoost(ItemSkillFilter('Fighters'),
                                        'fighterAbilityMissilesDamageMultiplier',
                                        src.getModifiedItemAttr('shipBonusSupercarrierC1'), skill='Caldari Carrier', **kwargs)
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemBoost(ItemSkillFilter('Fighters'),
                                        'fighterAbilityAttackTurretDamageMultiplier',
                                        src.getModifiedItemAttr('shipBonusSupercarrierC1'), skill='Caldari Carrier', **kwargs)
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemBoost(ItemSkillFilter('Fighters'),
                                        'fighterAbilityAttackMissileDamageMultiplier',
                                        src.getModifiedItemAttr('shipBonusSupercarrierC1'), skill='Caldari Carrier', **kwargs)
 
@@ -29306,13 +29276,13 @@ class Effect6605(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemBoost(ItemSkillFilter('Fighters'),
                                        'fighterAbilityAttackTurretDamageMultiplier',
                                        src.getModifiedItemAttr('shipBonusSupercarrierG1'), skill='Gallente Carrier', **kwargs)
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemBoost(ItemSkillFilter('Fighters'),
                                        'fighterAbilityMissilesDamageMultiplier',
                                        src.getModifiedItemAttr('shipBonusSupercarrierG1'), skill='Gallente Carrier', **kwargs)
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemBoost(ItemSkillFilter('Fighters'),
                                        'fighterAbilityAttackMissileDamageMultiplier',
                                        src.getModifiedItemAttr('shipBonusSupercarrierG1'), skill='Gallente Carrier', **kwargs)
 
@@ -29329,13 +29299,13 @@ class Effect6606(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemBoost(ItemSkillFilter('Fighters'),
                                        'fighterAbilityAttackMissileDamageMultiplier',
                                        src.getModifiedItemAttr('shipBonusSupercarrierM1'), skill='Minmatar Carrier', **kwargs)
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemBoost(ItemSkillFilter('Fighters'),
                                        'fighterAbilityMissilesDamageMultiplier',
                                        src.getModifiedItemAttr('shipBonusSupercarrierM1'), skill='Minmatar Carrier', **kwargs)
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemBoost(ItemSkillFilter('Fighters'),
                                        'fighterAbilityAttackTurretDamageMultiplier',
                                        src.getModifiedItemAttr('shipBonusSupercarrierM1'), skill='Minmatar Carrier', **kwargs)
 
@@ -29353,19 +29323,19 @@ class Effect6607(BaseEffect):
     @staticmethod
     def handler(fit, src, context, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Armored Command') or mod.item.requiresSkill('Information Command'),
+            ItemSkillFilter('Armored Command', 'Information Command'),
             'warfareBuff4Value', src.getModifiedItemAttr('shipBonusSupercarrierA5'), skill='Amarr Carrier', **kwargs)
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Armored Command') or mod.item.requiresSkill('Information Command'),
+            ItemSkillFilter('Armored Command', 'Information Command'),
             'warfareBuff3Value', src.getModifiedItemAttr('shipBonusSupercarrierA5'), skill='Amarr Carrier', **kwargs)
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Armored Command') or mod.item.requiresSkill('Information Command'),
+            ItemSkillFilter('Armored Command', 'Information Command'),
             'buffDuration', src.getModifiedItemAttr('shipBonusSupercarrierA5'), skill='Amarr Carrier', **kwargs)
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Armored Command') or mod.item.requiresSkill('Information Command'),
+            ItemSkillFilter('Armored Command', 'Information Command'),
             'warfareBuff2Value', src.getModifiedItemAttr('shipBonusSupercarrierA5'), skill='Amarr Carrier', **kwargs)
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Armored Command') or mod.item.requiresSkill('Information Command'),
+            ItemSkillFilter('Armored Command', 'Information Command'),
             'warfareBuff1Value', src.getModifiedItemAttr('shipBonusSupercarrierA5'), skill='Amarr Carrier', **kwargs)
 
 
@@ -29382,19 +29352,19 @@ class Effect6608(BaseEffect):
     @staticmethod
     def handler(fit, src, context, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Shield Command') or mod.item.requiresSkill('Information Command'),
+            ItemSkillFilter('Shield Command', 'Information Command'),
             'buffDuration', src.getModifiedItemAttr('shipBonusSupercarrierC5'), skill='Caldari Carrier', **kwargs)
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Shield Command') or mod.item.requiresSkill('Information Command'),
+            ItemSkillFilter('Shield Command', 'Information Command'),
             'warfareBuff2Value', src.getModifiedItemAttr('shipBonusSupercarrierC5'), skill='Caldari Carrier', **kwargs)
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Shield Command') or mod.item.requiresSkill('Information Command'),
+            ItemSkillFilter('Shield Command', 'Information Command'),
             'warfareBuff1Value', src.getModifiedItemAttr('shipBonusSupercarrierC5'), skill='Caldari Carrier', **kwargs)
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Shield Command') or mod.item.requiresSkill('Information Command'),
+            ItemSkillFilter('Shield Command', 'Information Command'),
             'warfareBuff4Value', src.getModifiedItemAttr('shipBonusSupercarrierC5'), skill='Caldari Carrier', **kwargs)
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Shield Command') or mod.item.requiresSkill('Information Command'),
+            ItemSkillFilter('Shield Command', 'Information Command'),
             'warfareBuff3Value', src.getModifiedItemAttr('shipBonusSupercarrierC5'), skill='Caldari Carrier', **kwargs)
 
 
@@ -29411,19 +29381,19 @@ class Effect6609(BaseEffect):
     @staticmethod
     def handler(fit, src, context, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Skirmish Command') or mod.item.requiresSkill('Armored Command'),
+            ItemSkillFilter('Skirmish Command', 'Armored Command'),
             'warfareBuff2Value', src.getModifiedItemAttr('shipBonusSupercarrierG5'), skill='Gallente Carrier', **kwargs)
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Skirmish Command') or mod.item.requiresSkill('Armored Command'),
+            ItemSkillFilter('Skirmish Command', 'Armored Command'),
             'buffDuration', src.getModifiedItemAttr('shipBonusSupercarrierG5'), skill='Gallente Carrier', **kwargs)
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Skirmish Command') or mod.item.requiresSkill('Armored Command'),
+            ItemSkillFilter('Skirmish Command', 'Armored Command'),
             'warfareBuff1Value', src.getModifiedItemAttr('shipBonusSupercarrierG5'), skill='Gallente Carrier', **kwargs)
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Skirmish Command') or mod.item.requiresSkill('Armored Command'),
+            ItemSkillFilter('Skirmish Command', 'Armored Command'),
             'warfareBuff3Value', src.getModifiedItemAttr('shipBonusSupercarrierG5'), skill='Gallente Carrier', **kwargs)
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Skirmish Command') or mod.item.requiresSkill('Armored Command'),
+            ItemSkillFilter('Skirmish Command', 'Armored Command'),
             'warfareBuff4Value', src.getModifiedItemAttr('shipBonusSupercarrierG5'), skill='Gallente Carrier', **kwargs)
 
 
@@ -29440,19 +29410,19 @@ class Effect6610(BaseEffect):
     @staticmethod
     def handler(fit, src, context, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Skirmish Command') or mod.item.requiresSkill('Shield Command'),
+            ItemSkillFilter('Skirmish Command', 'Shield Command'),
             'warfareBuff4Value', src.getModifiedItemAttr('shipBonusSupercarrierM5'), skill='Minmatar Carrier', **kwargs)
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Skirmish Command') or mod.item.requiresSkill('Shield Command'),
+            ItemSkillFilter('Skirmish Command', 'Shield Command'),
             'warfareBuff1Value', src.getModifiedItemAttr('shipBonusSupercarrierM5'), skill='Minmatar Carrier', **kwargs)
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Skirmish Command') or mod.item.requiresSkill('Shield Command'),
+            ItemSkillFilter('Skirmish Command', 'Shield Command'),
             'warfareBuff3Value', src.getModifiedItemAttr('shipBonusSupercarrierM5'), skill='Minmatar Carrier', **kwargs)
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Skirmish Command') or mod.item.requiresSkill('Shield Command'),
+            ItemSkillFilter('Skirmish Command', 'Shield Command'),
             'buffDuration', src.getModifiedItemAttr('shipBonusSupercarrierM5'), skill='Minmatar Carrier', **kwargs)
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Skirmish Command') or mod.item.requiresSkill('Shield Command'),
+            ItemSkillFilter('Skirmish Command', 'Shield Command'),
             'warfareBuff2Value', src.getModifiedItemAttr('shipBonusSupercarrierM5'), skill='Minmatar Carrier', **kwargs)
 
 
@@ -29468,7 +29438,7 @@ class Effect6611(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Afterburner'), 'speedFactor',
+        fit.modules.filteredItemBoost(ItemSkillFilter('Afterburner'), 'speedFactor',
                                       src.getModifiedItemAttr('shipBonusSupercarrierC2'), skill='Caldari Carrier', **kwargs)
 
 
@@ -29484,10 +29454,10 @@ class Effect6612(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemBoost(ItemSkillFilter('Fighters'),
                                        'fighterAbilityMissilesExplosionVelocity',
                                        src.getModifiedItemAttr('shipBonusSupercarrierA2'), skill='Amarr Carrier', **kwargs)
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemBoost(ItemSkillFilter('Fighters'),
                                        'fighterAbilityAttackMissileExplosionVelocity',
                                        src.getModifiedItemAttr('shipBonusSupercarrierA2'), skill='Amarr Carrier', **kwargs)
 
@@ -29504,9 +29474,9 @@ class Effect6613(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemIncrease(lambda mod: mod.item.requiresSkill('Leadership'), 'maxGroupOnline',
+        fit.modules.filteredItemIncrease(ItemSkillFilter('Leadership'), 'maxGroupOnline',
                                          src.getModifiedItemAttr('shipBonusRole1'), **kwargs)
-        fit.modules.filteredItemIncrease(lambda mod: mod.item.requiresSkill('Leadership'), 'maxGroupActive',
+        fit.modules.filteredItemIncrease(ItemSkillFilter('Leadership'), 'maxGroupActive',
                                          src.getModifiedItemAttr('shipBonusRole1'), **kwargs)
 
 
@@ -29522,9 +29492,9 @@ class Effect6614(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Hull Upgrades'), 'armorHPBonusAdd',
+        fit.modules.filteredItemBoost(ItemSkillFilter('Hull Upgrades'), 'armorHPBonusAdd',
                                       src.getModifiedItemAttr('shipBonusRole2'), **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Upgrades'), 'capacityBonus',
+        fit.modules.filteredItemBoost(ItemSkillFilter('Shield Upgrades'), 'capacityBonus',
                                       src.getModifiedItemAttr('shipBonusRole2'), **kwargs)
 
 
@@ -29540,7 +29510,7 @@ class Effect6615(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Burst Projector Operation'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Burst Projector Operation'),
                                       'durationWeaponDisruptionBurstProjector',
                                       src.getModifiedItemAttr('shipBonusSupercarrierA4'), skill='Amarr Carrier', **kwargs)
 
@@ -29557,7 +29527,7 @@ class Effect6616(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Burst Projector Operation'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Burst Projector Operation'),
                                       'durationECMJammerBurstProjector', src.getModifiedItemAttr('shipBonusSupercarrierC4'),
                                       skill='Caldari Carrier', **kwargs)
 
@@ -29574,7 +29544,7 @@ class Effect6617(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Burst Projector Operation'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Burst Projector Operation'),
                                       'durationSensorDampeningBurstProjector',
                                       src.getModifiedItemAttr('shipBonusSupercarrierG4'), skill='Gallente Carrier', **kwargs)
 
@@ -29591,7 +29561,7 @@ class Effect6618(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Burst Projector Operation'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Burst Projector Operation'),
                                       'durationTargetIlluminationBurstProjector',
                                       src.getModifiedItemAttr('shipBonusSupercarrierM4'), skill='Minmatar Carrier', **kwargs)
 
@@ -29608,9 +29578,9 @@ class Effect6619(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemIncrease(lambda mod: mod.item.requiresSkill('Leadership'), 'maxGroupOnline',
+        fit.modules.filteredItemIncrease(ItemSkillFilter('Leadership'), 'maxGroupOnline',
                                          src.getModifiedItemAttr('shipBonusRole1'), **kwargs)
-        fit.modules.filteredItemIncrease(lambda mod: mod.item.requiresSkill('Leadership'), 'maxGroupActive',
+        fit.modules.filteredItemIncrease(ItemSkillFilter('Leadership'), 'maxGroupActive',
                                          src.getModifiedItemAttr('shipBonusRole1'), **kwargs)
 
 
@@ -29626,7 +29596,7 @@ class Effect6620(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Missile Launcher Operation'), 'reloadTime',
+        fit.modules.filteredItemBoost(ItemSkillFilter('Missile Launcher Operation'), 'reloadTime',
                                       src.getModifiedItemAttr('shipBonusDreadnoughtC3'), skill='Caldari Dreadnought', **kwargs)
 
 
@@ -29686,7 +29656,7 @@ class Effect6623(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'), 'shieldCapacity',
+        fit.fighters.filteredItemBoost(ItemSkillFilter('Fighters'), 'shieldCapacity',
                                        src.getModifiedItemAttr('shipBonusSupercarrierG2'), skill='Gallente Carrier', **kwargs)
 
 
@@ -29703,7 +29673,7 @@ class Effect6624(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'), 'maxVelocity',
+        fit.fighters.filteredItemBoost(ItemSkillFilter('Fighters'), 'maxVelocity',
                                        src.getModifiedItemAttr('shipBonusSupercarrierM2'), skill='Minmatar Carrier', **kwargs)
 
 
@@ -29719,9 +29689,9 @@ class Effect6625(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Support Fighters'), 'fighterSquadronOrbitRange',
+        fit.fighters.filteredItemBoost(ItemSkillFilter('Support Fighters'), 'fighterSquadronOrbitRange',
                                        src.getModifiedItemAttr('shipBonusCarrierA2'), skill='Amarr Carrier', **kwargs)
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Support Fighters'),
+        fit.fighters.filteredItemBoost(ItemSkillFilter('Support Fighters'),
                                        'fighterAbilityEnergyNeutralizerOptimalRange',
                                        src.getModifiedItemAttr('shipBonusCarrierA2'), skill='Amarr Carrier', **kwargs)
 
@@ -29738,9 +29708,9 @@ class Effect6626(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Support Fighters'), 'fighterSquadronOrbitRange',
+        fit.fighters.filteredItemBoost(ItemSkillFilter('Support Fighters'), 'fighterSquadronOrbitRange',
                                        src.getModifiedItemAttr('shipBonusCarrierC2'), skill='Caldari Carrier', **kwargs)
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Support Fighters'),
+        fit.fighters.filteredItemBoost(ItemSkillFilter('Support Fighters'),
                                        'fighterAbilityECMRangeOptimal', src.getModifiedItemAttr('shipBonusCarrierC2'),
                                        skill='Caldari Carrier', **kwargs)
 
@@ -29757,9 +29727,9 @@ class Effect6627(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Support Fighters'), 'fighterSquadronOrbitRange',
+        fit.fighters.filteredItemBoost(ItemSkillFilter('Support Fighters'), 'fighterSquadronOrbitRange',
                                        src.getModifiedItemAttr('shipBonusCarrierG2'), skill='Gallente Carrier', **kwargs)
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Support Fighters'),
+        fit.fighters.filteredItemBoost(ItemSkillFilter('Support Fighters'),
                                        'fighterAbilityWarpDisruptionRange', src.getModifiedItemAttr('shipBonusCarrierG2'),
                                        skill='Gallente Carrier', **kwargs)
 
@@ -29776,9 +29746,9 @@ class Effect6628(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Support Fighters'), 'fighterSquadronOrbitRange',
+        fit.fighters.filteredItemBoost(ItemSkillFilter('Support Fighters'), 'fighterSquadronOrbitRange',
                                        src.getModifiedItemAttr('shipBonusCarrierM2'), skill='Minmatar Carrier', **kwargs)
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Support Fighters'),
+        fit.fighters.filteredItemBoost(ItemSkillFilter('Support Fighters'),
                                        'fighterAbilityStasisWebifierOptimalRange',
                                        src.getModifiedItemAttr('shipBonusCarrierM2'), skill='Minmatar Carrier', **kwargs)
 
@@ -29814,7 +29784,7 @@ class Effect6634(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Energy Turret'), 'damageMultiplier',
+        fit.modules.filteredItemBoost(ItemSkillFilter('Capital Energy Turret'), 'damageMultiplier',
                                       src.getModifiedItemAttr('shipBonusTitanA1'), skill='Amarr Titan', **kwargs)
 
 
@@ -29830,11 +29800,11 @@ class Effect6635(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('XL Torpedoes'), 'kineticDamage',
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('XL Torpedoes'), 'kineticDamage',
                                         src.getModifiedItemAttr('shipBonusTitanC1'), skill='Caldari Titan', **kwargs)
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('XL Cruise Missiles'), 'kineticDamage',
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('XL Cruise Missiles'), 'kineticDamage',
                                         src.getModifiedItemAttr('shipBonusTitanC1'), skill='Caldari Titan', **kwargs)
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Torpedoes'), 'kineticDamage',
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Torpedoes'), 'kineticDamage',
                                         src.getModifiedItemAttr('shipBonusTitanC1'), skill='Caldari Titan', **kwargs)
 
 
@@ -29850,7 +29820,7 @@ class Effect6636(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Hybrid Turret'), 'damageMultiplier',
+        fit.modules.filteredItemBoost(ItemSkillFilter('Capital Hybrid Turret'), 'damageMultiplier',
                                       src.getModifiedItemAttr('shipBonusTitanG1'), skill='Gallente Titan', **kwargs)
 
 
@@ -29866,7 +29836,7 @@ class Effect6637(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Projectile Turret'), 'damageMultiplier',
+        fit.modules.filteredItemBoost(ItemSkillFilter('Capital Projectile Turret'), 'damageMultiplier',
                                       src.getModifiedItemAttr('shipBonusTitanM1'), skill='Minmatar Titan', **kwargs)
 
 
@@ -29882,11 +29852,11 @@ class Effect6638(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Missile Launcher XL Cruise', 'speed',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Missile Launcher XL Cruise'), 'speed',
                                       src.getModifiedItemAttr('shipBonusTitanC2'), skill='Caldari Titan', **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Missile Launcher Rapid Torpedo', 'speed',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Missile Launcher Rapid Torpedo'), 'speed',
                                       src.getModifiedItemAttr('shipBonusTitanC2'), skill='Caldari Titan', **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Missile Launcher XL Torpedo', 'speed',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Missile Launcher XL Torpedo'), 'speed',
                                       src.getModifiedItemAttr('shipBonusTitanC2'), skill='Caldari Titan', **kwargs)
 
 
@@ -29902,10 +29872,10 @@ class Effect6639(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemBoost(ItemSkillFilter('Fighters'),
                                        'fighterAbilityMissilesExplosionRadius',
                                        src.getModifiedItemAttr('shipBonusSupercarrierA4'), skill='Amarr Carrier', **kwargs)
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemBoost(ItemSkillFilter('Fighters'),
                                        'fighterAbilityAttackMissileExplosionRadius',
                                        src.getModifiedItemAttr('shipBonusSupercarrierA4'), skill='Amarr Carrier', **kwargs)
 
@@ -29922,9 +29892,9 @@ class Effect6640(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemIncrease(lambda mod: mod.item.requiresSkill('Leadership'), 'maxGroupOnline',
+        fit.modules.filteredItemIncrease(ItemSkillFilter('Leadership'), 'maxGroupOnline',
                                          src.getModifiedItemAttr('shipBonusRole1'), **kwargs)
-        fit.modules.filteredItemIncrease(lambda mod: mod.item.requiresSkill('Leadership'), 'maxGroupActive',
+        fit.modules.filteredItemIncrease(ItemSkillFilter('Leadership'), 'maxGroupActive',
                                          src.getModifiedItemAttr('shipBonusRole1'), **kwargs)
 
 
@@ -29940,9 +29910,9 @@ class Effect6641(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Hull Upgrades'), 'armorHPBonusAdd',
+        fit.modules.filteredItemBoost(ItemSkillFilter('Hull Upgrades'), 'armorHPBonusAdd',
                                       src.getModifiedItemAttr('shipBonusRole2'), **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Upgrades'), 'capacityBonus',
+        fit.modules.filteredItemBoost(ItemSkillFilter('Shield Upgrades'), 'capacityBonus',
                                       src.getModifiedItemAttr('shipBonusRole2'), **kwargs)
 
 
@@ -29959,7 +29929,7 @@ class Effect6642(BaseEffect):
     @staticmethod
     def handler(fit, src, context, **kwargs):
         lvl = src.level
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Doomsday Operation'), 'duration',
+        fit.modules.filteredItemBoost(ItemSkillFilter('Doomsday Operation'), 'duration',
                                       src.getModifiedItemAttr('rofBonus') * lvl, **kwargs)
 
 
@@ -30085,7 +30055,7 @@ class Effect6653(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Energy Turret'), 'capacitorNeed',
+        fit.modules.filteredItemBoost(ItemSkillFilter('Capital Energy Turret'), 'capacitorNeed',
                                       src.getModifiedItemAttr('shipBonusTitanA2'), skill='Amarr Titan', **kwargs)
 
 
@@ -30101,7 +30071,7 @@ class Effect6654(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Hybrid Turret'), 'speed',
+        fit.modules.filteredItemBoost(ItemSkillFilter('Capital Hybrid Turret'), 'speed',
                                       src.getModifiedItemAttr('shipBonusTitanG2'), skill='Gallente Titan', **kwargs)
 
 
@@ -30117,7 +30087,7 @@ class Effect6655(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Projectile Turret'), 'speed',
+        fit.modules.filteredItemBoost(ItemSkillFilter('Capital Projectile Turret'), 'speed',
                                       src.getModifiedItemAttr('shipBonusTitanM2'), skill='Minmatar Titan', **kwargs)
 
 
@@ -30133,7 +30103,7 @@ class Effect6656(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Torpedoes'), 'maxVelocity',
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Torpedoes'), 'maxVelocity',
                                         src.getModifiedItemAttr('shipBonusRole3'), **kwargs)
 
 
@@ -30149,23 +30119,23 @@ class Effect6657(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Torpedoes'), 'emDamage',
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Torpedoes'), 'emDamage',
                                         src.getModifiedItemAttr('shipBonusTitanC5'), skill='Caldari Titan', **kwargs)
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Torpedoes'), 'explosiveDamage',
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Torpedoes'), 'explosiveDamage',
                                         src.getModifiedItemAttr('shipBonusTitanC5'), skill='Caldari Titan', **kwargs)
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Torpedoes'), 'thermalDamage',
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Torpedoes'), 'thermalDamage',
                                         src.getModifiedItemAttr('shipBonusTitanC5'), skill='Caldari Titan', **kwargs)
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('XL Cruise Missiles'), 'explosiveDamage',
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('XL Cruise Missiles'), 'explosiveDamage',
                                         src.getModifiedItemAttr('shipBonusTitanC5'), skill='Caldari Titan', **kwargs)
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('XL Cruise Missiles'), 'thermalDamage',
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('XL Cruise Missiles'), 'thermalDamage',
                                         src.getModifiedItemAttr('shipBonusTitanC5'), skill='Caldari Titan', **kwargs)
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('XL Cruise Missiles'), 'emDamage',
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('XL Cruise Missiles'), 'emDamage',
                                         src.getModifiedItemAttr('shipBonusTitanC5'), skill='Caldari Titan', **kwargs)
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('XL Torpedoes'), 'thermalDamage',
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('XL Torpedoes'), 'thermalDamage',
                                         src.getModifiedItemAttr('shipBonusTitanC5'), skill='Caldari Titan', **kwargs)
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('XL Torpedoes'), 'emDamage',
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('XL Torpedoes'), 'emDamage',
                                         src.getModifiedItemAttr('shipBonusTitanC5'), skill='Caldari Titan', **kwargs)
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('XL Torpedoes'), 'explosiveDamage',
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('XL Torpedoes'), 'explosiveDamage',
                                         src.getModifiedItemAttr('shipBonusTitanC5'), skill='Caldari Titan', **kwargs)
 
 
@@ -30193,28 +30163,22 @@ class Effect6658(BaseEffect):
                                           stackingPenalties=penalize, penaltyGroup='preMul', **kwargs)
 
         # Turrets
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Energy Turret') or
-                                                  mod.item.requiresSkill('Large Hybrid Turret') or
-                                                  mod.item.requiresSkill('Large Projectile Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Large Energy Turret', 'Large Hybrid Turret', 'Large Projectile Turret'),
                                       'maxRange', src.getModifiedItemAttr('maxRangeBonus'),
                                       stackingPenalties=True, **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Energy Turret') or
-                                                  mod.item.requiresSkill('Large Hybrid Turret') or
-                                                  mod.item.requiresSkill('Large Projectile Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Large Energy Turret', 'Large Hybrid Turret', 'Large Projectile Turret'),
                                       'falloff', src.getModifiedItemAttr('falloffBonus'),
                                       stackingPenalties=True, **kwargs)
 
         # Missiles
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Torpedoes') or
-                                                    mod.charge.requiresSkill('Cruise Missiles') or
-                                                    mod.charge.requiresSkill('Heavy Missiles'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Torpedoes', 'Cruise Missiles', 'Heavy Missiles'),
                                         'maxVelocity', src.getModifiedItemAttr('missileVelocityBonus'), **kwargs)
 
         # Tanking
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Repair Systems'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Repair Systems'),
                                       'armorDamageAmount', src.getModifiedItemAttr('armorDamageAmountBonus'),
                                       stackingPenalties=True, **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Operation'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Shield Operation'),
                                       'shieldBonus', src.getModifiedItemAttr('shieldBoostMultiplier'),
                                       stackingPenalties=True, **kwargs)
 
@@ -30234,7 +30198,7 @@ class Effect6658(BaseEffect):
         fit.ship.boostItemAttr('remoteRepairImpedance', src.getModifiedItemAttr('remoteRepairImpedanceBonus'), **kwargs)
         fit.ship.boostItemAttr('remoteAssistanceImpedance', src.getModifiedItemAttr('remoteAssistanceImpedanceBonus'), **kwargs)
         fit.ship.boostItemAttr('sensorDampenerResistance', src.getModifiedItemAttr('sensorDampenerResistanceBonus'), **kwargs)
-        fit.modules.filteredItemIncrease(lambda mod: mod.item.requiresSkill('Micro Jump Drive Operation'),
+        fit.modules.filteredItemIncrease(ItemSkillFilter('Micro Jump Drive Operation'),
                                          'activationBlocked', src.getModifiedItemAttr('activationBlockedStrenght'), **kwargs)
         fit.ship.boostItemAttr('targetPainterResistance', src.getModifiedItemAttr('targetPainterResistanceBonus'), **kwargs)
         fit.ship.boostItemAttr('weaponDisruptionResistance', src.getModifiedItemAttr('weaponDisruptionResistanceBonus'), **kwargs)
@@ -30256,7 +30220,7 @@ class Effect6661(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'), 'maxVelocity',
+        fit.fighters.filteredItemBoost(ItemSkillFilter('Fighters'), 'maxVelocity',
                                        src.getModifiedItemAttr('shipBonusCarrierM3'), skill='Minmatar Carrier', **kwargs)
 
 
@@ -30272,7 +30236,7 @@ class Effect6662(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'), 'shieldCapacity',
+        fit.fighters.filteredItemBoost(ItemSkillFilter('Fighters'), 'shieldCapacity',
                                        src.getModifiedItemAttr('shipBonusCarrierG3'), skill='Gallente Carrier', **kwargs)
 
 
@@ -30289,18 +30253,18 @@ class Effect6663(BaseEffect):
     @staticmethod
     def handler(fit, src, context, **kwargs):
         lvl = src.level if 'skill' in context else 1
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'), 'damageMultiplier',
+        fit.drones.filteredItemBoost(ItemSkillFilter('Drones'), 'damageMultiplier',
                                      src.getModifiedItemAttr('damageMultiplierBonus') * lvl, **kwargs)
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemBoost(ItemSkillFilter('Fighters'),
                                        'fighterAbilityAttackMissileDamageMultiplier',
                                        src.getModifiedItemAttr('damageMultiplierBonus') * lvl, **kwargs)
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemBoost(ItemSkillFilter('Fighters'),
                                        'fighterAbilityAttackTurretDamageMultiplier',
                                        src.getModifiedItemAttr('damageMultiplierBonus') * lvl, **kwargs)
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemBoost(ItemSkillFilter('Fighters'),
                                        'fighterAbilityMissilesDamageMultiplier',
                                        src.getModifiedItemAttr('damageMultiplierBonus') * lvl, **kwargs)
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Mining Drone Operation'), 'miningDroneAmountPercent',
+        fit.drones.filteredItemBoost(ItemSkillFilter('Mining Drone Operation'), 'miningDroneAmountPercent',
                                      src.getModifiedItemAttr('miningAmountBonus') * lvl, **kwargs)
 
 
@@ -30317,14 +30281,14 @@ class Effect6664(BaseEffect):
     @staticmethod
     def handler(fit, src, context, **kwargs):
         lvl = src.level if 'skill' in context else 1
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'), 'maxRange',
+        fit.drones.filteredItemBoost(ItemSkillFilter('Drones'), 'maxRange',
                                      src.getModifiedItemAttr('rangeSkillBonus') * lvl, **kwargs)
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'), 'fighterAbilityMissilesRange',
+        fit.fighters.filteredItemBoost(ItemSkillFilter('Fighters'), 'fighterAbilityMissilesRange',
                                        src.getModifiedItemAttr('rangeSkillBonus') * lvl, **kwargs)
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemBoost(ItemSkillFilter('Fighters'),
                                        'fighterAbilityAttackTurretRangeOptimal',
                                        src.getModifiedItemAttr('rangeSkillBonus') * lvl, **kwargs)
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemBoost(ItemSkillFilter('Fighters'),
                                        'fighterAbilityAttackMissileRangeOptimal',
                                        src.getModifiedItemAttr('rangeSkillBonus') * lvl, **kwargs)
 
@@ -30342,13 +30306,13 @@ class Effect6665(BaseEffect):
     @staticmethod
     def handler(fit, src, context, **kwargs):
         lvl = src.level if 'skill' in context else 1
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'), 'hp',
+        fit.drones.filteredItemBoost(ItemSkillFilter('Drones'), 'hp',
                                      src.getModifiedItemAttr('hullHpBonus') * lvl, **kwargs)
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'), 'armorHP',
+        fit.drones.filteredItemBoost(ItemSkillFilter('Drones'), 'armorHP',
                                      src.getModifiedItemAttr('armorHpBonus') * lvl, **kwargs)
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'), 'shieldCapacity',
+        fit.drones.filteredItemBoost(ItemSkillFilter('Drones'), 'shieldCapacity',
                                      src.getModifiedItemAttr('shieldCapacityBonus') * lvl, **kwargs)
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'), 'shieldCapacity',
+        fit.fighters.filteredItemBoost(ItemSkillFilter('Fighters'), 'shieldCapacity',
                                        src.getModifiedItemAttr('shieldCapacityBonus') * lvl, **kwargs)
 
 
@@ -30365,9 +30329,9 @@ class Effect6667(BaseEffect):
     @staticmethod
     def handler(fit, src, context, **kwargs):
         lvl = src.level if 'skill' in context else 1
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'), 'maxVelocity',
+        fit.drones.filteredItemBoost(ItemSkillFilter('Drones'), 'maxVelocity',
                                      src.getModifiedItemAttr('maxVelocityBonus') * lvl, **kwargs)
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'), 'maxVelocity',
+        fit.fighters.filteredItemBoost(ItemSkillFilter('Fighters'), 'maxVelocity',
                                        src.getModifiedItemAttr('maxVelocityBonus') * lvl, **kwargs)
 
 
@@ -30383,13 +30347,13 @@ class Effect6669(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'), 'armorHP',
+        fit.drones.filteredItemBoost(ItemSkillFilter('Drones'), 'armorHP',
                                      src.getModifiedItemAttr('hullHpBonus'), **kwargs)
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'), 'hp',
+        fit.drones.filteredItemBoost(ItemSkillFilter('Drones'), 'hp',
                                      src.getModifiedItemAttr('hullHpBonus'), **kwargs)
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'), 'shieldCapacity',
+        fit.drones.filteredItemBoost(ItemSkillFilter('Drones'), 'shieldCapacity',
                                      src.getModifiedItemAttr('hullHpBonus'), **kwargs)
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'), 'shieldCapacity',
+        fit.fighters.filteredItemBoost(ItemSkillFilter('Fighters'), 'shieldCapacity',
                                        src.getModifiedItemAttr('hullHpBonus'), **kwargs)
         fit.ship.boostItemAttr('cpuOutput', src.getModifiedItemAttr('drawback'), **kwargs)
 
@@ -30406,14 +30370,14 @@ class Effect6670(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'), 'maxRange',
+        fit.drones.filteredItemBoost(ItemSkillFilter('Drones'), 'maxRange',
                                      src.getModifiedItemAttr('rangeSkillBonus'), stackingPenalties=True, **kwargs)
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'), 'fighterAbilityMissilesRange',
+        fit.fighters.filteredItemBoost(ItemSkillFilter('Fighters'), 'fighterAbilityMissilesRange',
                                        src.getModifiedItemAttr('rangeSkillBonus'), stackingPenalties=True, **kwargs)
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemBoost(ItemSkillFilter('Fighters'),
                                        'fighterAbilityAttackTurretRangeOptimal', src.getModifiedItemAttr('rangeSkillBonus'),
                                        stackingPenalties=True, **kwargs)
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemBoost(ItemSkillFilter('Fighters'),
                                        'fighterAbilityAttackMissileRangeOptimal',
                                        src.getModifiedItemAttr('rangeSkillBonus'), stackingPenalties=True, **kwargs)
         fit.ship.boostItemAttr('cpuOutput', src.getModifiedItemAttr('drawback'), **kwargs)
@@ -30431,9 +30395,9 @@ class Effect6671(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'), 'maxVelocity',
+        fit.drones.filteredItemBoost(ItemSkillFilter('Drones'), 'maxVelocity',
                                      src.getModifiedItemAttr('droneMaxVelocityBonus'), stackingPenalties=True, **kwargs)
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'), 'maxVelocity',
+        fit.fighters.filteredItemBoost(ItemSkillFilter('Fighters'), 'maxVelocity',
                                        src.getModifiedItemAttr('droneMaxVelocityBonus'), stackingPenalties=True, **kwargs)
         fit.ship.boostItemAttr('cpuOutput', src.getModifiedItemAttr('drawback'), **kwargs)
 
@@ -30484,7 +30448,7 @@ class Effect6679(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Structure Doomsday Weapon',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Structure Doomsday Weapon'),
                                       'duration', src.getModifiedItemAttr('durationBonus'),
                                       skill='Structure Doomsday Operation', **kwargs)
 
@@ -30501,9 +30465,9 @@ class Effect6681(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemIncrease(lambda mod: mod.item.requiresSkill('Leadership'), 'maxGroupOnline',
+        fit.modules.filteredItemIncrease(ItemSkillFilter('Leadership'), 'maxGroupOnline',
                                          src.getModifiedItemAttr('shipBonusRole3'), **kwargs)
-        fit.modules.filteredItemIncrease(lambda mod: mod.item.requiresSkill('Leadership'), 'maxGroupActive',
+        fit.modules.filteredItemIncrease(ItemSkillFilter('Leadership'), 'maxGroupActive',
                                          src.getModifiedItemAttr('shipBonusRole3'), **kwargs)
 
 
@@ -30602,17 +30566,17 @@ class Effect6686(BaseEffect):
                     ('missileVelocityBonus', 'maxVelocity'),
                     ('explosionDelayBonus', 'explosionDelay'),
             ):
-                fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+                fit.modules.filteredChargeBoost(ChargeSkillFilter('Missile Launcher Operation'),
                                                 tgtAttr, module.getModifiedItemAttr(srcAttr),
                                                 stackingPenalties=True, **kwargs)
 
-            fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Gunnery'),
+            fit.modules.filteredItemBoost(ItemSkillFilter('Gunnery'),
                                           'trackingSpeed', module.getModifiedItemAttr('trackingSpeedBonus'),
                                           stackingPenalties=True, **kwargs)
-            fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Gunnery'),
+            fit.modules.filteredItemBoost(ItemSkillFilter('Gunnery'),
                                           'maxRange', module.getModifiedItemAttr('maxRangeBonus'),
                                           stackingPenalties=True, **kwargs)
-            fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Gunnery'),
+            fit.modules.filteredItemBoost(ItemSkillFilter('Gunnery'),
                                           'falloff', module.getModifiedItemAttr('falloffBonus'),
                                           stackingPenalties=True, **kwargs)
 
@@ -30770,13 +30734,13 @@ class Effect6694(BaseEffect):
     @staticmethod
     def handler(fit, module, context, **kwargs):
         if 'projected' in context:
-            fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Gunnery'),
+            fit.modules.filteredItemBoost(ItemSkillFilter('Gunnery'),
                                           'trackingSpeed', module.getModifiedItemAttr('trackingSpeedBonus'),
                                           stackingPenalties=True, **kwargs)
-            fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Gunnery'),
+            fit.modules.filteredItemBoost(ItemSkillFilter('Gunnery'),
                                           'maxRange', module.getModifiedItemAttr('maxRangeBonus'),
                                           stackingPenalties=True, **kwargs)
-            fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Gunnery'),
+            fit.modules.filteredItemBoost(ItemSkillFilter('Gunnery'),
                                           'falloff', module.getModifiedItemAttr('falloffBonus'),
                                           stackingPenalties=True, **kwargs)
 
@@ -30817,9 +30781,9 @@ class Effect6697(BaseEffect):
     @staticmethod
     def handler(fit, src, context, **kwargs):
         lvl = src.level
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Rig Armor', 'drawback',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Rig Armor'), 'drawback',
                                       src.getModifiedItemAttr('rigDrawbackBonus') * lvl, **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Rig Resource Processing', 'drawback',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Rig Resource Processing'), 'drawback',
                                       src.getModifiedItemAttr('rigDrawbackBonus') * lvl, **kwargs)
 
 
@@ -30836,9 +30800,9 @@ class Effect6698(BaseEffect):
     @staticmethod
     def handler(fit, src, context, **kwargs):
         lvl = src.level
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Rig Navigation', 'drawback',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Rig Navigation'), 'drawback',
                                       src.getModifiedItemAttr('rigDrawbackBonus') * lvl, **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Rig Anchor', 'drawback',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Rig Anchor'), 'drawback',
                                       src.getModifiedItemAttr('rigDrawbackBonus') * lvl, **kwargs)
 
 
@@ -30855,7 +30819,7 @@ class Effect6699(BaseEffect):
     @staticmethod
     def handler(fit, src, context, **kwargs):
         lvl = src.level
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Rig Drones', 'drawback',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Rig Drones'), 'drawback',
                                       src.getModifiedItemAttr('rigDrawbackBonus') * lvl, **kwargs)
 
 
@@ -30872,11 +30836,11 @@ class Effect6700(BaseEffect):
     @staticmethod
     def handler(fit, src, context, **kwargs):
         lvl = src.level
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Rig Electronic Systems', 'drawback',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Rig Electronic Systems'), 'drawback',
                                       src.getModifiedItemAttr('rigDrawbackBonus') * lvl, **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Rig Scanning', 'drawback',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Rig Scanning'), 'drawback',
                                       src.getModifiedItemAttr('rigDrawbackBonus') * lvl, **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Rig Targeting', 'drawback',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Rig Targeting'), 'drawback',
                                       src.getModifiedItemAttr('rigDrawbackBonus') * lvl, **kwargs)
 
 
@@ -30893,7 +30857,7 @@ class Effect6701(BaseEffect):
     @staticmethod
     def handler(fit, src, context, **kwargs):
         lvl = src.level
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Rig Projectile Weapon', 'drawback',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Rig Projectile Weapon'), 'drawback',
                                       src.getModifiedItemAttr('rigDrawbackBonus') * lvl, **kwargs)
 
 
@@ -30910,7 +30874,7 @@ class Effect6702(BaseEffect):
     @staticmethod
     def handler(fit, src, context, **kwargs):
         lvl = src.level
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Rig Energy Weapon', 'drawback',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Rig Energy Weapon'), 'drawback',
                                       src.getModifiedItemAttr('rigDrawbackBonus') * lvl, **kwargs)
 
 
@@ -30927,7 +30891,7 @@ class Effect6703(BaseEffect):
     @staticmethod
     def handler(fit, src, context, **kwargs):
         lvl = src.level
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Rig Hybrid Weapon', 'drawback',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Rig Hybrid Weapon'), 'drawback',
                                       src.getModifiedItemAttr('rigDrawbackBonus') * lvl, **kwargs)
 
 
@@ -30944,7 +30908,7 @@ class Effect6704(BaseEffect):
     @staticmethod
     def handler(fit, src, context, **kwargs):
         lvl = src.level
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Rig Launcher', 'drawback',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Rig Launcher'), 'drawback',
                                       src.getModifiedItemAttr('rigDrawbackBonus') * lvl, **kwargs)
 
 
@@ -30961,7 +30925,7 @@ class Effect6705(BaseEffect):
     @staticmethod
     def handler(fit, src, context, **kwargs):
         lvl = src.level
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Rig Shield', 'drawback',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Rig Shield'), 'drawback',
                                       src.getModifiedItemAttr('rigDrawbackBonus') * lvl, **kwargs)
 
 
@@ -30978,7 +30942,7 @@ class Effect6706(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.appliedImplants.filteredItemMultiply(lambda mod: mod.item.requiresSkill('Cybernetics'),
+        fit.appliedImplants.filteredItemMultiply(ItemSkillFilter('Cybernetics'),
                                                  'armorRepairBonus', src.getModifiedItemAttr('implantSetSerpentis2'), **kwargs)
 
 
@@ -30994,7 +30958,7 @@ class Effect6708(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Repair Systems'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Repair Systems'),
                                       'armorDamageAmount', src.getModifiedItemAttr('armorRepairBonus'), **kwargs)
 
 
@@ -31010,7 +30974,7 @@ class Effect6709(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Hybrid Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Capital Hybrid Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('shipBonusRole1'), **kwargs)
 
 
@@ -31026,7 +30990,7 @@ class Effect6710(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Stasis Web', 'speedFactor',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Stasis Web'), 'speedFactor',
                                       src.getModifiedItemAttr('shipBonusDreadnoughtM1'), skill='Minmatar Dreadnought', **kwargs)
 
 
@@ -31042,7 +31006,7 @@ class Effect6711(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Hybrid Turret'), 'damageMultiplier',
+        fit.modules.filteredItemBoost(ItemSkillFilter('Capital Hybrid Turret'), 'damageMultiplier',
                                       src.getModifiedItemAttr('shipBonusRole3'), **kwargs)
 
 
@@ -31058,7 +31022,7 @@ class Effect6712(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Stasis Web', 'speedFactor',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Stasis Web'), 'speedFactor',
                                       src.getModifiedItemAttr('shipBonusTitanM1'), skill='Minmatar Titan', **kwargs)
 
 
@@ -31075,7 +31039,7 @@ class Effect6713(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Burst Projector Operation'), 'speedFactor',
+        fit.modules.filteredItemBoost(ItemSkillFilter('Burst Projector Operation'), 'speedFactor',
                                       src.getModifiedItemAttr('shipBonusSupercarrierM1'), skill='Minmatar Carrier', **kwargs)
 
 
@@ -31114,13 +31078,13 @@ class Effect6717(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Mining'), 'capacitorNeed',
+        fit.modules.filteredItemBoost(ItemSkillFilter('Mining'), 'capacitorNeed',
                                       src.getModifiedItemAttr('miningDurationRoleBonus'), **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Mining'), 'duration',
+        fit.modules.filteredItemBoost(ItemSkillFilter('Mining'), 'duration',
                                       src.getModifiedItemAttr('miningDurationRoleBonus'), **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Ice Harvesting'), 'duration',
+        fit.modules.filteredItemBoost(ItemSkillFilter('Ice Harvesting'), 'duration',
                                       src.getModifiedItemAttr('miningDurationRoleBonus'), **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Ice Harvesting'), 'capacitorNeed',
+        fit.modules.filteredItemBoost(ItemSkillFilter('Ice Harvesting'), 'capacitorNeed',
                                       src.getModifiedItemAttr('miningDurationRoleBonus'), **kwargs)
 
 
@@ -31136,11 +31100,11 @@ class Effect6720(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'), 'shieldBonus',
+        fit.drones.filteredItemBoost(ItemSkillFilter('Drones'), 'shieldBonus',
                                      src.getModifiedItemAttr('shipBonusMC'), skill='Minmatar Cruiser', **kwargs)
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'), 'structureDamageAmount',
+        fit.drones.filteredItemBoost(ItemSkillFilter('Drones'), 'structureDamageAmount',
                                      src.getModifiedItemAttr('shipBonusMC'), skill='Minmatar Cruiser', **kwargs)
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'), 'armorDamageAmount',
+        fit.drones.filteredItemBoost(ItemSkillFilter('Drones'), 'armorDamageAmount',
                                      src.getModifiedItemAttr('shipBonusMC'), skill='Minmatar Cruiser', **kwargs)
 
 
@@ -31156,11 +31120,11 @@ class Effect6721(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Remote Armor Repair Systems'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Remote Armor Repair Systems'),
                                       'falloffEffectiveness',
                                       src.getModifiedItemAttr('eliteBonusLogistics1'),
                                       skill='Logistics Cruisers', **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Remote Armor Repair Systems'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Remote Armor Repair Systems'),
                                       'maxRange',
                                       src.getModifiedItemAttr('eliteBonusLogistics1'),
                                       skill='Logistics Cruisers', **kwargs)
@@ -31178,10 +31142,10 @@ class Effect6722(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Remote Armor Repair Systems'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Remote Armor Repair Systems'),
                                       'falloffEffectiveness',
                                       src.getModifiedItemAttr('roleBonusRepairRange'), **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Remote Armor Repair Systems'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Remote Armor Repair Systems'),
                                       'maxRange',
                                       src.getModifiedItemAttr('roleBonusRepairRange'), **kwargs)
 
@@ -31198,7 +31162,7 @@ class Effect6723(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Cloaking'), 'cpu',
+        fit.modules.filteredItemBoost(ItemSkillFilter('Cloaking'), 'cpu',
                                       src.getModifiedItemAttr('shipBonusMC2'), skill='Minmatar Cruiser', **kwargs)
 
 
@@ -31214,7 +31178,7 @@ class Effect6724(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Remote Armor Repair Systems'), 'duration',
+        fit.modules.filteredItemBoost(ItemSkillFilter('Remote Armor Repair Systems'), 'duration',
                                       src.getModifiedItemAttr('eliteBonusLogistics3'), skill='Logistics Cruisers', **kwargs)
 
 
@@ -31230,7 +31194,7 @@ class Effect6725(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Energy Turret'), 'falloff',
+        fit.modules.filteredItemBoost(ItemSkillFilter('Small Energy Turret'), 'falloff',
                                       src.getModifiedItemAttr('shipBonus2AF'), skill='Amarr Frigate', **kwargs)
 
 
@@ -31246,7 +31210,7 @@ class Effect6726(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Cloaking'), 'cpu',
+        fit.modules.filteredItemBoost(ItemSkillFilter('Cloaking'), 'cpu',
                                       src.getModifiedItemAttr('shipBonusMF'), skill='Minmatar Frigate', **kwargs)
 
 
@@ -31262,7 +31226,7 @@ class Effect6727(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name in ('Energy Nosferatu', 'Energy Neutralizer'),
+        fit.modules.filteredItemBoost(ItemGroupFilter('Energy Nosferatu', 'Energy Neutralizer'),
                                       'falloffEffectiveness', src.getModifiedItemAttr('eliteBonusCovertOps1'),
                                       stackingPenalties=True, skill='Covert Ops', **kwargs)
 
@@ -31465,9 +31429,9 @@ class Effect6762(BaseEffect):
     @staticmethod
     def handler(fit, src, context, **kwargs):
         lvl = src.level
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Mining Drone Specialization'), 'miningAmount',
+        fit.drones.filteredItemBoost(ItemSkillFilter('Mining Drone Specialization'), 'miningAmount',
                                      src.getModifiedItemAttr('miningAmountBonus') * lvl, **kwargs)
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Mining Drone Specialization'), 'maxVelocity',
+        fit.drones.filteredItemBoost(ItemSkillFilter('Mining Drone Specialization'), 'maxVelocity',
                                      src.getModifiedItemAttr('maxVelocityBonus') * lvl, **kwargs)
 
 
@@ -31485,7 +31449,7 @@ class Effect6763(BaseEffect):
     @staticmethod
     def handler(fit, src, context, **kwargs):
         lvl = src.level if 'skill' in context else 1
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Ice Harvesting Drone Operation'), 'duration', src.getModifiedItemAttr('rofBonus') * lvl, **kwargs)
+        fit.drones.filteredItemBoost(ItemSkillFilter('Ice Harvesting Drone Operation'), 'duration', src.getModifiedItemAttr('rofBonus') * lvl, **kwargs)
 
 
 class Effect6764(BaseEffect):
@@ -31501,9 +31465,9 @@ class Effect6764(BaseEffect):
     @staticmethod
     def handler(fit, src, context, **kwargs):
         lvl = src.level
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Ice Harvesting Drone Specialization'), 'duration',
+        fit.drones.filteredItemBoost(ItemSkillFilter('Ice Harvesting Drone Specialization'), 'duration',
                                      src.getModifiedItemAttr('rofBonus') * lvl, **kwargs)
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Ice Harvesting Drone Specialization'),
+        fit.drones.filteredItemBoost(ItemSkillFilter('Ice Harvesting Drone Specialization'),
                                      'maxVelocity', src.getModifiedItemAttr('maxVelocityBonus') * lvl, **kwargs)
 
 
@@ -31520,7 +31484,7 @@ class Effect6765(BaseEffect):
     @staticmethod
     def handler(fit, src, context, **kwargs):
         lvl = src.level
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Spatial Phenomena Generation'), 'buffDuration',
+        fit.modules.filteredItemBoost(ItemSkillFilter('Spatial Phenomena Generation'), 'buffDuration',
                                       src.getModifiedItemAttr('durationBonus') * lvl, **kwargs)
 
 
@@ -31536,9 +31500,9 @@ class Effect6766(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemIncrease(lambda mod: mod.item.requiresSkill('Leadership'), 'maxGroupActive',
+        fit.modules.filteredItemIncrease(ItemSkillFilter('Leadership'), 'maxGroupActive',
                                          src.getModifiedItemAttr('maxGangModules'), **kwargs)
-        fit.modules.filteredItemIncrease(lambda mod: mod.item.requiresSkill('Leadership'), 'maxGroupOnline',
+        fit.modules.filteredItemIncrease(ItemSkillFilter('Leadership'), 'maxGroupOnline',
                                          src.getModifiedItemAttr('maxGangModules'), **kwargs)
 
 
@@ -31556,7 +31520,7 @@ class Effect6769(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Leadership'), 'maxRange',
+        fit.modules.filteredItemBoost(ItemSkillFilter('Leadership'), 'maxRange',
                                       src.getModifiedItemAttr('areaOfEffectBonus') * src.level, **kwargs)
 
 
@@ -31573,7 +31537,7 @@ class Effect6770(BaseEffect):
     @staticmethod
     def handler(fit, src, context, **kwargs):
         lvl = src.level
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Armored Command'), 'buffDuration',
+        fit.modules.filteredItemBoost(ItemSkillFilter('Armored Command'), 'buffDuration',
                                       src.getModifiedItemAttr('durationBonus') * lvl, **kwargs)
 
 
@@ -31590,7 +31554,7 @@ class Effect6771(BaseEffect):
     @staticmethod
     def handler(fit, src, context, **kwargs):
         lvl = src.level
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Command'), 'buffDuration',
+        fit.modules.filteredItemBoost(ItemSkillFilter('Shield Command'), 'buffDuration',
                                       src.getModifiedItemAttr('durationBonus') * lvl, **kwargs)
 
 
@@ -31607,7 +31571,7 @@ class Effect6772(BaseEffect):
     @staticmethod
     def handler(fit, src, context, **kwargs):
         lvl = src.level
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Information Command'), 'buffDuration',
+        fit.modules.filteredItemBoost(ItemSkillFilter('Information Command'), 'buffDuration',
                                       src.getModifiedItemAttr('durationBonus') * lvl, **kwargs)
 
 
@@ -31624,7 +31588,7 @@ class Effect6773(BaseEffect):
     @staticmethod
     def handler(fit, src, context, **kwargs):
         lvl = src.level
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Skirmish Command'), 'buffDuration',
+        fit.modules.filteredItemBoost(ItemSkillFilter('Skirmish Command'), 'buffDuration',
                                       src.getModifiedItemAttr('durationBonus') * lvl, **kwargs)
 
 
@@ -31641,7 +31605,7 @@ class Effect6774(BaseEffect):
     @staticmethod
     def handler(fit, src, context, **kwargs):
         lvl = src.level
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Mining Foreman'), 'buffDuration',
+        fit.modules.filteredItemBoost(ItemSkillFilter('Mining Foreman'), 'buffDuration',
                                       src.getModifiedItemAttr('durationBonus') * lvl, **kwargs)
 
 
@@ -31658,13 +31622,13 @@ class Effect6776(BaseEffect):
     @staticmethod
     def handler(fit, src, context, **kwargs):
         lvl = src.level
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Armored Command'), 'warfareBuff1Multiplier',
+        fit.modules.filteredChargeBoost(ItemSkillFilter('Armored Command'), 'warfareBuff1Multiplier',
                                         src.getModifiedItemAttr('commandStrengthBonus') * lvl, **kwargs)
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Armored Command'), 'warfareBuff2Multiplier',
+        fit.modules.filteredChargeBoost(ItemSkillFilter('Armored Command'), 'warfareBuff2Multiplier',
                                         src.getModifiedItemAttr('commandStrengthBonus') * lvl, **kwargs)
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Armored Command'), 'warfareBuff4Multiplier',
+        fit.modules.filteredChargeBoost(ItemSkillFilter('Armored Command'), 'warfareBuff4Multiplier',
                                         src.getModifiedItemAttr('commandStrengthBonus') * lvl, **kwargs)
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Armored Command'), 'warfareBuff3Multiplier',
+        fit.modules.filteredChargeBoost(ItemSkillFilter('Armored Command'), 'warfareBuff3Multiplier',
                                         src.getModifiedItemAttr('commandStrengthBonus') * lvl, **kwargs)
 
 
@@ -31681,13 +31645,13 @@ class Effect6777(BaseEffect):
     @staticmethod
     def handler(fit, src, context, **kwargs):
         lvl = src.level
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Shield Command'), 'warfareBuff3Multiplier',
+        fit.modules.filteredChargeBoost(ItemSkillFilter('Shield Command'), 'warfareBuff3Multiplier',
                                         src.getModifiedItemAttr('commandStrengthBonus') * lvl, **kwargs)
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Shield Command'), 'warfareBuff1Multiplier',
+        fit.modules.filteredChargeBoost(ItemSkillFilter('Shield Command'), 'warfareBuff1Multiplier',
                                         src.getModifiedItemAttr('commandStrengthBonus') * lvl, **kwargs)
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Shield Command'), 'warfareBuff2Multiplier',
+        fit.modules.filteredChargeBoost(ItemSkillFilter('Shield Command'), 'warfareBuff2Multiplier',
                                         src.getModifiedItemAttr('commandStrengthBonus') * lvl, **kwargs)
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Shield Command'), 'warfareBuff4Multiplier',
+        fit.modules.filteredChargeBoost(ItemSkillFilter('Shield Command'), 'warfareBuff4Multiplier',
                                         src.getModifiedItemAttr('commandStrengthBonus') * lvl, **kwargs)
 
 
@@ -31704,13 +31668,13 @@ class Effect6778(BaseEffect):
     @staticmethod
     def handler(fit, src, context, **kwargs):
         lvl = src.level
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Information Command'), 'warfareBuff2Multiplier',
+        fit.modules.filteredChargeBoost(ItemSkillFilter('Information Command'), 'warfareBuff2Multiplier',
                                         src.getModifiedItemAttr('commandStrengthBonus') * lvl, **kwargs)
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Information Command'), 'warfareBuff1Multiplier',
+        fit.modules.filteredChargeBoost(ItemSkillFilter('Information Command'), 'warfareBuff1Multiplier',
                                         src.getModifiedItemAttr('commandStrengthBonus') * lvl, **kwargs)
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Information Command'), 'warfareBuff3Multiplier',
+        fit.modules.filteredChargeBoost(ItemSkillFilter('Information Command'), 'warfareBuff3Multiplier',
                                         src.getModifiedItemAttr('commandStrengthBonus') * lvl, **kwargs)
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Information Command'), 'warfareBuff4Multiplier',
+        fit.modules.filteredChargeBoost(ItemSkillFilter('Information Command'), 'warfareBuff4Multiplier',
                                         src.getModifiedItemAttr('commandStrengthBonus') * lvl, **kwargs)
 
 
@@ -31727,13 +31691,13 @@ class Effect6779(BaseEffect):
     @staticmethod
     def handler(fit, src, context, **kwargs):
         lvl = src.level
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Skirmish Command'), 'warfareBuff3Multiplier',
+        fit.modules.filteredChargeBoost(ItemSkillFilter('Skirmish Command'), 'warfareBuff3Multiplier',
                                         src.getModifiedItemAttr('commandStrengthBonus') * lvl, **kwargs)
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Skirmish Command'), 'warfareBuff4Multiplier',
+        fit.modules.filteredChargeBoost(ItemSkillFilter('Skirmish Command'), 'warfareBuff4Multiplier',
                                         src.getModifiedItemAttr('commandStrengthBonus') * lvl, **kwargs)
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Skirmish Command'), 'warfareBuff1Multiplier',
+        fit.modules.filteredChargeBoost(ItemSkillFilter('Skirmish Command'), 'warfareBuff1Multiplier',
                                         src.getModifiedItemAttr('commandStrengthBonus') * lvl, **kwargs)
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Skirmish Command'), 'warfareBuff2Multiplier',
+        fit.modules.filteredChargeBoost(ItemSkillFilter('Skirmish Command'), 'warfareBuff2Multiplier',
                                         src.getModifiedItemAttr('commandStrengthBonus') * lvl, **kwargs)
 
 
@@ -31750,10 +31714,10 @@ class Effect6780(BaseEffect):
     @staticmethod
     def handler(fit, src, context, **kwargs):
         lvl = src.level
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Mining Foreman'), 'warfareBuff4Value', src.getModifiedItemAttr('commandStrengthBonus') * lvl, **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Mining Foreman'), 'warfareBuff3Value', src.getModifiedItemAttr('commandStrengthBonus') * lvl, **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Mining Foreman'), 'warfareBuff2Value', src.getModifiedItemAttr('commandStrengthBonus') * lvl, **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Mining Foreman'), 'warfareBuff1Value', src.getModifiedItemAttr('commandStrengthBonus') * lvl, **kwargs)
+        fit.modules.filteredItemBoost(ItemSkillFilter('Mining Foreman'), 'warfareBuff4Value', src.getModifiedItemAttr('commandStrengthBonus') * lvl, **kwargs)
+        fit.modules.filteredItemBoost(ItemSkillFilter('Mining Foreman'), 'warfareBuff3Value', src.getModifiedItemAttr('commandStrengthBonus') * lvl, **kwargs)
+        fit.modules.filteredItemBoost(ItemSkillFilter('Mining Foreman'), 'warfareBuff2Value', src.getModifiedItemAttr('commandStrengthBonus') * lvl, **kwargs)
+        fit.modules.filteredItemBoost(ItemSkillFilter('Mining Foreman'), 'warfareBuff1Value', src.getModifiedItemAttr('commandStrengthBonus') * lvl, **kwargs)
 
 
 class Effect6782(BaseEffect):
@@ -31769,7 +31733,7 @@ class Effect6782(BaseEffect):
     @staticmethod
     def handler(fit, src, context, **kwargs):
         lvl = src.level
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Leadership'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Leadership'),
                                       'reloadTime',
                                       src.getModifiedItemAttr('reloadTimeBonus') * lvl, **kwargs)
 
@@ -31794,7 +31758,7 @@ class Effect6783(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Leadership'), 'maxRange',
+        fit.modules.filteredItemBoost(ItemSkillFilter('Leadership'), 'maxRange',
                                       src.getModifiedItemAttr('roleBonusCommandBurstAoERange'), **kwargs)
 
 
@@ -31810,15 +31774,15 @@ class Effect6786(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Command'), 'warfareBuff4Multiplier',
+        fit.modules.filteredItemBoost(ItemSkillFilter('Shield Command'), 'warfareBuff4Multiplier',
                                       src.getModifiedItemAttr('shipBonusICS3'), skill='Industrial Command Ships', **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Command'), 'warfareBuff1Multiplier',
+        fit.modules.filteredItemBoost(ItemSkillFilter('Shield Command'), 'warfareBuff1Multiplier',
                                       src.getModifiedItemAttr('shipBonusICS3'), skill='Industrial Command Ships', **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Command'), 'warfareBuff2Multiplier',
+        fit.modules.filteredItemBoost(ItemSkillFilter('Shield Command'), 'warfareBuff2Multiplier',
                                       src.getModifiedItemAttr('shipBonusICS3'), skill='Industrial Command Ships', **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Command'), 'warfareBuff3Multiplier',
+        fit.modules.filteredItemBoost(ItemSkillFilter('Shield Command'), 'warfareBuff3Multiplier',
                                       src.getModifiedItemAttr('shipBonusICS3'), skill='Industrial Command Ships', **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Command'), 'buffDuration',
+        fit.modules.filteredItemBoost(ItemSkillFilter('Shield Command'), 'buffDuration',
                                       src.getModifiedItemAttr('shipBonusICS3'), skill='Industrial Command Ships', **kwargs)
 
 
@@ -31834,27 +31798,27 @@ class Effect6787(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+        fit.drones.filteredItemBoost(ItemSkillFilter('Drones'),
                                      'damageMultiplier',
                                      src.getModifiedItemAttr('shipBonusICS4'),
                                      skill='Industrial Command Ships', **kwargs)
 
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+        fit.drones.filteredItemBoost(ItemSkillFilter('Drones'),
                                      'shieldCapacity',
                                      src.getModifiedItemAttr('shipBonusICS4'),
                                      skill='Industrial Command Ships', **kwargs)
 
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+        fit.drones.filteredItemBoost(ItemSkillFilter('Drones'),
                                      'armorHP',
                                      src.getModifiedItemAttr('shipBonusICS4'),
                                      skill='Industrial Command Ships', **kwargs)
 
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+        fit.drones.filteredItemBoost(ItemSkillFilter('Drones'),
                                      'hp',
                                      src.getModifiedItemAttr('shipBonusICS4'),
                                      skill='Industrial Command Ships', **kwargs)
 
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Mining Drone Operation'),
+        fit.drones.filteredItemBoost(ItemSkillFilter('Mining Drone Operation'),
                                      'miningAmount',
                                      src.getModifiedItemAttr('shipBonusICS4'),
                                      skill='Industrial Command Ships', **kwargs)
@@ -31872,7 +31836,7 @@ class Effect6788(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Ice Harvesting Drone Operation'),
+        fit.drones.filteredItemBoost(ItemSkillFilter('Ice Harvesting Drone Operation'),
                                      'duration',
                                      src.getModifiedItemAttr('shipBonusICS5'),
                                      skill='Industrial Command Ships', **kwargs)
@@ -31897,7 +31861,7 @@ class Effect6789(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+        fit.drones.filteredItemBoost(ItemSkillFilter('Drones'),
                                      'damageMultiplier',
                                      src.getModifiedItemAttr('industrialBonusDroneDamage'), **kwargs)
 
@@ -31914,7 +31878,7 @@ class Effect6790(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Ice Harvesting Drone Operation'), 'duration',
+        fit.drones.filteredItemBoost(ItemSkillFilter('Ice Harvesting Drone Operation'), 'duration',
                                      src.getModifiedItemAttr('roleBonusDroneIceHarvestingSpeed'), **kwargs)
 
 
@@ -31930,27 +31894,27 @@ class Effect6792(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+        fit.drones.filteredItemBoost(ItemSkillFilter('Drones'),
                                      'damageMultiplier',
                                      src.getModifiedItemAttr('shipBonusORECapital4'),
                                      skill='Capital Industrial Ships', **kwargs)
 
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+        fit.drones.filteredItemBoost(ItemSkillFilter('Drones'),
                                      'shieldCapacity',
                                      src.getModifiedItemAttr('shipBonusORECapital4'),
                                      skill='Capital Industrial Ships', **kwargs)
 
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+        fit.drones.filteredItemBoost(ItemSkillFilter('Drones'),
                                      'armorHP',
                                      src.getModifiedItemAttr('shipBonusORECapital4'),
                                      skill='Capital Industrial Ships', **kwargs)
 
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+        fit.drones.filteredItemBoost(ItemSkillFilter('Drones'),
                                      'hp',
                                      src.getModifiedItemAttr('shipBonusORECapital4'),
                                      skill='Capital Industrial Ships', **kwargs)
 
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Mining Drone Operation'),
+        fit.drones.filteredItemBoost(ItemSkillFilter('Mining Drone Operation'),
                                      'miningAmount',
                                      src.getModifiedItemAttr('shipBonusORECapital4'),
                                      skill='Capital Industrial Ships', **kwargs)
@@ -31968,15 +31932,15 @@ class Effect6793(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Mining Foreman'), 'warfareBuff1Value',
+        fit.modules.filteredItemBoost(ItemSkillFilter('Mining Foreman'), 'warfareBuff1Value',
                                       src.getModifiedItemAttr('shipBonusORECapital2'), skill='Capital Industrial Ships', **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Mining Foreman'), 'warfareBuff2Value',
+        fit.modules.filteredItemBoost(ItemSkillFilter('Mining Foreman'), 'warfareBuff2Value',
                                       src.getModifiedItemAttr('shipBonusORECapital2'), skill='Capital Industrial Ships', **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Mining Foreman'), 'warfareBuff4Value',
+        fit.modules.filteredItemBoost(ItemSkillFilter('Mining Foreman'), 'warfareBuff4Value',
                                       src.getModifiedItemAttr('shipBonusORECapital2'), skill='Capital Industrial Ships', **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Mining Foreman'), 'warfareBuff3Value',
+        fit.modules.filteredItemBoost(ItemSkillFilter('Mining Foreman'), 'warfareBuff3Value',
                                       src.getModifiedItemAttr('shipBonusORECapital2'), skill='Capital Industrial Ships', **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Mining Foreman'), 'buffDuration',
+        fit.modules.filteredItemBoost(ItemSkillFilter('Mining Foreman'), 'buffDuration',
                                       src.getModifiedItemAttr('shipBonusORECapital2'), skill='Capital Industrial Ships', **kwargs)
 
 
@@ -31992,15 +31956,15 @@ class Effect6794(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Command'), 'warfareBuff4Value',
+        fit.modules.filteredItemBoost(ItemSkillFilter('Shield Command'), 'warfareBuff4Value',
                                       src.getModifiedItemAttr('shipBonusORECapital3'), skill='Capital Industrial Ships', **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Command'), 'buffDuration',
+        fit.modules.filteredItemBoost(ItemSkillFilter('Shield Command'), 'buffDuration',
                                       src.getModifiedItemAttr('shipBonusORECapital3'), skill='Capital Industrial Ships', **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Command'), 'warfareBuff1Value',
+        fit.modules.filteredItemBoost(ItemSkillFilter('Shield Command'), 'warfareBuff1Value',
                                       src.getModifiedItemAttr('shipBonusORECapital3'), skill='Capital Industrial Ships', **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Command'), 'warfareBuff3Value',
+        fit.modules.filteredItemBoost(ItemSkillFilter('Shield Command'), 'warfareBuff3Value',
                                       src.getModifiedItemAttr('shipBonusORECapital3'), skill='Capital Industrial Ships', **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Command'), 'warfareBuff2Value',
+        fit.modules.filteredItemBoost(ItemSkillFilter('Shield Command'), 'warfareBuff2Value',
                                       src.getModifiedItemAttr('shipBonusORECapital3'), skill='Capital Industrial Ships', **kwargs)
 
 
@@ -32016,7 +31980,7 @@ class Effect6795(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Ice Harvesting Drone Operation'),
+        fit.drones.filteredItemBoost(ItemSkillFilter('Ice Harvesting Drone Operation'),
                                      'duration',
                                      src.getModifiedItemAttr('shipBonusORECapital5'),
                                      skill='Capital Industrial Ships', **kwargs)
@@ -32035,7 +31999,7 @@ class Effect6796(BaseEffect):
     @staticmethod
     def handler(fit, module, context, **kwargs):
         fit.modules.filteredItemMultiply(
-            lambda mod: mod.item.requiresSkill('Small Hybrid Turret'),
+            ItemSkillFilter('Small Hybrid Turret'),
             'damageMultiplier',
             1 / module.getModifiedItemAttr('modeDamageBonusPostDiv'),
             stackingPenalties=True,
@@ -32055,7 +32019,7 @@ class Effect6797(BaseEffect):
     @staticmethod
     def handler(fit, module, context, **kwargs):
         fit.modules.filteredItemMultiply(
-            lambda mod: mod.item.requiresSkill('Small Projectile Turret'),
+            ItemSkillFilter('Small Projectile Turret'),
             'damageMultiplier',
             1 / module.getModifiedItemAttr('modeDamageBonusPostDiv'),
             stackingPenalties=True,
@@ -32075,7 +32039,7 @@ class Effect6798(BaseEffect):
     @staticmethod
     def handler(fit, module, context, **kwargs):
         fit.modules.filteredItemMultiply(
-            lambda mod: mod.item.requiresSkill('Small Energy Turret'),
+            ItemSkillFilter('Small Energy Turret'),
             'damageMultiplier',
             1 / module.getModifiedItemAttr('modeDamageBonusPostDiv'),
             stackingPenalties=True,
@@ -32096,7 +32060,7 @@ class Effect6799(BaseEffect):
     def handler(fit, module, context, **kwargs):
         types = ('thermal', 'em', 'explosive', 'kinetic')
         for type in types:
-            fit.modules.filteredChargeMultiply(lambda mod: mod.charge.requiresSkill('Rockets') or mod.charge.requiresSkill('Light Missiles'),
+            fit.modules.filteredChargeMultiply(ChargeSkillFilter('Rockets', 'Light Missiles'),
                                                '{}Damage'.format(type),
                                                1 / module.getModifiedItemAttr('modeDamageBonusPostDiv'),
                                                stackingPenalties=True,
@@ -32133,7 +32097,7 @@ class Effect6801(BaseEffect):
     @staticmethod
     def handler(fit, module, context, **kwargs):
         fit.modules.filteredItemMultiply(
-            lambda mod: mod.item.requiresSkill('High Speed Maneuvering') or mod.item.requiresSkill('Afterburner'),
+            ItemSkillFilter('High Speed Maneuvering', 'Afterburner'),
             'speedFactor',
             1 / module.getModifiedItemAttr('modeVelocityPostDiv'),
             stackingPenalties=True,
@@ -32153,9 +32117,9 @@ class Effect6807(BaseEffect):
     @staticmethod
     def handler(fit, src, context, **kwargs):
         lvl = src.level
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Invulnerability Core Operation'), 'buffDuration',
+        fit.modules.filteredItemBoost(ItemSkillFilter('Invulnerability Core Operation'), 'buffDuration',
                                       src.getModifiedItemAttr('durationBonus') * lvl, **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Invulnerability Core Operation'), 'duration',
+        fit.modules.filteredItemBoost(ItemSkillFilter('Invulnerability Core Operation'), 'duration',
                                       src.getModifiedItemAttr('durationBonus') * lvl, **kwargs)
 
 
@@ -32171,7 +32135,7 @@ class Effect6844(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Defender Missiles'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Defender Missiles'),
                                         'maxVelocity', skill.getModifiedItemAttr('missileVelocityBonus') * skill.level, **kwargs)
 
 
@@ -32187,7 +32151,7 @@ class Effect6845(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Defender Missiles'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Defender Missiles'),
                                       'moduleReactivationDelay', ship.getModifiedItemAttr('shipBonusRole1'), **kwargs)
 
 
@@ -32204,7 +32168,7 @@ class Effect6851(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Energy Turret'), 'damageMultiplier', src.getModifiedItemAttr('shipBonusRole3'), **kwargs)
+        fit.modules.filteredItemBoost(ItemSkillFilter('Capital Energy Turret'), 'damageMultiplier', src.getModifiedItemAttr('shipBonusRole3'), **kwargs)
 
 
 class Effect6852(BaseEffect):
@@ -32219,7 +32183,7 @@ class Effect6852(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Stasis Web',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Stasis Web'),
                                       'maxRange', src.getModifiedItemAttr('shipBonusTitanM1'), skill='Minmatar Titan', **kwargs)
 
 
@@ -32235,9 +32199,9 @@ class Effect6853(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Nosferatu',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Energy Nosferatu'),
                                       'powerTransferAmount', src.getModifiedItemAttr('shipBonusTitanA1'), skill='Amarr Titan', **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Neutralizer',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Energy Neutralizer'),
                                       'energyNeutralizerAmount', src.getModifiedItemAttr('shipBonusTitanA1'), skill='Amarr Titan', **kwargs)
 
 
@@ -32253,9 +32217,9 @@ class Effect6855(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Nosferatu',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Energy Nosferatu'),
                                       'powerTransferAmount', src.getModifiedItemAttr('shipBonusDreadnoughtA1'), skill='Amarr Dreadnought', **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Neutralizer',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Energy Neutralizer'),
                                       'energyNeutralizerAmount', src.getModifiedItemAttr('shipBonusDreadnoughtA1'), skill='Amarr Dreadnought', **kwargs)
 
 
@@ -32271,7 +32235,7 @@ class Effect6856(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Stasis Web',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Stasis Web'),
                                       'maxRange', src.getModifiedItemAttr('shipBonusDreadnoughtM1'), skill='Minmatar Dreadnought', **kwargs)
 
 
@@ -32287,9 +32251,9 @@ class Effect6857(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Nosferatu',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Energy Nosferatu'),
                                       'maxRange', src.getModifiedItemAttr('shipBonusForceAuxiliaryA1'), skill='Amarr Carrier', **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Nosferatu',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Energy Nosferatu'),
                                       'falloffEffectiveness', src.getModifiedItemAttr('shipBonusForceAuxiliaryA1'), skill='Amarr Carrier', **kwargs)
 
 
@@ -32305,7 +32269,7 @@ class Effect6858(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Nosferatu',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Energy Nosferatu'),
                                       'powerTransferAmount', src.getModifiedItemAttr('shipBonusForceAuxiliaryA1'), skill='Amarr Carrier', **kwargs)
 
 
@@ -32322,7 +32286,7 @@ class Effect6859(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Nosferatu', 'cpu', src.getModifiedItemAttr('shipBonusRole4'), **kwargs)
+        fit.modules.filteredItemBoost(ItemGroupFilter('Energy Nosferatu'), 'cpu', src.getModifiedItemAttr('shipBonusRole4'), **kwargs)
 
 
 class Effect6860(BaseEffect):
@@ -32337,7 +32301,7 @@ class Effect6860(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Remote Armor Repair Systems'), 'power',
+        fit.modules.filteredItemBoost(ItemSkillFilter('Remote Armor Repair Systems'), 'power',
                                       src.getModifiedItemAttr('shipBonusRole5'), **kwargs)
 
 
@@ -32353,7 +32317,7 @@ class Effect6861(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Remote Armor Repair Systems'), 'power', src.getModifiedItemAttr('shipBonusRole5'), **kwargs)
+        fit.modules.filteredItemBoost(ItemSkillFilter('Capital Remote Armor Repair Systems'), 'power', src.getModifiedItemAttr('shipBonusRole5'), **kwargs)
 
 
 class Effect6862(BaseEffect):
@@ -32368,7 +32332,7 @@ class Effect6862(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Remote Armor Repair Systems'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Remote Armor Repair Systems'),
                                       'duration', src.getModifiedItemAttr('shipBonusForceAuxiliaryM1'), skill='Minmatar Carrier', **kwargs)
 
 
@@ -32399,9 +32363,9 @@ class Effect6866(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Rockets'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Rockets'),
                                         'explosionDelay', src.getModifiedItemAttr('shipBonusCF'), skill='Caldari Frigate', **kwargs)
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Light Missiles'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Light Missiles'),
                                         'explosionDelay', src.getModifiedItemAttr('shipBonusCF'), skill='Caldari Frigate', **kwargs)
 
 
@@ -32417,7 +32381,7 @@ class Effect6867(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Projectile Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Small Projectile Turret'),
                                       'speed', src.getModifiedItemAttr('shipBonusMF'), skill='Minmatar Frigate', **kwargs)
 
 
@@ -32444,9 +32408,9 @@ class Effect6871(BaseEffect):
             bonus = None
 
         if bonus is not None:
-            fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Repair Systems'),
+            fit.modules.filteredItemBoost(ItemSkillFilter('Repair Systems'),
                                       'armorDamageAmount', bonus, stackingPenalties=True, **kwargs)
-            fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Operation'),
+            fit.modules.filteredItemBoost(ItemSkillFilter('Shield Operation'),
                                       'shieldBonus', bonus, stackingPenalties=True, **kwargs)
 
 
@@ -32462,7 +32426,7 @@ class Effect6872(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Stasis Web', 'maxRange', src.getModifiedItemAttr('eliteBonusReconShip1'), skill='Recon Ships', **kwargs)
+        fit.modules.filteredItemBoost(ItemGroupFilter('Stasis Web'), 'maxRange', src.getModifiedItemAttr('eliteBonusReconShip1'), skill='Recon Ships', **kwargs)
 
 
 class Effect6873(BaseEffect):
@@ -32492,9 +32456,9 @@ class Effect6874(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Heavy Missiles'),
                                         'explosionDelay', src.getModifiedItemAttr('shipBonusCC2'), skill='Caldari Cruiser', **kwargs)
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Assault Missiles'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Heavy Assault Missiles'),
                                         'explosionDelay', src.getModifiedItemAttr('shipBonusCC2'), skill='Caldari Cruiser', **kwargs)
 
 
@@ -32525,7 +32489,7 @@ class Effect6878(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Warp Scrambler', 'maxRange',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Warp Scrambler'), 'maxRange',
                                       src.getModifiedItemAttr('eliteBonusBlackOps4'), stackingPenalties=True, skill='Black Ops', **kwargs)
 
 
@@ -32541,7 +32505,7 @@ class Effect6879(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Stasis Web', 'maxRange',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Stasis Web'), 'maxRange',
                                       src.getModifiedItemAttr('eliteBonusBlackOps3'), stackingPenalties=True, skill='Black Ops', **kwargs)
 
 
@@ -32557,11 +32521,11 @@ class Effect6880(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Missile Launcher Cruise', 'speed',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Missile Launcher Cruise'), 'speed',
                                       src.getModifiedItemAttr('shipBonus2CB'), skill='Caldari Battleship', **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Missile Launcher Torpedo', 'speed',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Missile Launcher Torpedo'), 'speed',
                                       src.getModifiedItemAttr('shipBonus2CB'), skill='Caldari Battleship', **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Missile Launcher Rapid Heavy', 'speed',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Missile Launcher Rapid Heavy'), 'speed',
                                       src.getModifiedItemAttr('shipBonus2CB'), skill='Caldari Battleship', **kwargs)
 
 
@@ -32577,9 +32541,9 @@ class Effect6881(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Torpedoes'), 'explosionDelay',
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Torpedoes'), 'explosionDelay',
                                         src.getModifiedItemAttr('shipBonusCB'), skill='Caldari Battleship', **kwargs)
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Cruise Missiles'), 'explosionDelay',
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Cruise Missiles'), 'explosionDelay',
                                         src.getModifiedItemAttr('shipBonusCB'), skill='Caldari Battleship', **kwargs)
 
 
@@ -32595,9 +32559,9 @@ class Effect6883(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Repair Systems'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Repair Systems'),
                                       'armorDamageAmount', src.getModifiedItemAttr('shipBonusForceAuxiliaryM2'), skill='Minmatar Carrier', **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Repair Systems'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Capital Repair Systems'),
                                       'armorDamageAmount', src.getModifiedItemAttr('shipBonusForceAuxiliaryM2'), skill='Minmatar Carrier', **kwargs)
 
 
@@ -32613,9 +32577,9 @@ class Effect6894(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name in ('Energy Nosferatu', 'Energy Neutralizer'),
+        fit.modules.filteredItemBoost(ItemGroupFilter('Energy Nosferatu', 'Energy Neutralizer'),
         'cpu', src.getModifiedItemAttr('subsystemEnergyNeutFittingReduction'), **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name in ('Energy Nosferatu', 'Energy Neutralizer'),
+        fit.modules.filteredItemBoost(ItemGroupFilter('Energy Nosferatu', 'Energy Neutralizer'),
                                       'power', src.getModifiedItemAttr('subsystemEnergyNeutFittingReduction'), **kwargs)
 
 
@@ -32631,9 +32595,9 @@ class Effect6895(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Energy Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Medium Energy Turret'),
                                       'cpu', src.getModifiedItemAttr('subsystemMETFittingReduction'), **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Energy Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Medium Energy Turret'),
                                       'power', src.getModifiedItemAttr('subsystemMETFittingReduction'), **kwargs)
 
 
@@ -32651,9 +32615,9 @@ class Effect6896(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Hybrid Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Medium Hybrid Turret'),
                                       'cpu', src.getModifiedItemAttr('subsystemMHTFittingReduction'), **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Hybrid Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Medium Hybrid Turret'),
                                       'power', src.getModifiedItemAttr('subsystemMHTFittingReduction'), **kwargs)
 
 
@@ -32669,9 +32633,9 @@ class Effect6897(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Projectile Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Medium Projectile Turret'),
                                       'power', src.getModifiedItemAttr('subsystemMPTFittingReduction'), **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Projectile Turret'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Medium Projectile Turret'),
                                       'cpu', src.getModifiedItemAttr('subsystemMPTFittingReduction'), **kwargs)
 
 
@@ -32689,7 +32653,7 @@ class Effect6898(BaseEffect):
     @staticmethod
     def handler(fit, src, context, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Remote Armor Repair Systems'),
+            ItemSkillFilter('Remote Armor Repair Systems'),
             'mediumRemoteRepFittingMultiplier', src.getModifiedItemAttr('subsystemMRARFittingReduction'), **kwargs)
 
 
@@ -32707,7 +32671,7 @@ class Effect6899(BaseEffect):
     @staticmethod
     def handler(fit, src, context, **kwargs):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Shield Emission Systems'),
+            ItemSkillFilter('Shield Emission Systems'),
             'mediumRemoteRepFittingMultiplier', src.getModifiedItemAttr('subsystemMRSBFittingReduction'), **kwargs)
 
 
@@ -32726,9 +32690,9 @@ class Effect6900(BaseEffect):
     @staticmethod
     def handler(fit, src, context, **kwargs):
         groups = ('Missile Launcher Heavy', 'Missile Launcher Rapid Light', 'Missile Launcher Heavy Assault')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name in groups,
+        fit.modules.filteredItemBoost(ItemGroupFilter(*groups),
                                       'cpu', src.getModifiedItemAttr('subsystemMMissileFittingReduction'), **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name in groups,
+        fit.modules.filteredItemBoost(ItemGroupFilter(*groups),
                                       'power', src.getModifiedItemAttr('subsystemMMissileFittingReduction'), **kwargs)
 
 
@@ -32828,7 +32792,7 @@ class Effect6921(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Astrometrics'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Astrometrics'),
                                         'baseSensorStrength', src.getModifiedItemAttr('subsystemBonusAmarrDefensive2'),
                                         skill='Amarr Defensive Systems', **kwargs)
 
@@ -32845,7 +32809,7 @@ class Effect6923(BaseEffect):
 
     @staticmethod
     def handler(fit, container, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles') or mod.charge.requiresSkill('Heavy Assault Missiles'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Heavy Missiles', 'Heavy Assault Missiles'),
                                       'maxVelocity', container.getModifiedItemAttr('subsystemBonusMinmatarOffensive'),
                                       skill='Minmatar Offensive Systems', **kwargs)
 
@@ -32862,7 +32826,7 @@ class Effect6924(BaseEffect):
 
     @staticmethod
     def handler(fit, container, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Missile Launcher Operation'),
                                       'aoeVelocity', container.getModifiedItemAttr('subsystemBonusMinmatarOffensive3'),
                                       skill='Minmatar Offensive Systems', **kwargs)
 
@@ -32879,10 +32843,10 @@ class Effect6925(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'),
+        fit.drones.filteredItemBoost(ItemSkillFilter('Drones'),
                                      'maxVelocity', src.getModifiedItemAttr('subsystemBonusGallenteOffensive2'),
                                      skill='Gallente Offensive Systems', **kwargs)
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'),
+        fit.drones.filteredItemBoost(ItemSkillFilter('Drones'),
                                      'trackingSpeed', src.getModifiedItemAttr('subsystemBonusGallenteOffensive2'),
                                      skill='Gallente Offensive Systems', **kwargs)
 
@@ -32930,7 +32894,7 @@ class Effect6928(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Afterburner') or mod.item.requiresSkill('High Speed Maneuvering'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Afterburner', 'High Speed Maneuvering'),
                                       'overloadSpeedFactorBonus', src.getModifiedItemAttr('subsystemBonusCaldariPropulsion2'),
                                       skill='Caldari Propulsion Systems', **kwargs)
 
@@ -32948,7 +32912,7 @@ class Effect6929(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Afterburner') or mod.item.requiresSkill('High Speed Maneuvering'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Afterburner', 'High Speed Maneuvering'),
                                       'overloadSpeedFactorBonus', src.getModifiedItemAttr('subsystemBonusGallentePropulsion2'),
                                       skill='Gallente Propulsion Systems', **kwargs)
 
@@ -33045,7 +33009,7 @@ class Effect6935(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name in ('Energy Nosferatu', 'Energy Neutralizer'), 'overloadSelfDurationBonus',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Energy Nosferatu', 'Energy Neutralizer'), 'overloadSelfDurationBonus',
                                       src.getModifiedItemAttr('subsystemBonusAmarrCore3'), skill='Amarr Core Systems', **kwargs)
 
 
@@ -33061,7 +33025,7 @@ class Effect6936(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Stasis Web',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Stasis Web'),
                                       'overloadRangeBonus', src.getModifiedItemAttr('subsystemBonusMinmatarCore3'),
                                       skill='Minmatar Core Systems', **kwargs)
 
@@ -33078,7 +33042,7 @@ class Effect6937(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Warp Scrambler', 'overloadRangeBonus',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Warp Scrambler'), 'overloadRangeBonus',
                                       src.getModifiedItemAttr('subsystemBonusGallenteCore3'), skill='Gallente Core Systems', **kwargs)
 
 
@@ -33094,7 +33058,7 @@ class Effect6938(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'ECM', 'overloadECMStrengthBonus',
+        fit.modules.filteredItemBoost(ItemGroupFilter('ECM'), 'overloadECMStrengthBonus',
                                       src.getModifiedItemAttr('subsystemBonusCaldariCore3'), skill='Caldari Core Systems', **kwargs)
 
 
@@ -33110,9 +33074,9 @@ class Effect6939(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Hull Upgrades'), 'overloadSelfDurationBonus',
+        fit.modules.filteredItemBoost(ItemSkillFilter('Hull Upgrades'), 'overloadSelfDurationBonus',
                                       src.getModifiedItemAttr('subsystemBonusAmarrDefensive2'), skill='Amarr Defensive Systems', **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Hull Upgrades'), 'overloadHardeningBonus',
+        fit.modules.filteredItemBoost(ItemSkillFilter('Hull Upgrades'), 'overloadHardeningBonus',
                                       src.getModifiedItemAttr('subsystemBonusAmarrDefensive2'), skill='Amarr Defensive Systems', **kwargs)
 
 
@@ -33128,9 +33092,9 @@ class Effect6940(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Hull Upgrades'), 'overloadHardeningBonus',
+        fit.modules.filteredItemBoost(ItemSkillFilter('Hull Upgrades'), 'overloadHardeningBonus',
                                       src.getModifiedItemAttr('subsystemBonusGallenteDefensive2'), skill='Gallente Defensive Systems', **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Hull Upgrades'), 'overloadSelfDurationBonus',
+        fit.modules.filteredItemBoost(ItemSkillFilter('Hull Upgrades'), 'overloadSelfDurationBonus',
                                       src.getModifiedItemAttr('subsystemBonusGallenteDefensive2'), skill='Gallente Defensive Systems', **kwargs)
 
 
@@ -33146,7 +33110,7 @@ class Effect6941(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Tactical Shield Manipulation'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Tactical Shield Manipulation'),
                                       'overloadHardeningBonus', src.getModifiedItemAttr('subsystemBonusCaldariDefensive2'),
                                       skill='Caldari Defensive Systems', **kwargs)
 
@@ -33163,11 +33127,11 @@ class Effect6942(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Hull Upgrades'), 'overloadSelfDurationBonus',
+        fit.modules.filteredItemBoost(ItemSkillFilter('Hull Upgrades'), 'overloadSelfDurationBonus',
                                       src.getModifiedItemAttr('subsystemBonusMinmatarDefensive2'), skill='Minmatar Defensive Systems', **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Hull Upgrades'), 'overloadHardeningBonus',
+        fit.modules.filteredItemBoost(ItemSkillFilter('Hull Upgrades'), 'overloadHardeningBonus',
                                       src.getModifiedItemAttr('subsystemBonusMinmatarDefensive2'), skill='Minmatar Defensive Systems', **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Tactical Shield Manipulation'), 'overloadHardeningBonus',
+        fit.modules.filteredItemBoost(ItemSkillFilter('Tactical Shield Manipulation'), 'overloadHardeningBonus',
                                       src.getModifiedItemAttr('subsystemBonusMinmatarDefensive2'), skill='Minmatar Defensive Systems', **kwargs)
 
 
@@ -33184,10 +33148,10 @@ class Effect6943(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Repair Systems'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Repair Systems'),
                                       'overloadSelfDurationBonus', src.getModifiedItemAttr('subsystemBonusAmarrDefensive3'),
                                       skill='Amarr Defensive Systems', **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Repair Systems'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Repair Systems'),
                                       'overloadArmorDamageAmount', src.getModifiedItemAttr('subsystemBonusAmarrDefensive3'),
                                       skill='Amarr Defensive Systems', **kwargs)
 
@@ -33205,10 +33169,10 @@ class Effect6944(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Repair Systems'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Repair Systems'),
                                       'overloadSelfDurationBonus', src.getModifiedItemAttr('subsystemBonusGallenteDefensive3'),
                                       skill='Gallente Defensive Systems', **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Repair Systems'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Repair Systems'),
                                       'overloadArmorDamageAmount', src.getModifiedItemAttr('subsystemBonusGallenteDefensive3'),
                                       skill='Gallente Defensive Systems', **kwargs)
 
@@ -33226,10 +33190,10 @@ class Effect6945(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Operation'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Shield Operation'),
                                       'overloadShieldBonus', src.getModifiedItemAttr('subsystemBonusCaldariDefensive3'),
                                       skill='Caldari Defensive Systems', **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Operation'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Shield Operation'),
                                       'overloadSelfDurationBonus', src.getModifiedItemAttr('subsystemBonusCaldariDefensive3'),
                                       skill='Caldari Defensive Systems', **kwargs)
 
@@ -33247,10 +33211,10 @@ class Effect6946(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Repair Systems') or mod.item.requiresSkill('Shield Operation'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Repair Systems', 'Shield Operation'),
                                       'overloadArmorDamageAmount', src.getModifiedItemAttr('subsystemBonusMinmatarDefensive3'),
                                       skill='Minmatar Defensive Systems', **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Repair Systems') or mod.item.requiresSkill('Shield Operation'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Repair Systems', 'Shield Operation'),
                                       'overloadSelfDurationBonus', src.getModifiedItemAttr('subsystemBonusMinmatarDefensive3'),
                                       skill='Minmatar Defensive Systems', **kwargs)
 
@@ -33267,7 +33231,7 @@ class Effect6947(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Astrometrics'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Astrometrics'),
                                         'baseSensorStrength', src.getModifiedItemAttr('subsystemBonusCaldariDefensive2'),
                                         skill='Caldari Defensive Systems', **kwargs)
 
@@ -33284,7 +33248,7 @@ class Effect6949(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Astrometrics'), 'baseSensorStrength',
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Astrometrics'), 'baseSensorStrength',
                                         src.getModifiedItemAttr('subsystemBonusGallenteDefensive2'), skill='Gallente Defensive Systems', **kwargs)
 
 
@@ -33300,7 +33264,7 @@ class Effect6951(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Astrometrics'), 'baseSensorStrength',
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Astrometrics'), 'baseSensorStrength',
                                         src.getModifiedItemAttr('subsystemBonusMinmatarDefensive2'), skill='Minmatar Defensive Systems', **kwargs)
 
 
@@ -33335,9 +33299,9 @@ class Effect6954(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Leadership'), 'power',
+        fit.modules.filteredItemBoost(ItemSkillFilter('Leadership'), 'power',
                                       src.getModifiedItemAttr('subsystemCommandBurstFittingReduction'), **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Leadership'), 'cpu',
+        fit.modules.filteredItemBoost(ItemSkillFilter('Leadership'), 'cpu',
                                       src.getModifiedItemAttr('subsystemCommandBurstFittingReduction'), **kwargs)
 
 
@@ -33354,7 +33318,7 @@ class Effect6955(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name in ('Remote Shield Booster', 'Ancillary Remote Shield Booster'),
+        fit.modules.filteredItemBoost(ItemGroupFilter('Remote Shield Booster', 'Ancillary Remote Shield Booster'),
                                       'falloffEffectiveness', src.getModifiedItemAttr('remoteShieldBoosterFalloffBonus'), **kwargs)
 
 
@@ -33370,7 +33334,7 @@ class Effect6956(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name in ('Remote Armor Repairer', 'Ancillary Remote Armor Repairer'),
+        fit.modules.filteredItemBoost(ItemGroupFilter('Remote Armor Repairer', 'Ancillary Remote Armor Repairer'),
                                       'maxRange', src.getModifiedItemAttr('remoteArmorRepairerOptimalBonus'), **kwargs)
 
 
@@ -33386,7 +33350,7 @@ class Effect6957(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name in ('Remote Armor Repairer', 'Ancillary Remote Armor Repairer'),
+        fit.modules.filteredItemBoost(ItemGroupFilter('Remote Armor Repairer', 'Ancillary Remote Armor Repairer'),
                                       'falloffEffectiveness', src.getModifiedItemAttr('remoteArmorRepairerFalloffBonus'), **kwargs)
 
 
@@ -33402,7 +33366,7 @@ class Effect6958(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Remote Armor Repair Systems'), 'overloadSelfDurationBonus',
+        fit.modules.filteredItemBoost(ItemSkillFilter('Remote Armor Repair Systems'), 'overloadSelfDurationBonus',
                                       src.getModifiedItemAttr('subsystemBonusAmarrOffensive3'), skill='Amarr Offensive Systems', **kwargs)
 
 
@@ -33418,7 +33382,7 @@ class Effect6959(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Remote Armor Repair Systems'), 'overloadSelfDurationBonus',
+        fit.modules.filteredItemBoost(ItemSkillFilter('Remote Armor Repair Systems'), 'overloadSelfDurationBonus',
                                       src.getModifiedItemAttr('subsystemBonusGallenteOffensive3'), skill='Gallente Offensive Systems', **kwargs)
 
 
@@ -33434,7 +33398,7 @@ class Effect6960(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Emission Systems'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Shield Emission Systems'),
                                       'overloadSelfDurationBonus', src.getModifiedItemAttr('subsystemBonusCaldariOffensive3'),
                                       skill='Caldari Offensive Systems', **kwargs)
 
@@ -33451,7 +33415,7 @@ class Effect6961(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Emission Systems') or mod.item.requiresSkill('Remote Armor Repair Systems'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Shield Emission Systems', 'Remote Armor Repair Systems'),
                                       'overloadSelfDurationBonus', src.getModifiedItemAttr('subsystemBonusMinmatarOffensive3'),
                                       skill='Minmatar Offensive Systems', **kwargs)
 
@@ -33516,17 +33480,17 @@ class Effect6981(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Torpedoes'), 'thermalDamage',
+        fit.modules.filteredChargeBoost(ItemSkillFilter('Torpedoes'), 'thermalDamage',
                                       src.getModifiedItemAttr('shipBonusTitanG1'), skill='Gallente Titan', **kwargs)
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Torpedoes'), 'kineticDamage',
+        fit.modules.filteredChargeBoost(ItemSkillFilter('Torpedoes'), 'kineticDamage',
                                       src.getModifiedItemAttr('shipBonusTitanG1'), skill='Gallente Titan', **kwargs)
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('XL Torpedoes'), 'thermalDamage',
+        fit.modules.filteredChargeBoost(ItemSkillFilter('XL Torpedoes'), 'thermalDamage',
                                       src.getModifiedItemAttr('shipBonusTitanG1'), skill='Gallente Titan', **kwargs)
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('XL Torpedoes'), 'kineticDamage',
+        fit.modules.filteredChargeBoost(ItemSkillFilter('XL Torpedoes'), 'kineticDamage',
                                       src.getModifiedItemAttr('shipBonusTitanG1'), skill='Gallente Titan', **kwargs)
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('XL Cruise Missiles'), 'thermalDamage',
+        fit.modules.filteredChargeBoost(ItemSkillFilter('XL Cruise Missiles'), 'thermalDamage',
                                       src.getModifiedItemAttr('shipBonusTitanG1'), skill='Gallente Titan', **kwargs)
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('XL Cruise Missiles'), 'kineticDamage',
+        fit.modules.filteredChargeBoost(ItemSkillFilter('XL Cruise Missiles'), 'kineticDamage',
                                       src.getModifiedItemAttr('shipBonusTitanG1'), skill='Gallente Titan', **kwargs)
 
 
@@ -33542,17 +33506,17 @@ class Effect6982(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Torpedoes'), 'explosiveDamage',
+        fit.modules.filteredChargeBoost(ItemSkillFilter('Torpedoes'), 'explosiveDamage',
                                       src.getModifiedItemAttr('shipBonusTitanG2'), skill='Gallente Titan', **kwargs)
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Torpedoes'), 'emDamage',
+        fit.modules.filteredChargeBoost(ItemSkillFilter('Torpedoes'), 'emDamage',
                                       src.getModifiedItemAttr('shipBonusTitanG2'), skill='Gallente Titan', **kwargs)
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('XL Torpedoes'), 'emDamage',
+        fit.modules.filteredChargeBoost(ItemSkillFilter('XL Torpedoes'), 'emDamage',
                                       src.getModifiedItemAttr('shipBonusTitanG2'), skill='Gallente Titan', **kwargs)
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('XL Torpedoes'), 'explosiveDamage',
+        fit.modules.filteredChargeBoost(ItemSkillFilter('XL Torpedoes'), 'explosiveDamage',
                                       src.getModifiedItemAttr('shipBonusTitanG2'), skill='Gallente Titan', **kwargs)
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('XL Cruise Missiles'), 'emDamage',
+        fit.modules.filteredChargeBoost(ItemSkillFilter('XL Cruise Missiles'), 'emDamage',
                                       src.getModifiedItemAttr('shipBonusTitanG2'), skill='Gallente Titan', **kwargs)
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('XL Cruise Missiles'), 'explosiveDamage',
+        fit.modules.filteredChargeBoost(ItemSkillFilter('XL Cruise Missiles'), 'explosiveDamage',
                                       src.getModifiedItemAttr('shipBonusTitanG2'), skill='Gallente Titan', **kwargs)
 
 
@@ -33587,13 +33551,13 @@ class Effect6984(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'), 'shieldCapacity',
+        fit.fighters.filteredItemBoost(ItemSkillFilter('Fighters'), 'shieldCapacity',
                                        src.getModifiedItemAttr('shipBonusRole4'), **kwargs)
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'), 'fighterAbilityAttackTurretDamageMultiplier',
+        fit.fighters.filteredItemBoost(ItemSkillFilter('Fighters'), 'fighterAbilityAttackTurretDamageMultiplier',
                                        src.getModifiedItemAttr('shipBonusRole4'), **kwargs)
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'), 'fighterAbilityAttackMissileDamageMultiplier',
+        fit.fighters.filteredItemBoost(ItemSkillFilter('Fighters'), 'fighterAbilityAttackMissileDamageMultiplier',
                                        src.getModifiedItemAttr('shipBonusRole4'), **kwargs)
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'), 'fighterAbilityMissilesDamageMultiplier',
+        fit.fighters.filteredItemBoost(ItemSkillFilter('Fighters'), 'fighterAbilityMissilesDamageMultiplier',
                                        src.getModifiedItemAttr('shipBonusRole4'), **kwargs)
 
 
@@ -33609,17 +33573,17 @@ class Effect6985(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Torpedoes'), 'kineticDamage',
+        fit.modules.filteredChargeBoost(ItemSkillFilter('Torpedoes'), 'kineticDamage',
                                       src.getModifiedItemAttr('shipBonusDreadnoughtG1'), skill='Gallente Dreadnought', **kwargs)
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Torpedoes'), 'thermalDamage',
+        fit.modules.filteredChargeBoost(ItemSkillFilter('Torpedoes'), 'thermalDamage',
                                       src.getModifiedItemAttr('shipBonusDreadnoughtG1'), skill='Gallente Dreadnought', **kwargs)
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('XL Torpedoes'), 'kineticDamage',
+        fit.modules.filteredChargeBoost(ItemSkillFilter('XL Torpedoes'), 'kineticDamage',
                                       src.getModifiedItemAttr('shipBonusDreadnoughtG1'), skill='Gallente Dreadnought', **kwargs)
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('XL Torpedoes'), 'thermalDamage',
+        fit.modules.filteredChargeBoost(ItemSkillFilter('XL Torpedoes'), 'thermalDamage',
                                       src.getModifiedItemAttr('shipBonusDreadnoughtG1'), skill='Gallente Dreadnought', **kwargs)
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('XL Cruise Missiles'), 'thermalDamage',
+        fit.modules.filteredChargeBoost(ItemSkillFilter('XL Cruise Missiles'), 'thermalDamage',
                                       src.getModifiedItemAttr('shipBonusDreadnoughtG1'), skill='Gallente Dreadnought', **kwargs)
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('XL Cruise Missiles'), 'kineticDamage',
+        fit.modules.filteredChargeBoost(ItemSkillFilter('XL Cruise Missiles'), 'kineticDamage',
                                       src.getModifiedItemAttr('shipBonusDreadnoughtG1'), skill='Gallente Dreadnought', **kwargs)
 
 
@@ -33635,7 +33599,7 @@ class Effect6986(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Shield Emission Systems'), 'shieldBonus',
+        fit.modules.filteredItemBoost(ItemSkillFilter('Capital Shield Emission Systems'), 'shieldBonus',
                                       src.getModifiedItemAttr('shipBonusForceAuxiliaryG1'), skill='Gallente Carrier', **kwargs)
 
 
@@ -33651,17 +33615,17 @@ class Effect6987(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Repair Drone Operation'),
+        fit.drones.filteredItemBoost(ItemSkillFilter('Repair Drone Operation'),
                                         'structureDamageAmount', src.getModifiedItemAttr('shipBonusRole2'), **kwargs)
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Repair Drone Operation'),
+        fit.drones.filteredItemBoost(ItemSkillFilter('Repair Drone Operation'),
                                         'shieldBonus', src.getModifiedItemAttr('shipBonusRole2'), **kwargs)
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Repair Drone Operation'),
+        fit.drones.filteredItemBoost(ItemSkillFilter('Repair Drone Operation'),
                                         'armorDamageAmount', src.getModifiedItemAttr('shipBonusRole2'), **kwargs)
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Repair Drone Operation'),
+        fit.drones.filteredItemBoost(ItemSkillFilter('Repair Drone Operation'),
                                         'armorHP', src.getModifiedItemAttr('shipBonusRole2'), **kwargs)
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Repair Drone Operation'),
+        fit.drones.filteredItemBoost(ItemSkillFilter('Repair Drone Operation'),
                                         'shieldCapacity', src.getModifiedItemAttr('shipBonusRole2'), **kwargs)
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Repair Drone Operation'),
+        fit.drones.filteredItemBoost(ItemSkillFilter('Repair Drone Operation'),
                                         'hp', src.getModifiedItemAttr('shipBonusRole2'), **kwargs)
 
 
@@ -33677,7 +33641,7 @@ class Effect6992(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Hybrid Turret'), 'damageMultiplier', src.getModifiedItemAttr('shipBonusRole1'), **kwargs)
+        fit.modules.filteredItemBoost(ItemSkillFilter('Medium Hybrid Turret'), 'damageMultiplier', src.getModifiedItemAttr('shipBonusRole1'), **kwargs)
 
 
 class Effect6993(BaseEffect):
@@ -33693,18 +33657,18 @@ class Effect6993(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.boosters.filteredItemBoost(lambda mod: mod.item.group.name == 'Booster', 'boosterMissileAOECloudPenalty', src.getModifiedItemAttr('shipBonusRole2'), **kwargs)
-        fit.boosters.filteredItemBoost(lambda mod: mod.item.group.name == 'Booster', 'boosterCapacitorCapacityPenalty', src.getModifiedItemAttr('shipBonusRole2'), **kwargs)
-        fit.boosters.filteredItemBoost(lambda mod: mod.item.group.name == 'Booster', 'boosterAOEVelocityPenalty', src.getModifiedItemAttr('shipBonusRole2'), **kwargs)
-        fit.boosters.filteredItemBoost(lambda mod: mod.item.group.name == 'Booster', 'boosterArmorRepairAmountPenalty', src.getModifiedItemAttr('shipBonusRole2'), **kwargs)
-        fit.boosters.filteredItemBoost(lambda mod: mod.item.group.name == 'Booster', 'boosterMissileVelocityPenalty', src.getModifiedItemAttr('shipBonusRole2'), **kwargs)
-        fit.boosters.filteredItemBoost(lambda mod: mod.item.group.name == 'Booster', 'boosterTurretTrackingPenalty', src.getModifiedItemAttr('shipBonusRole2'), **kwargs)
-        fit.boosters.filteredItemBoost(lambda mod: mod.item.group.name == 'Booster', 'boosterShieldCapacityPenalty', src.getModifiedItemAttr('shipBonusRole2'), **kwargs)
-        fit.boosters.filteredItemBoost(lambda mod: mod.item.group.name == 'Booster', 'boosterTurretOptimalRangePenalty', src.getModifiedItemAttr('shipBonusRole2'), **kwargs)
-        fit.boosters.filteredItemBoost(lambda mod: mod.item.group.name == 'Booster', 'boosterShieldBoostAmountPenalty', src.getModifiedItemAttr('shipBonusRole2'), **kwargs)
-        fit.boosters.filteredItemBoost(lambda mod: mod.item.group.name == 'Booster', 'boosterTurretFalloffPenalty', src.getModifiedItemAttr('shipBonusRole2'), **kwargs)
-        fit.boosters.filteredItemBoost(lambda mod: mod.item.group.name == 'Booster', 'boosterArmorHPPenalty', src.getModifiedItemAttr('shipBonusRole2'), **kwargs)
-        fit.boosters.filteredItemBoost(lambda mod: mod.item.group.name == 'Booster', 'boosterMaxVelocityPenalty', src.getModifiedItemAttr('shipBonusRole2'), **kwargs)
+        fit.boosters.filteredItemBoost(ItemGroupFilter('Booster'), 'boosterMissileAOECloudPenalty', src.getModifiedItemAttr('shipBonusRole2'), **kwargs)
+        fit.boosters.filteredItemBoost(ItemGroupFilter('Booster'), 'boosterCapacitorCapacityPenalty', src.getModifiedItemAttr('shipBonusRole2'), **kwargs)
+        fit.boosters.filteredItemBoost(ItemGroupFilter('Booster'), 'boosterAOEVelocityPenalty', src.getModifiedItemAttr('shipBonusRole2'), **kwargs)
+        fit.boosters.filteredItemBoost(ItemGroupFilter('Booster'), 'boosterArmorRepairAmountPenalty', src.getModifiedItemAttr('shipBonusRole2'), **kwargs)
+        fit.boosters.filteredItemBoost(ItemGroupFilter('Booster'), 'boosterMissileVelocityPenalty', src.getModifiedItemAttr('shipBonusRole2'), **kwargs)
+        fit.boosters.filteredItemBoost(ItemGroupFilter('Booster'), 'boosterTurretTrackingPenalty', src.getModifiedItemAttr('shipBonusRole2'), **kwargs)
+        fit.boosters.filteredItemBoost(ItemGroupFilter('Booster'), 'boosterShieldCapacityPenalty', src.getModifiedItemAttr('shipBonusRole2'), **kwargs)
+        fit.boosters.filteredItemBoost(ItemGroupFilter('Booster'), 'boosterTurretOptimalRangePenalty', src.getModifiedItemAttr('shipBonusRole2'), **kwargs)
+        fit.boosters.filteredItemBoost(ItemGroupFilter('Booster'), 'boosterShieldBoostAmountPenalty', src.getModifiedItemAttr('shipBonusRole2'), **kwargs)
+        fit.boosters.filteredItemBoost(ItemGroupFilter('Booster'), 'boosterTurretFalloffPenalty', src.getModifiedItemAttr('shipBonusRole2'), **kwargs)
+        fit.boosters.filteredItemBoost(ItemGroupFilter('Booster'), 'boosterArmorHPPenalty', src.getModifiedItemAttr('shipBonusRole2'), **kwargs)
+        fit.boosters.filteredItemBoost(ItemGroupFilter('Booster'), 'boosterMaxVelocityPenalty', src.getModifiedItemAttr('shipBonusRole2'), **kwargs)
 
 
 class Effect6994(BaseEffect):
@@ -33719,7 +33683,7 @@ class Effect6994(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Hybrid Turret'), 'damageMultiplier',
+        fit.modules.filteredItemBoost(ItemSkillFilter('Medium Hybrid Turret'), 'damageMultiplier',
                                       src.getModifiedItemAttr('eliteBonusReconShip1'), skill='Recon Ships', **kwargs)
 
 
@@ -33751,7 +33715,7 @@ class Effect6996(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Repair Systems'), 'armorDamageAmount',
+        fit.modules.filteredItemBoost(ItemSkillFilter('Repair Systems'), 'armorDamageAmount',
                                       src.getModifiedItemAttr('eliteBonusReconShip3'), skill='Recon Ships', **kwargs)
 
 
@@ -33767,7 +33731,7 @@ class Effect6997(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Repair Systems'), 'armorDamageAmount',
+        fit.modules.filteredItemBoost(ItemSkillFilter('Repair Systems'), 'armorDamageAmount',
                                       src.getModifiedItemAttr('eliteBonusCovertOps4'), skill='Covert Ops', **kwargs)
 
 
@@ -33783,7 +33747,7 @@ class Effect6999(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemMultiply(lambda mod: mod.item.group.name == 'Missile Launcher Torpedo',
+        fit.modules.filteredItemMultiply(ItemGroupFilter('Missile Launcher Torpedo'),
                                          'cpu', ship.getModifiedItemAttr('stealthBomberLauncherCPU'), **kwargs)
 
 
@@ -33799,7 +33763,7 @@ class Effect7000(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Hybrid Turret'), 'falloff',
+        fit.modules.filteredItemBoost(ItemSkillFilter('Small Hybrid Turret'), 'falloff',
                                       src.getModifiedItemAttr('shipBonusGF'), skill='Gallente Frigate', **kwargs)
 
 
@@ -33815,7 +33779,7 @@ class Effect7001(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Missile Launcher Torpedo', 'speed', src.getModifiedItemAttr('shipBonusRole1'), **kwargs)
+        fit.modules.filteredItemBoost(ItemGroupFilter('Missile Launcher Torpedo'), 'speed', src.getModifiedItemAttr('shipBonusRole1'), **kwargs)
 
 
 class Effect7002(BaseEffect):
@@ -33830,8 +33794,8 @@ class Effect7002(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Bomb Deployment'), 'power', src.getModifiedItemAttr('shipBonusRole3'), **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Bomb Deployment'), 'cpu', src.getModifiedItemAttr('shipBonusRole3'), **kwargs)
+        fit.modules.filteredItemBoost(ItemSkillFilter('Bomb Deployment'), 'power', src.getModifiedItemAttr('shipBonusRole3'), **kwargs)
+        fit.modules.filteredItemBoost(ItemSkillFilter('Bomb Deployment'), 'cpu', src.getModifiedItemAttr('shipBonusRole3'), **kwargs)
 
 
 class Effect7003(BaseEffect):
@@ -33846,7 +33810,7 @@ class Effect7003(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Hybrid Turret'), 'damageMultiplier',
+        fit.modules.filteredItemBoost(ItemSkillFilter('Small Hybrid Turret'), 'damageMultiplier',
                                       src.getModifiedItemAttr('eliteBonusCovertOps3'), skill='Covert Ops', **kwargs)
 
 
@@ -33919,7 +33883,7 @@ class Effect7013(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'), 'kineticDamage',
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Missile Launcher Operation'), 'kineticDamage',
                                         src.getModifiedItemAttr('eliteBonusGunship1'), skill='Assault Frigates', **kwargs)
 
 
@@ -33935,7 +33899,7 @@ class Effect7014(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'), 'thermalDamage',
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Missile Launcher Operation'), 'thermalDamage',
                                         src.getModifiedItemAttr('eliteBonusGunship1'), skill='Assault Frigates', **kwargs)
 
 
@@ -33951,7 +33915,7 @@ class Effect7015(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'), 'emDamage',
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Missile Launcher Operation'), 'emDamage',
                                         src.getModifiedItemAttr('eliteBonusGunship1'), skill='Assault Frigates', **kwargs)
 
 
@@ -33967,7 +33931,7 @@ class Effect7016(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'), 'explosiveDamage',
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Missile Launcher Operation'), 'explosiveDamage',
                                         src.getModifiedItemAttr('eliteBonusGunship1'), skill='Assault Frigates', **kwargs)
 
 
@@ -33983,7 +33947,7 @@ class Effect7017(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'), 'aoeVelocity',
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Missile Launcher Operation'), 'aoeVelocity',
                                         src.getModifiedItemAttr('eliteBonusGunship2'), stackingPenalties=True, skill='Assault Frigates', **kwargs)
 
 
@@ -33999,7 +33963,7 @@ class Effect7018(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Energy Turret'), 'speed',
+        fit.modules.filteredItemBoost(ItemSkillFilter('Small Energy Turret'), 'speed',
                                       src.getModifiedItemAttr('shipBonusAF'), stackingPenalties=False, skill='Amarr Frigate', **kwargs)
 
 
@@ -34016,7 +33980,7 @@ class Effect7020(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Stasis Web', 'maxRange',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Stasis Web'), 'maxRange',
                                       src.getModifiedItemAttr('stasisWebRangeBonus'), stackingPenalties=False, **kwargs)
 
 
@@ -34049,7 +34013,7 @@ class Effect7024(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'), 'trackingSpeed',
+        fit.drones.filteredItemBoost(ItemSkillFilter('Drones'), 'trackingSpeed',
                                      src.getModifiedItemAttr('eliteBonusGunship2'), skill='Assault Frigates', **kwargs)
 
 
@@ -34129,11 +34093,11 @@ class Effect7030(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Structure Guided Bomb Launcher',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Structure Guided Bomb Launcher'),
                                       'speed', ship.getModifiedItemAttr('structureAoERoFRoleBonus'), **kwargs)
         for attr in ['duration', 'durationTargetIlluminationBurstProjector', 'durationWeaponDisruptionBurstProjector',
                      'durationECMJammerBurstProjector', 'durationSensorDampeningBurstProjector', 'capacitorNeed']:
-            fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Structure Burst Projector',
+            fit.modules.filteredItemBoost(ItemGroupFilter('Structure Burst Projector'),
                                           attr, ship.getModifiedItemAttr('structureAoERoFRoleBonus'), **kwargs)
 
 
@@ -34149,7 +34113,7 @@ class Effect7031(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'), 'kineticDamage',
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Heavy Missiles'), 'kineticDamage',
                                         src.getModifiedItemAttr('shipBonusCBC2'), skill='Caldari Battlecruiser', **kwargs)
 
 
@@ -34165,7 +34129,7 @@ class Effect7032(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'), 'thermalDamage',
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Heavy Missiles'), 'thermalDamage',
                                         src.getModifiedItemAttr('shipBonusCBC2'), skill='Caldari Battlecruiser', **kwargs)
 
 
@@ -34181,7 +34145,7 @@ class Effect7033(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Heavy Missiles'),
                                         'emDamage', src.getModifiedItemAttr('shipBonusCBC2'), skill='Caldari Battlecruiser', **kwargs)
 
 
@@ -34197,7 +34161,7 @@ class Effect7034(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'), 'explosiveDamage',
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Heavy Missiles'), 'explosiveDamage',
                                         src.getModifiedItemAttr('shipBonusCBC2'), skill='Caldari Battlecruiser', **kwargs)
 
 
@@ -34213,7 +34177,7 @@ class Effect7035(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Assault Missiles'), 'explosiveDamage',
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Heavy Assault Missiles'), 'explosiveDamage',
                                         src.getModifiedItemAttr('shipBonusCBC2'), skill='Caldari Battlecruiser', **kwargs)
 
 
@@ -34229,7 +34193,7 @@ class Effect7036(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Assault Missiles'), 'emDamage',
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Heavy Assault Missiles'), 'emDamage',
                                         src.getModifiedItemAttr('shipBonusCBC2'), skill='Caldari Battlecruiser', **kwargs)
 
 
@@ -34245,7 +34209,7 @@ class Effect7037(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Assault Missiles'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Heavy Assault Missiles'),
                                         'thermalDamage', src.getModifiedItemAttr('shipBonusCBC2'), skill='Caldari Battlecruiser', **kwargs)
 
 
@@ -34261,7 +34225,7 @@ class Effect7038(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Assault Missiles'),
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Heavy Assault Missiles'),
                                         'kineticDamage', src.getModifiedItemAttr('shipBonusCBC2'), skill='Caldari Battlecruiser', **kwargs)
 
 
@@ -34279,7 +34243,7 @@ class Effect7039(BaseEffect):
     def handler(fit, src, context, **kwargs):
         groups = ('Structure Anti-Subcapital Missile', 'Structure Anti-Capital Missile')
         for dmgType in ('em', 'kinetic', 'explosive', 'thermal'):
-            fit.modules.filteredChargeMultiply(lambda mod: mod.item.group.name in groups,
+            fit.modules.filteredChargeMultiply(ItemGroupFilter(*groups),
                                                '%sDamage' % dmgType,
                                                src.getModifiedItemAttr('hiddenMissileDamageMultiplier'), **kwargs)
 
@@ -34397,14 +34361,14 @@ class Effect7047(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name in ('Propulsion Module', 'Micro Jump Drive'),
+        fit.modules.filteredItemBoost(ItemGroupFilter('Propulsion Module', 'Micro Jump Drive'),
                                       'power', src.getModifiedItemAttr('flagCruiserFittingBonusPropMods'), **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name in ('Propulsion Module', 'Micro Jump Drive'),
+        fit.modules.filteredItemBoost(ItemGroupFilter('Propulsion Module', 'Micro Jump Drive'),
                                       'cpu', src.getModifiedItemAttr('flagCruiserFittingBonusPropMods'), **kwargs)
 
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name in ('Target Painter', 'Scan Probe Launcher'),
+        fit.modules.filteredItemBoost(ItemGroupFilter('Target Painter', 'Scan Probe Launcher'),
                                       'cpu', src.getModifiedItemAttr('flagCruiserFittingBonusPainterProbes'), **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name in ('Target Painter', 'Scan Probe Launcher'),
+        fit.modules.filteredItemBoost(ItemGroupFilter('Target Painter', 'Scan Probe Launcher'),
                                       'power', src.getModifiedItemAttr('flagCruiserFittingBonusPainterProbes'), **kwargs)
 
 
@@ -34464,9 +34428,9 @@ class Effect7052(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Target Painter', 'signatureRadiusBonus',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Target Painter'), 'signatureRadiusBonus',
                                       src.getModifiedItemAttr('targetPainterStrengthModifierFlagCruisers'), **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Target Painter', 'maxRange',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Target Painter'), 'maxRange',
                                       src.getModifiedItemAttr('targetPainterRangeModifierFlagCruisers'), **kwargs)
 
 
@@ -34482,35 +34446,35 @@ class Effect7055(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Hybrid Turret'), 'damageMultiplier',
+        fit.modules.filteredItemBoost(ItemSkillFilter('Large Hybrid Turret'), 'damageMultiplier',
                                       src.getModifiedItemAttr('shipBonusRole7'), **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Projectile Turret'), 'damageMultiplier',
+        fit.modules.filteredItemBoost(ItemSkillFilter('Large Projectile Turret'), 'damageMultiplier',
                                       src.getModifiedItemAttr('shipBonusRole7'), **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Energy Turret'), 'damageMultiplier',
+        fit.modules.filteredItemBoost(ItemSkillFilter('Large Energy Turret'), 'damageMultiplier',
                                       src.getModifiedItemAttr('shipBonusRole7'), **kwargs)
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'), 'thermalDamage',
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Heavy Missiles'), 'thermalDamage',
                                         src.getModifiedItemAttr('shipBonusRole7'), **kwargs)
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'), 'emDamage',
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Heavy Missiles'), 'emDamage',
                                         src.getModifiedItemAttr('shipBonusRole7'), **kwargs)
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'), 'kineticDamage',
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Heavy Missiles'), 'kineticDamage',
                                         src.getModifiedItemAttr('shipBonusRole7'), **kwargs)
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'), 'explosiveDamage',
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Heavy Missiles'), 'explosiveDamage',
                                         src.getModifiedItemAttr('shipBonusRole7'), **kwargs)
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Torpedoes'), 'emDamage',
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Torpedoes'), 'emDamage',
                                         src.getModifiedItemAttr('shipBonusRole7'), **kwargs)
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Torpedoes'), 'kineticDamage',
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Torpedoes'), 'kineticDamage',
                                         src.getModifiedItemAttr('shipBonusRole7'), **kwargs)
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Torpedoes'), 'explosiveDamage',
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Torpedoes'), 'explosiveDamage',
                                         src.getModifiedItemAttr('shipBonusRole7'), **kwargs)
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Torpedoes'), 'thermalDamage',
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Torpedoes'), 'thermalDamage',
                                         src.getModifiedItemAttr('shipBonusRole7'), **kwargs)
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Cruise Missiles'), 'thermalDamage',
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Cruise Missiles'), 'thermalDamage',
                                         src.getModifiedItemAttr('shipBonusRole7'), **kwargs)
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Cruise Missiles'), 'explosiveDamage',
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Cruise Missiles'), 'explosiveDamage',
                                         src.getModifiedItemAttr('shipBonusRole7'), **kwargs)
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Cruise Missiles'), 'kineticDamage',
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Cruise Missiles'), 'kineticDamage',
                                         src.getModifiedItemAttr('shipBonusRole7'), **kwargs)
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Cruise Missiles'), 'emDamage',
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Cruise Missiles'), 'emDamage',
                                         src.getModifiedItemAttr('shipBonusRole7'), **kwargs)
 
 
@@ -34681,7 +34645,7 @@ class Effect7071(BaseEffect):
     @staticmethod
     def handler(fit, container, context, **kwargs):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Precursor Weapon'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Small Precursor Weapon'),
                                       'damageMultiplier', container.getModifiedItemAttr('damageMultiplierBonus') * level, **kwargs)
 
 
@@ -34698,7 +34662,7 @@ class Effect7072(BaseEffect):
     @staticmethod
     def handler(fit, container, context, **kwargs):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Precursor Weapon'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Medium Precursor Weapon'),
                                       'damageMultiplier', container.getModifiedItemAttr('damageMultiplierBonus') * level, **kwargs)
 
 
@@ -34715,7 +34679,7 @@ class Effect7073(BaseEffect):
     @staticmethod
     def handler(fit, container, context, **kwargs):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Precursor Weapon'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Large Precursor Weapon'),
                                       'damageMultiplier', container.getModifiedItemAttr('damageMultiplierBonus') * level, **kwargs)
 
 
@@ -34732,7 +34696,7 @@ class Effect7074(BaseEffect):
     @staticmethod
     def handler(fit, container, context, **kwargs):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Disintegrator Specialization'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Small Disintegrator Specialization'),
                                       'damageMultiplier', container.getModifiedItemAttr('damageMultiplierBonus') * level, **kwargs)
 
 
@@ -34749,7 +34713,7 @@ class Effect7075(BaseEffect):
     @staticmethod
     def handler(fit, container, context, **kwargs):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Disintegrator Specialization'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Medium Disintegrator Specialization'),
                                       'damageMultiplier', container.getModifiedItemAttr('damageMultiplierBonus') * level, **kwargs)
 
 
@@ -34766,7 +34730,7 @@ class Effect7076(BaseEffect):
     @staticmethod
     def handler(fit, container, context, **kwargs):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Disintegrator Specialization'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Large Disintegrator Specialization'),
                                       'damageMultiplier', container.getModifiedItemAttr('damageMultiplierBonus') * level, **kwargs)
 
 
@@ -34782,7 +34746,7 @@ class Effect7077(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, **kwargs):
-        fit.modules.filteredItemMultiply(lambda mod: mod.item.group.name == 'Precursor Weapon',
+        fit.modules.filteredItemMultiply(ItemGroupFilter('Precursor Weapon'),
                                          'damageMultiplier', module.getModifiedItemAttr('damageMultiplier'),
                                          stackingPenalties=True, **kwargs)
 
@@ -34799,7 +34763,7 @@ class Effect7078(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, **kwargs):
-        fit.modules.filteredItemMultiply(lambda mod: mod.item.group.name == 'Precursor Weapon',
+        fit.modules.filteredItemMultiply(ItemGroupFilter('Precursor Weapon'),
                                          'speed', module.getModifiedItemAttr('speedMultiplier'),
                                          stackingPenalties=True, **kwargs)
 
@@ -34816,7 +34780,7 @@ class Effect7079(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Precursor Weapon'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Large Precursor Weapon'),
                                       'speed', ship.getModifiedItemAttr('shipBonusPBS1'), skill='Precursor Battleship', **kwargs)
 
 
@@ -34832,7 +34796,7 @@ class Effect7080(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Precursor Weapon'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Large Precursor Weapon'),
                                       'damageMultiplier', ship.getModifiedItemAttr('shipBonusPBS2'), skill='Precursor Battleship', **kwargs)
 
 
@@ -34849,7 +34813,7 @@ class Effect7085(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Precursor Weapon'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Medium Precursor Weapon'),
                                       'damageMultiplier', ship.getModifiedItemAttr('shipBonusPC1'), skill='Precursor Cruiser', **kwargs)
 
 
@@ -34866,7 +34830,7 @@ class Effect7086(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Precursor Weapon'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Medium Precursor Weapon'),
                                       'trackingSpeed', ship.getModifiedItemAttr('shipBonusPC2'), skill='Precursor Cruiser', **kwargs)
 
 
@@ -34882,7 +34846,7 @@ class Effect7087(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Precursor Weapon'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Small Precursor Weapon'),
                                       'maxRange', ship.getModifiedItemAttr('shipBonusPF2'), skill='Precursor Frigate', **kwargs)
 
 
@@ -34899,7 +34863,7 @@ class Effect7088(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Precursor Weapon'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Small Precursor Weapon'),
                                       'damageMultiplier', ship.getModifiedItemAttr('shipBonusPF1'), skill='Precursor Frigate', **kwargs)
 
 
@@ -34915,7 +34879,7 @@ class Effect7091(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capacitor Emission Systems'), 'capacitorNeed', src.getModifiedItemAttr('shipBonusRole2'), **kwargs)
+        fit.modules.filteredItemBoost(ItemSkillFilter('Capacitor Emission Systems'), 'capacitorNeed', src.getModifiedItemAttr('shipBonusRole2'), **kwargs)
 
 
 class Effect7092(BaseEffect):
@@ -34936,7 +34900,7 @@ class Effect7092(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Remote Armor Repair Systems'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Remote Armor Repair Systems'),
                                       'capacitorNeed', ship.getModifiedItemAttr('shipBonusRole2'), **kwargs)
 
 
@@ -34959,7 +34923,7 @@ class Effect7093(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Energy Pulse Weapons'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Energy Pulse Weapons'),
                                       'capacitorNeed', ship.getModifiedItemAttr('shipBonusRole2'), **kwargs)
 
 
@@ -34981,7 +34945,7 @@ class Effect7094(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Remote Armor Repair Systems'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Remote Armor Repair Systems'),
                                       'maxRange', ship.getModifiedItemAttr('shipBonusRole1'), **kwargs)
 
 
@@ -34997,7 +34961,7 @@ class Effect7097(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Precursor Weapon',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Precursor Weapon'),
                                       'damageMultiplier', skill.getModifiedItemAttr('damageMultiplierBonus') * skill.level, **kwargs)
 
 
@@ -35014,7 +34978,7 @@ class Effect7111(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, **kwargs):
-        fit.modules.filteredItemMultiply(lambda mod: mod.item.requiresSkill('Small Precursor Weapon'),
+        fit.modules.filteredItemMultiply(ItemSkillFilter('Small Precursor Weapon'),
                                          'damageMultiplier', module.getModifiedItemAttr('smallWeaponDamageMultiplier'),
                                          stackingPenalties=True, **kwargs)
 
@@ -35037,7 +35001,7 @@ class Effect7112(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Neutralizer', 'capacitorNeed',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Energy Neutralizer'), 'capacitorNeed',
                                       src.getModifiedItemAttr('shipBonusRole2'), **kwargs)
 
 
@@ -35053,7 +35017,7 @@ class Effect7116(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Astrometrics'), 'baseSensorStrength',
+        fit.modules.filteredChargeBoost(ChargeSkillFilter('Astrometrics'), 'baseSensorStrength',
                                         src.getModifiedItemAttr('eliteBonusReconShip2'), skill='Recon Ships', **kwargs)
 
 
@@ -35088,7 +35052,7 @@ class Effect7118(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemIncrease(lambda mod: mod.item.requiresSkill('Small Precursor Weapon'), 'damageMultiplierBonusPerCycle',
+        fit.modules.filteredItemIncrease(ItemSkillFilter('Small Precursor Weapon'), 'damageMultiplierBonusPerCycle',
                                          src.getModifiedItemAttr('eliteBonusCovertOps3'), skill='Covert Ops', **kwargs)
 
 
@@ -35104,7 +35068,7 @@ class Effect7119(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemIncrease(lambda mod: mod.item.requiresSkill('Medium Precursor Weapon'), 'damageMultiplierBonusPerCycle',
+        fit.modules.filteredItemIncrease(ItemSkillFilter('Medium Precursor Weapon'), 'damageMultiplierBonusPerCycle',
                                          src.getModifiedItemAttr('eliteBonusReconShip3'), skill='Recon Ships', **kwargs)
 
 
@@ -35122,11 +35086,11 @@ class Effect7142(BaseEffect):
     def handler(fit, src, context, **kwargs):
         fit.ship.increaseItemAttr('warpScrambleStatus', src.getModifiedItemAttr('warpScrambleStrength'), **kwargs)
         fit.ship.boostItemAttr('mass', src.getModifiedItemAttr('massBonusPercentage'), stackingPenalties=True, **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Afterburner'), 'speedFactor',
+        fit.modules.filteredItemBoost(ItemSkillFilter('Afterburner'), 'speedFactor',
                                       src.getModifiedItemAttr('speedFactorBonus'), stackingPenalties=True, **kwargs)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Afterburner'), 'speedBoostFactor',
+        fit.modules.filteredItemBoost(ItemSkillFilter('Afterburner'), 'speedBoostFactor',
                                       src.getModifiedItemAttr('speedBoostFactorBonus'), **kwargs)
-        fit.modules.filteredItemIncrease(lambda mod: mod.item.requiresSkill('High Speed Maneuvering'), 'activationBlocked',
+        fit.modules.filteredItemIncrease(ItemSkillFilter('High Speed Maneuvering'), 'activationBlocked',
                                          src.getModifiedItemAttr('activationBlockedStrenght'), **kwargs)
         fit.ship.boostItemAttr('maxVelocity', src.getModifiedItemAttr('maxVelocityBonus'), stackingPenalties=True, **kwargs)
 
@@ -35143,7 +35107,7 @@ class Effect7154(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Precursor Weapon'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Small Precursor Weapon'),
                                       'damageMultiplier', ship.getModifiedItemAttr('shipBonusPD1'),
                                       skill='Precursor Destroyer', **kwargs)
 
@@ -35160,7 +35124,7 @@ class Effect7155(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Precursor Weapon'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Medium Precursor Weapon'),
                                       'damageMultiplier', ship.getModifiedItemAttr('shipBonusPBC1'),
                                       skill='Precursor Battlecruiser', **kwargs)
 
@@ -35177,7 +35141,7 @@ class Effect7156(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Precursor Weapon'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Small Precursor Weapon'),
                                       'maxRange', ship.getModifiedItemAttr('maxRangeBonus'), **kwargs)
 
 
@@ -35193,7 +35157,7 @@ class Effect7157(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Precursor Weapon'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Small Precursor Weapon'),
                                       'maxRange', ship.getModifiedItemAttr('shipBonusPD2'),
                                       skill='Precursor Destroyer', **kwargs)
 
@@ -35274,7 +35238,7 @@ class Effect7162(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Precursor Weapon'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Medium Precursor Weapon'),
                                       'maxRange', ship.getModifiedItemAttr('roleBonusCBC'), **kwargs)
 
 
@@ -35318,7 +35282,7 @@ class Effect7167(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Remote Capacitor Transmitter', 'maxRange', src.getModifiedItemAttr('shipBonusRole1'), **kwargs)
+        fit.modules.filteredItemBoost(ItemGroupFilter('Remote Capacitor Transmitter'), 'maxRange', src.getModifiedItemAttr('shipBonusRole1'), **kwargs)
 
 
 class Effect7168(BaseEffect):
@@ -35333,7 +35297,7 @@ class Effect7168(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Mutadaptive Remote Armor Repairer', 'maxRange', src.getModifiedItemAttr('shipBonusRole3'), **kwargs)
+        fit.modules.filteredItemBoost(ItemGroupFilter('Mutadaptive Remote Armor Repairer'), 'maxRange', src.getModifiedItemAttr('shipBonusRole3'), **kwargs)
 
 
 class Effect7169(BaseEffect):
@@ -35348,7 +35312,8 @@ class Effect7169(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Mutadaptive Remote Armor Repairer', 'armorDamageAmount', src.getModifiedItemAttr('shipBonusPC1'), skill='Precursor Cruiser', **kwargs)
+        fit.modules.filteredItemBoost(ItemGroupFilter('Mutadaptive Remote Armor Repairer'),
+                                      'armorDamageAmount', src.getModifiedItemAttr('shipBonusPC1'), skill='Precursor Cruiser', **kwargs)
 
 
 class Effect7170(BaseEffect):
@@ -35363,7 +35328,8 @@ class Effect7170(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Mutadaptive Remote Armor Repairer', 'capacitorNeed', src.getModifiedItemAttr('shipBonusPC2'), skill='Precursor Cruiser', **kwargs)
+        fit.modules.filteredItemBoost(ItemGroupFilter('Mutadaptive Remote Armor Repairer'),
+                                      'capacitorNeed', src.getModifiedItemAttr('shipBonusPC2'), skill='Precursor Cruiser', **kwargs)
 
 
 class Effect7171(BaseEffect):
@@ -35378,7 +35344,8 @@ class Effect7171(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Mutadaptive Remote Armor Repairer', 'maxRange', src.getModifiedItemAttr('shipBonusPC1'), skill='Precursor Cruiser', **kwargs)
+        fit.modules.filteredItemBoost(ItemGroupFilter('Mutadaptive Remote Armor Repairer'),
+                                      'maxRange', src.getModifiedItemAttr('shipBonusPC1'), skill='Precursor Cruiser', **kwargs)
 
 
 class Effect7172(BaseEffect):
@@ -35393,7 +35360,8 @@ class Effect7172(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Mutadaptive Remote Armor Repairer', 'capacitorNeed', src.getModifiedItemAttr('eliteBonusLogistics1'), skill='Logistics Cruisers', **kwargs)
+        fit.modules.filteredItemBoost(ItemGroupFilter('Mutadaptive Remote Armor Repairer'),
+                                      'capacitorNeed', src.getModifiedItemAttr('eliteBonusLogistics1'), skill='Logistics Cruisers', **kwargs)
 
 
 class Effect7173(BaseEffect):
@@ -35408,7 +35376,8 @@ class Effect7173(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Mutadaptive Remote Armor Repairer', 'armorDamageAmount', src.getModifiedItemAttr('eliteBonusLogistics2'), skill='Logistics Cruisers', **kwargs)
+        fit.modules.filteredItemBoost(ItemGroupFilter('Mutadaptive Remote Armor Repairer'),
+                                      'armorDamageAmount', src.getModifiedItemAttr('eliteBonusLogistics2'), skill='Logistics Cruisers', **kwargs)
 
 
 class Effect7176(BaseEffect):
@@ -35424,7 +35393,7 @@ class Effect7176(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'), 'damageMultiplier',
+        fit.drones.filteredItemBoost(ItemSkillFilter('Drones'), 'damageMultiplier',
                                      src.getModifiedItemAttr('damageMultiplierBonus'), **kwargs)
 
 
@@ -35440,11 +35409,11 @@ class Effect7177(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'), 'hp',
+        fit.drones.filteredItemBoost(ItemSkillFilter('Drones'), 'hp',
                                      src.getModifiedItemAttr('hullHpBonus'))
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'), 'armorHP',
+        fit.drones.filteredItemBoost(ItemSkillFilter('Drones'), 'armorHP',
                                      src.getModifiedItemAttr('armorHpBonus'))
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'), 'shieldCapacity',
+        fit.drones.filteredItemBoost(ItemSkillFilter('Drones'), 'shieldCapacity',
                                      src.getModifiedItemAttr('shieldCapacityBonus'), **kwargs)
 
 
@@ -35460,7 +35429,7 @@ class Effect7179(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Strip Miner',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Strip Miner'),
                                       'duration', module.getModifiedItemAttr('miningDurationMultiplier'), **kwargs)
 
 
@@ -35476,7 +35445,7 @@ class Effect7180(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Mining Laser',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Mining Laser'),
                                       'duration', module.getModifiedItemAttr('miningDurationMultiplier'), **kwargs)
 
 
@@ -35492,7 +35461,7 @@ class Effect7183(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Warp Scrambler',
+        fit.modules.filteredItemBoost(ItemGroupFilter('Warp Scrambler'),
                                       'maxRange', src.getModifiedItemAttr('warpScrambleRangeBonus'),
                                       stackingPenalties=False, **kwargs)
 
@@ -35509,7 +35478,7 @@ class Effect7184(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Medium Drone Operation'),
+        fit.drones.filteredItemBoost(ItemSkillFilter('Medium Drone Operation'),
                                      'hp', ship.getModifiedItemAttr('shipBonusRole8'), **kwargs)
 
 
@@ -35525,7 +35494,7 @@ class Effect7185(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Medium Drone Operation'),
+        fit.drones.filteredItemBoost(ItemSkillFilter('Medium Drone Operation'),
                                      'shieldCapacity', ship.getModifiedItemAttr('shipBonusRole8'), **kwargs)
 
 
@@ -35541,7 +35510,7 @@ class Effect7186(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Medium Drone Operation'),
+        fit.drones.filteredItemBoost(ItemSkillFilter('Medium Drone Operation'),
                                      'armorHP', ship.getModifiedItemAttr('shipBonusRole8'), **kwargs)
 
 
@@ -35558,7 +35527,7 @@ class Effect7193(BaseEffect):
 
     @staticmethod
     def handler(fit, beacon, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Mining'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Mining'),
                                       'duration', beacon.getModifiedItemAttr('miningDurationMultiplier'), **kwargs)
 
 
@@ -35575,7 +35544,7 @@ class Effect7202(BaseEffect):
 
     @staticmethod
     def handler(fit, beacon, context, **kwargs):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+        fit.drones.filteredItemBoost(ItemSkillFilter('Drones'),
                                      'maxVelocity', beacon.getModifiedItemAttr('droneMaxVelocityBonus'),
                                      stackingPenalties=True, **kwargs)
 
@@ -35593,7 +35562,7 @@ class Effect7203(BaseEffect):
 
     @staticmethod
     def handler(fit, beacon, context, **kwargs):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+        fit.drones.filteredItemBoost(ItemSkillFilter('Drones'),
                                      'damageMultiplier', beacon.getModifiedItemAttr('droneDamageBonus'),
                                      stackingPenalties=True, **kwargs)
 
@@ -35670,7 +35639,7 @@ class Effect7209(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Precursor Weapon'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Small Precursor Weapon'),
                                       'maxRange', ship.getModifiedItemAttr('eliteBonusGunship2'),
                                       skill='Assault Frigates', **kwargs)
 
@@ -35687,7 +35656,7 @@ class Effect7210(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Defender Missiles'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Defender Missiles'),
                                       'moduleReactivationDelay', ship.getModifiedItemAttr('shipBonusRole2'), **kwargs)
 
 
@@ -35703,7 +35672,7 @@ class Effect7211(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Precursor Weapon'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Medium Precursor Weapon'),
                                       'damageMultiplierBonusMax', ship.getModifiedItemAttr('eliteBonusHeavyGunship1'),
                                       skill='Heavy Assault Cruisers', **kwargs)
 
@@ -35720,7 +35689,7 @@ class Effect7216(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Precursor Weapon'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Small Precursor Weapon'),
                                       'damageMultiplierBonusMax', ship.getModifiedItemAttr('eliteBonusGunship1'),
                                       skill='Assault Frigates', **kwargs)
 
@@ -35769,7 +35738,7 @@ class Effect7228(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Precursor Weapon'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Medium Precursor Weapon'),
                                       'maxRange', ship.getModifiedItemAttr('eliteBonusHeavyGunship2'),
                                       skill='Heavy Assault Cruisers', **kwargs)
 
@@ -35786,7 +35755,7 @@ class Effect7230(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'),
+        fit.drones.filteredItemBoost(ItemSkillFilter('Drones'),
                                      'trackingSpeed', ship.getModifiedItemAttr('shipBonusGC2'),
                                      skill='Gallente Cruiser', **kwargs)
 
@@ -35803,6 +35772,6 @@ class Effect7231(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context, **kwargs):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Repair Systems'),
+        fit.modules.filteredItemBoost(ItemSkillFilter('Repair Systems'),
                                       'armorDamageAmount', ship.getModifiedItemAttr('shipBonusGC3'),
                                       skill='Gallente Cruiser', **kwargs)
@@ -19,6 +19,7 @@
 
 
 class EqBase:
+    __slots__ = ()
     ID = None
 
     def __eq__(self, other):
@@ -23,9 +23,11 @@ from collections import OrderedDict
 from logbook import Logger
 from sqlalchemy.orm import reconstructor
 
-import eos.effects
 import eos.db
-from eos.saveddata.price import Price as types_Price
+from eos.calcHooks import registerHooks
+from eos.calcJournal import journalState
+from eos.calcProfiler import profilerState
+from eos.effectRegistry import EffectRegistry
 from .eqBase import EqBase
 
 
@@ -51,6 +53,7 @@ class Effect(EqBase):
         """
         self.__generated = False
         self.__effectDef = None
+        self.__handler = None
 
     @property
     def handler(self):
@@ -62,6 +65,8 @@ class Effect(EqBase):
         if not self.__generated:
             pyfalog.debug("Generating effect: {0} ({1}) [runTime: {2}]", self.name, self.effectID, self.runTime)
             self.__generateHandler()
+        if self.__handler is None:
+            self.__loadHandler()
 
         return self.__handler
 
@@ -156,51 +161,77 @@ class Effect(EqBase):
 
     def __generateHandler(self):
         """
-        Grab the handler, type and runTime from the effect code if it exists,
-        if it doesn't, set dummy values and add a dummy handler
+        Grab the type and runTime from the effect metadata if the effect is implemented,
+        if it isn't, set dummy values and add a dummy handler. Handler itself is loaded
+        only when it's needed
         """
         try:
-            effectDefName = "Effect{}".format(self.ID)
-            pyfalog.debug("Loading {0} ({1})".format(self.name, effectDefName))
-            self.__effectDef = effectDef = getattr(eos.effects, effectDefName)
-            self.__handler = getattr(effectDef, "handler", eos.effects.BaseEffect.handler)
-            self.__runTime = getattr(effectDef, "runTime", "normal")
-            self.__activeByDefault = getattr(effectDef, "activeByDefault", True)
-            effectType = getattr(effectDef, "type", None)
-            effectType = effectType if isinstance(effectType, tuple) or effectType is None else (effectType,)
-            self.__type = effectType
-        except ImportError as e:
-            # Effect probably doesn't exist, so create a dummy effect and flag it with a warning.
-            self.__handler = eos.effects.DummyEffect.handler
-            self.__runTime = "normal"
-            self.__activeByDefault = True
-            self.__type = None
-            pyfalog.debug("ImportError generating handler: {0}", e)
-        except AttributeError as e:
-            # Effect probably exists but there is an issue with it.  Turn it into a dummy effect so we can continue, but flag it with an error.
-            self.__handler = eos.effects.DummyEffect.handler
-            self.__runTime = "normal"
-            self.__activeByDefault = True
-            self.__type = None
-            pyfalog.error("AttributeError generating handler: {0}", e)
+            metadata = EffectRegistry.getInstance().getMetadata(self.ID)
+            if metadata is None:
+                # Effect doesn't exist, so create a dummy effect
+                pyfalog.debug("No effect definition for {0} ({1})", self.name, self.ID)
+                self.__setDummy()
+            else:
+                self.__effectDef = metadata
+                self.__handler = None
+                self.__runTime = metadata.get("runTime", "normal")
+                self.__activeByDefault = metadata.get("activeByDefault", True)
+                effectType = metadata.get("type", None)
+                effectType = effectType if isinstance(effectType, tuple) or effectType is None else (effectType,)
+                self.__type = effectType
         except Exception as e:
-            self.__handler = eos.effects.DummyEffect.handler
-            self.__runTime = "normal"
-            self.__activeByDefault = True
-            self.__type = None
+            self.__setDummy()
             pyfalog.critical("Exception generating handler:")
             pyfalog.critical(e)
 
         self.__generated = True
 
+    def __loadHandler(self):
+        registry = EffectRegistry.getInstance()
+        try:
+            effectDefName = "Effect{}".format(self.ID)
+            pyfalog.debug("Loading {0} ({1})".format(self.name, effectDefName))
+            effectDef = registry.getDefinition(self.ID)
+            self.__handler = getattr(effectDef, "handler", registry.baseEffect.handler)
+        except Exception as e:
+            # Effect exists but there is an issue with it.  Turn it into a dummy effect so we can continue, but flag it with an error.
+            self.__handler = registry.dummyEffect.handler
+            pyfalog.critical("Exception loading handler:")
+            pyfalog.critical(e)
+
+    def __setDummy(self):
+        self.__effectDef = None
+        self.__handler = EffectRegistry.getInstance().dummyEffect.handler
+        self.__runTime = "normal"
+        self.__activeByDefault = True
+        self.__type = None
+
     def getattr(self, key):
         if not self.__generated:
             self.__generateHandler()
 
-        try:
-            return self.__effectDef.get(key, None)
-        except:
-            return getattr(self.__effectDef, key, None)
+        if self.__effectDef is None:
+            return None
+        return self.__effectDef.get(key, None)
+
+
+def _hookedHandler(getHandler):
+    def hookedHandler(self):
+        handler = getHandler(self)
+        # When calculation journal is recording, let it track the call
+        journal = journalState.journal
+        if journal is not None:
+            handler = journal.trackHandler(handler)
+        # Same for profiler, which times the call
+        profiler = profilerState.profiler
+        if profiler is not None:
+            handler = profiler.trackHandler(self, handler)
+        return handler
+    return property(hookedHandler, doc=getHandler.__doc__)
+
+
+# Calculation journal and profiler hooks, used only while they are active
+registerHooks(Effect, {"handler": _hookedHandler(Effect.handler.fget)})
 
 
 class Item(EqBase):
@@ -241,7 +272,6 @@ class Item(EqBase):
         self.__offensive = None
         self.__assistive = None
         self.__overrides = None
-        self.__priceObj = None
 
     def getShortName(self, charLimit=12):
         if len(self.name) <= charLimit:
@@ -473,23 +503,7 @@ class Item(EqBase):
 
     @property
     def price(self):
-        # todo: use `from sqlalchemy import inspect` instead (mac-deprecated doesn't have inspect(), was imp[lemented in 0.8)
-        if self.__priceObj is not None and getattr(self.__priceObj, '_sa_instance_state', None) and self.__priceObj._sa_instance_state.deleted:
-            pyfalog.debug("Price data for {} was deleted (probably from a cache reset), resetting object".format(self.ID))
-            self.__priceObj = None
-
-        if self.__priceObj is None:
-            db_price = eos.db.getPrice(self.ID)
-            # do not yet have a price in the database for this item, create one
-            if db_price is None:
-                pyfalog.debug("Creating a price for {}".format(self.ID))
-                self.__priceObj = types_Price(self.ID)
-                eos.db.add(self.__priceObj)
-                eos.db.flush()
-            else:
-                self.__priceObj = db_price
-
-        return self.__priceObj
+        return eos.db.getPrice(self.ID)
 
     @property
     def isAbyssal(self):
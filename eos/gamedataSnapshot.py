@@ -0,0 +1,398 @@
+# ===============================================================================
+# Copyright (C) 2010 Diego Duclos
+#
+# This file is part of eos.
+#
+# eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with eos.  If not, see <http://www.gnu.org/licenses/>.
+# ===============================================================================
+
+"""
+Read-only columnar snapshot of gamedata database. All data is kept in flat
+arrays of a single file, which is memory-mapped when snapshot is opened, so
+processes forked after opening it share its pages instead of loading gamedata
+into their own ORM objects. This module doesn't depend on database layer.
+
+Attributes and effects of types are stored in CSR form: for type at position
+N, its sorted attribute IDs and values are at positions
+attrOffsets[N]..attrOffsets[N + 1] of attrIDs / attrValues arrays.
+"""
+
+import json
+import mmap
+import sqlite3
+import sys
+from array import array
+from bisect import bisect_left
+from collections import OrderedDict, namedtuple
+
+from logbook import Logger
+
+
+pyfalog = Logger(__name__)
+
+MAGIC = b"EOSGDS01"
+ALIGNMENT = 8
+# Attributes which are kept as columns of types table, and are moved into
+# attributes the same way as Item.moveAttrs does: mass, capacity, volume
+MOVE_ATTRS = ((4, "mass"), (38, "capacity"), (161, "volume"))
+# Required skill attribute ID: required skill level attribute ID, same as Item.srqIDMap
+SRQ_ID_MAP = {182: 277, 183: 278, 184: 279, 1285: 1286, 1289: 1287, 1290: 1288}
+# Used instead of null IDs
+NO_ID = -1
+
+SnapshotAttribute = namedtuple("SnapshotAttribute", ("ID", "name", "value"))
+SnapshotEffect = namedtuple("SnapshotEffect", ("ID", "name"))
+
+
+class SnapshotError(Exception):
+    pass
+
+
+class SnapshotWriter:
+
+    def __init__(self):
+        # Format: [(name, typecode, data bytes, length)]
+        self.sections = []
+
+    def add(self, name, typecode, values):
+        data = array(typecode, values)
+        self.sections.append((name, typecode, data.tobytes(), len(data)))
+
+    def addStrings(self, name, strings):
+        """Add strings as one UTF-8 blob and offsets of every string in it"""
+        encoded = [(string or "").encode("utf-8") for string in strings]
+        offsets = [0]
+        for string in encoded:
+            offsets.append(offsets[-1] + len(string))
+        self.add(name + ".offsets", "I", offsets)
+        self.add(name, "B", b"".join(encoded))
+
+    def write(self, path, version):
+        header = {"version": version, "byteorder": sys.byteorder, "sections": {}}
+        # Offsets are relative to start of data, which follows aligned header
+        position = 0
+        for name, typecode, data, length in self.sections:
+            header["sections"][name] = [position, length, typecode]
+            position += -(-len(data) // ALIGNMENT) * ALIGNMENT
+        headerData = json.dumps(header).encode("utf-8")
+        dataStart = -(-(len(MAGIC) + 4 + len(headerData)) // ALIGNMENT) * ALIGNMENT
+        with open(path, "wb") as snapshotFile:
+            snapshotFile.write(MAGIC)
+            snapshotFile.write(array("I", [len(headerData)]).tobytes())
+            snapshotFile.write(headerData)
+            snapshotFile.write(b"\0" * (dataStart - len(MAGIC) - 4 - len(headerData)))
+            for name, typecode, data, length in self.sections:
+                snapshotFile.write(data)
+                snapshotFile.write(b"\0" * (-len(data) % ALIGNMENT))
+
+
+def exportSnapshot(dbPath, path):
+    """Write gamedata database at dbPath into snapshot file at path"""
+    connection = sqlite3.connect(dbPath)
+    try:
+        try:
+            version = connection.execute("SELECT field_value FROM metadata WHERE field_name LIKE 'client_build'").fetchone()[0]
+        except (sqlite3.Error, TypeError):
+            version = None
+        writer = SnapshotWriter()
+
+        types = connection.execute(
+            "SELECT typeID, typeName, groupID, marketGroupID, published, mass, capacity, volume FROM invtypes ORDER BY typeID").fetchall()
+        writer.add("types.id", "i", (row[0] for row in types))
+        writer.addStrings("types.name", (row[1] for row in types))
+        writer.add("types.group", "i", (NO_ID if row[2] is None else row[2] for row in types))
+        writer.add("types.marketGroup", "i", (NO_ID if row[3] is None else row[3] for row in types))
+        writer.add("types.published", "b", (1 if row[4] else 0 for row in types))
+
+        typeAttrs = {}
+        for typeID, attributeID, value in connection.execute("SELECT typeID, attributeID, value FROM dgmtypeattribs"):
+            typeAttrs.setdefault(typeID, {})[attributeID] = value
+        typeEffects = {}
+        for typeID, effectID in connection.execute("SELECT typeID, effectID FROM dgmtypeeffects"):
+            typeEffects.setdefault(typeID, []).append(effectID)
+
+        attrOffsets = [0]
+        attrIDs = array("i")
+        attrValues = array("d")
+        effectOffsets = [0]
+        effectIDs = array("i")
+        for row in types:
+            attrs = typeAttrs.get(row[0], {})
+            for (attributeID, _), value in zip(MOVE_ATTRS, row[5:8]):
+                if value:
+                    attrs[attributeID] = value
+            for attributeID in sorted(attrs):
+                attrIDs.append(attributeID)
+                attrValues.append(attrs[attributeID] or 0.0)
+            attrOffsets.append(len(attrIDs))
+            effectIDs.extend(sorted(typeEffects.get(row[0], ())))
+            effectOffsets.append(len(effectIDs))
+        writer.add("types.attrOffsets", "I", attrOffsets)
+        writer.add("attrs.id", "i", attrIDs)
+        writer.add("attrs.value", "d", attrValues)
+        writer.add("types.effectOffsets", "I", effectOffsets)
+        writer.add("effects.ofType", "i", effectIDs)
+
+        for section, query in (
+            ("attributeInfo", "SELECT attributeID, attributeName FROM dgmattribs ORDER BY attributeID"),
+            ("effects", "SELECT effectID, effectName FROM dgmeffects ORDER BY effectID"),
+            ("categories", "SELECT categoryID, categoryName FROM invcategories ORDER BY categoryID")
+        ):
+            rows = connection.execute(query).fetchall()
+            writer.add(section + ".id", "i", (row[0] for row in rows))
+            writer.addStrings(section + ".name", (row[1] for row in rows))
+
+        groups = connection.execute("SELECT groupID, groupName, categoryID, published FROM invgroups ORDER BY groupID").fetchall()
+        writer.add("groups.id", "i", (row[0] for row in groups))
+        writer.addStrings("groups.name", (row[1] for row in groups))
+        writer.add("groups.category", "i", (NO_ID if row[2] is None else row[2] for row in groups))
+        writer.add("groups.published", "b", (1 if row[3] else 0 for row in groups))
+
+        marketGroups = connection.execute(
+            "SELECT marketGroupID, marketGroupName, parentGroupID FROM invmarketgroups ORDER BY marketGroupID").fetchall()
+        writer.add("marketGroups.id", "i", (row[0] for row in marketGroups))
+        writer.addStrings("marketGroups.name", (row[1] for row in marketGroups))
+        writer.add("marketGroups.parent", "i", (NO_ID if row[2] is None else row[2] for row in marketGroups))
+    finally:
+        connection.close()
+
+    writer.write(path, version)
+    pyfalog.info("Exported gamedata snapshot of {} types into {}", len(types), path)
+
+
+class GamedataSnapshot:
+    """Read-only view of snapshot file, see exportSnapshot"""
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as snapshotFile:
+            self.map = mmap.mmap(snapshotFile.fileno(), 0, access=mmap.ACCESS_READ)
+        view = memoryview(self.map)
+        if bytes(view[:len(MAGIC)]) != MAGIC:
+            raise SnapshotError("Not a gamedata snapshot: {}".format(path))
+        headerLength = view[len(MAGIC):len(MAGIC) + 4].cast("I")[0]
+        headerEnd = len(MAGIC) + 4 + headerLength
+        header = json.loads(bytes(view[len(MAGIC) + 4:headerEnd]).decode("utf-8"))
+        if header["byteorder"] != sys.byteorder:
+            raise SnapshotError("Snapshot was written on machine with different byte order")
+        self.version = header["version"]
+        dataStart = -(-headerEnd // ALIGNMENT) * ALIGNMENT
+        self.sections = {}
+        for name, (offset, length, typecode) in header["sections"].items():
+            start = dataStart + offset
+            self.sections[name] = view[start:start + length * array(typecode).itemsize].cast(typecode)
+        self.typeIDs = self.sections["types.id"]
+        self.attrOffsets = self.sections["types.attrOffsets"]
+        self.attrIDs = self.sections["attrs.id"]
+        self.attrValues = self.sections["attrs.value"]
+        self.effectOffsets = self.sections["types.effectOffsets"]
+        self.effectIDs = self.sections["effects.ofType"]
+        # Small lookup tables are kept as regular dictionaries
+        self.attributeNames = dict(zip(self.sections["attributeInfo.id"], self.__getStrings("attributeInfo.name")))
+        self.attributeIDs = {name: attributeID for attributeID, name in self.attributeNames.items()}
+        self.effectNames = dict(zip(self.sections["effects.id"], self.__getStrings("effects.name")))
+        self.__typeNameIndex = None
+
+    def __getStrings(self, name):
+        return [self.getString(name, position) for position in range(len(self.sections[name + ".offsets"]) - 1)]
+
+    def getString(self, name, position):
+        offsets = self.sections[name + ".offsets"]
+        return bytes(self.sections[name][offsets[position]:offsets[position + 1]]).decode("utf-8")
+
+    @staticmethod
+    def findPosition(ids, ID):
+        position = bisect_left(ids, ID)
+        if position < len(ids) and ids[position] == ID:
+            return position
+        return None
+
+    def __len__(self):
+        return len(self.typeIDs)
+
+    def __contains__(self, typeID):
+        return self.findPosition(self.typeIDs, typeID) is not None
+
+    def getItem(self, lookfor):
+        """Get item by type ID or name, None if there's no such item"""
+        if isinstance(lookfor, int):
+            position = self.findPosition(self.typeIDs, lookfor)
+        elif isinstance(lookfor, str):
+            if self.__typeNameIndex is None:
+                self.__typeNameIndex = {name: position for position, name in enumerate(self.__getStrings("types.name"))}
+            position = self.__typeNameIndex.get(lookfor)
+        else:
+            raise TypeError("Need integer or string as argument")
+        return None if position is None else SnapshotItem(self, position)
+
+    def getGroup(self, groupID):
+        position = self.findPosition(self.sections["groups.id"], groupID)
+        return None if position is None else SnapshotGroup(self, position)
+
+    def getCategory(self, categoryID):
+        position = self.findPosition(self.sections["categories.id"], categoryID)
+        return None if position is None else SnapshotCategory(self, position)
+
+    def getMarketGroup(self, marketGroupID):
+        position = self.findPosition(self.sections["marketGroups.id"], marketGroupID)
+        return None if position is None else SnapshotMarketGroup(self, position)
+
+    def getAttributeArrays(self, position):
+        """Get sorted attribute IDs and their values of type at position, as array views"""
+        start, end = self.attrOffsets[position], self.attrOffsets[position + 1]
+        return self.attrIDs[start:end], self.attrValues[start:end]
+
+    def getAttributeValue(self, position, attributeID, default=None):
+        start, end = self.attrOffsets[position], self.attrOffsets[position + 1]
+        index = bisect_left(self.attrIDs, attributeID, start, end)
+        if index < end and self.attrIDs[index] == attributeID:
+            return self.attrValues[index]
+        return default
+
+    def close(self):
+        self.sections = {}
+        self.typeIDs = self.attrOffsets = self.attrIDs = self.attrValues = self.effectOffsets = self.effectIDs = None
+        self.map.close()
+
+
+class SnapshotEntity:
+    __slots__ = ("snapshot", "position")
+    section = None
+
+    def __init__(self, snapshot, position):
+        self.snapshot = snapshot
+        self.position = position
+
+    @property
+    def ID(self):
+        return self.snapshot.sections[self.section + ".id"][self.position]
+
+    @property
+    def name(self):
+        return self.snapshot.getString(self.section + ".name", self.position)
+
+    def __eq__(self, other):
+        return type(self) is type(other) and self.ID == other.ID
+
+    def __hash__(self):
+        return hash((type(self), self.ID))
+
+    def __repr__(self):
+        return "{}(ID={}, name={})".format(type(self).__name__, self.ID, self.name)
+
+
+class SnapshotCategory(SnapshotEntity):
+    __slots__ = ()
+    section = "categories"
+
+
+class SnapshotGroup(SnapshotEntity):
+    __slots__ = ()
+    section = "groups"
+
+    @property
+    def published(self):
+        return bool(self.snapshot.sections["groups.published"][self.position])
+
+    @property
+    def category(self):
+        return self.snapshot.getCategory(self.snapshot.sections["groups.category"][self.position])
+
+
+class SnapshotMarketGroup(SnapshotEntity):
+    __slots__ = ()
+    section = "marketGroups"
+
+    @property
+    def parent(self):
+        return self.snapshot.getMarketGroup(self.snapshot.sections["marketGroups.parent"][self.position])
+
+
+class SnapshotItem(SnapshotEntity):
+    """Read-only stand-in for gamedata Item, backed by snapshot arrays"""
+    __slots__ = ()
+    section = "types"
+
+    @property
+    def typeID(self):
+        return self.ID
+
+    @property
+    def groupID(self):
+        return self.snapshot.sections["types.group"][self.position]
+
+    @property
+    def group(self):
+        return self.snapshot.getGroup(self.groupID)
+
+    @property
+    def category(self):
+        group = self.group
+        return group.category if group is not None else None
+
+    @property
+    def marketGroupID(self):
+        marketGroupID = self.snapshot.sections["types.marketGroup"][self.position]
+        return None if marketGroupID == NO_ID else marketGroupID
+
+    @property
+    def marketGroup(self):
+        marketGroupID = self.marketGroupID
+        return None if marketGroupID is None else self.snapshot.getMarketGroup(marketGroupID)
+
+    @property
+    def published(self):
+        return bool(self.snapshot.sections["types.published"][self.position])
+
+    @property
+    def attributes(self):
+        """Attributes by name, the same as Item.attributes, but built on every access"""
+        names = self.snapshot.attributeNames
+        attributes = {}
+        for attributeID, value in zip(*self.snapshot.getAttributeArrays(self.position)):
+            name = names.get(attributeID)
+            if name is not None:
+                attributes[name] = SnapshotAttribute(attributeID, name, value)
+        return attributes
+
+    def getAttribute(self, key, default=None):
+        """Get attribute value by name or ID"""
+        attributeID = self.snapshot.attributeIDs.get(key) if isinstance(key, str) else key
+        if attributeID is None:
+            return default
+        return self.snapshot.getAttributeValue(self.position, attributeID, default)
+
+    @property
+    def effects(self):
+        snapshot = self.snapshot
+        start, end = snapshot.effectOffsets[self.position], snapshot.effectOffsets[self.position + 1]
+        effects = {}
+        for effectID in snapshot.effectIDs[start:end]:
+            name = snapshot.effectNames.get(effectID)
+            if name is not None:
+                effects[name] = SnapshotEffect(effectID, name)
+        return effects
+
+    @property
+    def requiredSkills(self):
+        """Required skills as {item: level}, the same as Item.requiredSkills"""
+        requiredSkills = OrderedDict()
+        for skillAttrID, levelAttrID in SRQ_ID_MAP.items():
+            skillID = self.getAttribute(skillAttrID)
+            level = self.getAttribute(levelAttrID)
+            if skillID is not None and level is not None:
+                skill = self.snapshot.getItem(int(skillID))
+                if skill is not None:
+                    requiredSkills[skill] = level
+        return requiredSkills
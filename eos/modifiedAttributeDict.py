@@ -18,9 +18,15 @@
 # ===============================================================================
 
 import collections
+from array import array
 from copy import copy
 from math import exp
+from time import perf_counter
 
+import eos.config
+from eos.calcHooks import registerHooks
+from eos.calcJournal import journaledRead, journalState
+from eos.calcProfiler import profilerState
 from eos.const import Operator
 # TODO: This needs to be moved out, we shouldn't have *ANY* dependencies back to other modules/methods inside eos.
 # This also breaks writing any tests. :(
@@ -66,7 +72,97 @@ def getResistanceAttrID(modifyingItem, effect):
         return resistanceID
 
 
+def getCappingKey(key):
+    """Get name of attribute which caps value of passed attribute, if any"""
+    try:
+        cappingKey = cappingAttrKeyCache[key]
+    except KeyError:
+        attrInfo = getAttributeInfo(key)
+        if attrInfo is None:
+            cappingId = cappingAttrKeyCache[key] = None
+        else:
+            cappingId = attrInfo.maxAttributeID
+        if cappingId is None:
+            cappingKey = None
+        else:
+            cappingAttrInfo = getAttributeInfo(cappingId)
+            cappingKey = None if cappingAttrInfo is None else cappingAttrInfo.name
+            cappingAttrKeyCache[key] = cappingKey
+    return cappingKey
+
+
+def copyContainer(container):
+    """Copy container together with plain containers nested in it"""
+    if type(container) is dict:
+        return {k: copyContainer(v) for k, v in container.items()}
+    if type(container) in (list, set):
+        return type(container)(copyContainer(v) for v in container)
+    if type(container) is array:
+        return copy(container)
+    return container
+
+
+def getPenaltyFactor(position):
+    """Get effectiveness of modification at given position in stacking penalized chain"""
+    return exp(- position ** 2 / 7.1289)
+
+
+def applyStackingPenalties(val, penalizedMultiplierGroups, ignorePenMult=None):
+    # Each group is penalized independently
+    # Things in different groups will not be stack penalized between each other
+    for penaltyGroup, penalizedMultipliers in penalizedMultiplierGroups.items():
+        if ignorePenMult is not None and penaltyGroup in ignorePenMult:
+            # Avoid modifying source and remove multipliers we were asked to remove for this calc
+            penalizedMultipliers = penalizedMultipliers[:]
+            for ignoreMult in ignorePenMult[penaltyGroup]:
+                try:
+                    penalizedMultipliers.remove(ignoreMult)
+                except ValueError:
+                    pass
+        # A quick explanation of how this works:
+        # 1: Bonuses and penalties are calculated seperately, so we'll have to filter each of them
+        l1 = [_val for _val in penalizedMultipliers if _val > 1]
+        l2 = [_val for _val in penalizedMultipliers if _val < 1]
+        # 2: The most significant bonuses take the smallest penalty,
+        # This means we'll have to sort
+        abssort = lambda _val: -abs(_val - 1)
+        l1.sort(key=abssort)
+        l2.sort(key=abssort)
+        # 3: The first module doesn't get penalized at all
+        # Any module after the first takes penalties according to:
+        # 1 + (multiplier - 1) * math.exp(- math.pow(i, 2) / 7.1289)
+        for l in (l1, l2):
+            for i in range(len(l)):
+                bonus = l[i]
+                val *= 1 + (bonus - 1) * getPenaltyFactor(i)
+    return val
+
+
+def addExtraMultipliers(fit, penalizedMultiplierGroups, extraMultipliers):
+    """Get copy of penalized multiplier groups with extra multipliers added, resisted by ship of the fit"""
+    penalizedMultiplierGroups = copy(penalizedMultiplierGroups)
+    for stackGroup, operationsData in extraMultipliers.items():
+        multipliers = []
+        for mult, resAttrID in operationsData:
+            if not resAttrID:
+                multipliers.append(mult)
+                continue
+            resAttrInfo = getAttributeInfo(resAttrID)
+            if not resAttrInfo:
+                multipliers.append(mult)
+                continue
+            resMult = fit.ship.itemModifiedAttributes[resAttrInfo.attributeName]
+            if resMult is None or resMult == 1:
+                multipliers.append(mult)
+                continue
+            mult = (mult - 1) * resMult + 1
+            multipliers.append(mult)
+        penalizedMultiplierGroups[stackGroup] = penalizedMultiplierGroups.get(stackGroup, []) + multipliers
+    return penalizedMultiplierGroups
+
+
 class ItemAttrShortcut:
+    __slots__ = ()
 
     def getModifiedItemAttr(self, key, default=0):
         return_value = self.itemModifiedAttributes.get(key)
@@ -82,6 +178,7 @@ class ItemAttrShortcut:
 
 
 class ChargeAttrShortcut:
+    __slots__ = ()
 
     def getModifiedChargeAttr(self, key, default=0):
         return_value = self.chargeModifiedAttributes.get(key)
@@ -96,6 +193,14 @@ class ChargeAttrShortcut:
         return return_value or default
 
 
+def createModifiedAttributeDict(fit=None, parent=None):
+    """Create modified attribute map of the kind selected in eos configuration"""
+    if eos.config.attributeBackend == "array":
+        from eos.arrayAttributeDict import ArrayModifiedAttributeDict
+        return ArrayModifiedAttributeDict(fit=fit, parent=parent)
+    return ModifiedAttributeDict(fit=fit, parent=parent)
+
+
 class ModifiedAttributeDict(collections.MutableMapping):
     overrides_enabled = False
 
@@ -108,6 +213,17 @@ class ModifiedAttributeDict(collections.MutableMapping):
         self.parent = parent
         # Stores original values of the entity
         self.__original = None
+        # Overrides (per item)
+        self.__overrides = {}
+        # Mutators (per module)
+        self.__mutators = {}
+        # We sometimes override the modifier (for things like skill handling). Store it here instead of registering it
+        # with the fit (which could cause bug for items that have both item bonuses and skill bonus, ie Subsystems)
+        self.__tmpModifier = None
+        self.initStorage()
+
+    def initStorage(self):
+        """Create containers for modifications and calculated values"""
         # Modified values during calculations
         self.__intermediary = {}
         # Final modified values
@@ -118,10 +234,6 @@ class ModifiedAttributeDict(collections.MutableMapping):
         #   modifying item, operation, stacking group, pre-resist amount,
         #   post-resist amount, affects result or not)}}
         self.__affectedBy = {}
-        # Overrides (per item)
-        self.__overrides = {}
-        # Mutators (per module)
-        self.__mutators = {}
         # Dictionaries for various value modification types
         self.__forced = {}
         self.__preAssigns = {}
@@ -129,9 +241,6 @@ class ModifiedAttributeDict(collections.MutableMapping):
         self.__multipliers = {}
         self.__penalizedMultipliers = {}
         self.__postIncreases = {}
-        # We sometimes override the modifier (for things like skill handling). Store it here instead of registering it
-        # with the fit (which could cause bug for items that have both item bonuses and skill bonus, ie Subsystems)
-        self.__tmpModifier = None
 
     def clear(self):
         self.__intermediary.clear()
@@ -144,6 +253,24 @@ class ModifiedAttributeDict(collections.MutableMapping):
         self.__penalizedMultipliers.clear()
         self.__postIncreases.clear()
 
+    def _getStorage(self):
+        """Get containers which hold modifications and calculated values"""
+        return (
+            self.__intermediary, self.__modified, self.__affectedBy, self.__forced, self.__preAssigns,
+            self.__preIncreases, self.__multipliers, self.__penalizedMultipliers, self.__postIncreases)
+
+    def getState(self):
+        """Get copy of modifications and calculated values, which can be brought back via setState()"""
+        return [copyContainer(container) for container in self._getStorage()]
+
+    def setState(self, state):
+        for container, saved in zip(self._getStorage(), state):
+            if isinstance(container, (dict, set)):
+                container.clear()
+                container.update(copyContainer(saved))
+            else:
+                container[:] = copyContainer(saved)
+
     @property
     def fit(self):
         # self.fit is usually set during fit calculations when the item is registered with the fit. However,
@@ -167,6 +294,10 @@ class ModifiedAttributeDict(collections.MutableMapping):
     @original.setter
     def original(self, val):
         self.__original = val
+        self.resetValues()
+
+    def resetValues(self):
+        """Drop modified values, as they do not match new original values"""
         self.__modified.clear()
 
     @property
@@ -189,7 +320,7 @@ class ModifiedAttributeDict(collections.MutableMapping):
         # Check if we have final calculated value
         val = self.__modified.get(key)
         if val is self.CalculationPlaceholder:
-            val = self.__modified[key] = self.__calculateValue(key)
+            val = self.__modified[key] = self._calculateValue(key)
         if val is not None:
             return val
 
@@ -238,17 +369,14 @@ class ModifiedAttributeDict(collections.MutableMapping):
             return self.get(key, default=default)
 
         # Try to calculate custom values
-        val = self.__calculateValue(
+        val = self._calculateValue(
             key, extraMultipliers=extraMultipliers, preIncAdj=preIncreaseAdjustment, multAdj=multiplierAdjustment,
             postIncAdj=postIncreaseAdjustment, ignorePenMult=ignorePenalizedMultipliers)
         if val is not None:
             return val
 
         # Then the same fallbacks as in regular getter
-        if self.__intermediary:
-            val = self.__intermediary.get(key)
-        else:
-            val = None
+        val = self._getIntermediary(key)
         if val is not None:
             return val
         val = self.getOriginal(key)
@@ -256,6 +384,11 @@ class ModifiedAttributeDict(collections.MutableMapping):
             return val
         return default
 
+    def _getIntermediary(self, key):
+        if self.__intermediary:
+            return self.__intermediary.get(key)
+        return None
+
     def __delitem__(self, key):
         if key in self.__modified:
             del self.__modified[key]
@@ -283,7 +416,7 @@ class ModifiedAttributeDict(collections.MutableMapping):
         return val.value if hasattr(val, "value") else val
 
     def __setitem__(self, key, val):
-        self.__intermediary[key] = val
+        self.__apply((None, key, val, False, None, None))
 
     def __iter__(self):
         all_dict = dict(self.original, **self.__modified)
@@ -304,26 +437,13 @@ class ModifiedAttributeDict(collections.MutableMapping):
         keys.update(iter(self.__intermediary.keys()))
         return len(keys)
 
-    def __calculateValue(self, key, extraMultipliers=None, preIncAdj=None, multAdj=None, postIncAdj=None, ignorePenMult=None):
+    def _calculateValue(self, key, extraMultipliers=None, preIncAdj=None, multAdj=None, postIncAdj=None, ignorePenMult=None):
         # It's possible that various attributes are capped by other attributes,
         # it's defined by reference maxAttributeID
-        try:
-            cappingKey = cappingAttrKeyCache[key]
-        except KeyError:
-            attrInfo = getAttributeInfo(key)
-            if attrInfo is None:
-                cappingId = cappingAttrKeyCache[key] = None
-            else:
-                cappingId = attrInfo.maxAttributeID
-            if cappingId is None:
-                cappingKey = None
-            else:
-                cappingAttrInfo = getAttributeInfo(cappingId)
-                cappingKey = None if cappingAttrInfo is None else cappingAttrInfo.name
-                cappingAttrKeyCache[key] = cappingKey
+        cappingKey = getCappingKey(key)
 
         if cappingKey:
-            cappingValue = self.original.get(cappingKey, self.__calculateValue(cappingKey))
+            cappingValue = self.original.get(cappingKey, self._calculateValue(cappingKey))
             cappingValue = cappingValue.value if hasattr(cappingValue, "value") else cappingValue
         else:
             cappingValue = None
@@ -343,24 +463,7 @@ class ModifiedAttributeDict(collections.MutableMapping):
         penalizedMultiplierGroups = self.__penalizedMultipliers.get(key, {})
         # Add extra multipliers to the group, not modifying initial data source
         if extraMultipliers is not None:
-            penalizedMultiplierGroups = copy(penalizedMultiplierGroups)
-            for stackGroup, operationsData in extraMultipliers.items():
-                multipliers = []
-                for mult, resAttrID in operationsData:
-                    if not resAttrID:
-                        multipliers.append(mult)
-                        continue
-                    resAttrInfo = getAttributeInfo(resAttrID)
-                    if not resAttrInfo:
-                        multipliers.append(mult)
-                        continue
-                    resMult = self.fit.ship.itemModifiedAttributes[resAttrInfo.attributeName]
-                    if resMult is None or resMult == 1:
-                        multipliers.append(mult)
-                        continue
-                    mult = (mult - 1) * resMult + 1
-                    multipliers.append(mult)
-                penalizedMultiplierGroups[stackGroup] = penalizedMultiplierGroups.get(stackGroup, []) + multipliers
+            penalizedMultiplierGroups = addExtraMultipliers(self.fit, penalizedMultiplierGroups, extraMultipliers)
         postIncrease = self.__postIncreases.get(key, 0)
 
         # Grab initial value, priorities are:
@@ -376,33 +479,7 @@ class ModifiedAttributeDict(collections.MutableMapping):
         val *= multiplier
         if multAdj is not None:
             val *= multAdj
-        # Each group is penalized independently
-        # Things in different groups will not be stack penalized between each other
-        for penaltyGroup, penalizedMultipliers in penalizedMultiplierGroups.items():
-            if ignorePenMult is not None and penaltyGroup in ignorePenMult:
-                # Avoid modifying source and remove multipliers we were asked to remove for this calc
-                penalizedMultipliers = penalizedMultipliers[:]
-                for ignoreMult in ignorePenMult[penaltyGroup]:
-                    try:
-                        penalizedMultipliers.remove(ignoreMult)
-                    except ValueError:
-                        pass
-            # A quick explanation of how this works:
-            # 1: Bonuses and penalties are calculated seperately, so we'll have to filter each of them
-            l1 = [_val for _val in penalizedMultipliers if _val > 1]
-            l2 = [_val for _val in penalizedMultipliers if _val < 1]
-            # 2: The most significant bonuses take the smallest penalty,
-            # This means we'll have to sort
-            abssort = lambda _val: -abs(_val - 1)
-            l1.sort(key=abssort)
-            l2.sort(key=abssort)
-            # 3: The first module doesn't get penalized at all
-            # Any module after the first takes penalties according to:
-            # 1 + (multiplier - 1) * math.exp(- math.pow(i, 2) / 7.1289)
-            for l in (l1, l2):
-                for i in range(len(l)):
-                    bonus = l[i]
-                    val *= 1 + (bonus - 1) * exp(- i ** 2 / 7.1289)
+        val = applyStackingPenalties(val, penalizedMultiplierGroups, ignorePenMult)
         val += postIncrease
         if postIncAdj is not None:
             val += postIncAdj
@@ -432,39 +509,88 @@ class ModifiedAttributeDict(collections.MutableMapping):
     def iterAfflictions(self):
         return self.__affectedBy.__iter__()
 
-    def __afflict(self, attributeName, operator, stackingGroup, preResAmount, postResAmount, used=True):
-        """Add modifier to list of things affecting current item"""
+    def __afflict(self):
+        """Compose modifier data used for 'Affected By' map, returns (modifying fit, affliction modifier) tuple"""
         # Do nothing if no fit is assigned
         fit = self.fit
         if fit is None:
-            return
-        # Create dictionary for given attribute and give it alias
-        if attributeName not in self.__affectedBy:
-            self.__affectedBy[attributeName] = {}
-        affs = self.__affectedBy[attributeName]
+            return None
         origin = fit.getOrigin()
         fit = origin if origin and origin != fit else fit
-        # If there's no set for current fit in dictionary, create it
-        if fit not in affs:
-            affs[fit] = []
-        # Reassign alias to list
-        affs = affs[fit]
         # Get modifier which helps to compose 'Affected by' map
-
         if self.__tmpModifier:
             modifier = self.__tmpModifier
             self.__tmpModifier = None
         else:
             modifier = fit.getModifier()
+        return fit, modifier
+
+    def __apply(self, operation):
+        self.applyOperation(operation)
+
+    def applyOperation(self, operation):
+        """
+        Apply operation composed by one of modification methods. Format:
+        (operator, attribute name, value, stacking penalties, penalty group,
+        (modifying fit, (modifier, operator, stacking group, pre-resist amount,
+        post-resist amount, affects result or not)))
+        Operator is None for intermediary values.
+        """
+        operator, attributeName, value, stackingPenalties, penaltyGroup, affliction = operation
+        if operator is None:
+            self.__intermediary[attributeName] = value
+            return
+        if operator == Operator.PREASSIGN:
+            self.__preAssigns[attributeName] = value
+        elif operator == Operator.PREINCREASE or operator == Operator.POSTINCREASE:
+            # Increases applied before multiplications and after them are
+            # written in separate maps
+            tbl = self.__preIncreases if operator == Operator.PREINCREASE else self.__postIncreases
+            if attributeName not in tbl:
+                tbl[attributeName] = 0
+            tbl[attributeName] += value
+        elif operator == Operator.MULTIPLY:
+            # If we're asked to do stacking penalized multiplication, append values
+            # to per penalty group lists
+            if stackingPenalties:
+                if attributeName not in self.__penalizedMultipliers:
+                    self.__penalizedMultipliers[attributeName] = {}
+                if penaltyGroup not in self.__penalizedMultipliers[attributeName]:
+                    self.__penalizedMultipliers[attributeName][penaltyGroup] = []
+                tbl = self.__penalizedMultipliers[attributeName][penaltyGroup]
+                tbl.append(value)
+            # Non-penalized multiplication factors go to the single list
+            else:
+                if attributeName not in self.__multipliers:
+                    self.__multipliers[attributeName] = 1
+                self.__multipliers[attributeName] *= value
+        elif operator == Operator.FORCE:
+            self.__forced[attributeName] = value
+        self.__placehold(attributeName)
 
-        # Add current affliction to list
-        affs.append((modifier, operator, stackingGroup, preResAmount, postResAmount, used))
+        # Add current affliction to list of things affecting current item
+        if affliction is not None:
+            fit, affData = affliction
+            # Create dictionary for given attribute and give it alias
+            if attributeName not in self.__affectedBy:
+                self.__affectedBy[attributeName] = {}
+            affs = self.__affectedBy[attributeName]
+            # If there's no set for current fit in dictionary, create it
+            if fit not in affs:
+                affs[fit] = []
+            affs[fit].append(affData)
+
+    def __composeAffliction(self, operator, stackingGroup, preResAmount, postResAmount, used=True):
+        affliction = self.__afflict()
+        if affliction is None:
+            return None
+        fit, modifier = affliction
+        return fit, (modifier, operator, stackingGroup, preResAmount, postResAmount, used)
 
     def preAssign(self, attributeName, value, **kwargs):
         """Overwrites original value of the entity with given one, allowing further modification"""
-        self.__preAssigns[attributeName] = value
-        self.__placehold(attributeName)
-        self.__afflict(attributeName, Operator.PREASSIGN, None, value, value, value != self.getOriginal(attributeName))
+        affliction = self.__composeAffliction(Operator.PREASSIGN, None, value, value, value != self.getOriginal(attributeName))
+        self.__apply((Operator.PREASSIGN, attributeName, value, False, None, affliction))
 
     def increase(self, attributeName, increase, position="pre", skill=None, **kwargs):
         """Increase value of given attribute by given number"""
@@ -474,21 +600,14 @@ class ModifiedAttributeDict(collections.MutableMapping):
         if 'effect' in kwargs:
             increase *= ModifiedAttributeDict.getResistance(self.fit, kwargs['effect']) or 1
 
-        # Increases applied before multiplications and after them are
-        # written in separate maps
         if position == "pre":
             operator = Operator.PREINCREASE
-            tbl = self.__preIncreases
         elif position == "post":
             operator = Operator.POSTINCREASE
-            tbl = self.__postIncreases
         else:
             raise ValueError("position should be either pre or post")
-        if attributeName not in tbl:
-            tbl[attributeName] = 0
-        tbl[attributeName] += increase
-        self.__placehold(attributeName)
-        self.__afflict(attributeName, operator, None, increase, increase, increase != 0)
+        affliction = self.__composeAffliction(operator, None, increase, increase, increase != 0)
+        self.__apply((operator, attributeName, increase, False, None, affliction))
 
     def multiply(self, attributeName, multiplier, stackingPenalties=False, penaltyGroup="default", skill=None, **kwargs):
         """Multiply value of given attribute by given factor"""
@@ -499,40 +618,16 @@ class ModifiedAttributeDict(collections.MutableMapping):
             multiplier *= self.__handleSkill(skill)
 
         preResMultiplier = multiplier
-        resisted = False
         # Goddammit CCP, make up your mind where you want this information >.< See #1139
         if 'effect' in kwargs:
             resistFactor = ModifiedAttributeDict.getResistance(self.fit, kwargs['effect']) or 1
             if resistFactor != 1:
-                resisted = True
                 multiplier = (multiplier - 1) * resistFactor + 1
 
-        # If we're asked to do stacking penalized multiplication, append values
-        # to per penalty group lists
-        if stackingPenalties:
-            if attributeName not in self.__penalizedMultipliers:
-                self.__penalizedMultipliers[attributeName] = {}
-            if penaltyGroup not in self.__penalizedMultipliers[attributeName]:
-                self.__penalizedMultipliers[attributeName][penaltyGroup] = []
-            tbl = self.__penalizedMultipliers[attributeName][penaltyGroup]
-            tbl.append(multiplier)
-        # Non-penalized multiplication factors go to the single list
-        else:
-            if attributeName not in self.__multipliers:
-                self.__multipliers[attributeName] = 1
-            self.__multipliers[attributeName] *= multiplier
-
-        self.__placehold(attributeName)
-
-        afflictPenal = ""
-        if stackingPenalties:
-            afflictPenal += "s"
-        if resisted:
-            afflictPenal += "r"
-
-        self.__afflict(
-            attributeName, Operator.MULTIPLY, penaltyGroup if stackingPenalties else None,
+        affliction = self.__composeAffliction(
+            Operator.MULTIPLY, penaltyGroup if stackingPenalties else None,
             preResMultiplier, multiplier, multiplier != 1)
+        self.__apply((Operator.MULTIPLY, attributeName, multiplier, stackingPenalties, penaltyGroup, affliction))
 
     def boost(self, attributeName, boostFactor, skill=None, **kwargs):
         """Boost value by some percentage"""
@@ -544,9 +639,8 @@ class ModifiedAttributeDict(collections.MutableMapping):
 
     def force(self, attributeName, value, **kwargs):
         """Force value to attribute and prohibit any changes to it"""
-        self.__forced[attributeName] = value
-        self.__placehold(attributeName)
-        self.__afflict(attributeName, Operator.FORCE, None, value, value)
+        affliction = self.__composeAffliction(Operator.FORCE, None, value, value)
+        self.__apply((Operator.FORCE, attributeName, value, False, None, affliction))
 
     @staticmethod
     def getResistance(fit, effect):
@@ -566,6 +660,28 @@ class ModifiedAttributeDict(collections.MutableMapping):
         return resist or 1
 
 
+def _hookedApply(self, operation):
+    # Let calculation journal know about the operation, if it's recording
+    journal = journalState.journal
+    if journal is not None and not journal.recordOperation(self, operation):
+        return
+    profiler = profilerState.profiler
+    if profiler is not None:
+        start = perf_counter()
+        self.applyOperation(operation)
+        profiler.addOperation(operation[0], perf_counter() - start)
+        return
+    self.applyOperation(operation)
+
+
+# Calculation journal and profiler hooks, used only while they are active
+registerHooks(ModifiedAttributeDict, {
+    "__getitem__": journaledRead(ModifiedAttributeDict.__getitem__, cappingAttrKeyCache.get),
+    "getOriginal": journaledRead(ModifiedAttributeDict.getOriginal),
+    "__contains__": journaledRead(ModifiedAttributeDict.__contains__),
+    "_ModifiedAttributeDict__apply": _hookedApply})
+
+
 class Affliction:
     def __init__(self, affliction_type, amount):
         self.type = affliction_type
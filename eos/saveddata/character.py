@@ -18,6 +18,7 @@
 # ===============================================================================
 
 import time
+from contextlib import contextmanager
 
 from logbook import Logger
 from itertools import chain
@@ -28,6 +29,7 @@ import eos
 import eos.db
 import eos.config
 from eos.effectHandlerHelpers import HandledItem, HandledImplantList
+from eos.skillModifierSet import SkillModifierSet
 
 pyfalog = Logger(__name__)
 
@@ -36,6 +38,7 @@ class Character:
     __itemList = None
     __itemIDMap = None
     __itemNameMap = None
+    __skillModifiers = None
 
     def __init__(self, name, defaultLevel=None, initSkills=True):
         self.savedName = name
@@ -271,10 +274,30 @@ class Character:
     def calculateModifiedAttributes(self, fit, runTime, forceProjected=False):
         if forceProjected:
             return
+        if self.__skillModifiers is not None:
+            self.__skillModifiers.apply(fit, runTime)
+            return
         for skill in self.skills:
             fit.register(skill)
             skill.calculateModifiedAttributes(fit, runTime)
 
+    @contextmanager
+    def sharedSkillModifiers(self):
+        """
+        Within this context, skill effects are run once and the modifications
+        they make are applied to every fit calculated with this character,
+        which saves time when many fits are calculated in a row. Skill levels
+        should not be changed within the context.
+        """
+        if self.__skillModifiers is not None:
+            yield self.__skillModifiers
+            return
+        self.__skillModifiers = SkillModifierSet(self)
+        try:
+            yield self.__skillModifiers
+        finally:
+            self.__skillModifiers = None
+
     def clear(self):
         c = chain(
                 self.skills,
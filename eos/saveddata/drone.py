@@ -23,7 +23,7 @@ from sqlalchemy.orm import reconstructor, validates
 
 import eos.db
 from eos.effectHandlerHelpers import HandledCharge, HandledItem
-from eos.modifiedAttributeDict import ChargeAttrShortcut, ItemAttrShortcut, ModifiedAttributeDict
+from eos.modifiedAttributeDict import ChargeAttrShortcut, ItemAttrShortcut, createModifiedAttributeDict
 from eos.utils.cycles import CycleInfo
 from eos.utils.stats import DmgTypes, RRTypes
 
@@ -70,11 +70,11 @@ class Drone(HandledItem, HandledCharge, ItemAttrShortcut, ChargeAttrShortcut):
         self.__baseVolley = None
         self.__baseRRAmount = None
         self.__miningyield = None
-        self.__itemModifiedAttributes = ModifiedAttributeDict()
+        self.__itemModifiedAttributes = createModifiedAttributeDict()
         self.__itemModifiedAttributes.original = self.__item.attributes
         self.__itemModifiedAttributes.overrides = self.__item.overrides
 
-        self.__chargeModifiedAttributes = ModifiedAttributeDict()
+        self.__chargeModifiedAttributes = createModifiedAttributeDict()
         # pheonix todo: check the attribute itself, not the modified. this will always return 0 now.
         chargeID = self.getModifiedItemAttr("entityMissileTypeID", None)
         if chargeID is not None:
@@ -24,7 +24,7 @@ from sqlalchemy.orm import reconstructor, validates
 import eos.db
 from eos.const import FittingSlot
 from eos.effectHandlerHelpers import HandledCharge, HandledItem
-from eos.modifiedAttributeDict import ChargeAttrShortcut, ItemAttrShortcut, ModifiedAttributeDict
+from eos.modifiedAttributeDict import ChargeAttrShortcut, ItemAttrShortcut, createModifiedAttributeDict
 from eos.saveddata.fighterAbility import FighterAbility
 from eos.utils.cycles import CycleInfo, CycleSequence
 from eos.utils.stats import DmgTypes
@@ -93,8 +93,8 @@ class Fighter(HandledItem, HandledCharge, ItemAttrShortcut, ChargeAttrShortcut):
         self.__charge = None
         self.__baseVolley = None
         self.__miningyield = None
-        self.__itemModifiedAttributes = ModifiedAttributeDict()
-        self.__chargeModifiedAttributes = ModifiedAttributeDict()
+        self.__itemModifiedAttributes = createModifiedAttributeDict()
+        self.__chargeModifiedAttributes = createModifiedAttributeDict()
 
         if len(self.abilities) != len(self.item.effects):
             self.__abilities = []
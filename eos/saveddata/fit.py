@@ -19,6 +19,7 @@
 
 import datetime
 import time
+from contextlib import contextmanager
 from copy import deepcopy
 from itertools import chain
 
@@ -26,8 +27,11 @@ from logbook import Logger
 from math import asinh, log, sqrt
 from sqlalchemy.orm import reconstructor, validates
 
+import eos.config
 import eos.db
 from eos import capSim
+from eos.calcJournal import CalcJournal, getActiveJournal
+from eos.calcSnapshot import CalcSnapshot
 from eos.const import CalcType, FitSystemSecurity, FittingHardpoint, FittingModuleState, FittingSlot, ImplantLocation
 from eos.effectHandlerHelpers import (
     HandledBoosterList, HandledDroneCargoList, HandledImplantList,
@@ -150,6 +154,7 @@ class Fit:
         self.gangBoosts = None
         self.ecmProjectedStr = 1
         self.commandBonuses = {}
+        self.__calcJournal = None
 
     def clearFactorReloadDependentData(self):
         # Here we clear all data known to rely on cycle parameters
@@ -524,6 +529,9 @@ class Fit:
         # oh fuck this is so janky
         # @todo should we pass in min/max to this function, or is abs okay?
         # (abs is old method, ccp now provides the aggregate function in their data)
+        journal = getActiveJournal()
+        if journal is not None:
+            journal.recordSideEffect()
         if warfareBuffID not in self.commandBonuses or abs(self.commandBonuses[warfareBuffID][1]) < abs(value):
             self.commandBonuses[warfareBuffID] = (runTime, value, module, effect)
 
@@ -780,6 +788,93 @@ class Fit:
             if value.victim_fit:  # removing a self-projected fit causes victim fit to be None. @todo: look into why. :3
                 value.victim_fit.calculated = False
 
+    def iterCalcSources(self):
+        """Iterate over items which apply their effects during local fit calculation, in the order they are run"""
+        # Items that are unrestricted. These items are run on the local fit
+        # first and then projected onto the target fit it one is designated
+        u = [
+            (self.character, self.ship),
+            self.drones,
+            self.fighters,
+            self.boosters,
+            self.appliedImplants,
+            self.modules
+        ] if not self.isStructure else [
+            # Ensure a restricted set for citadels
+            (self.character, self.ship),
+            self.fighters,
+            self.modules
+        ]
+
+        # Items that are restricted. These items are only run on the local
+        # fit. They are NOT projected onto the target fit. # See issue 354
+        r = [(self.mode,), self.projectedDrones, self.projectedFighters, self.projectedModules]
+
+        # chain unrestricted and restricted into one iterable
+        for item in chain.from_iterable(u + r):
+            if item is not None:
+                yield item
+
+    def updateModifiedAttributes(self):
+        """
+        Bring local fit calculation up to date after changes made to the fit.
+
+        If previous calculation was recorded in a calculation journal, only effects
+        whose inputs changed are run again, and results of other effects are
+        replayed from the journal. Otherwise, or if the journal cannot reproduce
+        results of full calculation, fit is calculated from scratch, recording new
+        journal when possible.
+        """
+        journal = self.__calcJournal
+        if journal is not None and self.__calculated:
+            self.__resetDependentCalcs()
+            for value in list(self.boostedOnto.values()):
+                if value.boosted_fit:
+                    value.boosted_fit.__resetDependentCalcs()
+            if journal.update():
+                pyfalog.debug("Fit calculation updated incrementally: {0}", repr(self))
+                self.__calculated = True
+                return
+            pyfalog.debug("Incremental update failed, recalculating fit: {0}", repr(self))
+
+        self.clear()
+        if CalcJournal.canRecord(self):
+            with CalcJournal(self) as journal:
+                self.calculateModifiedAttributes()
+            if not journal.finish():
+                self.__calcJournal = None
+        else:
+            self.calculateModifiedAttributes()
+
+    @contextmanager
+    def evaluateUnder(self, overrides):
+        """
+        Calculate fit with temporary changes applied, for what-if evaluations.
+
+        Overrides are (object, attribute name, value) tuples, e.g. (module, "state",
+        FittingModuleState.ONLINE). Calculated state of the fit is saved, changes are
+        applied and fit is updated like after any other change - incrementally when
+        calculation journal allows it. On exit, changed attributes get their previous
+        values back and saved calculated state is restored instead of calculating the
+        fit again; this happens even if evaluation raises.
+        """
+        snapshot = CalcSnapshot(self)
+        journal = self.__calcJournal
+        journalState = journal.getState() if journal is not None else None
+        changed = []
+        try:
+            for obj, attrName, value in overrides:
+                changed.append((obj, attrName, getattr(obj, attrName)))
+                setattr(obj, attrName, value)
+            self.updateModifiedAttributes()
+            yield self
+        finally:
+            for obj, attrName, value in reversed(changed):
+                setattr(obj, attrName, value)
+            snapshot.restore()
+            if journal is not None:
+                journal.setState(journalState)
+
     def calculateModifiedAttributes(self, targetFit=None, type=CalcType.LOCAL):
         """
         The fit calculation function. It should be noted that this is a recursive function - if the local fit has
@@ -850,50 +945,35 @@ class Fit:
             pyfalog.debug("Fit has already been calculated and is local, returning: {0}", self)
             return
 
+        journal = None
         if not self.__calculated:
             pyfalog.info("Fit is not yet calculated; will be running local calcs for {}".format(repr(self)))
             self.clear()
+            # Keep journal of the calculation only if it's being recorded for this fit,
+            # results of anything else cannot be updated incrementally
+            journal = getActiveJournal()
+            if journal is not None and (journal.fit is not self or type != CalcType.LOCAL):
+                journal = None
+            self.__calcJournal = journal
 
         # Loop through our run times here. These determine which effects are run in which order.
         for runTime in ("early", "normal", "late"):
             # pyfalog.debug("Run time: {0}", runTime)
-            # Items that are unrestricted. These items are run on the local fit
-            # first and then projected onto the target fit it one is designated
-            u = [
-                (self.character, self.ship),
-                self.drones,
-                self.fighters,
-                self.boosters,
-                self.appliedImplants,
-                self.modules
-            ] if not self.isStructure else [
-                # Ensure a restricted set for citadels
-                (self.character, self.ship),
-                self.fighters,
-                self.modules
-            ]
-
-            # Items that are restricted. These items are only run on the local
-            # fit. They are NOT projected onto the target fit. # See issue 354
-            r = [(self.mode,), self.projectedDrones, self.projectedFighters, self.projectedModules]
-
-            # chain unrestricted and restricted into one iterable
-            c = chain.from_iterable(u + r)
-
-            for item in c:
+            for item in self.iterCalcSources():
                 # Registering the item about to affect the fit allows us to
                 # track "Affected By" relations correctly
-                if item is not None:
-                    # apply effects locally if this is first time running them on fit
-                    if not self.__calculated:
-                        self.register(item)
-                        item.calculateModifiedAttributes(self, runTime, False)
-
-                    # Run command effects against target fit. We only have to worry about modules
-                    if type == CalcType.COMMAND and item in self.modules:
-                        # Apply the gang boosts to target fit
-                        # targetFit.register(item, origin=self)
-                        item.calculateModifiedAttributes(targetFit, runTime, False, True)
+                # apply effects locally if this is first time running them on fit
+                if not self.__calculated:
+                    self.register(item)
+                    if journal is not None:
+                        journal.enterSource(item, runTime)
+                    item.calculateModifiedAttributes(self, runTime, False)
+
+                # Run command effects against target fit. We only have to worry about modules
+                if type == CalcType.COMMAND and item in self.modules:
+                    # Apply the gang boosts to target fit
+                    # targetFit.register(item, origin=self)
+                    item.calculateModifiedAttributes(targetFit, runTime, False, True)
 
             # pyfalog.debug("Command Bonuses: {}".format(self.commandBonuses))
 
@@ -1221,6 +1301,10 @@ class Fit:
             capNeed = capNeed * min(1, signatureRadius / energyNeutralizerSignatureResolution)
 
         self.__extraDrains.append((cycleTime, capNeed, clipSize, reloadTime))
+        # Drains are not attribute modifications, calculation journal cannot replay them
+        journal = getActiveJournal()
+        if journal is not None:
+            journal.recordSideEffect()
 
     def removeDrain(self, i):
         del self.__extraDrains[i]
@@ -1276,6 +1360,9 @@ class Fit:
         drains, self.__capUsed, self.__capRecharge = self.__generateDrain()
         self.__capRecharge += self.calculateCapRecharge()
         sim = self.__runCapSim(drains=drains)
+        self.__applyCapSim(sim)
+
+    def __applyCapSim(self, sim):
         if sim is not None:
             capState = (sim.cap_stable_low + sim.cap_stable_high) / (2 * sim.capacitorCapacity)
             self.__capStable = capState > 0
@@ -1284,6 +1371,21 @@ class Fit:
             self.__capStable = True
             self.__capState = 100
 
+    @staticmethod
+    def simulateCapBatch(fits):
+        """
+        Simulate capacitor of many fits at once. Changes of capacitor level
+        over time are not kept for fits simulated this way.
+        """
+        sims = []
+        for fit in fits:
+            drains, fit.__capUsed, fit.__capRecharge = fit.__generateDrain()
+            fit.__capRecharge += fit.calculateCapRecharge()
+            sims.append(fit.__makeCapSim(drains, None, 6 * 60 * 60 * 1000, True, vectorized=True))
+        capSim.runBatch([sim for sim in sims if sim is not None])
+        for fit, sim in zip(fits, sims):
+            fit.__applyCapSim(sim)
+
     def getCapSimData(self, startingCap):
         if startingCap not in self.__savedCapSimData:
             self.__runCapSim(startingCap=startingCap, tMax=3600, optimizeRepeats=False)
@@ -1296,26 +1398,34 @@ class Fit:
             tMax = 6 * 60 * 60 * 1000
         else:
             tMax *= 1000
-        if len(drains) > 0:
-            sim = capSim.CapSimulator()
-            sim.init(drains)
-            sim.capacitorCapacity = self.ship.getModifiedItemAttr("capacitorCapacity")
-            sim.capacitorRecharge = self.ship.getModifiedItemAttr("rechargeRate")
-            sim.startingCapacity = startingCap = self.ship.getModifiedItemAttr("capacitorCapacity") if startingCap is None else startingCap
-            sim.stagger = True
-            sim.scale = False
-            sim.t_max = tMax
-            sim.reload = self.factorReload
-            sim.optimize_repeats = optimizeRepeats
+        sim = self.__makeCapSim(drains, startingCap, tMax, optimizeRepeats)
+        if sim is not None:
             sim.run()
             # We do not want to store partial results
             if not sim.result_optimized_repeats:
-                self.__savedCapSimData[startingCap] = sim.saved_changes
+                self.__savedCapSimData[sim.startingCapacity] = sim.saved_changes
             return sim
         else:
             self.__savedCapSimData[startingCap] = []
             return None
 
+    def __makeCapSim(self, drains, startingCap, tMax, optimizeRepeats, vectorized=None):
+        if len(drains) == 0:
+            return None
+        if vectorized is None:
+            vectorized = eos.config.settings["vectorizedCapSim"]
+        sim = capSim.VectorCapSimulator() if vectorized else capSim.CapSimulator()
+        sim.init(drains)
+        sim.capacitorCapacity = self.ship.getModifiedItemAttr("capacitorCapacity")
+        sim.capacitorRecharge = self.ship.getModifiedItemAttr("rechargeRate")
+        sim.startingCapacity = self.ship.getModifiedItemAttr("capacitorCapacity") if startingCap is None else startingCap
+        sim.stagger = True
+        sim.scale = False
+        sim.t_max = tMax
+        sim.reload = self.factorReload
+        sim.optimize_repeats = optimizeRepeats
+        return sim
+
     def getCapRegenGainFromMod(self, mod):
         """Return how much cap regen do we gain from having this module"""
         currentRegen = self.calculateCapRecharge()
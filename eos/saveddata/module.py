@@ -22,9 +22,10 @@ import math
 from sqlalchemy.orm import reconstructor, validates
 
 import eos.db
+from eos.calcJournal import getActiveJournal
 from eos.const import FittingHardpoint, FittingModuleState, FittingSlot
-from eos.effectHandlerHelpers import HandledCharge, HandledItem
-from eos.modifiedAttributeDict import ChargeAttrShortcut, ItemAttrShortcut, ModifiedAttributeDict
+from eos.effectHandlerHelpers import HandledCharge, HandledItem, dropAllIndexes
+from eos.modifiedAttributeDict import ChargeAttrShortcut, ItemAttrShortcut, createModifiedAttributeDict
 from eos.saveddata.citadel import Citadel
 from eos.saveddata.mutator import Mutator
 from eos.utils.cycles import CycleInfo, CycleSequence
@@ -140,8 +141,8 @@ class Module(HandledItem, HandledCharge, ItemAttrShortcut, ChargeAttrShortcut):
         self.__reloadForce = None
         self.__chargeCycles = None
         self.__hardpoint = FittingHardpoint.NONE
-        self.__itemModifiedAttributes = ModifiedAttributeDict(parent=self)
-        self.__chargeModifiedAttributes = ModifiedAttributeDict(parent=self)
+        self.__itemModifiedAttributes = createModifiedAttributeDict(parent=self)
+        self.__chargeModifiedAttributes = createModifiedAttributeDict(parent=self)
         self.__slot = self.dummySlot  # defaults to None
 
         if self.__item:
@@ -390,6 +391,8 @@ class Module(HandledItem, HandledCharge, ItemAttrShortcut, ChargeAttrShortcut):
             self.__chargeModifiedAttributes.overrides = {}
 
         self.__itemModifiedAttributes.clear()
+        # Lists this module is in might have it indexed by charge
+        dropAllIndexes()
 
     @property
     def miningStats(self):
@@ -589,6 +592,10 @@ class Module(HandledItem, HandledCharge, ItemAttrShortcut, ChargeAttrShortcut):
     @reloadTime.setter
     def reloadTime(self, milliseconds):
         self.__reloadTime = milliseconds
+        # Set by effects, which means calculation journal cannot just replay them
+        journal = getActiveJournal()
+        if journal is not None:
+            journal.recordSideEffect()
 
     @property
     def forceReload(self):
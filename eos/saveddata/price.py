@@ -63,6 +63,11 @@ class Price:
         else:
             return False
 
+    @property
+    def isKnown(self):
+        """Whether there is some price for the item, even if it's outdated"""
+        return self.status == PriceStatus.fetchSuccess or bool(self.price)
+
     def update(self, status, price=0):
         # Keep old price if we failed to fetch new one
         if status in (PriceStatus.fetchFail, PriceStatus.fetchTimeout):
@@ -0,0 +1,173 @@
+# ===============================================================================
+# Copyright (C) 2010 Diego Duclos
+#
+# This file is part of eos.
+#
+# eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with eos.  If not, see <http://www.gnu.org/licenses/>.
+# ===============================================================================
+
+import types
+
+from logbook import Logger
+
+from eos.calcJournal import getActiveJournal, journalState
+
+
+pyfalog = Logger(__name__)
+
+# Fit attributes which skill effects can modify in replayable way, and methods
+# they can call on them. Skill effects only use values of the skill itself and
+# apply them through these calls, so results of the calls can be collected once
+# per character and applied to any fit.
+RECORDABLE_TARGETS = frozenset((
+    "ship", "modules", "drones", "fighters", "boosters", "implants", "appliedImplants", "extraAttributes"))
+RECORDABLE_METHODS = frozenset((
+    "boostItemAttr", "increaseItemAttr", "multiplyItemAttr", "forceItemAttr", "preAssignItemAttr",
+    "boost", "increase", "multiply", "force", "preAssign",
+    "filteredItemBoost", "filteredItemIncrease", "filteredItemMultiply", "filteredItemForce", "filteredItemPreAssign",
+    "filteredChargeBoost", "filteredChargeIncrease", "filteredChargeMultiply", "filteredChargeForce",
+    "filteredChargePreAssign"))
+
+
+class FitDependency(Exception):
+    """Raised when skill effect relies on fit contents, and can't be collected"""
+    pass
+
+
+def makeCell(value):
+    return (lambda: value).__closure__[0]
+
+
+class RecordingTarget:
+
+    def __init__(self, fit, name):
+        self.__fit = fit
+        self.__name = name
+
+    def __getattr__(self, method):
+        if method not in RECORDABLE_METHODS:
+            raise FitDependency(self.__name, method)
+        fit = self.__fit
+        name = self.__name
+
+        def record(*args, **kwargs):
+            fit.calls.append((name, method, tuple(fit.freeze(arg) for arg in args), kwargs))
+        return record
+
+
+class RecordingFit:
+    """Stands for a fit while skill effects are run, collecting calls they make"""
+
+    def __init__(self):
+        self.calls = []
+
+    def __getattr__(self, name):
+        if name not in RECORDABLE_TARGETS:
+            raise FitDependency(name)
+        return RecordingTarget(self, name)
+
+    def freeze(self, arg):
+        """
+        Filter functions are called by the time effect handler returns, so they may
+        refer to variables which change right after the call, like loop variables.
+        Bind copy of the function to the values its closure has at the moment.
+        """
+        if not isinstance(arg, types.FunctionType) or not arg.__closure__:
+            return arg
+        cells = []
+        for cell in arg.__closure__:
+            try:
+                value = cell.cell_contents
+            except ValueError:
+                raise FitDependency("closure")
+            if value is self:
+                raise FitDependency("closure")
+            cells.append(makeCell(value))
+        return types.FunctionType(arg.__code__, arg.__globals__, arg.__name__, arg.__defaults__, tuple(cells))
+
+
+class SkillModifierSet:
+    """
+    Modifications which character skills make to fits. Skill effects are run
+    once per kind of fit and run time, with calls they make to the fit
+    collected; after that, calculating a fit just makes the same calls on it.
+    Effects which use anything besides the skill itself are run as usual.
+    """
+
+    def __init__(self, character):
+        self.character = character
+        # {(is structure, run time): [(skill, [handler, ...]), ...]}
+        self.__handlers = {}
+
+    def apply(self, fit, runTime):
+        key = (fit.isStructure, runTime)
+        handlers = self.__handlers.get(key)
+        if handlers is None:
+            handlers = self.__handlers[key] = self.__collect(fit.isStructure, runTime)
+        journal = getActiveJournal()
+        for skill, skillHandlers in handlers:
+            fit.register(skill)
+            for handler in skillHandlers:
+                if journal is not None:
+                    handler = journal.trackHandler(handler)
+                try:
+                    handler(fit, skill, ("skill",))
+                except AttributeError:
+                    continue
+
+    def __collect(self, isStructure, runTime):
+        handlers = []
+        replayed = live = 0
+        # Effects are run against a stand-in, keep calculation journal out of it
+        journal = journalState.journal
+        journalState.journal = None
+        try:
+            for skill in self.character.skills:
+                if skill.isSuppressed():
+                    continue
+                item = skill.item
+                if item is None:
+                    continue
+                skillHandlers = []
+                for effect in item.effects.values():
+                    if effect.runTime == runTime and \
+                            effect.isType("passive") and \
+                            (not isStructure or effect.isType("structure")) and \
+                            effect.activeByDefault:
+                        handler = effect.handler
+                        recordingFit = RecordingFit()
+                        try:
+                            handler(recordingFit, skill, ("skill",))
+                        except Exception:
+                            # Relies on the fit (or fails the same way for any fit), run it as usual
+                            skillHandlers.append(handler)
+                            live += 1
+                        else:
+                            if recordingFit.calls:
+                                skillHandlers.append(self.__makeReplay(recordingFit.calls))
+                                replayed += 1
+                if skillHandlers:
+                    handlers.append((skill, skillHandlers))
+        finally:
+            journalState.journal = journal
+        pyfalog.debug("Collected skill effects of {0} for run time {1}: {2} replayed, {3} live",
+                      repr(self.character), runTime, replayed, live)
+        return handlers
+
+    @staticmethod
+    def __makeReplay(calls):
+        def replay(fit, skill, context, **kwargs):
+            for name, method, args, callKwargs in calls:
+                getattr(getattr(fit, name), method)(*args, **callKwargs)
+        return replay
@@ -20,6 +20,8 @@
 
 import math
 
+import numpy
+
 
 def calculateRangeFactor(srcOptimalRange, srcFalloffRange, distance, restrictedRange=True):
     """Range strength/chance factor, applicable to guns, ewar, RRs, etc."""
@@ -36,6 +38,19 @@ def calculateRangeFactor(srcOptimalRange, srcFalloffRange, distance, restrictedR
         return 0
 
 
+def calculateRangeFactorArray(srcOptimalRange, srcFalloffRange, distance, restrictedRange=True):
+    """Range factor for array of distances."""
+    if distance is None:
+        return 1
+    distance = numpy.asarray(distance, dtype=float)
+    if srcFalloffRange > 0:
+        factor = 0.5 ** ((numpy.maximum(0, distance - srcOptimalRange) / srcFalloffRange) ** 2)
+        if restrictedRange:
+            factor = numpy.where(distance > srcOptimalRange + 3 * srcFalloffRange, 0.0, factor)
+        return factor
+    return numpy.where(distance <= srcOptimalRange, 1.0, 0.0)
+
+
 # Just copy-paste penalization chain calculation code (with some modifications,
 # as multipliers arrive in different form) in here to not make actual attribute
 # calculations slower than they already are due to extra function calls
@@ -21,6 +21,8 @@
 import math
 from abc import ABCMeta, abstractmethod
 
+import numpy
+
 
 class PointGetter(metaclass=ABCMeta):
 
@@ -40,11 +42,15 @@ class SmoothPointGetter(PointGetter, metaclass=ABCMeta):
 
     _baseResolution = 200
     _extraDepth = 0
+    # Set when getter implements _calculatePoints
+    _vectorized = False
 
     def getRange(self, xRange, miscParams, src, tgt):
+        commonData = self._getCommonData(miscParams=miscParams, src=src, tgt=tgt)
+        if self._vectorized:
+            return self._getRangeVectorized(xRange=xRange, miscParams=miscParams, src=src, tgt=tgt, commonData=commonData)
         xs = []
         ys = []
-        commonData = self._getCommonData(miscParams=miscParams, src=src, tgt=tgt)
 
         def addExtraPoints(x1, y1, x2, y2, depth):
             if depth <= 0 or y1 == y2:
@@ -71,6 +77,31 @@ class SmoothPointGetter(PointGetter, metaclass=ABCMeta):
             ys.append(y)
         return xs, ys
 
+    def _getRangeVectorized(self, xRange, miscParams, src, tgt, commonData):
+        xs = numpy.array(list(self._xIterLinear(xRange)), dtype=float)
+        ys = self._calculatePoints(xs=xs, miscParams=miscParams, src=src, tgt=tgt, commonData=commonData)
+        allXs = [xs]
+        allYs = [ys]
+        # Add extra points between adjacent points with different Y values,
+        # one level of depth at a time, all points of level in one go
+        x1, y1, x2, y2 = xs[:-1], ys[:-1], xs[1:], ys[1:]
+        for depth in range(self._extraDepth):
+            differs = y1 != y2
+            if not differs.any():
+                break
+            x1, y1, x2, y2 = x1[differs], y1[differs], x2[differs], y2[differs]
+            newXs = (x1 + x2) / 2
+            newYs = self._calculatePoints(xs=newXs, miscParams=miscParams, src=src, tgt=tgt, commonData=commonData)
+            allXs.append(newXs)
+            allYs.append(newYs)
+            x1, y1, x2, y2 = (
+                numpy.concatenate((x1, newXs)), numpy.concatenate((y1, newYs)),
+                numpy.concatenate((newXs, x2)), numpy.concatenate((newYs, y2)))
+        xs = numpy.concatenate(allXs)
+        ys = numpy.concatenate(allYs)
+        order = numpy.argsort(xs, kind='mergesort')
+        return xs[order].tolist(), ys[order].tolist()
+
     def getPoint(self, x, miscParams, src, tgt):
         commonData = self._getCommonData(miscParams=miscParams, src=src, tgt=tgt)
         return self._calculatePoint(x=x, miscParams=miscParams, src=src, tgt=tgt, commonData=commonData)
@@ -93,3 +124,7 @@ class SmoothPointGetter(PointGetter, metaclass=ABCMeta):
     @abstractmethod
     def _calculatePoint(self, x, miscParams, src, tgt, commonData):
         raise NotImplementedError
+
+    def _calculatePoints(self, xs, miscParams, src, tgt, commonData):
+        """Calculate Y values for numpy array of X values, has to be implemented by vectorized getters"""
+        raise NotImplementedError
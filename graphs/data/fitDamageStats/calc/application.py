@@ -21,9 +21,11 @@
 import math
 from functools import lru_cache
 
+import numpy
+
 from eos.const import FittingHardpoint
-from eos.utils.float import floatUnerr
-from graphs.calc import calculateRangeFactor
+from eos.utils.float import floatUnerr, keepDigits
+from graphs.calc import calculateRangeFactor, calculateRangeFactorArray
 from service.attribute import Attribute
 from service.const import GraphDpsDroneMode
 from service.settings import GraphSettings
@@ -367,3 +369,305 @@ def _calcBombFactor(atkEr, tgtSigRadius):
         return 1
     else:
         return min(1, tgtSigRadius / atkEr)
+
+
+# Array versions of application calculation, to calculate multipliers for many
+# points at once. Any of atkSpeed, distance, tgtSpeed and tgtSigRadius can be
+# numpy array, all arrays have to be of the same shape
+def getApplicationPerKeyArray(src, tgt, atkSpeed, atkAngle, distance, tgtSpeed, tgtAngle, tgtSigRadius):
+    shape = numpy.broadcast(*(v for v in (atkSpeed, distance, tgtSpeed, tgtSigRadius) if v is not None)).shape
+    applicationMap = {}
+    for mod in src.item.activeModulesIter():
+        if not mod.isDealingDamage():
+            continue
+        if mod.hardpoint == FittingHardpoint.TURRET:
+            applicationMap[mod] = getTurretMultArray(
+                mod=mod,
+                src=src,
+                tgt=tgt,
+                atkSpeed=atkSpeed,
+                atkAngle=atkAngle,
+                distance=distance,
+                tgtSpeed=tgtSpeed,
+                tgtAngle=tgtAngle,
+                tgtSigRadius=tgtSigRadius)
+        elif mod.hardpoint == FittingHardpoint.MISSILE:
+            applicationMap[mod] = getLauncherMultArray(
+                mod=mod,
+                src=src,
+                distance=distance,
+                tgtSpeed=tgtSpeed,
+                tgtSigRadius=tgtSigRadius)
+        elif mod.item.group.name in ('Smart Bomb', 'Structure Area Denial Module'):
+            applicationMap[mod] = getSmartbombMultArray(
+                mod=mod,
+                distance=distance)
+        elif mod.item.group.name == 'Missile Launcher Bomb':
+            applicationMap[mod] = getBombMultArray(
+                mod=mod,
+                src=src,
+                tgt=tgt,
+                distance=distance,
+                tgtSigRadius=tgtSigRadius)
+        elif mod.item.group.name == 'Structure Guided Bomb Launcher':
+            applicationMap[mod] = getGuidedBombMultArray(
+                mod=mod,
+                src=src,
+                distance=distance,
+                tgtSigRadius=tgtSigRadius)
+        elif mod.item.group.name in ('Super Weapon', 'Structure Doomsday Weapon'):
+            applicationMap[mod] = getDoomsdayMultArray(
+                mod=mod,
+                tgt=tgt,
+                distance=distance,
+                tgtSigRadius=tgtSigRadius)
+    for drone in src.item.activeDronesIter():
+        if not drone.isDealingDamage():
+            continue
+        applicationMap[drone] = getDroneMultArray(
+            drone=drone,
+            src=src,
+            tgt=tgt,
+            atkSpeed=atkSpeed,
+            atkAngle=atkAngle,
+            distance=distance,
+            tgtSpeed=tgtSpeed,
+            tgtAngle=tgtAngle,
+            tgtSigRadius=tgtSigRadius)
+    for fighter in src.item.activeFightersIter():
+        if not fighter.isDealingDamage():
+            continue
+        for ability in fighter.abilities:
+            if not ability.dealsDamage or not ability.active:
+                continue
+            applicationMap[(fighter, ability.effectID)] = getFighterAbilityMultArray(
+                fighter=fighter,
+                ability=ability,
+                src=src,
+                tgt=tgt,
+                distance=distance,
+                tgtSpeed=tgtSpeed,
+                tgtSigRadius=tgtSigRadius)
+    # Ensure consistent results - round off a little to avoid float errors
+    for k, v in applicationMap.items():
+        applicationMap[k] = _floatUnerrArray(numpy.broadcast_to(v, shape))
+    return applicationMap
+
+
+def getTurretMultArray(mod, src, tgt, atkSpeed, atkAngle, distance, tgtSpeed, tgtAngle, tgtSigRadius):
+    cth = _calcTurretChanceToHitArray(
+        atkSpeed=atkSpeed,
+        atkAngle=atkAngle,
+        atkRadius=src.getRadius(),
+        atkOptimalRange=mod.maxRange or 0,
+        atkFalloffRange=mod.falloff or 0,
+        atkTracking=mod.getModifiedItemAttr('trackingSpeed'),
+        atkOptimalSigRadius=mod.getModifiedItemAttr('optimalSigRadius'),
+        distance=distance,
+        tgtSpeed=tgtSpeed,
+        tgtAngle=tgtAngle,
+        tgtRadius=tgt.getRadius(),
+        tgtSigRadius=tgtSigRadius)
+    return _calcTurretMultArray(cth)
+
+
+def getLauncherMultArray(mod, src, distance, tgtSpeed, tgtSigRadius):
+    modRange = mod.maxRange
+    if modRange is None:
+        return 0.0
+    mult = _calcMissileFactorArray(
+        atkEr=mod.getModifiedChargeAttr('aoeCloudSize'),
+        atkEv=mod.getModifiedChargeAttr('aoeVelocity'),
+        atkDrf=mod.getModifiedChargeAttr('aoeDamageReductionFactor'),
+        tgtSpeed=tgtSpeed,
+        tgtSigRadius=tgtSigRadius)
+    if distance is not None:
+        mult = numpy.where(distance + src.getRadius() > modRange, 0.0, mult)
+    return mult
+
+
+def getSmartbombMultArray(mod, distance):
+    modRange = mod.maxRange
+    if modRange is None:
+        return 0.0
+    if distance is None:
+        return 1.0
+    return numpy.where(distance > modRange, 0.0, 1.0)
+
+
+def getDoomsdayMultArray(mod, tgt, distance, tgtSigRadius):
+    # Fitting-related checks do not depend on arguments which can be arrays
+    mult = getDoomsdayMult(mod=mod, tgt=tgt, distance=None, tgtSigRadius=1)
+    if mult == 0:
+        return 0.0
+    damageSig = mod.getModifiedItemAttr('doomsdayDamageRadius') or mod.getModifiedItemAttr('signatureRadius')
+    mult = numpy.minimum(1, numpy.asarray(tgtSigRadius, dtype=float) / damageSig) if damageSig else 1.0
+    modRange = mod.maxRange
+    if distance is not None and modRange:
+        mult = numpy.where(distance > modRange, 0.0, mult)
+    return mult
+
+
+def getBombMultArray(mod, src, tgt, distance, tgtSigRadius):
+    modRange = mod.maxRange
+    if modRange is None:
+        return 0.0
+    blastRadius = mod.getModifiedChargeAttr('explosionRange')
+    atkRadius = src.getRadius()
+    tgtRadius = tgt.getRadius()
+    mult = _calcBombFactorArray(
+        atkEr=mod.getModifiedChargeAttr('aoeCloudSize'),
+        tgtSigRadius=tgtSigRadius)
+    if distance is not None:
+        mult = numpy.where(
+            (distance < max(0, modRange - atkRadius - tgtRadius - blastRadius)) |
+            (distance > max(0, modRange - atkRadius + tgtRadius + blastRadius)),
+            0.0, mult)
+    return mult
+
+
+def getGuidedBombMultArray(mod, src, distance, tgtSigRadius):
+    modRange = mod.maxRange
+    if modRange is None:
+        return 0.0
+    mult = _calcBombFactorArray(
+        atkEr=mod.getModifiedChargeAttr('aoeCloudSize'),
+        tgtSigRadius=tgtSigRadius)
+    if distance is not None:
+        mult = numpy.where(distance > modRange - src.getRadius(), 0.0, mult)
+    return mult
+
+
+def getDroneMultArray(drone, src, tgt, atkSpeed, atkAngle, distance, tgtSpeed, tgtAngle, tgtSigRadius):
+    droneSpeed = drone.getModifiedItemAttr('maxVelocity')
+    droneOpt = GraphSettings.getInstance().get('mobileDroneMode')
+    droneRadius = drone.getModifiedItemAttr('radius')
+    cth = _calcTurretChanceToHitArray(
+        atkSpeed=numpy.minimum(atkSpeed, droneSpeed),
+        atkAngle=atkAngle,
+        atkRadius=droneRadius,
+        atkOptimalRange=drone.maxRange or 0,
+        atkFalloffRange=drone.falloff or 0,
+        atkTracking=drone.getModifiedItemAttr('trackingSpeed'),
+        atkOptimalSigRadius=drone.getModifiedItemAttr('optimalSigRadius'),
+        distance=None if distance is None else distance + src.getRadius() - droneRadius,
+        tgtSpeed=tgtSpeed,
+        tgtAngle=tgtAngle,
+        tgtRadius=tgt.getRadius(),
+        tgtSigRadius=tgtSigRadius)
+    # Mobile drones which catch up with target always hit
+    if droneSpeed > 1:
+        if droneOpt == GraphDpsDroneMode.followTarget:
+            cth = 1.0
+        elif droneOpt == GraphDpsDroneMode.auto:
+            cth = numpy.where(droneSpeed >= numpy.asarray(tgtSpeed), 1.0, cth)
+    mult = _calcTurretMultArray(cth)
+    if distance is not None:
+        mult = numpy.where(distance > src.item.extraAttributes['droneControlRange'], 0.0, mult)
+    return mult
+
+
+def getFighterAbilityMultArray(fighter, ability, src, tgt, distance, tgtSpeed, tgtSigRadius):
+    attrPrefix = ability.attrPrefix
+    # It's bomb attack
+    if attrPrefix == 'fighterAbilityLaunchBomb':
+        return _calcBombFactorArray(
+            atkEr=fighter.getModifiedChargeAttr('aoeCloudSize'),
+            tgtSigRadius=tgtSigRadius)
+    fighterSpeed = fighter.getModifiedItemAttr('maxVelocity')
+    droneOpt = GraphSettings.getInstance().get('mobileDroneMode')
+    if droneOpt == GraphDpsDroneMode.followTarget:
+        rangeFactor = 1.0
+    else:
+        rangeFactor = calculateRangeFactorArray(
+            srcOptimalRange=fighter.getModifiedItemAttr('{}RangeOptimal'.format(attrPrefix)) or fighter.getModifiedItemAttr('{}Range'.format(attrPrefix)),
+            srcFalloffRange=fighter.getModifiedItemAttr('{}RangeFalloff'.format(attrPrefix)),
+            distance=None if distance is None else distance + src.getRadius() - fighter.getModifiedItemAttr('radius'))
+        if droneOpt == GraphDpsDroneMode.auto:
+            rangeFactor = numpy.where(fighterSpeed >= numpy.asarray(tgtSpeed), 1.0, rangeFactor)
+    drf = fighter.getModifiedItemAttr('{}ReductionFactor'.format(attrPrefix), None)
+    if drf is None:
+        drf = fighter.getModifiedItemAttr('{}DamageReductionFactor'.format(attrPrefix))
+    drs = fighter.getModifiedItemAttr('{}ReductionSensitivity'.format(attrPrefix), None)
+    if drs is None:
+        drs = fighter.getModifiedItemAttr('{}DamageReductionSensitivity'.format(attrPrefix))
+    missileFactor = _calcMissileFactorArray(
+        atkEr=fighter.getModifiedItemAttr('{}ExplosionRadius'.format(attrPrefix)),
+        atkEv=fighter.getModifiedItemAttr('{}ExplosionVelocity'.format(attrPrefix)),
+        atkDrf=_calcAggregatedDrf(reductionFactor=drf, reductionSensitivity=drs),
+        tgtSpeed=tgtSpeed,
+        tgtSigRadius=tgtSigRadius)
+    # Resistance does not depend on arguments which can be arrays
+    resistMult = 1
+    if tgt.isFit:
+        resistAttrID = fighter.getModifiedItemAttr('{}ResistanceID'.format(attrPrefix))
+        if resistAttrID:
+            resistAttrInfo = Attribute.getInstance().getAttributeInfo(resistAttrID)
+            if resistAttrInfo is not None:
+                resistMult = tgt.item.ship.getModifiedItemAttr(resistAttrInfo.name, 1)
+    return rangeFactor * missileFactor * resistMult
+
+
+def _calcTurretMultArray(chanceToHit):
+    chanceToHit = numpy.asarray(chanceToHit, dtype=float)
+    wreckingChance = numpy.minimum(chanceToHit, 0.01)
+    normalChance = chanceToHit - wreckingChance
+    avgDamageMult = (0.01 + chanceToHit) / 2 + 0.49
+    normalPart = numpy.where(normalChance > 0, normalChance * avgDamageMult, 0.0)
+    return normalPart + wreckingChance * 3
+
+
+def _calcTurretChanceToHitArray(
+    atkSpeed, atkAngle, atkRadius, atkOptimalRange, atkFalloffRange, atkTracking, atkOptimalSigRadius,
+    distance, tgtSpeed, tgtAngle, tgtRadius, tgtSigRadius
+):
+    angularSpeed = _calcAngularSpeedArray(atkSpeed, atkAngle, atkRadius, distance, tgtSpeed, tgtAngle, tgtRadius)
+    rangeFactor = calculateRangeFactorArray(atkOptimalRange, atkFalloffRange, distance, restrictedRange=False)
+    trackingFactor = _calcTrackingFactorArray(atkTracking, atkOptimalSigRadius, angularSpeed, tgtSigRadius)
+    return rangeFactor * trackingFactor
+
+
+def _calcAngularSpeedArray(atkSpeed, atkAngle, atkRadius, distance, tgtSpeed, tgtAngle, tgtRadius):
+    if distance is None:
+        return 0.0
+    atkAngle = atkAngle * math.pi / 180
+    tgtAngle = tgtAngle * math.pi / 180
+    ctcDistance = numpy.asarray(atkRadius + distance + tgtRadius, dtype=float)
+    transSpeed = numpy.abs(numpy.asarray(atkSpeed) * math.sin(atkAngle) - numpy.asarray(tgtSpeed) * math.sin(tgtAngle))
+    with numpy.errstate(divide='ignore', invalid='ignore'):
+        angularSpeed = transSpeed / ctcDistance
+    return numpy.where(ctcDistance == 0, numpy.where(transSpeed == 0, 0.0, math.inf), angularSpeed)
+
+
+def _calcTrackingFactorArray(atkTracking, atkOptimalSigRadius, angularSpeed, tgtSigRadius):
+    with numpy.errstate(divide='ignore', invalid='ignore'):
+        return 0.5 ** (((angularSpeed * atkOptimalSigRadius) / (atkTracking * numpy.asarray(tgtSigRadius, dtype=float))) ** 2)
+
+
+def _calcMissileFactorArray(atkEr, atkEv, atkDrf, tgtSpeed, tgtSigRadius):
+    tgtSpeed = numpy.asarray(tgtSpeed, dtype=float)
+    tgtSigRadius = numpy.asarray(tgtSigRadius, dtype=float)
+    mult = numpy.ones(numpy.broadcast(tgtSpeed, tgtSigRadius).shape)
+    # "Slow" part
+    if atkEr > 0:
+        mult = numpy.minimum(mult, tgtSigRadius / atkEr)
+    # "Fast" part
+    with numpy.errstate(divide='ignore', invalid='ignore'):
+        fastPart = ((atkEv * tgtSigRadius) / (atkEr * tgtSpeed)) ** atkDrf
+    return numpy.where(tgtSpeed > 0, numpy.minimum(mult, fastPart), mult)
+
+
+def _calcBombFactorArray(atkEr, tgtSigRadius):
+    if atkEr == 0:
+        return 1.0
+    return numpy.minimum(1, numpy.asarray(tgtSigRadius, dtype=float) / atkEr)
+
+
+def _floatUnerrArray(values):
+    values = numpy.asarray(values, dtype=float)
+    with numpy.errstate(divide='ignore', invalid='ignore'):
+        roundFactors = keepDigits - numpy.ceil(numpy.log10(numpy.abs(values)))
+    # Zeros and infinities are left as they are
+    roundable = numpy.isfinite(roundFactors) & numpy.isfinite(values)
+    scale = 10.0 ** numpy.where(roundable, roundFactors, 0)
+    return numpy.where(roundable, numpy.round(values * scale) / scale, values)
@@ -18,12 +18,14 @@
 # =============================================================================
 
 
+import numpy
+
 import eos.config
 from eos.utils.spoolSupport import SpoolOptions, SpoolType
 from eos.utils.stats import DmgTypes
 from graphs.data.base import PointGetter, SmoothPointGetter
 from service.settings import GraphSettings
-from .calc.application import getApplicationPerKey
+from .calc.application import getApplicationPerKey, getApplicationPerKeyArray
 from .calc.projected import getScramRange, getScrammables, getTackledSpeed, getSigRadiusMult
 
 
@@ -133,6 +135,7 @@ class XDistanceMixin(SmoothPointGetter):
 
     _baseResolution = 50
     _extraDepth = 2
+    _vectorized = True
 
     def _getCommonData(self, miscParams, src, tgt):
         # Prepare time cache here because we need to do it only once,
@@ -146,8 +149,7 @@ class XDistanceMixin(SmoothPointGetter):
             'dmgMap': self._getDamagePerKey(src=src, time=miscParams['time']),
             'tgtResists': tgt.getResists()}
 
-    def _calculatePoint(self, x, miscParams, src, tgt, commonData):
-        distance = x
+    def _getTgtSpeedSigRadius(self, distance, miscParams, src, tgt, commonData):
         tgtSpeed = miscParams['tgtSpeed']
         tgtSigRadius = tgt.getSigRadius()
         if commonData['applyProjected']:
@@ -174,6 +176,12 @@ class XDistanceMixin(SmoothPointGetter):
                 tpDrones=tpDrones,
                 tpFighters=tpFighters,
                 distance=distance)
+        return tgtSpeed, tgtSigRadius
+
+    def _calculatePoint(self, x, miscParams, src, tgt, commonData):
+        distance = x
+        tgtSpeed, tgtSigRadius = self._getTgtSpeedSigRadius(
+            distance=distance, miscParams=miscParams, src=src, tgt=tgt, commonData=commonData)
         applicationMap = getApplicationPerKey(
             src=src,
             tgt=tgt,
@@ -189,6 +197,31 @@ class XDistanceMixin(SmoothPointGetter):
             tgtResists=commonData['tgtResists']).total
         return y
 
+    def _calculatePoints(self, xs, miscParams, src, tgt, commonData):
+        distances = xs
+        if commonData['applyProjected']:
+            # Projected effects are applied via attribute calculation, point by point
+            tgtSpeeds, tgtSigRadii = (numpy.array(v, dtype=float) for v in zip(*(
+                self._getTgtSpeedSigRadius(distance=distance, miscParams=miscParams, src=src, tgt=tgt, commonData=commonData)
+                for distance in distances.tolist())))
+        else:
+            tgtSpeeds, tgtSigRadii = self._getTgtSpeedSigRadius(
+                distance=None, miscParams=miscParams, src=src, tgt=tgt, commonData=commonData)
+        applicationMap = getApplicationPerKeyArray(
+            src=src,
+            tgt=tgt,
+            atkSpeed=miscParams['atkSpeed'],
+            atkAngle=miscParams['atkAngle'],
+            distance=distances,
+            tgtSpeed=tgtSpeeds,
+            tgtAngle=miscParams['tgtAngle'],
+            tgtSigRadius=tgtSigRadii)
+        ys = applyDamage(
+            dmgMap=commonData['dmgMap'],
+            applicationMap=applicationMap,
+            tgtResists=commonData['tgtResists']).total
+        return numpy.broadcast_to(ys, distances.shape)
+
 
 class XTimeMixin(PointGetter):
 
@@ -302,6 +335,7 @@ class XTgtSpeedMixin(SmoothPointGetter):
 
     _baseResolution = 50
     _extraDepth = 2
+    _vectorized = True
 
     def _getCommonData(self, miscParams, src, tgt):
         # Prepare time cache here because we need to do it only once,
@@ -312,8 +346,7 @@ class XTgtSpeedMixin(SmoothPointGetter):
             'dmgMap': self._getDamagePerKey(src=src, time=miscParams['time']),
             'tgtResists': tgt.getResists()}
 
-    def _calculatePoint(self, x, miscParams, src, tgt, commonData):
-        tgtSpeed = x
+    def _getTgtSpeedSigRadius(self, tgtSpeed, miscParams, src, tgt, commonData):
         tgtSigRadius = tgt.getSigRadius()
         if commonData['applyProjected']:
             srcScramRange = getScramRange(src=src)
@@ -341,6 +374,11 @@ class XTgtSpeedMixin(SmoothPointGetter):
                 tpDrones=tpDrones,
                 tpFighters=tpFighters,
                 distance=miscParams['distance'])
+        return tgtSpeed, tgtSigRadius
+
+    def _calculatePoint(self, x, miscParams, src, tgt, commonData):
+        tgtSpeed, tgtSigRadius = self._getTgtSpeedSigRadius(
+            tgtSpeed=x, miscParams=miscParams, src=src, tgt=tgt, commonData=commonData)
         applicationMap = getApplicationPerKey(
             src=src,
             tgt=tgt,
@@ -356,11 +394,36 @@ class XTgtSpeedMixin(SmoothPointGetter):
             tgtResists=commonData['tgtResists']).total
         return y
 
+    def _calculatePoints(self, xs, miscParams, src, tgt, commonData):
+        if commonData['applyProjected']:
+            # Projected effects are applied via attribute calculation, point by point
+            tgtSpeeds, tgtSigRadii = (numpy.array(v, dtype=float) for v in zip(*(
+                self._getTgtSpeedSigRadius(tgtSpeed=tgtSpeed, miscParams=miscParams, src=src, tgt=tgt, commonData=commonData)
+                for tgtSpeed in xs.tolist())))
+        else:
+            tgtSpeeds = xs
+            tgtSigRadii = tgt.getSigRadius()
+        applicationMap = getApplicationPerKeyArray(
+            src=src,
+            tgt=tgt,
+            atkSpeed=miscParams['atkSpeed'],
+            atkAngle=miscParams['atkAngle'],
+            distance=miscParams['distance'],
+            tgtSpeed=tgtSpeeds,
+            tgtAngle=miscParams['tgtAngle'],
+            tgtSigRadius=tgtSigRadii)
+        ys = applyDamage(
+            dmgMap=commonData['dmgMap'],
+            applicationMap=applicationMap,
+            tgtResists=commonData['tgtResists']).total
+        return numpy.broadcast_to(ys, xs.shape)
+
 
 class XTgtSigRadiusMixin(SmoothPointGetter):
 
     _baseResolution = 50
     _extraDepth = 2
+    _vectorized = True
 
     def _getCommonData(self, miscParams, src, tgt):
         tgtSpeed = miscParams['tgtSpeed']
@@ -417,6 +480,22 @@ class XTgtSigRadiusMixin(SmoothPointGetter):
             tgtResists=commonData['tgtResists']).total
         return y
 
+    def _calculatePoints(self, xs, miscParams, src, tgt, commonData):
+        applicationMap = getApplicationPerKeyArray(
+            src=src,
+            tgt=tgt,
+            atkSpeed=miscParams['atkSpeed'],
+            atkAngle=miscParams['atkAngle'],
+            distance=miscParams['distance'],
+            tgtSpeed=commonData['tgtSpeed'],
+            tgtAngle=miscParams['tgtAngle'],
+            tgtSigRadius=xs * commonData['tgtSigMult'])
+        ys = applyDamage(
+            dmgMap=commonData['dmgMap'],
+            applicationMap=applicationMap,
+            tgtResists=commonData['tgtResists']).total
+        return numpy.broadcast_to(ys, xs.shape)
+
 
 # Final getters
 class Distance2DpsGetter(XDistanceMixin, YDpsMixin):
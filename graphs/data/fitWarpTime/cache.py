@@ -28,7 +28,7 @@ class SubwarpSpeedCache(FitDataCache):
         try:
             subwarpSpeed = self._data[src.item.ID]
         except KeyError:
-            modStates = {}
+            overrides = []
             disallowedGroups = (
                 # Active modules which affect ship speed and cannot be used in warp
                 'Propulsion Module',
@@ -42,41 +42,21 @@ class SubwarpSpeedCache(FitDataCache):
                 'Jump Portal Generator')
             for mod in src.item.activeModulesIter():
                 if mod.item is not None and mod.item.group.name in disallowedGroups:
-                    modStates[mod] = mod.state
-                    mod.state = FittingModuleState.ONLINE
-            projFitStates = {}
+                    overrides.append((mod, 'state', FittingModuleState.ONLINE))
             for projFit in src.item.projectedFits:
                 projectionInfo = projFit.getProjectionInfo(src.item.ID)
                 if projectionInfo is not None and projectionInfo.active:
-                    projFitStates[projectionInfo] = projectionInfo.active
-                    projectionInfo.active = False
-            projModStates = {}
+                    overrides.append((projectionInfo, 'active', False))
             for mod in src.item.projectedModules:
                 if not mod.isExclusiveSystemEffect and mod.state >= FittingModuleState.ACTIVE:
-                    projModStates[mod] = mod.state
-                    mod.state = FittingModuleState.ONLINE
-            projDroneStates = {}
+                    overrides.append((mod, 'state', FittingModuleState.ONLINE))
             for drone in src.item.projectedDrones:
                 if drone.amountActive > 0:
-                    projDroneStates[drone] = drone.amountActive
-                    drone.amountActive = 0
-            projFighterStates = {}
+                    overrides.append((drone, 'amountActive', 0))
             for fighter in src.item.projectedFighters:
                 if fighter.active:
-                    projFighterStates[fighter] = fighter.active
-                    fighter.active = False
-            src.item.calculateModifiedAttributes()
-            subwarpSpeed = src.getMaxVelocity()
+                    overrides.append((fighter, 'active', False))
+            with src.item.evaluateUnder(overrides):
+                subwarpSpeed = src.getMaxVelocity()
             self._data[src.item.ID] = subwarpSpeed
-            for projInfo, state in projFitStates.items():
-                projInfo.active = state
-            for mod, state in modStates.items():
-                mod.state = state
-            for mod, state in projModStates.items():
-                mod.state = state
-            for drone, amountActive in projDroneStates.items():
-                drone.amountActive = amountActive
-            for fighter, state in projFighterStates.items():
-                fighter.active = state
-            src.item.calculateModifiedAttributes()
         return subwarpSpeed
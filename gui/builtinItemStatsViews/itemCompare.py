@@ -1,22 +1,69 @@
+import threading
+
 # noinspection PyPackageRequirements
 import wx
+from logbook import Logger
 
 from .helpers import AutoListCtrl
+from eos.saveddata.module import Module
 from service.price import Price as ServicePrice
 from service.market import Market
 from service.attribute import Attribute
+from service.variationSweep import VariationSweep, VariationSweepError
 from gui.utils.numberFormatter import formatAmount
 
 
+pyfalog = Logger(__name__)
+
+# Columns with stats of the fit, with every compared item fitted in place of the module
+SWEEP_COLUMNS = (
+    ("Fit DPS", "dps", lambda value: formatAmount(value, 3, 0, 0)),
+    ("Fit EHP", "ehp", lambda value: formatAmount(value, 3, 0, 0)),
+    ("Fits", "fits", lambda value: "Yes" if value else "No"))
+
+
 def defaultSort(item):
     return (item.attributes['metaLevel'].value if 'metaLevel' in item.attributes else 0, item.name)
 
 
+class SweepThread(threading.Thread):
+    """Evaluates fit with every compared item in place of the module"""
+
+    def __init__(self, mod, items, callback):
+        threading.Thread.__init__(self)
+        self.name = "VariationSweep"
+        self.daemon = True
+        self.cancelled = threading.Event()
+        candidates = [(item.ID, None) for item in items if Module.calculateSlot(item) == mod.slot]
+        # Fit is exported here, as it can be changed by commands on the main thread
+        self.prepared = VariationSweep.getInstance().prepare(mod.owner, {mod: candidates})
+        self.callback = callback
+        self.start()
+
+    def run(self):
+        sVariationSweep = VariationSweep.getInstance()
+        try:
+            results = sVariationSweep.runSweep(self.prepared, cancelled=self.cancelled)
+        except (KeyboardInterrupt, SystemExit):
+            raise
+        except VariationSweepError as e:
+            pyfalog.info(str(e))
+            results = None
+        except Exception as e:
+            pyfalog.error("Variation sweep failed")
+            pyfalog.error(e)
+            results = None
+        finally:
+            # Sweeps are started by hand, so worker processes are not kept around between them
+            sVariationSweep.close()
+        wx.CallAfter(self.callback, results)
+
+
 class ItemCompare(wx.Panel):
     def __init__(self, parent, stuff, item, items, context=None):
         # Start dealing with Price stuff to get that thread going
         sPrice = ServicePrice.getInstance()
-        sPrice.getPrices(items, self.UpdateList, fetchTimeout=90)
+        sPrice.getPrices(items, self.UpdateList, fetchTimeout=90, stale=True)
 
         wx.Panel.__init__(self, parent)
         mainSizer = wx.BoxSizer(wx.VERTICAL)
@@ -33,6 +80,9 @@ class ItemCompare(wx.Panel):
         self.item = item
         self.items = sorted(items, key=defaultSort)
         self.attrs = {}
+        # {item ID: stats of the fit with that item}
+        self.fitStats = {}
+        self.sweepThread = None
 
         # get a dict of attrName: attrInfo of all unique attributes across all items
         for item in self.items:
@@ -78,12 +128,52 @@ class ItemCompare(wx.Panel):
         bSizer.Add(self.refreshBtn, 0, wx.ALIGN_CENTER_VERTICAL)
         self.refreshBtn.Bind(wx.EVT_BUTTON, self.RefreshValues)
 
+        # Fitted module can be compared within its fit as well
+        if isinstance(stuff, Module) and not stuff.isEmpty and stuff.item is item and stuff.owner is not None \
+                and stuff in stuff.owner.modules:
+            self.sweepBtn = wx.Button(self, wx.ID_ANY, "Compare in fit", wx.DefaultPosition, wx.DefaultSize,
+                                      wx.BU_EXACTFIT)
+            self.sweepBtn.SetToolTip("Calculate fit DPS and EHP with each of the items in place of the module")
+            bSizer.Add(self.sweepBtn, 0, wx.ALIGN_CENTER_VERTICAL)
+            self.sweepBtn.Bind(wx.EVT_BUTTON, self.StartSweep)
+
         mainSizer.Add(bSizer, 0, wx.ALIGN_RIGHT)
 
         self.PopulateList()
 
         self.toggleViewBtn.Bind(wx.EVT_TOGGLEBUTTON, self.ToggleViewMode)
         self.Bind(wx.EVT_LIST_COL_CLICK, self.SortCompareCols)
+        self.Bind(wx.EVT_WINDOW_DESTROY, self.OnDestroy)
+
+    def StartSweep(self, event):
+        self.sweepBtn.Disable()
+        # Module could have been removed from the fit since the window was opened
+        if self.stuff.owner is None or self.stuff not in self.stuff.owner.modules:
+            return
+        self.sweepBtn.SetLabel("Comparing...")
+        self.sweepThread = SweepThread(self.stuff, self.items, self.processSweep)
+
+    def OnDestroy(self, event):
+        # Stop worker processes if window is closed while sweep is running
+        if event.GetEventObject() is self and self.sweepThread is not None:
+            self.sweepThread.cancelled.set()
+        event.Skip()
+
+    def processSweep(self, results):
+        # Window might have been closed while sweep was running
+        if not self:
+            return
+        self.sweepThread = None
+        self.sweepBtn.SetLabel("Compare in fit")
+        self.sweepBtn.Enable()
+        if results is None:
+            return
+        self.fitStats = {}
+        for row in results:
+            if "error" not in row:
+                itemID, chargeID = next(iter(row["items"].values()))
+                self.fitStats[itemID] = row
+        self.UpdateList()
 
     def SortCompareCols(self, event):
         self.Freeze()
@@ -134,6 +224,11 @@ class ItemCompare(wx.Panel):
                     # Price
                     if sort == len(self.attrs) + 1:
                         func = lambda i: i.price.price if i.price.price != 0 else float("Inf")
+                    # Stats of the fit, items which weren't evaluated go last
+                    elif self.fitStats and sort - len(self.attrs) - 2 < len(SWEEP_COLUMNS):
+                        stat = SWEEP_COLUMNS[sort - len(self.attrs) - 2][1]
+                        missing = float("-Inf") if self.sortReverse else float("Inf")
+                        func = lambda i: self.fitStats[i.ID][stat] if i.ID in self.fitStats else missing
                     # Something else
                     else:
                         self.sortReverse = False
@@ -152,6 +247,11 @@ class ItemCompare(wx.Panel):
         self.paramList.InsertColumn(len(self.attrs) + 1, "Price")
         self.paramList.SetColumnWidth(len(self.attrs) + 1, 60)
 
+        if self.fitStats:
+            for x, (name, stat, formatter) in enumerate(SWEEP_COLUMNS, start=len(self.attrs) + 2):
+                self.paramList.InsertColumn(x, name)
+                self.paramList.SetColumnWidth(x, 80)
+
         for item in self.items:
             i = self.paramList.InsertItem(self.paramList.GetItemCount(), item.name)
             for x, attr in enumerate(self.attrs.keys()):
@@ -170,6 +270,11 @@ class ItemCompare(wx.Panel):
             # Add prices
             self.paramList.SetItem(i, len(self.attrs) + 1, formatAmount(item.price.price, 3, 3, 9, currency=True) if item.price.price else "")
 
+            # Add stats of the fit
+            if item.ID in self.fitStats:
+                for x, (name, stat, formatter) in enumerate(SWEEP_COLUMNS, start=len(self.attrs) + 2):
+                    self.paramList.SetItem(i, x, formatter(self.fitStats[item.ID][stat]))
+
         self.paramList.RefreshRows()
         self.Layout()
 
@@ -16,6 +16,7 @@ import gui.utils.draw as drawUtils
 import gui.utils.fonts as fonts
 from gui.bitmap_loader import BitmapLoader
 from gui.builtinShipBrowser.pfBitmapFrame import PFBitmapFrame
+from gui.utils.numberFormatter import formatAmount
 from service.fit import Fit
 from .events import BoosterListUpdated, FitSelected, ImportSelected, SearchSelected, Stage3Selected
 
@@ -161,6 +162,14 @@ class FitItem(SFItem.SFBrowserItem):
             notes = ""
             if self.notes:
                 notes = '─' * 20 + "\nNotes: {}\n".format(self.notes[:197] + '...' if len(self.notes) > 200 else self.notes)
+            # Show stats only if they are known already (cached after the fit was last
+            # calculated), browsing fits should not load or calculate them
+            stats = sFit.getFitStats(self.fitID, calculate=False)
+            if stats is not None:
+                notes += '─' * 20 + "\nDPS: {}  EHP: {}  Speed: {} m/s\n".format(
+                    formatAmount(stats["dps"]["total"], 3, 0, 0),
+                    formatAmount(stats["ehp"]["total"], 3, 0, 9),
+                    formatAmount(stats["navigation"]["maxSpeed"], 3, 0, 0))
             self.SetToolTip(wx.ToolTip('{}\n{}{}\n{}'.format(self.shipName, notes, '─' * 20, self.shipTrait)))
 
     def OnKeyUp(self, event):
@@ -328,7 +337,7 @@ class FitItem(SFItem.SFBrowserItem):
 
     def OnFitRename(self, event):
         if event.fitID == self.fitID:
-            fit = Fit.getInstance().getFit(self.fitID)
+            fit = Fit.getInstance().getFit(self.fitID, basic=True)
             self.fitName = fit.name
             if self:
                 self.Refresh()
@@ -74,7 +74,7 @@ class PriceViewMinimal(StatsView):
         if fit is not None:
             self.fit = fit
             fit_items = set(Fit.fitItemIter(fit))
-            Price.getInstance().getPrices(fit_items, self.processPrices, fetchTimeout=30)
+            Price.getInstance().getPrices(fit_items, self.processPrices, fetchTimeout=30, stale=True)
             self.labelEMStatus.SetLabel("Updating prices...")
 
         self.refreshPanelPrices(fit)
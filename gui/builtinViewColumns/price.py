@@ -65,7 +65,9 @@ class Price(ViewColumn):
 
         priceObj = stuff.item.price
 
-        if not priceObj.isValid():
+        # Outdated prices are refreshed when fit is shown, until then we show
+        # last known price
+        if not priceObj.isKnown:
             return False
 
         return formatPrice(stuff, priceObj)
@@ -41,6 +41,7 @@ from gui.contextMenu import ContextMenu
 from gui.utils.staticHelpers import DragDropHelper
 from service.fit import Fit
 from service.market import Market
+from service.price import Price
 from config import slotColourMap
 from gui.fitCommands.helpers import getSimilarModPositions
 
@@ -343,11 +344,21 @@ class FittingView(d.Display):
                 self.Show(fitID is not None)
                 self.slotsChanged()
                 sFit.switchFit(fitID)
+                self.refreshPrices(fitID)
                 # @todo pheonix: had to disable this as it was causing a crash at the wxWidgets level. Dunno why, investigate
                 wx.PostEvent(self.mainFrame, GE.FitChanged(fitIDs=(fitID,)))
 
         event.Skip()
 
+    def refreshPrices(self, fitID):
+        """Refresh outdated prices of items on the fit, and redraw it once they are in"""
+        fit = Fit.getInstance().getFit(fitID, basic=True)
+        if fit is None:
+            return
+        Price.getInstance().refreshPrices(
+            set(Fit.fitItemIter(fit)),
+            callback=lambda: wx.PostEvent(self.mainFrame, GE.FitChanged(fitIDs=(fitID,))))
+
     def updateTab(self):
         sFit = Fit.getInstance()
         fit = sFit.getFit(self.getActiveFit(), basic=True)
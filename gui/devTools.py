@@ -28,6 +28,7 @@ from logbook import Logger
 import eos.db
 from gui.auxFrame import AuxiliaryFrame
 from gui.builtinShipBrowser.events import FitSelected
+from service.fit import Fit
 
 
 pyfalog = Logger(__name__)
@@ -36,11 +37,12 @@ pyfalog = Logger(__name__)
 class DevTools(AuxiliaryFrame):
 
     DAMAGE_TYPES = ("em", "thermal", "kinetic", "explosive")
+    PROFILE_COLUMNS = (("Effect", 200), ("Run time", 60), ("Calls", 60), ("Total, ms", 70), ("Average, us", 80))
 
     def __init__(self, parent):
         super().__init__(
             parent, id=wx.ID_ANY, title="Development Tools", resizeable=True,
-            size=wx.Size(400, 320) if "wxGTK" in wx.PlatformInfo else wx.Size(400, 240))
+            size=wx.Size(500, 620) if "wxGTK" in wx.PlatformInfo else wx.Size(500, 540))
         self.mainFrame = parent
         self.block = False
         self.SetSizeHints(wx.DefaultSize, wx.DefaultSize)
@@ -69,6 +71,37 @@ class DevTools(AuxiliaryFrame):
 
         self.cmdPrint.Bind(wx.EVT_BUTTON, self.cmd_print)
 
+        mainSizer.Add(wx.StaticLine(self, wx.ID_ANY), 0, wx.EXPAND | wx.TOP | wx.BOTTOM, 5)
+        mainSizer.Add(wx.StaticText(self, wx.ID_ANY, "Calculation profiler"), 0, wx.TOP | wx.BOTTOM, 5)
+
+        profilerBtnSizer = wx.BoxSizer(wx.HORIZONTAL)
+        self.profileToggle = wx.ToggleButton(self, wx.ID_ANY, "Profile recalcs")
+        self.profileToggle.SetValue(Fit.getInstance().calcProfiler is not None)
+        profilerBtnSizer.Add(self.profileToggle, 1, wx.RIGHT, 5)
+        self.profileRefresh = wx.Button(self, wx.ID_ANY, "Refresh")
+        profilerBtnSizer.Add(self.profileRefresh, 1, wx.RIGHT, 5)
+        self.profileReset = wx.Button(self, wx.ID_ANY, "Reset")
+        profilerBtnSizer.Add(self.profileReset, 1, wx.RIGHT, 5)
+        self.profileExport = wx.Button(self, wx.ID_ANY, "Export JSON")
+        profilerBtnSizer.Add(self.profileExport, 1)
+        mainSizer.Add(profilerBtnSizer, 0, wx.EXPAND | wx.TOP | wx.BOTTOM, 5)
+
+        self.profileToggle.Bind(wx.EVT_TOGGLEBUTTON, self.profile_toggle)
+        self.profileRefresh.Bind(wx.EVT_BUTTON, self.profile_refresh)
+        self.profileReset.Bind(wx.EVT_BUTTON, self.profile_reset)
+        self.profileExport.Bind(wx.EVT_BUTTON, self.profile_export)
+
+        self.profileSummary = wx.StaticText(self, wx.ID_ANY, "")
+        mainSizer.Add(self.profileSummary, 0, wx.EXPAND | wx.TOP | wx.BOTTOM, 5)
+
+        self.profileList = wx.ListCtrl(self, wx.ID_ANY, wx.DefaultPosition, wx.DefaultSize, wx.LC_REPORT)
+        for i, (heading, width) in enumerate(self.PROFILE_COLUMNS):
+            self.profileList.InsertColumn(i, heading=heading, width=width)
+        mainSizer.Add(self.profileList, 1, wx.EXPAND | wx.TOP | wx.BOTTOM, 5)
+        # Stats of last stopped profiling session
+        self.profiler = Fit.getInstance().calcProfiler
+        self.profile_refresh(None)
+
         self.SetSizer(mainSizer)
 
         self.Layout()
@@ -107,6 +140,50 @@ class DevTools(AuxiliaryFrame):
         self.thread = FitTestThread([x.ID for x in fits], self.Parent)
         self.thread.start()
 
+    def profile_toggle(self, evt):
+        sFit = Fit.getInstance()
+        if self.profileToggle.GetValue():
+            self.profiler = sFit.startProfiling()
+        else:
+            self.profiler = sFit.stopProfiling()
+        self.profile_refresh(evt)
+
+    def profile_refresh(self, evt):
+        self.profileList.DeleteAllItems()
+        if self.profiler is None:
+            self.profileSummary.SetLabel("Enable profiling and change fits to collect stats")
+            return
+        recalcs = self.profiler.recalcs
+        self.profileSummary.SetLabel("{} recalcs, {:.1f} ms total; effects by total time:".format(
+            len(recalcs), sum(r[2] for r in recalcs) * 1000))
+        for effectID, name, runTime, stats in self.profiler.getEffectStats():
+            index = self.profileList.InsertItem(self.profileList.GetItemCount(), "{} ({})".format(name, effectID))
+            self.profileList.SetItem(index, 1, runTime)
+            self.profileList.SetItem(index, 2, str(stats.calls))
+            self.profileList.SetItem(index, 3, "{:.2f}".format(stats.time * 1000))
+            self.profileList.SetItem(index, 4, "{:.1f}".format(stats.time / stats.calls * 1000000))
+
+    def profile_reset(self, evt):
+        if self.profiler is not None:
+            self.profiler.reset()
+        self.profile_refresh(evt)
+
+    def profile_export(self, evt):
+        if self.profiler is None:
+            return
+        with wx.FileDialog(
+            self, "Export Calculation Profile As...",
+            wildcard="JSON files (*.json)|*.json",
+            style=wx.FD_SAVE | wx.FD_OVERWRITE_PROMPT,
+            defaultFile="calcProfile.json"
+        ) as dlg:
+            if dlg.ShowModal() == wx.ID_OK:
+                path = dlg.GetPath()
+                try:
+                    self.profiler.exportJson(path)
+                except IOError as e:
+                    pyfalog.error("Unable to export calculation profile to {0}: {1}", path, e)
+
 
 class FitTestThread(threading.Thread):
     def __init__(self, fitIDs, mainFrame):
@@ -2,8 +2,9 @@ import wx
 from logbook import Logger
 
 import eos.db
-from gui.fitCommands.helpers import restoreCheckedStates, activeStateLimit
+from gui.fitCommands.helpers import restoreCheckedStates
 from service.fit import Fit
+from service.port.shared import activeStateLimit
 
 
 pyfalog = Logger(__name__)
@@ -1,11 +1,7 @@
 import wx
 
-import eos.db
-import gui.mainFrame
-from gui import globalEvents as GE
 from gui.fitCommands.calc.booster.add import CalcAddBoosterCommand
-from gui.fitCommands.helpers import BoosterInfo, InternalCommandHistory
-from service.fit import Fit
+from gui.fitCommands.helpers import BoosterInfo, InternalCommandHistory, refreshFit
 from service.market import Market
 
 
@@ -21,20 +17,10 @@ class GuiAddBoosterCommand(wx.Command):
         cmd = CalcAddBoosterCommand(fitID=self.fitID, boosterInfo=BoosterInfo(itemID=self.itemID))
         success = self.internalHistory.submit(cmd)
         Market.getInstance().storeRecentlyUsed(self.itemID)
-        eos.db.flush()
-        sFit = Fit.getInstance()
-        sFit.recalc(self.fitID)
-        sFit.fill(self.fitID)
-        eos.db.commit()
-        wx.PostEvent(gui.mainFrame.MainFrame.getInstance(), GE.FitChanged(fitIDs=(self.fitID,)))
+        refreshFit(self.fitID)
         return success
 
     def Undo(self):
         success = self.internalHistory.undoAll()
-        eos.db.flush()
-        sFit = Fit.getInstance()
-        sFit.recalc(self.fitID)
-        sFit.fill(self.fitID)
-        eos.db.commit()
-        wx.PostEvent(gui.mainFrame.MainFrame.getInstance(), GE.FitChanged(fitIDs=(self.fitID,)))
+        refreshFit(self.fitID)
         return success
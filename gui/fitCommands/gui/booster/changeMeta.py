@@ -1,10 +1,7 @@
 import wx
 
-import eos.db
-import gui.mainFrame
-from gui import globalEvents as GE
 from gui.fitCommands.calc.booster.add import CalcAddBoosterCommand
-from gui.fitCommands.helpers import BoosterInfo, InternalCommandHistory
+from gui.fitCommands.helpers import BoosterInfo, InternalCommandHistory, refreshFit
 from service.fit import Fit
 
 
@@ -27,19 +24,10 @@ class GuiChangeBoosterMetaCommand(wx.Command):
         info.itemID = self.newItemID
         cmd = CalcAddBoosterCommand(fitID=self.fitID, boosterInfo=info)
         success = self.internalHistory.submit(cmd)
-        eos.db.flush()
-        sFit.recalc(self.fitID)
-        sFit.fill(self.fitID)
-        eos.db.commit()
-        wx.PostEvent(gui.mainFrame.MainFrame.getInstance(), GE.FitChanged(fitIDs=(self.fitID,)))
+        refreshFit(self.fitID)
         return success
 
     def Undo(self):
         success = self.internalHistory.undoAll()
-        eos.db.flush()
-        sFit = Fit.getInstance()
-        sFit.recalc(self.fitID)
-        sFit.fill(self.fitID)
-        eos.db.commit()
-        wx.PostEvent(gui.mainFrame.MainFrame.getInstance(), GE.FitChanged(fitIDs=(self.fitID,)))
+        refreshFit(self.fitID)
         return success
@@ -1,10 +1,7 @@
 import wx
 from service.fit import Fit
 
-import eos.db
-import gui.mainFrame
-from gui import globalEvents as GE
-from gui.fitCommands.helpers import InternalCommandHistory
+from gui.fitCommands.helpers import InternalCommandHistory, refreshFit
 from gui.fitCommands.calc.module.localRemove import CalcRemoveLocalModulesCommand
 
 
@@ -30,11 +27,7 @@ class GuiToggleFittingRestrictionsCommand(wx.Command):
             if len(results) > 0:
                 success = any(results)
 
-        eos.db.flush()
-        sFit.recalc(self.fitID)
-        sFit.fill(self.fitID)
-        eos.db.commit()
-        wx.PostEvent(gui.mainFrame.MainFrame.getInstance(), GE.FitChanged(fitIDs=(self.fitID,)))
+        refreshFit(self.fitID)
         return success
 
     def Undo(self):
@@ -42,9 +35,5 @@ class GuiToggleFittingRestrictionsCommand(wx.Command):
         fit = sFit.getFit(self.fitID)
         fit.ignoreRestrictions = not fit.ignoreRestrictions
         success = self.internalHistory.undoAll()
-        eos.db.flush()
-        sFit.recalc(self.fitID)
-        sFit.fill(self.fitID)
-        eos.db.commit()
-        wx.PostEvent(gui.mainFrame.MainFrame.getInstance(), GE.FitChanged(fitIDs=(self.fitID,)))
+        refreshFit(self.fitID)
         return success
@@ -1,10 +1,7 @@
 import wx
 
-import eos.db
-import gui.mainFrame
-from gui import globalEvents as GE
 from gui.fitCommands.calc.implant.add import CalcAddImplantCommand
-from gui.fitCommands.helpers import ImplantInfo, InternalCommandHistory
+from gui.fitCommands.helpers import ImplantInfo, InternalCommandHistory, refreshFit
 from service.fit import Fit
 
 
@@ -27,19 +24,10 @@ class GuiChangeImplantMetaCommand(wx.Command):
         info.itemID = self.newItemID
         cmd = CalcAddImplantCommand(fitID=self.fitID, implantInfo=info)
         success = self.internalHistory.submit(cmd)
-        eos.db.flush()
-        sFit.recalc(self.fitID)
-        sFit.fill(self.fitID)
-        eos.db.commit()
-        wx.PostEvent(gui.mainFrame.MainFrame.getInstance(), GE.FitChanged(fitIDs=(self.fitID,)))
+        refreshFit(self.fitID)
         return success
 
     def Undo(self):
         success = self.internalHistory.undoAll()
-        eos.db.flush()
-        sFit = Fit.getInstance()
-        sFit.recalc(self.fitID)
-        sFit.fill(self.fitID)
-        eos.db.commit()
-        wx.PostEvent(gui.mainFrame.MainFrame.getInstance(), GE.FitChanged(fitIDs=(self.fitID,)))
+        refreshFit(self.fitID)
         return success
@@ -3,7 +3,7 @@ import wx
 import eos.db
 import gui.mainFrame
 from gui import globalEvents as GE
-from gui.fitCommands.helpers import CargoInfo, InternalCommandHistory
+from gui.fitCommands.helpers import CargoInfo, InternalCommandHistory, refreshFit
 from service.fit import Fit
 from gui.fitCommands.calc.cargo.add import CalcAddCargoCommand
 from gui.fitCommands.calc.cargo.remove import CalcRemoveCargoCommand
@@ -68,11 +68,6 @@ class GuiRebaseItemsCommand(wx.Command):
         return len(self.internalHistory) > 0
 
     def Undo(self):
-        sFit = Fit.getInstance()
         success = self.internalHistory.undoAll()
-        eos.db.flush()
-        sFit.recalc(self.fitID)
-        sFit.fill(self.fitID)
-        eos.db.commit()
-        wx.PostEvent(gui.mainFrame.MainFrame.getInstance(), GE.FitChanged(fitIDs=(self.fitID,)))
+        refreshFit(self.fitID)
         return success
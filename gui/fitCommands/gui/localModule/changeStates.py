@@ -4,7 +4,7 @@ import eos.db
 import gui.mainFrame
 from gui import globalEvents as GE
 from gui.fitCommands.calc.module.localChangeStates import CalcChangeLocalModuleStatesCommand
-from gui.fitCommands.helpers import InternalCommandHistory, restoreRemovedDummies
+from gui.fitCommands.helpers import InternalCommandHistory, refreshFit, restoreRemovedDummies
 from service.fit import Fit
 
 
@@ -40,9 +40,5 @@ class GuiChangeLocalModuleStatesCommand(wx.Command):
         fit = sFit.getFit(self.fitID)
         restoreRemovedDummies(fit, self.savedRemovedDummies)
         success = self.internalHistory.undoAll()
-        eos.db.flush()
-        sFit.recalc(self.fitID)
-        sFit.fill(self.fitID)
-        eos.db.commit()
-        wx.PostEvent(gui.mainFrame.MainFrame.getInstance(), GE.FitChanged(fitIDs=(self.fitID,)))
+        refreshFit(self.fitID)
         return success
@@ -12,7 +12,7 @@ from gui.fitCommands.calc.drone.projectedChangeState import CalcChangeProjectedD
 from gui.fitCommands.calc.fighter.projectedChangeState import CalcChangeProjectedFighterStateCommand
 from gui.fitCommands.calc.module.projectedChangeStates import CalcChangeProjectedModuleStatesCommand
 from gui.fitCommands.calc.projectedFit.changeState import CalcChangeProjectedFitStateCommand
-from gui.fitCommands.helpers import InternalCommandHistory
+from gui.fitCommands.helpers import InternalCommandHistory, refreshFit
 from service.fit import Fit
 
 
@@ -96,10 +96,5 @@ class GuiChangeProjectedItemStatesCommand(wx.Command):
 
     def Undo(self):
         success = self.internalHistory.undoAll()
-        eos.db.flush()
-        sFit = Fit.getInstance()
-        sFit.recalc(self.fitID)
-        sFit.fill(self.fitID)
-        eos.db.commit()
-        wx.PostEvent(gui.mainFrame.MainFrame.getInstance(), GE.FitChanged(fitIDs=(self.fitID,)))
+        refreshFit(self.fitID)
         return success
@@ -11,7 +11,7 @@ from gui.fitCommands.calc.drone.projectedRemove import CalcRemoveProjectedDroneC
 from gui.fitCommands.calc.fighter.projectedRemove import CalcRemoveProjectedFighterCommand
 from gui.fitCommands.calc.module.projectedRemove import CalcRemoveProjectedModuleCommand
 from gui.fitCommands.calc.projectedFit.remove import CalcRemoveProjectedFitCommand
-from gui.fitCommands.helpers import InternalCommandHistory
+from gui.fitCommands.helpers import InternalCommandHistory, refreshFit
 from service.fit import Fit
 
 
@@ -67,10 +67,5 @@ class GuiRemoveProjectedItemsCommand(wx.Command):
 
     def Undo(self):
         success = self.internalHistory.undoAll()
-        eos.db.flush()
-        sFit = Fit.getInstance()
-        sFit.recalc(self.fitID)
-        sFit.fill(self.fitID)
-        eos.db.commit()
-        wx.PostEvent(gui.mainFrame.MainFrame.getInstance(), GE.FitChanged(fitIDs=(self.fitID,)))
+        refreshFit(self.fitID)
         return success
@@ -4,14 +4,17 @@ import wx
 from logbook import Logger
 
 import eos.db
-from eos.const import FittingModuleState
 from eos.saveddata.booster import Booster
 from eos.saveddata.cargo import Cargo
 from eos.saveddata.drone import Drone
 from eos.saveddata.fighter import Fighter
 from eos.saveddata.implant import Implant
 from eos.saveddata.module import Module
+import gui.mainFrame
+from gui import globalEvents as GE
+from service.fit import Fit
 from service.market import Market
+from service.recalcScheduler import RecalcScheduler
 from utils.repr import makeReprStr
 
 
@@ -317,16 +320,6 @@ class CargoInfo:
         return makeReprStr(self, ['itemID', 'amount'])
 
 
-def activeStateLimit(itemIdentity):
-    item = Market.getInstance().getItem(itemIdentity)
-    if {
-        'moduleBonusAssaultDamageControl', 'moduleBonusIndustrialInvulnerability',
-        'microJumpDrive', 'microJumpPortalDrive'
-    }.intersection(item.effects):
-        return FittingModuleState.ONLINE
-    return FittingModuleState.ACTIVE
-
-
 def droneStackLimit(fit, itemIdentity):
     item = Market.getInstance().getItem(itemIdentity)
     hardLimit = max(5, fit.extraAttributes["maxActiveDrones"])
@@ -356,6 +349,33 @@ def restoreRemovedDummies(fit, dummyInfo):
         fit.modules.insert(position, Module.buildEmpty(slot))
 
 
+def refreshFit(fitID, recalc=True):
+    """
+    Bring fit up to date after command changed it, and let GUI know about it.
+
+    If recalc coalescing is enabled, fit is recalculated by recalc scheduler,
+    which merges quick series of changes (e.g. wheeling through charges) into
+    a single recalc, and FitChanged event is posted once it's done. The recalc
+    itself still runs on the main thread.
+    """
+    sFit = Fit.getInstance()
+    if recalc and sFit.serviceFittingOptions['coalesceRecalc']:
+        eos.db.commit()
+        RecalcScheduler.getInstance().schedule(
+            fitID, callback=_fillAndNotify, delay=sFit.serviceFittingOptions['coalesceRecalcDelay'])
+        return
+    if recalc:
+        eos.db.flush()
+        sFit.recalc(fitID)
+    _fillAndNotify(fitID)
+
+
+def _fillAndNotify(fitID):
+    Fit.getInstance().fill(fitID)
+    eos.db.commit()
+    wx.PostEvent(gui.mainFrame.MainFrame.getInstance(), GE.FitChanged(fitIDs=(fitID,)))
+
+
 def getSimilarModPositions(mods, mainMod):
     sMkt = Market.getInstance()
     mainGroupID = getattr(sMkt.getGroupByItem(mainMod.item), 'ID', None)
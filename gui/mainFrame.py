@@ -64,10 +64,12 @@ from gui.utils.clipboard import fromClipboard
 from service.character import Character
 from service.esi import Esi
 from service.fit import Fit
+from service.fitOptimizer import FitOptimizer
 from service.port import IPortUser, Port
 from service.price import Price
 from service.settings import HTMLExportSettings, SettingsProvider
 from service.update import Update
+from service.variationSweep import VariationSweep
 
 
 pyfalog = Logger(__name__)
@@ -218,7 +220,10 @@ class MainFrame(wx.Frame):
         # Show ourselves
         self.Show()
 
-        self.LoadPreviousOpenFits()
+        # With deferred startup tasks, previous fits are restored after them, as
+        # database cleanup is one of those tasks
+        if not config.deferStartupTasks:
+            self.LoadPreviousOpenFits()
 
         # Check for updates
         self.sUpdate = Update.getInstance()
@@ -383,6 +388,10 @@ class MainFrame(wx.Frame):
 
         # save all teh settingz
         SettingsProvider.getInstance().saveAll()
+
+        # stop worker processes, aborting calculations still running
+        VariationSweep.getInstance().close(terminate=True)
+        FitOptimizer.getInstance().close(terminate=True)
         event.Skip()
 
     def ExitApp(self, event):
@@ -375,7 +375,7 @@ class ShipBrowser(wx.Panel):
                 shipTrait = ship.traits.traitText if (ship.traits is not None) else ""  # empty string if no traits
 
                 self.lpane.AddWidget(
-                    ShipItem(self.lpane, ship.ID, (ship.name, shipTrait, len(sFit.getFitsWithShip(ship.ID))),
+                    ShipItem(self.lpane, ship.ID, (ship.name, shipTrait, sFit.countFitsWithShip(ship.ID)),
                              ship.race, ship.graphicID))
 
             for ID, name, shipID, shipName, booster, timestamp, notes in fitList:
@@ -9,6 +9,7 @@ from service.port import Port
 from service.market import Market
 from logbook import Logger
 from eos.db import getFit
+from gui.utils.numberFormatter import formatAmount
 
 pyfalog = Logger(__name__)
 
@@ -217,7 +218,7 @@ class exportHtmlThread(threading.Thread):
                             HTMLfit = (
                                     '           <li data-role="collapsible" data-iconpos="right" data-shadow="false" '
                                     'data-corners="false">\n'
-                                    '           <h2>' + fit[1] + '</h2>\n'
+                                    '           <h2>' + fit[1] + self.getStatsLabel(sFit, fit[0]) + '</h2>\n'
                                     '               <ul data-role="listview" data-shadow="false" data-inset="true" '
                                                                  'data-corners="false">\n'
                             )
@@ -256,6 +257,15 @@ class exportHtmlThread(threading.Thread):
 
         return HTML
 
+    @staticmethod
+    def getStatsLabel(sFit, fitID):
+        # Exporting every fit should not calculate them, stats are shown only if they are known
+        stats = sFit.getFitStats(fitID, calculate=False)
+        if stats is None:
+            return ''
+        return ' <span class="ui-li-aside">DPS: {} EHP: {}</span>'.format(
+            formatAmount(stats["dps"]["total"], 3, 0, 0), formatAmount(stats["ehp"]["total"], 3, 0, 9))
+
     def generateMinimalHTML(self, sMkt, sFit, dnaUrl):
         """ Generate a minimal HTML version of the fittings, without any javascript or styling"""
         categoryList = list(sMkt.getShipRoot())
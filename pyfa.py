@@ -20,10 +20,14 @@
 
 
 import datetime
+import multiprocessing
 import os
 import sys
 from optparse import AmbiguousOptionError, BadOptionError, OptionParser
 
+# Imported first, so that startup trace counts time from here
+from utils.startupTrace import StartupTrace
+
 import config
 from service.prereqsCheck import PreCheckException, PreCheckMessage, version_block, version_precheck
 
@@ -72,14 +76,23 @@ parser.add_option("-t", "--title", action="store", dest="title", help="Set Windo
 parser.add_option("-s", "--savepath", action="store", dest="savepath", help="Set the folder for savedata", default=None)
 parser.add_option("-l", "--logginglevel", action="store", dest="logginglevel", help="Set desired logging level [Critical|Error|Warning|Info|Debug]", default="Error")
 parser.add_option("-p", "--profile", action="store", dest="profile_path", help="Set location to save profileing.", default=None)
+parser.add_option("--trace-startup", action="store_true", dest="trace_startup", help="Report time taken by each startup phase.", default=False)
 
 (options, args) = parser.parse_args()
 
 if __name__ == "__main__":
 
+    # Frozen builds run worker processes (e.g. of variation sweeps) via this executable
+    multiprocessing.freeze_support()
+
+    trace = StartupTrace.getInstance()
+    if options.trace_startup:
+        trace.enable()
+
     try:
         # first and foremost - check required libraries
-        version_precheck()
+        with trace.phase("prerequisites check"):
+            version_precheck()
     except PreCheckException as ex:
         # do not pass GO, go directly to jail (and then die =/)
         PreCheckMessage(str(ex))
@@ -101,8 +114,11 @@ if __name__ == "__main__":
 
     config.debug = options.debug
     config.loggingLevel = config.LOGLEVEL_MAP.get(options.logginglevel.lower(), config.LOGLEVEL_MAP['error'])
-    config.defPaths(options.savepath)
-    config.defLogging()
+    # Database validation is not needed to show main window, do it after
+    config.deferStartupTasks = True
+    with trace.phase("paths and logging setup"):
+        config.defPaths(options.savepath)
+        config.defLogging()
 
     with config.logging_setup.threadbound():
 
@@ -117,26 +133,48 @@ if __name__ == "__main__":
             pyfalog.info("Running in a thawed state.")
 
         # Lets get to the good stuff, shall we?
-        import eos.db
-        import eos.events  # todo: move this to eos initialization?
+        with trace.phase("database initialization"):
+            import eos.db
+        with trace.phase("eos events"):
+            import eos.events  # todo: move this to eos initialization?
 
         # noinspection PyUnresolvedReferences
-        import service.prefetch  # noqa: F401
+        with trace.phase("saveddata migration"):
+            import service.prefetch
 
         # Make sure the saveddata db exists
         if not os.path.exists(config.savePath):
             os.mkdir(config.savePath)
 
         eos.db.saveddata_meta.create_all()
-        from gui.mainFrame import MainFrame
+        with trace.phase("GUI modules import"):
+            from gui.mainFrame import MainFrame
 
         # set title if it wasn't supplied by argument
         if options.title is None:
             options.title = "pyfa %s - Python Fitting Assistant" % (config.getVersion())
 
-        pyfa = wx.App(False)
-        mf = MainFrame(options.title)
-        ErrorHandler.SetParent(mf)
+        with trace.phase("main window creation"):
+            pyfa = wx.App(False)
+            mf = MainFrame(options.title)
+            ErrorHandler.SetParent(mf)
+
+        def onDeferredTasksDone():
+            # Previous fits are restored only now, so that they are not loaded
+            # while database cleanup is still fixing them
+            mf.LoadPreviousOpenFits()
+            if trace.enabled:
+                pyfalog.info(trace.getReport())
+
+        def onFirstIdle(event):
+            # First idle event comes when all pending events, including paint
+            # of the main window, were processed
+            mf.Unbind(wx.EVT_IDLE, handler=onFirstIdle)
+            event.Skip()
+            trace.mark("first paint")
+            service.prefetch.runDeferredTasks(callback=lambda: wx.CallAfter(onDeferredTasksDone))
+
+        mf.Bind(wx.EVT_IDLE, onFirstIdle)
 
         if options.profile_path:
             profile_path = os.path.join(options.profile_path, 'pyfa-{}.profile'.format(datetime.datetime.now().strftime('%Y%m%d_%H%M%S')))
@@ -52,7 +52,8 @@ if os_name == 'Darwin':
 
 import_these = [
     'numpy.core._dtype_ctypes',  # https://github.com/pyinstaller/pyinstaller/issues/3982
-    'sqlalchemy.ext.baked'  # windows build doesn't launch without if when using sqlalchemy 1.3.x
+    'sqlalchemy.ext.baked',  # windows build doesn't launch without if when using sqlalchemy 1.3.x
+    'eos.effects'  # loaded on demand by effect registry
 ]
 
 # Walk directories that do dynamic importing
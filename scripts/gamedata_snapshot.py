@@ -0,0 +1,28 @@
+#!/usr/bin/env python3
+"""
+This script exports gamedata database into columnar snapshot file, which can
+be memory-mapped by read-only worker processes, see eos.gamedataSnapshot
+"""
+
+import argparse
+import os.path
+import sys
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.realpath(os.path.join(script_dir, "..")))
+default_db = os.path.join(script_dir, "..", "eve.db")
+
+from eos.gamedataSnapshot import exportSnapshot, GamedataSnapshot  # noqa: E402
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Export gamedata database into memory-mappable snapshot")
+    parser.add_argument("-d", "--db", type=str, help="path to gamedata database, defaults to current pyfa eve.db", default=default_db)
+    parser.add_argument("-o", "--output", type=str, required=True, help="path to snapshot file")
+    args = parser.parse_args()
+
+    exportSnapshot(os.path.expanduser(args.db), os.path.expanduser(args.output))
+    snapshot = GamedataSnapshot(os.path.expanduser(args.output))
+    print("Exported {} types of gamedata version {} into {} ({} bytes)".format(
+        len(snapshot), snapshot.version, args.output, os.path.getsize(args.output)))
+    snapshot.close()
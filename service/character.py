@@ -28,12 +28,8 @@ from xml.etree import ElementTree
 from xml.dom import minidom
 import gzip
 
-# noinspection PyPackageRequirements
-import wx
-
 import config
 import eos.db
-from service.esi import Esi
 
 from eos.saveddata.implant import Implant as es_Implant
 from eos.saveddata.character import Character as es_Character, Skill
@@ -41,6 +37,12 @@ from eos.saveddata.module import Module as es_Module
 from eos.const import FittingSlot as es_Slot
 from eos.saveddata.fighter import Fighter as es_Fighter
 
+# Only GUI callbacks need the GUI toolkit
+try:
+    import wx
+except ImportError:
+    wx = None
+
 pyfalog = Logger(__name__)
 
 
@@ -473,6 +475,7 @@ class UpdateAPIThread(threading.Thread):
         try:
             char = eos.db.getCharacter(self.charID)
 
+            from service.esi import Esi
             sEsi = Esi.getInstance()
             sChar = Character.getInstance()
             ssoChar = sChar.getSsoCharacter(char.ID)
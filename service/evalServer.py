@@ -0,0 +1,225 @@
+# =============================================================================
+# Copyright (C) 2010 Diego Duclos
+#
+# This file is part of pyfa.
+#
+# pyfa is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# pyfa is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with pyfa.  If not, see <http://www.gnu.org/licenses/>.
+# =============================================================================
+
+"""
+Headless fit evaluation server.
+
+Run with `python -m service.evalServer`, then POST fits to /evaluate, either as
+plain text (single fit in any importable format) or as JSON:
+{"fits": ["<fit text>", ...], "character": "All 5"}
+Response is JSON with one result per passed fit text.
+"""
+
+import http.server
+import json
+import multiprocessing
+import os
+import socketserver
+import urllib.parse
+from optparse import OptionParser
+
+from logbook import Logger
+
+import config
+
+
+pyfalog = Logger(__name__)
+
+# Requests with larger bodies are refused, without reading them
+MAX_REQUEST_SIZE = 8 * 1024 * 1024
+
+
+def setupEnvironment(savePath, saveInRoot, debug, loggingLevel):
+    """Configure paths and logging, has to be done before eos database is imported"""
+    config.saveInRoot = saveInRoot
+    config.debug = debug
+    config.loggingLevel = config.LOGLEVEL_MAP.get(loggingLevel.lower(), config.LOGLEVEL_MAP['error'])
+    config.defPaths(savePath)
+    config.defLogging()
+
+
+def initWorker(*envArgs):
+    """Load gamedata in pool worker process"""
+    setupEnvironment(*envArgs)
+    config.logging_setup.push_application()
+    import eos.db  # noqa: F401
+    import eos.events  # noqa: F401
+    from service.evaluation import Evaluation
+    # Load default character and its skills right away, so that first
+    # evaluation doesn't take longer than the rest
+    Evaluation.getCharacter()
+    pyfalog.debug("Evaluation worker {} is ready", os.getpid())
+
+
+def getEnvArgs():
+    """Environment arguments which configure workers the same way as the current process is configured"""
+    loggingLevel = next((k for k, v in config.LOGLEVEL_MAP.items() if v == config.loggingLevel), 'error')
+    return config.savePath, config.saveInRoot, config.debug, loggingLevel
+
+
+def createPool(workers, envArgs):
+    # Workers are always spawned, so that they don't inherit database
+    # connections of this process, and behave the same on all platforms
+    context = multiprocessing.get_context("spawn")
+    return context.Pool(workers, initializer=initWorker, initargs=envArgs)
+
+
+def evaluateFits(texts, characterName=None):
+    """Evaluate batch of fit texts, returning JSON-serializable result per text"""
+    from service.evaluation import Evaluation, EvaluationError
+    try:
+        return Evaluation.getInstance().evaluateBatch(texts, characterName)
+    except EvaluationError as e:
+        return [{"error": str(e)}] * len(texts)
+    except Exception as e:
+        pyfalog.error("Error evaluating fits")
+        pyfalog.error(e)
+        # Find out which of the fits is broken
+        if len(texts) > 1:
+            return [result for text in texts for result in evaluateFits([text], characterName)]
+        return [{"error": "Unable to evaluate fit: {}".format(e)}]
+
+
+class EvalRequestHandler(http.server.BaseHTTPRequestHandler):
+
+    def do_GET(self):
+        path = urllib.parse.urlparse(self.path).path
+        if path != "/status":
+            self.sendJson(404, {"error": "Not found"})
+            return
+        import eos.config
+        self.sendJson(200, {
+            "workers": self.server.workers,
+            "gamedataVersion": eos.config.gamedata_version,
+            "gamedataDate": eos.config.gamedata_date})
+
+    def do_POST(self):
+        path = urllib.parse.urlparse(self.path).path
+        if path != "/evaluate":
+            self.sendJson(404, {"error": "Not found"})
+            return
+        try:
+            length = int(self.headers.get("Content-Length") or 0)
+        except ValueError:
+            self.sendJson(400, {"error": "Invalid Content-Length"})
+            return
+        if length < 0 or length > MAX_REQUEST_SIZE:
+            self.close_connection = True
+            self.sendJson(413, {"error": "Request body is limited to {} bytes".format(MAX_REQUEST_SIZE)})
+            return
+        body = self.rfile.read(length).decode("utf-8", errors="replace")
+        contentType = (self.headers.get("Content-Type") or "").split(";")[0].strip()
+        if contentType == "application/json":
+            try:
+                payload = json.loads(body)
+                texts = payload["fits"] if "fits" in payload else [payload["fit"]]
+                characterName = payload.get("character")
+            except (ValueError, KeyError, TypeError, AttributeError):
+                self.sendJson(400, {"error": "Expected JSON object with 'fits' list or 'fit' string"})
+                return
+            if not isinstance(texts, list) or not all(isinstance(t, str) for t in texts):
+                self.sendJson(400, {"error": "Fits have to be passed as strings"})
+                return
+        else:
+            texts = [body]
+            characterName = None
+        self.sendJson(200, {"results": self.server.evaluate(texts, characterName)})
+
+    def sendJson(self, code, data):
+        response = json.dumps(data).encode("utf-8")
+        self.send_response(code)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(response)))
+        self.end_headers()
+        self.wfile.write(response)
+
+    def log_message(self, format, *args):
+        pyfalog.debug("{} - {}", self.address_string(), format % args)
+
+
+class EvalServer(socketserver.ThreadingMixIn, socketserver.TCPServer):
+    """
+    HTTP server which evaluates fits in a pool of worker processes. Every
+    worker loads gamedata once on start. With zero workers, evaluation is done
+    in the server process itself, one fit at a time.
+    """
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, address, workers, envArgs):
+        self.workers = workers
+        if workers > 0:
+            self.pool = createPool(workers, envArgs)
+        else:
+            self.pool = None
+        socketserver.TCPServer.__init__(self, address, EvalRequestHandler)
+
+    def evaluate(self, texts, characterName=None):
+        if self.pool is None:
+            return evaluateFits(texts, characterName)
+        # Split fits into batches, so that every worker gets a few of them, and
+        # skill effects are run once per batch
+        batchSize = max(1, -(-len(texts) // (self.workers * 4)))
+        batches = [(texts[i:i + batchSize], characterName) for i in range(0, len(texts), batchSize)]
+        return [result for batch in self.pool.starmap(evaluateFits, batches) for result in batch]
+
+    def server_close(self):
+        socketserver.TCPServer.server_close(self)
+        if self.pool is not None:
+            self.pool.close()
+            self.pool.join()
+
+
+def main():
+    parser = OptionParser(usage="usage: %prog [options]")
+    parser.add_option("-H", "--host", action="store", dest="host", help="Address to listen on", default="127.0.0.1")
+    parser.add_option("-P", "--port", action="store", type="int", dest="port", help="Port to listen on", default=6462)
+    parser.add_option("-w", "--workers", action="store", type="int", dest="workers",
+                      help="Amount of worker processes, 0 to evaluate in server process", default=os.cpu_count() or 1)
+    parser.add_option("-r", "--root", action="store_true", dest="rootsavedata",
+                      help="if you want pyfa to store its data in root folder, use this option", default=False)
+    parser.add_option("-d", "--debug", action="store_true", dest="debug", help="Set logger to debug level.", default=False)
+    parser.add_option("-s", "--savepath", action="store", dest="savepath", help="Set the folder for savedata", default=None)
+    parser.add_option("-l", "--logginglevel", action="store", dest="logginglevel",
+                      help="Set desired logging level [Critical|Error|Warning|Info|Debug]", default="Error")
+    (options, args) = parser.parse_args()
+
+    envArgs = (options.savepath, options.rootsavedata, options.debug, options.logginglevel)
+    setupEnvironment(*envArgs)
+
+    with config.logging_setup.threadbound():
+        import eos.db  # noqa: F401
+        import eos.events  # noqa: F401
+        # Migrate and validate saved data once, before workers start to use it
+        import service.prefetch  # noqa: F401
+        from service.evaluation import Evaluation
+        Evaluation.getCharacter()
+
+        server = EvalServer((options.host, options.port), options.workers, envArgs)
+        pyfalog.info("Fit evaluation server listening on {}:{} with {} workers", options.host, options.port, options.workers)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,172 @@
+# =============================================================================
+# Copyright (C) 2010 Diego Duclos
+#
+# This file is part of pyfa.
+#
+# pyfa is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# pyfa is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with pyfa.  If not, see <http://www.gnu.org/licenses/>.
+# =============================================================================
+
+import threading
+
+from logbook import Logger
+
+import eos.config
+import eos.db
+from eos.calcOnly import isCalcOnly, toCalcOnly
+from eos.const import ImplantLocation
+from service.fit import Fit as svcFit
+from service.fitStatsCache import collectFitStats
+from service.port import Port
+
+
+pyfalog = Logger(__name__)
+
+
+class EvaluationError(Exception):
+    pass
+
+
+class Evaluation:
+    """
+    Service which calculates stats of fits passed as text, without showing
+    them in the GUI or saving them.
+    """
+    instance = None
+
+    @classmethod
+    def getInstance(cls):
+        if cls.instance is None:
+            cls.instance = Evaluation()
+
+        return cls.instance
+
+    def __init__(self):
+        # Calculation engine is not thread-safe, so only one evaluation
+        # can run at a time within single process
+        self.lock = threading.RLock()
+
+    @staticmethod
+    def getCharacter(name=None):
+        """Get saved character by name, or default fitting character if name is not specified"""
+        if name is None:
+            return svcFit.getInstance().character
+        character = eos.db.getCharacter(name)
+        if character is None:
+            raise EvaluationError("Unknown character: {}".format(name))
+        return character
+
+    @classmethod
+    def importFits(cls, text, character=None, calcOnly=False):
+        """
+        Parse fits in any format supported by import (EFT, DNA, ESI, XML),
+        setting them up the same way as fits imported via GUI are. With
+        calcOnly, calculation-only copies of the fits are returned.
+        Returns import type and list of fits.
+        """
+        try:
+            importType, makesNewFits, importData = Port.importAuto(text)
+        except Exception as e:
+            raise EvaluationError("Unable to parse fit: {}".format(e))
+        if not makesNewFits:
+            raise EvaluationError("Passed data does not describe a fit")
+        fits = [fit for fit in importData if fit is not None]
+        if not fits:
+            raise EvaluationError("Passed data does not describe a fit")
+
+        sFit = svcFit.getInstance()
+        for fit in fits:
+            fit.character = character if character is not None else sFit.character
+            fit.damagePattern = sFit.pattern
+            fit.targetProfile = sFit.targetProfile
+            if len(fit.implants) > 0:
+                fit.implantLocation = ImplantLocation.FIT
+            else:
+                useCharImplants = sFit.serviceFittingOptions["useCharacterImplantsByDefault"]
+                fit.implantLocation = ImplantLocation.CHARACTER if useCharImplants else ImplantLocation.FIT
+        if calcOnly:
+            calcFits = [toCalcOnly(fit) for fit in fits]
+            for fit in fits:
+                cls.discardFit(fit)
+            fits = calcFits
+        return importType, fits
+
+    @staticmethod
+    def discardFit(fit):
+        """
+        Detach evaluated fit from saved data. Assigning saved character to
+        a fit puts the fit into saveddata session, where it would otherwise
+        stay until the next commit.
+        """
+        fit.character = None
+        if isCalcOnly(fit):
+            return
+        with eos.db.sd_lock:
+            if fit in eos.db.saveddata_session:
+                eos.db.saveddata_session.expunge(fit)
+
+    def evaluate(self, text, characterName=None):
+        """
+        Calculate stats for all fits in passed text. Returns import type
+        and list of stats dictionaries, one per fit.
+        """
+        with self.lock:
+            character = self.getCharacter(characterName)
+            importType, fits = self.importFits(text, character, calcOnly=True)
+            try:
+                self.calculateFits(fits, character)
+                stats = [self.getFitStats(fit) for fit in fits]
+            finally:
+                for fit in fits:
+                    self.discardFit(fit)
+        return importType, stats
+
+    def evaluateBatch(self, texts, characterName=None):
+        """
+        Calculate stats for fits in multiple texts, all with the same character.
+        Skill effects are run only once for the whole batch. Returns list with
+        result per text: dictionary with import format and stats of its fits,
+        or with error message if the text couldn't be evaluated.
+        """
+        with self.lock:
+            character = self.getCharacter(characterName)
+            results = []
+            with character.sharedSkillModifiers():
+                for text in texts:
+                    try:
+                        importType, stats = self.evaluate(text, characterName)
+                    except EvaluationError as e:
+                        results.append({"error": str(e)})
+                    else:
+                        results.append({"format": importType, "fits": stats})
+        return results
+
+    @staticmethod
+    def calculateFits(fits, character=None):
+        """
+        Calculate fits from scratch. Fits which use the same character share
+        results of its skill effects.
+        """
+        byCharacter = {}
+        for fit in fits:
+            byCharacter.setdefault(fit.character if character is None else character, []).append(fit)
+        for fitCharacter, characterFits in byCharacter.items():
+            with fitCharacter.sharedSkillModifiers():
+                for fit in characterFits:
+                    fit.clear()
+                    fit.calculateModifiedAttributes()
+
+    @staticmethod
+    def getFitStats(fit, spoolOptions=None):
+        """Compose dictionary with main stats of calculated fit"""
+        return collectFitStats(fit, spoolOptions)
@@ -18,14 +18,13 @@
 # ===============================================================================
 
 import copy
-import datetime
 from time import time
 from weakref import WeakSet
 
-import wx
 from logbook import Logger
 
 import eos.db
+from eos.calcProfiler import CalcProfiler
 from eos.const import FittingModuleState, ImplantLocation
 from eos.saveddata.character import Character as saveddata_Character
 from eos.saveddata.citadel import Citadel as es_Citadel
@@ -34,11 +33,22 @@ from eos.saveddata.fit import Fit as FitType
 from eos.saveddata.ship import Ship as es_Ship
 from service.character import Character
 from service.damagePattern import DamagePattern
+from service.fitStatsCache import FitStatsCache, collectFitStats
+from service.recalcScheduler import RecalcScheduler
 from service.settings import SettingsProvider
 
+# Only command history of GUI needs the GUI toolkit
+try:
+    import wx
+except ImportError:
+    wx = None
+
 
 pyfalog = Logger(__name__)
 
+# Stats of recalculated fit are stored once it was not changed for this long, in milliseconds
+STATS_STORE_DELAY = 1000
+
 
 class DeferRecalc:
     def __init__(self, fitID):
@@ -72,6 +82,10 @@ class Fit:
         self.character = saveddata_Character.getAll5()
         self.booster = False
         self._loadedFits = WeakSet()
+        # Profiler recalculations are run under, when profiling is enabled
+        self.calcProfiler = None
+        # Timers which store stats of recalculated fits, {fit ID: timer}
+        self.statsTimers = {}
 
         serviceFittingDefaultOptions = {
             "useGlobalCharacter": False,
@@ -92,6 +106,10 @@ class Fit:
             "showShipBrowserTooltip": True,
             "marketSearchDelay": 250,
             "ammoChangeAll": False,
+            # Incremental recalculation is opt-in until it has seen more use
+            "incrementalRecalc": False,
+            "coalesceRecalc": True,
+            "coalesceRecalcDelay": 50,
         }
 
         self.serviceFittingOptions = SettingsProvider.getInstance().getSettings(
@@ -122,15 +140,12 @@ class Fit:
     def getFitsWithShip(shipID):
         """ Lists fits of shipID, used with shipBrowser """
         pyfalog.debug("Fetching all fits for ship ID: {0}", shipID)
-        fits = eos.db.getFitsWithShip(shipID)
+        fits = eos.db.getFitSummariesWithShip(shipID)
+        ship = eos.db.getItem(shipID)
+        graphicID = ship.graphicID if ship is not None else None
         names = []
-        for fit in fits:
-            names.append((fit.ID,
-                          fit.name,
-                          fit.booster,
-                          fit.modified or fit.created or datetime.datetime.fromtimestamp(fit.timestamp),
-                          fit.notes,
-                          fit.ship.item.graphicID))
+        for fitID, name, booster, modified, notes in fits:
+            names.append((fitID, name, booster, modified, notes, graphicID))
 
         return names
 
@@ -141,10 +156,11 @@ class Fit:
         fits = eos.db.getRecentFits()
         returnInfo = []
 
-        for fit in fits:
-            item = eos.db.getItem(fit[1])
-            returnInfo.append((fit[0], fit[2], fit[3] or fit[4] or datetime.datetime.fromtimestamp(fit[5]), item, fit[6]))
-            #                  ID      name    timestamps                                                   item  notes
+        for fitID, shipID, name, modified, notes in fits:
+            item = eos.db.getItem(shipID)
+            if item is None:
+                continue
+            returnInfo.append((fitID, name, modified, item, notes))
 
         return returnInfo
 
@@ -217,6 +233,11 @@ class Fit:
                 refreshFits.add(booster.boosted_fit)
 
         eos.db.remove(fit)
+        FitStatsCache.getInstance().remove(fitID)
+        RecalcScheduler.getInstance().cancel(fitID)
+        timer = Fit.getInstance().statsTimers.pop(fitID, None)
+        if timer is not None:
+            timer.Stop()
 
         if fitID in Fit.processors:
             del Fit.processors[fitID]
@@ -347,21 +368,84 @@ class Fit:
             fit.inited = True
         return fit
 
+    def getFitStats(self, fitID, calculate=True):
+        """
+        Get summary of fit stats. Stats are served from persistent stats cache
+        when fit, its character and calculation settings did not change since they
+        were stored; otherwise fit is calculated, and its stats are stored.
+
+        With calculate flag off, fit is neither loaded nor calculated for this. If
+        it is not calculated already, stats stored after its last recalc are
+        served as they are, or None if there are none.
+        """
+        if not calculate:
+            fit = self.__getLoadedFit(fitID)
+            if fit is None or not fit.calculated:
+                return FitStatsCache.getInstance().getLatest(fitID)
+            return self.__getCachedStats(fit)
+        fit = self.getFit(fitID)
+        if fit is None:
+            return None
+        if not fit.calculated:
+            self.recalc(fit)
+        return self.__getCachedStats(fit)
+
+    def storeFitStats(self, fitID):
+        """Store stats of the fit in stats cache, if it is calculated"""
+        timer = self.statsTimers.pop(fitID, None)
+        if timer is not None:
+            timer.Stop()
+        fit = self.__getLoadedFit(fitID)
+        if fit is not None and fit.calculated:
+            self.__getCachedStats(fit)
+
+    def __scheduleStatsStore(self, fitID):
+        # Stats are collected once the fit is left alone for a while, so that
+        # quick series of changes do not wait for them
+        if wx is None or wx.GetApp() is None:
+            self.storeFitStats(fitID)
+            return
+        wx.CallAfter(self.__restartStatsTimer, fitID)
+
+    def __restartStatsTimer(self, fitID):
+        timer = self.statsTimers.get(fitID)
+        if timer is not None:
+            timer.Restart(STATS_STORE_DELAY)
+        else:
+            self.statsTimers[fitID] = wx.CallLater(STATS_STORE_DELAY, self.storeFitStats, fitID)
+
+    def __getLoadedFit(self, fitID):
+        for fit in self._loadedFits:
+            if fit.ID == fitID:
+                return fit
+        return None
+
+    def __getCachedStats(self, fit):
+        """Get stats of calculated fit from stats cache, storing them there on a miss"""
+        statsCache = FitStatsCache.getInstance()
+        fitHash = statsCache.getFitHash(fit, self.serviceFittingOptions["useGlobalForceReload"])
+        stats = statsCache.get(fitHash)
+        if stats is None:
+            stats = collectFitStats(fit)
+            statsCache.store(fitHash, fit.ID, stats)
+        stats["name"] = fit.name
+        return stats
+
     @staticmethod
     def searchFits(name):
         pyfalog.debug("Searching for fit: {0}", name)
-        results = eos.db.searchFits(name)
+        results = eos.db.searchFitSummaries(name)
+        ships = {}
         fits = []
 
-        for fit in sorted(results, key=lambda f: (f.ship.item.group.name, f.ship.item.name, f.name)):
-            fits.append((
-                fit.ID,
-                fit.name,
-                fit.ship.item.ID,
-                fit.ship.item.name,
-                fit.booster,
-                fit.modifiedCoalesce,
-                fit.notes))
+        for fitID, fitName, shipID, booster, modified, notes in results:
+            if shipID not in ships:
+                ships[shipID] = eos.db.getItem(shipID)
+            ship = ships[shipID]
+            if ship is None:
+                continue
+            fits.append((fitID, fitName, ship.ID, ship.name, booster, modified, notes))
+        fits.sort(key=lambda f: (ships[f[2]].group.name, f[3], f[1]))
         return fits
 
     def changeMutatedValuePrelim(self, mutator, value):
@@ -512,9 +596,40 @@ class Fit:
         pyfalog.info("=" * 10 + "recalc: {0}" + "=" * 10, fit.name)
 
         fit.factorReload = self.serviceFittingOptions["useGlobalForceReload"]
-        fit.clear()
-        fit.calculateModifiedAttributes()
-        pyfalog.info("=" * 10 + "recalc time: " + str(time() - start_time) + "=" * 10)
+        incremental = self.serviceFittingOptions["incrementalRecalc"]
+        profiler = self.calcProfiler
+        if profiler is not None:
+            with profiler:
+                self.__calculate(fit, incremental)
+        else:
+            self.__calculate(fit, incremental)
+        recalcTime = time() - start_time
+        if profiler is not None:
+            profiler.addRecalc(fit.name, "incremental" if incremental else "full", recalcTime)
+        pyfalog.info("=" * 10 + "recalc time: " + str(recalcTime) + "=" * 10)
+        # Fits which are not saved yet, like the ones being imported, have no stats to store
+        if fit.ID is not None:
+            self.__scheduleStatsStore(fit.ID)
+
+    @staticmethod
+    def __calculate(fit, incremental):
+        if incremental:
+            fit.updateModifiedAttributes()
+        else:
+            fit.clear()
+            fit.calculateModifiedAttributes()
+
+    def startProfiling(self):
+        """Start collecting per-effect stats of fit recalculations, returns the profiler"""
+        if self.calcProfiler is None:
+            self.calcProfiler = CalcProfiler()
+        return self.calcProfiler
+
+    def stopProfiling(self):
+        """Stop collecting stats of fit recalculations, returns profiler with stats collected so far"""
+        profiler = self.calcProfiler
+        self.calcProfiler = None
+        return profiler
 
     def fill(self, fit):
         if isinstance(fit, int):
@@ -0,0 +1,325 @@
+# =============================================================================
+# Copyright (C) 2010 Diego Duclos
+#
+# This file is part of pyfa.
+#
+# pyfa is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# pyfa is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with pyfa.  If not, see <http://www.gnu.org/licenses/>.
+# =============================================================================
+
+"""
+Search for module combinations which maximize chosen stat of a fit.
+
+Empty module slots of the fit are filled one by one with beam search. Every
+candidate is first probed alone on the fit, and children of search states are
+estimated from those probes: estimates are used to drop children which cannot
+fit even if the rest of the slots is filled with the cheapest candidates, and
+to calculate only the most promising children. Calculated states are memoized,
+and calculations are done in a pool of worker processes, like with variation
+sweeps; states of the fit which EFT text loses are restored the same way too.
+"""
+
+import os
+import threading
+
+from logbook import Logger
+
+import eos.db
+from eos.const import FittingModuleState, FittingSlot
+from eos.saveddata.module import Module
+from service.variationSweep import VariationSweepError, applyFitStates, getFitStates, getSweepStats
+
+
+pyfalog = Logger(__name__)
+
+OPTIMIZED_SLOTS = (FittingSlot.HIGH, FittingSlot.MED, FittingSlot.LOW, FittingSlot.RIG)
+
+# Stats which are compared against ship output when checking if fit fits
+RESOURCES = (("cpuUsed", "cpuOutput"), ("powerUsed", "powerOutput"), ("calibrationUsed", "calibration"))
+
+
+def getSustainedTank(fit):
+    tank = fit.effectiveSustainableTank
+    return sum(tank[k] for k in ("passiveShield", "shieldRepair", "armorRepair", "hullRepair"))
+
+
+# {objective name: (display name, function which gets its value from calculated fit)}
+OBJECTIVES = {
+    "dps": ("DPS", lambda fit, stats: stats["dps"]),
+    "ehp": ("EHP", lambda fit, stats: stats["ehp"]),
+    "tank": ("Sustained tank", lambda fit, stats: getSustainedTank(fit)),
+    "speed": ("Speed", lambda fit, stats: fit.maxSpeed)}
+
+
+class FitOptimizerError(Exception):
+    pass
+
+
+def evaluateStates(fitText, states, objective, characterName=None, damagePatternID=None, fitStates=None):
+    """
+    Calculate fit with every passed state fitted into its empty slots. State is a list
+    of (item ID, charge ID) pairs; fit states are the ones collected by getFitStates().
+    Returns dictionary with stats per state.
+    """
+    from service.evaluation import Evaluation, EvaluationError
+    getObjective = OBJECTIVES[objective][1]
+    evaluation = Evaluation.getInstance()
+    with evaluation.lock:
+        character = evaluation.getCharacter(characterName)
+        importType, fits = evaluation.importFits(fitText, character)
+        fit = fits[0]
+        try:
+            damagePattern = eos.db.getDamagePattern(damagePatternID) if damagePatternID is not None else None
+            if damagePattern is not None:
+                fit.damagePattern = damagePattern
+            if fitStates is not None:
+                applyFitStates(fit, fitStates)
+            results = []
+            with character.sharedSkillModifiers():
+                # Amount of slots can depend on fitted subsystems, so slots are
+                # filled with dummies only once fit is calculated
+                fit.updateModifiedAttributes()
+                fit.fill()
+                for state in states:
+                    placed = []
+                    for itemID, chargeID in state:
+                        mod = Module(eos.db.getItem(itemID))
+                        if chargeID is not None:
+                            mod.charge = eos.db.getItem(chargeID)
+                        mod.state = mod.getMaxState(proposedState=FittingModuleState.ACTIVE)
+                        position = next((i for i, m in enumerate(fit.modules) if m.isEmpty and m.slot == mod.slot), None)
+                        if position is None:
+                            break
+                        fit.modules.replace(position, mod)
+                        if mod not in fit.modules:
+                            break
+                        placed.append(position)
+                    else:
+                        fit.updateModifiedAttributes()
+                        stats = getSweepStats(fit, [fit.modules[position] for position in placed])
+                        stats["objective"] = getObjective(fit, stats)
+                        results.append(stats)
+                    if len(placed) < len(state):
+                        results.append({"error": "Unable to fit {}".format(eos.db.getItem(itemID).name)})
+                    for position in placed:
+                        fit.modules.free(position)
+        except (EvaluationError, VariationSweepError) as e:
+            return [{"error": str(e)}] * len(states)
+        finally:
+            evaluation.discardFit(fit)
+    return results
+
+
+def getStateKey(state):
+    return tuple(sorted(choice for choice in state if choice is not None))
+
+
+class SearchState:
+    """Modules chosen for the first few empty slots, with stats of the fit they make"""
+    __slots__ = ("choices", "stats")
+
+    def __init__(self, choices, stats):
+        # Candidate index per filled slot, None for slots left empty
+        self.choices = choices
+        self.stats = stats
+
+
+class FitOptimizer:
+    instance = None
+
+    @classmethod
+    def getInstance(cls):
+        if cls.instance is None:
+            cls.instance = FitOptimizer()
+
+        return cls.instance
+
+    def __init__(self):
+        self.pool = None
+        self.workers = 0
+        self.lock = threading.Lock()
+
+    def getPool(self, workers):
+        if self.pool is not None and self.workers == workers:
+            return self.pool
+        self.close()
+        from service.evalServer import createPool, getEnvArgs
+        self.pool = createPool(workers, getEnvArgs())
+        self.workers = workers
+        return self.pool
+
+    def close(self, terminate=False):
+        """Shut worker processes down; with terminate, running evaluation is aborted"""
+        pool, self.pool = self.pool, None
+        self.workers = 0
+        if pool is not None:
+            if terminate:
+                pool.terminate()
+            else:
+                pool.close()
+            pool.join()
+
+    def optimize(self, fit, candidatesBySlot, objective, beamWidth=10, expansion=3, results=10, workers=None):
+        """
+        Fill empty slots of the fit with candidates, maximizing objective (one of OBJECTIVES).
+        Candidates are passed as {slot: [(item ID, charge ID)]} dictionary. Every search step
+        keeps beamWidth best states, and calculates at most beamWidth * expansion of their
+        children. Returns list of best fitting combinations, each with {slot: [(item ID, charge ID)]}
+        under "items" key, and with stats of the fit.
+        """
+        if objective not in OBJECTIVES:
+            raise FitOptimizerError("Unknown objective: {}".format(objective))
+        from service.port import Port
+        from service.port.eft import EFT_OPTIONS
+        eftOptions = {option[0]: option[3] for option in EFT_OPTIONS}
+        # Export can load data from the database, which other threads might be using. Fits are
+        # changed by commands on the main thread, so fit is read here before the search starts
+        with eos.db.sd_lock:
+            fitText = Port.exportEft(fit, eftOptions)
+            fitStates = getFitStates(fit)
+            freeSlots = [
+                mod.slot for mod in fit.modules
+                if mod.isEmpty and mod.slot in OPTIMIZED_SLOTS and candidatesBySlot.get(mod.slot)]
+            characterName = fit.character.name if fit.character is not None else None
+            damagePatternID = fit.damagePattern.ID if fit.damagePattern is not None else None
+        if workers is None:
+            workers = max(1, min(4, (os.cpu_count() or 2) - 1))
+        search = BeamSearch(
+            self, fitText, freeSlots, candidatesBySlot, objective, characterName, damagePatternID, workers,
+            fitStates)
+        return search.run(beamWidth, expansion, results)
+
+    def evaluate(self, args, states, workers):
+        if workers == 0:
+            return evaluateStates(args[0], states, *args[1:])
+        # Every worker gets a few batches, and updates its fit incrementally within a batch
+        batchSize = max(1, -(-len(states) // (workers * 4)))
+        batches = [(args[0], states[i:i + batchSize]) + args[1:] for i in range(0, len(states), batchSize)]
+        with self.lock:
+            pool = self.getPool(workers)
+            return [result for batch in pool.starmap(evaluateStates, batches) for result in batch]
+
+
+class BeamSearch:
+
+    def __init__(
+            self, optimizer, fitText, freeSlots, candidatesBySlot, objective, characterName, damagePatternID, workers,
+            fitStates=None):
+        self.optimizer = optimizer
+        self.args = (fitText, objective, characterName, damagePatternID, fitStates)
+        self.workers = workers
+        # Group slots of the same kind together, so that every combination
+        # of modules within a rack is searched only once
+        self.slots = sorted(freeSlots, key=OPTIMIZED_SLOTS.index)
+        self.candidates = {slot: list(candidatesBySlot[slot]) for slot in set(self.slots)}
+        self.candidateSlots = {c: slot for slot, candidates in self.candidates.items() for c in candidates}
+        # {state key: stats}
+        self.memo = {}
+        self.calculated = 0
+
+    def getChoice(self, depth, index):
+        return self.candidates[self.slots[depth]][index] if index is not None else None
+
+    def getState(self, choices):
+        return [self.getChoice(depth, index) for depth, index in enumerate(choices)]
+
+    def calculate(self, states):
+        """Get stats of every state, calculating the ones which are not memoized yet"""
+        missing = list(dict.fromkeys(key for key in map(getStateKey, states) if key not in self.memo))
+        if missing:
+            for key, stats in zip(missing, self.optimizer.evaluate(self.args, missing, self.workers)):
+                self.memo[key] = stats
+            self.calculated += len(missing)
+        return [self.memo[getStateKey(state)] for state in states]
+
+    def getMargins(self):
+        """Calculate change of fit stats each candidate brings when fitted alone"""
+        probes = [()] + [(c,) for slot in self.candidates for c in self.candidates[slot]]
+        base, *probeStats = self.calculate(probes)
+        if "error" in base:
+            raise FitOptimizerError(base["error"])
+        margins = {}
+        for (candidate,), stats in zip(probes[1:], probeStats):
+            if "error" in stats:
+                continue
+            margins[candidate] = {k: stats[k] - base[k] for k in ("objective",) + sum(RESOURCES, ())}
+        return base, margins
+
+    def getRemainingSlack(self, margins):
+        """
+        For every depth, get the most resources which can be freed by filling remaining slots;
+        anything but resource-adding modules frees nothing, as slots can be left empty
+        """
+        remaining = [(0, 0, 0)]
+        for slot in reversed(self.slots):
+            slack = []
+            for used, output in RESOURCES:
+                nets = [margins[c][used] - margins[c][output] for c in self.candidates[slot] if c in margins]
+                slack.append(min(0, min(nets, default=0)))
+            remaining.append(tuple(a + b for a, b in zip(remaining[-1], slack)))
+        return remaining[::-1]
+
+    @staticmethod
+    def canFit(stats, slack):
+        return all(stats[used] - stats[output] + s <= 0 for (used, output), s in zip(RESOURCES, slack))
+
+    def run(self, beamWidth, expansion, resultCount):
+        base, margins = self.getMargins()
+        slack = self.getRemainingSlack(margins)
+        beam = [SearchState((), base)]
+        found = {(): base} if base["fits"] else {}
+        for depth, slot in enumerate(self.slots):
+            # Estimate children of every state in the beam from the margins of their candidates
+            children = []
+            for parent in beam:
+                # Within a rack, candidates are picked in order, and once slot is left empty, rest
+                # of the rack is left empty as well; this way every combination is visited once
+                previous = parent.choices[-1] if depth > 0 and self.slots[depth - 1] == slot else 0
+                if previous is None:
+                    children.append((parent.stats["objective"], parent.choices + (None,)))
+                    continue
+                for index in range(previous, len(self.candidates[slot])):
+                    margin = margins.get(self.candidates[slot][index])
+                    if margin is None:
+                        continue
+                    estimate = {k: parent.stats[k] + v for k, v in margin.items()}
+                    if not self.canFit(estimate, slack[depth + 1]):
+                        continue
+                    children.append((estimate["objective"], parent.choices + (index,)))
+                children.append((parent.stats["objective"], parent.choices + (None,)))
+            # Only the most promising children are calculated
+            children.sort(key=lambda child: child[0], reverse=True)
+            children = [choices for estimate, choices in children[:beamWidth * expansion]]
+            beam = []
+            for choices, stats in zip(children, self.calculate([self.getState(c) for c in children])):
+                if "error" in stats or not self.canFit(stats, slack[depth + 1]):
+                    continue
+                # Restrictions other than resource limits cannot be lifted by fitting more modules
+                if not stats["fits"] and self.canFit(stats, (0, 0, 0)):
+                    continue
+                beam.append(SearchState(choices, stats))
+                if stats["fits"]:
+                    found[getStateKey(self.getState(choices))] = stats
+            beam.sort(key=lambda state: state.stats["objective"], reverse=True)
+            beam = beam[:beamWidth]
+            if not beam:
+                break
+        pyfalog.debug("Fit optimization calculated {} states", self.calculated)
+        best = sorted(found.items(), key=lambda item: item[1]["objective"], reverse=True)[:resultCount]
+        results = []
+        for key, stats in best:
+            items = {}
+            for candidate in key:
+                items.setdefault(self.candidateSlots[candidate], []).append(candidate)
+            results.append(dict(stats, items=items))
+        return results
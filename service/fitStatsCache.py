@@ -0,0 +1,210 @@
+# =============================================================================
+# Copyright (C) 2010 Diego Duclos
+#
+# This file is part of pyfa.
+#
+# pyfa is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# pyfa is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with pyfa.  If not, see <http://www.gnu.org/licenses/>.
+# =============================================================================
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+
+from logbook import Logger
+
+import config
+import eos.config
+from eos.calcJournal import CalcJournal
+from eos.const import ImplantLocation
+from eos.utils.spoolSupport import SpoolOptions, SpoolType
+
+
+pyfalog = Logger(__name__)
+
+# Engine settings which change results of calculation
+CALC_SETTINGS = ("useStaticAdaptiveArmorHardener", "strictSkillLevels", "globalDefaultSpoolupPercentage")
+
+# Signature radii of common targets, lock times are reported against them
+LOCK_RADII = (
+    ("Pod", 25), ("Interceptor", 33), ("Frigate", 38),
+    ("Destroyer", 83), ("Cruiser", 130),
+    ("Battlecruiser", 265), ("Battleship", 420),
+    ("Carrier", 3000))
+
+
+def getCharacterSignature(character, withImplants):
+    if character is None:
+        return None
+    return (
+        character.alphaCloneID,
+        tuple(sorted((skill.itemID, skill.level) for skill in character.skills)),
+        tuple((implant.itemID, implant.active) for implant in character.implants) if withImplants else None)
+
+
+def getFitSignature(fit, forceReload=False, seen=None):
+    """Collect everything stats of the fit depend on, besides gamedata"""
+    if seen is None:
+        seen = set()
+    seen.add(fit.ID)
+    # Empty slots, which are added when fit is filled, change nothing
+    modules = [mod for mod in fit.modules if not mod.isEmpty]
+    sources = [fit.ship, fit.mode]
+    for items in (
+        modules, fit.drones, fit.fighters, fit.implants, fit.boosters,
+        fit.projectedModules, fit.projectedDrones, fit.projectedFighters
+    ):
+        sources.extend(items)
+    damagePattern = fit.damagePattern
+    targetProfile = fit.targetProfile
+    # Fits which affect this one are included with their contents, unless
+    # they were already seen higher up the chain
+    otherFits = []
+    for otherFit in fit.commandFits:
+        info = otherFit.getCommandInfo(fit.ID)
+        if info is None:
+            continue
+        otherFits.append(("command", info.active, None) + (
+            (otherFit.ID,) if otherFit.ID in seen else (getFitSignature(otherFit, forceReload, seen),)))
+    for otherFit in fit.projectedFits:
+        info = otherFit.getProjectionInfo(fit.ID)
+        if info is None:
+            continue
+        otherFits.append(("projected", info.active, info.amount) + (
+            (otherFit.ID,) if otherFit.ID in seen else (getFitSignature(otherFit, forceReload, seen),)))
+    return (
+        fit.shipID,
+        fit.implantLocation,
+        getCharacterSignature(fit.character, fit.implantLocation == ImplantLocation.CHARACTER),
+        fit.systemSecurity,
+        forceReload,
+        tuple(CalcJournal.sourceSignature(source) for source in sources),
+        tuple((mod.spoolType, mod.spoolAmount) for mod in modules),
+        (damagePattern.emAmount, damagePattern.thermalAmount, damagePattern.kineticAmount,
+         damagePattern.explosiveAmount) if damagePattern is not None else None,
+        (targetProfile.emAmount, targetProfile.thermalAmount, targetProfile.kineticAmount,
+         targetProfile.explosiveAmount, targetProfile.maxVelocity, targetProfile.signatureRadius,
+         targetProfile.radius) if targetProfile is not None else None,
+        tuple(otherFits))
+
+
+def collectFitStats(fit, spoolOptions=None):
+    """Compose dictionary with main stats of calculated fit"""
+    if spoolOptions is None:
+        defaultSpoolValue = eos.config.settings['globalDefaultSpoolupPercentage']
+        spoolOptions = SpoolOptions(SpoolType.SCALE, defaultSpoolValue, False)
+    fitModAttr = fit.ship.getModifiedItemAttr
+    weaponDps = fit.getWeaponDps(spoolOptions=spoolOptions)
+    droneDps = fit.getDroneDps()
+    totalDps = weaponDps + droneDps
+    weaponVolley = fit.getWeaponVolley(spoolOptions=spoolOptions)
+    droneVolley = fit.getDroneVolley()
+    ehp = fit.ehp
+    return {
+        "name": fit.name,
+        "ship": fit.ship.item.name,
+        "typeID": fit.shipID,
+        "dps": {
+            "weapon": weaponDps.total, "drone": droneDps.total, "total": totalDps.total,
+            "em": totalDps.em, "thermal": totalDps.thermal,
+            "kinetic": totalDps.kinetic, "explosive": totalDps.explosive},
+        "volley": {
+            "weapon": weaponVolley.total, "drone": droneVolley.total,
+            "total": (weaponVolley + droneVolley).total},
+        "hp": fit.hp,
+        "ehp": dict(ehp, total=sum(ehp.values())),
+        "capacitor": {
+            "capacity": fitModAttr("capacitorCapacity"), "rechargeRate": fitModAttr("rechargeRate"),
+            "stable": fit.capStable, "state": fit.capState,
+            "used": fit.capUsed, "recharge": fit.capRecharge},
+        "navigation": {
+            "maxSpeed": fit.maxSpeed, "alignTime": fit.alignTime, "warpSpeed": fit.warpSpeed,
+            "signatureRadius": fitModAttr("signatureRadius"), "mass": fitModAttr("mass")},
+        "targeting": {
+            "maxTargets": fit.maxTargets, "maxTargetRange": fit.maxTargetRange,
+            "scanResolution": fitModAttr("scanResolution"), "scanStrength": fit.scanStrength,
+            "scanType": fit.scanType,
+            "lockTimes": {size: fit.calculateLockTime(radius) for size, radius in LOCK_RADII}},
+        "resources": {
+            "cpuUsed": fit.cpuUsed, "cpuOutput": fitModAttr("cpuOutput"),
+            "powerUsed": fit.pgUsed, "powerOutput": fitModAttr("powerOutput"),
+            "calibrationUsed": fit.calibrationUsed, "calibration": fitModAttr("upgradeCapacity")}}
+
+
+class FitStatsCache:
+    """
+    Persistent cache of fit stats, kept next to saved data. Stats are stored
+    under hash of fit contents, character skills, calculation settings and
+    gamedata version, so any of those changing just makes the fit miss the cache.
+    """
+    instance = None
+
+    @classmethod
+    def getInstance(cls):
+        if cls.instance is None:
+            cls.instance = FitStatsCache()
+
+        return cls.instance
+
+    def __init__(self, path=None):
+        self.path = path if path is not None else os.path.join(config.savePath, "fitstats.db")
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.connection = sqlite3.connect(self.path, check_same_thread=False)
+        with self.connection:
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS fitStats (hash TEXT PRIMARY KEY, fitID INTEGER NOT NULL, stats TEXT NOT NULL)")
+            self.connection.execute("CREATE INDEX IF NOT EXISTS ix_fitStats_fitID ON fitStats (fitID)")
+
+    @staticmethod
+    def getFitHash(fit, forceReload=False):
+        signature = (
+            eos.config.gamedata_version,
+            tuple(eos.config.settings[key] for key in CALC_SETTINGS),
+            getFitSignature(fit, forceReload))
+        return hashlib.sha1(repr(signature).encode("utf-8")).hexdigest()
+
+    def get(self, fitHash):
+        """Get stats stored under the hash, or None"""
+        with self.lock:
+            row = self.connection.execute("SELECT stats FROM fitStats WHERE hash = ?", (fitHash,)).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        return json.loads(row[0])
+
+    def getLatest(self, fitID):
+        """Get stats stored last for the fit, whether they are up to date or not, or None"""
+        with self.lock:
+            row = self.connection.execute("SELECT stats FROM fitStats WHERE fitID = ?", (fitID,)).fetchone()
+        return json.loads(row[0]) if row is not None else None
+
+    def store(self, fitHash, fitID, stats):
+        """Store stats of the fit, replacing stats of its older versions"""
+        data = json.dumps(stats)
+        with self.lock, self.connection:
+            self.connection.execute("DELETE FROM fitStats WHERE fitID = ? AND hash != ?", (fitID, fitHash))
+            self.connection.execute("INSERT OR REPLACE INTO fitStats (hash, fitID, stats) VALUES (?, ?, ?)", (fitHash, fitID, data))
+
+    def remove(self, fitID):
+        with self.lock, self.connection:
+            self.connection.execute("DELETE FROM fitStats WHERE fitID = ?", (fitID,))
+
+    def clear(self):
+        with self.lock, self.connection:
+            self.connection.execute("DELETE FROM fitStats")
+        pyfalog.debug("Fit stats cache cleared")
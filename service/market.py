@@ -21,8 +21,6 @@ import queue
 import threading
 from collections import OrderedDict
 
-# noinspection PyPackageRequirements
-import wx
 from logbook import Logger
 from sqlalchemy.sql import or_
 
@@ -34,6 +32,12 @@ from service import conversions
 from service.jargon import JargonLoader
 from service.settings import SettingsProvider
 
+# GUI toolkit is used only to call back the GUI from worker threads
+try:
+    import wx
+except ImportError:
+    wx = None
+
 pyfalog = Logger(__name__)
 
 # Event which tells threads dependent on Market that it's initialized
@@ -45,10 +49,10 @@ class ShipBrowserWorkerThread(threading.Thread):
         threading.Thread.__init__(self)
         pyfalog.debug("Initialize ShipBrowserWorkerThread.")
         self.name = "ShipBrowser"
-
-    def run(self):
         self.queue = queue.Queue()
         self.cache = {}
+
+    def run(self):
         # Wait for full market initialization (otherwise there's high risky
         # this thread will attempt to init Market which is already being inited)
         mktRdy.wait(5)
@@ -86,10 +90,10 @@ class SearchWorkerThread(threading.Thread):
         # load the jargon while in an out-of-thread context, to spot any problems while in the main thread
         self.jargonLoader.get_jargon()
         self.jargonLoader.get_jargon().apply('test string')
-
-    def run(self):
         self.cv = threading.Condition()
         self.searchRequest = None
+
+    def run(self):
         self.processSearches()
 
     def processSearches(self):
@@ -121,7 +125,7 @@ class SearchWorkerThread(threading.Thread):
                                              eager=("group.category", "metaGroup", "metaGroup.parent"))
 
             jargon_results = []
-            if len(jargon_request) >= config.minItemSearchLength:
+            if jargon_request != request and len(jargon_request) >= config.minItemSearchLength:
                 jargon_results = eos.db.searchItems(jargon_request, where=filter_,
                                              join=(types_Item.group, types_Group.category),
                                              eager=("group.category", "metaGroup", "metaGroup.parent"))
@@ -151,15 +155,11 @@ class Market:
         self.serviceMarketRecentlyUsedModules = SettingsProvider.getInstance().getSettings(
                 "pyfaMarketRecentlyUsedModules", serviceMarketRecentlyUsedModules)
 
-        # Thread which handles search
-        self.searchWorkerThread = SearchWorkerThread()
-        self.searchWorkerThread.daemon = True
-        self.searchWorkerThread.start()
-
-        # Ship browser helper thread
-        self.shipBrowserWorkerThread = ShipBrowserWorkerThread()
-        self.shipBrowserWorkerThread.daemon = True
-        self.shipBrowserWorkerThread.start()
+        # Thread which handles search and ship browser helper thread, both
+        # are started on first use
+        self.__workerLock = threading.Lock()
+        self.__searchWorkerThread = None
+        self.__shipBrowserWorkerThread = None
 
         # Items' group overrides
         self.customGroups = set()
@@ -340,7 +340,8 @@ class Market:
                                    2202,  # Structure Equipment
                                    2203  # Structure Modifications
                                    )
-        self.SHOWN_MARKET_GROUPS = eos.db.getMarketTreeNodeIds(self.ROOT_MARKET_GROUPS)
+        # Market groups which are shown in market tree, built on first use
+        self.__shownMarketGroups = None
         # Tell other threads that Market is at their service
         mktRdy.set()
 
@@ -350,6 +351,30 @@ class Market:
             cls.instance = Market()
         return cls.instance
 
+    @property
+    def SHOWN_MARKET_GROUPS(self):
+        if self.__shownMarketGroups is None:
+            self.__shownMarketGroups = eos.db.getMarketTreeNodeIds(self.ROOT_MARKET_GROUPS)
+        return self.__shownMarketGroups
+
+    @property
+    def searchWorkerThread(self):
+        with self.__workerLock:
+            if self.__searchWorkerThread is None:
+                self.__searchWorkerThread = SearchWorkerThread()
+                self.__searchWorkerThread.daemon = True
+                self.__searchWorkerThread.start()
+        return self.__searchWorkerThread
+
+    @property
+    def shipBrowserWorkerThread(self):
+        with self.__workerLock:
+            if self.__shipBrowserWorkerThread is None:
+                self.__shipBrowserWorkerThread = ShipBrowserWorkerThread()
+                self.__shipBrowserWorkerThread.daemon = True
+                self.__shipBrowserWorkerThread.start()
+        return self.__shipBrowserWorkerThread
+
     @staticmethod
     def __makeRevDict(orig):
         """Creates reverse dictionary"""
@@ -70,6 +70,14 @@ class Network:
 
         return cls._instance
 
+    def __init__(self):
+        # Session keeps connections to hosts open, so that subsequent requests,
+        # including concurrent ones, can reuse them
+        self.session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=8, pool_maxsize=8)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
     def get(self, url, type, **kwargs):
         self.__networkAccessCheck(type)
 
@@ -77,7 +85,7 @@ class Network:
         proxies = self.__getProxies()
 
         try:
-            resp = requests.get(url, headers=headers, proxies=proxies, **kwargs)
+            resp = self.session.get(url, headers=headers, proxies=proxies, **kwargs)
             resp.raise_for_status()
             return resp
         except requests.exceptions.HTTPError as error:
@@ -102,7 +110,7 @@ class Network:
         proxies = self.__getProxies()
 
         try:
-            resp = requests.post(url, json=jsonData, headers=headers, proxies=proxies, **kwargs)
+            resp = self.session.post(url, json=jsonData, headers=headers, proxies=proxies, **kwargs)
             resp.raise_for_status()
             return resp
         except requests.exceptions.HTTPError as error:
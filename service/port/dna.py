@@ -31,10 +31,10 @@ from eos.saveddata.fighter import Fighter
 from eos.saveddata.fit import Fit
 from eos.saveddata.module import Module
 from eos.saveddata.ship import Ship
-from gui.fitCommands.helpers import activeStateLimit
 from service.const import PortDnaOptions
 from service.fit import Fit as svcFit
 from service.market import Market
+from service.port.shared import activeStateLimit
 
 
 pyfalog = Logger(__name__)
@@ -16,10 +16,6 @@ from eos.effectHandlerHelpers import HandledList
 from eos.db import gamedata_session, getCategory, getAttributeInfo, getGroup
 from eos.gamedata import Attribute, Effect, Group, Item, ItemEffect
 from eos.utils.spoolSupport import SpoolType, SpoolOptions
-from gui.fitCommands.calc.module.localAdd import CalcAddLocalModuleCommand
-from gui.fitCommands.calc.module.localRemove import CalcRemoveLocalModulesCommand
-from gui.fitCommands.calc.module.changeCharges import CalcChangeModuleChargesCommand
-from gui.fitCommands.helpers import ModuleInfo
 
 
 pyfalog = Logger(__name__)
@@ -36,6 +32,10 @@ class EfsPort:
 
     @staticmethod
     def getT2MwdSpeed(fit, sFit):
+        # Commands are imported here, so that importing ports doesn't need GUI
+        from gui.fitCommands.calc.module.localAdd import CalcAddLocalModuleCommand
+        from gui.fitCommands.calc.module.localRemove import CalcRemoveLocalModulesCommand
+        from gui.fitCommands.helpers import ModuleInfo
         fitID = fit.ID
         propID = None
         shipHasMedSlots = fit.ship.getModifiedItemAttr("medSlots") > 0
@@ -82,18 +82,14 @@ class EfsPort:
         return mwdPropSpeed
 
     @staticmethod
-    def getPropData(fit, sFit):
+    def getPropData(fit):
         propMods = filter(lambda mod: mod.item and mod.item.group.name == "Propulsion Module", fit.modules)
         activePropWBloomFilter = lambda mod: mod.state > 0 and "signatureRadiusBonus" in mod.item.attributes
         propWithBloom = next(filter(activePropWBloomFilter, propMods), None)
         if propWithBloom is not None:
-            oldPropState = propWithBloom.state
-            propWithBloom.state = FittingModuleState.ONLINE
-            sFit.recalc(fit)
-            sp = fit.maxSpeed
-            sig = fit.ship.getModifiedItemAttr("signatureRadius")
-            propWithBloom.state = oldPropState
-            sFit.recalc(fit)
+            with fit.evaluateUnder([(propWithBloom, "state", FittingModuleState.ONLINE)]):
+                sp = fit.maxSpeed
+                sig = fit.ship.getModifiedItemAttr("signatureRadius")
             return {"usingMWD": True, "unpropedSpeed": sp, "unpropedSig": sig}
         return {
             "usingMWD": False,
@@ -112,6 +108,7 @@ class EfsPort:
     # Note this also includes data for any cap boosters as they "repair" cap.
     @staticmethod
     def getRepairData(fit, sFit):
+        from gui.fitCommands.calc.module.changeCharges import CalcChangeModuleChargesCommand
         modGroupNames = [
             "Shield Booster", "Armor Repair Unit",
             "Ancillary Shield Booster", "Ancillary Armor Repairer",
@@ -652,7 +649,7 @@ class EfsPort:
             fitName = fit.ship.name + ": " + fit.name
         pyfalog.info("Creating Eve Fleet Simulator data for: " + fit.name)
         fitModAttr = fit.ship.getModifiedItemAttr
-        propData = EfsPort.getPropData(fit, sFit)
+        propData = EfsPort.getPropData(fit)
         mwdPropSpeed = fit.maxSpeed
         if includeShipTypeData:
             mwdPropSpeed = EfsPort.getT2MwdSpeed(fit, sFit)
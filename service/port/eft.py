@@ -33,12 +33,11 @@ from eos.saveddata.fit import Fit
 from eos.saveddata.implant import Implant
 from eos.saveddata.module import Module
 from eos.saveddata.ship import Ship
-from gui.fitCommands.helpers import activeStateLimit
 from service.const import PortEftOptions
 from service.fit import Fit as svcFit
 from service.market import Market
 from service.port.muta import parseMutant, renderMutant
-from service.port.shared import IPortUser, fetchItem, processing_notify
+from service.port.shared import IPortUser, activeStateLimit, fetchItem, processing_notify
 
 
 pyfalog = Logger(__name__)
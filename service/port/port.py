@@ -18,12 +18,16 @@
 # =============================================================================
 
 
+import itertools
 import re
 import os
 import threading
 import xml.dom
 import xml.parsers.expat
 from codecs import open
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from xml.etree.ElementTree import ParseError
 
 from bs4 import UnicodeDammit
 from logbook import Logger
@@ -39,7 +43,7 @@ from service.port.eft import (
 from service.port.esi import exportESI, importESI
 from service.port.multibuy import exportMultiBuy
 from service.port.shared import IPortUser, UserCancelException, processing_notify
-from service.port.xml import importXml, exportXml
+from service.port.xml import importXml, iterXml, exportXml, writeXml
 from service.port.muta import parseMutant
 
 
@@ -53,6 +57,11 @@ class Port:
     """Service which houses all import/export format functions"""
     instance = None
     __tag_replace_flag = True
+    # Amount of threads which read fit files, and amount of files they read ahead of parser
+    importReadWorkers = 4
+    importReadAhead = 16
+    # Amount of imported fits which are saved with single commit
+    importBatchSize = 200
 
     @classmethod
     def getInstance(cls):
@@ -79,10 +88,12 @@ class Port:
             success = True
             try:
                 iportuser.on_port_process_start()
-                backedUpFits = Port.exportXml(svcFit.getInstance().getAllFits(), iportuser)
-                backupFile = open(path, "w", encoding="utf-8")
-                backupFile.write(backedUpFits)
-                backupFile.close()
+                # Fits are loaded one by one and written right away, so that
+                # memory use doesn't depend on amount of fits
+                fitIDs = [fit.ID for fit in svcFit.getInstance().getAllFitsLite()]
+                fits = (fit for fit in (db.getFit(fitID) for fitID in fitIDs) if fit is not None)
+                with open(path, "w", encoding="utf-8") as backupFile:
+                    Port.writeXml(fits, backupFile, iportuser, len(fitIDs))
             except UserCancelException:
                 success = False
             # Send done signal to GUI
@@ -117,71 +128,124 @@ class Port:
             args=(paths, iportuser)
         ).start()
 
+    @staticmethod
+    def readFitFile(path):
+        """Read file and decode it into unicode string"""
+        with open(path, "rb") as file_:
+            srcString = file_.read()
+        return UnicodeDammit(srcString).unicode_markup
+
     @staticmethod
     def importFitFromFiles(paths, iportuser=None):
         """
-        Imports fits from file(s). First processes all provided paths and stores
-        assembled fits into a list. This allows us to call back to the GUI as
-        fits are processed as well as when fits are being saved.
+        Imports fits from file(s). Files are read and decoded in a thread pool
+        a few files ahead of parser, which parses them one by one in order of
+        paths. Parsed fits are saved in batches, one commit per batch. This
+        allows us to call back to the GUI as fits are processed as well as when
+        fits are being saved. Import either saves all fits or none of them: if
+        it fails or gets canceled, fits saved by then are removed.
         returns
         """
 
         sFit = svcFit.getInstance()
+        useCharImplants = sFit.serviceFittingOptions["useCharacterImplantsByDefault"]
 
+        paths = list(paths)
         fit_list = []
+        batch = []
+        savedCount = 0
+        fileIdx = 0
+
+        def saveBatch():
+            nonlocal savedCount
+            for fit in batch:
+                # Set some more fit attributes
+                fit.character = sFit.character
+                fit.damagePattern = sFit.pattern
+                fit.targetProfile = sFit.targetProfile
+                if len(fit.implants) > 0:
+                    fit.implantLocation = ImplantLocation.FIT
+                else:
+                    fit.implantLocation = ImplantLocation.CHARACTER if useCharImplants else ImplantLocation.FIT
+                db.add(fit)
+            db.commit()
+            savedCount += len(batch)
+            fit_list.extend(batch)
+            if iportuser:  # Pulse
+                pyfalog.debug("Saved fits to database: {0}", savedCount)
+                processing_notify(
+                    iportuser, IPortUser.PROCESS_IMPORT | IPortUser.ID_UPDATE,
+                    "Saving fits to database\n(%d saved, file %d/%d) %s" % (savedCount, fileIdx, len(paths), batch[-1].ship.name)
+                )
+            del batch[:]
+
+        def fail(message):
+            # Fits of unsaved batch may be in session already
+            db.rollback()
+            if fit_list:
+                pyfalog.warning("Removing {0} fits saved before import failure", len(fit_list))
+                try:
+                    db.removeAll(fit_list)
+                except Exception as e:
+                    pyfalog.critical("Failed to remove imported fits")
+                    pyfalog.critical(e)
+                    return False, "%s\n\n%d fits were saved before error and could not be removed" % (message, len(fit_list))
+            return False, message
+
+        path = None
+        # Parsing works with gamedata and saveddata sessions, which may be used by one thread only,
+        # thus only reading is done in parallel
+        reader = ThreadPoolExecutor(max_workers=Port.importReadWorkers, thread_name_prefix="FitFileReader")
+        pending = deque()
         try:
-            for path in paths:
+            pathIter = iter(paths)
+            for path in itertools.islice(pathIter, Port.importReadAhead):
+                pending.append((path, reader.submit(Port.readFitFile, path)))
+            while pending:
+                path, future = pending.popleft()
+                for nextPath in itertools.islice(pathIter, 1):
+                    pending.append((nextPath, reader.submit(Port.readFitFile, nextPath)))
+                fileIdx += 1
                 if iportuser:  # Pulse
-                    msg = "Processing file:\n%s" % path
+                    msg = "Processing file %d/%d:\n%s" % (fileIdx, len(paths), path)
                     pyfalog.debug(msg)
                     processing_notify(iportuser, IPortUser.PROCESS_IMPORT | IPortUser.ID_UPDATE, msg)
-                    # wx.CallAfter(callback, 1, msg)
-
-                with open(path, "rb") as file_:
-                    srcString = file_.read()
-                    dammit = UnicodeDammit(srcString)
-                    srcString = dammit.unicode_markup
 
+                srcString = future.result()
                 if len(srcString) == 0:  # ignore blank files
                     pyfalog.debug("File is blank.")
                     continue
 
                 try:
+                    if Port.isXml(srcString):
+                        # Save fits from big XML files while parsing the rest
+                        for fit in Port.iterXml(srcString, iportuser):
+                            batch.append(fit)
+                            if len(batch) >= Port.importBatchSize:
+                                saveBatch()
+                        continue
                     importType, makesNewFits, fitsImport = Port.importAuto(srcString, path, iportuser=iportuser)
-                    fit_list += fitsImport
-                except xml.parsers.expat.ExpatError:
+                except (xml.parsers.expat.ExpatError, ParseError):
                     pyfalog.warning("Malformed XML in:\n{0}", path)
-                    return False, "Malformed XML in %s" % path
+                    return fail("Malformed XML in %s" % path)
+                batch.extend(fitsImport)
+                if len(batch) >= Port.importBatchSize:
+                    saveBatch()
 
-            # IDs = []  # NOTE: what use for IDs?
-            numFits = len(fit_list)
-            for idx, fit in enumerate(fit_list):
-                # Set some more fit attributes and save
-                fit.character = sFit.character
-                fit.damagePattern = sFit.pattern
-                fit.targetProfile = sFit.targetProfile
-                if len(fit.implants) > 0:
-                    fit.implantLocation = ImplantLocation.FIT
-                else:
-                    useCharImplants = sFit.serviceFittingOptions["useCharacterImplantsByDefault"]
-                    fit.implantLocation = ImplantLocation.CHARACTER if useCharImplants else ImplantLocation.FIT
-                db.save(fit)
-                # IDs.append(fit.ID)
-                if iportuser:  # Pulse
-                    pyfalog.debug("Processing complete, saving fits to database: {0}/{1}", idx + 1, numFits)
-                    processing_notify(
-                        iportuser, IPortUser.PROCESS_IMPORT | IPortUser.ID_UPDATE,
-                        "Processing complete, saving fits to database\n(%d/%d) %s" % (idx + 1, numFits, fit.ship.name)
-                    )
+            if batch:
+                saveBatch()
 
         except UserCancelException:
-            return False, "Processing has been canceled.\n"
+            return fail("Processing has been canceled.\n")
         except Exception as e:
             pyfalog.critical("Unknown exception processing: {0}", path)
             pyfalog.critical(e)
-            # TypeError: not all arguments converted during string formatting
-#                 return False, "Unknown Error while processing {0}" % path
-            return False, "Unknown error while processing %s\n\n Error: %s" % (path, e.message)
+            return fail("Unknown error while processing %s\n\n Error: %s" % (path, e))
+        finally:
+            # Do not read files which are not going to be parsed
+            for _, future in pending:
+                future.cancel()
+            reader.shutdown(wait=False)
 
         return True, fit_list
 
@@ -219,7 +283,7 @@ class Port:
                 break
 
         # If XML-style start of tag encountered, detect as XML
-        if re.search(RE_XML_START, firstLine):
+        if cls.isXml(firstLine):
             return "XML", True, cls.importXml(string, iportuser)
 
         # If JSON-style start, parse as CREST/JSON
@@ -305,14 +369,27 @@ class Port:
         return exportESI(fit, callback=callback)
 
     # XML-related methods
+    @staticmethod
+    def isXml(string):
+        """Check if string starts with XML declaration"""
+        return re.search(RE_XML_START, string.lstrip()[:100].split("\n", 1)[0]) is not None
+
     @staticmethod
     def importXml(text, iportuser=None):
         return importXml(text, iportuser)
 
+    @staticmethod
+    def iterXml(source, iportuser=None):
+        return iterXml(source, iportuser)
+
     @staticmethod
     def exportXml(fits, iportuser=None, callback=None):
         return exportXml(fits, iportuser, callback=callback)
 
+    @staticmethod
+    def writeXml(fits, file_, iportuser=None, fit_count=None):
+        return writeXml(fits, file_, iportuser, fit_count)
+
     # Multibuy-related methods
     @staticmethod
     def exportMultiBuy(fit, options, callback=None):
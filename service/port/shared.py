@@ -22,6 +22,7 @@ from abc import ABCMeta, abstractmethod
 
 from logbook import Logger
 
+from eos.const import FittingModuleState
 from service.market import Market
 
 
@@ -77,6 +78,16 @@ def processing_notify(iportuser, flag, data):
         raise UserCancelException
 
 
+def activeStateLimit(itemIdentity):
+    item = Market.getInstance().getItem(itemIdentity)
+    if {
+        'moduleBonusAssaultDamageControl', 'moduleBonusIndustrialInvulnerability',
+        'microJumpDrive', 'microJumpPortalDrive'
+    }.intersection(item.effects):
+        return FittingModuleState.ONLINE
+    return FittingModuleState.ACTIVE
+
+
 def fetchItem(typeName, eagerCat=False):
     sMkt = Market.getInstance()
     eager = 'group.category' if eagerCat else None
@@ -17,9 +17,12 @@
 # along with pyfa.  If not, see <http://www.gnu.org/licenses/>.
 # =============================================================================
 
+import io
 import re
 import xml.dom
+import xml.dom.minidom
 import xml.parsers.expat
+from xml.etree.ElementTree import iterparse
 
 from logbook import Logger
 
@@ -31,10 +34,9 @@ from eos.saveddata.fighter import Fighter
 from eos.saveddata.fit import Fit
 from eos.saveddata.module import Module
 from eos.saveddata.ship import Ship
-from gui.fitCommands.helpers import activeStateLimit
 from service.fit import Fit as svcFit
 from service.market import Market
-from service.port.shared import IPortUser, processing_notify
+from service.port.shared import IPortUser, activeStateLimit, processing_notify
 from utils.strfunctions import replace_ltgt, sequential_rep
 
 
@@ -44,6 +46,8 @@ pyfalog = Logger(__name__)
 RE_LTGT = "&(lt|gt);"
 L_MARK = "&lt;localized hint=&quot;"
 # &lt;localized hint=&quot;([^"]+)&quot;&gt;([^\*]+)\*&lt;\/localized&gt;
+# Same mark in parsed attribute values
+LOCALIZED_MARK = '<localized hint="'
 LOCALIZED_PATTERN = re.compile(r'<localized hint="([^"]+)">([^\*]+)\*</localized>')
 
 
@@ -59,16 +63,16 @@ def _extract_match(t):
     return m.group(1), m.group(2)
 
 
-def _resolve_ship(fitting, sMkt, b_localized):
-    # type: (xml.dom.minidom.Element, service.market.Market, bool) -> eos.saveddata.fit.Fit
+def _resolve_ship(fitting, sMkt):
+    # type: (xml.etree.ElementTree.Element, service.market.Market) -> eos.saveddata.fit.Fit
     """ NOTE: Since it is meaningless unless a correct ship object can be constructed,
         process flow changed
     """
     # ------ Confirm ship
     # <localized hint="Maelstrom">Maelstrom</localized>
-    shipType = fitting.getElementsByTagName("shipType").item(0).getAttribute("value")
+    shipType = fitting.find("shipType").get("value", "")
     anything = None
-    if b_localized:
+    if LOCALIZED_MARK in shipType:
         try:
             # expect an official name, emergency cache
             shipType, anything = _extract_match(shipType)
@@ -100,7 +104,7 @@ def _resolve_ship(fitting, sMkt, b_localized):
 
     fitobj = Fit(ship=ship)
     # ------ Confirm fit name
-    anything = fitting.getAttribute("name")
+    anything = fitting.get("name", "")
     # 2017/03/29 NOTE:
     #    if fit name contained "<" or ">" then reprace to named html entity by EVE client
     # if re.search(RE_LTGT, anything):
@@ -111,11 +115,11 @@ def _resolve_ship(fitting, sMkt, b_localized):
     return fitobj
 
 
-def _resolve_module(hardware, sMkt, b_localized):
-    # type: (xml.dom.minidom.Element, service.market.Market, bool) -> eos.saveddata.module.Module
-    moduleName = hardware.getAttribute("type")
+def _resolve_module(hardware, sMkt):
+    # type: (xml.etree.ElementTree.Element, service.market.Market) -> eos.saveddata.module.Module
+    moduleName = hardware.get("type", "")
     emergency = None
-    if b_localized:
+    if LOCALIZED_MARK in moduleName:
         try:
             # expect an official name, emergency cache
             moduleName, emergency = _extract_match(moduleName)
@@ -142,117 +146,150 @@ def _resolve_module(hardware, sMkt, b_localized):
 
 
 def importXml(text, iportuser):
-    from .port import Port
     # type: (str, IPortUser) -> list[eos.saveddata.fit.Fit]
+    return list(iterXml(text, iportuser))
+
+
+def iterXml(source, iportuser):
+    # type: (object, IPortUser) -> collections.Iterator[eos.saveddata.fit.Fit]
+    """
+    Parse XML text or file object, yielding fits one by one as their <fitting>
+    elements are parsed. Parsed elements are dropped right away, so that whole
+    document is never kept in memory.
+    """
+    if isinstance(source, str):
+        source = io.StringIO(source)
     sMkt = Market.getInstance()
-    doc = xml.dom.minidom.parseString(text)
-    # NOTE:
-    #   When L_MARK is included at this point,
-    #   Decided to be localized data
-    b_localized = L_MARK in text
-    fittings = doc.getElementsByTagName("fittings").item(0)
-    fittings = fittings.getElementsByTagName("fitting")
-    fit_list = []
-    failed = 0
-
-    for fitting in fittings:
+    root = None
+    for event, element in iterparse(source, events=("start", "end")):
+        if event == "start":
+            if root is None:
+                root = element
+            continue
+        if element.tag != "fitting":
+            continue
         try:
-            fitobj = _resolve_ship(fitting, sMkt, b_localized)
-        except:
-            failed += 1
+            fitobj = _resolve_fitting(element, sMkt)
+        finally:
+            # Drop processed <fitting> elements from the tree
+            root.clear()
+        if fitobj is None:
             continue
+        if iportuser:  # NOTE: Send current processing status
+            processing_notify(
+                iportuser, IPortUser.PROCESS_IMPORT | IPortUser.ID_UPDATE,
+                "Processing %s\n%s" % (fitobj.ship.name, fitobj.name)
+            )
+        yield fitobj
 
-        # -- 170327 Ignored description --
-        # read description from exported xml. (EVE client, EFT)
-        description = fitting.getElementsByTagName("description").item(0).getAttribute("value")
-        if description is None:
-            description = ""
-        elif len(description):
-            # convert <br> to "\n" and remove html tags.
-            if Port.is_tag_replace():
-                description = replace_ltgt(
-                    sequential_rep(description, r"<(br|BR)>", "\n", r"<[^<>]+>", "")
-                )
-        fitobj.notes = description
 
-        hardwares = fitting.getElementsByTagName("hardware")
-        moduleList = []
-        for hardware in hardwares:
-            try:
-                item = _resolve_module(hardware, sMkt, b_localized)
-                if not item or not item.published:
-                    continue
+def _resolve_fitting(fitting, sMkt):
+    # type: (xml.etree.ElementTree.Element, service.market.Market) -> eos.saveddata.fit.Fit
+    from .port import Port
+    try:
+        fitobj = _resolve_ship(fitting, sMkt)
+    except:
+        return None
+
+    # -- 170327 Ignored description --
+    # read description from exported xml. (EVE client, EFT)
+    descriptionElement = fitting.find("description")
+    description = descriptionElement.get("value") if descriptionElement is not None else None
+    if description is None:
+        description = ""
+    elif len(description):
+        # convert <br> to "\n" and remove html tags.
+        if Port.is_tag_replace():
+            description = replace_ltgt(
+                sequential_rep(description, r"<(br|BR)>", "\n", r"<[^<>]+>", "")
+            )
+    fitobj.notes = description
 
-                if item.category.name == "Drone":
-                    d = Drone(item)
-                    d.amount = int(hardware.getAttribute("qty"))
-                    fitobj.drones.append(d)
-                elif item.category.name == "Fighter":
-                    ft = Fighter(item)
-                    ft.amount = int(hardware.getAttribute("qty")) if ft.amount <= ft.fighterSquadronMaxSize else ft.fighterSquadronMaxSize
-                    fitobj.fighters.append(ft)
-                elif hardware.getAttribute("slot").lower() == "cargo":
-                    # although the eve client only support charges in cargo, third-party programs
-                    # may support items or "refits" in cargo. Support these by blindly adding all
-                    # cargo, not just charges
-                    c = Cargo(item)
-                    c.amount = int(hardware.getAttribute("qty"))
-                    fitobj.cargo.append(c)
-                else:
-                    try:
-                        m = Module(item)
-                    # When item can't be added to any slot (unknown item or just charge), ignore it
-                    except ValueError:
-                        pyfalog.warning("item can't be added to any slot (unknown item or just charge), ignore it")
-                        continue
-                    # Add subsystems before modules to make sure T3 cruisers have subsystems installed
-                    if item.category.name == "Subsystem":
-                        if m.fits(fitobj):
-                            m.owner = fitobj
-                            fitobj.modules.append(m)
-                    else:
-                        if m.isValidState(FittingModuleState.ACTIVE):
-                            m.state = activeStateLimit(m.item)
-
-                        moduleList.append(m)
-
-            except KeyboardInterrupt:
-                pyfalog.warning("Keyboard Interrupt")
+    hardwares = fitting.iter("hardware")
+    moduleList = []
+    for hardware in hardwares:
+        try:
+            item = _resolve_module(hardware, sMkt)
+            if not item or not item.published:
                 continue
 
-        # Recalc to get slot numbers correct for T3 cruisers
-        sFit = svcFit.getInstance()
-        sFit.recalc(fitobj)
-        sFit.fill(fitobj)
+            if item.category.name == "Drone":
+                d = Drone(item)
+                d.amount = int(hardware.get("qty"))
+                fitobj.drones.append(d)
+            elif item.category.name == "Fighter":
+                ft = Fighter(item)
+                ft.amount = int(hardware.get("qty")) if ft.amount <= ft.fighterSquadronMaxSize else ft.fighterSquadronMaxSize
+                fitobj.fighters.append(ft)
+            elif hardware.get("slot", "").lower() == "cargo":
+                # although the eve client only support charges in cargo, third-party programs
+                # may support items or "refits" in cargo. Support these by blindly adding all
+                # cargo, not just charges
+                c = Cargo(item)
+                c.amount = int(hardware.get("qty"))
+                fitobj.cargo.append(c)
+            else:
+                try:
+                    m = Module(item)
+                # When item can't be added to any slot (unknown item or just charge), ignore it
+                except ValueError:
+                    pyfalog.warning("item can't be added to any slot (unknown item or just charge), ignore it")
+                    continue
+                # Add subsystems before modules to make sure T3 cruisers have subsystems installed
+                if item.category.name == "Subsystem":
+                    if m.fits(fitobj):
+                        m.owner = fitobj
+                        fitobj.modules.append(m)
+                else:
+                    if m.isValidState(FittingModuleState.ACTIVE):
+                        m.state = activeStateLimit(m.item)
+
+                    moduleList.append(m)
 
-        for module in moduleList:
-            if module.fits(fitobj):
-                module.owner = fitobj
-                fitobj.modules.append(module)
+        except KeyboardInterrupt:
+            pyfalog.warning("Keyboard Interrupt")
+            continue
 
-        fit_list.append(fitobj)
-        if iportuser:  # NOTE: Send current processing status
-            processing_notify(
-                iportuser, IPortUser.PROCESS_IMPORT | IPortUser.ID_UPDATE,
-                "Processing %s\n%s" % (fitobj.ship.name, fitobj.name)
-            )
+    # Recalc to get slot numbers correct for T3 cruisers
+    sFit = svcFit.getInstance()
+    sFit.recalc(fitobj)
+    sFit.fill(fitobj)
+
+    for module in moduleList:
+        if module.fits(fitobj):
+            module.owner = fitobj
+            fitobj.modules.append(module)
 
-    return fit_list
+    return fitobj
 
 
 def exportXml(fits, iportuser, callback):
+    output = io.StringIO()
+    writeXml(fits, output, iportuser)
+    text = output.getvalue()
+
+    if callback:
+        callback(text)
+    else:
+        return text
+
+
+def writeXml(fits, file_, iportuser, fit_count=None):
+    # type: (collections.Iterable[eos.saveddata.fit.Fit], io.TextIOBase, IPortUser, int) -> None
+    """
+    Write fits to file object as XML. Every <fitting> element is written as soon
+    as it's built, so fits can be passed as generator which loads them one by
+    one. Output is the same as pretty-printed DOM of all fits.
+    """
     doc = xml.dom.minidom.Document()
-    fittings = doc.createElement("fittings")
-    # fit count
-    fit_count = len(fits)
-    fittings.setAttribute("count", "%s" % fit_count)
-    doc.appendChild(fittings)
+    if fit_count is None:
+        fit_count = len(fits)
+    file_.write('<?xml version="1.0" ?>\n<fittings count="%s">\n' % fit_count)
 
     for i, fit in enumerate(fits):
+        fitting = doc.createElement("fitting")
         try:
-            fitting = doc.createElement("fitting")
             fitting.setAttribute("name", fit.name)
-            fittings.appendChild(fitting)
             description = doc.createElement("description")
             # -- 170327 Ignored description --
             try:
@@ -328,18 +365,16 @@ def exportXml(fits, iportuser, callback):
                 hardware.setAttribute("slot", "cargo")
                 hardware.setAttribute("type", name)
                 fitting.appendChild(hardware)
+            fitting.writexml(file_, "\t", "\t", "\n")
         except Exception as e:
-            pyfalog.error("Failed on fitID: %d, message: %s" % e.message)
+            pyfalog.error("Failed on fitID: {0}, message: {1}", fit.ID, e)
             continue
         finally:
+            fitting.unlink()
             if iportuser:
                 processing_notify(
                     iportuser, IPortUser.PROCESS_EXPORT | IPortUser.ID_UPDATE,
                     (i, "convert to xml (%s/%s) %s" % (i + 1, fit_count, fit.ship.name))
                 )
-    text = doc.toprettyxml()
 
-    if callback:
-        callback(text)
-    else:
-        return text
+    file_.write("</fittings>\n")
@@ -18,17 +18,62 @@
 # =============================================================================
 
 import os
+import threading
 
 import config
 from eos import db
 from eos.db import migration
 from eos.db.saveddata.loadDefaultDatabaseValues import DefaultDatabaseValues
 from eos.db.saveddata.databaseRepair import DatabaseCleanup
+from eos.db.saveddata.fitSummary import syncFitSummaries
+from utils.startupTrace import StartupTrace
 
 from logbook import Logger
 
 pyfalog = Logger(__name__)
 
+# Tasks which were postponed until main window is shown, as (name, function)
+deferredTasks = []
+
+
+def validateDatabase():
+    # Finds and fixes database corruption issues.
+    pyfalog.debug("Starting database validation.")
+    # Hold session lock, so that cleanup doesn't run in the middle of saveddata changes
+    with db.sd_lock:
+        database_cleanup_instance = DatabaseCleanup()
+        database_cleanup_instance.OrphanedCharacterSkills(db.saveddata_engine)
+        database_cleanup_instance.OrphanedFitCharacterIDs(db.saveddata_engine)
+        database_cleanup_instance.OrphanedFitDamagePatterns(db.saveddata_engine)
+        database_cleanup_instance.NullDamagePatternNames(db.saveddata_engine)
+        database_cleanup_instance.NullTargetResistNames(db.saveddata_engine)
+        database_cleanup_instance.OrphanedFitIDItemID(db.saveddata_engine)
+        database_cleanup_instance.NullDamageTargetPatternValues(db.saveddata_engine)
+        database_cleanup_instance.DuplicateSelectedAmmoName(db.saveddata_engine)
+        syncFitSummaries(db.saveddata_engine)
+    pyfalog.debug("Completed database validation.")
+
+
+def runDeferredTasks(callback=None):
+    """Run postponed tasks in background thread, calling callback when all of them are done"""
+    def run():
+        trace = StartupTrace.getInstance()
+        while deferredTasks:
+            name, task = deferredTasks.pop(0)
+            try:
+                with trace.phase(name):
+                    task()
+            except Exception as e:
+                pyfalog.critical("Deferred startup task {} failed", name)
+                pyfalog.critical(e)
+        if callback is not None:
+            callback()
+
+    thread = threading.Thread(target=run, name="DeferredStartup")
+    thread.daemon = True
+    thread.start()
+
+
 # Make sure the saveddata db exists
 if config.savePath and not os.path.exists(config.savePath):
     os.mkdir(config.savePath)
@@ -43,18 +88,10 @@ if config.saveDB and os.path.isfile(config.saveDB):
     pyfalog.debug("Import Required Database Values.")
     DefaultDatabaseValues.importRequiredDefaults()
 
-    # Finds and fixes database corruption issues.
-    pyfalog.debug("Starting database validation.")
-    database_cleanup_instance = DatabaseCleanup()
-    database_cleanup_instance.OrphanedCharacterSkills(db.saveddata_engine)
-    database_cleanup_instance.OrphanedFitCharacterIDs(db.saveddata_engine)
-    database_cleanup_instance.OrphanedFitDamagePatterns(db.saveddata_engine)
-    database_cleanup_instance.NullDamagePatternNames(db.saveddata_engine)
-    database_cleanup_instance.NullTargetResistNames(db.saveddata_engine)
-    database_cleanup_instance.OrphanedFitIDItemID(db.saveddata_engine)
-    database_cleanup_instance.NullDamageTargetPatternValues(db.saveddata_engine)
-    database_cleanup_instance.DuplicateSelectedAmmoName(db.saveddata_engine)
-    pyfalog.debug("Completed database validation.")
+    if config.deferStartupTasks:
+        deferredTasks.append(("database validation", validateDatabase))
+    else:
+        validateDatabase()
 
 else:
     # If database does not exist, do not worry about migration. Simply
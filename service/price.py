@@ -18,13 +18,13 @@
 # =============================================================================
 
 
-import queue
 import threading
+import time
 import timeit
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from itertools import chain
 
 import math
-import wx
 from logbook import Logger
 
 from eos import db
@@ -34,6 +34,12 @@ from service.market import Market
 from service.network import TimeoutError
 
 
+# Headless tools run without GUI toolkit, they don't pass callbacks
+try:
+    import wx
+except ImportError:
+    wx = None
+
 pyfalog = Logger(__name__)
 
 
@@ -51,10 +57,18 @@ class Price:
     sources = {}
 
     def __init__(self):
-        # Start price fetcher
-        self.priceWorkerThread = PriceWorkerThread()
-        self.priceWorkerThread.daemon = True
-        self.priceWorkerThread.start()
+        # Price fetcher is started on first request
+        self.__workerLock = threading.Lock()
+        self.__priceWorkerThread = None
+
+    @property
+    def priceWorkerThread(self):
+        with self.__workerLock:
+            if self.__priceWorkerThread is None:
+                self.__priceWorkerThread = PriceWorkerThread()
+                self.__priceWorkerThread.daemon = True
+                self.__priceWorkerThread.start()
+        return self.__priceWorkerThread
 
     @classmethod
     def register(cls, source):
@@ -106,46 +120,16 @@ class Price:
         # attempt to find user's selected price source, otherwise get first one
         sourceAll = list(cls.sources.keys())
         sourcePrimary = sFit.serviceFittingOptions["priceSource"] if sFit.serviceFittingOptions["priceSource"] in sourceAll else sourceAll[0]
+        sourceOrder = [sourcePrimary] + [source for source in sourceAll if source != sourcePrimary]
 
-        # Format: {source name: timeout weight}
-        sources = {sourcePrimary: len(sourceAll)}
-        for source in sourceAll:
-            if source == sourcePrimary:
-                continue
-            sources[source] = min(sources.values()) - 1
-
-        # Record timeouts as it will affect our final decision
-        timedOutSources = {}
-
-        remainingTime = fetchTimeout
-
-        for source in sorted(sources, key=sources.get, reverse=True):
-            timeBefore = timeit.default_timer()
-            pyfalog.info('Trying {}'.format(source))
-            timedOutSources[source] = False
-            # Time we allocate for a source depends on source weight and remaining time
-            sourceFetchTimeout = remainingTime * sources[source] / sum(sources.values())
-            try:
-                sourceCls = cls.sources.get(source)
-                sourceCls(priceMap, cls.systemsList[sFit.serviceFittingOptions["priceSystem"]], sourceFetchTimeout)
-            except TimeoutError:
-                pyfalog.warning("Price fetch timeout for source {}".format(source))
-                timedOutSources[source] = True
-            except Exception as e:
-                pyfalog.warn('Failed to fetch prices from price source {}: {}'.format(source, e))
-            # Sources remove price map items as they fetch info, if none remain then we're done
-            if not priceMap:
-                break
-            timeAfter = timeit.default_timer()
-            # Remove source so it doesn't affect time weights of sources we're going to use next
-            del sources[source]
-            remainingTime -= timeAfter - timeBefore
-            # No time remaining (should not happen) - mark remaining sources as timeout
-            if remainingTime <= 0:
-                for source in sources:
-                    timedOutSources[source] = True
-                break
+        fetch = HedgedFetch(priceMap)
+        timedOutSources = fetch.run(
+            [cls.sources[source] for source in sourceOrder],
+            cls.systemsList[sFit.serviceFittingOptions["priceSystem"]],
+            fetchTimeout)
 
+        for typeID, price in fetch.results.items():
+            priceMap.pop(typeID).update(PriceStatus.fetchSuccess, price)
 
         # If we get to this point, then we've failed to get price with all our sources
         # If all sources failed due to timeouts, set one status
@@ -165,8 +149,12 @@ class Price:
 
         return item.price.price
 
-    def getPrices(self, objitems, callback, fetchTimeout=30, waitforthread=False, validityOverride=None):
-        """Get prices for multiple typeIDs"""
+    def getPrices(self, objitems, callback, fetchTimeout=30, waitforthread=False, validityOverride=None, stale=False):
+        """
+        Get prices for multiple typeIDs. With stale set, callback is called right
+        away if there is some price for every item, and once again after
+        outdated prices are refreshed.
+        """
         requests = []
         sMkt = Market.getInstance()
         for objitem in objitems:
@@ -183,9 +171,24 @@ class Price:
 
         if waitforthread:
             self.priceWorkerThread.setToWait(requests, cb)
+        elif stale and all(price.isKnown for price in requests):
+            wx.CallAfter(cb)
+            outdated = [price for price in requests if not price.isValid(validityOverride)]
+            if outdated:
+                self.priceWorkerThread.trigger(outdated, cb, fetchTimeout, validityOverride)
         else:
             self.priceWorkerThread.trigger(requests, cb, fetchTimeout, validityOverride)
 
+    def refreshPrices(self, objitems, fetchTimeout=30, validityOverride=None, callback=None):
+        """
+        Schedule refresh of outdated prices, without waiting for it. Callback is
+        called once they are refreshed, if there was anything to refresh.
+        """
+        sMkt = Market.getInstance()
+        outdated = [price for price in (sMkt.getItem(objitem).price for objitem in objitems) if not price.isValid(validityOverride)]
+        if outdated:
+            self.priceWorkerThread.trigger(outdated, callback, fetchTimeout, validityOverride)
+
     def clearPriceCache(self):
         pyfalog.debug("Clearing Prices")
         db.clearPrices()
@@ -202,7 +205,14 @@ class Price:
                 replacementsAll[item] = itemRepls
         itemsToFetch = {i for i in chain(replacementsAll.keys(), *replacementsAll.values())}
 
+        called = []
+
         def makeCheapMapCb(requests):
+            # Replacements are picked once, using known prices even if they are
+            # outdated, refreshed prices will be used next time
+            if called:
+                return
+            called.append(True)
             # Decide what we are going to replace
             replacementsCheaper = {}  # Items which should be replaced
             for replacee, replacers in replacementsAll.items():
@@ -217,42 +227,235 @@ class Price:
 
         # Prices older than 2 hours have to be refetched
         validityOverride = 2 * 60 * 60
-        self.getPrices(itemsToFetch, makeCheapMapCb, fetchTimeout=fetchTimeout, validityOverride=validityOverride)
+        self.getPrices(itemsToFetch, makeCheapMapCb, fetchTimeout=fetchTimeout, validityOverride=validityOverride, stale=True)
 
 
 
 
+class RateLimiter:
+    """Spaces out calls with the same key"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        # Format: {key: time when next call is allowed}
+        self.nextTimes = {}
+
+    def acquire(self, key, interval, cancelled=None):
+        """Wait for our turn, returning False if cancelled event was set meanwhile"""
+        with self.lock:
+            now = timeit.default_timer()
+            allowedAt = max(now, self.nextTimes.get(key, now))
+            self.nextTimes[key] = allowedAt + interval
+        if allowedAt > now:
+            if cancelled is None:
+                time.sleep(allowedAt - now)
+            elif cancelled.wait(allowedAt - now):
+                return False
+        return True
+
+
+class HedgedFetch:
+    """
+    Requests prices of the same items from several sources at once, taking first
+    answer for each item. Primary source gets a head start, other sources are
+    started when it's over or when head start time runs out. Items answered by
+    any source are not requested anymore by the others. Sources get only time
+    left until fetch deadline, and once fetch is over, sources which did not
+    start yet are cancelled.
+    """
+
+    # Head start of primary source, in seconds
+    hedgeDelay = 0.5
+    # Minimal time between requests to the same source, unless source sets its own
+    sourceInterval = 1
+    executor = ThreadPoolExecutor(max_workers=6, thread_name_prefix="PriceFetch")
+    rateLimiter = RateLimiter()
+
+    def __init__(self, typeIDs):
+        self.lock = threading.Lock()
+        self.pending = set(typeIDs)
+        # Format: {typeID: price}
+        self.results = {}
+        # Set when we stop waiting for sources
+        self.cancelled = threading.Event()
+
+    def record(self, typeID, price):
+        with self.lock:
+            if typeID in self.pending:
+                self.pending.discard(typeID)
+                self.results[typeID] = price
+
+    def isPending(self, typeID):
+        with self.lock:
+            return typeID in self.pending
+
+    def fetchSource(self, sourceCls, system, deadline):
+        """Run single source, returning if it timed out"""
+        if not self.rateLimiter.acquire(sourceCls.name, getattr(sourceCls, "minInterval", self.sourceInterval), self.cancelled):
+            return True
+        fetchTimeout = deadline - timeit.default_timer()
+        if self.cancelled.is_set() or fetchTimeout <= 0:
+            return True
+        pyfalog.info('Trying {}'.format(sourceCls.name))
+        try:
+            sourceCls(SourcePriceMap(self), system, fetchTimeout)
+        except TimeoutError:
+            pyfalog.warning("Price fetch timeout for source {}".format(sourceCls.name))
+            return True
+        except Exception as e:
+            pyfalog.warn('Failed to fetch prices from price source {}: {}'.format(sourceCls.name, e))
+        return False
+
+    def run(self, sourceClasses, system, fetchTimeout):
+        """Fetch prices, returning dictionary with timeout flag per source name"""
+        start = timeit.default_timer()
+        deadline = start + fetchTimeout
+        hedgeAt = start + min(self.hedgeDelay, fetchTimeout / 4)
+        primary, waiting = sourceClasses[0], list(sourceClasses[1:])
+        # Format: {future: source name}
+        running = {self.executor.submit(self.fetchSource, primary, system, deadline): primary.name}
+        timedOutSources = {}
+        while self.pending and (running or waiting):
+            now = timeit.default_timer()
+            if now >= deadline:
+                break
+            if waiting and (now >= hedgeAt or not running):
+                for sourceCls in waiting:
+                    running[self.executor.submit(self.fetchSource, sourceCls, system, deadline)] = sourceCls.name
+                waiting = []
+            done, _ = wait(running, timeout=(hedgeAt if waiting else deadline) - now, return_when=FIRST_COMPLETED)
+            for future in done:
+                timedOutSources[running.pop(future)] = future.result()
+        # Sources which did not start yet are dropped. Busy ones see empty price
+        # map from now on, so they do not make any further requests, and their
+        # current requests do not outlive the deadline much, as it limits
+        # their timeouts
+        self.cancelled.set()
+        for future, name in running.items():
+            future.cancel()
+            timedOutSources[name] = True
+        for sourceCls in waiting:
+            timedOutSources[sourceCls.name] = True
+        # Ignore whatever sources we don't wait for anymore get
+        with self.lock:
+            self.pending = set()
+        return timedOutSources
+
+
+class SourcePriceMap:
+    """
+    Price map passed to a price source. Items can be updated and removed from it
+    like from regular dictionary, while items answered by other sources just
+    disappear from it.
+    """
+
+    def __init__(self, fetch):
+        self.fetch = fetch
+        self.typeIDs = set(fetch.pending)
+
+    def __iter__(self):
+        return iter([typeID for typeID in self.typeIDs if self.fetch.isPending(typeID)])
+
+    def __len__(self):
+        return sum(1 for typeID in self.typeIDs if self.fetch.isPending(typeID))
+
+    def __contains__(self, typeID):
+        return typeID in self.typeIDs and self.fetch.isPending(typeID)
+
+    def __getitem__(self, typeID):
+        if typeID not in self.typeIDs:
+            raise KeyError(typeID)
+        return SourcePrice(self.fetch, typeID)
+
+    def __delitem__(self, typeID):
+        self.typeIDs.remove(typeID)
+
+
+class SourcePrice:
+
+    def __init__(self, fetch, typeID):
+        self.fetch = fetch
+        self.typeID = typeID
+
+    def update(self, status, price=0):
+        if status == PriceStatus.fetchSuccess:
+            self.fetch.record(self.typeID, price)
+
+
 class PriceWorkerThread(threading.Thread):
+    """
+    Fetches prices in background. Outdated prices requested by all callers
+    since last run are fetched together, in chunks, and every caller is notified
+    as soon as chunks with its prices are done.
+    """
+
+    # Amount of items requested from sources at once
+    chunkSize = 100
 
     def __init__(self):
         threading.Thread.__init__(self)
         self.name = "PriceWorker"
-        self.queue = queue.Queue()
+        self.cv = threading.Condition()
+        # List of (prices, callback, fetch timeout, validity override)
+        self.requests = []
         self.wait = {}
         pyfalog.debug("Initialize PriceWorkerThread.")
 
     def run(self):
-        queue = self.queue
         while True:
-            # Grab our data
-            callback, requests, fetchTimeout, validityOverride = queue.get()
-
-            # Grab prices, this is the time-consuming part
-            if len(requests) > 0:
-                Price.fetchPrices(requests, fetchTimeout, validityOverride)
-
-            wx.CallAfter(callback)
-            queue.task_done()
-
-            # After we fetch prices, go through the list of waiting items and call their callbacks
-            for price in requests:
-                callbacks = self.wait.pop(price.typeID, None)
-                if callbacks:
-                    for callback in callbacks:
-                        wx.CallAfter(callback)
+            with self.cv:
+                while not self.requests:
+                    self.cv.wait()
+                requests, self.requests = self.requests, []
+            try:
+                self.processRequests(requests)
+            except Exception as e:
+                pyfalog.critical("Price refresh failed.")
+                pyfalog.critical(e)
 
-    def trigger(self, prices, callbacks, fetchTimeout, validityOverride):
-        self.queue.put((callbacks, prices, fetchTimeout, validityOverride))
+    def processRequests(self, requests):
+        # Format: {typeID: price}
+        outdated = {}
+        # Format: [[callback, typeIDs left to fetch]]
+        pending = []
+        for prices, callback, fetchTimeout, validityOverride in requests:
+            typeIDs = set()
+            for price in prices:
+                if not price.isValid(validityOverride):
+                    outdated[price.typeID] = price
+                    typeIDs.add(price.typeID)
+            pending.append([callback, typeIDs])
+        fetchTimeout = max(request[2] for request in requests)
+
+        self.notify(pending, set())
+        typeIDs = list(outdated)
+        for i in range(0, len(typeIDs), self.chunkSize):
+            chunk = [outdated[typeID] for typeID in typeIDs[i:i + self.chunkSize]]
+            # All of these were already checked against validity of their requests
+            Price.fetchPrices(chunk, fetchTimeout, 0)
+            db.savePrices(chunk)
+            self.notify(pending, {price.typeID for price in chunk})
+
+    def notify(self, pending, doneTypeIDs):
+        """Call back requests which have all their prices fetched"""
+        for request in pending[:]:
+            callback, typeIDs = request
+            typeIDs.difference_update(doneTypeIDs)
+            if not typeIDs:
+                pending.remove(request)
+                if callback is not None:
+                    wx.CallAfter(callback)
+        # After we fetch prices, go through the list of waiting items and call their callbacks
+        for typeID in doneTypeIDs:
+            callbacks = self.wait.pop(typeID, None)
+            if callbacks:
+                for callback in callbacks:
+                    wx.CallAfter(callback)
+
+    def trigger(self, prices, callback, fetchTimeout, validityOverride):
+        with self.cv:
+            self.requests.append((prices, callback, fetchTimeout, validityOverride))
+            self.cv.notify()
 
     def setToWait(self, prices, callback):
         for price in prices:
@@ -0,0 +1,105 @@
+# =============================================================================
+# Copyright (C) 2010 Diego Duclos
+#
+# This file is part of pyfa.
+#
+# pyfa is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# pyfa is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with pyfa.  If not, see <http://www.gnu.org/licenses/>.
+# =============================================================================
+
+from logbook import Logger
+
+# Default timers need GUI toolkit, headless tools never schedule recalcs
+try:
+    import wx
+except ImportError:
+    wx = None
+
+
+pyfalog = Logger(__name__)
+
+
+class RecalcScheduler:
+    """
+    Coalesces fit recalculations requested by GUI commands.
+
+    Fit is recalculated once its requests stop coming for the configured delay,
+    so that quick series of changes (e.g. wheeling through charges) end up in a
+    single recalc, and callback of the latest request is called after it. Timers
+    fire on the main thread, so recalcs run there, like everything else which
+    touches fits; until then, fit keeps results of its previous calculation.
+
+    This only cuts the number of recalcs, each of them still blocks the UI while
+    it runs. Calculation is not moved to a worker thread: fits share character,
+    implants and projected / command fits with each other, and neither the
+    calculation engine nor the DB session is safe to use from several threads.
+    """
+    instance = None
+
+    @classmethod
+    def getInstance(cls):
+        if cls.instance is None:
+            cls.instance = RecalcScheduler()
+
+        return cls.instance
+
+    def __init__(self, timerFactory=None):
+        # Callable with wx.CallLater signature, which creates started timer
+        self.timerFactory = timerFactory
+        # {fitID: (timer, callback)}
+        self.pending = {}
+
+    def schedule(self, fitID, callback=None, delay=0):
+        """
+        Request recalc of the fit. Delay is in milliseconds, recalc is postponed
+        further by every new request for the same fit.
+        """
+        delay = max(1, delay)
+        request = self.pending.get(fitID)
+        if request is not None:
+            timer = request[0]
+            timer.Restart(delay)
+        else:
+            timerFactory = self.timerFactory or wx.CallLater
+            timer = timerFactory(delay, self.run, fitID)
+        self.pending[fitID] = (timer, callback)
+
+    def cancel(self, fitID):
+        """Drop pending recalc of the fit"""
+        request = self.pending.pop(fitID, None)
+        if request is not None:
+            request[0].Stop()
+
+    def run(self, fitID):
+        request = self.pending.pop(fitID, None)
+        if request is None:
+            return
+        callback = request[1]
+        try:
+            calculated = self.recalc(fitID)
+        except Exception as e:
+            pyfalog.error("Recalc of fit {0} failed", fitID)
+            pyfalog.error(e)
+            return
+        if calculated and callback is not None:
+            callback(fitID)
+
+    @staticmethod
+    def recalc(fitID):
+        from service.fit import Fit  # put this here to avoid loop
+        sFit = Fit.getInstance()
+        fit = sFit.getFit(fitID, basic=True)
+        if fit is None:
+            return False
+        sFit.recalc(fit)
+        return True
@@ -0,0 +1,337 @@
+# =============================================================================
+# Copyright (C) 2010 Diego Duclos
+#
+# This file is part of pyfa.
+#
+# pyfa is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# pyfa is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with pyfa.  If not, see <http://www.gnu.org/licenses/>.
+# =============================================================================
+
+"""
+Sweep over module variations of a fit.
+
+Every combination of candidate items for chosen module slots is fitted and
+calculated, and headline stats of the fit are collected for it. Combinations
+are evaluated in a pool of worker processes; each worker loads gamedata once,
+and works on its own copy of the fit imported from EFT text, updating it
+incrementally from one combination to the next. Projected and command fits
+are not part of EFT text, thus they are not taken into account. EFT text
+keeps only offline flag of modules, and nothing of active drones and fighters,
+so those states are sent along with it and restored on imported fit.
+"""
+
+import itertools
+import os
+import threading
+
+from logbook import Logger
+
+import eos.config
+import eos.db
+from eos.const import FittingHardpoint, FittingSlot
+from eos.saveddata.citadel import Citadel
+from eos.saveddata.module import Module
+from eos.utils.spoolSupport import SpoolOptions, SpoolType
+from service.const import PortEftOptions
+from service.market import Market
+
+
+pyfalog = Logger(__name__)
+
+# Sweeps with more combinations than that are refused
+MAX_COMBINATIONS = 5000
+
+SWEEP_STATS = (
+    "dps", "volley", "ehp", "capStable", "capState", "cpuUsed", "cpuOutput",
+    "powerUsed", "powerOutput", "calibrationUsed", "calibration", "fits")
+
+
+class VariationSweepError(Exception):
+    pass
+
+
+def getModuleKey(fit, mod):
+    """Identify module by its slot and its index among other modules in that slot, which survive EFT export"""
+    rank = 0
+    for other in fit.modules:
+        if other is mod:
+            return mod.slot, rank
+        if other.slot == mod.slot and not other.isEmpty:
+            rank += 1
+    raise VariationSweepError("Module is not fitted")
+
+
+def findModulePosition(fit, key):
+    slot, rank = key
+    for position, mod in enumerate(fit.modules):
+        if mod.slot == slot and not mod.isEmpty:
+            if rank == 0:
+                return position
+            rank -= 1
+    raise VariationSweepError("No module in {} slot #{}".format(slot, key[1]))
+
+
+def getFitStates(fit):
+    """
+    Collect states which are lost in EFT export: module states by module key, active
+    drone amounts by item ID, and fighter and fighter ability states by item ID.
+    """
+    modStates = {getModuleKey(fit, mod): mod.state for mod in fit.modules if not mod.isEmpty}
+    droneStates = {}
+    for drone in fit.drones:
+        droneStates[drone.itemID] = droneStates.get(drone.itemID, 0) + drone.amountActive
+    fighterStates = {}
+    for fighter in fit.fighters:
+        abilityStates = {ability.effectID: ability.active for ability in fighter.abilities}
+        fighterStates.setdefault(fighter.itemID, []).append((fighter.active, abilityStates))
+    return modStates, droneStates, fighterStates
+
+
+def applyFitStates(fit, fitStates):
+    """Restore states collected by getFitStates() on fit imported from EFT text"""
+    modStates, droneStates, fighterStates = fitStates
+    for key, state in modStates.items():
+        mod = fit.modules[findModulePosition(fit, key)]
+        if mod.isValidState(state):
+            mod.state = state
+    droneStates = dict(droneStates)
+    for drone in fit.drones:
+        drone.amountActive = min(drone.amount, droneStates.get(drone.itemID, 0))
+        if drone.itemID in droneStates:
+            droneStates[drone.itemID] -= drone.amountActive
+    fighterStates = {itemID: list(states) for itemID, states in fighterStates.items()}
+    for fighter in fit.fighters:
+        states = fighterStates.get(fighter.itemID)
+        if not states:
+            continue
+        fighter.active, abilityStates = states.pop(0)
+        for ability in fighter.abilities:
+            ability.active = abilityStates.get(ability.effectID, ability.active)
+
+
+def isFittingAllowed(fit, mod):
+    """
+    Check restrictions of fitted module which don't depend on fit resources. Module.fits() cannot be
+    used here, as it expects owner of fitted module to be set, which only happens when fit is saved.
+    """
+    if not fit.canFit(mod.item):
+        return False
+    if not isinstance(fit.ship, Citadel) and fit.ship.getModifiedItemAttr("isCapitalSize", 0) != 1 and mod.isCapitalSize:
+        return False
+    if mod.slot == FittingSlot.RIG and mod.getModifiedItemAttr("rigSize") != fit.ship.getModifiedItemAttr("rigSize"):
+        return False
+    maxGroupFitted = mod.getModifiedItemAttr("maxGroupFitted", None)
+    if maxGroupFitted is not None:
+        fitted = sum(1 for other in fit.modules if other.item is not None and other.item.groupID == mod.item.groupID)
+        if fitted > maxGroupFitted:
+            return False
+    return True
+
+
+def getSweepStats(fit, swapped):
+    """Compose dictionary with headline stats of calculated fit"""
+    spoolOptions = SpoolOptions(SpoolType.SCALE, eos.config.settings['globalDefaultSpoolupPercentage'], False)
+    fitModAttr = fit.ship.getModifiedItemAttr
+    ehp = fit.ehp
+    stats = {
+        "dps": (fit.getWeaponDps(spoolOptions=spoolOptions) + fit.getDroneDps()).total,
+        "volley": (fit.getWeaponVolley(spoolOptions=spoolOptions) + fit.getDroneVolley()).total,
+        "ehp": sum(ehp.values()) if ehp else 0,
+        "capStable": fit.capStable, "capState": fit.capState,
+        "cpuUsed": fit.cpuUsed, "cpuOutput": fitModAttr("cpuOutput"),
+        "powerUsed": fit.pgUsed, "powerOutput": fitModAttr("powerOutput"),
+        "calibrationUsed": fit.calibrationUsed, "calibration": fitModAttr("upgradeCapacity")}
+    checks = (
+        stats["cpuUsed"] <= stats["cpuOutput"], stats["powerUsed"] <= stats["powerOutput"],
+        stats["calibrationUsed"] <= stats["calibration"],
+        fit.getHardpointsFree(FittingHardpoint.TURRET) >= 0, fit.getHardpointsFree(FittingHardpoint.MISSILE) >= 0)
+    stats["fits"] = all(checks) and all(isFittingAllowed(fit, mod) for mod in swapped)
+    return stats
+
+
+def buildModule(itemID, chargeID, oldMod):
+    """Build module to replace the old one with, keeping its state and charge where possible"""
+    mod = Module(eos.db.getItem(itemID))
+    if chargeID is not None:
+        mod.charge = eos.db.getItem(chargeID)
+    elif oldMod.charge is not None and mod.isValidCharge(oldMod.charge):
+        mod.charge = oldMod.charge
+    mod.state = mod.getMaxState(proposedState=oldMod.state)
+    return mod
+
+
+def sweepCombinations(fitText, keys, combinations, characterName=None, damagePatternID=None, fitStates=None):
+    """
+    Evaluate combinations in the current process. Every combination is a tuple with
+    (item ID, charge ID) per module key; fit states are the ones collected by
+    getFitStates(). Returns dictionary with stats per combination.
+    """
+    from service.evaluation import Evaluation, EvaluationError
+    evaluation = Evaluation.getInstance()
+    with evaluation.lock:
+        character = evaluation.getCharacter(characterName)
+        importType, fits = evaluation.importFits(fitText, character)
+        fit = fits[0]
+        try:
+            damagePattern = eos.db.getDamagePattern(damagePatternID) if damagePatternID is not None else None
+            if damagePattern is not None:
+                fit.damagePattern = damagePattern
+            if fitStates is not None:
+                applyFitStates(fit, fitStates)
+            positions = [findModulePosition(fit, key) for key in keys]
+            originals = [fit.modules[position] for position in positions]
+            results = []
+            with character.sharedSkillModifiers():
+                for combination in combinations:
+                    swapped = []
+                    for position, oldMod, (itemID, chargeID) in zip(positions, originals, combination):
+                        mod = buildModule(itemID, chargeID, oldMod)
+                        fit.modules.replace(position, mod)
+                        if fit.modules[position] is not mod:
+                            break
+                        swapped.append(mod)
+                    else:
+                        fit.updateModifiedAttributes()
+                        results.append(getSweepStats(fit, swapped))
+                        continue
+                    results.append({"error": "Unable to fit {}".format(eos.db.getItem(itemID).name)})
+        except (EvaluationError, VariationSweepError) as e:
+            return [{"error": str(e)}] * len(combinations)
+        finally:
+            evaluation.discardFit(fit)
+    return results
+
+
+class VariationSweep:
+    instance = None
+
+    @classmethod
+    def getInstance(cls):
+        if cls.instance is None:
+            cls.instance = VariationSweep()
+
+        return cls.instance
+
+    def __init__(self):
+        self.pool = None
+        self.workers = 0
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def getCandidates(mod, variations=True, charges=False):
+        """
+        Get list of (item ID, charge ID) candidates for the module slot. Charge ID is None
+        when module's current charge should be kept, if new item can use it.
+        """
+        if mod.isEmpty:
+            return []
+        items = Market.getInstance().getVariationsByItems([mod.item]) if variations else [mod.item]
+        items = sorted((i for i in items if Module.calculateSlot(i) == mod.slot), key=lambda i: i.ID)
+        if not charges:
+            return [(item.ID, None) for item in items]
+        candidates = []
+        for item in items:
+            validCharges = Module(item).getValidCharges()
+            if not validCharges:
+                candidates.append((item.ID, None))
+                continue
+            candidates.extend((item.ID, charge.ID) for charge in sorted(validCharges, key=lambda c: c.ID))
+        return candidates
+
+    def getPool(self, workers):
+        if self.pool is not None and self.workers == workers:
+            return self.pool
+        self.close()
+        from service.evalServer import createPool, getEnvArgs
+        self.pool = createPool(workers, getEnvArgs())
+        self.workers = workers
+        return self.pool
+
+    def close(self, terminate=False):
+        """Shut worker processes down; with terminate, running sweep is aborted"""
+        pool, self.pool = self.pool, None
+        self.workers = 0
+        if pool is not None:
+            if terminate:
+                pool.terminate()
+            else:
+                pool.close()
+            pool.join()
+
+    def sweep(self, fit, candidatesByMod, workers=None, cancelled=None):
+        """
+        Evaluate fit with every combination of candidates fitted. Candidates are passed as
+        {module: [(item ID, charge ID)]} dictionary. With zero workers, evaluation is done in
+        the current process, which is not safe while other threads use the calculation
+        engine. Returns list of rows, each with {module: (item ID, charge ID)} under "items"
+        key and stats (or error message under "error" key) of that combination.
+        """
+        return self.runSweep(self.prepare(fit, candidatesByMod), workers, cancelled)
+
+    def prepare(self, fit, candidatesByMod):
+        """
+        Export everything sweep needs from the fit. Fits are changed by commands on the
+        main thread, so when sweep is run in background, this part is done beforehand.
+        """
+        from service.port import Port
+        from service.port.eft import EFT_OPTIONS
+        mods = list(candidatesByMod)
+        keys = [getModuleKey(fit, mod) for mod in mods]
+        combinations = list(itertools.product(*(candidatesByMod[mod] for mod in mods)))
+        if len(combinations) > MAX_COMBINATIONS:
+            raise VariationSweepError("Too many combinations: {}".format(len(combinations)))
+        eftOptions = {option[0]: option[3] for option in EFT_OPTIONS}
+        eftOptions[PortEftOptions.LOADED_CHARGES] = True
+        # Export can load data from the database, which other threads might be using
+        with eos.db.sd_lock:
+            fitText = Port.exportEft(fit, eftOptions)
+            fitStates = getFitStates(fit)
+        characterName = fit.character.name if fit.character is not None else None
+        damagePatternID = fit.damagePattern.ID if fit.damagePattern is not None else None
+        return fit.ID, fitText, mods, keys, combinations, characterName, damagePatternID, fitStates
+
+    def runSweep(self, prepared, workers=None, cancelled=None):
+        """
+        Evaluate combinations exported by prepare(). Sweep is aborted with VariationSweepError
+        when cancelled event is set, or when worker processes are terminated.
+        """
+        fitID, fitText, mods, keys, combinations, characterName, damagePatternID, fitStates = prepared
+        if workers is None:
+            workers = max(1, min(4, (os.cpu_count() or 2) - 1))
+        pyfalog.debug("Sweeping {} combinations of fit {} with {} workers", len(combinations), fitID, workers)
+
+        if workers == 0:
+            results = sweepCombinations(fitText, keys, combinations, characterName, damagePatternID, fitStates)
+        else:
+            # Every worker gets a few batches, and updates its fit incrementally within a batch
+            batchSize = max(1, -(-len(combinations) // (workers * 4)))
+            batches = [
+                (fitText, keys, combinations[i:i + batchSize], characterName, damagePatternID, fitStates)
+                for i in range(0, len(combinations), batchSize)]
+            with self.lock:
+                pool = self.getPool(workers)
+                asyncResult = pool.starmap_async(sweepCombinations, batches)
+                while not asyncResult.ready():
+                    if self.pool is not pool or (cancelled is not None and cancelled.is_set()):
+                        self.close(terminate=True)
+                        raise VariationSweepError("Sweep was cancelled")
+                    asyncResult.wait(0.1)
+                results = [result for batch in asyncResult.get() for result in batch]
+        return [dict(result, items=dict(zip(mods, combination))) for combination, result in zip(combinations, results)]
+
+    @staticmethod
+    def sortResults(results, stat, reverse=True):
+        """Sort rows by stat; rows which failed to evaluate go last"""
+        evaluated = [r for r in results if "error" not in r]
+        failed = [r for r in results if "error" in r]
+        return sorted(evaluated, key=lambda r: r[stat], reverse=reverse) + failed
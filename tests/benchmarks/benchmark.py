@@ -0,0 +1,401 @@
+#!/usr/bin/env python3
+"""
+Benchmarks of fit calculation engine.
+
+Times full and incremental recalculation, capacitor simulation, tank and
+stats calculation, graph rendering, and fit import / export on fits from
+the benchmark corpus (see corpus.py). Results are written as JSON, which
+can be compared with results of an earlier run, e.g. of another commit:
+
+    python tests/benchmarks/benchmark.py -o before.json
+    (switch to another commit)
+    python tests/benchmarks/benchmark.py -o after.json -c before.json
+
+Saved data is kept in a temporary folder, which is removed afterwards, so
+benchmarks do not touch user's fits and characters. The harness uses only
+APIs which older commits have as well, so that they can be benchmarked too.
+"""
+
+import argparse
+import datetime
+import fnmatch
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+from collections import OrderedDict
+from time import perf_counter
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+pyfa_dir = os.path.realpath(os.path.join(script_dir, '..', '..'))
+sys.path.append(pyfa_dir)
+sys.path.append(script_dir)
+
+import corpus  # noqa: E402
+
+
+RESULTS_VERSION = 1
+
+
+def setupEnvironment(savePath):
+    """Configure paths and logging, has to be done before eos database is imported"""
+    import config
+    config.saveInRoot = False
+    config.debug = False
+    config.loggingLevel = config.LOGLEVEL_MAP['error']
+    config.defPaths(savePath)
+    config.defLogging()
+
+
+def collectStats(fit):
+    """Get main stats of calculated fit, the same ones fit stats panels show"""
+    shipAttr = fit.ship.getModifiedItemAttr
+    return (
+        fit.getWeaponDps(), fit.getDroneDps(), fit.getWeaponVolley(), fit.getDroneVolley(),
+        fit.hp, fit.ehp, fit.capStable, fit.capState, fit.capUsed, fit.capRecharge,
+        fit.maxSpeed, fit.alignTime, fit.warpSpeed, fit.maxTargets, fit.maxTargetRange,
+        fit.scanStrength, fit.scanType, [fit.calculateLockTime(radius) for radius in (25, 38, 130, 420)],
+        fit.cpuUsed, fit.pgUsed, fit.calibrationUsed,
+        shipAttr("cpuOutput"), shipAttr("powerOutput"), shipAttr("signatureRadius"))
+
+
+def measure(func, repeat, warmup=1, setup=None):
+    """Run function repeatedly and return statistics of its run times in seconds"""
+    timings = []
+    for i in range(warmup + repeat):
+        if setup is not None:
+            setup()
+        start = perf_counter()
+        func()
+        elapsed = perf_counter() - start
+        if i >= warmup:
+            timings.append(elapsed)
+    return OrderedDict((
+        ("runs", len(timings)),
+        ("min", min(timings)),
+        ("median", statistics.median(timings)),
+        ("mean", statistics.mean(timings)),
+        ("max", max(timings))))
+
+
+def getCommit():
+    """Get hash of checked out commit, with mark if working tree has changes"""
+    try:
+        commit = subprocess.check_output(
+            ("git", "rev-parse", "HEAD"), cwd=pyfa_dir, stderr=subprocess.DEVNULL).decode().strip()
+        changes = subprocess.check_output(
+            ("git", "status", "--porcelain", "--untracked-files=no"), cwd=pyfa_dir, stderr=subprocess.DEVNULL).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return "{}-dirty".format(commit) if changes else commit
+
+
+def compareResults(oldResults, newResults, threshold):
+    """
+    Compare median run times of benchmarks present in both results. Returns
+    list of (name, old median, new median, relative change, is regression)
+    """
+    oldBenchmarks = oldResults["benchmarks"]
+    comparison = []
+    for name, stats in newResults["benchmarks"].items():
+        if name not in oldBenchmarks:
+            continue
+        oldMedian = oldBenchmarks[name]["median"]
+        newMedian = stats["median"]
+        change = newMedian / oldMedian - 1 if oldMedian > 0 else 0
+        comparison.append((name, oldMedian, newMedian, change, change > threshold))
+    return comparison
+
+
+class BenchmarkRunner:
+
+    def __init__(self, repeat, warmup, patterns):
+        self.repeat = repeat
+        self.warmup = warmup
+        self.patterns = patterns
+        self.results = OrderedDict()
+
+    def isSelected(self, name):
+        return not self.patterns or any(fnmatch.fnmatch(name, pattern) for pattern in self.patterns)
+
+    def run(self, name, func, setup=None):
+        if not self.isSelected(name):
+            return
+        stats = measure(func, self.repeat, self.warmup, setup)
+        self.results[name] = stats
+        print("{:<50} median {:>10.3f} ms   min {:>10.3f} ms".format(name, stats["median"] * 1000, stats["min"] * 1000))
+
+
+class FitBenchmarks:
+    """Benchmarks which need gamedata, eos and services to be loaded"""
+
+    def __init__(self, runner, characterName):
+        import eos.db
+        self.runner = runner
+        self.character = eos.db.getCharacter(characterName)
+        if self.character is None:
+            raise ValueError("Unknown character: {}".format(characterName))
+        self.fits = OrderedDict()
+        for name, text in corpus.FITS.items():
+            self.fits[name] = self.importFit(text)
+        self.fits["chain"] = self.buildChain()
+
+    def importFit(self, text):
+        import eos.db
+        from eos.const import ImplantLocation
+        from service.fit import Fit
+        from service.port import Port
+        importType, makesNewFits, fits = Port.importAuto(text)
+        fit = fits[0]
+        # Set fit up the same way as fits imported via GUI are
+        sFit = Fit.getInstance()
+        fit.character = self.character
+        fit.damagePattern = sFit.pattern
+        fit.targetProfile = sFit.targetProfile
+        if len(fit.implants) > 0:
+            fit.implantLocation = ImplantLocation.FIT
+        else:
+            useCharImplants = sFit.serviceFittingOptions["useCharacterImplantsByDefault"]
+            fit.implantLocation = ImplantLocation.CHARACTER if useCharImplants else ImplantLocation.FIT
+        # Fits are saved to temporary saved data, as projection and graph
+        # caches rely on fit IDs
+        eos.db.save(fit)
+        return fit
+
+    def buildChain(self):
+        import eos.db
+        victim = self.importFit(corpus.FITS[corpus.CHAIN_VICTIM])
+        projectedFits = [self.importFit(text) for text in corpus.CHAIN_PROJECTED.values()]
+        commandFits = [self.importFit(text) for text in corpus.CHAIN_COMMAND.values()]
+        for boostedFit in [victim] + projectedFits:
+            for commandFit in commandFits:
+                boostedFit.commandFitDict[commandFit.ID] = commandFit
+        for projectedFit in projectedFits:
+            victim.projectedFitDict[projectedFit.ID] = projectedFit
+        # Same as when projecting fits via GUI, see issue #83
+        eos.db.saveddata_session.flush()
+        for fit in projectedFits + commandFits:
+            eos.db.saveddata_session.refresh(fit)
+        eos.db.commit()
+        return victim
+
+    def recalc(self, fit):
+        fit.clear()
+        fit.calculateModifiedAttributes()
+
+    def update(self, fit):
+        """Update fit after a change, incrementally where engine supports it"""
+        if hasattr(fit, "updateModifiedAttributes"):
+            fit.updateModifiedAttributes()
+        else:
+            self.recalc(fit)
+
+    def runAll(self):
+        for name, fit in self.fits.items():
+            self.runCalc(name, fit)
+        for name, fit in self.fits.items():
+            self.runPort(name, fit)
+        self.runGraphs()
+
+    def runCalc(self, name, fit):
+        from eos.const import FittingModuleState
+        self.runner.run("calc.full.{}".format(name), lambda: self.recalc(fit))
+
+        # Incremental update after toggling state of a module, as done
+        # when module state is changed via GUI
+        toggledMod = next((mod for mod in fit.modules if not mod.isEmpty and mod.isValidState(FittingModuleState.ACTIVE)), None)
+        if toggledMod is not None:
+            def toggleAndUpdate():
+                toggledMod.state = FittingModuleState.ONLINE if toggledMod.state == FittingModuleState.ACTIVE else FittingModuleState.ACTIVE
+                self.update(fit)
+
+            originalState = toggledMod.state
+            self.update(fit)
+            self.runner.run("calc.incremental.{}".format(name), toggleAndUpdate)
+            toggledMod.state = originalState
+
+        self.recalc(fit)
+        self.runner.run("capacitor.{}".format(name), fit.simulateCap)
+
+        def getTank():
+            return fit.sustainableTank, fit.effectiveSustainableTank
+
+        self.runner.run("tank.{}".format(name), getTank, setup=lambda: self.recalc(fit))
+        self.runner.run("stats.{}".format(name), lambda: collectStats(fit), setup=lambda: self.recalc(fit))
+
+    def runPort(self, name, fit):
+        from service.port import Port
+        from service.port.dna import DNA_OPTIONS
+        from service.port.eft import EFT_OPTIONS
+        eftOptions = {option[0]: option[3] for option in EFT_OPTIONS}
+        # Formatting tags are not understood by DNA import
+        dnaOptions = {option[0]: False for option in DNA_OPTIONS}
+        self.recalc(fit)
+        eftText = Port.exportEft(fit, eftOptions)
+        dnaText = Port.exportDna(fit, dnaOptions)
+        xmlText = Port.exportXml([fit])
+        self.runner.run("export.eft.{}".format(name), lambda: Port.exportEft(fit, eftOptions))
+        self.runner.run("export.dna.{}".format(name), lambda: Port.exportDna(fit, dnaOptions))
+        self.runner.run("export.xml.{}".format(name), lambda: Port.exportXml([fit]))
+        self.runner.run("import.eft.{}".format(name), lambda: Port.importAuto(eftText))
+        self.runner.run("import.dna.{}".format(name), lambda: Port.importAuto(dnaText))
+        self.runner.run("import.xml.{}".format(name), lambda: Port.importAuto(xmlText))
+
+    def runGraphs(self):
+        if not any(self.runner.isSelected("graph.*.{}".format(name)) for name in self.fits):
+            return
+        # Graph package pulls GUI modules in, thus it is loaded only when needed
+        import graphs.data  # noqa: F401
+        from eos.saveddata.targetProfile import TargetProfile
+        from graphs.data.base import FitGraph
+        from graphs.wrapper import SourceWrapper, TargetWrapper
+        target = TargetWrapper(TargetProfile.getIdeal(), lightnessID=None, lineStyleID=None)
+        for viewClass in FitGraph.views:
+            view = viewClass()
+            for name, fit in self.fits.items():
+                benchmarkName = "graph.{}.{}".format(view.internalName, name)
+                if not self.runner.isSelected(benchmarkName):
+                    continue
+                self.recalc(fit)
+                source = SourceWrapper(fit, colorID=None)
+                plots = self.getGraphPlots(view, source, target if view.hasTargets else None)
+                if not plots:
+                    continue
+                self.runner.run(benchmarkName, lambda: self.renderGraph(view, plots), setup=lambda: self.clearGraphCache(view))
+
+    @staticmethod
+    def clearGraphCache(view):
+        from service.const import GraphCacheCleanupReason
+        view.clearCache(reason=GraphCacheCleanupReason.graphSwitched)
+
+    @staticmethod
+    def renderGraph(view, plots):
+        for plot in plots:
+            view.getPlotPoints(**plot)
+
+    def getGraphPlots(self, view, source, target):
+        """Get arguments of all plots graph can draw for the source, with input values set to defaults"""
+        plots = []
+        for xDef in view.xDefs:
+            for yDef in view.yDefs:
+                mainInput, miscInputs = self.getGraphInputs(view, xDef, yDef)
+                plot = dict(mainInput=mainInput, miscInputs=miscInputs, xSpec=xDef, ySpec=yDef, src=source, tgt=target)
+                # Skip plots which cannot be drawn for the fit, just like graph
+                # window does
+                try:
+                    view.getPlotPoints(**plot)
+                except Exception as e:
+                    print("Skipping {} graph {} vs {} for {}: {}".format(view.internalName, yDef.handle, xDef.handle, source.item.name, e))
+                    continue
+                plots.append(plot)
+        self.clearGraphCache(view)
+        return plots
+
+    @staticmethod
+    def getGraphInputs(view, xDef, yDef):
+        """Compose graph inputs the same way graph control panel does, using default values"""
+        from graphs.gui.ctrlPanel import InputData
+
+        def conditionsMatch(inputDef):
+            if not inputDef.conditions:
+                return True
+            for xCond, yCond in inputDef.conditions:
+                xMatch = xCond is None or tuple(xCond) == (xDef.handle, xDef.unit)
+                yMatch = yCond is None or tuple(yCond) == (yDef.handle, yDef.unit)
+                if xMatch and yMatch:
+                    return True
+            return False
+
+        mainInputDef = view.inputMap[xDef.mainInput]
+        mainInput = InputData(handle=mainInputDef.handle, unit=mainInputDef.unit, value=mainInputDef.defaultRange)
+        handledHandles = {mainInputDef.handle}
+        miscInputs = []
+        # Default vectors of control panel: stationary attacker and target
+        # moving at full speed
+        for vectorDef, length in ((view.srcVectorDef, 0), (view.tgtVectorDef, 100)):
+            if vectorDef is None:
+                continue
+            if vectorDef.lengthHandle != mainInputDef.handle:
+                miscInputs.append(InputData(handle=vectorDef.lengthHandle, unit=vectorDef.lengthUnit, value=length))
+            miscInputs.append(InputData(handle=vectorDef.angleHandle, unit=vectorDef.angleUnit, value=90))
+            handledHandles.update((vectorDef.lengthHandle, vectorDef.angleHandle))
+        for inputDef in view.inputs:
+            if inputDef.handle not in handledHandles and conditionsMatch(inputDef):
+                handledHandles.add(inputDef.handle)
+                miscInputs.append(InputData(handle=inputDef.handle, unit=inputDef.unit, value=inputDef.defaultValue))
+        for checkboxDef in view.checkboxes:
+            if checkboxDef.handle not in handledHandles and conditionsMatch(checkboxDef):
+                handledHandles.add(checkboxDef.handle)
+                miscInputs.append(InputData(handle=checkboxDef.handle, unit=None, value=checkboxDef.defaultValue))
+        return mainInput, miscInputs
+
+
+def printComparison(comparison, threshold):
+    print()
+    print("{:<50} {:>12} {:>12} {:>9}".format("benchmark", "old, ms", "new, ms", "change"))
+    for name, oldMedian, newMedian, change, isRegression in comparison:
+        print("{:<50} {:>12.3f} {:>12.3f} {:>+8.1f}%{}".format(
+            name, oldMedian * 1000, newMedian * 1000, change * 100, "  REGRESSION" if isRegression else ""))
+    regressions = sum(1 for row in comparison if row[4])
+    print("{} of {} benchmarks are slower by more than {:.0f}%".format(regressions, len(comparison), threshold * 100))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark fit calculation engine")
+    parser.add_argument("-o", "--output", type=str, help="path to JSON file to write results to")
+    parser.add_argument("-c", "--compare", type=str, help="path to JSON file with earlier results to compare with")
+    parser.add_argument("-t", "--threshold", type=float, default=0.1,
+                        help="relative slowdown of median time reported as regression, default 0.1")
+    parser.add_argument("-r", "--repeat", type=int, default=10, help="timed runs of every benchmark, default 10")
+    parser.add_argument("-w", "--warmup", type=int, default=1, help="untimed runs before timed ones, default 1")
+    parser.add_argument("-k", "--select", action="append", default=[],
+                        help="run only benchmarks with names matching the pattern, e.g. 'calc.*'; can be repeated")
+    parser.add_argument("--character", type=str, default="All 5", help="character to calculate fits with, default 'All 5'")
+    args = parser.parse_args()
+
+    savePath = tempfile.mkdtemp(prefix="pyfa-benchmark-")
+    try:
+        setupEnvironment(savePath)
+        import config
+        with config.logging_setup.threadbound():
+            import eos.config
+            import eos.db  # noqa: F401
+            import eos.events  # noqa: F401
+            import service.prefetch  # noqa: F401
+            runner = BenchmarkRunner(args.repeat, args.warmup, args.select)
+            FitBenchmarks(runner, args.character).runAll()
+            eos.db.saveddata_session.close()
+            results = OrderedDict((
+                ("version", RESULTS_VERSION),
+                ("commit", getCommit()),
+                ("date", datetime.datetime.now().isoformat()),
+                ("python", platform.python_version()),
+                ("platform", platform.platform()),
+                ("gamedataVersion", eos.config.gamedata_version),
+                ("repeat", args.repeat),
+                ("benchmarks", runner.results)))
+    finally:
+        shutil.rmtree(savePath, ignore_errors=True)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+    if args.compare:
+        with open(args.compare, "r") as f:
+            oldResults = json.load(f)
+        if oldResults.get("version") != RESULTS_VERSION:
+            print("Results in {} have different format and cannot be compared".format(args.compare))
+            return 2
+        regressions = printComparison(compareResults(oldResults, results, args.threshold), args.threshold)
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
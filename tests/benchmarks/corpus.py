@@ -0,0 +1,195 @@
+"""
+Fits used by calculation engine benchmarks, in EFT format.
+
+Corpus is meant to stay stable - changing any of the fits makes results
+incomparable with results recorded before the change, so add new fits under
+new names instead of editing existing ones.
+"""
+
+from collections import OrderedDict
+
+
+FITS = OrderedDict()
+
+FITS["subcap"] = """
+[Rifter, Benchmark Rifter]
+Gyrostabilizer II
+Damage Control II
+Small Armor Repairer II
+
+1MN Afterburner II
+Warp Scrambler II
+Stasis Webifier II
+
+200mm AutoCannon II, EMP S
+200mm AutoCannon II, EMP S
+200mm AutoCannon II, EMP S
+Rocket Launcher II, Nova Rage Rocket
+
+Small Projectile Burst Aerator I
+Small Projectile Collision Accelerator I
+Small Auxiliary Nano Pump I
+
+Warrior II x1
+"""
+
+FITS["capital"] = """
+[Revelation, Benchmark Revelation]
+Heat Sink II
+Heat Sink II
+Heat Sink II
+Capital Armor Repairer I
+Energized Adaptive Nano Membrane II
+Damage Control II
+Reactor Control Unit II
+
+Cap Recharger II
+Cap Recharger II
+Capital Capacitor Booster II, Navy Cap Booster 3200
+Sensor Booster II, Targeting Range Script
+
+Dual Giga Pulse Laser I, Imperial Navy Multifrequency XL
+Dual Giga Pulse Laser I, Imperial Navy Multifrequency XL
+Dual Giga Pulse Laser I, Imperial Navy Multifrequency XL
+Siege Module II
+
+Capital Energy Burst Aerator I
+Capital Trimark Armor Pump I
+Capital Trimark Armor Pump I
+"""
+
+FITS["strategic"] = """
+[Loki, Benchmark Loki]
+Gyrostabilizer II
+Gyrostabilizer II
+Damage Control II
+Tracking Enhancer II
+
+50MN Microwarpdrive II
+Large Shield Extender II
+Large Shield Extender II
+Warp Disruptor II
+Stasis Webifier II
+
+425mm AutoCannon II, Republic Fleet EMP M
+425mm AutoCannon II, Republic Fleet EMP M
+425mm AutoCannon II, Republic Fleet EMP M
+425mm AutoCannon II, Republic Fleet EMP M
+425mm AutoCannon II, Republic Fleet EMP M
+
+Medium Core Defense Field Extender I
+Medium Core Defense Field Extender I
+Medium Projectile Burst Aerator I
+
+Loki Core - Immobility Drivers
+Loki Defensive - Adaptive Defense Node
+Loki Offensive - Projectile Scoping Array
+Loki Propulsion - Intercalated Nanofibers
+
+Hammerhead II x5
+"""
+
+FITS["structure"] = """
+[Fortizar, Benchmark Fortizar]
+Standup Ballistic Control System I
+Standup Ballistic Control System I
+Standup Signal Amplifier I
+
+Standup Heavy Energy Neutralizer I
+Standup Warp Scrambler I
+Standup Stasis Webifier I
+Standup Focused Warp Disruptor I
+
+Standup Anticapital Missile Launcher I
+Standup Multirole Missile Launcher I
+Standup Point Defense Battery I
+Standup Guided Bomb Launcher I
+
+Standup Market Hub I
+Standup Cloning Center I
+"""
+
+# Fits of projection / command chain. Chain victim gets projected fits applied
+# to it, and every projected fit is boosted by every command fit, so that one
+# recalculation of the victim goes through the whole chain.
+CHAIN_VICTIM = "subcap"
+
+CHAIN_PROJECTED = OrderedDict()
+
+CHAIN_PROJECTED["neutralizer"] = """
+[Curse, Benchmark Chain Curse]
+Damage Control II
+Signal Distortion Amplifier II
+
+50MN Microwarpdrive II
+Large Shield Extender II
+Large Shield Extender II
+Tracking Disruptor II, Optimal Range Disruption Script
+
+Heavy Energy Neutralizer II
+Heavy Energy Neutralizer II
+Heavy Energy Neutralizer II
+Heavy Energy Nosferatu II
+
+Hammerhead II x5
+"""
+
+CHAIN_PROJECTED["webifier"] = """
+[Huginn, Benchmark Chain Huginn]
+Damage Control II
+Power Diagnostic System II
+
+50MN Microwarpdrive II
+Large Shield Extender II
+Stasis Webifier II
+Stasis Webifier II
+Target Painter II
+
+Heavy Assault Missile Launcher II, Scourge Rage Heavy Assault Missile
+Heavy Assault Missile Launcher II, Scourge Rage Heavy Assault Missile
+Heavy Assault Missile Launcher II, Scourge Rage Heavy Assault Missile
+"""
+
+CHAIN_PROJECTED["logistics"] = """
+[Guardian, Benchmark Chain Guardian]
+Damage Control II
+Energized Adaptive Nano Membrane II
+1600mm Steel Plates II
+
+10MN Afterburner II
+Sensor Booster II, Scan Resolution Script
+Large Cap Battery II
+
+Large Remote Armor Repairer II
+Large Remote Armor Repairer II
+Large Remote Armor Repairer II
+Large Remote Capacitor Transmitter II
+"""
+
+CHAIN_COMMAND = OrderedDict()
+
+CHAIN_COMMAND["shield"] = """
+[Claymore, Benchmark Chain Claymore]
+Damage Control II
+Power Diagnostic System II
+
+50MN Microwarpdrive II
+Large Shield Extender II
+Large Shield Extender II
+
+Shield Command Burst II, Shield Harmonizing Charge
+Skirmish Command Burst II, Rapid Deployment Charge
+Information Command Burst II, Sensor Optimization Charge
+"""
+
+CHAIN_COMMAND["armor"] = """
+[Damnation, Benchmark Chain Damnation]
+Damage Control II
+1600mm Steel Plates II
+
+50MN Microwarpdrive II
+
+Armor Command Burst II, Armor Energizing Charge
+Armor Command Burst II, Rapid Repair Charge
+Armor Command Burst II, Armor Reinforcement Charge
+"""
@@ -0,0 +1,43 @@
+# Add root folder to python paths
+# This must be done on every test in order to pass in Travis
+import os
+import sys
+script_dir = os.path.dirname(os.path.abspath(__file__))
+script_dir = os.path.realpath(os.path.join(script_dir, '..', '..', '..'))
+print(script_dir)
+sys.path.append(script_dir)
+
+# noinspection PyPackageRequirements
+
+ATTRIBUTES = ("shieldEmDamageResonance", "shieldCapacity", "cpuOutput", "cpuLoad", "maxVelocity", "signatureRadius")
+MODULES = ("EM Ward Amplifier II", "EM Ward Amplifier II", "EM Ward Amplifier II", "Medium Shield Extender II")
+
+
+def _buildFit(DB, Saveddata):
+    ship = Saveddata['Ship'](DB['db'].getItem("Rifter"))
+    fit = Saveddata['Fit'](ship, "My Rifter Fit")
+    fit.character = Saveddata['Character'].getAll5()
+    for itemName in MODULES:
+        fit.modules.append(Saveddata['Module'](DB['db'].getItem(itemName)))
+    fit.calculateModifiedAttributes()
+    return {attr: fit.ship.getModifiedItemAttr(attr) for attr in ATTRIBUTES}
+
+
+def test_array_backend_matches_dict_backend(DB, Saveddata):
+    """
+    Tests that array-backed attribute maps calculate the same values as regular ones
+    """
+    import eos.config
+    from eos.arrayAttributeDict import ArrayModifiedAttributeDict
+
+    expected = _buildFit(DB, Saveddata)
+    backend = eos.config.attributeBackend
+    threshold = ArrayModifiedAttributeDict.vectorizeThreshold
+    eos.config.attributeBackend = "array"
+    try:
+        # Check both per-attribute and bulk calculation
+        for ArrayModifiedAttributeDict.vectorizeThreshold in (sys.maxsize, 0):
+            assert _buildFit(DB, Saveddata) == expected
+    finally:
+        eos.config.attributeBackend = backend
+        ArrayModifiedAttributeDict.vectorizeThreshold = threshold
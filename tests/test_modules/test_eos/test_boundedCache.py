@@ -0,0 +1,33 @@
+# Add root folder to python paths
+# This must be done on every test in order to pass in Travis
+import os
+import sys
+script_dir = os.path.dirname(os.path.abspath(__file__))
+script_dir = os.path.realpath(os.path.join(script_dir, '..', '..', '..'))
+print(script_dir)
+sys.path.append(script_dir)
+
+
+def test_queryCache_evictsLeastRecentlyUsed(DB):
+    from eos.db.boundedCache import QueryCache, getCacheStats
+    cache = QueryCache("testQuery", 2, 1024 * 1024)
+    cache.store(("a",), 1)
+    cache.store(("b",), 2)
+    assert cache.get(("a",)) == (True, 1)
+    cache.store(("c",), 3)
+    # "b" was used least recently
+    assert cache.get(("b",)) == (False, None)
+    assert cache.get(("c",)) == (True, 3)
+    stats = getCacheStats()["testQuery"]
+    assert (stats["entries"], stats["hits"], stats["misses"], stats["evictions"]) == (2, 2, 1, 1)
+
+
+def test_queryCache_limitsSize(DB):
+    from eos.db.boundedCache import QueryCache
+    cache = QueryCache("testSizedQuery", 100, 2000)
+    for i in range(10):
+        cache.store((i,), list(range(50)))
+    # Every result takes ~1KB with the list of ints it contains
+    assert cache.bytes <= 2000
+    assert len(cache.entries) < 10
+    assert cache.get((9,))[0]
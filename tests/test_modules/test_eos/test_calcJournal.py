@@ -0,0 +1,146 @@
+# Add root folder to python paths
+# This must be done on every test in order to pass in Travis
+import os
+import sys
+script_dir = os.path.dirname(os.path.abspath(__file__))
+script_dir = os.path.realpath(os.path.join(script_dir, '..', '..', '..'))
+print(script_dir)
+sys.path.append(script_dir)
+
+# noinspection PyPackageRequirements
+
+ATTRIBUTES = ("shieldEmDamageResonance", "shieldCapacity", "cpuOutput", "maxVelocity", "signatureRadius")
+
+
+def _shipAttrs(fit):
+    return {attr: fit.ship.getModifiedItemAttr(attr) for attr in ATTRIBUTES}
+
+
+def _allAttrs(fit):
+    attrs = {"ship": dict(fit.ship.itemModifiedAttributes)}
+    for position, mod in enumerate(fit.modules):
+        if not mod.isEmpty:
+            attrs[position] = (dict(mod.itemModifiedAttributes), dict(mod.chargeModifiedAttributes))
+    return attrs
+
+
+def _assertUpdateMatchesFullCalc(fit):
+    fit.updateModifiedAttributes()
+    updated = _allAttrs(fit)
+    fit.clear()
+    fit.calculateModifiedAttributes()
+    assert _allAttrs(fit) == updated
+    # Full calculation without journal drops it, record a new one
+    fit.calculated = False
+    fit.updateModifiedAttributes()
+
+
+def test_incremental_update_matches_full_calc(DB, Saveddata, RifterFit):
+    """
+    Tests that incremental updates produce the same values as calculation from scratch
+    """
+    RifterFit.character = Saveddata['Character'].getAll5()
+    RifterFit.updateModifiedAttributes()
+
+    for itemName in ("EM Ward Amplifier II", "Medium Shield Extender II", "EM Ward Amplifier II"):
+        RifterFit.modules.append(Saveddata['Module'](DB['db'].getItem(itemName)))
+        RifterFit.updateModifiedAttributes()
+        updated = _shipAttrs(RifterFit)
+
+        RifterFit.clear()
+        RifterFit.calculateModifiedAttributes()
+        assert _shipAttrs(RifterFit) == updated
+        # Full calculation without journal drops it, record a new one
+        RifterFit.calculated = False
+        RifterFit.updateModifiedAttributes()
+
+    RifterFit.modules.remove(RifterFit.modules[0])
+    RifterFit.updateModifiedAttributes()
+    updated = _shipAttrs(RifterFit)
+    RifterFit.clear()
+    RifterFit.calculateModifiedAttributes()
+    assert _shipAttrs(RifterFit) == updated
+
+
+def test_evaluateUnder_restoresCalculatedState(DB, Saveddata, RifterFit):
+    """
+    Tests that what-if evaluation sees overridden state, and that fit gets back
+    to its calculated state afterwards, including when evaluation fails
+    """
+    from eos.const import FittingModuleState
+    prop = Saveddata['Module'](DB['db'].getItem("1MN Afterburner II"))
+    prop.state = FittingModuleState.ACTIVE
+    RifterFit.character = Saveddata['Character'].getAll5()
+    RifterFit.modules.append(prop)
+    RifterFit.updateModifiedAttributes()
+    expected = _shipAttrs(RifterFit)
+
+    with RifterFit.evaluateUnder([(prop, "state", FittingModuleState.ONLINE)]):
+        assert prop.state == FittingModuleState.ONLINE
+        assert RifterFit.ship.getModifiedItemAttr("maxVelocity") < expected["maxVelocity"]
+    assert prop.state == FittingModuleState.ACTIVE
+    assert _shipAttrs(RifterFit) == expected
+
+    try:
+        with RifterFit.evaluateUnder([(prop, "state", FittingModuleState.OFFLINE)]):
+            raise RuntimeError
+    except RuntimeError:
+        pass
+    assert prop.state == FittingModuleState.ACTIVE
+    assert _shipAttrs(RifterFit) == expected
+    # Journal is still usable for incremental updates
+    RifterFit.modules.append(Saveddata['Module'](DB['db'].getItem("EM Ward Amplifier II")))
+    RifterFit.updateModifiedAttributes()
+    updated = _shipAttrs(RifterFit)
+    RifterFit.clear()
+    RifterFit.calculateModifiedAttributes()
+    assert _shipAttrs(RifterFit) == updated
+
+
+def test_incremental_update_matches_full_calc_after_state_changes(DB, Saveddata, RifterFit):
+    """
+    Tests that incremental updates after module state changes produce the same values as
+    calculation from scratch, for every attribute of ship and modules
+    """
+    from eos.const import FittingModuleState
+    RifterFit.character = Saveddata['Character'].getAll5()
+    mods = []
+    for itemName in ("1MN Afterburner II", "Damage Control II", "EM Ward Amplifier II"):
+        mod = Saveddata['Module'](DB['db'].getItem(itemName))
+        mod.state = mod.getMaxState(proposedState=FittingModuleState.ACTIVE)
+        RifterFit.modules.append(mod)
+        mods.append(mod)
+    RifterFit.updateModifiedAttributes()
+
+    for mod in mods:
+        for state in (FittingModuleState.ONLINE, FittingModuleState.OFFLINE, FittingModuleState.ACTIVE):
+            mod.state = mod.getMaxState(proposedState=state)
+            _assertUpdateMatchesFullCalc(RifterFit)
+
+
+def test_incremental_update_matches_full_calc_after_fitting_changes(DB, Saveddata, RifterFit):
+    """
+    Tests that incremental updates after adding, removing and replacing modules and
+    charges produce the same values as calculation from scratch
+    """
+    RifterFit.character = Saveddata['Character'].getAll5()
+    RifterFit.updateModifiedAttributes()
+
+    gun = Saveddata['Module'](DB['db'].getItem("125mm Gatling AutoCannon II"))
+    gun.charge = DB['db'].getItem("EMP S")
+    RifterFit.modules.append(gun)
+    _assertUpdateMatchesFullCalc(RifterFit)
+    gun.charge = DB['db'].getItem("Fusion S")
+    _assertUpdateMatchesFullCalc(RifterFit)
+    gun.charge = None
+    _assertUpdateMatchesFullCalc(RifterFit)
+
+    for itemName in ("Damage Control II", "Medium Shield Extender II", "EM Ward Amplifier II"):
+        RifterFit.modules.append(Saveddata['Module'](DB['db'].getItem(itemName)))
+        _assertUpdateMatchesFullCalc(RifterFit)
+    position = RifterFit.modules.index(gun)
+    RifterFit.modules.replace(position, Saveddata['Module'](DB['db'].getItem("1MN Afterburner II")))
+    _assertUpdateMatchesFullCalc(RifterFit)
+    while RifterFit.modules:
+        RifterFit.modules.remove(RifterFit.modules[0])
+        _assertUpdateMatchesFullCalc(RifterFit)
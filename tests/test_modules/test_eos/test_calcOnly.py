@@ -0,0 +1,39 @@
+# Add root folder to python paths
+# This must be done on every test in order to pass in Travis
+import os
+import sys
+script_dir = os.path.dirname(os.path.abspath(__file__))
+script_dir = os.path.realpath(os.path.join(script_dir, '..', '..', '..'))
+print(script_dir)
+sys.path.append(script_dir)
+
+# noinspection PyPackageRequirements
+
+ATTRIBUTES = ("shieldEmDamageResonance", "shieldCapacity", "cpuOutput", "maxVelocity", "signatureRadius")
+
+
+def _shipAttrs(fit):
+    return {attr: fit.ship.getModifiedItemAttr(attr) for attr in ATTRIBUTES}
+
+
+def test_calcOnly_matchesSavedFit(DB, Saveddata, RifterFit):
+    """
+    Tests that calculation-only copy of a fit keeps attributes in slots, and calculates the same
+    values as the fit it was copied from
+    """
+    from eos.calcOnly import isCalcOnly, toCalcOnly
+    from eos.const import FittingModuleState
+    RifterFit.character = Saveddata['Character'].getAll5()
+    for itemName in ("1MN Afterburner II", "EM Ward Amplifier II", "Medium Shield Extender II"):
+        mod = Saveddata['Module'](DB['db'].getItem(itemName))
+        mod.state = FittingModuleState.ACTIVE
+        RifterFit.modules.append(mod)
+    RifterFit.calculateModifiedAttributes()
+
+    calcFit = toCalcOnly(RifterFit)
+    assert isCalcOnly(calcFit) and not isCalcOnly(RifterFit)
+    assert not hasattr(calcFit, "__dict__")
+    assert all(not hasattr(mod, "__dict__") for mod in calcFit.modules)
+    calcFit.calculateModifiedAttributes()
+    assert _shipAttrs(calcFit) == _shipAttrs(RifterFit)
+    assert calcFit.cpuUsed == RifterFit.cpuUsed
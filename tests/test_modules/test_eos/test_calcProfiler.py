@@ -0,0 +1,47 @@
+# Add root folder to python paths
+# This must be done on every test in order to pass in Travis
+import os
+import sys
+script_dir = os.path.dirname(os.path.abspath(__file__))
+script_dir = os.path.realpath(os.path.join(script_dir, '..', '..', '..'))
+print(script_dir)
+sys.path.append(script_dir)
+
+# noinspection PyPackageRequirements
+
+
+def test_profiler_collectsEffectStats(DB, Saveddata, RifterFit):
+    """
+    Tests that profiled calculation gives the same results, and that profiler
+    sees handlers, list passes and attribute operations of the calculation
+    """
+    import json
+    from eos.calcHooks import hooksEnabled
+    from eos.calcProfiler import CalcProfiler, profilerState
+
+    RifterFit.character = Saveddata['Character'].getAll5()
+    RifterFit.modules.append(Saveddata['Module'](DB['db'].getItem("EM Ward Amplifier II")))
+    RifterFit.calculateModifiedAttributes()
+    expected = RifterFit.ship.getModifiedItemAttr("shieldEmDamageResonance")
+
+    profiler = CalcProfiler()
+    RifterFit.clear()
+    with profiler:
+        RifterFit.calculateModifiedAttributes()
+    assert profilerState.profiler is None
+    # Hooks are swapped out of attribute maps and effects when profiler is done
+    assert not hooksEnabled()
+    assert RifterFit.ship.getModifiedItemAttr("shieldEmDamageResonance") == expected
+
+    profile = json.loads(json.dumps(profiler.export()))
+    assert profile["effects"]
+    assert {row["runTime"] for row in profile["runTimes"]} <= {"early", "normal", "late"}
+    assert any(row["type"] == "Module" and row["name"] == "EM Ward Amplifier II" for row in profile["sources"])
+    assert profile["listPasses"]
+    assert sum(row["calls"] for row in profile["operations"]) > 0
+
+    # Nothing is collected while profiler is not active
+    calls = sum(row[3].calls for row in profiler.getEffectStats())
+    RifterFit.clear()
+    RifterFit.calculateModifiedAttributes()
+    assert sum(row[3].calls for row in profiler.getEffectStats()) == calls
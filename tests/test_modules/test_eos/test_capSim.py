@@ -0,0 +1,77 @@
+# Add root folder to python paths
+# This must be done on every test in order to pass in Travis
+import os
+import sys
+script_dir = os.path.dirname(os.path.abspath(__file__))
+script_dir = os.path.realpath(os.path.join(script_dir, '..', '..', '..'))
+print(script_dir)
+sys.path.append(script_dir)
+
+import pytest
+
+from eos import capSim
+
+# (duration, capNeed, clipSize, disableStagger, reloadTime, isInjector)
+DRAINS = (
+    ((5000, 40, 0, False, 0, False), (5000, 40, 0, False, 0, False), (4000, 12, 0, True, 0, False)),
+    ((3000, 60, 0, False, 0, False), (10000, 120, 0, False, 0, False)),
+    ((6000, 20.5, 8, False, 10000, False), (6000, 20.5, 8, False, 10000, False), (2000, 5, 0, False, 0, False)))
+
+
+def _makeSim(cls, drains, reload, capacity=800, recharge=200000):
+    sim = cls()
+    sim.init(drains)
+    sim.capacitorCapacity = capacity
+    sim.capacitorRecharge = recharge
+    sim.startingCapacity = capacity
+    sim.stagger = True
+    sim.t_max = 6 * 60 * 60 * 1000
+    sim.reload = reload
+    return sim
+
+
+def _getResults(sim):
+    return sim.t, sim.iterations, sim.result_optimized_repeats, sim.cap_stable_low, sim.cap_stable_high
+
+
+def test_vectorized_sim_matches_regular_sim():
+    for drains in DRAINS:
+        for reload in (False, True):
+            sim = _makeSim(capSim.CapSimulator, drains, reload)
+            sim.run()
+            vectorSim = _makeSim(capSim.VectorCapSimulator, drains, reload)
+            vectorSim.run()
+            assert _getResults(vectorSim) == _getResults(sim)
+            assert vectorSim.saved_changes == sim.saved_changes
+
+
+def test_batch_matches_regular_sim():
+    sims = [_makeSim(capSim.CapSimulator, drains, reload) for drains in DRAINS for reload in (False, True)]
+    for sim in sims:
+        sim.run()
+    vectorSims = [_makeSim(capSim.VectorCapSimulator, drains, reload) for drains in DRAINS for reload in (False, True)]
+    capSim.runBatch(vectorSims)
+    for sim, vectorSim in zip(sims, vectorSims):
+        assert _getResults(vectorSim) == _getResults(sim)
+
+
+def test_vectorized_batch_matches_regular_sim():
+    """
+    Tests that simulations stepped together in arrays get the same results as regular ones,
+    including capacitors which run dry at different moments
+    """
+    params = [
+        (drains, reload, capacity, recharge)
+        for drains in DRAINS for reload in (False, True)
+        for capacity in (150, 400, 800, 2500) for recharge in (60000, 200000, 600000)]
+    sims = [_makeSim(capSim.CapSimulator, *p) for p in params]
+    for sim in sims:
+        sim.run()
+    vectorSims = [_makeSim(capSim.VectorCapSimulator, *p) for p in params]
+    # Every simulation is finished in arrays, none is left to the plain loop
+    capSim.runBatch(vectorSims, minBatch=1)
+    for sim, vectorSim in zip(sims, vectorSims):
+        # Arrays round differently than scalar math in the last digits
+        assert _getResults(vectorSim) == pytest.approx(_getResults(sim), rel=1e-12)
+    # Both stable capacitors and ones running dry are covered
+    assert any(sim.cap_stable_low == 0 for sim in sims) and any(sim.cap_stable_low > 0 for sim in sims)
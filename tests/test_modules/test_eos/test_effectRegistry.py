@@ -0,0 +1,28 @@
+# Add root folder to python paths
+# This must be done on every test in order to pass in Travis
+import os
+import sys
+script_dir = os.path.dirname(os.path.abspath(__file__))
+script_dir = os.path.realpath(os.path.join(script_dir, '..', '..', '..'))
+print(script_dir)
+sys.path.append(script_dir)
+
+import eos.effects
+from eos.effectRegistry import EFFECTS_PATH, EffectRegistry, getEffectID
+
+
+def test_registry_matches_effects_module(tmpdir):
+    cachePath = str(tmpdir.join("effects.registry"))
+    # First registry builds the cache, second one loads from it
+    for registry in (EffectRegistry(EFFECTS_PATH, cachePath), EffectRegistry(EFFECTS_PATH, cachePath)):
+        for name, definition in vars(eos.effects).items():
+            effectID = getEffectID(name)
+            if effectID is None:
+                continue
+            metadata = registry.getMetadata(effectID)
+            for key, value in vars(definition).items():
+                if not key.startswith("__") and key != "handler":
+                    assert metadata[key] == value
+        assert registry.getMetadata(4)["writes"] == ("shieldRepair",)
+        assert registry.getDefinition(4) is eos.effects.Effect4
+        assert registry.getMetadata(-1) is None
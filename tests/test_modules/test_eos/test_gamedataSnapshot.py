@@ -0,0 +1,61 @@
+# Add root folder to python paths
+# This must be done on every test in order to pass in Travis
+import os
+import sys
+script_dir = os.path.dirname(os.path.abspath(__file__))
+script_dir = os.path.realpath(os.path.join(script_dir, '..', '..', '..'))
+print(script_dir)
+sys.path.append(script_dir)
+
+import sqlite3
+
+GAMEDATA = """
+CREATE TABLE invtypes (typeID INTEGER PRIMARY KEY, typeName TEXT, groupID INT, marketGroupID INT, published BOOL,
+    mass FLOAT, capacity FLOAT, volume FLOAT);
+CREATE TABLE dgmtypeattribs (typeID INT, attributeID INT, value FLOAT);
+CREATE TABLE dgmtypeeffects (typeID INT, effectID INT);
+CREATE TABLE dgmattribs (attributeID INT, attributeName TEXT);
+CREATE TABLE dgmeffects (effectID INT, effectName TEXT);
+CREATE TABLE invcategories (categoryID INT, categoryName TEXT);
+CREATE TABLE invgroups (groupID INT, groupName TEXT, categoryID INT, published BOOL);
+CREATE TABLE invmarketgroups (marketGroupID INT, marketGroupName TEXT, parentGroupID INT);
+CREATE TABLE metadata (field_name TEXT, field_value TEXT);
+INSERT INTO metadata VALUES ('client_build', '1234');
+INSERT INTO invcategories VALUES (6, 'Ship'), (16, 'Skill');
+INSERT INTO invgroups VALUES (25, 'Frigate', 6, 1), (257, 'Spaceship Command', 16, 1);
+INSERT INTO invmarketgroups VALUES (4, 'Ships', NULL), (61, 'Frigates', 4);
+INSERT INTO invtypes VALUES (587, 'Rifter', 25, 61, 1, 1067000, 140, 27289), (3329, 'Minmatar Frigate', 257, NULL, 1, 0, 0, 0.01);
+INSERT INTO dgmattribs VALUES (4, 'mass'), (38, 'capacity'), (161, 'volume'), (182, 'requiredSkill1'),
+    (277, 'requiredSkill1Level'), (263, 'shieldCapacity');
+INSERT INTO dgmeffects VALUES (10, 'targetAttack'), (11, 'loPower');
+INSERT INTO dgmtypeattribs VALUES (587, 263, 450), (587, 182, 3329), (587, 277, 1);
+INSERT INTO dgmtypeeffects VALUES (587, 11), (587, 10);
+"""
+
+
+def test_snapshot_roundTrip(tmpdir):
+    from eos.gamedataSnapshot import exportSnapshot, GamedataSnapshot
+    dbPath = str(tmpdir.join("eve.db"))
+    connection = sqlite3.connect(dbPath)
+    connection.executescript(GAMEDATA)
+    connection.close()
+    snapshotPath = str(tmpdir.join("eve.snapshot"))
+    exportSnapshot(dbPath, snapshotPath)
+
+    snapshot = GamedataSnapshot(snapshotPath)
+    assert snapshot.version == "1234"
+    assert len(snapshot) == 2 and 587 in snapshot and 588 not in snapshot
+    rifter = snapshot.getItem("Rifter")
+    assert rifter.ID == 587
+    assert (rifter.group.name, rifter.category.name) == ("Frigate", "Ship")
+    assert (rifter.marketGroup.name, rifter.marketGroup.parent.name) == ("Frigates", "Ships")
+    # Columns of types table are moved into attributes, like with ORM items
+    assert {name: attr.value for name, attr in rifter.attributes.items()} == {
+        "mass": 1067000, "capacity": 140, "volume": 27289, "shieldCapacity": 450,
+        "requiredSkill1": 3329, "requiredSkill1Level": 1}
+    assert rifter.getAttribute("shieldCapacity") == rifter.getAttribute(263) == 450
+    assert rifter.getAttribute("armorHP", 0) == 0
+    assert sorted(rifter.effects) == ["loPower", "targetAttack"]
+    assert [(skill.name, level) for skill, level in rifter.requiredSkills.items()] == [("Minmatar Frigate", 1)]
+    assert snapshot.getItem(3329).marketGroup is None
+    snapshot.close()
@@ -0,0 +1,79 @@
+# Add root folder to python paths
+# This must be done on every test in order to pass in Travis
+import os
+import sys
+from collections import namedtuple
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.realpath(os.path.join(script_dir, '..', '..', '..')))
+
+from eos.effectHandlerHelpers import (  # noqa: E402
+    ChargeGroupFilter, HandledList, ItemGroupFilter, ItemSkillFilter, dropAllIndexes)
+
+
+Group = namedtuple('Group', ('ID', 'name'))
+Skill = namedtuple('Skill', ('ID', 'name'))
+
+GUNNERY = Skill(3300, 'Gunnery')
+SMALL_PROJECTILE = Skill(3301, 'Small Projectile Turret')
+MISSILES = Skill(3319, 'Missile Launcher Operation')
+
+
+class Item:
+
+    def __init__(self, group, skills=()):
+        self.group = group
+        self.requiredSkills = {skill: 1 for skill in skills}
+
+    def requiresSkill(self, skill):
+        return any(skill in (s.ID, s.name) for s in self.requiredSkills)
+
+
+class Mod:
+
+    isInvalid = False
+
+    def __init__(self, item, charge=None):
+        self.item = item
+        self.charge = charge
+        self.boosts = 0
+
+    def boostItemAttr(self, *args, **kwargs):
+        self.boosts += 1
+
+    def boostChargeAttr(self, *args, **kwargs):
+        self.boosts += 1
+
+
+def _boosted(handledList, filter, charge=False):
+    for mod in handledList:
+        mod.boosts = 0
+    if charge:
+        handledList.filteredChargeBoost(filter, 'damageMultiplier', 5)
+    else:
+        handledList.filteredItemBoost(filter, 'damageMultiplier', 5)
+    return [mod.boosts for mod in handledList]
+
+
+def test_indexedFilters_matchLambdas():
+    projectile = Group(55, 'Projectile Weapon')
+    rocket = Group(387, 'Rocket')
+    mods = HandledList([
+        Mod(Item(projectile, (GUNNERY, SMALL_PROJECTILE))),
+        Mod(Item(Group(507, 'Missile Launcher Rocket'), (MISSILES,)), Item(rocket)),
+        Mod(None),
+        Mod(Item(projectile, (GUNNERY,)))])
+
+    assert _boosted(mods, ItemSkillFilter('Gunnery')) == _boosted(mods, lambda mod: mod.item.requiresSkill('Gunnery')) == [1, 0, 0, 1]
+    assert _boosted(mods, ItemSkillFilter('Missile Launcher Operation', 3301)) == [1, 1, 0, 0]
+    assert _boosted(mods, ItemGroupFilter('Projectile Weapon')) == [1, 0, 0, 1]
+    assert _boosted(mods, ChargeGroupFilter('Rocket'), charge=True) == [0, 1, 0, 0]
+
+    # Indexes follow changes of the list and of charges
+    mods[2] = Mod(Item(projectile, (GUNNERY,)))
+    assert _boosted(mods, ItemSkillFilter(GUNNERY.ID)) == [1, 0, 1, 1]
+    mods.remove(mods[0])
+    assert _boosted(mods, ItemSkillFilter('Gunnery')) == [0, 1, 1]
+    mods[0].charge = None
+    dropAllIndexes()
+    assert _boosted(mods, ChargeGroupFilter('Rocket'), charge=True) == [0, 0, 0]
@@ -0,0 +1,37 @@
+# Add root folder to python paths
+# This must be done on every test in order to pass in Travis
+import os
+import sys
+script_dir = os.path.dirname(os.path.abspath(__file__))
+script_dir = os.path.realpath(os.path.join(script_dir, '..', '..', '..'))
+print(script_dir)
+sys.path.append(script_dir)
+
+
+def test_priceStore_keepsLatestAndHistory(DB, tmpdir):
+    import time
+    from eos.db.saveddata.priceStore import PriceStore
+    from eos.saveddata.price import PriceStatus
+    path = str(tmpdir.join("prices.db"))
+    store = PriceStore(path)
+    price = store.get(587)
+    assert price.status == PriceStatus.initialized and not price.isKnown
+    now = int(time.time())
+    for priceTime, value in ((now - 2000, 5.0), (now - 1000, 7.0)):
+        price.update(PriceStatus.fetchSuccess, value)
+        price.time = priceTime
+        store.save([price])
+    price.update(PriceStatus.fetchFail)
+    price.time = now
+    store.save([price])
+
+    # Failed fetch keeps last known price
+    reloaded = PriceStore(path).get(587)
+    assert (reloaded.time, reloaded.price, reloaded.status) == (now, 7.0, PriceStatus.fetchFail)
+    assert reloaded.isKnown
+    assert store.getHistory(587) == [(now - 2000, 5.0), (now - 1000, 7.0)]
+
+    store.clear()
+    assert price.status == PriceStatus.initialized
+    assert store.get(587) is not price
+    assert PriceStore(path).get(587).price == 0
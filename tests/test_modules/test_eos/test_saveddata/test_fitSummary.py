@@ -0,0 +1,31 @@
+# Add root folder to python paths
+# This must be done on every test in order to pass in Travis
+import os
+import sys
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.realpath(os.path.join(script_dir, '..', '..', '..', '..')))
+
+
+def test_fitSummary_followsFitSaves(DB, RifterFit):
+    from eos.const import ImplantLocation
+    from eos.db.saveddata.fitSummary import syncFitSummaries
+    db = DB['db']
+    RifterFit.implantLocation = ImplantLocation.FIT
+    db.save(RifterFit)
+    shipID = RifterFit.shipID
+    assert [row[:2] for row in db.getFitSummariesWithShip(shipID)] == [(RifterFit.ID, "My Rifter Fit")]
+    assert db.countFitsWithShip(shipID) == 1
+
+    RifterFit.name = "Renamed Rifter"
+    db.commit()
+    assert [row[:3] for row in db.searchFitSummaries("renamed")] == [(RifterFit.ID, "Renamed Rifter", shipID)]
+
+    # Summaries which went missing are restored from fits
+    db.saveddata_engine.execute("DELETE FROM fitSummaries")
+    syncFitSummaries(db.saveddata_engine)
+    assert db.countFitsWithShip(shipID) == 1
+
+    db.remove(RifterFit)
+    assert db.countFitsWithShip(shipID) == 0
+    assert db.searchFitSummaries("renamed") == []
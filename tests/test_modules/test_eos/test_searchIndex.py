@@ -0,0 +1,26 @@
+# Add root folder to python paths
+# This must be done on every test in order to pass in Travis
+import os
+import sys
+script_dir = os.path.dirname(os.path.abspath(__file__))
+script_dir = os.path.realpath(os.path.join(script_dir, '..', '..', '..'))
+print(script_dir)
+sys.path.append(script_dir)
+
+NAMES = ("medium shield extender ii", "5mn microwarpdrive ii", "heavy missile launcher ii", "light missile launcher i")
+
+
+def test_trigramIndex_find(DB):
+    from eos.db.gamedata.searchIndex import TrigramIndex
+    index = TrigramIndex(NAMES)
+    assert index.find("launcher") == {2, 3}
+    assert index.find("ii") == {0, 1, 2}
+    assert index.find("heavy*ii") == {2}
+    assert index.find("missile*heavy") == set()
+    assert index.find("shield extender") == {0}
+
+
+def test_searchItems_RifterNameParts(DB):
+    items = DB['db'].searchItems("rift")
+    assert "Rifter" in [item.name for item in items]
+    assert items == DB['db'].searchItems("Rift")
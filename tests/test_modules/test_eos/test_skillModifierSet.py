@@ -0,0 +1,37 @@
+# Add root folder to python paths
+# This must be done on every test in order to pass in Travis
+import os
+import sys
+script_dir = os.path.dirname(os.path.abspath(__file__))
+script_dir = os.path.realpath(os.path.join(script_dir, '..', '..', '..'))
+print(script_dir)
+sys.path.append(script_dir)
+
+# noinspection PyPackageRequirements
+
+ATTRIBUTES = ("shieldEmDamageResonance", "shieldCapacity", "cpuOutput", "maxVelocity", "maxTargetRange", "agility")
+MODULES = ("EM Ward Amplifier II", "Medium Shield Extender II", "Damage Control II")
+
+
+def _calculate(fit):
+    fit.clear()
+    fit.calculateModifiedAttributes()
+    shipAttrs = {attr: fit.ship.getModifiedItemAttr(attr) for attr in ATTRIBUTES}
+    moduleAttrs = [dict(mod.itemModifiedAttributes) for mod in fit.modules]
+    return shipAttrs, moduleAttrs
+
+
+def test_shared_skill_modifiers_match_regular_calc(DB, Saveddata, RifterFit):
+    """
+    Tests that fits calculated with shared skill modifiers get the same values as usual
+    """
+    char5 = Saveddata['Character'].getAll5()
+    RifterFit.character = char5
+    for itemName in MODULES:
+        RifterFit.modules.append(Saveddata['Module'](DB['db'].getItem(itemName)))
+    expected = _calculate(RifterFit)
+
+    with char5.sharedSkillModifiers():
+        # First calculation collects skill modifications, second one reuses them
+        assert _calculate(RifterFit) == expected
+        assert _calculate(RifterFit) == expected
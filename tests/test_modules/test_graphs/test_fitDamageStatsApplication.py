@@ -0,0 +1,216 @@
+# Add root folder to python paths
+# This must be done on every test in order to pass in Travis
+import os
+import sys
+script_dir = os.path.dirname(os.path.abspath(__file__))
+script_dir = os.path.realpath(os.path.join(script_dir, '..', '..', '..'))
+print(script_dir)
+sys.path.append(script_dir)
+
+import numpy
+import pytest
+
+from graphs.calc import calculateRangeFactor, calculateRangeFactorArray
+from graphs.data.fitDamageStats.calc import application
+from service.const import GraphDpsDroneMode
+
+DISTANCES = (0, 300, 2500, 9000, 24000, 60000, 250000)
+ATK_SPEEDS = (0, 350)
+TGT_SPEEDS = (0, 120, 2200)
+TGT_SIG_RADII = (8, 150, 3000)
+
+
+class FakeItem:
+
+    def __init__(self, attrs=None, chargeAttrs=None, maxRange=None, falloff=None, effects=()):
+        self.attrs = attrs or {}
+        self.chargeAttrs = chargeAttrs or {}
+        self.maxRange = maxRange
+        self.falloff = falloff
+        self.item = self
+        self.effects = set(effects)
+        self.extraAttributes = {'droneControlRange': 70000}
+
+    def getModifiedItemAttr(self, key, default=0):
+        return self.attrs.get(key, default)
+
+    def getModifiedChargeAttr(self, key, default=0):
+        return self.chargeAttrs.get(key, default)
+
+
+class FakeShip:
+
+    isFit = False
+
+    def __init__(self, radius):
+        self.radius = radius
+        self.item = FakeItem()
+
+    def getRadius(self):
+        return self.radius
+
+
+class FakeSettings:
+
+    def __init__(self, droneMode):
+        self.droneMode = droneMode
+
+    def get(self, key):
+        assert key == 'mobileDroneMode'
+        return self.droneMode
+
+
+def _grid():
+    atkSpeed, distance, tgtSpeed, tgtSigRadius = numpy.meshgrid(
+        ATK_SPEEDS, DISTANCES, TGT_SPEEDS, TGT_SIG_RADII, indexing='ij')
+    return atkSpeed.ravel(), distance.ravel(), tgtSpeed.ravel(), tgtSigRadius.ravel()
+
+
+def _assertArrayMatches(arrayFunc, scalarFunc, **kwargs):
+    """Run array kernel on the grid and scalar function on each point of the grid."""
+    atkSpeed, distance, tgtSpeed, tgtSigRadius = _grid()
+    arrayResult = numpy.broadcast_to(arrayFunc(
+        atkSpeed=atkSpeed, distance=distance, tgtSpeed=tgtSpeed, tgtSigRadius=tgtSigRadius, **kwargs), atkSpeed.shape)
+    scalarResult = [
+        scalarFunc(atkSpeed=float(a), distance=float(d), tgtSpeed=float(s), tgtSigRadius=float(r), **kwargs)
+        for a, d, s, r in zip(atkSpeed, distance, tgtSpeed, tgtSigRadius)]
+    assert list(arrayResult) == pytest.approx(scalarResult, rel=1e-12, abs=1e-15)
+    # Undefined distance has to be handled the same way as well
+    arrayResult = numpy.broadcast_to(arrayFunc(
+        atkSpeed=atkSpeed, distance=None, tgtSpeed=tgtSpeed, tgtSigRadius=tgtSigRadius, **kwargs), atkSpeed.shape)
+    scalarResult = [
+        scalarFunc(atkSpeed=float(a), distance=None, tgtSpeed=float(s), tgtSigRadius=float(r), **kwargs)
+        for a, s, r in zip(atkSpeed, tgtSpeed, tgtSigRadius)]
+    assert list(arrayResult) == pytest.approx(scalarResult, rel=1e-12, abs=1e-15)
+
+
+def _dropArgs(func, *names):
+    def wrapper(**kwargs):
+        for name in names:
+            del kwargs[name]
+        return func(**kwargs)
+    return wrapper
+
+
+@pytest.fixture(params=list(GraphDpsDroneMode))
+def droneMode(request, monkeypatch):
+    settings = FakeSettings(request.param)
+    monkeypatch.setattr(application.GraphSettings, 'getInstance', lambda: settings)
+    return request.param
+
+
+@pytest.mark.parametrize('optimal, falloff, restricted', (
+    (0, 0, True),
+    (5000, 0, True),
+    (5000, 12000, True),
+    (5000, 12000, False),
+    (0, 40000, True)))
+def test_rangeFactorArray(optimal, falloff, restricted):
+    distances = numpy.array(DISTANCES, dtype=float)
+    arrayResult = calculateRangeFactorArray(optimal, falloff, distances, restrictedRange=restricted)
+    scalarResult = [calculateRangeFactor(optimal, falloff, d, restrictedRange=restricted) for d in DISTANCES]
+    assert list(arrayResult) == pytest.approx(scalarResult, rel=1e-12, abs=1e-15)
+    assert calculateRangeFactorArray(optimal, falloff, None) == calculateRangeFactor(optimal, falloff, None)
+
+
+@pytest.mark.parametrize('atkRadius, tgtRadius', ((0, 0), (40, 400)))
+def test_angularSpeedArray(atkRadius, tgtRadius):
+    atkSpeed, distance, tgtSpeed, _ = _grid()
+    for atkAngle, tgtAngle in ((0, 0), (90, 0), (30, 135)):
+        arrayResult = application._calcAngularSpeedArray(atkSpeed, atkAngle, atkRadius, distance, tgtSpeed, tgtAngle, tgtRadius)
+        scalarResult = [
+            application._calcAngularSpeed(float(a), atkAngle, atkRadius, float(d), float(s), tgtAngle, tgtRadius)
+            for a, d, s in zip(atkSpeed, distance, tgtSpeed)]
+        assert list(arrayResult) == pytest.approx(scalarResult, rel=1e-12, abs=1e-15)
+
+
+def test_turretMultArray():
+    chances = numpy.linspace(0, 1, 101)
+    arrayResult = application._calcTurretMultArray(chances)
+    scalarResult = [application._calcTurretMult(float(c)) for c in chances]
+    assert list(arrayResult) == pytest.approx(scalarResult, rel=1e-12, abs=1e-15)
+
+
+@pytest.mark.parametrize('atkAngle, tgtAngle', ((0, 0), (90, 0), (45, 200)))
+def test_getTurretMultArray(atkAngle, tgtAngle):
+    mod = FakeItem(attrs={'trackingSpeed': 0.05, 'optimalSigRadius': 40000}, maxRange=5000, falloff=12000)
+    _assertArrayMatches(
+        application.getTurretMultArray, application.getTurretMult,
+        mod=mod, src=FakeShip(40), tgt=FakeShip(400), atkAngle=atkAngle, tgtAngle=tgtAngle)
+
+
+@pytest.mark.parametrize('chargeAttrs', (
+    {'aoeCloudSize': 125, 'aoeVelocity': 85, 'aoeDamageReductionFactor': 0.882},
+    {'aoeCloudSize': 40, 'aoeVelocity': 3000, 'aoeDamageReductionFactor': 0.5}))
+def test_getLauncherMultArray(chargeAttrs):
+    mod = FakeItem(chargeAttrs=chargeAttrs, maxRange=45000)
+    _assertArrayMatches(
+        _dropArgs(application.getLauncherMultArray, 'atkSpeed'),
+        _dropArgs(application.getLauncherMult, 'atkSpeed'),
+        mod=mod, src=FakeShip(40))
+
+
+@pytest.mark.parametrize('maxRange', (None, 6000))
+def test_getSmartbombMultArray(maxRange):
+    _assertArrayMatches(
+        _dropArgs(application.getSmartbombMultArray, 'atkSpeed', 'tgtSpeed', 'tgtSigRadius'),
+        _dropArgs(application.getSmartbombMult, 'atkSpeed', 'tgtSpeed', 'tgtSigRadius'),
+        mod=FakeItem(maxRange=maxRange))
+
+
+@pytest.mark.parametrize('attrs, maxRange', (
+    ({'signatureRadius': 2000}, 250000),
+    ({'doomsdayDamageRadius': 5000}, None),
+    ({}, 20000)))
+def test_getDoomsdayMultArray(attrs, maxRange):
+    _assertArrayMatches(
+        _dropArgs(application.getDoomsdayMultArray, 'atkSpeed', 'tgtSpeed'),
+        _dropArgs(application.getDoomsdayMult, 'atkSpeed', 'tgtSpeed'),
+        mod=FakeItem(attrs=attrs, maxRange=maxRange), tgt=FakeShip(400))
+
+
+@pytest.mark.parametrize('aoeCloudSize', (0, 400))
+def test_getBombMultArray(aoeCloudSize):
+    mod = FakeItem(chargeAttrs={'aoeCloudSize': aoeCloudSize, 'explosionRange': 15000}, maxRange=30000)
+    _assertArrayMatches(
+        _dropArgs(application.getBombMultArray, 'atkSpeed', 'tgtSpeed'),
+        _dropArgs(application.getBombMult, 'atkSpeed', 'tgtSpeed'),
+        mod=mod, src=FakeShip(40), tgt=FakeShip(400))
+
+
+@pytest.mark.parametrize('aoeCloudSize', (0, 400))
+def test_getGuidedBombMultArray(aoeCloudSize):
+    mod = FakeItem(chargeAttrs={'aoeCloudSize': aoeCloudSize}, maxRange=30000)
+    _assertArrayMatches(
+        _dropArgs(application.getGuidedBombMultArray, 'atkSpeed', 'tgtSpeed'),
+        _dropArgs(application.getGuidedBombMult, 'atkSpeed', 'tgtSpeed'),
+        mod=mod, src=FakeShip(40))
+
+
+@pytest.mark.parametrize('droneSpeed', (0, 1200))
+def test_getDroneMultArray(droneMode, droneSpeed):
+    drone = FakeItem(attrs={
+        'maxVelocity': droneSpeed, 'radius': 25, 'trackingSpeed': 0.4, 'optimalSigRadius': 125},
+        maxRange=8000, falloff=6000)
+    _assertArrayMatches(
+        application.getDroneMultArray, application.getDroneMult,
+        drone=drone, src=FakeShip(40), tgt=FakeShip(400), atkAngle=30, tgtAngle=90)
+
+
+@pytest.mark.parametrize('attrPrefix', ('fighterAbilityMissiles', 'fighterAbilityLaunchBomb'))
+def test_getFighterAbilityMultArray(droneMode, attrPrefix):
+    fighter = FakeItem(
+        attrs={
+            'maxVelocity': 1800, 'radius': 35,
+            '{}Range'.format(attrPrefix): 20000,
+            '{}RangeFalloff'.format(attrPrefix): 10000,
+            '{}DamageReductionFactor'.format(attrPrefix): 0.5,
+            '{}DamageReductionSensitivity'.format(attrPrefix): 5.5,
+            '{}ExplosionRadius'.format(attrPrefix): 120,
+            '{}ExplosionVelocity'.format(attrPrefix): 300},
+        chargeAttrs={'aoeCloudSize': 400})
+    ability = type('FakeAbility', (), {'attrPrefix': attrPrefix})()
+    _assertArrayMatches(
+        _dropArgs(application.getFighterAbilityMultArray, 'atkSpeed'),
+        _dropArgs(application.getFighterAbilityMult, 'atkSpeed'),
+        fighter=fighter, ability=ability, src=FakeShip(40), tgt=FakeShip(400))
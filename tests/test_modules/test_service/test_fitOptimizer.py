@@ -0,0 +1,50 @@
+# Add root folder to python paths
+import os
+import sys
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.realpath(os.path.join(script_dir, '..', '..', '..')))
+
+# noinspection PyPackageRequirements
+from eos.const import FittingSlot  # noqa: E402
+from service.fitOptimizer import BeamSearch  # noqa: E402
+
+
+# {item ID: (objective, cpu, cpu output)}
+ITEMS = {1: (10, 30, 0), 2: (6, 10, 0), 3: (1, 5, 0), 4: (0, 0, 40), 5: (4, 20, 0)}
+
+
+class Evaluator:
+    """Fits where stats of modules simply add up, with 50 CPU on the hull"""
+
+    def __init__(self):
+        self.states = []
+
+    def evaluate(self, args, states, workers):
+        self.states.extend(states)
+        results = []
+        for state in states:
+            stats = {
+                "objective": sum(ITEMS[itemID][0] for itemID, chargeID in state),
+                "cpuUsed": sum(ITEMS[itemID][1] for itemID, chargeID in state),
+                "cpuOutput": 50 + sum(ITEMS[itemID][2] for itemID, chargeID in state),
+                "powerUsed": 0, "powerOutput": 0, "calibrationUsed": 0, "calibration": 0}
+            stats["fits"] = stats["cpuUsed"] <= stats["cpuOutput"]
+            results.append(stats)
+        return results
+
+
+def test_beamSearch_findsBestFittingCombination():
+    evaluator = Evaluator()
+    slots = [FittingSlot.HIGH, FittingSlot.HIGH, FittingSlot.LOW]
+    candidates = {
+        FittingSlot.HIGH: [(1, None), (2, None), (3, None)],
+        FittingSlot.LOW: [(4, None), (5, None)]}
+    search = BeamSearch(evaluator, "", slots, candidates, "dps", None, None, 0)
+    results = search.run(beamWidth=3, expansion=2, resultCount=3)
+    # CPU upgrade in the low slot pays for two of the best high slot modules
+    assert results[0]["objective"] == 20
+    assert results[0]["items"] == {FittingSlot.HIGH: [(1, None), (1, None)], FittingSlot.LOW: [(4, None)]}
+    assert all(r["fits"] for r in results)
+    # Every state is calculated only once
+    assert len(evaluator.states) == len(set(evaluator.states))
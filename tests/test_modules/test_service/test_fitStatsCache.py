@@ -0,0 +1,63 @@
+# Add root folder to python paths
+import os
+import sys
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.realpath(os.path.join(script_dir, '..', '..', '..')))
+
+# noinspection PyPackageRequirements
+import pytest
+
+from service.fitStatsCache import FitStatsCache, collectFitStats
+
+
+def test_storeAndRemove(tmpdir):
+    cache = FitStatsCache(str(tmpdir.join("fitstats.db")))
+    assert cache.get("abc") is None
+    cache.store("abc", 1, {"dps": {"total": 100.5}})
+    assert cache.get("abc") == {"dps": {"total": 100.5}}
+    assert cache.getLatest(1) == {"dps": {"total": 100.5}}
+    # Newer version of the same fit replaces older one
+    cache.store("def", 1, {"dps": {"total": 200}})
+    assert cache.get("abc") is None
+    assert cache.get("def") == {"dps": {"total": 200}}
+    assert cache.getLatest(1) == {"dps": {"total": 200}}
+    cache.remove(1)
+    assert cache.get("def") is None
+    assert cache.getLatest(1) is None
+    assert (cache.hits, cache.misses) == (2, 3)
+
+
+def test_fitHash_RifterFit(DB, Saveddata, RifterFit):
+    initialHash = FitStatsCache.getFitHash(RifterFit)
+    assert FitStatsCache.getFitHash(RifterFit) == initialHash
+    RifterFit.modules.append(Saveddata['Module'](DB['db'].getItem("Damage Control II")))
+    assert FitStatsCache.getFitHash(RifterFit) != initialHash
+
+
+def test_fitStats_servedWithoutRecalc(DB, Saveddata, RifterFit, tmpdir, monkeypatch):
+    """
+    Tests that stats of recalculated fit get stored, and that ship browser and
+    exports get them without calculating the fit
+    """
+    from service.fit import Fit
+    from gui.utils.exportHtml import exportHtmlThread
+
+    monkeypatch.setattr(FitStatsCache, "instance", FitStatsCache(str(tmpdir.join("fitstats.db"))))
+    sFit = Fit.getInstance()
+    RifterFit.character = Saveddata['Character'].getAll5()
+    DB['db'].save(RifterFit)
+    fitID = RifterFit.ID
+    assert sFit.getFitStats(fitID, calculate=False) is None
+
+    fit = sFit.getFit(fitID)
+    expected = collectFitStats(fit)
+    monkeypatch.setattr(sFit, "recalc", lambda fit: pytest.fail("Fit was recalculated"))
+    stats = sFit.getFitStats(fitID, calculate=False)
+    assert stats["dps"] == expected["dps"] and stats["ehp"] == expected["ehp"]
+    assert FitStatsCache.getInstance().hits == 1
+
+    # Fits which are not loaded are served stats of their last recalc
+    monkeypatch.setattr(sFit, "_loadedFits", set())
+    assert sFit.getFitStats(fitID, calculate=False)["dps"] == expected["dps"]
+    assert exportHtmlThread.getStatsLabel(sFit, fitID).startswith(' <span class="ui-li-aside">DPS: ')
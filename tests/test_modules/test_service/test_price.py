@@ -0,0 +1,113 @@
+# Add root folder to python paths
+import os
+import sys
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.realpath(os.path.join(script_dir, '..', '..', '..')))
+
+import http.server
+import json
+import threading
+import time
+
+
+def startStubServer(prices, delay):
+    """Start local HTTP server answering with passed prices after delay"""
+
+    class Handler(http.server.BaseHTTPRequestHandler):
+        def do_GET(self):
+            time.sleep(delay)
+            data = json.dumps(prices).encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler) if hasattr(http.server, "ThreadingHTTPServer") \
+        else http.server.HTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever)
+    thread.daemon = True
+    thread.start()
+    return server
+
+
+def makeSource(name, server):
+    from eos.saveddata.price import PriceStatus
+    from service.network import Network
+
+    class StubSource:
+
+        def __init__(self, priceMap, system, fetchTimeout):
+            network = Network.getInstance()
+            url = "http://127.0.0.1:{}/".format(server.server_address[1])
+            data = network.get(url=url, type=network.PRICES, timeout=fetchTimeout).json()
+            for typeID, price in data.items():
+                typeID = int(typeID)
+                if typeID in priceMap:
+                    priceMap[typeID].update(PriceStatus.fetchSuccess, price)
+                    del priceMap[typeID]
+
+    StubSource.name = name
+    return StubSource
+
+
+def test_hedgedFetch_fastSecondary(DB):
+    from service.price import HedgedFetch
+    slow = startStubServer({"1": 10, "2": 20}, 3)
+    fast = startStubServer({"1": 11, "3": 31}, 0)
+    try:
+        fetch = HedgedFetch((1, 2, 3))
+        start = time.time()
+        timedOutSources = fetch.run([makeSource("slow", slow), makeSource("fast", fast)], None, 10)
+        # Secondary source answers right after head start of the primary one,
+        # and we wait for primary for the rest of items only
+        assert fetch.results == {1: 11, 2: 20, 3: 31}
+        assert timedOutSources == {"slow": False, "fast": False}
+        assert time.time() - start < 5
+    finally:
+        slow.shutdown()
+        fast.shutdown()
+
+
+def test_hedgedFetch_timeout(DB):
+    from service.price import HedgedFetch
+    slow = startStubServer({"1": 10}, 3)
+    try:
+        fetch = HedgedFetch((1,))
+        start = time.time()
+        timedOutSources = fetch.run([makeSource("slow", slow)], None, 1)
+        assert fetch.results == {}
+        assert timedOutSources == {"slow": True}
+        assert time.time() - start < 2
+    finally:
+        slow.shutdown()
+
+
+def test_hedgedFetch_cancelRateLimited(DB):
+    from service.price import HedgedFetch
+    server = startStubServer({"1": 10}, 0)
+    try:
+        source = makeSource("limited", server)
+        source.minInterval = 3
+        calls = []
+        originalInit = source.__init__
+
+        def countingInit(self, *args):
+            calls.append(args)
+            originalInit(self, *args)
+
+        source.__init__ = countingInit
+        assert HedgedFetch((1,)).run([source], None, 5) == {"limited": False}
+        # Second request has to wait for rate limiter longer than we wait for
+        # prices, so it should not be made at all
+        start = time.time()
+        assert HedgedFetch((1,)).run([source], None, 1) == {"limited": True}
+        assert time.time() - start < 2
+        time.sleep(3)
+        assert len(calls) == 1
+    finally:
+        server.shutdown()
@@ -0,0 +1,56 @@
+# Add root folder to python paths
+import os
+import sys
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.realpath(os.path.join(script_dir, '..', '..', '..')))
+
+# noinspection PyPackageRequirements
+from service.recalcScheduler import RecalcScheduler  # noqa: E402
+
+
+class Timer:
+    """Timer which fires only when test tells it to, in place of wx.CallLater"""
+
+    def __init__(self, delay, func, *args):
+        self.delay = delay
+        self.func = func
+        self.args = args
+        self.running = True
+
+    def Restart(self, delay):
+        self.delay = delay
+        self.running = True
+
+    def Stop(self):
+        self.running = False
+
+    def fire(self):
+        if self.running:
+            self.running = False
+            self.func(*self.args)
+
+
+def test_coalesceRequests(monkeypatch):
+    recalced = []
+    finished = []
+    timers = []
+
+    def timerFactory(delay, func, *args):
+        timer = Timer(delay, func, *args)
+        timers.append(timer)
+        return timer
+
+    monkeypatch.setattr(RecalcScheduler, 'recalc', staticmethod(lambda fitID: recalced.append(fitID) or True))
+    scheduler = RecalcScheduler(timerFactory=timerFactory)
+    # Burst of changes to one fit ends up in single recalc, reported to the latest callback
+    for i in range(10):
+        scheduler.schedule(1, callback=lambda fitID, i=i: finished.append((fitID, i)), delay=100)
+    # Cancelled request is not calculated
+    scheduler.schedule(2, delay=50)
+    scheduler.cancel(2)
+    assert len(timers) == 2
+    for timer in timers:
+        timer.fire()
+    assert recalced == [1]
+    assert finished == [(1, 9)]
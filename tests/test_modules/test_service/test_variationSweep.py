@@ -0,0 +1,60 @@
+# Add root folder to python paths
+import os
+import sys
+from collections import namedtuple
+from types import SimpleNamespace
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.realpath(os.path.join(script_dir, '..', '..', '..')))
+
+# noinspection PyPackageRequirements
+from eos.const import FittingModuleState, FittingSlot  # noqa: E402
+from service.variationSweep import (  # noqa: E402
+    VariationSweep, applyFitStates, findModulePosition, getFitStates, getModuleKey)
+
+
+Mod = namedtuple('Mod', ('slot', 'isEmpty'))
+Fit = namedtuple('Fit', ('modules',))
+
+
+def test_moduleKeys_skipEmptySlots():
+    fit = Fit([
+        Mod(FittingSlot.HIGH, False), Mod(FittingSlot.HIGH, True), Mod(FittingSlot.MED, False),
+        Mod(FittingSlot.HIGH, False), Mod(FittingSlot.LOW, False)])
+    # Exported fit loses empty slots, but keys still point to the same modules
+    exported = Fit([mod for mod in fit.modules if not mod.isEmpty])
+    for mod in exported.modules:
+        key = getModuleKey(exported, mod)
+        assert fit.modules[findModulePosition(fit, key)] is mod
+    assert getModuleKey(fit, fit.modules[3]) == (FittingSlot.HIGH, 1)
+
+
+def test_sortResults_failedLast():
+    results = [{"dps": 10}, {"error": "Unable to fit"}, {"dps": 30}, {"dps": 20}]
+    assert [r.get("dps") for r in VariationSweep.sortResults(results, "dps")] == [30, 20, 10, None]
+    assert [r.get("dps") for r in VariationSweep.sortResults(results, "dps", reverse=False)] == [10, 20, 30, None]
+
+
+def makeStatesFit(modStates, drones, fighters):
+    modules = [
+        SimpleNamespace(slot=FittingSlot.MED, isEmpty=False, state=state, isValidState=lambda state: True)
+        for state in modStates]
+    drones = [SimpleNamespace(itemID=itemID, amount=amount, amountActive=active) for itemID, amount, active in drones]
+    fighters = [
+        SimpleNamespace(itemID=itemID, active=active, abilities=[SimpleNamespace(effectID=1, active=abilityActive)])
+        for itemID, active, abilityActive in fighters]
+    return SimpleNamespace(modules=modules, drones=drones, fighters=fighters)
+
+
+def test_fitStates_restoredOnImportedFit():
+    fit = makeStatesFit(
+        (FittingModuleState.OVERHEATED, FittingModuleState.ONLINE),
+        ((10, 5, 3),), ((20, False, True), (20, True, False)))
+    # Imported fit gets active modules, inactive drones and default fighter states
+    imported = makeStatesFit(
+        (FittingModuleState.ACTIVE, FittingModuleState.ACTIVE),
+        ((10, 5, 0),), ((20, True, False), (20, True, False)))
+    applyFitStates(imported, getFitStates(fit))
+    assert [mod.state for mod in imported.modules] == [FittingModuleState.OVERHEATED, FittingModuleState.ONLINE]
+    assert imported.drones[0].amountActive == 3
+    assert [(f.active, f.abilities[0].active) for f in imported.fighters] == [(False, True), (True, False)]
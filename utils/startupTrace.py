@@ -0,0 +1,64 @@
+import threading
+import time
+from contextlib import contextmanager
+
+
+# Time of first import, which is as close to process start as we can get
+importTime = time.perf_counter()
+
+
+class StartupTrace:
+    """
+    Collects timings of application startup phases. Disabled by default, in
+    which case phases are not recorded at all.
+    """
+    instance = None
+
+    @classmethod
+    def getInstance(cls):
+        if cls.instance is None:
+            cls.instance = StartupTrace()
+
+        return cls.instance
+
+    def __init__(self):
+        self.enabled = False
+        self.start = importTime
+        self.lock = threading.Lock()
+        # List of (name, start offset, duration, thread name), times are in seconds
+        self.phases = []
+
+    def enable(self):
+        self.enabled = True
+
+    @contextmanager
+    def phase(self, name):
+        if not self.enabled:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.__record(name, start, time.perf_counter() - start)
+
+    def mark(self, name):
+        """Record point in time which has no duration, like first paint of main window"""
+        if self.enabled:
+            self.__record(name, time.perf_counter(), None)
+
+    def __record(self, name, start, duration):
+        with self.lock:
+            self.phases.append((name, start - self.start, duration, threading.current_thread().name))
+
+    def getReport(self):
+        with self.lock:
+            phases = sorted(self.phases, key=lambda p: p[1])
+        lines = ["Startup trace (ms):", "{:>9} {:>9}  {}".format("at", "took", "phase")]
+        for name, offset, duration, threadName in phases:
+            lines.append("{:>9.1f} {:>9}  {}{}".format(
+                offset * 1000,
+                "-" if duration is None else "{:.1f}".format(duration * 1000),
+                name,
+                "" if threadName == "MainThread" else " [{}]".format(threadName)))
+        return "\n".join(lines)